@@ -18,7 +18,7 @@ import time
 import traceback
 from collections.abc import AsyncIterator
 from contextlib import AsyncExitStack, asynccontextmanager
-from typing import TYPE_CHECKING, Any, Literal, cast
+from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
     from fastmcp.server.auth import AuthProvider  # pragma: no cover
@@ -39,7 +39,7 @@ from katana_mcp._fastmcp_patches import apply_fastmcp_patches as _apply_patches
 from katana_mcp.logging import get_logger, setup_logging
 from katana_mcp.middleware import JsonStringCoercionMiddleware
 from katana_mcp.services import Services
-from katana_public_api_client import KatanaClient
+from katana_public_api_client import KatanaClient, request_priority
 
 # Apply FastMCP patches for Pydantic 2.12+ compatibility BEFORE registering tools
 _apply_patches()
@@ -48,6 +48,9 @@ _apply_patches()
 setup_logging()
 logger = get_logger(__name__)
 
+# Cross-process rate-limit state, kept in the typed-cache directory
+_RATE_LIMIT_DB_FILENAME = "rate_limit.db"
+
 
 async def _warm_caches_in_background(
     client: KatanaClient,
@@ -199,12 +202,21 @@ async def lifespan(server: FastMCP) -> AsyncIterator[Services]:
     logger.info("server_initializing", version=__version__, base_url=base_url)
 
     try:
+        from katana_mcp.typed_cache.engine import cache_dir
+
         # Shared resilience tuning applied to every KatanaClient we build.
+        # The rate-limit state lives beside the typed cache so every server
+        # process on this machine draws from one budget per API key instead
+        # of each assuming it owns Katana's full 60 req/min. Concurrent tool
+        # calls often fetch the same record (e.g. parallel variant
+        # enrichments), so identical in-flight GETs share one request.
         client_kwargs: dict[str, Any] = {
             "base_url": base_url,
             "timeout": 30.0,
             "max_retries": 5,
             "max_pages": 100,
+            "shared_rate_limit": cache_dir() / _RATE_LIMIT_DB_FILENAME,
+            "coalesce_requests": True,
         }
 
         # Initialize KatanaClient with automatic resilience features.
@@ -238,11 +250,8 @@ async def lifespan(server: FastMCP) -> AsyncIterator[Services]:
             # its first call with no signal at the config site).
             sync_api_key = (os.getenv("KATANA_SYNC_API_KEY") or "").strip() or None
             if sync_api_key and sync_api_key != api_key:
-                dedicated_sync_client = cast(
-                    KatanaClient,
-                    await sync_stack.enter_async_context(
-                        KatanaClient(api_key=sync_api_key, **client_kwargs)
-                    ),
+                dedicated_sync_client = await sync_stack.enter_async_context(
+                    KatanaClient(api_key=sync_api_key, **client_kwargs)
                 )
                 logger.info("sync_client_initialized", isolated=True)
             else:
@@ -260,11 +269,8 @@ async def lifespan(server: FastMCP) -> AsyncIterator[Services]:
             # Build the service container up front so the warm-up can route
             # through ``Services.sync_client`` — the single source of truth for
             # the dedicated-vs-foreground fallback (no duplicated resolution).
-            # The generated ``AuthenticatedClient.__aenter__`` is annotated to
-            # return its own class, dropping the ``KatanaClient`` subclass we
-            # constructed, hence the casts.
             context = Services(
-                client=cast(KatanaClient, client),
+                client=client,
                 typed_cache=typed_cache,
                 dedicated_sync_client=dedicated_sync_client,
             )
@@ -275,13 +281,16 @@ async def lifespan(server: FastMCP) -> AsyncIterator[Services]:
             # its rate-limit budget stays isolated from foreground tool calls
             # when ``KATANA_SYNC_API_KEY`` is set. Default ON; set
             # ``MCP_DISABLE_CACHE_WARMUP=1`` to skip (test runs do this
-            # via the autouse fixture in ``conftest.py``).
+            # via the autouse fixture in ``conftest.py``). The task runs at
+            # ``bulk`` rate-limit priority, so on a single key foreground
+            # tool calls are dispatched ahead of its queued page fetches.
             warmup_task: asyncio.Task[None] | None = None
             if os.getenv("MCP_DISABLE_CACHE_WARMUP") != "1":
-                warmup_task = asyncio.create_task(
-                    _warm_caches_in_background(context.sync_client, typed_cache),
-                    name="katana_cache_warmup",
-                )
+                with request_priority("bulk"):
+                    warmup_task = asyncio.create_task(
+                        _warm_caches_in_background(context.sync_client, typed_cache),
+                        name="katana_cache_warmup",
+                    )
                 logger.info("cache_warmup_started")
 
             try:
@@ -58,11 +58,14 @@ _CACHE_DIR_ENV = "KATANA_CACHE_DIR"
 _DB_FILENAME = "typed_cache.db"
 
 
-def _default_db_path() -> Path:
-    """Resolve the default SQLite cache path, honoring ``KATANA_CACHE_DIR``.
+def cache_dir() -> Path:
+    """Resolve the directory the server's SQLite files live in.
+
+    Holds the typed cache (``typed_cache.db``) and the shared rate-limit
+    state, and honors ``KATANA_CACHE_DIR``.
 
-    By default the cache lives at one machine-wide location
-    (``platformdirs.user_cache_dir("katana-mcp")/typed_cache.db``), which is
+    By default this is one machine-wide location
+    (``platformdirs.user_cache_dir("katana-mcp")``), which is
     intentional: a **shared** cache stays warm across every checkout,
     worktree, and connector, so a fresh server process reuses an already-
     synced DB instead of paying the cold-sync cost (Katana meters ~60 req/min
@@ -81,10 +84,14 @@ def _default_db_path() -> Path:
     override instead of creating a literal ``~`` directory under the CWD.
     """
     override = os.environ.get(_CACHE_DIR_ENV, "").strip()
-    base = (
+    return (
         Path(override).expanduser() if override else Path(user_cache_dir("katana-mcp"))
     )
-    return base / _DB_FILENAME
+
+
+def _default_db_path() -> Path:
+    """Resolve the default SQLite cache path: ``typed_cache.db`` in :func:`cache_dir`."""
+    return cache_dir() / _DB_FILENAME
 
 
 def _migrate_pre_create_all(sync_conn: Any) -> None:
@@ -14,6 +14,14 @@ sync via an :class:`EntitySpec` configuration object. Each spec wires up:
   from the attrs object (used by purchase orders, where Katana returns a
   discriminated union ``RegularPurchaseOrder | OutsourcedPurchaseOrder``).
 
+Records are converted straight from the decoded page JSON to column dicts
+by :mod:`katana_mcp.typed_cache.wire_rows` where they can be; the attrs ->
+pydantic -> cache-class chain in ``_convert`` is the fallback for records
+the fast path can't reproduce exactly. Pages are fetched inside
+``decoded_json_responses()``, so the client hands over the JSON it already
+decoded and attrs objects are only built for those fallback records (and to
+resolve a purchase order's class).
+
 Public ``ensure_<entity>_synced(client, cache)`` functions are thin
 wrappers over ``_ensure_synced`` so existing call sites and tests don't
 need to change.
@@ -64,8 +72,10 @@ from katana_public_api_client.api.stock_transfer import get_all_stock_transfers
 from katana_public_api_client.api.supplier import get_all_suppliers
 from katana_public_api_client.api.tax_rate import get_all_tax_rates
 from katana_public_api_client.api.variant import get_all_variants
+from katana_public_api_client.decode_offload import parse_decoded_json
 from katana_public_api_client.domain.converters import unwrap_unset
 from katana_public_api_client.domain.variant import build_variant_display_name
+from katana_public_api_client.katana_client import DecodedJSON, decoded_json_responses
 from katana_public_api_client.models.get_all_variants_extend_item import (
     GetAllVariantsExtendItem,
 )
@@ -118,6 +128,7 @@ from katana_public_api_client.models_pydantic._registry import get_pydantic_clas
 from katana_public_api_client.utils import unwrap, unwrap_data
 
 from .sync_state import SyncState
+from .wire_rows import WireRowMiss, build_row, nested_model_class, row_plan
 
 if TYPE_CHECKING:
     from katana_public_api_client import KatanaClient
@@ -190,6 +201,10 @@ class EntitySpec:
       ``parent_name`` / ``supplier_item_codes_text`` from the extended
       ``product_or_material`` payload — keeps Variant-specific
       denormalization out of the generic ``_convert``.
+    - ``wire_postprocess`` — the same hook for the wire fast path,
+      ``(record, row) -> None`` over the raw JSON record and the column
+      dict. A spec with an ``attrs_postprocess`` but no
+      ``wire_postprocess`` always takes the ``_convert`` path.
     - ``extra_fetch_kwargs`` — kwargs always passed to ``api_fn``
       regardless of incremental state. Variant uses it to enable
       ``extend=[PRODUCT_OR_MATERIAL]`` so the postprocess hook can read
@@ -235,6 +250,7 @@ class EntitySpec:
     related_specs: tuple[EntitySpec, ...] = field(default_factory=tuple)
     depends_on: tuple[str, ...] = ()
     attrs_postprocess: Callable[[Any, Any], None] | None = None
+    wire_postprocess: Callable[[dict[str, Any], dict[str, Any]], None] | None = None
     post_sync: Callable[[TypedCacheEngine], Awaitable[None]] | None = None
     preserve_columns_on_conflict: frozenset[str] = frozenset()
     extra_fetch_kwargs: dict[str, Any] = field(default_factory=dict)
@@ -410,8 +426,92 @@ def _convert(spec: EntitySpec, attrs_obj: Any) -> tuple[Any, list[Any]]:
     return parent, children
 
 
+def _convert_wire(
+    spec: EntitySpec, record: dict[str, Any], attrs_obj: Any = None
+) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """Convert one wire record straight to ``(parent, children)`` column dicts.
+
+    The fast-path counterpart of ``_convert``, producing what
+    ``_bulk_upsert`` would dump from ``_convert``'s cache rows. An attrs
+    object is only needed to resolve the API class (purchase orders), and is
+    built from the record when not given.
+
+    Raises:
+        WireRowMiss: If the record (or one of its child rows) needs the
+            reference conversion.
+    """
+    if spec.pydantic_resolver is not None:
+        if attrs_obj is None:
+            try:
+                attrs_obj = _attrs_from_record(spec, record)
+            except Exception as exc:
+                # The generated parser rejects the record; ``_convert``'s
+                # path reports it as a skipped record
+                msg = f"record does not parse: {exc!r}"
+                raise WireRowMiss(msg) from exc
+        api_cls = spec.pydantic_resolver(attrs_obj)
+    else:
+        api_cls = spec.pydantic_cls
+    # Same singleton ``id`` pin as ``_convert``
+    overrides = (
+        {"id": 1}
+        if spec.single_record and "id" not in getattr(api_cls, "model_fields", {})
+        else None
+    )
+    parent = build_row(row_plan(spec.cache_cls, api_cls), record, overrides)
+
+    children: list[dict[str, Any]] = []
+    if (
+        spec.child_cls is not None
+        and spec.rows_field is not None
+        and spec.fk_field is not None
+    ):
+        rows = record.get(spec.rows_field) or []
+        if rows:
+            row_cls = nested_model_class(api_cls, spec.rows_field)
+            if row_cls is None:
+                msg = f"{api_cls.__name__}.{spec.rows_field} has no row model"
+                raise WireRowMiss(msg)
+            child_plan = row_plan(spec.child_cls, row_cls)
+            fk = {spec.fk_field: parent["id"]}
+            children = [build_row(child_plan, row, fk) for row in rows]
+
+    if spec.wire_postprocess is not None:
+        spec.wire_postprocess(record, parent)
+
+    return parent, children
+
+
+def _wire_records(spec: EntitySpec, response: Any) -> list[Any] | None:
+    """Return the decoded page records behind ``response`` for the wire fast path.
+
+    ``_sync_one_locked`` fetches inside ``decoded_json_responses()``, so a
+    ``200`` arrives as a ``DecodedJSON`` over the body the client already
+    decoded. Returns ``None`` — every record then goes through ``_convert`` —
+    when the spec can't take the fast path, or when ``parsed`` is anything
+    else (an error response, or a mocked attrs model).
+    """
+    parsed = getattr(response, "parsed", None)
+    if not isinstance(parsed, DecodedJSON) or (
+        spec.attrs_postprocess is not None and spec.wire_postprocess is None
+    ):
+        return None
+    payload = parsed.payload
+    if spec.single_record:
+        return [payload] if isinstance(payload, dict) else None
+    records = payload.get("data", []) if isinstance(payload, dict) else payload
+    return records if isinstance(records, list) else None
+
+
+def _attrs_from_record(spec: EntitySpec, record: dict[str, Any]) -> Any:
+    """Build the attrs object the endpoint's generated parser makes of ``record``."""
+    if spec.single_record:
+        return parse_decoded_json(spec.api_fn, record)
+    return parse_decoded_json(spec.api_fn, {"data": [record]}).data[0]
+
+
 def _convert_batch(
-    spec: EntitySpec, attrs_objs: Iterable[Any]
+    spec: EntitySpec, items: Iterable[Any], *, wire: bool = False
 ) -> tuple[list[Any], list[Any]]:
     """Convert a batch of attrs objects into cache rows, isolating failures.
 
@@ -427,12 +527,38 @@ def _convert_batch(
 
     Skipped records are recoverable: a later ``updated_at`` bump re-syncs them,
     and ``rebuild_cache`` re-pulls the full set from scratch.
+
+    ``items`` are attrs objects, or with ``wire=True`` the decoded page
+    records: each record first tries ``_convert_wire``, producing column
+    dicts, and only the records the fast path hands back are built into
+    attrs objects for ``_convert``. Only ``WireRowMiss`` takes a record
+    down that path; any other exception from the fast path propagates.
     """
     cached_parents: list[Any] = []
     cached_children: list[Any] = []
     skipped = 0
-    for attrs_obj in attrs_objs:
+    fallbacks = 0
+    for item in items:
+        if wire:
+            try:
+                parent, children = _convert_wire(spec, item)
+            except WireRowMiss as miss:
+                # Only a declared miss falls back: any other exception is a
+                # fast-path bug and must surface, not silently cost the speedup
+                if not fallbacks:
+                    logger.debug(
+                        "cache_sync_wire_fallback",
+                        entity=spec.entity_key,
+                        record_id=item.get("id"),
+                        reason=str(miss),
+                    )
+                fallbacks += 1
+            else:
+                cached_parents.append(parent)
+                cached_children.extend(children)
+                continue
         try:
+            attrs_obj = _attrs_from_record(spec, item) if wire else item
             parent, children = _convert(spec, attrs_obj)
         except Exception as exc:
             # Catch-all on purpose: this is the batch-resilience backstop, so a
@@ -442,7 +568,7 @@ def _convert_batch(
             logger.warning(
                 "cache_sync_skipped_record",
                 entity=spec.entity_key,
-                record_id=getattr(attrs_obj, "id", None),
+                record_id=item.get("id") if wire else getattr(item, "id", None),
                 error=str(exc),
             )
             continue
@@ -455,6 +581,12 @@ def _convert_batch(
             entity=spec.entity_key,
             skipped=skipped,
         )
+    if fallbacks:
+        logger.debug(
+            "cache_sync_wire_fallbacks",
+            entity=spec.entity_key,
+            fallbacks=fallbacks,
+        )
 
     return cached_parents, cached_children
 
@@ -484,6 +616,10 @@ async def _bulk_upsert(
     hardcoded exclude list, so adding a new ``Relationship`` field to a
     cache class can never silently leak into the values payload.
 
+    ``rows`` may mix cache-class instances (from ``_convert``) with column
+    dicts from the wire fast path; the dicts already carry exactly the
+    table's columns and are inserted as-is.
+
     ``preserve_columns`` are excluded from the ``ON CONFLICT DO UPDATE SET``
     clause: their existing value survives the upsert instead of being
     overwritten by the incoming payload. This protects cache-only columns
@@ -509,7 +645,10 @@ async def _bulk_upsert(
     # cold sync of thousands of rows doesn't double-buffer the cache rows
     # *and* their dict projections in memory before the first INSERT.
     for chunk in batched(rows, chunk_size):
-        values = [r.model_dump(include=column_names) for r in chunk]
+        values = [
+            r if isinstance(r, dict) else r.model_dump(include=column_names)
+            for r in chunk
+        ]
         stmt = sqlite_insert(table_cls).values(values)
         update_cols = {c.name: c for c in stmt.excluded if c.name not in frozen}
         stmt = stmt.on_conflict_do_update(index_elements=["id"], set_=update_cols)
@@ -602,17 +741,24 @@ async def _sync_one_locked(
         kwargs.setdefault("include_deleted", True)
     if last_synced is not None and spec.supports_incremental:
         kwargs["updated_at_min"] = last_synced.replace(tzinfo=UTC)
-    response = await spec.api_fn.asyncio_detailed(client=client, **kwargs)
-    if spec.single_record:
-        # Endpoints like ``GET /factory`` return a bare object rather than
-        # a list-wrapped ``{"data": [...]}``. Normalize to a one-element
-        # list so the rest of the pipeline stays generic.
-        single = unwrap(response)
-        attrs_objs = [single] if single is not None else []
+    # Only the records the wire fast path hands back get an attrs model
+    with decoded_json_responses():
+        response = await spec.api_fn.asyncio_detailed(client=client, **kwargs)
+    records = _wire_records(spec, response)
+    if records is not None:
+        cached_parents, cached_children = _convert_batch(spec, records, wire=True)
     else:
-        attrs_objs = unwrap_data(response, default=[])
-
-    cached_parents, cached_children = _convert_batch(spec, attrs_objs)
+        if isinstance(response.parsed, DecodedJSON):
+            response.parsed = parse_decoded_json(spec.api_fn, response.parsed.payload)
+        if spec.single_record:
+            # Endpoints like ``GET /factory`` return a bare object rather than
+            # a list-wrapped ``{"data": [...]}``. Normalize to a one-element
+            # list so the rest of the pipeline stays generic.
+            single = unwrap(response)
+            attrs_objs = [single] if single is not None else []
+        else:
+            attrs_objs = unwrap_data(response, default=[])
+        cached_parents, cached_children = _convert_batch(spec, attrs_objs)
 
     async with cache.session() as session:
         # Parents first so child FK constraints resolve on insert.
@@ -664,7 +810,8 @@ async def _sync_one_locked(
             fk_col = child_columns[spec.fk_field]
             deleted_at_col = child_columns.get("deleted_at")
             for parent in cached_parents:
-                stmt = delete(spec.child_cls).where(fk_col == parent.id)
+                parent_id = parent["id"] if isinstance(parent, dict) else parent.id
+                stmt = delete(spec.child_cls).where(fk_col == parent_id)
                 if deleted_at_col is not None:
                     stmt = stmt.where(deleted_at_col.is_(None))
                 await session.exec(stmt.execution_options(synchronize_session=False))
@@ -953,6 +1100,45 @@ def _variant_postprocess(attrs_obj: Any, cache_row: CachedVariant) -> None:
     cache_row.supplier_item_codes_text = " ".join(codes) if codes else None
 
 
+def _variant_wire_postprocess(record: dict[str, Any], row: dict[str, Any]) -> None:
+    """``_variant_postprocess`` for the wire fast path.
+
+    Reads the same fields from the raw ``/variants`` record (the extended
+    ``product_or_material`` object is a plain dict here) and writes them
+    into the column dict. Raises ``WireRowMiss`` on a value the attrs path
+    would have parsed differently, so the record takes ``_convert``.
+    """
+    parent = record.get("product_or_material")
+    parent_name: str | None = None
+    if parent is not None:
+        if not isinstance(parent, dict):
+            msg = f"product_or_material is not an object: {parent!r}"
+            raise WireRowMiss(msg)
+        archived_at = parent.get("archived_at")
+        parent_name = parent.get("name")
+        if not isinstance(archived_at, str | None) or not isinstance(
+            parent_name, str | None
+        ):
+            msg = "unexpected product_or_material archived_at / name"
+            raise WireRowMiss(msg)
+        try:
+            row["parent_archived_at"] = (
+                datetime.fromisoformat(archived_at) if archived_at is not None else None
+            )
+        except ValueError as exc:
+            msg = f"product_or_material archived_at: {archived_at!r}"
+            raise WireRowMiss(msg) from exc
+        row["parent_name"] = parent_name
+
+    sku = record.get("sku") or ""
+    config_attrs = record.get("config_attributes") or []
+    display_name = build_variant_display_name(parent_name, config_attrs, sku)
+    row["display_name"] = display_name or None
+
+    codes = record.get("supplier_item_codes") or []
+    row["supplier_item_codes_text"] = " ".join(codes) if codes else None
+
+
 async def _backfill_service_variant_links(cache: TypedCacheEngine) -> None:
     """Denormalize ``service_id`` onto the service-type ``CachedVariant`` rows.
 
@@ -1046,6 +1232,7 @@ _VARIANT_SPEC = EntitySpec(
     },
     depends_on=("product", "material"),
     attrs_postprocess=_variant_postprocess,
+    wire_postprocess=_variant_wire_postprocess,
     # ``service_id`` is denormalized onto service variants by the service
     # spec's ``post_sync`` (it lives on /services, never on /variants).
     # Preserve it across /variants deltas so a re-upsert of a service
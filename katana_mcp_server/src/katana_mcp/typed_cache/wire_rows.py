@@ -0,0 +1,280 @@
+"""Wire-JSON → cache-column fast path for the typed-cache sync.
+
+The reference conversion in :func:`katana_mcp.typed_cache.sync._convert`
+materializes every record five times: attrs ``from_dict``, pydantic
+``from_attrs``, ``model_dump``, ``Cached*.model_validate``, and the
+``model_dump`` in ``_bulk_upsert``. On a cold sync of a large collection
+that chain, not the network, is where the time goes.
+
+This module maps a raw page record (the decoded JSON dict) straight to the
+column dict ``_bulk_upsert`` inserts. A :class:`RowPlan` is compiled once
+per ``(cache class, API pydantic class)`` pair from the two classes' field
+annotations. It holds one entry per table column, carrying only the work
+that column needs:
+
+- an exact-type check for ``int`` / ``str`` / ``bool`` columns
+  (``float`` columns also take ints, as pydantic does)
+- ISO-8601 parsing for ``datetime`` columns
+- the enum lookup for enum columns
+- a ``TypeAdapter`` round trip for JSON columns, for columns with pydantic
+  constraints (patterns, bounds), and for columns whose API and cache
+  annotations differ
+- the ``"null"`` / ``"undefined"`` sentinel coercion that ``from_attrs``
+  applies to fields that cannot hold a string
+
+The fast path never guesses. Anything it can't convert exactly the way the
+reference chain would raises :class:`WireRowMiss`, and the caller converts
+that record through ``_convert`` instead. That covers:
+
+- a value of an unexpected type
+- a null in a non-nullable column
+- an empty object where a nested model goes
+- a nested payload pydantic rejects
+"""
+
+from __future__ import annotations
+
+import enum
+import types
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Annotated, Any, Union, get_args, get_origin
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import inspect as sqla_inspect
+from sqlmodel import SQLModel
+
+from katana_public_api_client.models_pydantic._base import (
+    _SENTINEL_NULL_STRINGS,
+    _annotation_accepts_str,
+)
+from katana_public_api_client.models_pydantic._pydantic_json import PydanticJSON
+
+
+class WireRowMiss(Exception):
+    """A wire record the fast path can't convert exactly like ``_convert``."""
+
+
+# Column kinds, in rough order of frequency
+_SCALAR = 0  # int / str / bool: exact type check
+_FLOAT = 1  # float: ints widened
+_DATETIME = 2  # ISO-8601 string -> datetime
+_ENUM = 3  # value -> enum member
+_ADAPTED = 4  # validated through the API then the cache field's TypeAdapter
+_JSON = 5  # like _ADAPTED, dumped back to plain Python for the JSON column
+_CACHE_ONLY = 6  # not on the API class: always the cache field's default
+
+# ``(column, kind, nullable, coerce the sentinel, kind-specific argument)``.
+# The argument is the scalar type, the enum class, the ``(API, cache)``
+# adapters, or the cache-only default.
+_Column = tuple[str, int, bool, bool, Any]
+
+
+@dataclass(frozen=True)
+class RowPlan:
+    """Per-column conversion steps from a wire record to a cache row."""
+
+    cache_cls: type[SQLModel]
+    api_cls: type
+    columns: tuple[_Column, ...]
+
+
+_plans: dict[tuple[type[SQLModel], type], RowPlan] = {}
+
+
+def row_plan(cache_cls: type[SQLModel], api_cls: type) -> RowPlan:
+    """Return the cached :class:`RowPlan` for ``api_cls`` records in ``cache_cls``."""
+    plan = _plans.get((cache_cls, api_cls))
+    if plan is None:
+        plan = _plans[cache_cls, api_cls] = _compile_row_plan(cache_cls, api_cls)
+    return plan
+
+
+def build_row(
+    plan: RowPlan,
+    record: Mapping[str, Any],
+    overrides: Mapping[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Convert one wire ``record`` into the column dict for ``plan.cache_cls``.
+
+    Args:
+        plan: The compiled plan for the record's cache and API classes.
+        record: One decoded JSON object from the page.
+        overrides: Column values to use as-is instead of reading the record
+            (the child-row FK, the singleton ``id``).
+
+    Returns:
+        A dict with exactly one key per table column.
+
+    Raises:
+        WireRowMiss: If any column can't be converted exactly like the
+            reference ``from_attrs`` / ``model_validate`` chain.
+    """
+    row: dict[str, Any] = {}
+    for name, kind, nullable, coerce_sentinel, arg in plan.columns:
+        if overrides is not None and name in overrides:
+            row[name] = overrides[name]
+            continue
+        if kind == _CACHE_ONLY:
+            value = arg
+        else:
+            value = record.get(name)
+            if value is not None:
+                if (
+                    coerce_sentinel
+                    and value.__class__ is str
+                    and value in _SENTINEL_NULL_STRINGS
+                ):
+                    value = None
+                else:
+                    value = _convert(name, kind, arg, value)
+        if value is None and not nullable:
+            msg = f"{plan.cache_cls.__name__}.{name} is null"
+            raise WireRowMiss(msg)
+        row[name] = value
+    return row
+
+
+def nested_model_class(api_cls: type, field_name: str) -> type | None:
+    """Return the model class of a ``list[Model] | None`` field on ``api_cls``."""
+    field = getattr(api_cls, "model_fields", {}).get(field_name)
+    if field is None:
+        return None
+    for member in _members(field.annotation):
+        for arg in get_args(member):
+            if isinstance(arg, type) and hasattr(arg, "model_fields"):
+                return arg
+    return None
+
+
+def _convert(name: str, kind: int, arg: Any, value: Any) -> Any:
+    """Convert one non-null wire ``value`` for a column of ``kind``."""
+    cls = value.__class__
+    if kind == _SCALAR:
+        if cls is arg:
+            return value
+    elif kind == _FLOAT:
+        if cls is float:
+            return value
+        if cls is int:
+            return float(value)
+    elif kind == _DATETIME:
+        if cls is str:
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                pass
+    elif kind == _ENUM:
+        try:
+            return arg(value)
+        except (ValueError, TypeError):
+            pass
+    elif kind == _JSON and value == {}:
+        # ``from_attrs`` turns some empty objects into None and builds others
+        # into an all-null model; which one depends on the attrs field type
+        pass
+    else:
+        api_adapter, cache_adapter = arg
+        try:
+            if api_adapter is not None:
+                value = api_adapter.dump_python(api_adapter.validate_python(value))
+            value = cache_adapter.validate_python(value)
+        except ValidationError:
+            pass
+        else:
+            return cache_adapter.dump_python(value) if kind == _JSON else value
+    msg = f"{name}: unexpected wire value {value!r}"
+    raise WireRowMiss(msg)
+
+
+def _compile_row_plan(cache_cls: type[SQLModel], api_cls: type) -> RowPlan:
+    """Compile the per-column plan for ``api_cls`` records in ``cache_cls``."""
+    cache_fields = cache_cls.model_fields
+    api_fields: dict[str, Any] = getattr(api_cls, "model_fields", {})
+
+    columns: list[_Column] = []
+    for column in sqla_inspect(cache_cls).columns:
+        name = column.name
+        cache_field = cache_fields[name]
+        api_field = api_fields.get(name)
+        if api_field is None:
+            # ``from_attrs`` never fills it, so ``model_validate`` defaults it
+            default = (
+                None
+                if cache_field.is_required()
+                else cache_field.get_default(call_default_factory=True)
+            )
+            nullable = _accepts_none(cache_field.annotation)
+            columns.append((name, _CACHE_ONLY, nullable, False, default))
+            continue
+
+        kind, arg = _column_kind(
+            cache_field, api_field, is_json=isinstance(column.type, PydanticJSON)
+        )
+        columns.append(
+            (
+                name,
+                kind,
+                _accepts_none(cache_field.annotation)
+                and _accepts_none(api_field.annotation),
+                not _annotation_accepts_str(api_field.annotation),
+                arg,
+            )
+        )
+    return RowPlan(cache_cls=cache_cls, api_cls=api_cls, columns=tuple(columns))
+
+
+def _column_kind(cache_field: Any, api_field: Any, *, is_json: bool) -> tuple[int, Any]:
+    """Pick the cheapest exact conversion for one column."""
+    cache_type = _non_none(cache_field.annotation)
+    same_type = cache_type == _non_none(api_field.annotation)
+    constrained = bool(_constraints(cache_field) or _constraints(api_field))
+
+    if not is_json and same_type and not constrained:
+        if cache_type in (int, str, bool):
+            return _SCALAR, cache_type
+        if cache_type is float:
+            return _FLOAT, None
+        if cache_type is datetime:
+            return _DATETIME, None
+        if isinstance(cache_type, type) and issubclass(cache_type, enum.Enum):
+            return _ENUM, cache_type
+
+    # The reference chain validates the value against the API field, dumps
+    # it, then validates it against the cache field; the adapters do the
+    # same. The API pass is skipped when it can't change the result.
+    cache_adapter = _adapter(cache_field)
+    api_adapter = None if same_type and not constrained else _adapter(api_field)
+    return (_JSON if is_json else _ADAPTED), (api_adapter, cache_adapter)
+
+
+def _adapter(field: Any) -> TypeAdapter[Any]:
+    """``TypeAdapter`` for a model field's annotation plus its pydantic constraints."""
+    constraints = _constraints(field)
+    if constraints:
+        annotated: Any = Annotated[field.annotation, *constraints]
+        return TypeAdapter(annotated)
+    return TypeAdapter(field.annotation)
+
+
+def _constraints(field: Any) -> list[Any]:
+    """The field's validation metadata, without SQLModel's column settings."""
+    return [m for m in field.metadata if not type(m).__module__.startswith("sqlmodel")]
+
+
+def _members(annotation: Any) -> tuple[Any, ...]:
+    """Members of a union annotation, or the annotation itself."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        return get_args(annotation)
+    return (annotation,)
+
+
+def _non_none(annotation: Any) -> Any:
+    """The annotation without ``None``; unions of several types are kept whole."""
+    members = [m for m in _members(annotation) if m is not type(None)]
+    return members[0] if len(members) == 1 else annotation
+
+
+def _accepts_none(annotation: Any) -> bool:
+    return annotation is None or type(None) in _members(annotation)
@@ -11,6 +11,7 @@ from fastmcp import FastMCP
 from fastmcp.server.middleware.caching import ResponseCachingMiddleware
 from katana_mcp.server import _build_auth, lifespan, main, mcp
 from katana_mcp.services import Services
+from katana_mcp.typed_cache.engine import cache_dir
 
 from katana_public_api_client import KatanaClient
 
@@ -166,6 +167,8 @@ class TestLifespan:
                 timeout=30.0,
                 max_retries=5,
                 max_pages=100,
+                shared_rate_limit=cache_dir() / "rate_limit.db",
+                coalesce_requests=True,
             )
 
     @pytest.mark.asyncio
@@ -386,6 +389,44 @@ class TestCacheWarmup:
                 # No warmup task should be running with the disable flag set.
                 assert self._find_warmup_task() is None
 
+    @pytest.mark.cache_warmup_enabled
+    @pytest.mark.asyncio
+    async def test_warmup_runs_at_bulk_rate_limit_priority(self):
+        """The warm-up's requests queue behind foreground tool calls on a
+        shared key, while requests made by the lifespan itself stay
+        interactive.
+        """
+        import katana_mcp.server as server_mod
+
+        from katana_public_api_client.katana_client import _REQUEST_PRIORITY
+
+        mock_server = MagicMock(spec=FastMCP)
+        seen: list[str] = []
+
+        async def fake_warmup(*_args: object, **_kwargs: object) -> None:
+            seen.append(_REQUEST_PRIORITY.get())
+
+        with (
+            patch.dict(os.environ, {"KATANA_API_KEY": "test-api-key-123"}, clear=True),
+            patch("katana_mcp.server.load_dotenv"),
+            patch("katana_mcp.server.KatanaClient") as mock_client_class,
+            patch.object(server_mod, "_warm_caches_in_background", fake_warmup),
+        ):
+            mock_client_instance = AsyncMock(spec=KatanaClient)
+            mock_client_instance.__aenter__ = AsyncMock(
+                return_value=mock_client_instance
+            )
+            mock_client_instance.__aexit__ = AsyncMock(return_value=None)
+            mock_client_class.return_value = mock_client_instance
+
+            async with lifespan(mock_server):
+                warmup_task = self._find_warmup_task()
+                assert warmup_task is not None
+                await warmup_task
+                assert _REQUEST_PRIORITY.get() == "interactive"
+
+        assert seen == ["bulk"]
+
     @pytest.mark.cache_warmup_enabled
     @pytest.mark.asyncio
     async def test_warmup_task_scheduled_when_enabled(self):
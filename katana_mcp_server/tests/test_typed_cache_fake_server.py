@@ -0,0 +1,159 @@
+"""End-to-end typed-cache sync against the fake Katana server.
+
+Every ``ENTITY_SPECS`` entry (and its related row specs) syncs through a real
+``KatanaClient`` — pagination, decoding, ``from_attrs`` conversion and the
+bulk upsert — with :class:`FakeKatanaServer` standing in for the API. Pins
+that the fake server's synthetic payloads stay loadable by the cache, so it
+can back throughput benchmarks of the sync path.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from katana_mcp.typed_cache.sync import ENTITY_SPECS, _ensure_synced
+from sqlmodel import func, select
+
+from katana_public_api_client import KatanaClient
+from katana_public_api_client.models_pydantic._generated import (
+    CachedProduct,
+    CachedSalesOrder,
+    CachedSalesOrderRow,
+    CachedVariant,
+)
+from katana_public_api_client.testing.fake_server import FakeDataset, FakeKatanaServer
+
+
+async def _count(engine, table) -> int:
+    async with engine.session() as session:
+        return (await session.exec(select(func.count()).select_from(table))).one()
+
+
+@pytest.mark.asyncio
+async def test_every_entity_syncs_from_the_fake_server(typed_cache_engine):
+    dataset = FakeDataset(size=60)
+    server = FakeKatanaServer(dataset, requests_per_minute=None)
+
+    async with KatanaClient(
+        api_key="fake",
+        base_url="http://katana.test/v1",
+        base_transport=server,
+        requests_per_minute=None,
+    ) as client:
+        for spec in ENTITY_SPECS.values():
+            await _ensure_synced(client, typed_cache_engine, spec)
+
+    # Sync sends include_deleted/include_archived, so every record lands
+    assert await _count(typed_cache_engine, CachedProduct) == len(
+        dataset.records("/products")
+    )
+    assert await _count(typed_cache_engine, CachedVariant) == len(
+        dataset.records("/variants")
+    )
+    assert await _count(typed_cache_engine, CachedSalesOrder) == len(
+        dataset.records("/sales_orders")
+    )
+    assert await _count(typed_cache_engine, CachedSalesOrderRow) == len(
+        dataset.records("/sales_order_rows")
+    )
+
+
+@pytest.mark.asyncio
+async def test_incremental_sync_fetches_only_touched_rows(typed_cache_engine):
+    dataset = FakeDataset(size=60, end=datetime.now(tz=UTC) - timedelta(days=1))
+    server = FakeKatanaServer(dataset, requests_per_minute=None)
+    spec = ENTITY_SPECS["product"]
+
+    async with KatanaClient(
+        api_key="fake",
+        base_url="http://katana.test/v1",
+        base_transport=server,
+        requests_per_minute=None,
+    ) as client:
+        await _ensure_synced(client, typed_cache_engine, spec)
+        touched = dataset.touch(
+            "/products", 3, now=datetime.now(tz=UTC) + timedelta(minutes=1)
+        )
+        for product_id in touched:
+            record = dataset.get("/products", product_id)
+            assert record is not None
+            record["name"] = f"Renamed {product_id}"
+        await _ensure_synced(client, typed_cache_engine, spec)
+
+    async with typed_cache_engine.session() as session:
+        renamed = (
+            await session.exec(
+                select(CachedProduct).where(CachedProduct.name.startswith("Renamed"))
+            )
+        ).all()
+    assert sorted(p.id for p in renamed) == touched
+
+
+@pytest.mark.asyncio
+async def test_wire_fast_path_stores_the_same_rows(typed_cache_engine, monkeypatch):
+    """Rows synced from the raw page JSON equal rows synced through ``_convert``."""
+    from katana_mcp.typed_cache import sync
+
+    dataset = FakeDataset(size=60)
+    server = FakeKatanaServer(dataset, requests_per_minute=None)
+    tables = (CachedSalesOrder, CachedSalesOrderRow, CachedVariant, CachedProduct)
+
+    async def snapshot() -> dict[str, list[dict]]:
+        async with typed_cache_engine.session() as session:
+            return {
+                table.__name__: [
+                    row.model_dump()
+                    for row in (await session.exec(select(table))).all()
+                ]
+                for table in tables
+            }
+
+    async with KatanaClient(
+        api_key="fake",
+        base_url="http://katana.test/v1",
+        base_transport=server,
+        requests_per_minute=None,
+    ) as client:
+        for key in ("sales_order", "product", "variant"):
+            await _ensure_synced(client, typed_cache_engine, ENTITY_SPECS[key])
+        fast = await snapshot()
+
+        monkeypatch.setattr(sync, "_wire_records", lambda *args: None)
+        for key in ("sales_order", "product", "variant"):
+            await sync.force_resync(client, typed_cache_engine, key)
+        reference = await snapshot()
+
+    assert all(fast.values())
+    assert fast == reference
+
+
+@pytest.mark.asyncio
+async def test_wire_sync_builds_no_models(typed_cache_engine, monkeypatch):
+    """A clean page lands from its decoded JSON; no attrs model is built."""
+    from katana_mcp.typed_cache import sync
+
+    from katana_public_api_client.katana_client import DecodeOffload
+    from katana_public_api_client.models import ProductListResponse
+
+    def no_model(*args, **kwargs):
+        raise AssertionError("attrs model built")
+
+    monkeypatch.setattr(ProductListResponse, "from_dict", no_model)
+    monkeypatch.setattr(sync, "_attrs_from_record", no_model)
+    dataset = FakeDataset(size=60)
+
+    async with KatanaClient(
+        api_key="fake",
+        base_url="http://katana.test/v1",
+        base_transport=FakeKatanaServer(dataset, requests_per_minute=None),
+        requests_per_minute=None,
+        decode_offload=DecodeOffload(threshold_bytes=1),
+    ) as client:
+        await _ensure_synced(client, typed_cache_engine, ENTITY_SPECS["product"])
+        assert client.decode_offloader is not None
+        assert client.decode_offloader.stats().prebuilt == 0
+
+    assert await _count(typed_cache_engine, CachedProduct) == len(
+        dataset.records("/products")
+    )
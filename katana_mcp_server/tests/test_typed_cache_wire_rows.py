@@ -0,0 +1,154 @@
+"""Tests for the typed-cache wire fast path (``typed_cache.wire_rows``).
+
+The fast path must produce exactly the column values the reference
+``_convert`` chain (attrs -> pydantic -> cache class -> ``model_dump``)
+would, and hand every record it can't reproduce back to that chain. These
+tests compare the two paths record by record on the fake server's synthetic
+tenant, then pin the fallback cases.
+"""
+
+from __future__ import annotations
+
+import copy
+from datetime import UTC, datetime
+from http import HTTPStatus
+from unittest.mock import patch
+
+import pytest
+from katana_mcp.typed_cache import sync
+from katana_mcp.typed_cache.sync import (
+    ENTITY_SPECS,
+    EntitySpec,
+    _convert,
+    _convert_batch,
+    _convert_wire,
+    _wire_records,
+)
+from katana_mcp.typed_cache.wire_rows import WireRowMiss
+from sqlalchemy import inspect as sqla_inspect
+
+from katana_public_api_client.client_types import Response
+from katana_public_api_client.decode_offload import parse_decoded_json
+from katana_public_api_client.katana_client import DecodedJSON
+from katana_public_api_client.testing.fake_server import FakeDataset
+
+_DATASET = FakeDataset(size=40, end=datetime(2026, 1, 1, tzinfo=UTC))
+
+_ALL_SPECS = {
+    spec.entity_key: spec
+    for top in ENTITY_SPECS.values()
+    for spec in (top, *top.related_specs)
+}
+
+
+def _path(spec: EntitySpec) -> str:
+    return "/factory" if spec.single_record else f"/{spec.entity_key}s"
+
+
+def _page(spec: EntitySpec, records: list[dict]) -> tuple[Response, list]:
+    """The sync's view of a page, and the attrs objects the generated parser builds."""
+    payload = records[0] if spec.single_record else {"data": records}
+    parsed = parse_decoded_json(spec.api_fn, payload)
+    response = Response(HTTPStatus.OK, b"", {}, DecodedJSON(payload))
+    return response, [parsed] if spec.single_record else parsed.data
+
+
+def _reference_rows(spec: EntitySpec, attrs_obj) -> tuple[dict, list[dict]]:
+    parent, children = _convert(spec, attrs_obj)
+    columns = {c.name for c in sqla_inspect(spec.cache_cls).columns}
+    child_columns = (
+        {c.name for c in sqla_inspect(spec.child_cls).columns}
+        if spec.child_cls is not None
+        else set()
+    )
+    return (
+        parent.model_dump(include=columns),
+        [child.model_dump(include=child_columns) for child in children],
+    )
+
+
+def _typed(row: dict) -> dict:
+    """Column values with their types, so ``1 == 1.0`` style matches don't pass."""
+    return {name: (type(value), value) for name, value in row.items()}
+
+
+@pytest.mark.parametrize("entity_key", sorted(_ALL_SPECS))
+def test_wire_rows_match_reference_conversion(entity_key):
+    spec = _ALL_SPECS[entity_key]
+    response, attrs_objs = _page(spec, _DATASET.records(_path(spec)))
+    records = _wire_records(spec, response)
+    assert records is not None
+
+    for record, attrs_obj in zip(records, attrs_objs, strict=True):
+        parent, children = _convert_wire(spec, record, attrs_obj)
+        ref_parent, ref_children = _reference_rows(spec, attrs_obj)
+        assert _typed(parent) == _typed(ref_parent)
+        assert [_typed(c) for c in children] == [_typed(c) for c in ref_children]
+
+
+def _sales_order_page(**changes) -> tuple[list[dict], list]:
+    spec = ENTITY_SPECS["sales_order"]
+    records = copy.deepcopy(_DATASET.records("/sales_orders")[:3])
+    records[0].update(changes)
+    response, attrs_objs = _page(spec, records)
+    wire = _wire_records(spec, response)
+    assert wire is not None
+    return wire, attrs_objs
+
+
+def test_sentinel_null_is_coerced_on_the_fast_path():
+    records, attrs_objs = _sales_order_page(delivery_date="null")
+
+    parent, _ = _convert_wire(ENTITY_SPECS["sales_order"], records[0], attrs_objs[0])
+
+    assert parent["delivery_date"] is None
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {"shipping_fee": {}},  # empty object where a nested model goes
+        {"currency": "usd"},  # fails the column's pattern
+        {"delivery_date": "2026-01-05T10:00:00"},  # API field is AwareDatetime
+    ],
+)
+def test_unreproducible_records_fall_back_to_convert(changes):
+    spec = ENTITY_SPECS["sales_order"]
+    records, attrs_objs = _sales_order_page(**changes)
+
+    with pytest.raises(WireRowMiss):
+        _convert_wire(spec, records[0], attrs_objs[0])
+
+    with patch.object(
+        sync, "_attrs_from_record", wraps=sync._attrs_from_record
+    ) as attrs_from_record:
+        parents, _ = _convert_batch(spec, records, wire=True)
+    reference, _ = _convert_batch(spec, attrs_objs)
+    # The untouched records come back as column dicts; the first one is
+    # whatever ``_convert`` made of it (a cache row, or skipped)
+    assert all(isinstance(p, dict) for p in parents[-2:])
+    assert len(parents) == len(reference)
+    # Only the record that fell back was built into an attrs object
+    attrs_from_record.assert_called_once_with(spec, records[0])
+
+
+def test_fast_path_bugs_are_not_masked_by_the_fallback():
+    spec = ENTITY_SPECS["sales_order"]
+    records, _ = _sales_order_page()
+
+    with (
+        patch.object(sync, "build_row", side_effect=KeyError("id")),
+        pytest.raises(KeyError),
+    ):
+        _convert_batch(spec, records, wire=True)
+
+
+def test_only_decoded_pages_take_the_fast_path():
+    spec = ENTITY_SPECS["customer"]
+    records = _DATASET.records("/customers")[:2]
+    response, attrs_objs = _page(spec, records)
+
+    assert _wire_records(spec, response) == records
+    # A mocked or already-parsed model, an error, or a body without a list
+    for parsed in (attrs_objs[0], None, DecodedJSON({"data": {}}), DecodedJSON(1)):
+        assert _wire_records(spec, Response(HTTPStatus.OK, b"", {}, parsed)) is None
@@ -1,7 +1,10 @@
 """Katana Public API Client - Python client for Katana Manufacturing ERP."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .client import AuthenticatedClient, Client
-from .katana_client import KatanaClient
+from .katana_client import KatanaClient, request_priority
 from .utils import (
     APIError,
     AuthenticationError,
@@ -17,10 +20,18 @@ from .utils import (
     unwrap_data,
 )
 
+if TYPE_CHECKING:
+    from .bulk import BulkOperation, BulkReport
+
+# Loaded on first access, like the ``models`` package
+_LAZY_MODULES = {"BulkOperation": "bulk", "BulkReport": "bulk"}
+
 __all__ = [
     "APIError",
     "AuthenticatedClient",
     "AuthenticationError",
+    "BulkOperation",
+    "BulkReport",
     "Client",
     "KatanaClient",
     "RateLimitError",
@@ -31,6 +42,22 @@ __all__ = [
     "handle_response",
     "is_error",
     "is_success",
+    "request_priority",
     "unwrap",
     "unwrap_data",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY_MODULES[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,272 @@
+"""Adaptive (AIMD) cap on in-flight requests for the ``KatanaClient`` transport chain.
+
+:class:`AdaptiveConcurrencyTransport` queues requests beyond a concurrency limit
+that grows while the server answers quickly and halves on 429s, 5xx responses,
+transport errors or rising latency. ``KatanaClient(adaptive_concurrency=...)``
+installs it inside ``RateLimitTransport``.
+"""
+
+import asyncio
+import contextlib
+import logging
+from collections import deque
+from http import HTTPStatus
+from typing import Any
+
+import httpx
+from attrs import define
+from httpx import AsyncBaseTransport, AsyncHTTPTransport
+
+from ._logging import Logger
+
+_HEADER_REMAINING = "X-Ratelimit-Remaining"
+
+
+@define(frozen=True)
+class AdaptiveConcurrencyStats:
+    """Snapshot of ``AdaptiveConcurrencyTransport``'s controller.
+
+    Attributes:
+        limit: Current in-flight ceiling (fractional while it grows).
+        in_flight: Requests currently awaiting a response.
+        waiting: Requests queued for a slot.
+        increases: Additive increases applied so far.
+        decreases: Multiplicative decreases applied so far.
+        p95_seconds: p95 latency over the current sample window, or ``None``
+            until the window has filled.
+    """
+
+    limit: float
+    in_flight: int
+    waiting: int
+    increases: int
+    decreases: int
+    p95_seconds: float | None
+
+
+class AdaptiveConcurrencyTransport(AsyncBaseTransport):
+    """AIMD limit on in-flight requests, tuned by the server's responses.
+
+    Callers pick their own fan-out (``asyncio.gather`` over hundreds of ids,
+    concurrent cache warm-ups); this layer queues what exceeds the current
+    limit, FIFO, and moves the limit with the server's feedback:
+
+    - **Additive increase**: each healthy response while the limit is fully
+      used raises it by ``1 / limit``, i.e. by one per limit's worth of
+      requests. Healthy means not 429/5xx, ``X-Ratelimit-Remaining`` (when
+      present) above the current limit, and p95 latency within
+      ``latency_tolerance`` of the baseline p95.
+    - **Multiplicative decrease**: a 429, a 5xx, a transport error, or p95
+      latency rising past that tolerance halves the limit. Responses to
+      requests sent before the last decrease don't move it again, so one
+      overloaded burst costs one halving rather than one per request.
+
+    The baseline p95 drops straight to any lower p95, drifts up toward a
+    higher one that is still within tolerance, and is reset to the current
+    p95 when latency triggers a decrease. A slower mix of requests (page
+    fetches after single-record GETs) therefore halves the limit once and
+    then becomes the new normal.
+
+    Latency is sampled per request from send to response headers, so the
+    layer belongs *inside* ``RateLimitTransport``: time spent waiting for a
+    rate-limit token isn't server latency.
+    """
+
+    def __init__(
+        self,
+        wrapped_transport: AsyncBaseTransport | None = None,
+        *,
+        initial_limit: int = 4,
+        max_limit: int = 32,
+        min_limit: int = 1,
+        latency_window: int = 50,
+        latency_tolerance: float = 2.0,
+        logger: Logger | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the adaptive concurrency transport.
+
+        Args:
+            wrapped_transport: The transport to wrap. If None, creates a new
+                AsyncHTTPTransport.
+            initial_limit: In-flight ceiling to start from. Defaults to 4.
+            max_limit: Ceiling the limit never grows past. Defaults to 32.
+            min_limit: Floor the limit never shrinks below. Defaults to 1.
+            latency_window: Number of recent latencies the p95 is taken over.
+                Defaults to 50.
+            latency_tolerance: How many times the baseline p95 the current
+                p95 may reach before it counts as congestion. Defaults to 2.0.
+            logger: Logger for limit changes. If None, creates a default
+                logger.
+            **kwargs: Additional arguments passed to AsyncHTTPTransport if
+                wrapped_transport is None.
+
+        Raises:
+            ValueError: If the limits are not ``1 <= min_limit <=
+                initial_limit <= max_limit``, ``latency_window`` is not
+                positive, or ``latency_tolerance`` is not above 1.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            msg = (
+                "Concurrency limits must satisfy 1 <= min_limit <= initial_limit "
+                f"<= max_limit, got {min_limit}, {initial_limit}, {max_limit}"
+            )
+            raise ValueError(msg)
+        if latency_window <= 0:
+            msg = f"latency_window must be positive, got {latency_window}"
+            raise ValueError(msg)
+        if latency_tolerance <= 1:
+            msg = f"latency_tolerance must be greater than 1, got {latency_tolerance}"
+            raise ValueError(msg)
+        if wrapped_transport is None:
+            wrapped_transport = AsyncHTTPTransport(**kwargs)
+        self._wrapped_transport = wrapped_transport
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._latency_tolerance = latency_tolerance
+        self._latencies: deque[float] = deque(maxlen=latency_window)
+        self._best_p95: float | None = None
+        self._last_decrease_at = float("-inf")  # loop time
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._increases = 0
+        self._decreases = 0
+        self.logger: Logger = logger or logging.getLogger(__name__)
+
+    @property
+    def limit(self) -> int:
+        """Requests currently allowed in flight."""
+        return int(self._limit)
+
+    def stats(self) -> AdaptiveConcurrencyStats:
+        """Return the controller's current limit, occupancy and history."""
+        return AdaptiveConcurrencyStats(
+            limit=self._limit,
+            in_flight=self._in_flight,
+            waiting=sum(not waiter.done() for waiter in self._waiters),
+            increases=self._increases,
+            decreases=self._decreases,
+            p95_seconds=self._p95(),
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Wait for a slot, forward the request, and adjust the limit."""
+        await self._acquire()
+        loop = asyncio.get_running_loop()
+        sent_at = loop.time()
+        # Whether the caller is actually using the whole limit; growing a
+        # limit nobody reaches would only leave headroom for a later burst.
+        saturated = self._in_flight >= self.limit
+        try:
+            response = await self._wrapped_transport.handle_async_request(request)
+        except httpx.TransportError:
+            self._decrease(sent_at, "transport error")
+            raise
+        finally:
+            self._release()
+
+        if sent_at < self._last_decrease_at:
+            # Sent under the limit we just backed off from; its outcome says
+            # nothing about the new one.
+            return response
+        self._latencies.append(loop.time() - sent_at)
+        congestion = self._congestion(response)
+        if congestion is not None:
+            self._decrease(sent_at, congestion)
+        elif saturated:
+            self._increase()
+        return response
+
+    async def aclose(self) -> None:
+        """Propagate close down the wrapped chain so inner transports release resources."""
+        await self._wrapped_transport.aclose()
+
+    async def _acquire(self) -> None:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # A slot was handed to us just as we were cancelled; give it
+                # back rather than leaking it.
+                self._release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # Hand the slot over directly so a newcomer can't take it
+                # before the waiter resumes.
+                self._in_flight += 1
+                waiter.set_result(None)
+
+    def _congestion(self, response: httpx.Response) -> str | None:
+        """Return why ``response`` signals congestion, or ``None`` if healthy."""
+        if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            return "429 Too Many Requests"
+        if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            return f"{response.status_code} server error"
+        remaining = response.headers.get(_HEADER_REMAINING)
+        if remaining is not None:
+            with contextlib.suppress(ValueError):
+                if int(remaining) <= self.limit:
+                    return f"rate-limit budget low ({remaining} remaining)"
+        p95 = self._p95()
+        if p95 is None:
+            return None
+        baseline = self._best_p95
+        if baseline is None or p95 < baseline:
+            self._best_p95 = p95
+        elif p95 > baseline * self._latency_tolerance:
+            # Rebase on the new latency: a shift in the workload (detail GETs,
+            # then page fetches) costs one halving rather than one per window
+            self._best_p95 = p95
+            return f"p95 latency {p95:.3f}s over {baseline:.3f}s baseline"
+        else:
+            # Drift toward the current p95 by one sample's weight, so a quiet
+            # spell of fast requests doesn't set the baseline for good
+            self._best_p95 = baseline + (p95 - baseline) / len(self._latencies)
+        return None
+
+    def _p95(self) -> float | None:
+        if len(self._latencies) != self._latencies.maxlen:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def _increase(self) -> None:
+        if self._limit >= self._max_limit:
+            return
+        previous = self.limit
+        self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+        self._increases += 1
+        if self.limit > previous:
+            self.logger.debug("Adaptive concurrency limit raised to %d", self.limit)
+            self._wake_waiters()
+
+    def _decrease(self, sent_at: float, reason: str) -> None:
+        if sent_at < self._last_decrease_at:
+            return  # already backed off for the burst this request was part of
+        self._last_decrease_at = asyncio.get_running_loop().time()
+        self._limit = max(float(self._min_limit), self._limit / 2)
+        self._decreases += 1
+        # Latencies from before the back-off would re-trigger it
+        self._latencies.clear()
+        self.logger.info(
+            "Adaptive concurrency limit lowered to %d (%s)", self.limit, reason
+        )
+
+
+__all__ = ["AdaptiveConcurrencyStats", "AdaptiveConcurrencyTransport"]
@@ -1 +1,126 @@
 """Contains methods for accessing the API"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import (
+        additional_costs,
+        batch,
+        bin_transfer,
+        bom_row,
+        custom_fields,
+        customer,
+        customer_address,
+        demand_forecast,
+        factory,
+        inventory,
+        inventory_movements,
+        location,
+        manufacturing_order,
+        manufacturing_order_operation,
+        manufacturing_order_production,
+        manufacturing_order_production_ingredient,
+        manufacturing_order_recipe,
+        material,
+        operator,
+        price_list,
+        price_list_customer,
+        price_list_row,
+        product,
+        products,
+        purchase_order,
+        purchase_order_accounting_metadata,
+        purchase_order_additional_cost_row,
+        purchase_order_row,
+        purchase_orders,
+        recipe,
+        sales_order,
+        sales_order_address,
+        sales_order_fulfillment,
+        sales_order_row,
+        sales_orders,
+        sales_return,
+        sales_return_row,
+        serial_number,
+        services,
+        stock_adjustment,
+        stock_transfer,
+        stocktake,
+        stocktake_row,
+        storage_bin,
+        supplier,
+        supplier_address,
+        tax_rate,
+        user,
+        variant,
+        variant_default_storage_bin,
+        webhook,
+        webhook_logs,
+    )
+
+__all__ = (
+    "additional_costs",
+    "batch",
+    "bin_transfer",
+    "bom_row",
+    "custom_fields",
+    "customer",
+    "customer_address",
+    "demand_forecast",
+    "factory",
+    "inventory",
+    "inventory_movements",
+    "location",
+    "manufacturing_order",
+    "manufacturing_order_operation",
+    "manufacturing_order_production",
+    "manufacturing_order_production_ingredient",
+    "manufacturing_order_recipe",
+    "material",
+    "operator",
+    "price_list",
+    "price_list_customer",
+    "price_list_row",
+    "product",
+    "products",
+    "purchase_order",
+    "purchase_order_accounting_metadata",
+    "purchase_order_additional_cost_row",
+    "purchase_order_row",
+    "purchase_orders",
+    "recipe",
+    "sales_order",
+    "sales_order_address",
+    "sales_order_fulfillment",
+    "sales_order_row",
+    "sales_orders",
+    "sales_return",
+    "sales_return_row",
+    "serial_number",
+    "services",
+    "stock_adjustment",
+    "stock_transfer",
+    "stocktake",
+    "stocktake_row",
+    "storage_bin",
+    "supplier",
+    "supplier_address",
+    "tax_rate",
+    "user",
+    "variant",
+    "variant_default_storage_bin",
+    "webhook",
+    "webhook_logs",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -6,7 +6,7 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
-from ...client_types import UNSET, Response, Unset
+from ...client_types import UNSET, Response, Unset, deferred_content
 from ...models.additional_cost_list_response import AdditionalCostListResponse
 from ...models.error_response import ErrorResponse
 
@@ -64,6 +64,7 @@ def _get_kwargs(
 
     _kwargs: dict[str, Any] = {
         "method": "get",
+        "extensions": {"katana_endpoint": __name__},
         "url": "/additional_costs",
         "params": params,
     }
@@ -74,6 +75,9 @@ def _get_kwargs(
 def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> AdditionalCostListResponse | ErrorResponse | None:
+    # Model already built off the event loop by KatanaClient.
+    if (parsed := response.extensions.get("katana_parsed_model")) is not None:
+        return parsed
     if response.status_code == 200:
         response_200 = AdditionalCostListResponse.from_dict(response.json())
 
@@ -105,7 +109,7 @@ def _build_response(
 ) -> Response[AdditionalCostListResponse | ErrorResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
-        content=response.content,
+        content=deferred_content(response),
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
     )
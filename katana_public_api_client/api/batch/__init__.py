@@ -1 +1,24 @@
 """Contains endpoint functions for accessing the API"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import create_batch, get_batch_stock, update_batch_stock
+
+__all__ = (
+    "create_batch",
+    "get_batch_stock",
+    "update_batch_stock",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -5,7 +5,7 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
-from ...client_types import UNSET, Response, Unset
+from ...client_types import UNSET, Response, Unset, deferred_content
 from ...models.batch_stock_list_response import BatchStockListResponse
 from ...models.error_response import ErrorResponse
 
@@ -50,6 +50,7 @@ def _get_kwargs(
 
     _kwargs: dict[str, Any] = {
         "method": "get",
+        "extensions": {"katana_endpoint": __name__},
         "url": "/batch_stocks",
         "params": params,
     }
@@ -60,6 +61,9 @@ def _get_kwargs(
 def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> BatchStockListResponse | ErrorResponse | None:
+    # Model already built off the event loop by KatanaClient.
+    if (parsed := response.extensions.get("katana_parsed_model")) is not None:
+        return parsed
     if response.status_code == 200:
         response_200 = BatchStockListResponse.from_dict(response.json())
 
@@ -91,7 +95,7 @@ def _build_response(
 ) -> Response[BatchStockListResponse | ErrorResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
-        content=response.content,
+        content=deferred_content(response),
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
     )
@@ -1 +1,44 @@
 """Contains endpoint functions for accessing the API"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import (
+        create_bin_transfer,
+        create_bin_transfer_row,
+        delete_bin_transfer,
+        delete_bin_transfer_row,
+        get_all_bin_transfer_rows,
+        get_all_bin_transfers,
+        get_bin_transfer,
+        get_bin_transfer_row,
+        update_bin_transfer,
+        update_bin_transfer_row,
+        update_bin_transfer_status,
+    )
+
+__all__ = (
+    "create_bin_transfer",
+    "create_bin_transfer_row",
+    "delete_bin_transfer",
+    "delete_bin_transfer_row",
+    "get_all_bin_transfer_rows",
+    "get_all_bin_transfers",
+    "get_bin_transfer",
+    "get_bin_transfer_row",
+    "update_bin_transfer",
+    "update_bin_transfer_row",
+    "update_bin_transfer_status",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
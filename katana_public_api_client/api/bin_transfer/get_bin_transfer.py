@@ -6,7 +6,7 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
-from ...client_types import Response
+from ...client_types import Response, deferred_content
 from ...models.bin_transfer import BinTransfer
 from ...models.error_response import ErrorResponse
 
@@ -17,6 +17,7 @@ def _get_kwargs(
 
     _kwargs: dict[str, Any] = {
         "method": "get",
+        "extensions": {"katana_endpoint": __name__},
         "url": "/bin_transfers/{id}".format(
             id=quote(str(id), safe=""),
         ),
@@ -28,6 +29,9 @@ def _get_kwargs(
 def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> BinTransfer | ErrorResponse | None:
+    # Model already built off the event loop by KatanaClient.
+    if (parsed := response.extensions.get("katana_parsed_model")) is not None:
+        return parsed
     if response.status_code == 200:
         response_200 = BinTransfer.from_dict(response.json())
 
@@ -64,7 +68,7 @@ def _build_response(
 ) -> Response[BinTransfer | ErrorResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
-        content=response.content,
+        content=deferred_content(response),
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
     )
@@ -1 +1,32 @@
 """Contains endpoint functions for accessing the API"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import (
+        batch_create_bom_rows,
+        create_bom_row,
+        delete_bom_row,
+        get_all_bom_rows,
+        update_bom_row,
+    )
+
+__all__ = (
+    "batch_create_bom_rows",
+    "create_bom_row",
+    "delete_bom_row",
+    "get_all_bom_rows",
+    "update_bom_row",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
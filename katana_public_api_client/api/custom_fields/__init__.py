@@ -1 +1,34 @@
 """Contains endpoint functions for accessing the API"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import (
+        create_custom_field_definition,
+        delete_custom_field_definition,
+        get_all_custom_field_definitions,
+        get_all_custom_fields_collections,
+        get_custom_field_definition,
+        update_custom_field_definition,
+    )
+
+__all__ = (
+    "create_custom_field_definition",
+    "delete_custom_field_definition",
+    "get_all_custom_field_definitions",
+    "get_all_custom_fields_collections",
+    "get_custom_field_definition",
+    "update_custom_field_definition",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
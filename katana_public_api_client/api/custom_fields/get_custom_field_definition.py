@@ -7,7 +7,7 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
-from ...client_types import Response
+from ...client_types import Response, deferred_content
 from ...models.custom_field_definition import CustomFieldDefinition
 from ...models.error_response import ErrorResponse
 
@@ -18,6 +18,7 @@ def _get_kwargs(
 
     _kwargs: dict[str, Any] = {
         "method": "get",
+        "extensions": {"katana_endpoint": __name__},
         "url": "/custom_field_definitions/{id}".format(
             id=quote(str(id), safe=""),
         ),
@@ -29,6 +30,9 @@ def _get_kwargs(
 def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> CustomFieldDefinition | ErrorResponse | None:
+    # Model already built off the event loop by KatanaClient.
+    if (parsed := response.extensions.get("katana_parsed_model")) is not None:
+        return parsed
     if response.status_code == 200:
         response_200 = CustomFieldDefinition.from_dict(response.json())
 
@@ -65,7 +69,7 @@ def _build_response(
 ) -> Response[CustomFieldDefinition | ErrorResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
-        content=response.content,
+        content=deferred_content(response),
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
     )
@@ -1 +1,30 @@
 """Contains endpoint functions for accessing the API"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import (
+        create_inventory_reorder_point,
+        create_inventory_safety_stock_level,
+        get_all_inventory_point,
+        get_all_negative_stock,
+    )
+
+__all__ = (
+    "create_inventory_reorder_point",
+    "create_inventory_safety_stock_level",
+    "get_all_inventory_point",
+    "get_all_negative_stock",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -6,7 +6,7 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
-from ...client_types import UNSET, Response, Unset
+from ...client_types import UNSET, Response, Unset, deferred_content
 from ...models.error_response import ErrorResponse
 from ...models.inventory_movement_list_response import InventoryMovementListResponse
 from ...models.inventory_movement_resource_type_filter import (
@@ -87,6 +87,7 @@ def _get_kwargs(
 
     _kwargs: dict[str, Any] = {
         "method": "get",
+        "extensions": {"katana_endpoint": __name__},
         "url": "/inventory_movements",
         "params": params,
     }
@@ -97,6 +98,9 @@ def _get_kwargs(
 def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> ErrorResponse | InventoryMovementListResponse | None:
+    # Model already built off the event loop by KatanaClient.
+    if (parsed := response.extensions.get("katana_parsed_model")) is not None:
+        return parsed
     if response.status_code == 200:
         response_200 = InventoryMovementListResponse.from_dict(response.json())
 
@@ -128,7 +132,7 @@ def _build_response(
 ) -> Response[ErrorResponse | InventoryMovementListResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
-        content=response.content,
+        content=deferred_content(response),
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
     )
@@ -1 +1,38 @@
 """Contains endpoint functions for accessing the API"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import (
+        create_manufacturing_order,
+        delete_manufacturing_order,
+        get_all_manufacturing_order_productions,
+        get_all_manufacturing_orders,
+        get_manufacturing_order,
+        make_to_order_manufacturing_order,
+        unlink_manufacturing_order,
+        update_manufacturing_order,
+    )
+
+__all__ = (
+    "create_manufacturing_order",
+    "delete_manufacturing_order",
+    "get_all_manufacturing_order_productions",
+    "get_all_manufacturing_orders",
+    "get_manufacturing_order",
+    "make_to_order_manufacturing_order",
+    "unlink_manufacturing_order",
+    "update_manufacturing_order",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
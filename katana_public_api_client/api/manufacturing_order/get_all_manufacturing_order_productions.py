@@ -6,7 +6,7 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
-from ...client_types import UNSET, Response, Unset
+from ...client_types import UNSET, Response, Unset, deferred_content
 from ...models.error_response import ErrorResponse
 from ...models.manufacturing_order_production_list_response import (
     ManufacturingOrderProductionListResponse,
@@ -70,6 +70,7 @@ def _get_kwargs(
 
     _kwargs: dict[str, Any] = {
         "method": "get",
+        "extensions": {"katana_endpoint": __name__},
         "url": "/manufacturing_order_productions",
         "params": params,
     }
@@ -80,6 +81,9 @@ def _get_kwargs(
 def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> ErrorResponse | ManufacturingOrderProductionListResponse | None:
+    # Model already built off the event loop by KatanaClient.
+    if (parsed := response.extensions.get("katana_parsed_model")) is not None:
+        return parsed
     if response.status_code == 200:
         response_200 = ManufacturingOrderProductionListResponse.from_dict(
             response.json()
@@ -113,7 +117,7 @@ def _build_response(
 ) -> Response[ErrorResponse | ManufacturingOrderProductionListResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
-        content=response.content,
+        content=deferred_content(response),
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
     )
@@ -6,7 +6,7 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
-from ...client_types import UNSET, Response, Unset
+from ...client_types import UNSET, Response, Unset, deferred_content
 from ...models.error_response import ErrorResponse
 from ...models.manufacturing_operation_status import ManufacturingOperationStatus
 from ...models.manufacturing_order_operation_row_list_response import (
@@ -74,6 +74,7 @@ def _get_kwargs(
 
     _kwargs: dict[str, Any] = {
         "method": "get",
+        "extensions": {"katana_endpoint": __name__},
         "url": "/manufacturing_order_operation_rows",
         "params": params,
     }
@@ -84,6 +85,9 @@ def _get_kwargs(
 def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> ErrorResponse | ManufacturingOrderOperationRowListResponse | None:
+    # Model already built off the event loop by KatanaClient.
+    if (parsed := response.extensions.get("katana_parsed_model")) is not None:
+        return parsed
     if response.status_code == 200:
         response_200 = ManufacturingOrderOperationRowListResponse.from_dict(
             response.json()
@@ -117,7 +121,7 @@ def _build_response(
 ) -> Response[ErrorResponse | ManufacturingOrderOperationRowListResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
-        content=response.content,
+        content=deferred_content(response),
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
     )
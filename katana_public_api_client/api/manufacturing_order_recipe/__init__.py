@@ -1 +1,32 @@
 """Contains endpoint functions for accessing the API"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import (
+        create_manufacturing_order_recipe_rows,
+        delete_manufacturing_order_recipe_row,
+        get_all_manufacturing_order_recipe_rows,
+        get_manufacturing_order_recipe_row,
+        update_manufacturing_order_recipe_rows,
+    )
+
+__all__ = (
+    "create_manufacturing_order_recipe_rows",
+    "delete_manufacturing_order_recipe_row",
+    "get_all_manufacturing_order_recipe_rows",
+    "get_manufacturing_order_recipe_row",
+    "update_manufacturing_order_recipe_rows",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
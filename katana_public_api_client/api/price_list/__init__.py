@@ -1 +1,32 @@
 """Contains endpoint functions for accessing the API"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import (
+        create_price_list,
+        delete_price_list,
+        get_all_price_lists,
+        get_price_list,
+        update_price_list,
+    )
+
+__all__ = (
+    "create_price_list",
+    "delete_price_list",
+    "get_all_price_lists",
+    "get_price_list",
+    "update_price_list",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
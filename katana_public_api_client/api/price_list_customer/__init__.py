@@ -1 +1,32 @@
 """Contains endpoint functions for accessing the API"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import (
+        create_price_list_customer,
+        delete_price_list_customer,
+        get_all_price_list_customers,
+        get_price_list_customer,
+        update_price_list_customer,
+    )
+
+__all__ = (
+    "create_price_list_customer",
+    "delete_price_list_customer",
+    "get_all_price_list_customers",
+    "get_price_list_customer",
+    "update_price_list_customer",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
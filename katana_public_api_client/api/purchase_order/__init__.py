@@ -1 +1,34 @@
 """Contains endpoint functions for accessing the API"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import (
+        create_purchase_order,
+        delete_purchase_order,
+        find_purchase_orders,
+        get_purchase_order,
+        receive_purchase_order,
+        update_purchase_order,
+    )
+
+__all__ = (
+    "create_purchase_order",
+    "delete_purchase_order",
+    "find_purchase_orders",
+    "get_purchase_order",
+    "receive_purchase_order",
+    "update_purchase_order",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
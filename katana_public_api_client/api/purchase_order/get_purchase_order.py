@@ -7,7 +7,7 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
-from ...client_types import UNSET, Response, Unset
+from ...client_types import UNSET, Response, Unset, deferred_content
 from ...models.error_response import ErrorResponse
 from ...models.get_purchase_order_extend_item import GetPurchaseOrderExtendItem
 from ...models.outsourced_purchase_order import OutsourcedPurchaseOrder
@@ -35,6 +35,7 @@ def _get_kwargs(
 
     _kwargs: dict[str, Any] = {
         "method": "get",
+        "extensions": {"katana_endpoint": __name__},
         "url": "/purchase_orders/{id}".format(
             id=quote(str(id), safe=""),
         ),
@@ -47,6 +48,9 @@ def _get_kwargs(
 def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> ErrorResponse | OutsourcedPurchaseOrder | RegularPurchaseOrder | None:
+    # Model already built off the event loop by KatanaClient.
+    if (parsed := response.extensions.get("katana_parsed_model")) is not None:
+        return parsed
     if response.status_code == 200:
 
         def _parse_response_200(
@@ -100,7 +104,7 @@ def _build_response(
 ) -> Response[ErrorResponse | OutsourcedPurchaseOrder | RegularPurchaseOrder]:
     return Response(
         status_code=HTTPStatus(response.status_code),
-        content=response.content,
+        content=deferred_content(response),
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
     )
@@ -1 +1,32 @@
 """Contains endpoint functions for accessing the API"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import (
+        create_po_additional_cost_row,
+        delete_po_additional_cost,
+        get_po_additional_cost_row,
+        get_purchase_order_additional_cost_rows,
+        update_additional_cost_row,
+    )
+
+__all__ = (
+    "create_po_additional_cost_row",
+    "delete_po_additional_cost",
+    "get_po_additional_cost_row",
+    "get_purchase_order_additional_cost_rows",
+    "update_additional_cost_row",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
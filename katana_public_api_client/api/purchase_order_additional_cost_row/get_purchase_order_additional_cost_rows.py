@@ -6,7 +6,7 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
-from ...client_types import UNSET, Response, Unset
+from ...client_types import UNSET, Response, Unset, deferred_content
 from ...models.cost_distribution_method import CostDistributionMethod
 from ...models.error_response import ErrorResponse
 from ...models.purchase_order_additional_cost_row_list_response import (
@@ -83,6 +83,7 @@ def _get_kwargs(
 
     _kwargs: dict[str, Any] = {
         "method": "get",
+        "extensions": {"katana_endpoint": __name__},
         "url": "/po_additional_cost_rows",
         "params": params,
     }
@@ -93,6 +94,9 @@ def _get_kwargs(
 def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> ErrorResponse | PurchaseOrderAdditionalCostRowListResponse | None:
+    # Model already built off the event loop by KatanaClient.
+    if (parsed := response.extensions.get("katana_parsed_model")) is not None:
+        return parsed
     if response.status_code == 200:
         response_200 = PurchaseOrderAdditionalCostRowListResponse.from_dict(
             response.json()
@@ -126,7 +130,7 @@ def _build_response(
 ) -> Response[ErrorResponse | PurchaseOrderAdditionalCostRowListResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
-        content=response.content,
+        content=deferred_content(response),
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
     )
@@ -6,7 +6,7 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
-from ...client_types import Response
+from ...client_types import Response, deferred_content
 from ...models.error_response import ErrorResponse
 from ...models.outsourced_purchase_order_recipe_row import (
     OutsourcedPurchaseOrderRecipeRow,
@@ -19,6 +19,7 @@ def _get_kwargs(
 
     _kwargs: dict[str, Any] = {
         "method": "get",
+        "extensions": {"katana_endpoint": __name__},
         "url": "/outsourced_purchase_order_recipe_rows/{id}".format(
             id=quote(str(id), safe=""),
         ),
@@ -30,6 +31,9 @@ def _get_kwargs(
 def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> ErrorResponse | OutsourcedPurchaseOrderRecipeRow | None:
+    # Model already built off the event loop by KatanaClient.
+    if (parsed := response.extensions.get("katana_parsed_model")) is not None:
+        return parsed
     if response.status_code == 200:
         response_200 = OutsourcedPurchaseOrderRecipeRow.from_dict(response.json())
 
@@ -66,7 +70,7 @@ def _build_response(
 ) -> Response[ErrorResponse | OutsourcedPurchaseOrderRecipeRow]:
     return Response(
         status_code=HTTPStatus(response.status_code),
-        content=response.content,
+        content=deferred_content(response),
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
     )
@@ -6,7 +6,7 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
-from ...client_types import UNSET, Response, Unset
+from ...client_types import UNSET, Response, Unset, deferred_content
 from ...models.error_response import ErrorResponse
 from ...models.outsourced_purchase_order_recipe_row_list_response import (
     OutsourcedPurchaseOrderRecipeRowListResponse,
@@ -72,6 +72,7 @@ def _get_kwargs(
 
     _kwargs: dict[str, Any] = {
         "method": "get",
+        "extensions": {"katana_endpoint": __name__},
         "url": "/outsourced_purchase_order_recipe_rows",
         "params": params,
     }
@@ -82,6 +83,9 @@ def _get_kwargs(
 def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> ErrorResponse | OutsourcedPurchaseOrderRecipeRowListResponse | None:
+    # Model already built off the event loop by KatanaClient.
+    if (parsed := response.extensions.get("katana_parsed_model")) is not None:
+        return parsed
     if response.status_code == 200:
         response_200 = OutsourcedPurchaseOrderRecipeRowListResponse.from_dict(
             response.json()
@@ -115,7 +119,7 @@ def _build_response(
 ) -> Response[ErrorResponse | OutsourcedPurchaseOrderRecipeRowListResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
-        content=response.content,
+        content=deferred_content(response),
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
     )
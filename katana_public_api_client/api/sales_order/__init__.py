@@ -1 +1,36 @@
 """Contains endpoint functions for accessing the API"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import (
+        create_sales_order,
+        delete_sales_order,
+        get_all_sales_orders,
+        get_sales_order,
+        get_sales_order_returnable_items,
+        search_sales_orders,
+        update_sales_order,
+    )
+
+__all__ = (
+    "create_sales_order",
+    "delete_sales_order",
+    "get_all_sales_orders",
+    "get_sales_order",
+    "get_sales_order_returnable_items",
+    "search_sales_orders",
+    "update_sales_order",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
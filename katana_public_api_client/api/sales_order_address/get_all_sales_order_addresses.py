@@ -6,7 +6,7 @@ import httpx
 
 from ... import errors
 from ...client import AuthenticatedClient, Client
-from ...client_types import UNSET, Response, Unset
+from ...client_types import UNSET, Response, Unset, deferred_content
 from ...models.address_entity_type import AddressEntityType
 from ...models.error_response import ErrorResponse
 from ...models.sales_order_address_list_response import SalesOrderAddressListResponse
@@ -106,6 +106,7 @@ def _get_kwargs(
 
     _kwargs: dict[str, Any] = {
         "method": "get",
+        "extensions": {"katana_endpoint": __name__},
         "url": "/sales_order_addresses",
         "params": params,
     }
@@ -116,6 +117,9 @@ def _get_kwargs(
 def _parse_response(
     *, client: AuthenticatedClient | Client, response: httpx.Response
 ) -> ErrorResponse | SalesOrderAddressListResponse | None:
+    # Model already built off the event loop by KatanaClient.
+    if (parsed := response.extensions.get("katana_parsed_model")) is not None:
+        return parsed
     if response.status_code == 200:
         response_200 = SalesOrderAddressListResponse.from_dict(response.json())
 
@@ -147,7 +151,7 @@ def _build_response(
 ) -> Response[ErrorResponse | SalesOrderAddressListResponse]:
     return Response(
         status_code=HTTPStatus(response.status_code),
-        content=response.content,
+        content=deferred_content(response),
         headers=response.headers,
         parsed=_parse_response(client=client, response=response),
     )
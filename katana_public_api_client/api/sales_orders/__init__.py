@@ -1 +1,34 @@
 """Contains endpoint functions for accessing the API"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import (
+        create_sales_order_shipping_fee,
+        delete_sales_order_shipping_fee,
+        get_sales_order_accounting_metadata,
+        get_sales_order_shipping_fee,
+        get_sales_order_shipping_fees,
+        update_sales_order_shipping_fee,
+    )
+
+__all__ = (
+    "create_sales_order_shipping_fee",
+    "delete_sales_order_shipping_fee",
+    "get_sales_order_accounting_metadata",
+    "get_sales_order_shipping_fee",
+    "get_sales_order_shipping_fees",
+    "update_sales_order_shipping_fee",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
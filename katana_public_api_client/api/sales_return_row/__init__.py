@@ -1 +1,34 @@
 """Contains endpoint functions for accessing the API"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import (
+        create_sales_return_row,
+        delete_sales_return_row,
+        get_all_sales_return_rows,
+        get_sales_return_row,
+        get_sales_return_row_unassigned_batch_transactions,
+        update_sales_return_row,
+    )
+
+__all__ = (
+    "create_sales_return_row",
+    "delete_sales_return_row",
+    "get_all_sales_return_rows",
+    "get_sales_return_row",
+    "get_sales_return_row_unassigned_batch_transactions",
+    "update_sales_return_row",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
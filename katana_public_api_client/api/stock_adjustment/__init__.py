@@ -1 +1,30 @@
 """Contains endpoint functions for accessing the API"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import (
+        create_stock_adjustment,
+        delete_stock_adjustment,
+        get_all_stock_adjustments,
+        update_stock_adjustment,
+    )
+
+__all__ = (
+    "create_stock_adjustment",
+    "delete_stock_adjustment",
+    "get_all_stock_adjustments",
+    "update_stock_adjustment",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1 +1,32 @@
 """Contains endpoint functions for accessing the API"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import (
+        create_storage_bin,
+        delete_storage_bin,
+        get_all_storage_bins,
+        get_bin_inventory,
+        update_default_storage_bin,
+    )
+
+__all__ = (
+    "create_storage_bin",
+    "delete_storage_bin",
+    "get_all_storage_bins",
+    "get_bin_inventory",
+    "update_default_storage_bin",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
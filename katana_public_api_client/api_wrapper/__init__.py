@@ -6,10 +6,18 @@ Usage::
         products = await client.api.products.list(is_sellable=True)
         product = await client.api.products.get(123)
         await client.api.products.delete(123)
+        variants = await client.api.variants.get_many([1, 2, 3])
 """
 
+from ._batch import GetManyResult
 from ._namespace import ApiNamespace
 from ._registry import RESOURCE_REGISTRY, ResourceConfig
 from ._resource import Resource
 
-__all__ = ["RESOURCE_REGISTRY", "ApiNamespace", "Resource", "ResourceConfig"]
+__all__ = [
+    "RESOURCE_REGISTRY",
+    "ApiNamespace",
+    "GetManyResult",
+    "Resource",
+    "ResourceConfig",
+]
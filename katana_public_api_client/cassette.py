@@ -0,0 +1,239 @@
+"""Record/replay cassettes for deterministic, offline client runs.
+
+:class:`RecordingTransport` sits where the network would and captures every
+request/response pair that passes through it — status, headers (including
+``X-Ratelimit-*`` and ``X-Pagination``), the decoded body and how long the
+server took — into a gzip-compressed JSON cassette. :class:`ReplayTransport`
+serves those responses back without a network, optionally sleeping for the
+recorded latency, so benchmarks and profiles of sync and tool hot paths see
+realistic payload sizes, page counts and rate-limit headers on CI or a
+laptop with no tenant.
+
+Both are *base* transports: pass them as ``KatanaClient(base_transport=...)``
+so the whole resilience chain (pagination, rate limiting, retries) runs on
+top of them exactly as it does against the live API::
+
+    async with KatanaClient(
+        base_transport=RecordingTransport("sync.cassette")
+    ):
+        ...  # real requests, recorded on close
+
+    async with KatanaClient(
+        base_transport=ReplayTransport("sync.cassette"),
+        requests_per_minute=None,
+    ):
+        ...  # same responses, no network
+
+(``KatanaClient(transport=...)`` also accepts them, replacing the chain.)
+
+Credentials never reach the cassette: ``Authorization`` and other sensitive
+headers are not recorded, sensitive query parameters are redacted, and
+request bodies are stored only as a hash used for matching.
+"""
+
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import os
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any
+
+import httpx
+from httpx import AsyncBaseTransport, AsyncHTTPTransport
+
+from .katana_client import _is_sensitive, _sanitize_url
+
+CASSETTE_FORMAT_VERSION = 1
+
+# ``content`` is stored decoded, so the wire encoding/length no longer apply
+_WIRE_ONLY_HEADERS = frozenset({"content-encoding", "content-length"})
+
+
+class CassetteMismatchError(LookupError):
+    """Raised by :class:`ReplayTransport` for a request the cassette can't answer."""
+
+
+def _request_key(method: str, url: str, body: bytes) -> str:
+    """Match key: method, redacted URL and a hash of the body."""
+    digest = hashlib.sha256(body).hexdigest()[:16] if body else "-"
+    return f"{method} {_sanitize_url(url)} {digest}"
+
+
+def _encode_body(content: bytes) -> dict[str, str]:
+    try:
+        return {"text": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(content).decode("ascii")}
+
+
+def _decode_body(body: dict[str, str]) -> bytes:
+    if "text" in body:
+        return body["text"].encode("utf-8")
+    return base64.b64decode(body["base64"])
+
+
+class RecordingTransport(AsyncBaseTransport):
+    """Forward requests and record each exchange to a cassette.
+
+    The cassette is written by :meth:`save`, which :meth:`aclose` calls, so a
+    client used as an async context manager records on exit.
+
+    Args:
+        path: Cassette file to write (``~`` is expanded). Conventionally
+            ``*.cassette``; the content is gzip-compressed JSON.
+        wrapped_transport: Transport that does the real work. If None,
+            creates a new AsyncHTTPTransport.
+        **kwargs: Additional arguments passed to AsyncHTTPTransport if
+            wrapped_transport is None.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        wrapped_transport: AsyncBaseTransport | None = None,
+        **kwargs: Any,
+    ) -> None:
+        if wrapped_transport is None:
+            wrapped_transport = AsyncHTTPTransport(**kwargs)
+        self.path = Path(path).expanduser()
+        self._wrapped_transport = wrapped_transport
+        self._interactions: list[dict[str, Any]] = []
+
+    @property
+    def interactions(self) -> int:
+        """Number of exchanges recorded so far."""
+        return len(self._interactions)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Forward the request, read the response and record the exchange."""
+        body = await request.aread()
+        loop = asyncio.get_running_loop()
+        sent_at = loop.time()
+        response = await self._wrapped_transport.handle_async_request(request)
+        content = await response.aread()
+        elapsed = loop.time() - sent_at
+        self._interactions.append(
+            {
+                "request": {
+                    "method": request.method,
+                    "url": _sanitize_url(str(request.url)),
+                    "key": _request_key(request.method, str(request.url), body),
+                },
+                "response": {
+                    "status": response.status_code,
+                    "headers": [
+                        [name, value]
+                        for name, value in response.headers.items()
+                        if name not in _WIRE_ONLY_HEADERS and not _is_sensitive(name)
+                    ],
+                    "body": _encode_body(content),
+                },
+                "elapsed": round(elapsed, 6),
+            }
+        )
+        return response
+
+    def save(self) -> Path:
+        """Write every exchange recorded so far to the cassette; return its path."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        cassette = {
+            "version": CASSETTE_FORMAT_VERSION,
+            "interactions": self._interactions,
+        }
+        with gzip.open(self.path, "wt", encoding="utf-8") as fh:
+            json.dump(cassette, fh, separators=(",", ":"))
+        return self.path
+
+    async def aclose(self) -> None:
+        """Write the cassette, then close the wrapped transport."""
+        self.save()
+        await self._wrapped_transport.aclose()
+
+
+class ReplayTransport(AsyncBaseTransport):
+    """Answer requests from a cassette written by :class:`RecordingTransport`.
+
+    Requests are matched on method, URL (sensitive query values redacted)
+    and a hash of the body. Identical requests get their recorded responses
+    in recorded order; once those run out, the last one is repeated unless
+    ``strict`` is set.
+
+    Args:
+        path: Cassette file to read (``~`` is expanded).
+        latency_scale: Sleep for each exchange's recorded server time
+            multiplied by this factor before answering — ``1.0`` replays
+            real timing, ``0.1`` runs ten times faster. ``None`` (the
+            default) answers immediately.
+        strict: Raise :class:`CassetteMismatchError` instead of repeating a
+            response once a request has used up its recorded responses.
+
+    Raises:
+        ValueError: If the cassette's format version is unsupported or
+            ``latency_scale`` is negative.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        latency_scale: float | None = None,
+        strict: bool = False,
+    ) -> None:
+        if latency_scale is not None and latency_scale < 0:
+            msg = f"latency_scale must not be negative, got {latency_scale}"
+            raise ValueError(msg)
+        self.path = Path(path).expanduser()
+        with gzip.open(self.path, "rt", encoding="utf-8") as fh:
+            cassette = json.load(fh)
+        if cassette.get("version") != CASSETTE_FORMAT_VERSION:
+            msg = (
+                f"Unsupported cassette version {cassette.get('version')!r} in "
+                f"{self.path}; expected {CASSETTE_FORMAT_VERSION}"
+            )
+            raise ValueError(msg)
+        self._latency_scale = latency_scale
+        self._strict = strict
+        self._pending: defaultdict[str, deque[dict[str, Any]]] = defaultdict(deque)
+        self._last: dict[str, dict[str, Any]] = {}
+        for interaction in cassette["interactions"]:
+            self._pending[interaction["request"]["key"]].append(interaction)
+        self.replayed = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Return the next recorded response for ``request``."""
+        body = await request.aread()
+        key = _request_key(request.method, str(request.url), body)
+        pending = self._pending.get(key)
+        if pending:
+            interaction = pending.popleft()
+            self._last[key] = interaction
+        elif key in self._last and not self._strict:
+            interaction = self._last[key]
+        else:
+            msg = (
+                f"No recorded response for {request.method} "
+                f"{_sanitize_url(str(request.url))} in {self.path}"
+            )
+            raise CassetteMismatchError(msg)
+
+        if self._latency_scale:
+            await asyncio.sleep(interaction["elapsed"] * self._latency_scale)
+        self.replayed += 1
+        recorded = interaction["response"]
+        return httpx.Response(
+            recorded["status"],
+            headers=[(name, value) for name, value in recorded["headers"]],
+            content=_decode_body(recorded["body"]),
+            request=request,
+        )
+
+
+__all__ = [
+    "CASSETTE_FORMAT_VERSION",
+    "CassetteMismatchError",
+    "RecordingTransport",
+    "ReplayTransport",
+]
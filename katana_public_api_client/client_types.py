@@ -4,13 +4,19 @@ from collections.abc import Mapping, MutableMapping
 from http import HTTPStatus
 from typing import IO, BinaryIO, Literal, TypeVar
 
-from attrs import define
+import httpx
+from attrs import define, field
 
 
 class Unset:
     def __bool__(self) -> Literal[False]:
         return False
 
+    def __reduce__(self) -> str:
+        # Pickle and copy by reference, so ``UNSET`` stays the one instance
+        # the generated ``is UNSET`` checks compare against
+        return "UNSET"
+
 
 UNSET: Unset = Unset()
 
@@ -46,9 +52,37 @@ class Response[T]:
     """A response from an endpoint"""
 
     status_code: HTTPStatus
-    content: bytes
+    _content: bytes | httpx.Response = field(alias="content")
     headers: MutableMapping[str, str]
     parsed: T | None
 
+    @property
+    def content(self) -> bytes:
+        """Raw response body; an auto-paginated collection is encoded on first access."""
+        if isinstance(self._content, httpx.Response):
+            self._content = self._content.content
+        return self._content
+
+
+def lazy_dict_eq_key(value: Mapping[str, object] | None) -> Mapping[str, object]:
+    """Comparison key for a lazily allocated dict slot: ``None`` equals ``{}``."""
+    return value or {}
+
+
+def deferred_content(response: httpx.Response) -> bytes | httpx.Response:
+    """``response.content``, or ``response`` itself while its body is unencoded."""
+    if getattr(response, "content_deferred", False):
+        return response
+    return response.content
+
 
-__all__ = ["UNSET", "File", "FileTypes", "RequestFiles", "Response", "Unset"]
+__all__ = [
+    "UNSET",
+    "File",
+    "FileTypes",
+    "RequestFiles",
+    "Response",
+    "Unset",
+    "deferred_content",
+    "lazy_dict_eq_key",
+]
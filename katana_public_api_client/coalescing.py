@@ -0,0 +1,215 @@
+"""Single-flight coalescing of identical concurrent GETs for ``KatanaClient``.
+
+:class:`CoalescingTransport` lets a GET that matches one already in flight wait
+for that request's response instead of sending its own.
+``KatanaClient(coalesce_requests=True)`` installs it above pagination and
+below retry.
+"""
+
+import asyncio
+import logging
+from collections.abc import Hashable
+from typing import Any
+
+import httpx
+from attrs import define
+from httpx import AsyncBaseTransport, AsyncHTTPTransport
+
+from ._logging import Logger
+from .katana_client import (
+    _CodecJSONResponse,
+    _DecodedJSONResponse,
+    _is_deferred,
+    _resolve_request_priority,
+    _sanitize_url,
+)
+
+
+@define(frozen=True)
+class CoalescingStats:
+    """Counters from ``CoalescingTransport``.
+
+    Attributes:
+        sent: GETs forwarded to the wrapped transport.
+        coalesced: GETs served from an identical request already in flight.
+        in_flight: Distinct GETs currently awaiting a response.
+    """
+
+    sent: int
+    coalesced: int
+    in_flight: int
+
+
+class _Flight:
+    """One in-flight GET and the callers waiting on it."""
+
+    task: asyncio.Task[httpx.Response]
+
+    def __init__(self) -> None:
+        self.waiters = 0
+        self.followers = 0
+
+
+class CoalescingTransport(AsyncBaseTransport):
+    """Single-flight layer: identical concurrent GETs share one request.
+
+    A GET arriving while an identical one — same URL (including query
+    string), ``Authorization`` header, rate-limit priority and the request
+    extensions that change what the chain below returns (``auto_pagination``,
+    ``max_items``, ``retry``) — is still in flight waits for that request's
+    response instead of sending its own, so it spends no rate-limit token
+    and no round trip. Only ``GET`` requests without a body are ever
+    coalesced; every other request passes straight through.
+
+    When followers joined, the leader's response body is read once and each
+    follower gets its own ``httpx.Response`` over the same bytes (and, for
+    auto-paginated collections, the same pre-decoded payload — see
+    ``_DecodedJSONResponse``). A lone request's response is returned
+    untouched, unread. An exception from the shared request is raised to
+    every waiter. Cancelling one waiter doesn't cancel the request for the
+    others.
+    """
+
+    def __init__(
+        self,
+        wrapped_transport: AsyncBaseTransport | None = None,
+        *,
+        logger: Logger | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the coalescing transport.
+
+        Args:
+            wrapped_transport: The transport to wrap. If None, creates a new
+                AsyncHTTPTransport.
+            logger: Logger for coalesced requests. If None, creates a default
+                logger.
+            **kwargs: Additional arguments passed to AsyncHTTPTransport if
+                wrapped_transport is None.
+        """
+        if wrapped_transport is None:
+            wrapped_transport = AsyncHTTPTransport(**kwargs)
+        self._wrapped_transport = wrapped_transport
+        self._flights: dict[tuple[Hashable, ...], _Flight] = {}
+        self._sent = 0
+        self._coalesced = 0
+        self.logger: Logger = logger or logging.getLogger(__name__)
+
+    def stats(self) -> CoalescingStats:
+        """Return how many GETs were sent and how many were coalesced."""
+        return CoalescingStats(
+            sent=self._sent, coalesced=self._coalesced, in_flight=len(self._flights)
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Join an identical in-flight GET, or send the request."""
+        if not _is_coalescible(request):
+            return await self._wrapped_transport.handle_async_request(request)
+
+        key = _coalescing_key(request)
+        flight = self._flights.get(key)
+        leader = flight is None
+        if flight is None:
+            flight = _Flight()
+            flight.task = asyncio.create_task(self._fetch(key, request, flight))
+            self._flights[key] = flight
+            self._sent += 1
+        else:
+            flight.followers += 1
+            self._coalesced += 1
+            self.logger.debug("Coalesced GET %s", _sanitize_url(str(request.url)))
+
+        flight.waiters += 1
+        try:
+            # Shielded so one waiter's cancellation leaves the request
+            # running for the rest.
+            response = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                # Last waiter gone. A task cancelled before it started never
+                # reaches its own cleanup, so unregister it here too.
+                flight.task.cancel()
+                self._forget(key, flight)
+            raise
+        finally:
+            flight.waiters -= 1
+
+        if leader:
+            return response
+        return _copy_buffered_response(response, request)
+
+    async def aclose(self) -> None:
+        """Propagate close down the wrapped chain so inner transports release resources."""
+        await self._wrapped_transport.aclose()
+
+    async def _fetch(
+        self, key: tuple[Hashable, ...], request: httpx.Request, flight: _Flight
+    ) -> httpx.Response:
+        try:
+            response = await self._wrapped_transport.handle_async_request(request)
+        finally:
+            # Later arrivals send a fresh request rather than reuse this one
+            self._forget(key, flight)
+        if flight.followers and not _is_deferred(response):
+            await response.aread()
+        return response
+
+    def _forget(self, key: tuple[Hashable, ...], flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+
+# Request extensions read by the layers under ``CoalescingTransport``: a GET
+# differing in any of them may get a different response, so never shares one.
+_COALESCING_EXTENSIONS = ("auto_pagination", "max_items", "retry")
+
+
+def _coalescing_key(request: httpx.Request) -> tuple[Hashable, ...]:
+    """Return the single-flight key: everything that shapes the response."""
+    extensions = [request.extensions.get(name) for name in _COALESCING_EXTENSIONS]
+    return (
+        str(request.url),
+        request.headers.get("Authorization"),
+        _resolve_request_priority(request),
+        # Unhashable settings (a mutable ``Retry``) are matched by identity
+        *(value if isinstance(value, Hashable) else id(value) for value in extensions),
+    )
+
+
+def _is_coalescible(request: httpx.Request) -> bool:
+    """Only body-less GETs are safe to answer with another caller's response."""
+    return (
+        request.method == "GET"
+        and "content-length" not in request.headers
+        and "transfer-encoding" not in request.headers
+    )
+
+
+def _copy_buffered_response(
+    response: httpx.Response, request: httpx.Request
+) -> httpx.Response:
+    """Return a new response over ``response``'s already-read body, for ``request``."""
+    if isinstance(response, _DecodedJSONResponse):
+        return response.copy_for(request)
+    # ``content`` is already decoded, so the wire encoding/length no longer apply
+    headers = dict(response.headers)
+    headers.pop("content-encoding", None)
+    headers.pop("content-length", None)
+    response_cls = (
+        type(response) if isinstance(response, _CodecJSONResponse) else (httpx.Response)
+    )
+    copy = response_cls(
+        status_code=response.status_code,
+        headers=headers,
+        content=response.content,
+        request=request,
+        extensions=dict(response.extensions),
+    )
+    if isinstance(copy, _CodecJSONResponse) and isinstance(
+        response, _CodecJSONResponse
+    ):
+        copy.json_codec = response.json_codec
+    return copy
+
+
+__all__ = ["CoalescingStats", "CoalescingTransport"]
@@ -0,0 +1,269 @@
+"""Connection pool profiles and connection-reuse counters for ``KatanaClient``.
+
+:class:`ConnectionProfile` bundles the base ``AsyncHTTPTransport``'s pool
+settings; ``KatanaClient(connection_profile="managed")`` uses
+:meth:`ConnectionProfile.managed` (HTTP/2 when ``h2`` is installed, long
+keepalive, warm-up on enter). :class:`ConnectionReuseTransport` sits on the base
+transport and counts how many requests reused an open connection.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import httpx
+from attrs import define
+from httpx import AsyncBaseTransport, AsyncHTTPTransport
+
+from ._logging import Logger
+
+
+def _h2_installed() -> bool:
+    """Whether the ``h2`` package httpx needs for HTTP/2 is importable."""
+    return importlib.util.find_spec("h2") is not None
+
+
+# Idle seconds a pooled connection is kept for reuse by the managed profile
+# (httpx defaults to 5), so a warmed connection survives the gaps between
+# tool calls instead of being dropped before the first one arrives.
+_MANAGED_KEEPALIVE_EXPIRY = 120.0
+
+# Pool floor for the managed profile: headroom over the configured
+# concurrency for callers that gather without a concurrency limit.
+_MANAGED_MIN_CONNECTIONS = 10
+
+
+@define(frozen=True)
+class ConnectionProfile:
+    """Connection pool settings for the base ``AsyncHTTPTransport``.
+
+    Pass one as ``KatanaClient(connection_profile=...)``, or ``"managed"``
+    for :meth:`managed` sized to the client's concurrency. Explicit
+    ``http2=`` / ``limits=`` keyword arguments to the client still win.
+
+    Attributes:
+        http2: Multiplex concurrent requests over one HTTP/2 connection.
+            Requires the ``h2`` package (the ``http2`` extra).
+        max_connections: Most connections open at once (``None``: no limit).
+        max_keepalive_connections: Most idle connections kept for reuse.
+        keepalive_expiry: Seconds an idle connection is kept.
+        warm_up: Open a connection in ``__aenter__`` so the first request
+            skips DNS, TCP and TLS setup.
+        warm_up_timeout: Seconds the warm-up may take before it is abandoned.
+    """
+
+    http2: bool = False
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+    warm_up: bool = False
+    warm_up_timeout: float = 5.0
+
+    @classmethod
+    def managed(cls, concurrency: int = 4) -> ConnectionProfile:
+        """Profile for a long-lived client issuing ``concurrency`` requests at once.
+
+        HTTP/2 when ``h2`` is installed (HTTP/1.1 otherwise), enough idle
+        connections kept alive for ``concurrency`` requests, a two-minute
+        keepalive, and a warm-up connection on enter.
+        """
+        keepalive = max(concurrency, 1)
+        return cls(
+            http2=_h2_installed(),
+            max_connections=max(2 * keepalive, _MANAGED_MIN_CONNECTIONS),
+            max_keepalive_connections=keepalive,
+            keepalive_expiry=_MANAGED_KEEPALIVE_EXPIRY,
+            warm_up=True,
+        )
+
+    def transport_kwargs(self) -> dict[str, Any]:
+        """``AsyncHTTPTransport`` keyword arguments for this profile."""
+        return {
+            "http2": self.http2,
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+        }
+
+
+@define(frozen=True)
+class ConnectionStats:
+    """Counters from ``ConnectionReuseTransport``.
+
+    Only transports built on httpcore (``AsyncHTTPTransport``) report
+    connection events; with a fake or replay base transport every counter
+    stays at zero.
+
+    Attributes:
+        requests: Requests sent over a pooled connection.
+        connections_opened: TCP connections opened, each by the request that
+            needed it.
+        tls_handshakes: TLS handshakes completed.
+        connect_seconds_total: Time spent in TCP connect and TLS handshakes.
+        http2_requests: Requests multiplexed over HTTP/2.
+        warm_ups: Successful warm-up connections.
+    """
+
+    requests: int
+    connections_opened: int
+    tls_handshakes: int
+    connect_seconds_total: float
+    http2_requests: int
+    warm_ups: int
+
+    @property
+    def reused(self) -> int:
+        """Requests served on a connection that was already open."""
+        return max(0, self.requests - self.connections_opened)
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fraction of requests that reused a connection, or ``0.0`` before any."""
+        return self.reused / self.requests if self.requests else 0.0
+
+
+class _ConnectionTrace:
+    """httpcore ``trace`` extension feeding one request's events to the layer."""
+
+    def __init__(
+        self,
+        transport: ConnectionReuseTransport,
+        user_trace: Callable[[str, dict[str, Any]], Awaitable[None]] | None,
+    ) -> None:
+        self.transport = transport
+        self.user_trace = user_trace
+        self._started = 0.0
+
+    async def __call__(self, event: str, info: dict[str, Any]) -> None:
+        if event in _CONNECT_STARTED:
+            self._started = time.perf_counter()
+        elif event in _CONNECT_COMPLETE:
+            self.transport._observe_connect(event, time.perf_counter() - self._started)
+        elif event in _REQUEST_SENT:
+            self.transport._observe_request(http2=event.startswith("http2."))
+        if self.user_trace is not None:
+            await self.user_trace(event, info)
+
+
+_CONNECT_STARTED = frozenset(
+    {"connection.connect_tcp.started", "connection.start_tls.started"}
+)
+_CONNECT_COMPLETE = frozenset(
+    {"connection.connect_tcp.complete", "connection.start_tls.complete"}
+)
+_REQUEST_SENT = frozenset(
+    {"http11.send_request_headers.started", "http2.send_request_headers.started"}
+)
+
+
+class ConnectionReuseTransport(AsyncBaseTransport):
+    """
+    Transport layer that counts new versus reused pooled connections.
+
+    Sits directly on the base transport and listens to httpcore's ``trace``
+    request extension (chaining any ``trace`` the caller set), so
+    :meth:`stats` shows whether requests pay for DNS, TCP and TLS setup or
+    ride an open connection — e.g. that a warmed-up client's first call no
+    longer does.
+    """
+
+    def __init__(
+        self,
+        wrapped_transport: AsyncBaseTransport | None = None,
+        *,
+        logger: Logger | None = None,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the connection reuse transport.
+
+        Args:
+            wrapped_transport: The transport to wrap. If None, creates a new AsyncHTTPTransport.
+            logger: Logger for warm-up failures. If None, creates a default
+                logger.
+            **kwargs: Additional arguments passed to AsyncHTTPTransport if wrapped_transport is None.
+        """
+        if wrapped_transport is None:
+            wrapped_transport = AsyncHTTPTransport(**kwargs)
+        self._wrapped_transport = wrapped_transport
+        self.logger: Logger = logger or logging.getLogger(__name__)
+        self._requests = 0
+        self._connections_opened = 0
+        self._tls_handshakes = 0
+        self._connect_seconds = 0.0
+        self._http2_requests = 0
+        self._warm_ups = 0
+
+    def stats(self) -> ConnectionStats:
+        """Snapshot of the connection counters."""
+        return ConnectionStats(
+            requests=self._requests,
+            connections_opened=self._connections_opened,
+            tls_handshakes=self._tls_handshakes,
+            connect_seconds_total=self._connect_seconds,
+            http2_requests=self._http2_requests,
+            warm_ups=self._warm_ups,
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Forward the request with a ``trace`` hook that records connection use."""
+        existing = request.extensions.get("trace")
+        # A retried request comes back with our hook already installed
+        user_trace = (
+            existing.user_trace if isinstance(existing, _ConnectionTrace) else existing
+        )
+        request.extensions = {
+            **request.extensions,
+            "trace": _ConnectionTrace(self, user_trace),
+        }
+        return await self._wrapped_transport.handle_async_request(request)
+
+    async def warm_up(self, url: str, *, timeout: float = 5.0) -> bool:
+        """Open a pooled connection to ``url``'s host with an unauthenticated HEAD.
+
+        The request bypasses the rest of the chain: it spends no rate-limit
+        token, is never retried and carries no credentials. Failures are
+        logged at debug level and leave the client usable; the first real
+        request then connects as usual.
+
+        Returns:
+            Whether the connection was opened.
+        """
+        request = httpx.Request(
+            "HEAD", url, extensions={"timeout": httpx.Timeout(timeout).as_dict()}
+        )
+        try:
+            response = await self.handle_async_request(request)
+            # Reading the (empty) body lets httpcore return the connection to
+            # the pool; closing an unread response would drop it
+            await response.aread()
+        except httpx.HTTPError as e:
+            self.logger.debug("Connection warm-up failed: %s", e)
+            return False
+        self._warm_ups += 1
+        return True
+
+    async def aclose(self) -> None:
+        """Propagate close down the wrapped chain so inner transports release resources."""
+        await self._wrapped_transport.aclose()
+
+    def _observe_connect(self, event: str, seconds: float) -> None:
+        if event == "connection.connect_tcp.complete":
+            self._connections_opened += 1
+        else:
+            self._tls_handshakes += 1
+        self._connect_seconds += seconds
+
+    def _observe_request(self, *, http2: bool) -> None:
+        self._requests += 1
+        if http2:
+            self._http2_requests += 1
+
+
+__all__ = ["ConnectionProfile", "ConnectionReuseTransport", "ConnectionStats"]
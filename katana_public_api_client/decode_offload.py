@@ -0,0 +1,240 @@
+"""Parse large ``GET`` responses off the event loop for ``KatanaClient``.
+
+:class:`DecodeOffloadTransport` decodes a large ``200`` body and builds the
+endpoint's model in a thread or process pool, then hands the model to the
+generated ``_parse_response`` through ``PARSED_MODEL_EXTENSION``.
+``KatanaClient(decode_offload=...)`` configures it with a
+:class:`~katana_public_api_client.katana_client.DecodeOffload`.
+:func:`parse_decoded_json` builds the same model from a body that is already
+decoded.
+"""
+
+import asyncio
+import functools
+import importlib
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+from types import ModuleType
+from typing import Any, cast
+
+import httpx
+from attrs import define
+from httpx import AsyncBaseTransport, AsyncHTTPTransport
+
+from ._logging import Logger
+from .client import Client
+from .json_codec import JSONCodec, JSONCodecName, resolve_json_codec
+from .katana_client import (
+    _DECODED_JSON_RESULTS,
+    DECODE_OFFLOAD_EXTENSION,
+    DECODED_JSON_EXTENSION,
+    ENDPOINT_EXTENSION,
+    PARSED_MODEL_EXTENSION,
+    DecodeOffload,
+    _CodecJSONResponse,
+    _is_deferred,
+    _known_body_size,
+    _sanitize_url,
+)
+
+
+@define(frozen=True)
+class DecodeOffloadStats:
+    """Counters from ``DecodeOffloadTransport``.
+
+    Attributes:
+        prebuilt: Responses whose model was built in a worker.
+        failed: Responses the worker could not parse; they were handed on
+            untouched, to fail the same way on the event loop.
+    """
+
+    prebuilt: int
+    failed: int
+
+
+def parse_decoded_json(endpoint: ModuleType | str, payload: Any) -> Any:
+    """Build a GET endpoint's ``200`` model from its already-decoded body.
+
+    Runs the generated module's own ``_parse_response``, so the result is
+    what ``asyncio_detailed`` would have parsed from the same body.
+
+    Args:
+        endpoint: The generated endpoint module, or its dotted name.
+        payload: The decoded JSON body. It is not modified.
+
+    Example:
+        >>> from katana_public_api_client.api.variant import get_all_variants
+        >>> page = parse_decoded_json(get_all_variants, {"data": [record]})
+        >>> variant = page.data[0]
+    """
+    if isinstance(endpoint, str):
+        endpoint = importlib.import_module(endpoint)
+    response = _CodecJSONResponse(
+        status_code=200, extensions={DECODED_JSON_EXTENSION: payload}
+    )
+    return endpoint._parse_response(client=Client(base_url=""), response=response)
+
+
+def _parse_in_worker(
+    endpoint: str,
+    body: bytes | None,
+    payload: Any,
+    json_codec: JSONCodec | JSONCodecName,
+) -> Any:
+    """Build ``endpoint``'s model from ``body``, or from ``payload`` if already decoded.
+
+    Runs in a ``DecodeOffloadTransport`` worker thread or process, through
+    the generated module's own ``_parse_response``.
+    """
+    if body is not None:
+        payload = resolve_json_codec(json_codec).loads(body)
+    return parse_decoded_json(endpoint, payload)
+
+
+class DecodeOffloadTransport(AsyncBaseTransport):
+    """Transport layer that parses large ``GET`` responses in a worker.
+
+    The generated ``asyncio_detailed`` functions decode the body and run
+    ``from_dict`` synchronously once the response arrives, so a 25k-item
+    auto-paginated collection holds the event loop — and every other call in
+    flight — for a second or more. For a ``200`` at or above
+    ``threshold_bytes`` this layer does that work in a thread (or process)
+    pool instead: the generated module named by the request's
+    ``ENDPOINT_EXTENSION`` builds the model with its own ``_parse_response``
+    in the worker, and the model rides back in
+    ``extensions[PARSED_MODEL_EXTENSION]``, which the generated
+    ``_parse_response`` returns without parsing again. Requests sent
+    directly through the httpx client carry no endpoint and pass untouched.
+
+    Only bodies whose size is known up front (read already, as auto-paginated
+    collections are, or with a ``Content-Length``) are considered, so a
+    chunked streamed body is never buffered by this layer. Set the request
+    extension ``DECODE_OFFLOAD_EXTENSION`` to ``False`` to opt a request out;
+    requests made inside ``decoded_json_responses()`` are skipped as well,
+    since they want no model.
+    """
+
+    def __init__(
+        self,
+        wrapped_transport: AsyncBaseTransport | None = None,
+        *,
+        offload: DecodeOffload | None = None,
+        json_codec: JSONCodec | JSONCodecName = "auto",
+        logger: Logger | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the decode offload transport.
+
+        Args:
+            wrapped_transport: The transport to wrap. If None, creates a new
+                AsyncHTTPTransport.
+            offload: Threshold and executor settings. Defaults to
+                ``DecodeOffload()``.
+            json_codec: Codec (or backend name) the worker decodes with. A
+                process worker resolves it by name.
+            logger: Logger for failed worker parses. If None, creates a
+                default logger.
+            **kwargs: Additional arguments passed to AsyncHTTPTransport if
+                wrapped_transport is None.
+
+        Raises:
+            ValueError: If the executor kind is unknown or the threshold is
+                negative.
+        """
+        offload = offload if offload is not None else DecodeOffload()
+        if offload.executor not in ("thread", "process"):
+            msg = (
+                f"Unknown decode offload executor {offload.executor!r}; "
+                "expected 'thread' or 'process'"
+            )
+            raise ValueError(msg)
+        if offload.threshold_bytes < 0:
+            msg = f"threshold_bytes must not be negative, got {offload.threshold_bytes}"
+            raise ValueError(msg)
+        if wrapped_transport is None:
+            wrapped_transport = AsyncHTTPTransport(**kwargs)
+        self._wrapped_transport = wrapped_transport
+        self.offload = offload
+        self.json_codec = resolve_json_codec(json_codec)
+        self.logger: Logger = logger or logging.getLogger(__name__)
+        self._executor: Executor | None = None
+        self._prebuilt = 0
+        self._failed = 0
+
+    def stats(self) -> DecodeOffloadStats:
+        """Return how many responses were parsed off the event loop."""
+        return DecodeOffloadStats(prebuilt=self._prebuilt, failed=self._failed)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Forward the request and parse a large ``200`` body in a worker."""
+        response = await self._wrapped_transport.handle_async_request(request)
+        endpoint = request.extensions.get(ENDPOINT_EXTENSION)
+        if (
+            endpoint is None
+            or response.status_code != HTTPStatus.OK
+            or request.extensions.get(DECODE_OFFLOAD_EXTENSION) is False
+            or _DECODED_JSON_RESULTS.get()
+        ):
+            return response
+        size = _known_body_size(response)
+        if size is None or size < self.offload.threshold_bytes:
+            return response
+
+        decoded = response.extensions.get(DECODED_JSON_EXTENSION)
+        if decoded is None:
+            await response.aread()
+        process = self.offload.executor == "process"
+        # A process worker gets the wire body, unless only the payload exists
+        send_body = decoded is None or (process and not _is_deferred(response))
+        parse = functools.partial(
+            _parse_in_worker,
+            endpoint,
+            response.content if send_body else None,
+            None if send_body else decoded,
+            cast(JSONCodecName, self.json_codec.name) if process else self.json_codec,
+        )
+        try:
+            model = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), parse
+            )
+        except Exception as e:
+            self._failed += 1
+            self.logger.debug(
+                "Off-loop parse of %s failed, leaving it to the caller: %s",
+                _sanitize_url(str(request.url)),
+                e,
+            )
+            return response
+
+        if model is not None:
+            self._prebuilt += 1
+            response.extensions = {**response.extensions, PARSED_MODEL_EXTENSION: model}
+        return response
+
+    async def aclose(self) -> None:
+        """Shut the worker pool down and propagate close down the chain."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        await self._wrapped_transport.aclose()
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.offload.executor == "process":
+                # Spawned rather than forked: the parent runs an event loop
+                # and connection pool threads that must not be duplicated
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.offload.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.offload.max_workers,
+                    thread_name_prefix="katana-decode",
+                )
+        return self._executor
+
+
+__all__ = ["DecodeOffloadStats", "DecodeOffloadTransport", "parse_decoded_json"]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import builtins
+from collections.abc import Iterable
 from typing import Any
 
 from katana_public_api_client.api.material import (
@@ -12,6 +13,12 @@ from katana_public_api_client.api.material import (
     get_material,
     update_material,
 )
+from katana_public_api_client.api_wrapper._batch import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_CONCURRENCY,
+    GetManyResult,
+    fetch_many,
+)
 from katana_public_api_client.domain import (
     KatanaMaterial,
     material_to_katana,
@@ -79,6 +86,51 @@ class Materials(Base):
         attrs_material = unwrap_as(response, Material)
         return material_to_katana(attrs_material)
 
+    async def get_many(
+        self,
+        material_ids: Iterable[int],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        **filters: Any,
+    ) -> GetManyResult[KatanaMaterial]:
+        """Get many materials by ID with a few batched list requests.
+
+        IDs go out ``chunk_size`` at a time through the ``ids`` filter, with
+        at most ``concurrency`` requests in flight.
+
+        Args:
+            material_ids: The material IDs. Duplicates are fetched once.
+            chunk_size: Maximum IDs per request.
+            concurrency: Maximum requests in flight.
+            **filters: Extra list filters (e.g. ``include_deleted=True``).
+
+        Returns:
+            ``found`` maps each ID to its KatanaMaterial; ``missing`` lists IDs
+            the API did not return.
+
+        Example:
+            >>> result = await client.materials.get_many([1, 2, 3])
+            >>> result.found[1], result.missing
+        """
+
+        async def fetch_chunk(
+            chunk: builtins.list[int],
+        ) -> builtins.list[KatanaMaterial]:
+            response = await get_all_materials.asyncio_detailed(
+                client=self._client,
+                ids=chunk,
+                **filters,
+            )
+            return materials_to_katana(unwrap_data(response, default=[]))
+
+        return await fetch_many(
+            material_ids,
+            fetch_chunk,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+        )
+
     async def create(self, material_data: CreateMaterialRequest) -> KatanaMaterial:
         """Create a new material.
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import builtins
+from collections.abc import Iterable
 from typing import Any
 
 from katana_public_api_client.api.product import (
@@ -12,6 +13,12 @@ from katana_public_api_client.api.product import (
     get_product,
     update_product,
 )
+from katana_public_api_client.api_wrapper._batch import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_CONCURRENCY,
+    GetManyResult,
+    fetch_many,
+)
 from katana_public_api_client.domain import (
     KatanaProduct,
     product_to_katana,
@@ -78,6 +85,51 @@ class Products(Base):
         attrs_product = unwrap_as(response, Product)
         return product_to_katana(attrs_product)
 
+    async def get_many(
+        self,
+        product_ids: Iterable[int],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        **filters: Any,
+    ) -> GetManyResult[KatanaProduct]:
+        """Get many products by ID with a few batched list requests.
+
+        IDs go out ``chunk_size`` at a time through the ``ids`` filter, with
+        at most ``concurrency`` requests in flight.
+
+        Args:
+            product_ids: The product IDs. Duplicates are fetched once.
+            chunk_size: Maximum IDs per request.
+            concurrency: Maximum requests in flight.
+            **filters: Extra list filters (e.g. ``include_deleted=True``).
+
+        Returns:
+            ``found`` maps each ID to its KatanaProduct; ``missing`` lists IDs
+            the API did not return.
+
+        Example:
+            >>> result = await client.products.get_many([1, 2, 3])
+            >>> result.found[1], result.missing
+        """
+
+        async def fetch_chunk(
+            chunk: builtins.list[int],
+        ) -> builtins.list[KatanaProduct]:
+            response = await get_all_products.asyncio_detailed(
+                client=self._client,
+                ids=chunk,
+                **filters,
+            )
+            return products_to_katana(unwrap_data(response, default=[]))
+
+        return await fetch_many(
+            product_ids,
+            fetch_chunk,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+        )
+
     async def create(self, product_data: CreateProductRequest) -> KatanaProduct:
         """Create a new product.
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import builtins
+from collections.abc import Iterable
 from typing import Any
 
 from katana_public_api_client.api.services import (
@@ -12,6 +13,12 @@ from katana_public_api_client.api.services import (
     get_service,
     update_service,
 )
+from katana_public_api_client.api_wrapper._batch import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_CONCURRENCY,
+    GetManyResult,
+    fetch_many,
+)
 from katana_public_api_client.domain import (
     KatanaService,
     service_to_katana,
@@ -75,6 +82,51 @@ class Services(Base):
         attrs_service = unwrap_as(response, Service)
         return service_to_katana(attrs_service)
 
+    async def get_many(
+        self,
+        service_ids: Iterable[int],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        **filters: Any,
+    ) -> GetManyResult[KatanaService]:
+        """Get many services by ID with a few batched list requests.
+
+        IDs go out ``chunk_size`` at a time through the ``ids`` filter, with
+        at most ``concurrency`` requests in flight.
+
+        Args:
+            service_ids: The service IDs. Duplicates are fetched once.
+            chunk_size: Maximum IDs per request.
+            concurrency: Maximum requests in flight.
+            **filters: Extra list filters (e.g. ``include_deleted=True``).
+
+        Returns:
+            ``found`` maps each ID to its KatanaService; ``missing`` lists IDs
+            the API did not return.
+
+        Example:
+            >>> result = await client.services.get_many([1, 2, 3])
+            >>> result.found[1], result.missing
+        """
+
+        async def fetch_chunk(
+            chunk: builtins.list[int],
+        ) -> builtins.list[KatanaService]:
+            response = await get_all_services.asyncio_detailed(
+                client=self._client,
+                ids=chunk,
+                **filters,
+            )
+            return services_to_katana(unwrap_data(response, default=[]))
+
+        return await fetch_many(
+            service_ids,
+            fetch_chunk,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+        )
+
     async def create(self, service_data: CreateServiceRequest) -> KatanaService:
         """Create a new service.
 
@@ -6,6 +6,7 @@ import logging
 
 # Import list from builtins to avoid shadowing by our list() method
 from builtins import list as List
+from collections.abc import Iterable
 from typing import Any
 
 from katana_public_api_client.api.variant import (
@@ -15,6 +16,12 @@ from katana_public_api_client.api.variant import (
     get_variant,
     update_variant,
 )
+from katana_public_api_client.api_wrapper._batch import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_CONCURRENCY,
+    GetManyResult,
+    fetch_many,
+)
 from katana_public_api_client.domain import KatanaVariant, variants_to_katana
 from katana_public_api_client.domain.converters import variant_to_katana
 from katana_public_api_client.helpers.base import Base
@@ -86,6 +93,49 @@ class Variants(Base):
         attrs_variant = unwrap_as(response, Variant)
         return variant_to_katana(attrs_variant)
 
+    async def get_many(
+        self,
+        variant_ids: Iterable[int],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        **filters: Any,
+    ) -> GetManyResult[KatanaVariant]:
+        """Get many variants by ID with a few batched list requests.
+
+        IDs go out ``chunk_size`` at a time through the ``ids`` filter, with
+        at most ``concurrency`` requests in flight.
+
+        Args:
+            variant_ids: The variant IDs. Duplicates are fetched once.
+            chunk_size: Maximum IDs per request.
+            concurrency: Maximum requests in flight.
+            **filters: Extra list filters (e.g. ``include_deleted=True``).
+
+        Returns:
+            ``found`` maps each ID to its KatanaVariant; ``missing`` lists IDs
+            the API did not return.
+
+        Example:
+            >>> result = await client.variants.get_many([1, 2, 3])
+            >>> result.found[1], result.missing
+        """
+
+        async def fetch_chunk(chunk: List[int]) -> List[KatanaVariant]:
+            response = await get_all_variants.asyncio_detailed(
+                client=self._client,
+                ids=chunk,
+                **filters,
+            )
+            return variants_to_katana(unwrap_data(response, default=[]))
+
+        return await fetch_many(
+            variant_ids,
+            fetch_chunk,
+            chunk_size=chunk_size,
+            concurrency=concurrency,
+        )
+
     async def create(self, variant_data: CreateVariantRequest) -> KatanaVariant:
         """Create a new variant.
 
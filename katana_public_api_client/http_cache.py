@@ -0,0 +1,514 @@
+"""Conditional-request HTTP cache for ``KatanaClient``.
+
+Detail lookups such as ``get_product`` or ``get_purchase_order`` are repeated
+constantly, and without a cache every repeat transfers and parses the full
+body again. :class:`HttpCacheStore` keeps successful GET responses in one
+SQLite file, together with their validators (``ETag`` / ``Last-Modified``)
+and a freshness deadline, so ``HttpCacheTransport`` can:
+
+- serve a response that is still fresh without touching the network;
+- revalidate a stale one with ``If-None-Match`` / ``If-Modified-Since`` and
+  replay the stored body on ``304 Not Modified``.
+
+Entries are keyed by URL and a hash of the request's ``Authorization`` header,
+so clients using different API keys never see each other's responses and no
+key is written to disk. The file may be shared by several processes.
+:class:`HttpCacheTransport` is the transport layer that reads and writes it.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+
+import httpx
+from attrs import define
+from httpx import AsyncBaseTransport, AsyncHTTPTransport
+
+from ._logging import Logger
+from .json_codec import JSONCodec, JSONCodecName, resolve_json_codec
+from .katana_client import _CodecJSONResponse, _sanitize_url
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS http_cache (
+    key TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    status_code INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    content BLOB NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+_CREATE_PATH_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_http_cache_path ON http_cache(path)"
+)
+_CREATE_STORED_AT_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_http_cache_stored_at ON http_cache(stored_at)"
+)
+
+
+@define(frozen=True)
+class CachedResponse:
+    """A stored response.
+
+    Attributes:
+        status_code: HTTP status of the stored response.
+        headers: Response headers as ``(name, value)`` pairs, minus the wire
+            ``Content-Encoding``/``Content-Length`` (``content`` is decoded).
+        content: Decoded response body.
+        stored_at: Epoch seconds the response was stored or last revalidated.
+        expires_at: Epoch seconds until which it may be served without
+            revalidation.
+    """
+
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+    stored_at: float
+    expires_at: float
+
+    @property
+    def etag(self) -> str | None:
+        """The stored ``ETag`` validator, if any."""
+        return self._header("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        """The stored ``Last-Modified`` validator, if any."""
+        return self._header("last-modified")
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        """Whether the entry may be served without revalidating."""
+        return (time.time() if now is None else now) < self.expires_at
+
+    def _header(self, name: str) -> str | None:
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return None
+
+
+class HttpCacheStore:
+    """SQLite-backed store of cached GET responses.
+
+    Pass one to ``KatanaClient(http_cache=...)`` (or just the path), or to
+    ``HttpCacheTransport(store=...)`` directly. Methods are synchronous —
+    the transport runs them in a worker thread — and each runs one short
+    SQLite statement; they are safe to call from any number of threads.
+
+    Args:
+        path: SQLite database file (``~`` is expanded). Created, with its parent
+            directory, if missing.
+        max_entries: Entries kept before the least recently stored ones are
+            evicted. Defaults to 10,000.
+
+    Raises:
+        ValueError: If ``max_entries`` is not positive.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str], *, max_entries: int = 10_000
+    ) -> None:
+        if max_entries <= 0:
+            msg = f"max_entries must be positive, got {max_entries}"
+            raise ValueError(msg)
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        # Keeps threads from interleaving statements on the one connection
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, isolation_level=None, check_same_thread=False, timeout=30.0
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_CREATE_TABLE)
+        self._conn.execute(_CREATE_PATH_INDEX)
+        self._conn.execute(_CREATE_STORED_AT_INDEX)
+        # Rows in the file as this process last counted them plus its puts
+        # since (a replaced key counts twice), so ``put`` only runs the
+        # eviction query once the cap may have been passed. Other processes
+        # sharing the file evict on their own puts.
+        self._entries = self._count()
+
+    @staticmethod
+    def key_for(url: str, authorization: str | None) -> str:
+        """Return the store key for ``url`` requested with ``authorization``."""
+        scope = hashlib.sha256((authorization or "").encode()).hexdigest()[:16]
+        return f"{scope} {url}"
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Return the entry stored under ``key``, fresh or not."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status_code, headers, content, stored_at, expires_at "
+                "FROM http_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        status_code, headers, content, stored_at, expires_at = row
+        return CachedResponse(
+            status_code=status_code,
+            headers=[(name, value) for name, value in json.loads(headers)],
+            content=content,
+            stored_at=stored_at,
+            expires_at=expires_at,
+        )
+
+    def put(self, key: str, path: str, response: CachedResponse) -> None:
+        """Store ``response`` under ``key``, evicting the oldest entries if full.
+
+        ``path`` is the request URL's path, used by :meth:`invalidate_path`.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    path,
+                    response.status_code,
+                    json.dumps(response.headers),
+                    response.content,
+                    response.stored_at,
+                    response.expires_at,
+                ),
+            )
+            self._entries += 1
+            if self._entries <= self.max_entries:
+                return
+            self._conn.execute(
+                "DELETE FROM http_cache WHERE key IN (SELECT key FROM http_cache "
+                "ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._entries = self._count()
+
+    def delete(self, key: str) -> None:
+        """Drop the entry stored under ``key``, if any."""
+        self._delete("DELETE FROM http_cache WHERE key = ?", (key,))
+
+    def invalidate_path(self, path: str) -> int:
+        """Drop every entry for ``path`` (any query, any API key); return how many."""
+        return self._delete("DELETE FROM http_cache WHERE path = ?", (path,))
+
+    def invalidate_prefix(self, prefix: str) -> int:
+        """Drop every entry for ``prefix`` or a path below it; return how many.
+
+        ``invalidate_prefix("/v1/products")`` drops ``/v1/products`` and
+        ``/v1/products/5``, but not ``/v1/products_archive``.
+        """
+        prefix = prefix.rstrip("/")
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return self._delete(
+            "DELETE FROM http_cache WHERE path = ? OR path LIKE ? ESCAPE '\\'",
+            (prefix, f"{escaped}/%"),
+        )
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._delete("DELETE FROM http_cache", ())
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _delete(self, sql: str, params: tuple[str, ...]) -> int:
+        """Run one ``DELETE``; return how many entries it dropped."""
+        with self._lock:
+            dropped = self._conn.execute(sql, params).rowcount
+            self._entries = max(0, self._entries - dropped)
+        return dropped
+
+    def _count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM http_cache").fetchone()[0]
+
+
+# Set on responses passed through ``HttpCacheTransport``: ``"hit"`` (served
+# fresh from the store), ``"revalidated"`` (replayed on 304) or ``"miss"``.
+HTTP_CACHE_EXTENSION = "katana_http_cache"
+
+_WIRE_ONLY_HEADERS = ("content-encoding", "content-length")
+_UNSAFE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+@define(frozen=True)
+class HttpCacheStats:
+    """Counters from ``HttpCacheTransport``.
+
+    Attributes:
+        hits: GETs served from a fresh stored response, without a request.
+        revalidated: GETs answered ``304 Not Modified`` and replayed from the
+            store.
+        misses: GETs that fetched a full response.
+    """
+
+    hits: int
+    revalidated: int
+    misses: int
+
+
+def _cache_control(headers: httpx.Headers) -> dict[str, str | None]:
+    """Parse ``Cache-Control`` into lower-cased directives and their values."""
+    directives: dict[str, str | None] = {}
+    for part in headers.get("Cache-Control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def _collection_path(path: str) -> str:
+    """The collection a write to ``path`` touches: the path before its first id."""
+    segments = path.rstrip("/").split("/")
+    for index, segment in enumerate(segments):
+        if segment.isdigit():
+            return "/".join(segments[:index])
+    return "/".join(segments)
+
+
+def _is_detail_request(request: httpx.Request) -> bool:
+    """Whether ``request`` fetches a single resource, e.g. ``/products/123``."""
+    return request.url.path.rstrip("/").rpartition("/")[2].isdigit()
+
+
+class HttpCacheTransport(AsyncBaseTransport):
+    """Conditional-request HTTP cache over a persistent ``HttpCacheStore``.
+
+    Successful GET responses are stored with their ``ETag``/``Last-Modified``
+    validators. A later identical GET (same URL and API key) is then:
+
+    - served straight from the store while the entry is fresh — for
+      ``Cache-Control: max-age`` seconds, or, for detail GETs such as
+      ``/products/123`` without ``max-age``, for ``detail_ttl`` seconds;
+    - otherwise sent with ``If-None-Match``/``If-Modified-Since``, and a
+      ``304 Not Modified`` is answered with the stored body.
+
+    ``Cache-Control: no-store`` (request or response) bypasses the store;
+    ``no-cache`` forces revalidation. Responses that ``Vary`` on anything but
+    ``Accept-Encoding`` aren't stored. A successful POST/PUT/PATCH/DELETE
+    drops every stored response in the written resource's collection — the
+    path up to its first numeric id, so a write to ``/sales_order_rows/5``
+    drops the ``/sales_order_rows`` list pages and every
+    ``/sales_order_rows/...`` detail. Responses of other collections that
+    embed the written resource (``/sales_orders/1`` listing its rows) are
+    not dropped and stay cached until they go stale. Requests that already
+    carry validators are the caller's own conditional requests and pass
+    through untouched; validators the cache adds go on a copy of the
+    request, never on the caller's.
+
+    Served responses carry ``extensions[HTTP_CACHE_EXTENSION]``; ``stats()``
+    counts hits, revalidations and misses. Store reads and writes run in a
+    worker thread, so a cache file locked by another process never stalls
+    the event loop.
+    """
+
+    def __init__(
+        self,
+        wrapped_transport: AsyncBaseTransport | None = None,
+        *,
+        store: HttpCacheStore,
+        detail_ttl: float = 0.0,
+        json_codec: JSONCodec | JSONCodecName = "auto",
+        logger: Logger | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the HTTP cache transport.
+
+        Args:
+            wrapped_transport: The transport to wrap. If None, creates a new
+                AsyncHTTPTransport.
+            store: Where responses are kept.
+            detail_ttl: Seconds a detail GET response without
+                ``Cache-Control: max-age`` stays fresh. ``0`` (the default)
+                always revalidates.
+            json_codec: Codec for ``json()`` on responses served from the
+                store. Defaults to ``"auto"``.
+            logger: Logger for cache activity. If None, creates a default
+                logger.
+            **kwargs: Additional arguments passed to AsyncHTTPTransport if
+                wrapped_transport is None.
+
+        Raises:
+            ValueError: If ``detail_ttl`` is negative.
+        """
+        if detail_ttl < 0:
+            msg = f"detail_ttl must not be negative, got {detail_ttl}"
+            raise ValueError(msg)
+        if wrapped_transport is None:
+            wrapped_transport = AsyncHTTPTransport(**kwargs)
+        self._wrapped_transport = wrapped_transport
+        self.store = store
+        self._detail_ttl = detail_ttl
+        self.json_codec = resolve_json_codec(json_codec)
+        self._hits = 0
+        self._revalidated = 0
+        self._misses = 0
+        self.logger: Logger = logger or logging.getLogger(__name__)
+
+    def stats(self) -> HttpCacheStats:
+        """Return hit, revalidation and miss counts so far."""
+        return HttpCacheStats(
+            hits=self._hits, revalidated=self._revalidated, misses=self._misses
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Serve from the store, revalidate, or fetch and store."""
+        if request.method != "GET":
+            response = await self._wrapped_transport.handle_async_request(request)
+            if request.method in _UNSAFE_METHODS and response.status_code < 400:
+                await asyncio.to_thread(
+                    self.store.invalidate_prefix, _collection_path(request.url.path)
+                )
+            return response
+
+        request_directives = _cache_control(request.headers)
+        if (
+            "no-store" in request_directives
+            or "If-None-Match" in request.headers
+            or "If-Modified-Since" in request.headers
+            or "content-length" in request.headers
+        ):
+            return await self._wrapped_transport.handle_async_request(request)
+
+        key = self.store.key_for(str(request.url), request.headers.get("Authorization"))
+        cached = await asyncio.to_thread(self.store.get, key)
+        force_revalidate = (
+            "no-cache" in request_directives or request_directives.get("max-age") == "0"
+        )
+        if cached is not None and cached.is_fresh() and not force_revalidate:
+            self._hits += 1
+            return self._replay(cached, request, "hit")
+
+        forwarded = request
+        if cached is not None:
+            # A retry above re-sends the caller's request, which must not
+            # look like a conditional request of its own then
+            headers = request.headers.copy()
+            if cached.etag is not None:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified is not None:
+                headers["If-Modified-Since"] = cached.last_modified
+            forwarded = httpx.Request(
+                request.method,
+                request.url,
+                headers=headers,
+                extensions=dict(request.extensions),
+            )
+
+        response = await self._wrapped_transport.handle_async_request(forwarded)
+
+        if cached is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+            await response.aclose()
+            headers = httpx.Headers(cached.headers)
+            for name, value in response.headers.items():
+                if name not in _WIRE_ONLY_HEADERS:
+                    headers[name] = value
+            freshness = self._freshness(request, headers) or 0.0
+            now = time.time()
+            refreshed = CachedResponse(
+                status_code=cached.status_code,
+                headers=list(headers.items()),
+                content=cached.content,
+                stored_at=now,
+                expires_at=now + freshness,
+            )
+            await asyncio.to_thread(self.store.put, key, request.url.path, refreshed)
+            self._revalidated += 1
+            return self._replay(refreshed, request, "revalidated")
+
+        self._misses += 1
+        response.extensions[HTTP_CACHE_EXTENSION] = "miss"
+        if response.status_code == HTTPStatus.OK:
+            await self._store_response(key, request, response)
+        return response
+
+    async def aclose(self) -> None:
+        """Propagate close down the wrapped chain so inner transports release resources."""
+        await self._wrapped_transport.aclose()
+
+    async def _store_response(
+        self, key: str, request: httpx.Request, response: httpx.Response
+    ) -> None:
+        freshness = self._freshness(request, response.headers)
+        vary = response.headers.get("Vary", "").strip().lower()
+        has_validators = "ETag" in response.headers or (
+            "Last-Modified" in response.headers
+        )
+        if (
+            freshness is None
+            or vary not in ("", "accept-encoding")
+            or not (freshness > 0 or has_validators)
+        ):
+            # An older copy must not outlive a response that can't replace it
+            await asyncio.to_thread(self.store.delete, key)
+            return
+
+        content = await response.aread()
+        now = time.time()
+        await asyncio.to_thread(
+            self.store.put,
+            key,
+            request.url.path,
+            CachedResponse(
+                status_code=response.status_code,
+                headers=[
+                    (name, value)
+                    for name, value in response.headers.items()
+                    if name not in _WIRE_ONLY_HEADERS
+                ],
+                content=content,
+                stored_at=now,
+                expires_at=now + freshness,
+            ),
+        )
+
+    def _freshness(
+        self, request: httpx.Request, headers: httpx.Headers
+    ) -> float | None:
+        """Seconds a response stays fresh, or ``None`` if it may not be stored."""
+        directives = _cache_control(headers)
+        if "no-store" in directives:
+            return None
+        if "no-cache" in directives:
+            return 0.0
+        max_age = directives.get("max-age")
+        if max_age is not None:
+            try:
+                return max(0.0, float(max_age))
+            except ValueError:
+                return 0.0
+        return self._detail_ttl if _is_detail_request(request) else 0.0
+
+    def _replay(
+        self, cached: CachedResponse, request: httpx.Request, outcome: str
+    ) -> httpx.Response:
+        self.logger.debug(
+            "HTTP cache %s for %s", outcome, _sanitize_url(str(request.url))
+        )
+        response = _CodecJSONResponse(
+            status_code=cached.status_code,
+            headers=cached.headers,
+            content=cached.content,
+            request=request,
+            extensions={HTTP_CACHE_EXTENSION: outcome},
+        )
+        response.json_codec = self.json_codec
+        return response
+
+
+__all__ = [
+    "HTTP_CACHE_EXTENSION",
+    "CachedResponse",
+    "HttpCacheStats",
+    "HttpCacheStore",
+    "HttpCacheTransport",
+]
@@ -0,0 +1,153 @@
+"""Pluggable JSON codecs for the transport layer and response parsers.
+
+``KatanaClient`` decodes every response body (and re-encodes stitched
+auto-paginated collections), so JSON handling is a large share of per-request
+CPU when many list calls fan out concurrently. This module lets the client pick
+a faster backend when one is installed:
+
+- ``"orjson"`` — `orjson <https://github.com/ijl/orjson>`_
+- ``"msgspec"`` — `msgspec <https://jcristharif.com/msgspec/>`_
+- ``"stdlib"`` — the standard library :mod:`json` module (always available)
+
+``"auto"`` (the default) picks the first installed backend in that order. Install
+the optional extra to get one::
+
+    pip install "katana-openapi-client[fast-json]"
+
+Every codec raises :class:`json.JSONDecodeError` on malformed input, so callers
+only need to handle the one exception type regardless of backend.
+"""
+
+import importlib.util
+import json
+from typing import Any, Literal, Protocol
+
+JSONCodecName = Literal["auto", "orjson", "msgspec", "stdlib"]
+
+_FAST_JSON_HINT = 'pip install "katana-openapi-client[fast-json]"'
+
+
+class JSONCodec(Protocol):
+    """Structural type for a JSON backend: decode bytes/str, encode to bytes."""
+
+    name: str
+
+    def loads(self, data: bytes | str) -> Any: ...
+
+    def dumps(self, obj: Any) -> bytes: ...
+
+
+class StdlibJSONCodec:
+    """Codec backed by the standard library :mod:`json` module."""
+
+    name = "stdlib"
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
+class OrjsonCodec:
+    """Codec backed by ``orjson``.
+
+    ``orjson.JSONDecodeError`` already subclasses :class:`json.JSONDecodeError`.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+
+class MsgspecCodec:
+    """Codec backed by ``msgspec.json``, with reusable encoder/decoder instances."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._decode_error = msgspec.DecodeError
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as e:
+            # Normalize to the stdlib exception every caller already handles
+            doc = data if isinstance(data, str) else data.decode("utf-8", "replace")
+            raise json.JSONDecodeError(str(e), doc, 0) from e
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+
+_CODECS: dict[str, type[StdlibJSONCodec | OrjsonCodec | MsgspecCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "stdlib": StdlibJSONCodec,
+}
+
+STDLIB_JSON_CODEC: JSONCodec = StdlibJSONCodec()
+"""Shared stdlib codec; the default wherever no codec has been configured."""
+
+
+def resolve_json_codec(codec: JSONCodec | JSONCodecName = "auto") -> JSONCodec:
+    """Return a codec instance for ``codec``.
+
+    Args:
+        codec: A backend name, or any object implementing :class:`JSONCodec`
+            (returned unchanged). ``"auto"`` selects ``orjson``, then
+            ``msgspec``, then the stdlib, depending on what is installed.
+
+    Raises:
+        ValueError: If ``codec`` is not a known backend name.
+        ImportError: If a specific backend is requested but not installed.
+    """
+    if not isinstance(codec, str):
+        return codec
+
+    if codec == "auto":
+        for name in ("orjson", "msgspec"):
+            if importlib.util.find_spec(name) is not None:
+                return _CODECS[name]()
+        return STDLIB_JSON_CODEC
+
+    if codec == "stdlib":
+        return STDLIB_JSON_CODEC
+
+    codec_cls = _CODECS.get(codec)
+    if codec_cls is None:
+        msg = (
+            f"Unknown JSON codec {codec!r}; expected one of: auto, {', '.join(_CODECS)}"
+        )
+        raise ValueError(msg)
+    try:
+        return codec_cls()
+    except ImportError as e:
+        msg = (
+            f"JSON codec {codec!r} is not installed. Install it with: {_FAST_JSON_HINT}"
+        )
+        raise ImportError(msg) from e
+
+
+__all__ = [
+    "STDLIB_JSON_CODEC",
+    "JSONCodec",
+    "JSONCodecName",
+    "MsgspecCodec",
+    "OrjsonCodec",
+    "StdlibJSONCodec",
+    "resolve_json_codec",
+]
@@ -0,0 +1,175 @@
+"""Incremental parsing of the ``data`` array in large list responses.
+
+``response.json()`` holds the whole body text and the whole decoded object
+graph at once, so a page of several thousand inventory movements or sales
+order rows costs tens of megabytes before the first item is looked at. This
+module splits a streamed body into the raw bytes of each array element as
+they arrive, and decodes them one at a time with the configured
+:mod:`~katana_public_api_client.json_codec`, so peak memory is bounded by one
+item (plus one network chunk) instead of one page::
+
+    async with http.stream("GET", "/inventory_movements", params=...) as r:
+        async for item in aiter_json_items(r.aiter_bytes()):
+            process(item)
+
+:meth:`KatanaClient.stream_items
+<katana_public_api_client.KatanaClient.stream_items>` wraps this for the
+generated list endpoints, page by page.
+
+The splitter is a small tokenizer that only tracks strings and bracket depth,
+matching whole strings and structural characters with one regular expression;
+the codec still validates each item, so a malformed element raises
+:class:`json.JSONDecodeError` as usual.
+"""
+
+import json
+import re
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+from .json_codec import JSONCodec, JSONCodecName, resolve_json_codec
+
+# One token per match: a structural character, a whole string, or — when a
+# string is cut off at the end of the buffer — its lone opening quote.
+_TOKEN = re.compile(rb'[\[\]{},]|"[^"\\]*(?:\\.[^"\\]*)*"|"', re.DOTALL)
+
+_QUOTE, _COMMA = ord('"'), ord(",")
+_OPENERS = frozenset(b"[{")
+_ARRAY_OPEN = ord("[")
+
+# Splitter states
+_SEEKING, _IN_ARRAY, _DONE = range(3)
+
+
+class JSONItemSplitter:
+    """Split a JSON document fed in chunks into the raw items of one array.
+
+    The array is the top-level value when the document is a bare list, or
+    the value of ``key`` in the top-level object (``{"data": [...]}``).
+    Only the item in progress is buffered; everything before it is dropped
+    as soon as it has been scanned.
+    """
+
+    def __init__(self, key: str = "data") -> None:
+        """Initialize the splitter.
+
+        Args:
+            key: Top-level object key holding the array. A bare top-level
+                array is split regardless.
+        """
+        self._key = json.dumps(key).encode()[1:-1]
+        self._buffer = bytearray()
+        self._pos = 0
+        self._state = _SEEKING
+        self._depth = 0
+        self._last_key = b""
+        self._array_depth = 0
+        self._item_start = 0
+
+    @property
+    def done(self) -> bool:
+        """Whether the array's closing bracket has been seen."""
+        return self._state == _DONE
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Consume ``chunk`` and return the items it completed, in order."""
+        if self._state == _DONE:
+            return []
+        buffer = self._buffer
+        buffer += chunk
+        items: list[bytes] = []
+        pos = len(buffer)
+        for match in _TOKEN.finditer(buffer, self._pos):
+            start = match.start()
+            char = buffer[start]
+            if char == _QUOTE:
+                if match.end() - start == 1:
+                    # String cut off by the chunk boundary: rescan it next time
+                    pos = start
+                    break
+                if self._state == _SEEKING and self._depth == 1:
+                    self._last_key = bytes(buffer[start + 1 : match.end() - 1])
+            elif char in _OPENERS:
+                self._depth += 1
+                if (
+                    self._state == _SEEKING
+                    and char == _ARRAY_OPEN
+                    and (
+                        self._depth == 1
+                        or (self._depth == 2 and self._last_key == self._key)
+                    )
+                ):
+                    self._state = _IN_ARRAY
+                    self._array_depth = self._depth
+                    self._item_start = match.end()
+            elif self._state == _IN_ARRAY and self._depth == self._array_depth:
+                # ``,`` or the array's closing ``]``
+                self._emit(buffer, start, items)
+                if char == _COMMA:
+                    self._item_start = match.end()
+                else:
+                    self._state = _DONE
+                    break
+            elif char != _COMMA:
+                self._depth -= 1
+
+        self._compact(pos)
+        return items
+
+    def close(self) -> None:
+        """Check the document ended outside the array.
+
+        Raises:
+            json.JSONDecodeError: If the input stopped partway through the
+                array.
+        """
+        if self._state == _IN_ARRAY:
+            msg = "Unterminated array"
+            raise json.JSONDecodeError(
+                msg, self._buffer.decode("utf-8", "replace"), self._pos
+            )
+
+    def _emit(self, buffer: bytearray, end: int, items: list[bytes]) -> None:
+        item = bytes(buffer[self._item_start : end]).strip()
+        if item:
+            items.append(item)
+
+    def _compact(self, pos: int) -> None:
+        """Drop scanned bytes that no longer matter."""
+        if self._state == _DONE:
+            self._buffer.clear()
+            self._pos = 0
+            return
+        keep = self._item_start if self._state == _IN_ARRAY else pos
+        if keep:
+            del self._buffer[:keep]
+            self._item_start -= keep
+        self._pos = pos - keep
+
+
+async def aiter_json_items(
+    chunks: AsyncIterable[bytes],
+    *,
+    key: str = "data",
+    json_codec: JSONCodec | JSONCodecName = "auto",
+) -> AsyncIterator[Any]:
+    """Decode the items of a streamed list response one at a time.
+
+    Args:
+        chunks: Body chunks, e.g. ``response.aiter_bytes()``.
+        key: Top-level key holding the array (a bare array also works).
+        json_codec: Codec (or backend name) used to decode each item.
+
+    Yields:
+        Each decoded array element, in order.
+
+    Raises:
+        json.JSONDecodeError: If an item is malformed or the body ends inside
+            the array.
+    """
+    codec = resolve_json_codec(json_codec)
+    splitter = JSONItemSplitter(key)
+    async for chunk in chunks:
+        for raw in splitter.feed(chunk):
+            yield codec.loads(raw)
+    splitter.close()
@@ -6,6 +6,8 @@ rate limiting, error handling, and pagination for all API calls without any
 decorators or wrapper methods needed.
 """
 
+from __future__ import annotations
+
 import asyncio
 import contextlib
 import json
@@ -13,53 +15,58 @@ import logging
 import netrc
 import os
 import time
-from collections.abc import Awaitable, Callable
+from collections import deque
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from contextvars import ContextVar
 from http import HTTPStatus
 from pathlib import Path
-from typing import Any, cast
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Literal, Self, cast
 from urllib.parse import parse_qs, quote, urlencode, urlparse, urlunparse
 
 import httpx
+from attrs import define
 from dotenv import load_dotenv
-from httpx import AsyncBaseTransport, AsyncHTTPTransport
+from httpx import USE_CLIENT_DEFAULT, AsyncBaseTransport, AsyncHTTPTransport
+from httpx._client import UseClientDefault
+from httpx._types import AuthTypes
 from httpx_retries import Retry, RetryTransport
 from pyrate_limiter import Duration, Limiter, Rate
 
 from ._logging import Logger
+from .adaptive_concurrency import AdaptiveConcurrencyTransport
 from .api_wrapper import ApiNamespace
 from .client import AuthenticatedClient
 from .client_types import Unset
+from .connection_profile import ConnectionProfile, ConnectionReuseTransport
 from .helpers.materials import Materials
 from .helpers.products import Products
 from .helpers.services import Services
 from .helpers.variants import Variants
-from .models.additional_properties_validation_error import (
-    AdditionalPropertiesValidationError,
-)
-from .models.const_validation_error import ConstValidationError
-from .models.dependencies_validation_error import DependenciesValidationError
-from .models.detailed_error_response import DetailedErrorResponse
-from .models.enum_validation_error import EnumValidationError
-from .models.error_response import ErrorResponse
-from .models.exclusive_maximum_validation_error import (
-    ExclusiveMaximumValidationError,
-)
-from .models.exclusive_minimum_validation_error import (
-    ExclusiveMinimumValidationError,
+from .json_codec import (
+    STDLIB_JSON_CODEC,
+    JSONCodec,
+    JSONCodecName,
+    resolve_json_codec,
 )
-from .models.format_validation_error import FormatValidationError
-from .models.max_items_validation_error import MaxItemsValidationError
-from .models.max_length_validation_error import MaxLengthValidationError
-from .models.maximum_validation_error import MaximumValidationError
-from .models.min_items_validation_error import MinItemsValidationError
-from .models.min_length_validation_error import MinLengthValidationError
-from .models.minimum_validation_error import MinimumValidationError
-from .models.multiple_of_validation_error import MultipleOfValidationError
-from .models.one_of_validation_error import OneOfValidationError
-from .models.pattern_validation_error import PatternValidationError
-from .models.required_validation_error import RequiredValidationError
-from .models.type_validation_error import TypeValidationError
-from .models.unique_items_validation_error import UniqueItemsValidationError
+from .utils import unwrap
+
+if TYPE_CHECKING:
+    from .bulk import BulkOperation, BulkProgress, BulkReport
+    from .coalescing import CoalescingTransport
+    from .decode_offload import DecodeOffloadTransport
+    from .http_cache import HttpCacheStore, HttpCacheTransport
+    from .metrics import ClientMetrics
+    from .models import DetailedErrorResponse, ErrorResponse
+    from .shared_rate_limit import SharedRateLimitState
 
 # Patterns used to identify sensitive query parameters and body fields in logs.
 # Values matching these patterns are redacted to prevent information disclosure.
@@ -194,7 +201,7 @@ class RateLimitAwareRetry(Retry):
         # Other retryable errors - only retry idempotent methods
         return self._current_method in self.IDEMPOTENT_METHODS
 
-    def increment(self) -> "RateLimitAwareRetry":
+    def increment(self) -> RateLimitAwareRetry:
         """Return a new retry instance with the attempt count incremented."""
         # Call parent's increment which creates a new instance of our class
         new_retry = cast(RateLimitAwareRetry, super().increment())
@@ -269,6 +276,8 @@ class ErrorLoggingTransport(AsyncBaseTransport):
         self,
         wrapped_transport: AsyncBaseTransport | None = None,
         logger: Logger | None = None,
+        *,
+        json_codec: JSONCodec = STDLIB_JSON_CODEC,
         **kwargs: Any,
     ):
         """
@@ -277,12 +286,16 @@ class ErrorLoggingTransport(AsyncBaseTransport):
         Args:
             wrapped_transport: The transport to wrap. If None, creates a new AsyncHTTPTransport.
             logger: Logger instance for capturing error details. If None, creates a default logger.
+            json_codec: Codec used to decode request bodies for error context.
+                Response bodies are decoded via ``response.json()``, which
+                ``JSONCodecTransport`` routes through the same codec.
             **kwargs: Additional arguments passed to AsyncHTTPTransport if wrapped_transport is None.
         """
         if wrapped_transport is None:
             wrapped_transport = AsyncHTTPTransport(**kwargs)
         self._wrapped_transport = wrapped_transport
         self.logger: Logger = logger or logging.getLogger(__name__)
+        self.json_codec = json_codec
 
     async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
         """Handle request and log detailed error information for 4xx responses."""
@@ -315,7 +328,7 @@ class ErrorLoggingTransport(AsyncBaseTransport):
             with contextlib.suppress(
                 json.JSONDecodeError, UnicodeDecodeError, AttributeError, TypeError
             ):
-                request_body = json.loads(request.content.decode("utf-8"))
+                request_body = self.json_codec.loads(request.content)
 
         # Read response content if it's streaming
         if hasattr(response, "aread"):
@@ -331,6 +344,8 @@ class ErrorLoggingTransport(AsyncBaseTransport):
             )
             return
 
+        from .models import DetailedErrorResponse, ErrorResponse
+
         # Prefer DetailedErrorResponse for 422, else ErrorResponse
         if status_code == 422:
             # Try parsing directly, then try unwrapping nested 'error' key
@@ -385,6 +400,27 @@ class ErrorLoggingTransport(AsyncBaseTransport):
         request_body: dict[str, Any] | None = None,
     ) -> None:
         """Log detailed errors using the typed DetailedErrorResponse model."""
+        from .models import (
+            AdditionalPropertiesValidationError,
+            ConstValidationError,
+            DependenciesValidationError,
+            EnumValidationError,
+            ExclusiveMaximumValidationError,
+            ExclusiveMinimumValidationError,
+            FormatValidationError,
+            MaximumValidationError,
+            MaxItemsValidationError,
+            MaxLengthValidationError,
+            MinimumValidationError,
+            MinItemsValidationError,
+            MinLengthValidationError,
+            MultipleOfValidationError,
+            OneOfValidationError,
+            PatternValidationError,
+            RequiredValidationError,
+            TypeValidationError,
+            UniqueItemsValidationError,
+        )
 
         # Use the log prefix expected by tests for 422 errors
         if status_code == 422:
@@ -624,6 +660,349 @@ class ErrorLoggingTransport(AsyncBaseTransport):
         self.logger.error(log_message)
 
 
+def _normalize_pagination_values(
+    pagination_info: dict[str, Any], logger: Logger
+) -> dict[str, Any]:
+    """Convert pagination values from strings to appropriate Python types.
+
+    JSON parsing may return numeric values as strings (e.g., "41" instead of 41).
+    String comparison produces incorrect results: "5" >= "41" is True because
+    "5" > "4" lexicographically. This function ensures all numeric pagination
+    fields are proper integers for correct comparisons.
+
+    Additionally, boolean fields like first_page and last_page may come as
+    string values ("true"/"false") and are converted to Python booleans.
+
+    Args:
+        pagination_info: Dictionary containing pagination metadata.
+
+    Returns:
+        Dictionary with numeric fields converted to integers and boolean
+        fields converted to booleans.
+    """
+    # Fields that should be integers for pagination comparisons
+    numeric_fields = [
+        "page",
+        "total_pages",
+        "total_items",
+        "limit",
+        "offset",
+        "count",
+        "per_page",
+        "current_page",
+        "total_records",
+    ]
+
+    # Fields that should be booleans (API returns "true"/"false" strings)
+    boolean_fields = [
+        "first_page",
+        "last_page",
+    ]
+
+    result = pagination_info.copy()
+
+    # Convert numeric fields
+    for field in numeric_fields:
+        if field in result:
+            value = result[field]
+            # Convert string numbers to integers
+            if isinstance(value, str):
+                try:
+                    result[field] = int(value)
+                except ValueError:
+                    logger.warning(
+                        "Invalid pagination value for %s: %r, removing field",
+                        field,
+                        value,
+                    )
+                    # Remove invalid field so fallback values are used
+                    del result[field]
+            # Already an int or float - ensure it's int
+            elif isinstance(value, float):
+                # Warn if float has a fractional part (unexpected for pagination)
+                if value != int(value):
+                    logger.warning(
+                        "Pagination value %s has fractional part: %r, truncating to %d",
+                        field,
+                        value,
+                        int(value),
+                    )
+                result[field] = int(value)
+            # If it's already an int, leave it as is
+
+    # Convert boolean fields ("true"/"false" strings to Python booleans)
+    for field in boolean_fields:
+        if field in result:
+            value = result[field]
+            if isinstance(value, str):
+                lower_value = value.lower()
+                if lower_value == "true":
+                    result[field] = True
+                elif lower_value == "false":
+                    result[field] = False
+                else:
+                    logger.warning(
+                        "Invalid boolean pagination value for %s: %r, removing field",
+                        field,
+                        value,
+                    )
+                    del result[field]
+            elif not isinstance(value, bool):
+                # Unexpected type - convert truthy/falsy to bool
+                result[field] = bool(value)
+
+    return result
+
+
+# ``httpx.Response.extensions`` key holding an already-decoded JSON payload:
+# set by ``PaginationTransport`` on the responses it synthesizes and by
+# ``DecodeOffloadTransport`` on bodies it decoded in a worker.
+DECODED_JSON_EXTENSION = "katana_decoded_json"
+
+
+class _CodecJSONResponse(httpx.Response):
+    """``httpx.Response`` whose ``json()`` decodes with a configured ``JSONCodec``.
+
+    ``JSONCodecTransport`` re-wraps every response coming off the wire in this
+    class, so the transport layers above it and the generated
+    ``_parse_response`` helpers (which all call ``response.json()``) decode
+    through the client's codec without any change to generated code.
+    """
+
+    json_codec: JSONCodec = STDLIB_JSON_CODEC
+
+    @classmethod
+    def wrap(
+        cls, response: httpx.Response, request: httpx.Request, json_codec: JSONCodec
+    ) -> _CodecJSONResponse:
+        """Re-wrap an unread transport ``response`` around the same stream."""
+        if isinstance(response, _CodecJSONResponse):
+            response.json_codec = json_codec
+            return response
+        wrapped = cls(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=response.stream,
+            request=request,
+            extensions=response.extensions,
+        )
+        wrapped.json_codec = json_codec
+        return wrapped
+
+    def json(self, **kwargs: Any) -> Any:
+        """Decode the body with the configured codec (``kwargs`` force the stdlib).
+
+        A payload already decoded elsewhere — stitched by ``PaginationTransport``
+        or decoded off the event loop by ``DecodeOffloadTransport`` — is kept
+        in ``extensions[DECODED_JSON_EXTENSION]`` and returned as-is.
+        """
+        if kwargs:
+            return super().json(**kwargs)
+        if DECODED_JSON_EXTENSION in self.extensions:
+            return self.extensions[DECODED_JSON_EXTENSION]
+        return self.json_codec.loads(self.content)
+
+
+class _DeferredJSONStream(httpx.AsyncByteStream, httpx.SyncByteStream):
+    """Body stream of a ``_DecodedJSONResponse``: encodes only when iterated."""
+
+    def __init__(self, payload: Any, json_codec: JSONCodec) -> None:
+        self._payload = payload
+        self._json_codec = json_codec
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self._json_codec.dumps(self._payload)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._json_codec.dumps(self._payload)
+
+
+class _DecodedJSONResponse(_CodecJSONResponse):
+    """``httpx.Response`` synthesized from a JSON payload that is already decoded.
+
+    ``PaginationTransport`` has to decode every page to stitch the ``data``
+    arrays together. A plain ``httpx.Response`` built from the stitched body
+    would make the generated ``_parse_response`` (which calls
+    ``response.json()``) decode the whole collection a second time. This
+    subclass keeps the payload in ``extensions[DECODED_JSON_EXTENSION]`` and
+    returns it from ``json()`` as-is, so each page is decoded exactly once.
+
+    The body bytes are encoded only when ``content``, ``read()`` or the
+    stream is used. ``KatanaClient``'s httpx client does not read these
+    bodies, and the generated ``Response.content`` defers to this response
+    until it is accessed, so ``asyncio_detailed`` never encodes them.
+    ``size_hint`` carries the summed size of the pages the payload came
+    from. Callers of ``json()`` share the payload object — the generated
+    ``from_dict`` parsers copy before mutating, and so should any other
+    consumer.
+    """
+
+    size_hint: int | None = None
+
+    @classmethod
+    def from_payload(
+        cls,
+        payload: Any,
+        source: httpx.Response,
+        request: httpx.Request,
+        json_codec: JSONCodec = STDLIB_JSON_CODEC,
+        size_hint: int | None = None,
+    ) -> _DecodedJSONResponse:
+        """Build a 200 response for ``payload`` reusing ``source``'s headers."""
+        # The body is re-encoded, so the source's encoding/length no longer apply
+        headers = dict(source.headers)
+        headers.pop("content-encoding", None)
+        headers.pop("content-length", None)
+        response = cls(
+            status_code=200,
+            headers=headers,
+            stream=_DeferredJSONStream(payload, json_codec),
+            request=request,
+            extensions={DECODED_JSON_EXTENSION: payload},
+        )
+        response.json_codec = json_codec
+        response.size_hint = size_hint
+        return response
+
+    @property
+    def content_deferred(self) -> bool:
+        """Whether the body bytes have not been encoded yet."""
+        return not hasattr(self, "_content")
+
+    @property
+    def content(self) -> bytes:
+        """The payload encoded with the response's codec, on first access."""
+        if not hasattr(self, "_content"):
+            self._content = self.json_codec.dumps(
+                self.extensions[DECODED_JSON_EXTENSION]
+            )
+        return self._content
+
+    def read(self) -> bytes:
+        """Return ``content``; there is nothing to read off the wire."""
+        return self.content
+
+    async def aread(self) -> bytes:
+        """Return ``content``; there is nothing to read off the wire."""
+        return self.content
+
+    def copy_for(self, request: httpx.Request) -> _DecodedJSONResponse:
+        """Return a response over the same payload, for ``request``."""
+        copy = _DecodedJSONResponse.from_payload(
+            self.extensions[DECODED_JSON_EXTENSION],
+            self,
+            request,
+            self.json_codec,
+            self.size_hint,
+        )
+        copy.extensions = dict(self.extensions)
+        return copy
+
+
+def _is_deferred(response: httpx.Response) -> bool:
+    """Whether ``response`` is a stitched collection not encoded to bytes yet."""
+    return isinstance(response, _DecodedJSONResponse) and response.content_deferred
+
+
+def _extract_pagination_info(
+    headers: Mapping[str, str],
+    data: dict[str, Any],
+    logger: Logger,
+    json_codec: JSONCodec = STDLIB_JSON_CODEC,
+) -> dict[str, Any] | None:
+    """Extract pagination information from response headers or body.
+
+    Shared by ``PaginationTransport`` (auto-pagination) and
+    ``KatanaClient.paginate`` (streaming pagination) so both stop on the
+    same signals.
+
+    Note:
+        All numeric pagination values (page, total_pages, total_items, etc.)
+        are converted to integers to ensure correct comparisons. This is important
+        because JSON parsing may return string values, and string comparison
+        (e.g., "5" >= "41") produces incorrect results.
+    """
+    pagination_info: dict[str, Any] = {}
+
+    # Check for X-Pagination header (JSON format)
+    if "X-Pagination" in headers:
+        try:
+            header_data = json_codec.loads(headers["X-Pagination"])
+            # Validate that parsed JSON is a dictionary
+            if not isinstance(header_data, dict):
+                logger.warning(
+                    "X-Pagination header is not a JSON object: %r", header_data
+                )
+            else:
+                # Convert numeric string values to integers to avoid string comparison bugs
+                # (e.g., "5" >= "41" is True in string comparison but should be False)
+                pagination_info = _normalize_pagination_values(header_data, logger)
+                # Only return early if we got valid pagination data
+                if pagination_info:
+                    return pagination_info
+        except json.JSONDecodeError:
+            pass
+
+    # Check for individual headers (with validation for malformed values)
+    if "X-Total-Pages" in headers:
+        try:
+            pagination_info["total_pages"] = int(headers["X-Total-Pages"])
+        except ValueError:
+            logger.warning(
+                "Invalid X-Total-Pages header value: %s",
+                headers["X-Total-Pages"],
+            )
+    if "X-Current-Page" in headers:
+        try:
+            pagination_info["page"] = int(headers["X-Current-Page"])
+        except ValueError:
+            logger.warning(
+                "Invalid X-Current-Page header value: %s",
+                headers["X-Current-Page"],
+            )
+
+    # Check for pagination in response body
+    if "pagination" in data:
+        page_data = data["pagination"]
+        if isinstance(page_data, dict):
+            # page_data is dict from JSON response; iterate to build typed dict
+            pagination_info.update({str(k): v for k, v in page_data.items()})
+    elif (
+        "meta" in data
+        and isinstance(data["meta"], dict)
+        and "pagination" in data["meta"]
+    ):
+        meta_pagination = data["meta"]["pagination"]
+        if isinstance(meta_pagination, dict):
+            pagination_info.update({str(k): v for k, v in meta_pagination.items()})
+
+    # Normalize all numeric values to ensure correct comparisons
+    if pagination_info:
+        pagination_info = _normalize_pagination_values(pagination_info, logger)
+
+    return pagination_info if pagination_info else None
+
+
+def _should_auto_paginate(request: httpx.Request) -> bool:
+    """Whether ``PaginationTransport`` will auto-paginate ``request``.
+
+    Only GET requests without an explicit ``page`` query parameter and
+    without ``extensions={"auto_pagination": False}`` are paginated.
+    """
+    return (
+        request.method == "GET"
+        and request.extensions.get("auto_pagination", True)
+        and "page" not in request.url.params
+    )
+
+
+def _retry_attempts(response: httpx.Response) -> int:
+    """Retry attempts recorded on ``response`` by a retry loop (0 if none ran)."""
+    # ``getattr``: spec'd response mocks in tests don't carry ``extensions``
+    retry = getattr(response, "extensions", {}).get("retry")
+    return retry.attempts_made if isinstance(retry, Retry) else 0
+
+
 class PaginationTransport(AsyncBaseTransport):
     """
     Transport layer that adds automatic pagination for GET requests.
@@ -645,6 +1024,21 @@ class PaginationTransport(AsyncBaseTransport):
     - `max_pages` (constructor): Maximum number of pages to fetch
     - `max_items` (extension): Maximum total items to collect, e.g.,
       `extensions={"max_items": 200}` stops after 200 items
+
+    Concurrent prefetch:
+    - `concurrency` (constructor): When ``> 1``, page 1 is fetched alone to
+      learn ``total_pages``; pages 2..N are then issued in parallel with at
+      most ``concurrency`` requests in flight and reassembled in page order.
+      Every page still travels through the wrapped chain, so the rate
+      limiter below this layer charges one token per page.
+
+    Per-page retry:
+    - `retry` (constructor): When set, each page request is retried in place
+      with that policy's backoff and ``Retry-After`` handling (a
+      ``Retry`` passed via ``extensions={"retry": ...}`` takes precedence).
+      A 503 on page 37 then re-fetches page 37 only, instead of failing the
+      whole collection. The number of pages that needed a retry is reported
+      as ``resumed_pages`` in the combined pagination metadata.
     """
 
     def __init__(
@@ -652,6 +1046,11 @@ class PaginationTransport(AsyncBaseTransport):
         wrapped_transport: AsyncBaseTransport | None = None,
         max_pages: int = 100,
         logger: Logger | None = None,
+        *,
+        concurrency: int = 1,
+        json_codec: JSONCodec = STDLIB_JSON_CODEC,
+        retry: Retry | None = None,
+        metrics: ClientMetrics | None = None,
         **kwargs: Any,
     ):
         """
@@ -661,13 +1060,31 @@ class PaginationTransport(AsyncBaseTransport):
             wrapped_transport: The transport to wrap. If None, creates a new AsyncHTTPTransport.
             max_pages: Maximum number of pages to collect during auto-pagination. Defaults to 100.
             logger: Logger instance for capturing pagination operations. If None, creates a default logger.
+            concurrency: Maximum number of page requests in flight once the
+                first page has revealed ``total_pages``. Defaults to 1
+                (strictly sequential, the historical behavior).
+            json_codec: Codec used to parse ``X-Pagination`` headers and to
+                encode the combined response body.
+            retry: Retry policy applied to each page request individually, so
+                a failed page is retried and pagination resumes from it.
+                Defaults to None (a failed page ends pagination and its
+                response is returned).
+            metrics: Registry that receives the page count of each
+                auto-paginated collection. ``None`` records nothing.
             **kwargs: Additional arguments passed to AsyncHTTPTransport if wrapped_transport is None.
         """
+        if concurrency < 1:
+            msg = f"concurrency must be at least 1, got {concurrency}"
+            raise ValueError(msg)
         if wrapped_transport is None:
             wrapped_transport = AsyncHTTPTransport(**kwargs)
 
         self._wrapped_transport = wrapped_transport
         self.max_pages = max_pages
+        self.concurrency = concurrency
+        self.json_codec = json_codec
+        self.retry = retry
+        self.metrics = metrics
         self.logger: Logger = logger or logging.getLogger(__name__)
 
     async def aclose(self) -> None:
@@ -685,18 +1102,7 @@ class PaginationTransport(AsyncBaseTransport):
         will automatically use 250 items per page (Katana's max) unless you specify
         a limit, in which case your limit will be respected.
         """
-        # Check if auto-pagination is explicitly disabled via request extensions
-        auto_pagination = request.extensions.get("auto_pagination", True)
-
-        # ANY page param in URL disables auto-pagination - caller wants specific page
-        has_explicit_page = "page" in request.url.params
-
-        # Only paginate GET requests when auto_pagination is enabled and no explicit page
-        should_paginate = (
-            request.method == "GET" and auto_pagination and not has_explicit_page
-        )
-
-        if should_paginate:
+        if _should_auto_paginate(request):
             return await self._handle_paginated_request(request)
         else:
             # For non-paginated requests, just pass through to wrapped transport
@@ -730,6 +1136,11 @@ class PaginationTransport(AsyncBaseTransport):
         page_num = 1
         response: httpx.Response | None = None
         original_is_raw_list = False
+        # Pages collected by the concurrent prefetch after page 1
+        prefetched_pages = 0
+        # Pages that failed at least once and were retried in place
+        resumed_pages = 0
+        body_bytes = 0
 
         # Get max_items limit from extensions (None = unlimited)
         max_items: int | None = request.extensions.get("max_items")
@@ -771,26 +1182,12 @@ class PaginationTransport(AsyncBaseTransport):
             else:
                 current_limit = str(page_size)
 
-            # Build params with updated page/limit, preserving all multi-value params
-            url_params = [
-                *base_params,
-                ("page", str(page_num)),
-                ("limit", current_limit),
-            ]
-
-            # Create a new request with updated parameters
-            paginated_request = httpx.Request(
-                method=request.method,
-                url=request.url.copy_with(params=url_params),
-                headers=request.headers,
-                content=request.content,
-                extensions=request.extensions,
-            )
-
             # Make the request using the wrapped transport
-            response = await self._wrapped_transport.handle_async_request(
-                paginated_request
+            response = await self._send_page(
+                self._build_page_request(request, base_params, page_num, current_limit)
             )
+            if _retry_attempts(response):
+                resumed_pages += 1
 
             if response.status_code != 200:
                 # If we get an error, return the original response
@@ -805,13 +1202,16 @@ class PaginationTransport(AsyncBaseTransport):
                         await response.aread()
 
                 data = response.json()
+                body_bytes += _known_body_size(response) or 0
 
                 # Track original response format on first page
                 if page_num == 1:
                     original_is_raw_list = isinstance(data, list)
 
                 # Extract pagination info from headers or response body
-                pagination_info = self._extract_pagination_info(response, data)
+                pagination_info = _extract_pagination_info(
+                    response.headers, data, self.logger, self.json_codec
+                )
 
                 if pagination_info:
                     current_page = pagination_info.get("page", page_num)
@@ -845,6 +1245,28 @@ class PaginationTransport(AsyncBaseTransport):
                         len(items),
                         len(all_data),
                     )
+
+                    # Once page 1 reveals the page count, fan the rest out
+                    # concurrently instead of walking them one by one.
+                    if page_num == 1 and self.concurrency > 1 and total_pages:
+                        last_page = min(total_pages, self.max_pages)
+                        if max_items is not None:
+                            last_page = min(last_page, -(-max_items // page_size))
+                        pages, error_response = await self._fetch_pages_concurrently(
+                            request, base_params, range(2, last_page + 1), page_size
+                        )
+                        if error_response is not None:
+                            return error_response
+                        for page_items, page_response in pages:
+                            all_data.extend(page_items)
+                            response = page_response
+                            body_bytes += _known_body_size(page_response) or 0
+                            if _retry_attempts(page_response):
+                                resumed_pages += 1
+                        prefetched_pages = len(pages)
+                        if max_items is not None and len(all_data) > max_items:
+                            all_data = all_data[:max_items]
+                        break
                 else:
                     # No pagination info - return response preserving its shape
                     self.logger.info(
@@ -853,29 +1275,19 @@ class PaginationTransport(AsyncBaseTransport):
                     # Apply max_items truncation if set
                     if max_items is not None:
                         if isinstance(data, list) and len(data) > max_items:
-                            truncated = json.dumps(data[:max_items]).encode()
-                            headers = dict(response.headers)
-                            headers.pop("content-encoding", None)
-                            headers.pop("content-length", None)
-                            return httpx.Response(
-                                status_code=200,
-                                headers=headers,
-                                content=truncated,
-                                request=request,
+                            return _DecodedJSONResponse.from_payload(
+                                data[:max_items],
+                                response,
+                                request,
+                                self.json_codec,
+                                body_bytes,
                             )
                         if isinstance(data, dict) and "data" in data:
                             items = data["data"]
                             if isinstance(items, list) and len(items) > max_items:
                                 data["data"] = items[:max_items]
-                                truncated = json.dumps(data).encode()
-                                headers = dict(response.headers)
-                                headers.pop("content-encoding", None)
-                                headers.pop("content-length", None)
-                                return httpx.Response(
-                                    status_code=200,
-                                    headers=headers,
-                                    content=truncated,
-                                    request=request,
+                                return _DecodedJSONResponse.from_payload(
+                                    data, response, request, self.json_codec, body_bytes
                                 )
                     return response
 
@@ -888,216 +1300,327 @@ class PaginationTransport(AsyncBaseTransport):
             msg = "No response available after pagination"
             raise RuntimeError(msg)
 
+        collected_pages = page_num + prefetched_pages
+        if self.metrics is not None:
+            from .metrics import endpoint_template
+
+            self.metrics.observe_pagination(
+                request.method, endpoint_template(request.url.path), collected_pages
+            )
+
         # Create a combined response, preserving the original response shape
+        combined_payload: list[Any] | dict[str, Any]
         if original_is_raw_list:
             # Original endpoint returned a raw JSON list - preserve that format
-            combined_content = json.dumps(all_data).encode()
+            combined_payload = all_data
         else:
             combined_data: dict[str, Any] = {"data": all_data}
             # Add pagination metadata
             if total_pages:
                 combined_data["pagination"] = {
                     "total_pages": total_pages,
-                    "collected_pages": page_num,
+                    "collected_pages": collected_pages,
                     "total_items": len(all_data),
                     "auto_paginated": True,
                 }
-            combined_content = json.dumps(combined_data).encode()
+                if self.retry is not None:
+                    combined_data["pagination"]["resumed_pages"] = resumed_pages
+            combined_payload = combined_data
 
-        # Remove content-encoding headers to avoid compression issues
-        headers = dict(response.headers)
-        headers.pop("content-encoding", None)
-        headers.pop("content-length", None)  # Will be recalculated
-
-        combined_response = httpx.Response(
-            status_code=200,
-            headers=headers,
-            content=combined_content,
-            request=request,
+        # Carry the already-decoded payload so parsers don't decode it again
+        combined_response = _DecodedJSONResponse.from_payload(
+            combined_payload, response, request, self.json_codec, body_bytes
         )
 
         self.logger.info(
             "Auto-pagination complete: collected %d items from %d pages",
             len(all_data),
-            page_num,
+            collected_pages,
         )
 
         return combined_response
 
-    def _normalize_pagination_values(
-        self, pagination_info: dict[str, Any]
-    ) -> dict[str, Any]:
-        """Convert pagination values from strings to appropriate Python types.
-
-        JSON parsing may return numeric values as strings (e.g., "41" instead of 41).
-        String comparison produces incorrect results: "5" >= "41" is True because
-        "5" > "4" lexicographically. This method ensures all numeric pagination
-        fields are proper integers for correct comparisons.
-
-        Additionally, boolean fields like first_page and last_page may come as
-        string values ("true"/"false") and are converted to Python booleans.
-
-        Args:
-            pagination_info: Dictionary containing pagination metadata.
-
-        Returns:
-            Dictionary with numeric fields converted to integers and boolean
-            fields converted to booleans.
-        """
-        # Fields that should be integers for pagination comparisons
-        numeric_fields = [
-            "page",
-            "total_pages",
-            "total_items",
-            "limit",
-            "offset",
-            "count",
-            "per_page",
-            "current_page",
-            "total_records",
-        ]
-
-        # Fields that should be booleans (API returns "true"/"false" strings)
-        boolean_fields = [
-            "first_page",
-            "last_page",
-        ]
-
-        result = pagination_info.copy()
-
-        # Convert numeric fields
-        for field in numeric_fields:
-            if field in result:
-                value = result[field]
-                # Convert string numbers to integers
-                if isinstance(value, str):
-                    try:
-                        result[field] = int(value)
-                    except ValueError:
-                        self.logger.warning(
-                            "Invalid pagination value for %s: %r, removing field",
-                            field,
-                            value,
-                        )
-                        # Remove invalid field so fallback values are used
-                        del result[field]
-                # Already an int or float - ensure it's int
-                elif isinstance(value, float):
-                    # Warn if float has a fractional part (unexpected for pagination)
-                    if value != int(value):
-                        self.logger.warning(
-                            "Pagination value %s has fractional part: %r, truncating to %d",
-                            field,
-                            value,
-                            int(value),
-                        )
-                    result[field] = int(value)
-                # If it's already an int, leave it as is
-
-        # Convert boolean fields ("true"/"false" strings to Python booleans)
-        for field in boolean_fields:
-            if field in result:
-                value = result[field]
-                if isinstance(value, str):
-                    lower_value = value.lower()
-                    if lower_value == "true":
-                        result[field] = True
-                    elif lower_value == "false":
-                        result[field] = False
-                    else:
-                        self.logger.warning(
-                            "Invalid boolean pagination value for %s: %r, removing field",
-                            field,
-                            value,
-                        )
-                        del result[field]
-                elif not isinstance(value, bool):
-                    # Unexpected type - convert truthy/falsy to bool
-                    result[field] = bool(value)
-
-        return result
+    def _build_page_request(
+        self,
+        request: httpx.Request,
+        base_params: list[tuple[str, str]],
+        page_num: int,
+        limit: str,
+    ) -> httpx.Request:
+        """Clone ``request`` for a single page, preserving multi-value params."""
+        url_params = [*base_params, ("page", str(page_num)), ("limit", limit)]
+        return httpx.Request(
+            method=request.method,
+            url=request.url.copy_with(params=url_params),
+            headers=request.headers,
+            content=request.content,
+            extensions=request.extensions,
+        )
 
-    def _extract_pagination_info(
-        self, response: httpx.Response, data: dict[str, Any]
-    ) -> dict[str, Any] | None:
-        """Extract pagination information from response headers or body.
+    async def _send_page(self, page_request: httpx.Request) -> httpx.Response:
+        """Send one page request, retrying it in place under the retry policy.
 
-        Note:
-            All numeric pagination values (page, total_pages, total_items, etc.)
-            are converted to integers to ensure correct comparisons. This is important
-            because JSON parsing may return string values, and string comparison
-            (e.g., "5" >= "41") produces incorrect results.
+        Mirrors ``RetryTransport``'s loop — retryable status codes and
+        exceptions are retried with the policy's backoff / ``Retry-After``
+        sleep until it is exhausted — but scoped to a single page, so pages
+        that already succeeded are never fetched again. The final ``Retry``
+        is attached as ``response.extensions["retry"]``, as ``RetryTransport``
+        does.
         """
-        pagination_info: dict[str, Any] = {}
-
-        # Check for X-Pagination header (JSON format)
-        if "X-Pagination" in response.headers:
-            try:
-                header_data = json.loads(response.headers["X-Pagination"])
-                # Validate that parsed JSON is a dictionary
-                if not isinstance(header_data, dict):
-                    self.logger.warning(
-                        "X-Pagination header is not a JSON object: %r", header_data
-                    )
-                else:
-                    # Convert numeric string values to integers to avoid string comparison bugs
-                    # (e.g., "5" >= "41" is True in string comparison but should be False)
-                    pagination_info = self._normalize_pagination_values(header_data)
-                    # Only return early if we got valid pagination data
-                    if pagination_info:
-                        return pagination_info
-            except json.JSONDecodeError:
-                pass
-
-        # Check for individual headers (with validation for malformed values)
-        if "X-Total-Pages" in response.headers:
-            try:
-                pagination_info["total_pages"] = int(response.headers["X-Total-Pages"])
-            except ValueError:
-                self.logger.warning(
-                    "Invalid X-Total-Pages header value: %s",
-                    response.headers["X-Total-Pages"],
+        retry: Retry | None = page_request.extensions.get("retry", self.retry)
+        if retry is None or not retry.is_retryable_method(page_request.method):
+            return await self._wrapped_transport.handle_async_request(page_request)
+
+        previous: httpx.Response | Exception | None = None
+        while True:
+            if previous is not None:
+                if isinstance(previous, httpx.Response):
+                    await previous.aclose()
+                retry = retry.increment()
+                self.logger.info(
+                    "Retrying page %s (attempt %d/%d) after %s",
+                    page_request.url.params.get("page"),
+                    retry.attempts_made,
+                    retry.total,
+                    previous.status_code
+                    if isinstance(previous, httpx.Response)
+                    else type(previous).__name__,
                 )
-        if "X-Current-Page" in response.headers:
+                await retry.asleep(previous)
             try:
-                pagination_info["page"] = int(response.headers["X-Current-Page"])
-            except ValueError:
-                self.logger.warning(
-                    "Invalid X-Current-Page header value: %s",
-                    response.headers["X-Current-Page"],
+                response = await self._wrapped_transport.handle_async_request(
+                    page_request
                 )
+            except Exception as e:
+                if retry.is_exhausted() or not retry.is_retryable_exception(e):
+                    raise
+                previous = e
+                continue
+
+            if retry.is_exhausted() or not retry.is_retryable_status_code(
+                response.status_code
+            ):
+                response.extensions["retry"] = retry
+                return response
+            previous = response
 
-        # Check for pagination in response body
-        if "pagination" in data:
-            page_data = data["pagination"]
-            if isinstance(page_data, dict):
-                # page_data is dict from JSON response; iterate to build typed dict
-                pagination_info.update({str(k): v for k, v in page_data.items()})
-        elif (
-            "meta" in data
-            and isinstance(data["meta"], dict)
-            and "pagination" in data["meta"]
-        ):
-            meta_pagination = data["meta"]["pagination"]
-            if isinstance(meta_pagination, dict):
-                pagination_info.update({str(k): v for k, v in meta_pagination.items()})
+    async def _fetch_pages_concurrently(
+        self,
+        request: httpx.Request,
+        base_params: list[tuple[str, str]],
+        page_numbers: range,
+        page_size: int,
+    ) -> tuple[list[tuple[list[Any], httpx.Response]], httpx.Response | None]:
+        """Fetch ``page_numbers`` with bounded concurrency, preserving page order.
+
+        At most ``self.concurrency`` page requests are in flight at once. The
+        first non-200 page stops any not-yet-started pages
+        from being issued; in-flight pages are allowed to finish so their
+        responses are fully read before being discarded.
 
-        # Normalize all numeric values to ensure correct comparisons
-        if pagination_info:
-            pagination_info = self._normalize_pagination_values(pagination_info)
+        Returns:
+            ``(pages, error_response)`` — ``pages`` is a list of
+            ``(items, response)`` tuples in page order; ``error_response`` is
+            the lowest-numbered failing page's response, or ``None`` when
+            every page succeeded.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        failed = asyncio.Event()
+        limit = str(page_size)
+
+        async def fetch(page_num: int) -> httpx.Response | None:
+            async with semaphore:
+                if failed.is_set():
+                    return None
+                response = await self._send_page(
+                    self._build_page_request(request, base_params, page_num, limit)
+                )
+                if hasattr(response, "aread"):
+                    with contextlib.suppress(TypeError, AttributeError):
+                        await response.aread()
+                if response.status_code != 200:
+                    failed.set()
+                return response
 
-        return pagination_info if pagination_info else None
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [
+                    group.create_task(fetch(page_num)) for page_num in page_numbers
+                ]
+        except ExceptionGroup as group_error:
+            # Surface the page's own error (e.g. ``httpx.ConnectError``) so
+            # callers and the retry layer see it as with sequential paging
+            raise group_error.exceptions[0] from None
+
+        pages: list[tuple[list[Any], httpx.Response]] = []
+        for task in tasks:
+            response = task.result()
+            if response is None:
+                # Skipped because a page failed; that page is reported below.
+                continue
+            if response.status_code != 200:
+                return pages, response
+            try:
+                data = response.json()
+            except json.JSONDecodeError as e:
+                self.logger.warning("Failed to parse paginated response: %s", e)
+                return pages, response
+            items = data if isinstance(data, list) else data.get("data", [])
+            pages.append((items, response))
+
+        self.logger.debug(
+            "Concurrently collected %d pages (concurrency=%d)",
+            len(pages),
+            self.concurrency,
+        )
+        return pages, None
 
 
 # Bucket identifier for pyrate's per-name limiter. We have a single global
 # budget, so all requests share one bucket name.
 _RATE_LIMIT_BUCKET_NAME = "katana"
 
+# How long a shared-state acquirer waits between bucket attempts. Matches the
+# limiter's ``buffer_ms``.
+_SHARED_BUCKET_RETRY_SECONDS = 0.05
+
 # Spec-documented response headers we observe — see
 # ``docs/katana-openapi.yaml`` (``X-Pagination`` siblings under ``components/headers``).
 _HEADER_REMAINING = "X-Ratelimit-Remaining"
 _HEADER_RESET = "X-Ratelimit-Reset"
 
+RequestPriority = Literal["interactive", "bulk"]
+_REQUEST_PRIORITIES: tuple[RequestPriority, ...] = ("interactive", "bulk")
+
+# Per-request override: ``httpx.Request(..., extensions={"priority": "bulk"})``
+_PRIORITY_EXTENSION = "priority"
+
+# Priority for requests without the extension. A ``ContextVar`` so that
+# ``request_priority()`` reaches requests made deep inside generated endpoint
+# functions, and is inherited by tasks spawned inside the block.
+_REQUEST_PRIORITY: ContextVar[RequestPriority] = ContextVar(
+    "katana_request_priority", default="interactive"
+)
+
+
+@contextlib.contextmanager
+def request_priority(priority: RequestPriority) -> Iterator[None]:
+    """Tag every request made in this block with a rate-limit ``priority``.
+
+    ``RateLimitTransport`` dispatches ``"interactive"`` requests (the default)
+    ahead of queued ``"bulk"`` ones, and never lets bulk traffic spend the
+    budget share reserved for interactive calls. Tasks created inside the
+    block inherit the priority.
+
+    Example:
+        ```python
+        with request_priority("bulk"):
+            warmup = asyncio.create_task(sync_everything(client))
+        ```
+    """
+    _validate_request_priority(priority)
+    token = _REQUEST_PRIORITY.set(priority)
+    try:
+        yield
+    finally:
+        _REQUEST_PRIORITY.reset(token)
+
+
+def _validate_request_priority(priority: object) -> RequestPriority:
+    if priority not in _REQUEST_PRIORITIES:
+        msg = (
+            f"Unknown request priority {priority!r}; "
+            f"expected one of: {', '.join(_REQUEST_PRIORITIES)}"
+        )
+        raise ValueError(msg)
+    return cast(RequestPriority, priority)
+
+
+def _resolve_request_priority(request: httpx.Request) -> RequestPriority:
+    """Return the request's ``priority`` extension, else the context's priority."""
+    return _validate_request_priority(
+        request.extensions.get(_PRIORITY_EXTENSION, _REQUEST_PRIORITY.get())
+    )
+
+
+class _PriorityLock:
+    """Async mutex handed to waiting ``interactive`` tasks before ``bulk`` ones.
+
+    FIFO within a priority. ``RateLimitTransport`` holds it around pyrate's
+    blocking acquire, so it decides which queued request gets the next token,
+    and a second one orders the requests paced out after a reset gate.
+    """
+
+    def __init__(self) -> None:
+        self._locked = False
+        self._waiters: dict[RequestPriority, deque[asyncio.Future[None]]] = {
+            priority: deque() for priority in _REQUEST_PRIORITIES
+        }
+
+    def waiting(self, priority: RequestPriority) -> int:
+        """Number of tasks queued for the lock at ``priority``."""
+        return sum(not waiter.done() for waiter in self._waiters[priority])
+
+    @contextlib.asynccontextmanager
+    async def hold(self, priority: RequestPriority) -> AsyncIterator[None]:
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: RequestPriority) -> None:
+        if not self._locked:
+            self._locked = True
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Ownership was handed to us just as we were cancelled; pass
+                # it on rather than leaving the lock held by nobody.
+                self._release()
+            else:
+                self._waiters[priority].remove(waiter)
+            raise
+
+    def _release(self) -> None:
+        for priority in _REQUEST_PRIORITIES:
+            queue = self._waiters[priority]
+            while queue:
+                waiter = queue.popleft()
+                if not waiter.done():
+                    # Hand over directly: ``_locked`` stays True so a task
+                    # arriving before the waiter resumes can't barge in.
+                    waiter.set_result(None)
+                    return
+        self._locked = False
+
+
+@define(frozen=True)
+class RateLimitQueueStats:
+    """Snapshot of ``RateLimitTransport``'s reset-gate queue.
+
+    Attributes:
+        depth: Requests currently waiting on a closed gate or for their paced
+            turn after it reopened.
+        waited: Requests that have left the queue so far.
+        wait_seconds_total: Time those requests spent queued, summed.
+        wait_seconds_max: Longest single queued wait so far.
+    """
+
+    depth: int
+    waited: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+
+    @property
+    def mean_wait_seconds(self) -> float:
+        """Average queued wait, or ``0.0`` before any request has waited."""
+        return self.wait_seconds_total / self.waited if self.waited else 0.0
+
 
 class RateLimitTransport(AsyncBaseTransport):
     """Proactive rate-limiter that respects Katana's X-Ratelimit-* headers.
@@ -1115,6 +1638,12 @@ class RateLimitTransport(AsyncBaseTransport):
     - **Reset gate**: when remaining hits 0, an ``asyncio.Event`` blocks all
       future requests until ``X-Ratelimit-Reset`` elapses. This prevents
       pyrate's bucket from racing ahead of Katana's window.
+    - **Paced release**: when the gate reopens, the requests queued on it
+      proceed one every ``60 / requests_per_minute`` seconds in arrival
+      order instead of all at once, and new requests queue behind them.
+      Waking the whole backlog together would spend pyrate's refilled bucket
+      in one burst and trip the next 429. ``queue_stats()`` reports the
+      queue depth and wait times.
 
     Stack placement is innermost (above the base ``AsyncHTTPTransport``):
     every actual HTTP request — including retries from ``RetryTransport``
@@ -1131,6 +1660,23 @@ class RateLimitTransport(AsyncBaseTransport):
     so a delayed earlier response with a higher ``remaining`` value won't
     overwrite a fresher (lower) estimate.
 
+    **Priority lanes**: each request is ``"interactive"`` (the default) or
+    ``"bulk"`` — set per request with ``extensions={"priority": ...}`` or for
+    a whole block with ``request_priority()``. Requests take turns at the
+    token bucket strictly by priority (FIFO within one), so a foreground call
+    queued behind a cache warm-up goes next. Bulk requests additionally draw
+    from a second bucket sized to ``1 - interactive_reserve`` of the budget,
+    so even a saturating bulk sync leaves that share for interactive calls.
+
+    **Cross-process sharing**: with ``shared_state`` (a
+    ``SharedRateLimitState``), the token bucket, the remaining estimate and
+    the reset gate live in a SQLite file instead of this process, so every
+    process using the same file and API key draws from one budget. The local
+    gate still does the waiting; before each request the transport adopts
+    any reset deadline another process has recorded. Shared-state calls and
+    bucket puts run in a worker thread, so a contended SQLite file or bucket
+    file lock never stalls the event loop.
+
     Inherits from ``AsyncBaseTransport`` (not ``AsyncHTTPTransport``) because
     we delegate every request to ``_wrapped_transport`` — there's no need to
     spin up an unused connection pool inside this layer.
@@ -1142,6 +1688,10 @@ class RateLimitTransport(AsyncBaseTransport):
         *,
         requests_per_minute: int = 60,
         logger: Logger | None = None,
+        shared_state: SharedRateLimitState | None = None,
+        interactive_reserve: float = 0.2,
+        reset_pacing: bool = True,
+        metrics: ClientMetrics | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize the rate-limit transport.
@@ -1154,6 +1704,16 @@ class RateLimitTransport(AsyncBaseTransport):
                 this transport from the chain rather than passing 0.
             logger: Logger instance for capturing state changes. If None,
                 creates a default logger.
+            shared_state: Cross-process budget to draw from instead of an
+                in-memory bucket. Its ``requests_per_minute`` must match.
+            interactive_reserve: Fraction of ``requests_per_minute`` that
+                ``"bulk"`` requests may never spend. Must be in ``[0, 1)``;
+                ``0`` keeps strict-priority dispatch without a reserve.
+            reset_pacing: Release requests queued on the reset gate at the
+                steady-state rate once it reopens. ``False`` wakes them all
+                at once.
+            metrics: Registry that receives each request's rate-limit wait
+                and every reset-gate engagement. ``None`` records nothing.
             **kwargs: Additional arguments passed to AsyncHTTPTransport if
                 wrapped_transport is None.
         """
@@ -1163,13 +1723,41 @@ class RateLimitTransport(AsyncBaseTransport):
                 "to disable rate limiting, omit this transport from the chain"
             )
             raise ValueError(msg)
+        if not 0 <= interactive_reserve < 1:
+            msg = f"interactive_reserve must be in [0, 1), got {interactive_reserve}"
+            raise ValueError(msg)
+        if (
+            shared_state is not None
+            and shared_state.requests_per_minute != requests_per_minute
+        ):
+            msg = (
+                f"shared_state is sized for {shared_state.requests_per_minute} "
+                f"requests/minute, but requests_per_minute={requests_per_minute}"
+            )
+            raise ValueError(msg)
         if wrapped_transport is None:
             wrapped_transport = AsyncHTTPTransport(**kwargs)
         self._wrapped_transport = wrapped_transport
         self._rpm = requests_per_minute
+        self._shared_state = shared_state
         self._limiter = Limiter(
-            Rate(requests_per_minute, Duration.MINUTE), buffer_ms=50
+            shared_state.open_bucket()
+            if shared_state is not None
+            else Rate(requests_per_minute, Duration.MINUTE),
+            buffer_ms=50,
         )
+        self._priority_lock = _PriorityLock()
+        # Bulk requests pass this narrower bucket first; ``None`` when there
+        # is no reserve to protect.
+        self._bulk_limiter: Limiter | None = None
+        bulk_rpm = max(1, int(requests_per_minute * (1 - interactive_reserve)))
+        if bulk_rpm < requests_per_minute:
+            self._bulk_limiter = Limiter(
+                shared_state.open_bucket(lane="bulk", requests_per_minute=bulk_rpm)
+                if shared_state is not None
+                else Rate(bulk_rpm, Duration.MINUTE),
+                buffer_ms=50,
+            )
         self._reset_gate = asyncio.Event()
         self._reset_gate.set()  # initially open — no active reset window
         self._reset_handle: asyncio.TimerHandle | None = None
@@ -1181,17 +1769,50 @@ class RateLimitTransport(AsyncBaseTransport):
         self._release_task: asyncio.Task[None] | None = None
         self._lock = asyncio.Lock()
         self._estimated_remaining = requests_per_minute
+        # Reset-gate queue: requests waiting on the closed gate or for their
+        # paced turn. ``asyncio.Event`` wakes waiters in the order they began
+        # waiting and ``_PriorityLock`` grants turns in arrival order within
+        # a priority, so the backlog drains first-come, first-served.
+        self._reset_pacing = reset_pacing
+        self._pacing_lock = _PriorityLock()
+        self._next_paced_turn = 0.0  # loop time
+        self._queue_depth = 0
+        self._queue_waited = 0
+        self._queue_wait_total = 0.0
+        self._queue_wait_max = 0.0
+        self.metrics = metrics
         self.logger: Logger = logger or logging.getLogger(__name__)
 
+    def queue_stats(self) -> RateLimitQueueStats:
+        """Return the reset-gate queue depth and wait times so far."""
+        return RateLimitQueueStats(
+            depth=self._queue_depth,
+            waited=self._queue_waited,
+            wait_seconds_total=self._queue_wait_total,
+            wait_seconds_max=self._queue_wait_max,
+        )
+
     async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
         """Acquire a token, forward the request, and observe rate-limit headers."""
+        priority = _resolve_request_priority(request)
+        loop = asyncio.get_running_loop()
+        arrived_at = loop.time()
+
         # Block on any active reset window (set when remaining hit 0 on a
         # prior response). Acts as the override on top of pyrate's bucket
         # so we don't fire the burst-budget into a window the server has
-        # already declared exhausted.
-        await self._reset_gate.wait()
-
-        await self._limiter.try_acquire_async(name=_RATE_LIMIT_BUCKET_NAME)
+        # already declared exhausted. Also queues behind a backlog still
+        # being paced out after the gate reopened.
+        await self._wait_for_reset_gate(priority, behind_backlog=True)
+
+        # Bulk requests spend from their own narrower bucket first, so they
+        # can never take the interactive reserve out of the shared one.
+        if priority == "bulk" and self._bulk_limiter is not None:
+            await self._acquire_token(self._bulk_limiter)
+        # pyrate serves blocked acquirers in arrival order; the priority lock
+        # admits one at a time so queued interactive requests go first.
+        async with self._priority_lock.hold(priority):
+            await self._acquire_token(self._limiter)
 
         # Re-check the gate after acquiring. While this request was queued
         # on pyrate's bucket, a concurrent response observer may have seen
@@ -1201,23 +1822,126 @@ class RateLimitTransport(AsyncBaseTransport):
         # later engage during this wait should re-block us. The acquired
         # token is held across the wait — pyrate refills its bucket over
         # the window naturally, so this is not a wasted budget.
-        while not self._reset_gate.is_set():
-            await self._reset_gate.wait()
+        await self._wait_for_reset_gate(priority)
 
         # Optimistically debit our local estimate to match what the server
         # is about to see. Without this, the server's ``X-Ratelimit-Remaining``
         # response would always be one lower than our untouched estimate,
         # causing ``_observe_response`` to drain a redundant token on every
         # request and effectively halve our usable budget. The lock keeps
-        # the debit and any concurrent sync-down consistent.
+        # the debit and any concurrent sync-down consistent. A shared
+        # estimate is debited once for all processes and mirrored locally.
         async with self._lock:
-            self._estimated_remaining = max(0, self._estimated_remaining - 1)
+            if self._shared_state is not None:
+                self._estimated_remaining = await asyncio.to_thread(
+                    self._shared_state.debit
+                )
+            else:
+                self._estimated_remaining = max(0, self._estimated_remaining - 1)
+
+        if self.metrics is not None:
+            from .metrics import endpoint_template
+
+            self.metrics.observe_rate_limit_wait(
+                request.method,
+                endpoint_template(request.url.path),
+                loop.time() - arrived_at,
+            )
 
         response = await self._wrapped_transport.handle_async_request(request)
 
         await self._observe_response(response)
         return response
 
+    async def _acquire_token(
+        self, limiter: Limiter, *, weight: int = 1, blocking: bool = True
+    ) -> bool:
+        """Take ``weight`` tokens from ``limiter``'s bucket.
+
+        With ``shared_state`` the bucket is a synchronous ``SQLiteBucket``
+        whose every put takes the cross-process file lock, which another
+        process may hold for as long as it likes. Each attempt therefore runs
+        in a worker thread, and a blocked acquirer retries from the event
+        loop every ``_SHARED_BUCKET_RETRY_SECONDS`` instead of letting pyrate
+        block the loop on the lock.
+        """
+        if self._shared_state is None:
+            return await limiter.try_acquire_async(
+                name=_RATE_LIMIT_BUCKET_NAME, weight=weight, blocking=blocking
+            )
+        while not await asyncio.to_thread(
+            limiter.try_acquire,
+            name=_RATE_LIMIT_BUCKET_NAME,
+            weight=weight,
+            blocking=False,
+        ):
+            if not blocking:
+                return False
+            await asyncio.sleep(_SHARED_BUCKET_RETRY_SECONDS)
+        return True
+
+    async def _wait_for_reset_gate(
+        self,
+        priority: RequestPriority = "interactive",
+        *,
+        behind_backlog: bool = False,
+    ) -> None:
+        """Wait until the reset gate is open, including gates engaged elsewhere.
+
+        A request that finds the gate closed joins the reset-gate queue. With
+        ``behind_backlog``, a request that finds it open also queues while
+        earlier requests are still waiting, so it can't jump the backlog.
+
+        With pacing, queued requests leave one per ``60 / requests_per_minute``
+        seconds: the head of the queue holds ``_pacing_lock`` while it waits
+        out its interval and the gate, and everyone behind it waits for the
+        lock (``interactive`` before ``bulk``, FIFO within each).
+        """
+        await self._adopt_shared_reset_gate()
+        if self._reset_gate.is_set() and not (behind_backlog and self._queue_depth):
+            return
+
+        loop = asyncio.get_running_loop()
+        queued_at = loop.time()
+        self._queue_depth += 1
+        try:
+            if not self._reset_pacing:
+                await self._wait_for_open_gate()
+                return
+            async with self._pacing_lock.hold(priority):
+                delay = self._next_paced_turn - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                await self._wait_for_open_gate()
+                self._next_paced_turn = loop.time() + 60 / self._rpm
+        finally:
+            self._queue_depth -= 1
+            wait = loop.time() - queued_at
+            self._queue_waited += 1
+            self._queue_wait_total += wait
+            self._queue_wait_max = max(self._queue_wait_max, wait)
+
+    async def _wait_for_open_gate(self) -> None:
+        """Block until the gate is open.
+
+        Loops so that a gate engaged while we were waiting — locally or, with
+        ``shared_state``, by another process — blocks us again.
+        """
+        while True:
+            await self._adopt_shared_reset_gate()
+            if self._reset_gate.is_set():
+                return
+            await self._reset_gate.wait()
+
+    async def _adopt_shared_reset_gate(self) -> None:
+        """Close the local gate for a reset deadline recorded in ``shared_state``."""
+        if self._shared_state is None:
+            return
+        reset_until_ms = await asyncio.to_thread(self._shared_state.reset_until_ms)
+        if reset_until_ms is not None:
+            async with self._lock:
+                self._engage_reset_gate(reset_until_ms)
+
     async def _observe_response(self, response: httpx.Response) -> None:
         """Parse rate-limit headers and update local state.
 
@@ -1273,19 +1997,31 @@ class RateLimitTransport(AsyncBaseTransport):
             # gate is the override.
             if 0 < remaining < self._estimated_remaining:
                 drain = self._estimated_remaining - remaining
-                # Best-effort: pyrate may have already drifted, so non-blocking
-                # drain.
-                await self._limiter.try_acquire_async(
-                    name=_RATE_LIMIT_BUCKET_NAME, weight=drain, blocking=False
-                )
+                if self._shared_state is not None:
+                    # Zero when another process already synced the shared
+                    # estimate down for this window and drained the bucket.
+                    drain = await asyncio.to_thread(
+                        self._shared_state.sync_down, remaining
+                    )
+                if drain > 0:
+                    # Best-effort: pyrate may have already drifted, so
+                    # non-blocking drain.
+                    await self._acquire_token(
+                        self._limiter, weight=drain, blocking=False
+                    )
+                    self.logger.info(
+                        "Rate limit synced down: drained %d tokens, "
+                        "remote remaining=%d",
+                        drain,
+                        remaining,
+                    )
                 self._estimated_remaining = remaining
-                self.logger.info(
-                    "Rate limit synced down: drained %d tokens, remote remaining=%d",
-                    drain,
-                    remaining,
-                )
 
             if remaining == 0:
+                if self._shared_state is not None:
+                    await asyncio.to_thread(
+                        self._shared_state.engage_reset, reset_epoch_ms
+                    )
                 self._engage_reset_gate(reset_epoch_ms)
 
     def _engage_reset_gate(self, reset_epoch_ms: int) -> None:
@@ -1329,6 +2065,8 @@ class RateLimitTransport(AsyncBaseTransport):
 
         if self._reset_gate.is_set():
             self._reset_gate.clear()
+            if self.metrics is not None:
+                self.metrics.observe_reset_gate()
             self.logger.info(
                 "Rate limit reset gate engaged for %.2fs (server reports remaining=0)",
                 wait_s,
@@ -1389,8 +2127,22 @@ class RateLimitTransport(AsyncBaseTransport):
             self._reset_until_epoch_ms = None
             self._reset_handle = None
             self._estimated_remaining = self._rpm
+            if self._shared_state is not None:
+                # Another process may have recorded a later deadline; the
+                # next request adopts it via ``_wait_for_reset_gate``.
+                self._estimated_remaining = await asyncio.to_thread(
+                    self._shared_state.release_reset, deadline_epoch_ms
+                )
             self._reset_gate.set()
-            self.logger.info("Rate limit reset gate released")
+            if self._queue_depth and self._reset_pacing:
+                self.logger.info(
+                    "Rate limit reset gate released; pacing %d queued requests "
+                    "at one per %.2fs",
+                    self._queue_depth,
+                    60 / self._rpm,
+                )
+            else:
+                self.logger.info("Rate limit reset gate released")
 
     async def aclose(self) -> None:
         """Cancel the pending reset timer and any in-flight release, then close the wrapped transport.
@@ -1420,15 +2172,198 @@ class RateLimitTransport(AsyncBaseTransport):
                 await self._release_task
         self._release_task = None
 
+        if self._shared_state is not None:
+            # Closes the SQLite connections opened by ``open_bucket``; the
+            # shared state itself may outlive this transport.
+            self._limiter.close()
+            if self._bulk_limiter is not None:
+                self._bulk_limiter.close()
+
         await self._wrapped_transport.aclose()
 
 
-def ResilientAsyncTransport(
+class JSONCodecTransport(AsyncBaseTransport):
+    """
+    Transport layer that makes ``response.json()`` decode with a chosen codec.
+
+    Sits directly above the base transport so every response in the chain —
+    the ones the rate-limit, error-logging and pagination layers inspect, and
+    the ones the generated ``_parse_response`` helpers finally parse — is a
+    ``_CodecJSONResponse``. The body stream is handed over untouched; nothing
+    is read or decoded in this layer.
+    """
+
+    def __init__(
+        self,
+        wrapped_transport: AsyncBaseTransport | None = None,
+        *,
+        json_codec: JSONCodec | JSONCodecName = "auto",
+        **kwargs: Any,
+    ):
+        """
+        Initialize the JSON codec transport.
+
+        Args:
+            wrapped_transport: The transport to wrap. If None, creates a new AsyncHTTPTransport.
+            json_codec: Codec instance or backend name (see
+                ``katana_public_api_client.json_codec``). Defaults to ``"auto"``.
+            **kwargs: Additional arguments passed to AsyncHTTPTransport if wrapped_transport is None.
+        """
+        if wrapped_transport is None:
+            wrapped_transport = AsyncHTTPTransport(**kwargs)
+        self._wrapped_transport = wrapped_transport
+        self.json_codec = resolve_json_codec(json_codec)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Forward the request and re-wrap the response for codec-backed ``json()``."""
+        response = await self._wrapped_transport.handle_async_request(request)
+        return _CodecJSONResponse.wrap(response, request, self.json_codec)
+
+    async def aclose(self) -> None:
+        """Propagate close down the wrapped chain so inner transports release resources."""
+        await self._wrapped_transport.aclose()
+
+
+# ``httpx.Response.extensions`` key under which ``DecodeOffloadTransport``
+# stores the model it built. The generated ``_parse_response`` helpers return
+# it as-is instead of running ``from_dict`` on the event loop.
+PARSED_MODEL_EXTENSION = "katana_parsed_model"
+
+# Request extension naming the generated endpoint module that sent the
+# request; every generated GET ``_get_kwargs`` sets it to ``__name__``.
+ENDPOINT_EXTENSION = "katana_endpoint"
+
+# Request extension: ``False`` keeps a response off the offload path (e.g. a
+# streamed body that must not be buffered).
+DECODE_OFFLOAD_EXTENSION = "katana_decode_offload"
+
+# Bodies from this size up are parsed off the event loop. 256 KiB of JSON is
+# roughly 10 ms of decode plus ``from_dict``; below it the hand-off to a
+# worker costs about as much as it saves.
+DEFAULT_OFFLOAD_THRESHOLD = 256 * 1024
+
+
+@define(frozen=True)
+class DecodeOffload:
+    """When and where ``KatanaClient`` parses large responses off the event loop.
+
+    Attributes:
+        threshold_bytes: Body size from which a ``GET`` response is decoded
+            and built into its endpoint's model in a worker.
+        executor: ``"thread"`` (the default) or ``"process"``. A thread frees
+            the loop whenever the interpreter switches threads; a process
+            pool takes the work off the GIL entirely, at the cost of pickling
+            the body to the worker and the built model back.
+        max_workers: Pool size. ``None`` uses the executor's default.
+    """
+
+    threshold_bytes: int = DEFAULT_OFFLOAD_THRESHOLD
+    executor: Literal["thread", "process"] = "thread"
+    max_workers: int | None = None
+
+
+DEFAULT_DECODE_OFFLOAD = DecodeOffload()
+
+
+@define(frozen=True)
+class DecodedJSON:
+    """A GET endpoint's ``200`` body, decoded but not built into its model.
+
+    The ``parsed`` value ``asyncio_detailed`` returns inside
+    ``decoded_json_responses()``.
+
+    Attributes:
+        payload: The decoded body. Shared with the response that carried it
+            (and with coalesced callers), so treat it as read-only.
+    """
+
+    payload: Any
+
+
+# Set by ``decoded_json_responses()``. A ``ContextVar`` so that it covers the
+# calls made in the block, including from tasks created inside it.
+_DECODED_JSON_RESULTS: ContextVar[bool] = ContextVar(
+    "katana_decoded_json_results", default=False
+)
+
+
+@contextlib.contextmanager
+def decoded_json_responses() -> Iterator[None]:
+    """Have GET endpoints called in this block skip building their model.
+
+    For callers that consume the JSON directly: ``Response.parsed`` of a
+    ``200`` from a generated GET endpoint is a ``DecodedJSON`` over the body
+    the client already decoded, and no ``from_dict`` runs over it (off the
+    event loop or on it). ``parse_decoded_json`` builds the model for the
+    records that still need one. Other statuses are parsed as usual, and a
+    ``KatanaClient`` given its own httpx client ignores the block.
+
+    Example:
+        ```python
+        with decoded_json_responses():
+            response = await get_all_variants.asyncio_detailed(client=client)
+        if isinstance(response.parsed, DecodedJSON):
+            records = response.parsed.payload["data"]
+        ```
+    """
+    token = _DECODED_JSON_RESULTS.set(True)
+    try:
+        yield
+    finally:
+        _DECODED_JSON_RESULTS.reset(token)
+
+
+def _known_body_size(response: httpx.Response) -> int | None:
+    """Body size without reading it: already read, or from ``Content-Length``.
+
+    A stitched collection whose body is not encoded yet reports the summed
+    size of its pages instead.
+    """
+    if _is_deferred(response):
+        return cast(_DecodedJSONResponse, response).size_hint
+    try:
+        return len(response.content)
+    except httpx.ResponseNotRead:
+        pass
+    length = response.headers.get("content-length", "")
+    return int(length) if length.isdigit() else None
+
+
+class PaginationAwareRetryTransport(RetryTransport):
+    """
+    ``RetryTransport`` that leaves auto-paginated requests to ``PaginationTransport``.
+
+    When the pagination layer below retries each page itself, retrying the
+    whole collection here as well would re-fetch every page that already
+    succeeded (and spend a rate-limit token on each) whenever one page
+    exhausts its retries. Auto-paginated GETs therefore pass straight
+    through; every other request is retried as usual.
+    """
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Pass auto-paginated GETs through; retry everything else."""
+        if self._async_transport is not None and _should_auto_paginate(request):
+            return await self._async_transport.handle_async_request(request)
+        return await super().handle_async_request(request)
+
+
+def ResilientAsyncTransport(  # noqa: PLR0913 — one keyword per resilience knob
     max_retries: int = 5,
     max_pages: int = 100,
     logger: Logger | None = None,
     *,
     requests_per_minute: int | None = 60,
+    pagination_concurrency: int = 1,
+    json_codec: JSONCodec | JSONCodecName = "auto",
+    shared_rate_limit: SharedRateLimitState | None = None,
+    interactive_reserve: float = 0.2,
+    adaptive_concurrency: int | None = None,
+    coalesce_requests: bool = False,
+    http_cache: HttpCacheStore | None = None,
+    http_cache_ttl: float = 0.0,
+    base_transport: AsyncBaseTransport | None = None,
+    metrics: ClientMetrics | None = None,
+    decode_offload: DecodeOffload | None = None,
     **kwargs: Any,
 ) -> RetryTransport:
     """
@@ -1436,17 +2371,34 @@ def ResilientAsyncTransport(
     pagination, rate limiting, and retry capabilities.
 
     This function chains multiple transport layers (innermost → outermost):
-    1. AsyncHTTPTransport (base HTTP transport)
-    2. RateLimitTransport (proactive 60-req/min throttle, header-aware)
-    3. ErrorLoggingTransport (logs detailed 4xx errors)
-    4. PaginationTransport (auto-collects paginated responses)
-    5. RetryTransport (handles retries with Retry-After header support)
+    1. AsyncHTTPTransport (base HTTP transport, or ``base_transport``), under
+       a ConnectionReuseTransport counting connections opened vs reused
+    2. JSONCodecTransport (routes ``response.json()`` through the JSON codec)
+    3. MetricsTransport (optional; per-endpoint latency, status and byte
+       counts for every request on the wire)
+    4. AdaptiveConcurrencyTransport (optional AIMD cap on in-flight requests)
+    5. RateLimitTransport (proactive 60-req/min throttle, header-aware)
+    6. ErrorLoggingTransport (logs detailed 4xx errors)
+    7. HttpCacheTransport (optional; ETag/Last-Modified revalidation and
+       short-TTL freshness from a persistent store)
+    8. PaginationTransport (auto-collects paginated responses, retrying
+       each page in place)
+    9. CoalescingTransport (optional; identical concurrent GETs share one
+       request)
+    10. DecodeOffloadTransport (optional; decodes large responses and builds
+        their models in a worker pool, off the event loop)
+    11. PaginationAwareRetryTransport (retries everything else, with
+        Retry-After header support)
 
     The rate limiter is innermost (above the base) because Katana counts
     *every* HTTP request — retries from the outer ``RetryTransport`` and
     individual paginated pages from ``PaginationTransport`` all consume
     server-side budget. Placing the limiter higher up would under-count.
 
+    Both retry layers share one ``RateLimitAwareRetry`` policy. Auto-paginated
+    GETs are retried per page by ``PaginationTransport``, so a transient
+    failure on page 37 re-fetches page 37 rather than pages 1-37.
+
     Args:
         max_retries: Maximum number of retry attempts for failed requests. Defaults to 5.
         max_pages: Maximum number of pages to collect during auto-pagination. Defaults to 100.
@@ -1454,6 +2406,43 @@ def ResilientAsyncTransport(
             transport. Defaults to 60 (Katana's documented default). Pass ``None``
             to omit the rate-limit layer entirely (e.g. when the caller is
             responsible for throttling, or for tests that need raw throughput).
+        pagination_concurrency: Maximum number of auto-paginated page requests
+            in flight once the first page reveals ``total_pages``. Defaults to
+            1 (sequential). Each page still passes through the rate limiter.
+        json_codec: JSON codec instance or backend name (``"auto"``,
+            ``"orjson"``, ``"msgspec"`` or ``"stdlib"``) used by every layer
+            and by ``response.json()``. ``"auto"`` (the default) uses the
+            fastest installed backend and falls back to the stdlib.
+        shared_rate_limit: Cross-process budget for the rate-limit transport
+            (see ``katana_public_api_client.shared_rate_limit``), so several
+            processes using one API key stay under ``requests_per_minute``
+            together. Ignored when ``requests_per_minute`` is ``None``.
+        interactive_reserve: Fraction of ``requests_per_minute`` that
+            ``"bulk"``-priority requests (see ``request_priority``) may never
+            spend. Defaults to 0.2.
+        adaptive_concurrency: Ceiling for an ``AdaptiveConcurrencyTransport``
+            that grows the number of requests in flight while responses stay
+            healthy and halves it on 429s, 5xx or rising latency. ``None``
+            (the default) omits the layer and leaves fan-out to the caller.
+        coalesce_requests: Add a ``CoalescingTransport`` so a GET issued
+            while an identical one (same URL and credentials) is in flight
+            shares its response instead of spending another request.
+            Defaults to False.
+        http_cache: Store for an ``HttpCacheTransport`` that revalidates
+            repeated GETs with their ``ETag``/``Last-Modified`` and replays
+            the stored body on 304. ``None`` (the default) omits the layer.
+        http_cache_ttl: Seconds a cached detail GET (e.g. ``/products/123``)
+            is served without revalidating, when the response sets no
+            ``Cache-Control: max-age``. Defaults to 0 (always revalidate).
+        base_transport: Transport at the bottom of the chain in place of a
+            new AsyncHTTPTransport, e.g. a ``cassette.ReplayTransport`` that
+            answers from a recording. ``kwargs`` are ignored when given.
+        metrics: Registry (see ``katana_public_api_client.metrics``) that the
+            metrics, rate-limit and pagination layers record into. ``None``
+            (the default) omits the metrics layer and records nothing.
+        decode_offload: Settings for a ``DecodeOffloadTransport`` that parses
+            ``GET`` bodies above a size threshold in a thread or process pool.
+            ``None`` (the default) omits the layer.
         logger: Logger instance for capturing operations. If None, creates a default logger.
         **kwargs: Additional arguments passed to the base AsyncHTTPTransport.
             Common parameters include:
@@ -1481,35 +2470,62 @@ def ResilientAsyncTransport(
     resolved_logger: Logger = (
         logger if logger is not None else logging.getLogger(__name__)
     )
+    resolved_codec = resolve_json_codec(json_codec)
 
     # Build the transport chain from inside out:
-    # 1. Base AsyncHTTPTransport
-    inner_transport: AsyncBaseTransport = AsyncHTTPTransport(**kwargs)
+    # 1. Base AsyncHTTPTransport, wrapped so connection reuse is counted and
+    #    every response decodes with the configured codec
+    inner_transport: AsyncBaseTransport = JSONCodecTransport(
+        wrapped_transport=ConnectionReuseTransport(
+            wrapped_transport=base_transport or AsyncHTTPTransport(**kwargs),
+            logger=resolved_logger,
+        ),
+        json_codec=resolved_codec,
+    )
+
+    # 2. Optionally record every request that goes out on the wire. Below
+    #    the concurrency and rate limiters, so their waits aren't counted
+    #    as latency.
+    if metrics is not None:
+        from .metrics import MetricsTransport
+
+        inner_transport = MetricsTransport(
+            wrapped_transport=inner_transport, metrics=metrics
+        )
 
-    # 2. Wrap with rate limiting (innermost wrapping layer — every actual
-    #    HTTP request, including retries and per-page paginated fetches,
-    #    consumes one token. ``None`` skips this layer entirely.)
+    # 3. Optionally cap in-flight requests adaptively. Below the rate limiter
+    #    so the latency it samples is the server's, not time spent waiting
+    #    for a rate-limit token.
+    if adaptive_concurrency is not None:
+        inner_transport = AdaptiveConcurrencyTransport(
+            wrapped_transport=inner_transport,
+            initial_limit=min(4, adaptive_concurrency),
+            max_limit=adaptive_concurrency,
+            logger=resolved_logger,
+        )
+
+    # 4. Wrap with rate limiting (every actual HTTP request, including
+    #    retries and per-page paginated fetches, consumes one token.
+    #    ``None`` skips this layer entirely.)
     if requests_per_minute is not None:
         inner_transport = RateLimitTransport(
             wrapped_transport=inner_transport,
             requests_per_minute=requests_per_minute,
             logger=resolved_logger,
+            shared_state=shared_rate_limit,
+            interactive_reserve=interactive_reserve,
+            metrics=metrics,
         )
 
-    # 3. Wrap with error logging
+    # 5. Wrap with error logging
     error_logging_transport = ErrorLoggingTransport(
         wrapped_transport=inner_transport,
         logger=resolved_logger,
+        json_codec=resolved_codec,
     )
 
-    # 4. Wrap with pagination
-    pagination_transport = PaginationTransport(
-        wrapped_transport=error_logging_transport,
-        max_pages=max_pages,
-        logger=resolved_logger,
-    )
-
-    # Finally wrap with retry logic (outermost layer)
+    # Retry policy, shared by the per-page retries in the pagination layer and
+    # the outermost retry layer.
     # Use RateLimitAwareRetry which:
     # - Retries ALL methods (including POST/PATCH) for 429 rate limiting
     # - Retries ONLY idempotent methods for server errors (502, 503, 504)
@@ -1534,14 +2550,122 @@ def ResilientAsyncTransport(
             "PATCH",
         ],
     )
-    retry_transport = RetryTransport(
-        transport=pagination_transport,
+
+    # 6. Optionally answer GETs from the HTTP cache. Above the rate limiter,
+    #    so a fresh hit spends no token; below pagination, so each page is
+    #    cached and revalidated on its own.
+    page_transport: AsyncBaseTransport = error_logging_transport
+    if http_cache is not None:
+        from .http_cache import HttpCacheTransport
+
+        page_transport = HttpCacheTransport(
+            wrapped_transport=error_logging_transport,
+            store=http_cache,
+            detail_ttl=http_cache_ttl,
+            json_codec=resolved_codec,
+            logger=resolved_logger,
+        )
+
+    # 7. Wrap with pagination (retries each page in place, resuming from the
+    #    failed page instead of restarting the collection)
+    pagination_transport = PaginationTransport(
+        wrapped_transport=page_transport,
+        max_pages=max_pages,
+        logger=resolved_logger,
+        concurrency=pagination_concurrency,
+        json_codec=resolved_codec,
+        retry=retry,
+        metrics=metrics,
+    )
+
+    # 8. Optionally share identical concurrent GETs. Above pagination so a
+    #    coalesced collection is fetched and stitched once; below retry so
+    #    every caller still retries on its own behalf.
+    outer_transport: AsyncBaseTransport = pagination_transport
+    if coalesce_requests:
+        from .coalescing import CoalescingTransport
+
+        outer_transport = CoalescingTransport(
+            wrapped_transport=pagination_transport, logger=resolved_logger
+        )
+
+    # 9. Optionally parse large bodies in a worker pool. Above coalescing so
+    #    every caller gets a model of its own; below retry, which only looks
+    #    at status codes.
+    if decode_offload is not None:
+        from .decode_offload import DecodeOffloadTransport
+
+        outer_transport = DecodeOffloadTransport(
+            wrapped_transport=outer_transport,
+            offload=decode_offload,
+            json_codec=resolved_codec,
+            logger=resolved_logger,
+        )
+
+    # Finally wrap with retry logic (outermost layer) for everything the
+    # pagination layer doesn't already retry page by page
+    retry_transport = PaginationAwareRetryTransport(
+        transport=outer_transport,
         retry=retry,
     )
 
     return retry_transport
 
 
+def _page_items(parsed: Any) -> list[Any]:
+    """Return the item list from a parsed list response (``.data`` or a raw list)."""
+    if isinstance(parsed, list):
+        return parsed
+    data = getattr(parsed, "data", None)
+    return data if isinstance(data, list) else []
+
+
+class _KatanaAsyncClient(httpx.AsyncClient):
+    """``httpx.AsyncClient`` that leaves stitched collection bodies unencoded.
+
+    ``httpx`` reads every non-streamed response, which for a
+    ``_DecodedJSONResponse`` means encoding the whole collection only for the
+    generated ``_build_response`` to ignore it. This client fetches as a
+    stream and reads everything else as usual, but only closes those.
+    Inside ``decoded_json_responses()`` it also tags a GET endpoint's ``200``
+    with its ``DecodedJSON``.
+    """
+
+    async def send(
+        self,
+        request: httpx.Request,
+        *,
+        stream: bool = False,
+        auth: AuthTypes | UseClientDefault | None = USE_CLIENT_DEFAULT,
+        follow_redirects: bool | UseClientDefault = USE_CLIENT_DEFAULT,
+    ) -> httpx.Response:
+        """Send ``request``; see ``httpx.AsyncClient.send``."""
+        response = await super().send(
+            request, stream=True, auth=auth, follow_redirects=follow_redirects
+        )
+        if stream:
+            return response
+        try:
+            if _is_deferred(response):
+                await response.aclose()
+            else:
+                await response.aread()
+            if (
+                _DECODED_JSON_RESULTS.get()
+                and response.status_code == HTTPStatus.OK
+                and ENDPOINT_EXTENSION in request.extensions
+            ):
+                # Handed back by the generated ``_parse_response`` as-is
+                response.extensions = {
+                    **response.extensions,
+                    PARSED_MODEL_EXTENSION: DecodedJSON(response.json()),
+                }
+        except BaseException:
+            await response.aclose()
+            raise
+        return response
+
+
 class KatanaClient(AuthenticatedClient):
     """
     The pythonic Katana API client with automatic resilience and pagination.
@@ -1564,7 +2688,9 @@ class KatanaClient(AuthenticatedClient):
     - ANY explicit `page` parameter disables auto-pagination (e.g., `page=1`)
     - Disabled per-request via extensions: `extensions={"auto_pagination": False}`
     - Control max pages via `max_pages` constructor parameter
+    - Fetch pages 2..N in parallel via `pagination_concurrency` constructor parameter
     - Limit total items via extensions: `extensions={"max_items": 200}`
+    - Stream page by page instead with `client.paginate(...)` / `client.aiter_items(...)`
 
     Usage:
         async with KatanaClient() as client:
@@ -1667,7 +2793,7 @@ class KatanaClient(AuthenticatedClient):
 
         return None
 
-    def __init__(
+    def __init__(  # noqa: PLR0913 — one keyword per resilience knob
         self,
         api_key: str | None = None,
         base_url: str | None = None,
@@ -1677,6 +2803,18 @@ class KatanaClient(AuthenticatedClient):
         logger: Logger | None = None,
         *,
         requests_per_minute: int | None = 60,
+        pagination_concurrency: int = 1,
+        json_codec: JSONCodec | JSONCodecName = "auto",
+        shared_rate_limit: str | os.PathLike[str] | SharedRateLimitState | None = None,
+        interactive_reserve: float = 0.2,
+        adaptive_concurrency: int | None = None,
+        coalesce_requests: bool = False,
+        http_cache: str | os.PathLike[str] | HttpCacheStore | None = None,
+        http_cache_ttl: float = 0.0,
+        base_transport: AsyncBaseTransport | None = None,
+        metrics: ClientMetrics | None = None,
+        connection_profile: ConnectionProfile | Literal["managed"] | None = None,
+        decode_offload: DecodeOffload | None = DEFAULT_DECODE_OFFLOAD,
         **httpx_kwargs: Any,
     ):
         """
@@ -1697,6 +2835,79 @@ class KatanaClient(AuthenticatedClient):
                 request — including retries and per-page paginated fetches —
                 consumes one token, and the transport adapts to the server's
                 ``X-Ratelimit-Remaining`` / ``X-Ratelimit-Reset`` headers.
+            pagination_concurrency: Maximum number of auto-paginated page
+                requests in flight at once. Defaults to 1 (pages are fetched
+                sequentially). With a higher value, page 1 is fetched first to
+                learn ``total_pages`` and the remaining pages are issued in
+                parallel, then reassembled in page order. Every page still
+                consumes a rate-limit token.
+            json_codec: JSON backend for response parsing, pagination and
+                error logging: ``"auto"`` (default; ``orjson``, then
+                ``msgspec``, then the stdlib, whichever is installed first),
+                ``"orjson"``, ``"msgspec"``, ``"stdlib"``, or any object
+                implementing ``json_codec.JSONCodec``. Install the
+                ``fast-json`` extra for a faster backend. With a custom
+                ``transport=`` only the client's own hooks use the codec.
+            shared_rate_limit: Share the rate-limit budget and reset gate with
+                every other process on this machine using the same API key:
+                a SQLite file path (state is keyed by a hash of the API key)
+                or a ``SharedRateLimitState``. Defaults to ``None``
+                (in-process only). State opened from a path is closed with
+                the client; an instance passed in stays open. Requires the
+                ``shared-rate-limit`` extra. Ignored when
+                ``requests_per_minute`` is ``None`` or a custom transport is
+                supplied.
+            interactive_reserve: Fraction of ``requests_per_minute`` reserved
+                for interactive calls: requests tagged ``"bulk"`` (with
+                ``request_priority("bulk")`` or the ``priority`` request
+                extension) never spend it, and queued interactive requests
+                are always dispatched before queued bulk ones. Defaults to 0.2.
+            adaptive_concurrency: Let the client tune how many requests are
+                in flight at once, up to this ceiling: the limit grows while
+                latency and ``X-Ratelimit-Remaining`` look healthy and halves
+                on 429s, 5xx or rising p95 latency. Requests beyond the limit
+                wait their turn, so bulk fan-out self-tunes to the tenant's
+                capacity. ``None`` (the default) disables it.
+            coalesce_requests: Serve a GET issued while an identical one is
+                still in flight from that request's response, so concurrent
+                lookups of the same resource cost one request. Only GETs are
+                ever coalesced. Defaults to False.
+            http_cache: Cache GET responses in this SQLite file (or
+                ``HttpCacheStore``). Repeated GETs are revalidated with
+                ``If-None-Match``/``If-Modified-Since`` and a 304 is answered
+                from the stored body. A store opened from a path is closed
+                with the client. ``None`` (the default) disables it.
+            http_cache_ttl: Seconds a cached detail GET (e.g.
+                ``get_product``) is served without contacting Katana at all,
+                unless the response's ``Cache-Control`` says otherwise.
+                Writes to a resource always drop its cached copies. Defaults
+                to 0 (always revalidate).
+            base_transport: Transport to send requests through instead of a
+                new ``AsyncHTTPTransport``, underneath the full resilience
+                chain — unlike ``transport=``, which replaces the chain. Use
+                ``cassette.RecordingTransport`` / ``cassette.ReplayTransport``
+                to record a session and replay it offline.
+            metrics: Registry to record request metrics into, exposed as
+                ``client.metrics``. Defaults to a new ``ClientMetrics``; pass
+                one to aggregate several clients. Stays empty with a custom
+                ``transport=``.
+            connection_profile: Connection pool settings for the base
+                transport: a ``ConnectionProfile``, or ``"managed"`` for
+                HTTP/2 (when the ``http2`` extra is installed), keepalive and
+                pool sizes tuned to ``adaptive_concurrency`` /
+                ``pagination_concurrency``, and a connection opened during
+                ``__aenter__`` so the first call skips DNS and TLS setup.
+                Explicit ``http2=`` / ``limits=`` still win. ``None`` (the
+                default) keeps httpx's defaults. Ignored with a custom
+                ``transport=`` or a ``base_transport``.
+            decode_offload: Decode ``GET`` responses of at least
+                ``threshold_bytes`` (256 KiB by default) and build their
+                models in a thread pool — or a process pool, with
+                ``DecodeOffload(executor="process")`` — so a large collection
+                doesn't stall every other call on the event loop. Transparent
+                to the generated ``asyncio_detailed`` functions. ``None``
+                parses everything on the loop. Ignored with a custom
+                ``transport=``.
             logger: Any object whose debug/info/warning/error methods accept
                 (msg, *args, **kwargs) — the standard logging.Logger call convention
                 (e.g. logging.Logger, structlog.BoundLogger). If None, creates a
@@ -1750,6 +2961,35 @@ class KatanaClient(AuthenticatedClient):
 
         self.logger: Logger = logger or logging.getLogger(__name__)
         self.max_pages = max_pages
+        self.json_codec = resolve_json_codec(json_codec)
+        if metrics is None:
+            from .metrics import ClientMetrics
+
+            metrics = ClientMetrics()
+        self.metrics = metrics
+        if connection_profile == "managed":
+            from .bulk import DEFAULT_BULK_CONCURRENCY
+
+            connection_profile = ConnectionProfile.managed(
+                max(
+                    adaptive_concurrency or 0,
+                    pagination_concurrency,
+                    DEFAULT_BULK_CONCURRENCY,
+                )
+            )
+        elif connection_profile is not None and not isinstance(
+            connection_profile, ConnectionProfile
+        ):
+            msg = (
+                f"Unknown connection profile {connection_profile!r}; "
+                "expected 'managed' or a ConnectionProfile"
+            )
+            raise ValueError(msg)
+        self._connection_profile: ConnectionProfile | None = connection_profile
+        # Shared rate-limit state and HTTP cache store opened here from a
+        # path; ``__aexit__`` closes them.
+        self._owned_shared_state: SharedRateLimitState | None = None
+        self._owned_http_cache: HttpCacheStore | None = None
 
         # Warn if SSL verification is disabled — risk of MITM attacks
         if httpx_kwargs.get("verify") is False:
@@ -1806,12 +3046,51 @@ class KatanaClient(AuthenticatedClient):
                 if k in client_only_params
             }
 
+            # A path gets a budget keyed by this client's API key, so other
+            # keys sharing the file (e.g. a dedicated sync key) stay separate
+            shared_state: SharedRateLimitState | None = None
+            if not isinstance(shared_rate_limit, str | os.PathLike):
+                shared_state = shared_rate_limit
+            elif requests_per_minute is not None:
+                from .shared_rate_limit import SharedRateLimitState
+
+                shared_state = SharedRateLimitState(
+                    os.fspath(shared_rate_limit),
+                    requests_per_minute=requests_per_minute,
+                    scope=api_key,
+                )
+                self._owned_shared_state = shared_state
+
+            if connection_profile is not None:
+                for key, value in connection_profile.transport_kwargs().items():
+                    httpx_kwargs.setdefault(key, value)
+
+            cache_store: HttpCacheStore | None
+            if isinstance(http_cache, str | os.PathLike):
+                from .http_cache import HttpCacheStore
+
+                cache_store = HttpCacheStore(os.fspath(http_cache))
+                self._owned_http_cache = cache_store
+            else:
+                cache_store = http_cache
+
             # Create resilient transport with remaining transport-specific httpx_kwargs
             # These will be passed to the base AsyncHTTPTransport (http2, limits, verify, etc.)
             transport = ResilientAsyncTransport(
                 max_retries=max_retries,
                 max_pages=max_pages,
                 requests_per_minute=requests_per_minute,
+                pagination_concurrency=pagination_concurrency,
+                json_codec=self.json_codec,
+                shared_rate_limit=shared_state,
+                interactive_reserve=interactive_reserve,
+                adaptive_concurrency=adaptive_concurrency,
+                coalesce_requests=coalesce_requests,
+                http_cache=cache_store,
+                http_cache_ttl=http_cache_ttl,
+                base_transport=base_transport,
+                metrics=self.metrics,
+                decode_offload=decode_offload,
                 logger=self.logger,
                 **httpx_kwargs,  # Pass through http2, limits, verify, cert, trust_env, etc.
             )
@@ -1834,6 +3113,69 @@ class KatanaClient(AuthenticatedClient):
     # Remove the client property since we inherit from AuthenticatedClient
     # Users can now pass the KatanaClient instance directly to API methods
 
+    def get_async_httpx_client(self) -> httpx.AsyncClient:
+        """Get the underlying httpx client, constructing it on first use.
+
+        Built as the generated ``AuthenticatedClient`` builds it, but as a
+        client that does not encode auto-paginated collections nobody reads
+        the bytes of.
+        """
+        if self._async_client is None:
+            self._headers[self.auth_header_name] = (
+                f"{self.prefix} {self.token}" if self.prefix else self.token
+            )
+            self._async_client = _KatanaAsyncClient(
+                base_url=self._base_url,
+                cookies=self._cookies,
+                headers=self._headers,
+                timeout=self._timeout,
+                verify=self._verify_ssl,
+                follow_redirects=self._follow_redirects,
+                **self._httpx_args,
+            )
+        return self._async_client
+
+    async def __aenter__(self) -> Self:
+        """Open the underlying httpx client, warming a connection if configured."""
+        await super().__aenter__()
+        if self._connection_profile is not None and self._connection_profile.warm_up:
+            await self.warm_up()
+        return self
+
+    async def __aexit__(self, *args: Any, **kwargs: Any) -> None:
+        """Close the underlying httpx client and any state files it opened."""
+        await super().__aexit__(*args, **kwargs)
+        if self._owned_shared_state is not None:
+            self._owned_shared_state.close()
+            self._owned_shared_state = None
+        if self._owned_http_cache is not None:
+            self._owned_http_cache.close()
+            self._owned_http_cache = None
+
+    async def warm_up(self) -> bool:
+        """Open a pooled connection to the API host ahead of the first request.
+
+        Called by ``__aenter__`` when the connection profile asks for it. The
+        warm-up HEAD spends no rate-limit token and carries no credentials; a
+        failure is logged and leaves the client usable.
+
+        Returns:
+            Whether a connection was opened (always ``False`` with a custom
+            ``transport=``).
+
+        Example:
+            >>> client = KatanaClient(connection_profile="managed")
+            >>> async with client:  # warms up on enter
+            ...     await client.products.get(123)
+            ...     print(client.connections.stats().reused)
+            1
+        """
+        layer = self.connections
+        if layer is None:
+            return False
+        profile = self._connection_profile or ConnectionProfile()
+        return await layer.warm_up(self._base_url, timeout=profile.warm_up_timeout)
+
     # Domain properties for ergonomic access
     @property
     def products(self) -> Products:
@@ -1915,6 +3257,341 @@ class KatanaClient(AuthenticatedClient):
             self._api_namespace = ApiNamespace(self)
         return self._api_namespace
 
+    @property
+    def rate_limiter(self) -> RateLimitTransport | None:
+        """The client's ``RateLimitTransport``, or ``None`` if it has none.
+
+        ``None`` when rate limiting was disabled (``requests_per_minute=None``)
+        or a custom transport was supplied. Use it to inspect the reset-gate
+        queue:
+
+        Example:
+            >>> client = KatanaClient()
+            >>> if client.rate_limiter is not None:
+            ...     print(client.rate_limiter.queue_stats().depth)
+        """
+        return self._find_transport_layer(RateLimitTransport)
+
+    @property
+    def concurrency_limiter(self) -> AdaptiveConcurrencyTransport | None:
+        """The client's ``AdaptiveConcurrencyTransport``, or ``None`` if disabled.
+
+        Example:
+            >>> client = KatanaClient(adaptive_concurrency=16)
+            >>> client.concurrency_limiter.stats().limit
+            4.0
+        """
+        return self._find_transport_layer(AdaptiveConcurrencyTransport)
+
+    @property
+    def request_coalescer(self) -> CoalescingTransport | None:
+        """The client's ``CoalescingTransport``, or ``None`` if disabled.
+
+        Example:
+            >>> client = KatanaClient(coalesce_requests=True)
+            >>> client.request_coalescer.stats().coalesced
+            0
+        """
+        from .coalescing import CoalescingTransport
+
+        return self._find_transport_layer(CoalescingTransport)
+
+    @property
+    def http_cache(self) -> HttpCacheTransport | None:
+        """The client's ``HttpCacheTransport``, or ``None`` if disabled.
+
+        Example:
+            >>> client = KatanaClient(http_cache="~/.cache/katana/http.db")
+            >>> client.http_cache.stats().hits
+            0
+        """
+        from .http_cache import HttpCacheTransport
+
+        return self._find_transport_layer(HttpCacheTransport)
+
+    @property
+    def connections(self) -> ConnectionReuseTransport | None:
+        """The client's ``ConnectionReuseTransport``, or ``None`` with a custom transport.
+
+        Example:
+            >>> client = KatanaClient(connection_profile="managed")
+            >>> client.connections.stats().reuse_ratio
+            0.0
+        """
+        return self._find_transport_layer(ConnectionReuseTransport)
+
+    @property
+    def decode_offloader(self) -> DecodeOffloadTransport | None:
+        """The client's ``DecodeOffloadTransport``, or ``None`` when disabled.
+
+        Example:
+            >>> client.decode_offloader.stats().prebuilt
+            3
+        """
+        from .decode_offload import DecodeOffloadTransport
+
+        return self._find_transport_layer(DecodeOffloadTransport)
+
+    def _find_transport_layer[T](self, layer_type: type[T]) -> T | None:
+        """Return the first layer of ``layer_type`` in the transport chain."""
+        layer: Any = self._httpx_args.get("transport")
+        # RetryTransport keeps its inner chain on ``_async_transport``; every
+        # layer below it on ``_wrapped_transport``.
+        layer = getattr(layer, "_async_transport", layer)
+        while layer is not None:
+            if isinstance(layer, layer_type):
+                return layer
+            layer = getattr(layer, "_wrapped_transport", None)
+        return None
+
+    # Streaming pagination
+    async def paginate(
+        self,
+        endpoint: ModuleType,
+        /,
+        *,
+        page_size: int = 250,
+        max_pages: int | None = None,
+        **filters: Any,
+    ) -> AsyncIterator[Any]:
+        """Yield parsed list responses one page at a time.
+
+        Unlike auto-pagination, which buffers every page into one combined
+        response, this requests each page explicitly (``page=N`` disables the
+        transport's auto-pagination) and yields its parsed attrs model before
+        fetching the next one, so memory stays bounded by a single page.
+        Each page still goes through the retry and rate-limit layers.
+
+        Iteration stops at the last page reported by the pagination headers
+        (or body), or — when the server sends none — at the first page
+        holding fewer than ``page_size`` items.
+
+        Args:
+            endpoint: A generated list endpoint module, e.g.
+                ``katana_public_api_client.api.sales_order.get_all_sales_orders``.
+            page_size: Items requested per page. Defaults to 250 (Katana's max).
+            max_pages: Maximum pages to fetch. Defaults to the client's
+                ``max_pages``.
+            **filters: Additional keyword arguments forwarded to the
+                endpoint's ``asyncio_detailed`` (e.g. ``updated_at_min``).
+
+        Yields:
+            The parsed list response for each page (e.g.
+            ``SalesOrderListResponse``).
+
+        Raises:
+            APIError: (or a subclass) when a page returns an error status.
+
+        Example:
+            >>> from katana_public_api_client.api.sales_order import (
+            ...     get_all_sales_orders,
+            ... )
+            >>> async with KatanaClient() as client:
+            ...     async for page in client.paginate(
+            ...         get_all_sales_orders, status="NOT_SHIPPED"
+            ...     ):
+            ...         process(page.data)
+        """
+        page_limit = self.max_pages if max_pages is None else max_pages
+        for page_num in range(1, page_limit + 1):
+            response = await endpoint.asyncio_detailed(
+                client=self, page=page_num, limit=page_size, **filters
+            )
+            parsed = unwrap(response)
+            if parsed is None:
+                return
+
+            items = _page_items(parsed)
+            yield parsed
+
+            body_meta = getattr(parsed, "additional_properties", None)
+            pagination_info = _extract_pagination_info(
+                response.headers,
+                body_meta if isinstance(body_meta, dict) else {},
+                self.logger,
+                self.json_codec,
+            )
+            total_pages = (
+                pagination_info.get("total_pages") if pagination_info else None
+            )
+            if total_pages is not None:
+                if page_num >= total_pages:
+                    return
+            elif len(items) < page_size:
+                return
+
+    async def aiter_items(
+        self,
+        endpoint: ModuleType,
+        /,
+        *,
+        page_size: int = 250,
+        max_pages: int | None = None,
+        **filters: Any,
+    ) -> AsyncIterator[Any]:
+        """Yield individual items from a list endpoint, one page in memory at a time.
+
+        Item-level counterpart to :meth:`paginate`; accepts the same arguments.
+
+        Example:
+            >>> async with KatanaClient() as client:
+            ...     async for order in client.aiter_items(get_all_sales_orders):
+            ...         print(order.order_no)
+        """
+        async for page in self.paginate(
+            endpoint, page_size=page_size, max_pages=max_pages, **filters
+        ):
+            for item in _page_items(page):
+                yield item
+
+    async def stream_items(
+        self,
+        endpoint: ModuleType,
+        /,
+        *,
+        item_type: type[Any] | None = None,
+        page_size: int = 250,
+        max_pages: int | None = None,
+        **filters: Any,
+    ) -> AsyncIterator[Any]:
+        """Yield list items decoded one at a time from each streamed page.
+
+        Opt-in alternative to :meth:`aiter_items` for very large pages: the
+        body is streamed and the items of its ``data`` array are split out and
+        decoded individually (see :mod:`~katana_public_api_client.json_stream`),
+        so peak memory is one item plus one network chunk rather than one
+        page's text and object graph. The split costs more CPU than decoding
+        the page in one call, and a page the HTTP cache stores is still read
+        whole by that layer, so prefer :meth:`aiter_items` unless memory is
+        the constraint.
+
+        Pages stop on the same signals as :meth:`paginate`, read from the
+        pagination headers only — the body is never held to look for them.
+
+        Args:
+            endpoint: A generated list endpoint module, e.g.
+                ``katana_public_api_client.api.inventory_movements.get_all_inventory_movements``.
+            item_type: Generated model to build each item with (via its
+                ``from_dict``). Defaults to yielding the decoded dicts.
+            page_size: Items requested per page. Defaults to 250 (Katana's max).
+            max_pages: Maximum pages to fetch. Defaults to the client's
+                ``max_pages``.
+            **filters: Additional keyword arguments for the endpoint
+                (e.g. ``updated_at_min``).
+
+        Yields:
+            Each item, as ``item_type`` or as a dict.
+
+        Raises:
+            APIError: (or a subclass) when a page returns an error status.
+            json.JSONDecodeError: If a page body is malformed or truncated.
+
+        Example:
+            >>> async with KatanaClient() as client:
+            ...     async for movement in client.stream_items(
+            ...         get_all_inventory_movements, item_type=InventoryMovement
+            ...     ):
+            ...         process(movement)
+        """
+        http = self.get_async_httpx_client()
+        page_limit = self.max_pages if max_pages is None else max_pages
+        for page_num in range(1, page_limit + 1):
+            kwargs = endpoint._get_kwargs(page=page_num, limit=page_size, **filters)
+            count = 0
+            # Streamed item by item: never buffered for an off-loop parse
+            kwargs["extensions"] = {
+                **kwargs.get("extensions", {}),
+                DECODE_OFFLOAD_EXTENSION: False,
+            }
+            async with http.stream(**kwargs) as response:
+                if response.status_code != HTTPStatus.OK:
+                    await response.aread()
+                    unwrap(endpoint._build_response(client=self, response=response))
+                    return
+                from .json_stream import aiter_json_items
+
+                async for item in aiter_json_items(
+                    response.aiter_bytes(), json_codec=self.json_codec
+                ):
+                    count += 1
+                    yield item if item_type is None else item_type.from_dict(item)
+
+            pagination_info = _extract_pagination_info(
+                response.headers, {}, self.logger, self.json_codec
+            )
+            total_pages = (
+                pagination_info.get("total_pages") if pagination_info else None
+            )
+            if total_pages is not None:
+                if page_num >= total_pages:
+                    return
+            elif count < page_size:
+                return
+
+    # Bulk writes
+    async def bulk(
+        self,
+        operations: Iterable[BulkOperation] | AsyncIterable[BulkOperation],
+        /,
+        *,
+        concurrency: int | None = None,
+        checkpoint: str | Path | None = None,
+        max_attempts: int | None = None,
+        on_progress: Callable[[BulkProgress], None] | None = None,
+    ) -> BulkReport:
+        """Run many writes within the rate-limit budget, recording each outcome.
+
+        Operations run at most ``concurrency`` at a time with every request
+        tagged ``"bulk"`` priority (see :func:`request_priority`), so the rate
+        limiter paces them and interactive calls go first. A failed operation
+        is recorded and the batch carries on. The transport's retry policy
+        still applies; on top of it, an operation whose retries all ended in
+        ``429`` is re-run up to ``max_attempts`` times, while other failed
+        writes are never repeated.
+
+        Args:
+            operations: :class:`~katana_public_api_client.bulk.BulkOperation`
+                s to run, from a list or a (lazy) sync or async iterator.
+            concurrency: Maximum operations in flight. Defaults to
+                ``bulk.DEFAULT_BULK_CONCURRENCY`` (4).
+            checkpoint: JSON-lines file recording successful keys. Operations
+                already recorded there are skipped, so re-running the same
+                import after an interruption resumes it.
+            max_attempts: Runs per operation while it keeps being rate
+                limited. Defaults to ``bulk.DEFAULT_MAX_ATTEMPTS`` (3).
+            on_progress: Called with running totals and throughput after each
+                operation.
+
+        Returns:
+            A :class:`~katana_public_api_client.bulk.BulkReport` with
+            per-operation results, skipped keys and throughput.
+
+        Example:
+            >>> ops = [
+            ...     BulkOperation(
+            ...         key=f"po:{ref}",
+            ...         call=functools.partial(client.api.purchase_orders.create, body),
+            ...     )
+            ...     for ref, body in bodies.items()
+            ... ]
+            >>> report = await client.bulk(ops, checkpoint="po-import.jsonl")
+            >>> print(f"{len(report.failed)} failed, {report.throughput:.1f} ops/s")
+        """
+        from .bulk import DEFAULT_BULK_CONCURRENCY, DEFAULT_MAX_ATTEMPTS, run_bulk
+
+        with request_priority("bulk"):
+            return await run_bulk(
+                operations,
+                concurrency=DEFAULT_BULK_CONCURRENCY
+                if concurrency is None
+                else concurrency,
+                checkpoint=checkpoint,
+                max_attempts=DEFAULT_MAX_ATTEMPTS
+                if max_attempts is None
+                else max_attempts,
+                on_progress=on_progress,
+            )
+
     # Event hooks for observability
     async def _capture_pagination_metadata(self, response: httpx.Response) -> None:
         """Capture and store pagination metadata from response headers."""
@@ -1922,7 +3599,7 @@ class KatanaClient(AuthenticatedClient):
             x_pagination = response.headers.get("X-Pagination")
             if x_pagination:
                 try:
-                    pagination_info = json.loads(x_pagination)
+                    pagination_info = self.json_codec.loads(x_pagination)
                     self.logger.debug(f"Pagination metadata: {pagination_info}")
                     # Store pagination info for easy access
                     setattr(response, "pagination_info", pagination_info)  # noqa: B010
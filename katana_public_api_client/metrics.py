@@ -0,0 +1,679 @@
+"""In-process request metrics for ``KatanaClient``.
+
+Every ``KatanaClient`` owns a :class:`ClientMetrics` registry (``client.metrics``)
+that the transport chain (:class:`MetricsTransport` and the pagination and
+rate-limit layers) feeds as requests flow through it. It answers "where
+did the 60 requests/minute go?": each series is keyed by HTTP method and
+endpoint template (``/v1/products/{id}``, with numeric path segments folded),
+so one hot endpoint, retry storm or pagination sweep stands out.
+
+Per endpoint:
+
+- wire latency histogram (time to response headers, per HTTP request);
+- requests, responses by status, 429s and retries;
+- request and response bytes;
+- time spent waiting on the rate limiter;
+- auto-paginated calls and the pages they collected.
+
+Client-wide, reset-gate engagements (the server reported
+``X-Ratelimit-Remaining: 0``).
+
+Read the registry with :meth:`ClientMetrics.snapshot`, export it with
+:meth:`MetricsSnapshot.to_prometheus`, or stream observations into
+OpenTelemetry with :meth:`ClientMetrics.bind_opentelemetry` (or any callback
+via :meth:`ClientMetrics.add_listener`). OpenTelemetry is not a dependency:
+any object with the ``Meter`` API's ``create_counter`` / ``create_histogram``
+works.
+
+Example:
+    ```python
+    async with KatanaClient() as client:
+        await get_all_products.asyncio_detailed(client=client)
+        for name, endpoint in client.metrics.snapshot().endpoints.items():
+            print(name, endpoint.requests, endpoint.latency.quantile(0.95))
+    ```
+"""
+
+import asyncio
+import bisect
+import functools
+import itertools
+import math
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping, Sequence
+from typing import Any, cast
+
+import httpx
+from attrs import define
+from httpx import AsyncBaseTransport, AsyncHTTPTransport
+
+# Upper bounds (seconds) of the latency histogram buckets — Prometheus'
+# client defaults, which bracket Katana's typical 50 ms - 2 s responses.
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+MetricAttributes = Mapping[str, str | int]
+MetricListener = Callable[[str, float, MetricAttributes], None]
+"""``listener(name, value, attributes)``, called for every observation."""
+
+# Observation names passed to listeners, following the OpenTelemetry HTTP
+# client semantic conventions where one exists.
+REQUEST_DURATION = "http.client.request.duration"
+REQUEST_BODY_SIZE = "http.client.request.body.size"
+RESPONSE_BODY_SIZE = "http.client.response.body.size"
+RETRIES = "katana.client.retries"
+RATE_LIMITED = "katana.client.rate_limited"
+RATE_LIMIT_WAIT = "katana.client.rate_limit.wait"
+RESET_GATE_ENGAGEMENTS = "katana.client.rate_limit.reset_gate.engagements"
+PAGINATION_PAGES = "katana.client.pagination.pages"
+
+# name -> (instrument kind, unit, description) for ``bind_opentelemetry``
+_INSTRUMENTS: dict[str, tuple[str, str, str]] = {
+    REQUEST_DURATION: ("histogram", "s", "Time to response headers per request"),
+    REQUEST_BODY_SIZE: ("histogram", "By", "Request body size"),
+    RESPONSE_BODY_SIZE: ("histogram", "By", "Response body size"),
+    RETRIES: ("counter", "{request}", "Requests re-sent by a retry layer"),
+    RATE_LIMITED: ("counter", "{response}", "429 Too Many Requests responses"),
+    RATE_LIMIT_WAIT: ("histogram", "s", "Time spent waiting on the rate limiter"),
+    RESET_GATE_ENGAGEMENTS: (
+        "counter",
+        "{engagement}",
+        "Times the server reported an exhausted rate-limit window",
+    ),
+    PAGINATION_PAGES: ("histogram", "{page}", "Pages per auto-paginated request"),
+}
+
+
+def endpoint_template(path: str) -> str:
+    """Fold numeric path segments into ``{id}``: ``/v1/products/12`` → ``/v1/products/{id}``."""
+    return "/".join(
+        "{id}" if segment.isdigit() else segment for segment in path.split("/")
+    )
+
+
+@define(frozen=True)
+class LatencyHistogram:
+    """Bucketed latency observations.
+
+    Attributes:
+        bounds: Bucket upper bounds in seconds, ascending.
+        counts: Observations per bucket (not cumulative); one longer than
+            ``bounds``, the last entry counting observations above them all.
+        sum_seconds: Sum of every observation.
+    """
+
+    bounds: tuple[float, ...]
+    counts: tuple[int, ...]
+    sum_seconds: float
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return sum(self.counts)
+
+    @property
+    def mean_seconds(self) -> float:
+        """Average observation, or ``0.0`` before any."""
+        count = self.count
+        return self.sum_seconds / count if count else 0.0
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the ``q`` quantile.
+
+        Returns ``None`` before any observation and ``math.inf`` when the
+        quantile falls above the largest bound.
+        """
+        if not 0 <= q <= 1:
+            msg = f"q must be in [0, 1], got {q}"
+            raise ValueError(msg)
+        count = self.count
+        if not count:
+            return None
+        rank = max(1, math.ceil(q * count))
+        seen = 0
+        for bound, bucket in zip((*self.bounds, math.inf), self.counts, strict=True):
+            seen += bucket
+            if seen >= rank:
+                return bound
+        return math.inf
+
+
+@define(frozen=True)
+class EndpointMetrics:
+    """Counters for one ``(method, endpoint template)`` pair.
+
+    Attributes:
+        method: HTTP method.
+        path: Endpoint template, e.g. ``/v1/products/{id}``.
+        requests: HTTP requests sent, including retries and individual pages.
+        retries: Requests that were re-sends of an earlier attempt.
+        rate_limited: ``429 Too Many Requests`` responses.
+        errors: Requests that raised instead of returning a response.
+        status_counts: Responses by status code.
+        bytes_out: Request body bytes sent.
+        bytes_in: Response body bytes received (counted as bodies are read).
+        latency: Time to response headers per request.
+        rate_limit_wait_seconds: Time requests spent waiting on the rate
+            limiter before being sent.
+        paginated_calls: Auto-paginated calls, each one collection.
+        pages: Pages those calls collected.
+    """
+
+    method: str
+    path: str
+    requests: int
+    retries: int
+    rate_limited: int
+    errors: int
+    status_counts: dict[int, int]
+    bytes_out: int
+    bytes_in: int
+    latency: LatencyHistogram
+    rate_limit_wait_seconds: float
+    paginated_calls: int
+    pages: int
+
+
+@define(frozen=True)
+class MetricsSnapshot:
+    """Point-in-time copy of a :class:`ClientMetrics` registry.
+
+    Attributes:
+        endpoints: Per-endpoint counters keyed ``"METHOD /path/template"``.
+        reset_gate_engagements: Times the rate limiter closed its reset gate
+            because the server reported an exhausted window.
+    """
+
+    endpoints: dict[str, EndpointMetrics]
+    reset_gate_engagements: int
+
+    @property
+    def requests(self) -> int:
+        """HTTP requests sent across every endpoint."""
+        return sum(endpoint.requests for endpoint in self.endpoints.values())
+
+    @property
+    def rate_limited(self) -> int:
+        """429 responses across every endpoint."""
+        return sum(endpoint.rate_limited for endpoint in self.endpoints.values())
+
+    @property
+    def rate_limit_wait_seconds(self) -> float:
+        """Rate-limiter wait across every endpoint."""
+        return sum(
+            endpoint.rate_limit_wait_seconds for endpoint in self.endpoints.values()
+        )
+
+    def to_prometheus(self, namespace: str = "katana_client") -> str:
+        """Render the snapshot in the Prometheus text exposition format.
+
+        Args:
+            namespace: Prefix for every metric name.
+
+        Returns:
+            The exposition text, ending in a newline, ready to serve from a
+            ``/metrics`` handler.
+        """
+        lines: list[str] = []
+        endpoints = sorted(self.endpoints.values(), key=lambda e: (e.path, e.method))
+
+        def family(name: str, kind: str, help_text: str) -> str:
+            full = f"{namespace}_{name}"
+            lines.append(f"# HELP {full} {help_text}")
+            lines.append(f"# TYPE {full} {kind}")
+            return full
+
+        def sample(name: str, labels: dict[str, str], value: float) -> None:
+            rendered = ",".join(
+                f'{key}="{_escape_label(val)}"' for key, val in labels.items()
+            )
+            lines.append(f"{name}{{{rendered}}} {_format_value(value)}")
+
+        name = family(
+            "request_duration_seconds",
+            "histogram",
+            "Time to response headers per HTTP request.",
+        )
+        for endpoint in endpoints:
+            labels = {"method": endpoint.method, "endpoint": endpoint.path}
+            cumulative = 0
+            for bound, bucket in zip(
+                (*endpoint.latency.bounds, math.inf),
+                endpoint.latency.counts,
+                strict=True,
+            ):
+                cumulative += bucket
+                sample(
+                    f"{name}_bucket", {**labels, "le": _format_value(bound)}, cumulative
+                )
+            sample(f"{name}_sum", labels, endpoint.latency.sum_seconds)
+            sample(f"{name}_count", labels, cumulative)
+
+        name = family("responses_total", "counter", "HTTP responses by status code.")
+        for endpoint in endpoints:
+            for status, count in sorted(endpoint.status_counts.items()):
+                sample(
+                    name,
+                    {
+                        "method": endpoint.method,
+                        "endpoint": endpoint.path,
+                        "status": str(status),
+                    },
+                    count,
+                )
+
+        counters: Sequence[tuple[str, str, str]] = (
+            ("requests_total", "requests", "HTTP requests sent, including retries."),
+            ("retries_total", "retries", "HTTP requests re-sent by a retry layer."),
+            ("rate_limited_total", "rate_limited", "429 Too Many Requests responses."),
+            ("request_errors_total", "errors", "HTTP requests that raised."),
+            ("request_bytes_total", "bytes_out", "Request body bytes sent."),
+            ("response_bytes_total", "bytes_in", "Response body bytes received."),
+            (
+                "rate_limit_wait_seconds_total",
+                "rate_limit_wait_seconds",
+                "Time spent waiting on the rate limiter.",
+            ),
+            (
+                "paginated_requests_total",
+                "paginated_calls",
+                "Auto-paginated calls.",
+            ),
+            ("pagination_pages_total", "pages", "Pages collected by auto-pagination."),
+        )
+        for suffix, attribute, help_text in counters:
+            name = family(suffix, "counter", help_text)
+            for endpoint in endpoints:
+                sample(
+                    name,
+                    {"method": endpoint.method, "endpoint": endpoint.path},
+                    getattr(endpoint, attribute),
+                )
+
+        name = family(
+            "rate_limit_reset_gate_engagements_total",
+            "counter",
+            "Times the server reported an exhausted rate-limit window.",
+        )
+        lines.append(f"{name} {self.reset_gate_engagements}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _EndpointSeries:
+    """Mutable counters behind one :class:`EndpointMetrics`."""
+
+    __slots__ = (
+        "bytes_in",
+        "bytes_out",
+        "errors",
+        "latency_counts",
+        "latency_sum",
+        "pages",
+        "paginated_calls",
+        "rate_limit_wait",
+        "rate_limited",
+        "requests",
+        "retries",
+        "status_counts",
+    )
+
+    def __init__(self, buckets: int) -> None:
+        self.requests = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.errors = 0
+        self.status_counts: dict[int, int] = {}
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.latency_counts = [0] * (buckets + 1)
+        self.latency_sum = 0.0
+        self.rate_limit_wait = 0.0
+        self.paginated_calls = 0
+        self.pages = 0
+
+
+class ClientMetrics:
+    """Registry of request metrics, fed by the transport chain.
+
+    Observations are plain counter updates on the event loop's thread, cheap
+    enough to stay on for every request. Listeners (see :meth:`add_listener`)
+    are called synchronously with each observation; keep them fast.
+    """
+
+    def __init__(
+        self, latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    ) -> None:
+        """Create an empty registry.
+
+        Args:
+            latency_buckets: Upper bounds, in seconds, of the latency
+                histogram buckets. Must be positive and strictly ascending.
+        """
+        bounds = tuple(float(bound) for bound in latency_buckets)
+        if (
+            not bounds
+            or bounds[0] <= 0
+            or any(low >= high for low, high in itertools.pairwise(bounds))
+        ):
+            msg = (
+                "latency_buckets must be positive and strictly ascending, "
+                f"got {latency_buckets!r}"
+            )
+            raise ValueError(msg)
+        self._bounds = bounds
+        self._series: dict[tuple[str, str], _EndpointSeries] = {}
+        self._reset_gate_engagements = 0
+        self._listeners: list[MetricListener] = []
+
+    def add_listener(self, listener: MetricListener) -> None:
+        """Call ``listener(name, value, attributes)`` for every observation.
+
+        ``name`` is one of this module's observation names (e.g.
+        ``REQUEST_DURATION``); ``attributes`` carry ``http.request.method``
+        and ``url.template`` for per-endpoint observations, plus
+        ``http.response.status_code`` or ``error.type`` on durations.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: MetricListener) -> None:
+        """Stop calling a listener added with :meth:`add_listener`."""
+        self._listeners.remove(listener)
+
+    def bind_opentelemetry(self, meter: Any) -> MetricListener:
+        """Forward every observation to OpenTelemetry instruments.
+
+        Creates one histogram or counter per observation name on ``meter``
+        (an ``opentelemetry.metrics.Meter``, or anything with its
+        ``create_histogram`` / ``create_counter`` methods) and records into
+        it from then on.
+
+        Returns:
+            The listener that was added, for :meth:`remove_listener`.
+        """
+        instruments = {
+            name: (
+                meter.create_histogram(name, unit=unit, description=description)
+                if kind == "histogram"
+                else meter.create_counter(name, unit=unit, description=description)
+            )
+            for name, (kind, unit, description) in _INSTRUMENTS.items()
+        }
+
+        def forward(name: str, value: float, attributes: MetricAttributes) -> None:
+            instrument = instruments[name]
+            if _INSTRUMENTS[name][0] == "histogram":
+                instrument.record(value, attributes=dict(attributes))
+            else:
+                instrument.add(value, attributes=dict(attributes))
+
+        self.add_listener(forward)
+        return forward
+
+    def observe_request(
+        self,
+        method: str,
+        path: str,
+        *,
+        status_code: int | None,
+        seconds: float,
+        bytes_out: int = 0,
+        retry: bool = False,
+        error_type: str | None = None,
+    ) -> None:
+        """Record one HTTP request; ``status_code`` is ``None`` when it raised."""
+        series = self._get_series(method, path)
+        series.requests += 1
+        series.latency_counts[bisect.bisect_left(self._bounds, seconds)] += 1
+        series.latency_sum += seconds
+        series.bytes_out += bytes_out
+        if retry:
+            series.retries += 1
+        if status_code is None:
+            series.errors += 1
+        else:
+            series.status_counts[status_code] = (
+                series.status_counts.get(status_code, 0) + 1
+            )
+            if status_code == 429:
+                series.rate_limited += 1
+
+        if self._listeners:
+            attributes: dict[str, str | int] = {
+                "http.request.method": method,
+                "url.template": path,
+            }
+            self._emit(REQUEST_BODY_SIZE, bytes_out, attributes)
+            if retry:
+                self._emit(RETRIES, 1, attributes)
+            if status_code == 429:
+                self._emit(RATE_LIMITED, 1, attributes)
+            self._emit(
+                REQUEST_DURATION,
+                seconds,
+                {**attributes, "http.response.status_code": status_code}
+                if status_code is not None
+                else {**attributes, "error.type": error_type or "error"},
+            )
+
+    def observe_response_bytes(self, method: str, path: str, size: int) -> None:
+        """Record a response body of ``size`` bytes once it has been read."""
+        self._get_series(method, path).bytes_in += size
+        if self._listeners:
+            self._emit(
+                RESPONSE_BODY_SIZE,
+                size,
+                {"http.request.method": method, "url.template": path},
+            )
+
+    def observe_rate_limit_wait(self, method: str, path: str, seconds: float) -> None:
+        """Record time a request spent waiting on the rate limiter."""
+        self._get_series(method, path).rate_limit_wait += seconds
+        if self._listeners:
+            self._emit(
+                RATE_LIMIT_WAIT,
+                seconds,
+                {"http.request.method": method, "url.template": path},
+            )
+
+    def observe_reset_gate(self) -> None:
+        """Record the rate limiter closing its reset gate."""
+        self._reset_gate_engagements += 1
+        if self._listeners:
+            self._emit(RESET_GATE_ENGAGEMENTS, 1, {})
+
+    def observe_pagination(self, method: str, path: str, pages: int) -> None:
+        """Record an auto-paginated call that collected ``pages`` pages."""
+        series = self._get_series(method, path)
+        series.paginated_calls += 1
+        series.pages += pages
+        if self._listeners:
+            self._emit(
+                PAGINATION_PAGES,
+                pages,
+                {"http.request.method": method, "url.template": path},
+            )
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Return a frozen copy of every counter."""
+        return MetricsSnapshot(
+            endpoints={
+                f"{method} {path}": EndpointMetrics(
+                    method=method,
+                    path=path,
+                    requests=series.requests,
+                    retries=series.retries,
+                    rate_limited=series.rate_limited,
+                    errors=series.errors,
+                    status_counts=dict(series.status_counts),
+                    bytes_out=series.bytes_out,
+                    bytes_in=series.bytes_in,
+                    latency=LatencyHistogram(
+                        bounds=self._bounds,
+                        counts=tuple(series.latency_counts),
+                        sum_seconds=series.latency_sum,
+                    ),
+                    rate_limit_wait_seconds=series.rate_limit_wait,
+                    paginated_calls=series.paginated_calls,
+                    pages=series.pages,
+                )
+                for (method, path), series in self._series.items()
+            },
+            reset_gate_engagements=self._reset_gate_engagements,
+        )
+
+    def reset(self) -> None:
+        """Clear every counter (listeners stay registered)."""
+        self._series.clear()
+        self._reset_gate_engagements = 0
+
+    def _get_series(self, method: str, path: str) -> _EndpointSeries:
+        series = self._series.get((method, path))
+        if series is None:
+            series = self._series[method, path] = _EndpointSeries(len(self._bounds))
+        return series
+
+    def _emit(self, name: str, value: float, attributes: MetricAttributes) -> None:
+        for listener in self._listeners:
+            listener(name, value, attributes)
+
+
+def _request_body_size(request: httpx.Request) -> int:
+    """Bytes in ``request``'s body, or 0 while a streaming body is unread."""
+    try:
+        return len(request.content)
+    except httpx.RequestNotRead:
+        return 0
+
+
+class _CountingByteStream(httpx.AsyncByteStream, httpx.SyncByteStream):
+    """Response stream that reports the bytes it yielded once it is closed."""
+
+    def __init__(
+        self,
+        stream: httpx.AsyncByteStream | httpx.SyncByteStream,
+        on_close: Callable[[int], None],
+    ) -> None:
+        self._stream = stream
+        self._on_close: Callable[[int], None] | None = on_close
+        self._size = 0
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in cast(httpx.AsyncByteStream, self._stream):
+            self._size += len(chunk)
+            yield chunk
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in cast(httpx.SyncByteStream, self._stream):
+            self._size += len(chunk)
+            yield chunk
+
+    async def aclose(self) -> None:
+        await cast(httpx.AsyncByteStream, self._stream).aclose()
+        self._report()
+
+    def close(self) -> None:
+        cast(httpx.SyncByteStream, self._stream).close()
+        self._report()
+
+    def _report(self) -> None:
+        if self._on_close is not None:
+            self._on_close(self._size)
+            self._on_close = None
+
+
+class MetricsTransport(AsyncBaseTransport):
+    """
+    Transport layer that feeds a ``ClientMetrics`` registry.
+
+    Sits just above ``JSONCodecTransport`` so it sees every HTTP request that
+    actually goes out — each auto-paginated page and each retry attempt —
+    and times only the wire: rate-limit and concurrency waits happen above
+    it. Per request it records the endpoint template, status, time to
+    response headers and request body size; response body bytes are counted
+    as the body stream is consumed, so nothing is read early. A request
+    object seen before is a retry (both retry layers re-send the same
+    ``httpx.Request``).
+    """
+
+    def __init__(
+        self,
+        wrapped_transport: AsyncBaseTransport | None = None,
+        *,
+        metrics: ClientMetrics,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the metrics transport.
+
+        Args:
+            wrapped_transport: The transport to wrap. If None, creates a new AsyncHTTPTransport.
+            metrics: Registry to record into.
+            **kwargs: Additional arguments passed to AsyncHTTPTransport if wrapped_transport is None.
+        """
+        if wrapped_transport is None:
+            wrapped_transport = AsyncHTTPTransport(**kwargs)
+        self._wrapped_transport = wrapped_transport
+        self.metrics = metrics
+        self._sent: weakref.WeakSet[httpx.Request] = weakref.WeakSet()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Forward the request, recording it and (once read) its response body."""
+        method = request.method
+        path = endpoint_template(request.url.path)
+        retry = request in self._sent
+        self._sent.add(request)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            response = await self._wrapped_transport.handle_async_request(request)
+        except Exception as e:
+            self.metrics.observe_request(
+                method,
+                path,
+                status_code=None,
+                seconds=loop.time() - started,
+                bytes_out=_request_body_size(request),
+                retry=retry,
+                error_type=type(e).__name__,
+            )
+            raise
+        self.metrics.observe_request(
+            method,
+            path,
+            status_code=response.status_code,
+            seconds=loop.time() - started,
+            bytes_out=_request_body_size(request),
+            retry=retry,
+        )
+        response.stream = _CountingByteStream(
+            response.stream,
+            functools.partial(self.metrics.observe_response_bytes, method, path),
+        )
+        return response
+
+    async def aclose(self) -> None:
+        """Propagate close down the wrapped chain so inner transports release resources."""
+        await self._wrapped_transport.aclose()
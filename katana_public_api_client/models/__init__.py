@@ -1,616 +1,1119 @@
 """Contains all the data models used in inputs/outputs"""
 
-from .abc_classification import AbcClassification
-from .accounting_integration_type import AccountingIntegrationType
-from .additional_cost import AdditionalCost
-from .additional_cost_list_response import AdditionalCostListResponse
-from .additional_properties_validation_error import AdditionalPropertiesValidationError
-from .additional_properties_validation_error_code import (
-    AdditionalPropertiesValidationErrorCode,
-)
-from .additional_properties_validation_error_info import (
-    AdditionalPropertiesValidationErrorInfo,
-)
-from .address_entity_type import AddressEntityType
-from .archivable_deletable_entity import ArchivableDeletableEntity
-from .archivable_entity import ArchivableEntity
-from .assigned_operator import AssignedOperator
-from .base_entity import BaseEntity
-from .base_validation_error import BaseValidationError
-from .batch import Batch
-from .batch_create_bom_rows_request import BatchCreateBomRowsRequest
-from .batch_response import BatchResponse
-from .batch_stock import BatchStock
-from .batch_stock_list_response import BatchStockListResponse
-from .batch_stock_update import BatchStockUpdate
-from .batch_transaction import BatchTransaction
-from .batch_transaction_request import BatchTransactionRequest
-from .bin_inventory import BinInventory
-from .bin_inventory_granularity import BinInventoryGranularity
-from .bin_inventory_list_response import BinInventoryListResponse
-from .bin_transfer import BinTransfer
-from .bin_transfer_list_response import BinTransferListResponse
-from .bin_transfer_row import BinTransferRow
-from .bin_transfer_row_create_nested import BinTransferRowCreateNested
-from .bin_transfer_row_list_response import BinTransferRowListResponse
-from .bin_transfer_status import BinTransferStatus
-from .bin_transfer_traceability import BinTransferTraceability
-from .bin_transfer_traceability_request import BinTransferTraceabilityRequest
-from .bom_row import BomRow
-from .bom_row_list_response import BomRowListResponse
-from .clear_demand_forecast_request import ClearDemandForecastRequest
-from .clear_demand_forecast_request_periods_item import (
-    ClearDemandForecastRequestPeriodsItem,
-)
-from .coded_error_response import CodedErrorResponse
-from .const_validation_error import ConstValidationError
-from .const_validation_error_code import ConstValidationErrorCode
-from .const_validation_error_info import ConstValidationErrorInfo
-from .cost_distribution_method import CostDistributionMethod
-from .create_bin_transfer_request import CreateBinTransferRequest
-from .create_bin_transfer_row_request import CreateBinTransferRowRequest
-from .create_bom_row_request import CreateBomRowRequest
-from .create_custom_field_definition_request import CreateCustomFieldDefinitionRequest
-from .create_customer_address_request import CreateCustomerAddressRequest
-from .create_customer_request import CreateCustomerRequest
-from .create_customer_request_addresses_item import CreateCustomerRequestAddressesItem
-from .create_demand_forecast_request import CreateDemandForecastRequest
-from .create_demand_forecast_request_periods_item import (
-    CreateDemandForecastRequestPeriodsItem,
-)
-from .create_inventory_reorder_point_request import CreateInventoryReorderPointRequest
-from .create_inventory_safety_stock_level_request import (
-    CreateInventorySafetyStockLevelRequest,
-)
-from .create_manufacturing_order_operation_row_request import (
-    CreateManufacturingOrderOperationRowRequest,
-)
-from .create_manufacturing_order_operation_row_request_status import (
-    CreateManufacturingOrderOperationRowRequestStatus,
-)
-from .create_manufacturing_order_production_request import (
-    CreateManufacturingOrderProductionRequest,
-)
-from .create_manufacturing_order_recipe_row_request import (
-    CreateManufacturingOrderRecipeRowRequest,
-)
-from .create_manufacturing_order_recipe_row_request_batch_transactions_item import (
-    CreateManufacturingOrderRecipeRowRequestBatchTransactionsItem,
-)
-from .create_manufacturing_order_request import CreateManufacturingOrderRequest
-from .create_manufacturing_order_request_status import (
-    CreateManufacturingOrderRequestStatus,
-)
-from .create_material_request import CreateMaterialRequest
-from .create_outsourced_purchase_order_recipe_row_request import (
-    CreateOutsourcedPurchaseOrderRecipeRowRequest,
-)
-from .create_price_list_customer_request import CreatePriceListCustomerRequest
-from .create_price_list_customer_request_price_list_customers_item import (
-    CreatePriceListCustomerRequestPriceListCustomersItem,
-)
-from .create_price_list_request import CreatePriceListRequest
-from .create_price_list_row_request import CreatePriceListRowRequest
-from .create_price_list_row_request_price_list_rows_item import (
-    CreatePriceListRowRequestPriceListRowsItem,
-)
-from .create_product_operation_row_item import CreateProductOperationRowItem
-from .create_product_operation_rows_request import CreateProductOperationRowsRequest
-from .create_product_request import CreateProductRequest
-from .create_product_request_configs_item import CreateProductRequestConfigsItem
-from .create_purchase_order_additional_cost_row_request import (
-    CreatePurchaseOrderAdditionalCostRowRequest,
-)
-from .create_purchase_order_initial_status import CreatePurchaseOrderInitialStatus
-from .create_purchase_order_request import CreatePurchaseOrderRequest
-from .create_purchase_order_row_request import CreatePurchaseOrderRowRequest
-from .create_recipes_request import CreateRecipesRequest
-from .create_recipes_request_rows_item import CreateRecipesRequestRowsItem
-from .create_sales_order_address_request import CreateSalesOrderAddressRequest
-from .create_sales_order_fulfillment_request import CreateSalesOrderFulfillmentRequest
-from .create_sales_order_request import CreateSalesOrderRequest
-from .create_sales_order_request_addresses_item import (
-    CreateSalesOrderRequestAddressesItem,
-)
-from .create_sales_order_request_custom_fields_type_0 import (
-    CreateSalesOrderRequestCustomFieldsType0,
-)
-from .create_sales_order_request_sales_order_rows_item import (
-    CreateSalesOrderRequestSalesOrderRowsItem,
-)
-from .create_sales_order_request_sales_order_rows_item_attributes_item import (
-    CreateSalesOrderRequestSalesOrderRowsItemAttributesItem,
-)
-from .create_sales_order_request_sales_order_rows_item_custom_fields_type_0 import (
-    CreateSalesOrderRequestSalesOrderRowsItemCustomFieldsType0,
-)
-from .create_sales_order_row_request import CreateSalesOrderRowRequest
-from .create_sales_order_row_request_attributes_item import (
-    CreateSalesOrderRowRequestAttributesItem,
-)
-from .create_sales_order_row_request_custom_fields_type_0 import (
-    CreateSalesOrderRowRequestCustomFieldsType0,
-)
-from .create_sales_order_shipping_fee_request import CreateSalesOrderShippingFeeRequest
-from .create_sales_order_status import CreateSalesOrderStatus
-from .create_sales_return_request import CreateSalesReturnRequest
-from .create_sales_return_row_request import CreateSalesReturnRowRequest
-from .create_serial_number_failed_item import CreateSerialNumberFailedItem
-from .create_serial_number_failure_reason import CreateSerialNumberFailureReason
-from .create_serial_number_resource_type import CreateSerialNumberResourceType
-from .create_serial_numbers_request import CreateSerialNumbersRequest
-from .create_serial_numbers_response import CreateSerialNumbersResponse
-from .create_service_request import CreateServiceRequest
-from .create_service_variant_request import CreateServiceVariantRequest
-from .create_service_variant_request_custom_fields_item import (
-    CreateServiceVariantRequestCustomFieldsItem,
-)
-from .create_stock_adjustment_request import CreateStockAdjustmentRequest
-from .create_stock_adjustment_request_stock_adjustment_rows_item import (
-    CreateStockAdjustmentRequestStockAdjustmentRowsItem,
-)
-from .create_stock_transfer_request import CreateStockTransferRequest
-from .create_stocktake_request import CreateStocktakeRequest
-from .create_stocktake_request_stocktake_rows_item import (
-    CreateStocktakeRequestStocktakeRowsItem,
-)
-from .create_stocktake_row_request import CreateStocktakeRowRequest
-from .create_stocktake_row_request_stocktake_rows_item import (
-    CreateStocktakeRowRequestStocktakeRowsItem,
-)
-from .create_supplier_address_request import CreateSupplierAddressRequest
-from .create_supplier_request import CreateSupplierRequest
-from .create_tax_rate_request import CreateTaxRateRequest
-from .create_variant_request import CreateVariantRequest
-from .create_variant_request_config_attributes_item import (
-    CreateVariantRequestConfigAttributesItem,
-)
-from .create_variant_request_custom_fields_item import (
-    CreateVariantRequestCustomFieldsItem,
-)
-from .create_webhook_request import CreateWebhookRequest
-from .custom_field import CustomField
-from .custom_field_choice import CustomFieldChoice
-from .custom_field_choice_create import CustomFieldChoiceCreate
-from .custom_field_collection_resource_type import CustomFieldCollectionResourceType
-from .custom_field_definition import CustomFieldDefinition
-from .custom_field_definition_list_response import CustomFieldDefinitionListResponse
-from .custom_field_entity_type import CustomFieldEntityType
-from .custom_field_options import CustomFieldOptions
-from .custom_field_options_create import CustomFieldOptionsCreate
-from .custom_field_type import CustomFieldType
-from .custom_field_value import CustomFieldValue
-from .custom_fields_collection import CustomFieldsCollection
-from .custom_fields_collection_list_response import CustomFieldsCollectionListResponse
-from .customer import Customer
-from .customer_address import CustomerAddress
-from .customer_address_list_response import CustomerAddressListResponse
-from .customer_list_response import CustomerListResponse
-from .deletable_entity import DeletableEntity
-from .delete_serial_numbers_request import DeleteSerialNumbersRequest
-from .demand_forecast_period import DemandForecastPeriod
-from .demand_forecast_response import DemandForecastResponse
-from .dependencies_validation_error import DependenciesValidationError
-from .dependencies_validation_error_code import DependenciesValidationErrorCode
-from .dependencies_validation_error_info import DependenciesValidationErrorInfo
-from .detailed_error_response import DetailedErrorResponse
-from .document_send_status import DocumentSendStatus
-from .enum_validation_error import EnumValidationError
-from .enum_validation_error_code import EnumValidationErrorCode
-from .enum_validation_error_info import EnumValidationErrorInfo
-from .error_response import ErrorResponse
-from .exclusive_maximum_validation_error import ExclusiveMaximumValidationError
-from .exclusive_maximum_validation_error_code import ExclusiveMaximumValidationErrorCode
-from .exclusive_maximum_validation_error_info import ExclusiveMaximumValidationErrorInfo
-from .exclusive_maximum_validation_error_info_comparison import (
-    ExclusiveMaximumValidationErrorInfoComparison,
-)
-from .exclusive_minimum_validation_error import ExclusiveMinimumValidationError
-from .exclusive_minimum_validation_error_code import ExclusiveMinimumValidationErrorCode
-from .exclusive_minimum_validation_error_info import ExclusiveMinimumValidationErrorInfo
-from .exclusive_minimum_validation_error_info_comparison import (
-    ExclusiveMinimumValidationErrorInfoComparison,
-)
-from .factory import Factory
-from .factory_legal_address import FactoryLegalAddress
-from .find_purchase_orders_billing_status import FindPurchaseOrdersBillingStatus
-from .find_purchase_orders_extend_item import FindPurchaseOrdersExtendItem
-from .find_purchase_orders_status import FindPurchaseOrdersStatus
-from .format_validation_error import FormatValidationError
-from .format_validation_error_code import FormatValidationErrorCode
-from .format_validation_error_info import FormatValidationErrorInfo
-from .generic_validation_error import GenericValidationError
-from .get_all_inventory_point_extend_item import GetAllInventoryPointExtendItem
-from .get_all_materials_batch_tracked import GetAllMaterialsBatchTracked
-from .get_all_materials_extend_item import GetAllMaterialsExtendItem
-from .get_all_products_batch_tracked import GetAllProductsBatchTracked
-from .get_all_products_extend_item import GetAllProductsExtendItem
-from .get_all_products_serial_tracked import GetAllProductsSerialTracked
-from .get_all_sales_order_rows_extend_item import GetAllSalesOrderRowsExtendItem
-from .get_all_sales_order_rows_product_availability import (
-    GetAllSalesOrderRowsProductAvailability,
-)
-from .get_all_sales_orders_product_availability import (
-    GetAllSalesOrdersProductAvailability,
-)
-from .get_all_variants_extend_item import GetAllVariantsExtendItem
-from .get_material_extend_item import GetMaterialExtendItem
-from .get_product_extend_item import GetProductExtendItem
-from .get_purchase_order_extend_item import GetPurchaseOrderExtendItem
-from .get_sales_order_row_extend_item import GetSalesOrderRowExtendItem
-from .get_variant_extend_item import GetVariantExtendItem
-from .ingredient_availability import IngredientAvailability
-from .inventory import Inventory
-from .inventory_item import InventoryItem
-from .inventory_item_type import InventoryItemType
-from .inventory_list_response import InventoryListResponse
-from .inventory_movement import InventoryMovement
-from .inventory_movement_list_response import InventoryMovementListResponse
-from .inventory_movement_resource_type import InventoryMovementResourceType
-from .inventory_movement_resource_type_filter import InventoryMovementResourceTypeFilter
-from .inventory_reorder_point import InventoryReorderPoint
-from .inventory_reorder_point_response import InventoryReorderPointResponse
-from .inventory_safety_stock_level import InventorySafetyStockLevel
-from .inventory_safety_stock_level_response import InventorySafetyStockLevelResponse
-from .item_config import ItemConfig
-from .location import Location
-from .location_address import LocationAddress
-from .location_list_response import LocationListResponse
-from .make_to_order_manufacturing_order_request import (
-    MakeToOrderManufacturingOrderRequest,
-)
-from .manufacturing_operation_status import ManufacturingOperationStatus
-from .manufacturing_operation_type import ManufacturingOperationType
-from .manufacturing_order import ManufacturingOrder
-from .manufacturing_order_list_response import ManufacturingOrderListResponse
-from .manufacturing_order_operation_production import (
-    ManufacturingOrderOperationProduction,
-)
-from .manufacturing_order_operation_row import ManufacturingOrderOperationRow
-from .manufacturing_order_operation_row_list_response import (
-    ManufacturingOrderOperationRowListResponse,
-)
-from .manufacturing_order_production import ManufacturingOrderProduction
-from .manufacturing_order_production_ingredient import (
-    ManufacturingOrderProductionIngredient,
-)
-from .manufacturing_order_production_ingredient_response import (
-    ManufacturingOrderProductionIngredientResponse,
-)
-from .manufacturing_order_production_list_response import (
-    ManufacturingOrderProductionListResponse,
-)
-from .manufacturing_order_recipe_row import ManufacturingOrderRecipeRow
-from .manufacturing_order_recipe_row_batch_transactions_item import (
-    ManufacturingOrderRecipeRowBatchTransactionsItem,
-)
-from .manufacturing_order_recipe_row_list_response import (
-    ManufacturingOrderRecipeRowListResponse,
-)
-from .manufacturing_order_status import ManufacturingOrderStatus
-from .material import Material
-from .material_config import MaterialConfig
-from .material_list_response import MaterialListResponse
-from .material_type import MaterialType
-from .max_items_validation_error import MaxItemsValidationError
-from .max_items_validation_error_code import MaxItemsValidationErrorCode
-from .max_items_validation_error_info import MaxItemsValidationErrorInfo
-from .max_length_validation_error import MaxLengthValidationError
-from .max_length_validation_error_code import MaxLengthValidationErrorCode
-from .max_length_validation_error_info import MaxLengthValidationErrorInfo
-from .maximum_validation_error import MaximumValidationError
-from .maximum_validation_error_code import MaximumValidationErrorCode
-from .maximum_validation_error_info import MaximumValidationErrorInfo
-from .maximum_validation_error_info_comparison import (
-    MaximumValidationErrorInfoComparison,
-)
-from .min_items_validation_error import MinItemsValidationError
-from .min_items_validation_error_code import MinItemsValidationErrorCode
-from .min_items_validation_error_info import MinItemsValidationErrorInfo
-from .min_length_validation_error import MinLengthValidationError
-from .min_length_validation_error_code import MinLengthValidationErrorCode
-from .min_length_validation_error_info import MinLengthValidationErrorInfo
-from .minimum_validation_error import MinimumValidationError
-from .minimum_validation_error_code import MinimumValidationErrorCode
-from .minimum_validation_error_info import MinimumValidationErrorInfo
-from .minimum_validation_error_info_comparison import (
-    MinimumValidationErrorInfoComparison,
-)
-from .multiple_of_validation_error import MultipleOfValidationError
-from .multiple_of_validation_error_code import MultipleOfValidationErrorCode
-from .multiple_of_validation_error_info import MultipleOfValidationErrorInfo
-from .negative_stock import NegativeStock
-from .negative_stock_list_response import NegativeStockListResponse
-from .one_of_validation_error import OneOfValidationError
-from .one_of_validation_error_code import OneOfValidationErrorCode
-from .one_of_validation_error_info import OneOfValidationErrorInfo
-from .operator import Operator
-from .operator_list_response import OperatorListResponse
-from .operator_working_area import OperatorWorkingArea
-from .outsourced_purchase_order import OutsourcedPurchaseOrder
-from .outsourced_purchase_order_entity_type import OutsourcedPurchaseOrderEntityType
-from .outsourced_purchase_order_ingredient_availability import (
-    OutsourcedPurchaseOrderIngredientAvailability,
-)
-from .outsourced_purchase_order_recipe_row import OutsourcedPurchaseOrderRecipeRow
-from .outsourced_purchase_order_recipe_row_batch_transactions_item import (
-    OutsourcedPurchaseOrderRecipeRowBatchTransactionsItem,
-)
-from .outsourced_purchase_order_recipe_row_list_response import (
-    OutsourcedPurchaseOrderRecipeRowListResponse,
-)
-from .outsourced_recipe_ingredient_availability import (
-    OutsourcedRecipeIngredientAvailability,
-)
-from .pattern_validation_error import PatternValidationError
-from .pattern_validation_error_code import PatternValidationErrorCode
-from .pattern_validation_error_info import PatternValidationErrorInfo
-from .price_list import PriceList
-from .price_list_adjustment_method import PriceListAdjustmentMethod
-from .price_list_customer import PriceListCustomer
-from .price_list_customer_list_response import PriceListCustomerListResponse
-from .price_list_list_response import PriceListListResponse
-from .price_list_row import PriceListRow
-from .price_list_row_list_response import PriceListRowListResponse
-from .product import Product
-from .product_availability import ProductAvailability
-from .product_list_response import ProductListResponse
-from .product_operation_rerank import ProductOperationRerank
-from .product_operation_rerank_request import ProductOperationRerankRequest
-from .product_operation_row import ProductOperationRow
-from .product_operation_row_list_response import ProductOperationRowListResponse
-from .product_operation_type import ProductOperationType
-from .product_type import ProductType
-from .purchase_order_accounting_metadata import PurchaseOrderAccountingMetadata
-from .purchase_order_accounting_metadata_list_response import (
-    PurchaseOrderAccountingMetadataListResponse,
-)
-from .purchase_order_additional_cost_row import PurchaseOrderAdditionalCostRow
-from .purchase_order_additional_cost_row_list_response import (
-    PurchaseOrderAdditionalCostRowListResponse,
-)
-from .purchase_order_base import PurchaseOrderBase
-from .purchase_order_billing_status import PurchaseOrderBillingStatus
-from .purchase_order_document_status import PurchaseOrderDocumentStatus
-from .purchase_order_entity_type import PurchaseOrderEntityType
-from .purchase_order_list_response import PurchaseOrderListResponse
-from .purchase_order_receive_row import PurchaseOrderReceiveRow
-from .purchase_order_receive_row_batch_transactions_item import (
-    PurchaseOrderReceiveRowBatchTransactionsItem,
-)
-from .purchase_order_row import PurchaseOrderRow
-from .purchase_order_row_batch_transactions_item import (
-    PurchaseOrderRowBatchTransactionsItem,
-)
-from .purchase_order_row_list_response import PurchaseOrderRowListResponse
-from .purchase_order_row_request import PurchaseOrderRowRequest
-from .purchase_order_status import PurchaseOrderStatus
-from .recipe import Recipe
-from .recipe_list_response import RecipeListResponse
-from .regular_purchase_order import RegularPurchaseOrder
-from .regular_purchase_order_entity_type import RegularPurchaseOrderEntityType
-from .required_validation_error import RequiredValidationError
-from .required_validation_error_code import RequiredValidationErrorCode
-from .required_validation_error_info import RequiredValidationErrorInfo
-from .returnable_item import ReturnableItem
-from .sales_order import SalesOrder
-from .sales_order_accounting_metadata import SalesOrderAccountingMetadata
-from .sales_order_accounting_metadata_list_response import (
-    SalesOrderAccountingMetadataListResponse,
-)
-from .sales_order_address import SalesOrderAddress
-from .sales_order_address_list_response import SalesOrderAddressListResponse
-from .sales_order_custom_fields_type_0 import SalesOrderCustomFieldsType0
-from .sales_order_fulfillment import SalesOrderFulfillment
-from .sales_order_fulfillment_invoice_status import SalesOrderFulfillmentInvoiceStatus
-from .sales_order_fulfillment_invoice_status_filter import (
-    SalesOrderFulfillmentInvoiceStatusFilter,
-)
-from .sales_order_fulfillment_list_response import SalesOrderFulfillmentListResponse
-from .sales_order_fulfillment_row_request import SalesOrderFulfillmentRowRequest
-from .sales_order_fulfillment_sales_order_fulfillment_rows_item import (
-    SalesOrderFulfillmentSalesOrderFulfillmentRowsItem,
-)
-from .sales_order_fulfillment_sales_order_fulfillment_rows_item_batch_transactions_item import (
-    SalesOrderFulfillmentSalesOrderFulfillmentRowsItemBatchTransactionsItem,
-)
-from .sales_order_fulfillment_status import SalesOrderFulfillmentStatus
-from .sales_order_invoicing_status import SalesOrderInvoicingStatus
-from .sales_order_list_response import SalesOrderListResponse
-from .sales_order_production_status import SalesOrderProductionStatus
-from .sales_order_row import SalesOrderRow
-from .sales_order_row_attributes_item import SalesOrderRowAttributesItem
-from .sales_order_row_batch_transactions_item import SalesOrderRowBatchTransactionsItem
-from .sales_order_row_custom_fields_type_0 import SalesOrderRowCustomFieldsType0
-from .sales_order_row_list_response import SalesOrderRowListResponse
-from .sales_order_row_search_filter import SalesOrderRowSearchFilter
-from .sales_order_row_search_request import SalesOrderRowSearchRequest
-from .sales_order_row_search_where import SalesOrderRowSearchWhere
-from .sales_order_row_search_where_and_item import SalesOrderRowSearchWhereAndItem
-from .sales_order_row_search_where_or_item import SalesOrderRowSearchWhereOrItem
-from .sales_order_row_serial_number_transactions_item import (
-    SalesOrderRowSerialNumberTransactionsItem,
-)
-from .sales_order_row_serial_number_transactions_item_quantity import (
-    SalesOrderRowSerialNumberTransactionsItemQuantity,
-)
-from .sales_order_search_filter import SalesOrderSearchFilter
-from .sales_order_search_request import SalesOrderSearchRequest
-from .sales_order_search_where import SalesOrderSearchWhere
-from .sales_order_search_where_and_item import SalesOrderSearchWhereAndItem
-from .sales_order_search_where_or_item import SalesOrderSearchWhereOrItem
-from .sales_order_shipping_fee import SalesOrderShippingFee
-from .sales_order_shipping_fee_list_response import SalesOrderShippingFeeListResponse
-from .sales_order_status import SalesOrderStatus
-from .sales_return import SalesReturn
-from .sales_return_list_response import SalesReturnListResponse
-from .sales_return_reason import SalesReturnReason
-from .sales_return_refund_status import SalesReturnRefundStatus
-from .sales_return_row import SalesReturnRow
-from .sales_return_row_batch_transactions_item import (
-    SalesReturnRowBatchTransactionsItem,
-)
-from .sales_return_row_list_response import SalesReturnRowListResponse
-from .sales_return_status import SalesReturnStatus
-from .search_comparator import SearchComparator
-from .serial_number import SerialNumber
-from .serial_number_list_response import SerialNumberListResponse
-from .serial_number_resource_type import SerialNumberResourceType
-from .serial_number_stock import SerialNumberStock
-from .serial_number_stock_list_response import SerialNumberStockListResponse
-from .serial_number_stock_transactions_item import SerialNumberStockTransactionsItem
-from .service import Service
-from .service_list_response import ServiceListResponse
-from .service_type import ServiceType
-from .service_variant import ServiceVariant
-from .service_variant_custom_fields_type_0_item import (
-    ServiceVariantCustomFieldsType0Item,
-)
-from .stock_adjustment import StockAdjustment
-from .stock_adjustment_batch_transaction import StockAdjustmentBatchTransaction
-from .stock_adjustment_list_response import StockAdjustmentListResponse
-from .stock_adjustment_row import StockAdjustmentRow
-from .stock_transfer import StockTransfer
-from .stock_transfer_list_response import StockTransferListResponse
-from .stock_transfer_row import StockTransferRow
-from .stock_transfer_row_batch_transactions_item import (
-    StockTransferRowBatchTransactionsItem,
-)
-from .stock_transfer_row_request import StockTransferRowRequest
-from .stock_transfer_status import StockTransferStatus
-from .stocktake import Stocktake
-from .stocktake_list_response import StocktakeListResponse
-from .stocktake_row import StocktakeRow
-from .stocktake_row_list_response import StocktakeRowListResponse
-from .stocktake_status import StocktakeStatus
-from .storage_bin import StorageBin
-from .storage_bin_create import StorageBinCreate
-from .storage_bin_response import StorageBinResponse
-from .storage_bin_update import StorageBinUpdate
-from .supplier import Supplier
-from .supplier_address import SupplierAddress
-from .supplier_address_list_response import SupplierAddressListResponse
-from .supplier_address_request import SupplierAddressRequest
-from .supplier_list_response import SupplierListResponse
-from .tax_rate import TaxRate
-from .tax_rate_list_response import TaxRateListResponse
-from .traceability_request import TraceabilityRequest
-from .type_validation_error import TypeValidationError
-from .type_validation_error_code import TypeValidationErrorCode
-from .type_validation_error_info import TypeValidationErrorInfo
-from .unassigned_batch_transaction import UnassignedBatchTransaction
-from .unassigned_batch_transaction_list_response import (
-    UnassignedBatchTransactionListResponse,
-)
-from .unique_items_validation_error import UniqueItemsValidationError
-from .unique_items_validation_error_code import UniqueItemsValidationErrorCode
-from .unique_items_validation_error_info import UniqueItemsValidationErrorInfo
-from .unlink_manufacturing_order_request import UnlinkManufacturingOrderRequest
-from .unlink_variant_bin_location_request import UnlinkVariantBinLocationRequest
-from .updatable_entity import UpdatableEntity
-from .update_bin_transfer_request import UpdateBinTransferRequest
-from .update_bin_transfer_row_request import UpdateBinTransferRowRequest
-from .update_bin_transfer_status_request import UpdateBinTransferStatusRequest
-from .update_bom_row_request import UpdateBomRowRequest
-from .update_custom_field_definition_request import UpdateCustomFieldDefinitionRequest
-from .update_customer_address_request import UpdateCustomerAddressRequest
-from .update_customer_request import UpdateCustomerRequest
-from .update_manufacturing_order_operation_row_request import (
-    UpdateManufacturingOrderOperationRowRequest,
-)
-from .update_manufacturing_order_production_ingredient_request import (
-    UpdateManufacturingOrderProductionIngredientRequest,
-)
-from .update_manufacturing_order_production_request import (
-    UpdateManufacturingOrderProductionRequest,
-)
-from .update_manufacturing_order_recipe_row_request import (
-    UpdateManufacturingOrderRecipeRowRequest,
-)
-from .update_manufacturing_order_recipe_row_request_batch_transactions_item import (
-    UpdateManufacturingOrderRecipeRowRequestBatchTransactionsItem,
-)
-from .update_manufacturing_order_request import UpdateManufacturingOrderRequest
-from .update_material_request import UpdateMaterialRequest
-from .update_material_request_configs_item import UpdateMaterialRequestConfigsItem
-from .update_outsourced_purchase_order_recipe_row_request import (
-    UpdateOutsourcedPurchaseOrderRecipeRowRequest,
-)
-from .update_price_list_customer_request import UpdatePriceListCustomerRequest
-from .update_price_list_request import UpdatePriceListRequest
-from .update_price_list_row_request import UpdatePriceListRowRequest
-from .update_product_operation_row_request import UpdateProductOperationRowRequest
-from .update_product_request import UpdateProductRequest
-from .update_product_request_configs_item import UpdateProductRequestConfigsItem
-from .update_purchase_order_additional_cost_row_request import (
-    UpdatePurchaseOrderAdditionalCostRowRequest,
-)
-from .update_purchase_order_request import UpdatePurchaseOrderRequest
-from .update_purchase_order_row_request import UpdatePurchaseOrderRowRequest
-from .update_recipe_row_request import UpdateRecipeRowRequest
-from .update_sales_order_address_request import UpdateSalesOrderAddressRequest
-from .update_sales_order_fulfillment_request import UpdateSalesOrderFulfillmentRequest
-from .update_sales_order_request import UpdateSalesOrderRequest
-from .update_sales_order_request_custom_fields_type_0 import (
-    UpdateSalesOrderRequestCustomFieldsType0,
-)
-from .update_sales_order_row_request import UpdateSalesOrderRowRequest
-from .update_sales_order_row_request_attributes_item import (
-    UpdateSalesOrderRowRequestAttributesItem,
-)
-from .update_sales_order_row_request_custom_fields_type_0 import (
-    UpdateSalesOrderRowRequestCustomFieldsType0,
-)
-from .update_sales_order_row_request_serial_number_transactions_item import (
-    UpdateSalesOrderRowRequestSerialNumberTransactionsItem,
-)
-from .update_sales_order_shipping_fee_request import UpdateSalesOrderShippingFeeRequest
-from .update_sales_order_status import UpdateSalesOrderStatus
-from .update_sales_return_request import UpdateSalesReturnRequest
-from .update_sales_return_row_request import UpdateSalesReturnRowRequest
-from .update_service_request import UpdateServiceRequest
-from .update_stock_adjustment_request import UpdateStockAdjustmentRequest
-from .update_stock_transfer_request import UpdateStockTransferRequest
-from .update_stock_transfer_status_request import UpdateStockTransferStatusRequest
-from .update_stocktake_request import UpdateStocktakeRequest
-from .update_stocktake_row_request import UpdateStocktakeRowRequest
-from .update_supplier_address_request import UpdateSupplierAddressRequest
-from .update_supplier_request import UpdateSupplierRequest
-from .update_variant_request import UpdateVariantRequest
-from .update_variant_request_config_attributes_item import (
-    UpdateVariantRequestConfigAttributesItem,
-)
-from .update_variant_request_custom_fields_item import (
-    UpdateVariantRequestCustomFieldsItem,
-)
-from .update_webhook_request import UpdateWebhookRequest
-from .user import User
-from .user_info import UserInfo
-from .user_list_response import UserListResponse
-from .variant import Variant
-from .variant_config_attributes_type_0_item import VariantConfigAttributesType0Item
-from .variant_custom_fields_type_0_item import VariantCustomFieldsType0Item
-from .variant_default_storage_bin_link import VariantDefaultStorageBinLink
-from .variant_default_storage_bin_link_response import (
-    VariantDefaultStorageBinLinkResponse,
-)
-from .variant_list_response import VariantListResponse
-from .variant_response import VariantResponse
-from .variant_response_config_attributes_type_0_item import (
-    VariantResponseConfigAttributesType0Item,
-)
-from .variant_response_custom_fields_type_0_item import (
-    VariantResponseCustomFieldsType0Item,
-)
-from .variant_type import VariantType
-from .webhook import Webhook
-from .webhook_event import WebhookEvent
-from .webhook_event_payload import WebhookEventPayload
-from .webhook_event_payload_object import WebhookEventPayloadObject
-from .webhook_list_response import WebhookListResponse
-from .webhook_logs_export import WebhookLogsExport
-from .webhook_logs_export_request import WebhookLogsExportRequest
-from .webhook_logs_export_request_event import WebhookLogsExportRequestEvent
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .abc_classification import AbcClassification
+    from .accounting_integration_type import AccountingIntegrationType
+    from .additional_cost import AdditionalCost
+    from .additional_cost_list_response import AdditionalCostListResponse
+    from .additional_properties_validation_error import (
+        AdditionalPropertiesValidationError,
+    )
+    from .additional_properties_validation_error_code import (
+        AdditionalPropertiesValidationErrorCode,
+    )
+    from .additional_properties_validation_error_info import (
+        AdditionalPropertiesValidationErrorInfo,
+    )
+    from .address_entity_type import AddressEntityType
+    from .archivable_deletable_entity import ArchivableDeletableEntity
+    from .archivable_entity import ArchivableEntity
+    from .assigned_operator import AssignedOperator
+    from .base_entity import BaseEntity
+    from .base_validation_error import BaseValidationError
+    from .batch import Batch
+    from .batch_create_bom_rows_request import BatchCreateBomRowsRequest
+    from .batch_response import BatchResponse
+    from .batch_stock import BatchStock
+    from .batch_stock_list_response import BatchStockListResponse
+    from .batch_stock_update import BatchStockUpdate
+    from .batch_transaction import BatchTransaction
+    from .batch_transaction_request import BatchTransactionRequest
+    from .bin_inventory import BinInventory
+    from .bin_inventory_granularity import BinInventoryGranularity
+    from .bin_inventory_list_response import BinInventoryListResponse
+    from .bin_transfer import BinTransfer
+    from .bin_transfer_list_response import BinTransferListResponse
+    from .bin_transfer_row import BinTransferRow
+    from .bin_transfer_row_create_nested import BinTransferRowCreateNested
+    from .bin_transfer_row_list_response import BinTransferRowListResponse
+    from .bin_transfer_status import BinTransferStatus
+    from .bin_transfer_traceability import BinTransferTraceability
+    from .bin_transfer_traceability_request import BinTransferTraceabilityRequest
+    from .bom_row import BomRow
+    from .bom_row_list_response import BomRowListResponse
+    from .clear_demand_forecast_request import ClearDemandForecastRequest
+    from .clear_demand_forecast_request_periods_item import (
+        ClearDemandForecastRequestPeriodsItem,
+    )
+    from .coded_error_response import CodedErrorResponse
+    from .const_validation_error import ConstValidationError
+    from .const_validation_error_code import ConstValidationErrorCode
+    from .const_validation_error_info import ConstValidationErrorInfo
+    from .cost_distribution_method import CostDistributionMethod
+    from .create_bin_transfer_request import CreateBinTransferRequest
+    from .create_bin_transfer_row_request import CreateBinTransferRowRequest
+    from .create_bom_row_request import CreateBomRowRequest
+    from .create_custom_field_definition_request import (
+        CreateCustomFieldDefinitionRequest,
+    )
+    from .create_customer_address_request import CreateCustomerAddressRequest
+    from .create_customer_request import CreateCustomerRequest
+    from .create_customer_request_addresses_item import (
+        CreateCustomerRequestAddressesItem,
+    )
+    from .create_demand_forecast_request import CreateDemandForecastRequest
+    from .create_demand_forecast_request_periods_item import (
+        CreateDemandForecastRequestPeriodsItem,
+    )
+    from .create_inventory_reorder_point_request import (
+        CreateInventoryReorderPointRequest,
+    )
+    from .create_inventory_safety_stock_level_request import (
+        CreateInventorySafetyStockLevelRequest,
+    )
+    from .create_manufacturing_order_operation_row_request import (
+        CreateManufacturingOrderOperationRowRequest,
+    )
+    from .create_manufacturing_order_operation_row_request_status import (
+        CreateManufacturingOrderOperationRowRequestStatus,
+    )
+    from .create_manufacturing_order_production_request import (
+        CreateManufacturingOrderProductionRequest,
+    )
+    from .create_manufacturing_order_recipe_row_request import (
+        CreateManufacturingOrderRecipeRowRequest,
+    )
+    from .create_manufacturing_order_recipe_row_request_batch_transactions_item import (
+        CreateManufacturingOrderRecipeRowRequestBatchTransactionsItem,
+    )
+    from .create_manufacturing_order_request import CreateManufacturingOrderRequest
+    from .create_manufacturing_order_request_status import (
+        CreateManufacturingOrderRequestStatus,
+    )
+    from .create_material_request import CreateMaterialRequest
+    from .create_outsourced_purchase_order_recipe_row_request import (
+        CreateOutsourcedPurchaseOrderRecipeRowRequest,
+    )
+    from .create_price_list_customer_request import CreatePriceListCustomerRequest
+    from .create_price_list_customer_request_price_list_customers_item import (
+        CreatePriceListCustomerRequestPriceListCustomersItem,
+    )
+    from .create_price_list_request import CreatePriceListRequest
+    from .create_price_list_row_request import CreatePriceListRowRequest
+    from .create_price_list_row_request_price_list_rows_item import (
+        CreatePriceListRowRequestPriceListRowsItem,
+    )
+    from .create_product_operation_row_item import CreateProductOperationRowItem
+    from .create_product_operation_rows_request import CreateProductOperationRowsRequest
+    from .create_product_request import CreateProductRequest
+    from .create_product_request_configs_item import CreateProductRequestConfigsItem
+    from .create_purchase_order_additional_cost_row_request import (
+        CreatePurchaseOrderAdditionalCostRowRequest,
+    )
+    from .create_purchase_order_initial_status import CreatePurchaseOrderInitialStatus
+    from .create_purchase_order_request import CreatePurchaseOrderRequest
+    from .create_purchase_order_row_request import CreatePurchaseOrderRowRequest
+    from .create_recipes_request import CreateRecipesRequest
+    from .create_recipes_request_rows_item import CreateRecipesRequestRowsItem
+    from .create_sales_order_address_request import CreateSalesOrderAddressRequest
+    from .create_sales_order_fulfillment_request import (
+        CreateSalesOrderFulfillmentRequest,
+    )
+    from .create_sales_order_request import CreateSalesOrderRequest
+    from .create_sales_order_request_addresses_item import (
+        CreateSalesOrderRequestAddressesItem,
+    )
+    from .create_sales_order_request_custom_fields_type_0 import (
+        CreateSalesOrderRequestCustomFieldsType0,
+    )
+    from .create_sales_order_request_sales_order_rows_item import (
+        CreateSalesOrderRequestSalesOrderRowsItem,
+    )
+    from .create_sales_order_request_sales_order_rows_item_attributes_item import (
+        CreateSalesOrderRequestSalesOrderRowsItemAttributesItem,
+    )
+    from .create_sales_order_request_sales_order_rows_item_custom_fields_type_0 import (
+        CreateSalesOrderRequestSalesOrderRowsItemCustomFieldsType0,
+    )
+    from .create_sales_order_row_request import CreateSalesOrderRowRequest
+    from .create_sales_order_row_request_attributes_item import (
+        CreateSalesOrderRowRequestAttributesItem,
+    )
+    from .create_sales_order_row_request_custom_fields_type_0 import (
+        CreateSalesOrderRowRequestCustomFieldsType0,
+    )
+    from .create_sales_order_shipping_fee_request import (
+        CreateSalesOrderShippingFeeRequest,
+    )
+    from .create_sales_order_status import CreateSalesOrderStatus
+    from .create_sales_return_request import CreateSalesReturnRequest
+    from .create_sales_return_row_request import CreateSalesReturnRowRequest
+    from .create_serial_number_failed_item import CreateSerialNumberFailedItem
+    from .create_serial_number_failure_reason import CreateSerialNumberFailureReason
+    from .create_serial_number_resource_type import CreateSerialNumberResourceType
+    from .create_serial_numbers_request import CreateSerialNumbersRequest
+    from .create_serial_numbers_response import CreateSerialNumbersResponse
+    from .create_service_request import CreateServiceRequest
+    from .create_service_variant_request import CreateServiceVariantRequest
+    from .create_service_variant_request_custom_fields_item import (
+        CreateServiceVariantRequestCustomFieldsItem,
+    )
+    from .create_stock_adjustment_request import CreateStockAdjustmentRequest
+    from .create_stock_adjustment_request_stock_adjustment_rows_item import (
+        CreateStockAdjustmentRequestStockAdjustmentRowsItem,
+    )
+    from .create_stock_transfer_request import CreateStockTransferRequest
+    from .create_stocktake_request import CreateStocktakeRequest
+    from .create_stocktake_request_stocktake_rows_item import (
+        CreateStocktakeRequestStocktakeRowsItem,
+    )
+    from .create_stocktake_row_request import CreateStocktakeRowRequest
+    from .create_stocktake_row_request_stocktake_rows_item import (
+        CreateStocktakeRowRequestStocktakeRowsItem,
+    )
+    from .create_supplier_address_request import CreateSupplierAddressRequest
+    from .create_supplier_request import CreateSupplierRequest
+    from .create_tax_rate_request import CreateTaxRateRequest
+    from .create_variant_request import CreateVariantRequest
+    from .create_variant_request_config_attributes_item import (
+        CreateVariantRequestConfigAttributesItem,
+    )
+    from .create_variant_request_custom_fields_item import (
+        CreateVariantRequestCustomFieldsItem,
+    )
+    from .create_webhook_request import CreateWebhookRequest
+    from .custom_field import CustomField
+    from .custom_field_choice import CustomFieldChoice
+    from .custom_field_choice_create import CustomFieldChoiceCreate
+    from .custom_field_collection_resource_type import CustomFieldCollectionResourceType
+    from .custom_field_definition import CustomFieldDefinition
+    from .custom_field_definition_list_response import CustomFieldDefinitionListResponse
+    from .custom_field_entity_type import CustomFieldEntityType
+    from .custom_field_options import CustomFieldOptions
+    from .custom_field_options_create import CustomFieldOptionsCreate
+    from .custom_field_type import CustomFieldType
+    from .custom_field_value import CustomFieldValue
+    from .custom_fields_collection import CustomFieldsCollection
+    from .custom_fields_collection_list_response import (
+        CustomFieldsCollectionListResponse,
+    )
+    from .customer import Customer
+    from .customer_address import CustomerAddress
+    from .customer_address_list_response import CustomerAddressListResponse
+    from .customer_list_response import CustomerListResponse
+    from .deletable_entity import DeletableEntity
+    from .delete_serial_numbers_request import DeleteSerialNumbersRequest
+    from .demand_forecast_period import DemandForecastPeriod
+    from .demand_forecast_response import DemandForecastResponse
+    from .dependencies_validation_error import DependenciesValidationError
+    from .dependencies_validation_error_code import DependenciesValidationErrorCode
+    from .dependencies_validation_error_info import DependenciesValidationErrorInfo
+    from .detailed_error_response import DetailedErrorResponse
+    from .document_send_status import DocumentSendStatus
+    from .enum_validation_error import EnumValidationError
+    from .enum_validation_error_code import EnumValidationErrorCode
+    from .enum_validation_error_info import EnumValidationErrorInfo
+    from .error_response import ErrorResponse
+    from .exclusive_maximum_validation_error import ExclusiveMaximumValidationError
+    from .exclusive_maximum_validation_error_code import (
+        ExclusiveMaximumValidationErrorCode,
+    )
+    from .exclusive_maximum_validation_error_info import (
+        ExclusiveMaximumValidationErrorInfo,
+    )
+    from .exclusive_maximum_validation_error_info_comparison import (
+        ExclusiveMaximumValidationErrorInfoComparison,
+    )
+    from .exclusive_minimum_validation_error import ExclusiveMinimumValidationError
+    from .exclusive_minimum_validation_error_code import (
+        ExclusiveMinimumValidationErrorCode,
+    )
+    from .exclusive_minimum_validation_error_info import (
+        ExclusiveMinimumValidationErrorInfo,
+    )
+    from .exclusive_minimum_validation_error_info_comparison import (
+        ExclusiveMinimumValidationErrorInfoComparison,
+    )
+    from .factory import Factory
+    from .factory_legal_address import FactoryLegalAddress
+    from .find_purchase_orders_billing_status import FindPurchaseOrdersBillingStatus
+    from .find_purchase_orders_extend_item import FindPurchaseOrdersExtendItem
+    from .find_purchase_orders_status import FindPurchaseOrdersStatus
+    from .format_validation_error import FormatValidationError
+    from .format_validation_error_code import FormatValidationErrorCode
+    from .format_validation_error_info import FormatValidationErrorInfo
+    from .generic_validation_error import GenericValidationError
+    from .get_all_inventory_point_extend_item import GetAllInventoryPointExtendItem
+    from .get_all_materials_batch_tracked import GetAllMaterialsBatchTracked
+    from .get_all_materials_extend_item import GetAllMaterialsExtendItem
+    from .get_all_products_batch_tracked import GetAllProductsBatchTracked
+    from .get_all_products_extend_item import GetAllProductsExtendItem
+    from .get_all_products_serial_tracked import GetAllProductsSerialTracked
+    from .get_all_sales_order_rows_extend_item import GetAllSalesOrderRowsExtendItem
+    from .get_all_sales_order_rows_product_availability import (
+        GetAllSalesOrderRowsProductAvailability,
+    )
+    from .get_all_sales_orders_product_availability import (
+        GetAllSalesOrdersProductAvailability,
+    )
+    from .get_all_variants_extend_item import GetAllVariantsExtendItem
+    from .get_material_extend_item import GetMaterialExtendItem
+    from .get_product_extend_item import GetProductExtendItem
+    from .get_purchase_order_extend_item import GetPurchaseOrderExtendItem
+    from .get_sales_order_row_extend_item import GetSalesOrderRowExtendItem
+    from .get_variant_extend_item import GetVariantExtendItem
+    from .ingredient_availability import IngredientAvailability
+    from .inventory import Inventory
+    from .inventory_item import InventoryItem
+    from .inventory_item_type import InventoryItemType
+    from .inventory_list_response import InventoryListResponse
+    from .inventory_movement import InventoryMovement
+    from .inventory_movement_list_response import InventoryMovementListResponse
+    from .inventory_movement_resource_type import InventoryMovementResourceType
+    from .inventory_movement_resource_type_filter import (
+        InventoryMovementResourceTypeFilter,
+    )
+    from .inventory_reorder_point import InventoryReorderPoint
+    from .inventory_reorder_point_response import InventoryReorderPointResponse
+    from .inventory_safety_stock_level import InventorySafetyStockLevel
+    from .inventory_safety_stock_level_response import InventorySafetyStockLevelResponse
+    from .item_config import ItemConfig
+    from .location import Location
+    from .location_address import LocationAddress
+    from .location_list_response import LocationListResponse
+    from .make_to_order_manufacturing_order_request import (
+        MakeToOrderManufacturingOrderRequest,
+    )
+    from .manufacturing_operation_status import ManufacturingOperationStatus
+    from .manufacturing_operation_type import ManufacturingOperationType
+    from .manufacturing_order import ManufacturingOrder
+    from .manufacturing_order_list_response import ManufacturingOrderListResponse
+    from .manufacturing_order_operation_production import (
+        ManufacturingOrderOperationProduction,
+    )
+    from .manufacturing_order_operation_row import ManufacturingOrderOperationRow
+    from .manufacturing_order_operation_row_list_response import (
+        ManufacturingOrderOperationRowListResponse,
+    )
+    from .manufacturing_order_production import ManufacturingOrderProduction
+    from .manufacturing_order_production_ingredient import (
+        ManufacturingOrderProductionIngredient,
+    )
+    from .manufacturing_order_production_ingredient_response import (
+        ManufacturingOrderProductionIngredientResponse,
+    )
+    from .manufacturing_order_production_list_response import (
+        ManufacturingOrderProductionListResponse,
+    )
+    from .manufacturing_order_recipe_row import ManufacturingOrderRecipeRow
+    from .manufacturing_order_recipe_row_batch_transactions_item import (
+        ManufacturingOrderRecipeRowBatchTransactionsItem,
+    )
+    from .manufacturing_order_recipe_row_list_response import (
+        ManufacturingOrderRecipeRowListResponse,
+    )
+    from .manufacturing_order_status import ManufacturingOrderStatus
+    from .material import Material
+    from .material_config import MaterialConfig
+    from .material_list_response import MaterialListResponse
+    from .material_type import MaterialType
+    from .max_items_validation_error import MaxItemsValidationError
+    from .max_items_validation_error_code import MaxItemsValidationErrorCode
+    from .max_items_validation_error_info import MaxItemsValidationErrorInfo
+    from .max_length_validation_error import MaxLengthValidationError
+    from .max_length_validation_error_code import MaxLengthValidationErrorCode
+    from .max_length_validation_error_info import MaxLengthValidationErrorInfo
+    from .maximum_validation_error import MaximumValidationError
+    from .maximum_validation_error_code import MaximumValidationErrorCode
+    from .maximum_validation_error_info import MaximumValidationErrorInfo
+    from .maximum_validation_error_info_comparison import (
+        MaximumValidationErrorInfoComparison,
+    )
+    from .min_items_validation_error import MinItemsValidationError
+    from .min_items_validation_error_code import MinItemsValidationErrorCode
+    from .min_items_validation_error_info import MinItemsValidationErrorInfo
+    from .min_length_validation_error import MinLengthValidationError
+    from .min_length_validation_error_code import MinLengthValidationErrorCode
+    from .min_length_validation_error_info import MinLengthValidationErrorInfo
+    from .minimum_validation_error import MinimumValidationError
+    from .minimum_validation_error_code import MinimumValidationErrorCode
+    from .minimum_validation_error_info import MinimumValidationErrorInfo
+    from .minimum_validation_error_info_comparison import (
+        MinimumValidationErrorInfoComparison,
+    )
+    from .multiple_of_validation_error import MultipleOfValidationError
+    from .multiple_of_validation_error_code import MultipleOfValidationErrorCode
+    from .multiple_of_validation_error_info import MultipleOfValidationErrorInfo
+    from .negative_stock import NegativeStock
+    from .negative_stock_list_response import NegativeStockListResponse
+    from .one_of_validation_error import OneOfValidationError
+    from .one_of_validation_error_code import OneOfValidationErrorCode
+    from .one_of_validation_error_info import OneOfValidationErrorInfo
+    from .operator import Operator
+    from .operator_list_response import OperatorListResponse
+    from .operator_working_area import OperatorWorkingArea
+    from .outsourced_purchase_order import OutsourcedPurchaseOrder
+    from .outsourced_purchase_order_entity_type import OutsourcedPurchaseOrderEntityType
+    from .outsourced_purchase_order_ingredient_availability import (
+        OutsourcedPurchaseOrderIngredientAvailability,
+    )
+    from .outsourced_purchase_order_recipe_row import OutsourcedPurchaseOrderRecipeRow
+    from .outsourced_purchase_order_recipe_row_batch_transactions_item import (
+        OutsourcedPurchaseOrderRecipeRowBatchTransactionsItem,
+    )
+    from .outsourced_purchase_order_recipe_row_list_response import (
+        OutsourcedPurchaseOrderRecipeRowListResponse,
+    )
+    from .outsourced_recipe_ingredient_availability import (
+        OutsourcedRecipeIngredientAvailability,
+    )
+    from .pattern_validation_error import PatternValidationError
+    from .pattern_validation_error_code import PatternValidationErrorCode
+    from .pattern_validation_error_info import PatternValidationErrorInfo
+    from .price_list import PriceList
+    from .price_list_adjustment_method import PriceListAdjustmentMethod
+    from .price_list_customer import PriceListCustomer
+    from .price_list_customer_list_response import PriceListCustomerListResponse
+    from .price_list_list_response import PriceListListResponse
+    from .price_list_row import PriceListRow
+    from .price_list_row_list_response import PriceListRowListResponse
+    from .product import Product
+    from .product_availability import ProductAvailability
+    from .product_list_response import ProductListResponse
+    from .product_operation_rerank import ProductOperationRerank
+    from .product_operation_rerank_request import ProductOperationRerankRequest
+    from .product_operation_row import ProductOperationRow
+    from .product_operation_row_list_response import ProductOperationRowListResponse
+    from .product_operation_type import ProductOperationType
+    from .product_type import ProductType
+    from .purchase_order_accounting_metadata import PurchaseOrderAccountingMetadata
+    from .purchase_order_accounting_metadata_list_response import (
+        PurchaseOrderAccountingMetadataListResponse,
+    )
+    from .purchase_order_additional_cost_row import PurchaseOrderAdditionalCostRow
+    from .purchase_order_additional_cost_row_list_response import (
+        PurchaseOrderAdditionalCostRowListResponse,
+    )
+    from .purchase_order_base import PurchaseOrderBase
+    from .purchase_order_billing_status import PurchaseOrderBillingStatus
+    from .purchase_order_document_status import PurchaseOrderDocumentStatus
+    from .purchase_order_entity_type import PurchaseOrderEntityType
+    from .purchase_order_list_response import PurchaseOrderListResponse
+    from .purchase_order_receive_row import PurchaseOrderReceiveRow
+    from .purchase_order_receive_row_batch_transactions_item import (
+        PurchaseOrderReceiveRowBatchTransactionsItem,
+    )
+    from .purchase_order_row import PurchaseOrderRow
+    from .purchase_order_row_batch_transactions_item import (
+        PurchaseOrderRowBatchTransactionsItem,
+    )
+    from .purchase_order_row_list_response import PurchaseOrderRowListResponse
+    from .purchase_order_row_request import PurchaseOrderRowRequest
+    from .purchase_order_status import PurchaseOrderStatus
+    from .recipe import Recipe
+    from .recipe_list_response import RecipeListResponse
+    from .regular_purchase_order import RegularPurchaseOrder
+    from .regular_purchase_order_entity_type import RegularPurchaseOrderEntityType
+    from .required_validation_error import RequiredValidationError
+    from .required_validation_error_code import RequiredValidationErrorCode
+    from .required_validation_error_info import RequiredValidationErrorInfo
+    from .returnable_item import ReturnableItem
+    from .sales_order import SalesOrder
+    from .sales_order_accounting_metadata import SalesOrderAccountingMetadata
+    from .sales_order_accounting_metadata_list_response import (
+        SalesOrderAccountingMetadataListResponse,
+    )
+    from .sales_order_address import SalesOrderAddress
+    from .sales_order_address_list_response import SalesOrderAddressListResponse
+    from .sales_order_custom_fields_type_0 import SalesOrderCustomFieldsType0
+    from .sales_order_fulfillment import SalesOrderFulfillment
+    from .sales_order_fulfillment_invoice_status import (
+        SalesOrderFulfillmentInvoiceStatus,
+    )
+    from .sales_order_fulfillment_invoice_status_filter import (
+        SalesOrderFulfillmentInvoiceStatusFilter,
+    )
+    from .sales_order_fulfillment_list_response import SalesOrderFulfillmentListResponse
+    from .sales_order_fulfillment_row_request import SalesOrderFulfillmentRowRequest
+    from .sales_order_fulfillment_sales_order_fulfillment_rows_item import (
+        SalesOrderFulfillmentSalesOrderFulfillmentRowsItem,
+    )
+    from .sales_order_fulfillment_sales_order_fulfillment_rows_item_batch_transactions_item import (
+        SalesOrderFulfillmentSalesOrderFulfillmentRowsItemBatchTransactionsItem,
+    )
+    from .sales_order_fulfillment_status import SalesOrderFulfillmentStatus
+    from .sales_order_invoicing_status import SalesOrderInvoicingStatus
+    from .sales_order_list_response import SalesOrderListResponse
+    from .sales_order_production_status import SalesOrderProductionStatus
+    from .sales_order_row import SalesOrderRow
+    from .sales_order_row_attributes_item import SalesOrderRowAttributesItem
+    from .sales_order_row_batch_transactions_item import (
+        SalesOrderRowBatchTransactionsItem,
+    )
+    from .sales_order_row_custom_fields_type_0 import SalesOrderRowCustomFieldsType0
+    from .sales_order_row_list_response import SalesOrderRowListResponse
+    from .sales_order_row_search_filter import SalesOrderRowSearchFilter
+    from .sales_order_row_search_request import SalesOrderRowSearchRequest
+    from .sales_order_row_search_where import SalesOrderRowSearchWhere
+    from .sales_order_row_search_where_and_item import SalesOrderRowSearchWhereAndItem
+    from .sales_order_row_search_where_or_item import SalesOrderRowSearchWhereOrItem
+    from .sales_order_row_serial_number_transactions_item import (
+        SalesOrderRowSerialNumberTransactionsItem,
+    )
+    from .sales_order_row_serial_number_transactions_item_quantity import (
+        SalesOrderRowSerialNumberTransactionsItemQuantity,
+    )
+    from .sales_order_search_filter import SalesOrderSearchFilter
+    from .sales_order_search_request import SalesOrderSearchRequest
+    from .sales_order_search_where import SalesOrderSearchWhere
+    from .sales_order_search_where_and_item import SalesOrderSearchWhereAndItem
+    from .sales_order_search_where_or_item import SalesOrderSearchWhereOrItem
+    from .sales_order_shipping_fee import SalesOrderShippingFee
+    from .sales_order_shipping_fee_list_response import (
+        SalesOrderShippingFeeListResponse,
+    )
+    from .sales_order_status import SalesOrderStatus
+    from .sales_return import SalesReturn
+    from .sales_return_list_response import SalesReturnListResponse
+    from .sales_return_reason import SalesReturnReason
+    from .sales_return_refund_status import SalesReturnRefundStatus
+    from .sales_return_row import SalesReturnRow
+    from .sales_return_row_batch_transactions_item import (
+        SalesReturnRowBatchTransactionsItem,
+    )
+    from .sales_return_row_list_response import SalesReturnRowListResponse
+    from .sales_return_status import SalesReturnStatus
+    from .search_comparator import SearchComparator
+    from .serial_number import SerialNumber
+    from .serial_number_list_response import SerialNumberListResponse
+    from .serial_number_resource_type import SerialNumberResourceType
+    from .serial_number_stock import SerialNumberStock
+    from .serial_number_stock_list_response import SerialNumberStockListResponse
+    from .serial_number_stock_transactions_item import SerialNumberStockTransactionsItem
+    from .service import Service
+    from .service_list_response import ServiceListResponse
+    from .service_type import ServiceType
+    from .service_variant import ServiceVariant
+    from .service_variant_custom_fields_type_0_item import (
+        ServiceVariantCustomFieldsType0Item,
+    )
+    from .stock_adjustment import StockAdjustment
+    from .stock_adjustment_batch_transaction import StockAdjustmentBatchTransaction
+    from .stock_adjustment_list_response import StockAdjustmentListResponse
+    from .stock_adjustment_row import StockAdjustmentRow
+    from .stock_transfer import StockTransfer
+    from .stock_transfer_list_response import StockTransferListResponse
+    from .stock_transfer_row import StockTransferRow
+    from .stock_transfer_row_batch_transactions_item import (
+        StockTransferRowBatchTransactionsItem,
+    )
+    from .stock_transfer_row_request import StockTransferRowRequest
+    from .stock_transfer_status import StockTransferStatus
+    from .stocktake import Stocktake
+    from .stocktake_list_response import StocktakeListResponse
+    from .stocktake_row import StocktakeRow
+    from .stocktake_row_list_response import StocktakeRowListResponse
+    from .stocktake_status import StocktakeStatus
+    from .storage_bin import StorageBin
+    from .storage_bin_create import StorageBinCreate
+    from .storage_bin_response import StorageBinResponse
+    from .storage_bin_update import StorageBinUpdate
+    from .supplier import Supplier
+    from .supplier_address import SupplierAddress
+    from .supplier_address_list_response import SupplierAddressListResponse
+    from .supplier_address_request import SupplierAddressRequest
+    from .supplier_list_response import SupplierListResponse
+    from .tax_rate import TaxRate
+    from .tax_rate_list_response import TaxRateListResponse
+    from .traceability_request import TraceabilityRequest
+    from .type_validation_error import TypeValidationError
+    from .type_validation_error_code import TypeValidationErrorCode
+    from .type_validation_error_info import TypeValidationErrorInfo
+    from .unassigned_batch_transaction import UnassignedBatchTransaction
+    from .unassigned_batch_transaction_list_response import (
+        UnassignedBatchTransactionListResponse,
+    )
+    from .unique_items_validation_error import UniqueItemsValidationError
+    from .unique_items_validation_error_code import UniqueItemsValidationErrorCode
+    from .unique_items_validation_error_info import UniqueItemsValidationErrorInfo
+    from .unlink_manufacturing_order_request import UnlinkManufacturingOrderRequest
+    from .unlink_variant_bin_location_request import UnlinkVariantBinLocationRequest
+    from .updatable_entity import UpdatableEntity
+    from .update_bin_transfer_request import UpdateBinTransferRequest
+    from .update_bin_transfer_row_request import UpdateBinTransferRowRequest
+    from .update_bin_transfer_status_request import UpdateBinTransferStatusRequest
+    from .update_bom_row_request import UpdateBomRowRequest
+    from .update_custom_field_definition_request import (
+        UpdateCustomFieldDefinitionRequest,
+    )
+    from .update_customer_address_request import UpdateCustomerAddressRequest
+    from .update_customer_request import UpdateCustomerRequest
+    from .update_manufacturing_order_operation_row_request import (
+        UpdateManufacturingOrderOperationRowRequest,
+    )
+    from .update_manufacturing_order_production_ingredient_request import (
+        UpdateManufacturingOrderProductionIngredientRequest,
+    )
+    from .update_manufacturing_order_production_request import (
+        UpdateManufacturingOrderProductionRequest,
+    )
+    from .update_manufacturing_order_recipe_row_request import (
+        UpdateManufacturingOrderRecipeRowRequest,
+    )
+    from .update_manufacturing_order_recipe_row_request_batch_transactions_item import (
+        UpdateManufacturingOrderRecipeRowRequestBatchTransactionsItem,
+    )
+    from .update_manufacturing_order_request import UpdateManufacturingOrderRequest
+    from .update_material_request import UpdateMaterialRequest
+    from .update_material_request_configs_item import UpdateMaterialRequestConfigsItem
+    from .update_outsourced_purchase_order_recipe_row_request import (
+        UpdateOutsourcedPurchaseOrderRecipeRowRequest,
+    )
+    from .update_price_list_customer_request import UpdatePriceListCustomerRequest
+    from .update_price_list_request import UpdatePriceListRequest
+    from .update_price_list_row_request import UpdatePriceListRowRequest
+    from .update_product_operation_row_request import UpdateProductOperationRowRequest
+    from .update_product_request import UpdateProductRequest
+    from .update_product_request_configs_item import UpdateProductRequestConfigsItem
+    from .update_purchase_order_additional_cost_row_request import (
+        UpdatePurchaseOrderAdditionalCostRowRequest,
+    )
+    from .update_purchase_order_request import UpdatePurchaseOrderRequest
+    from .update_purchase_order_row_request import UpdatePurchaseOrderRowRequest
+    from .update_recipe_row_request import UpdateRecipeRowRequest
+    from .update_sales_order_address_request import UpdateSalesOrderAddressRequest
+    from .update_sales_order_fulfillment_request import (
+        UpdateSalesOrderFulfillmentRequest,
+    )
+    from .update_sales_order_request import UpdateSalesOrderRequest
+    from .update_sales_order_request_custom_fields_type_0 import (
+        UpdateSalesOrderRequestCustomFieldsType0,
+    )
+    from .update_sales_order_row_request import UpdateSalesOrderRowRequest
+    from .update_sales_order_row_request_attributes_item import (
+        UpdateSalesOrderRowRequestAttributesItem,
+    )
+    from .update_sales_order_row_request_custom_fields_type_0 import (
+        UpdateSalesOrderRowRequestCustomFieldsType0,
+    )
+    from .update_sales_order_row_request_serial_number_transactions_item import (
+        UpdateSalesOrderRowRequestSerialNumberTransactionsItem,
+    )
+    from .update_sales_order_shipping_fee_request import (
+        UpdateSalesOrderShippingFeeRequest,
+    )
+    from .update_sales_order_status import UpdateSalesOrderStatus
+    from .update_sales_return_request import UpdateSalesReturnRequest
+    from .update_sales_return_row_request import UpdateSalesReturnRowRequest
+    from .update_service_request import UpdateServiceRequest
+    from .update_stock_adjustment_request import UpdateStockAdjustmentRequest
+    from .update_stock_transfer_request import UpdateStockTransferRequest
+    from .update_stock_transfer_status_request import UpdateStockTransferStatusRequest
+    from .update_stocktake_request import UpdateStocktakeRequest
+    from .update_stocktake_row_request import UpdateStocktakeRowRequest
+    from .update_supplier_address_request import UpdateSupplierAddressRequest
+    from .update_supplier_request import UpdateSupplierRequest
+    from .update_variant_request import UpdateVariantRequest
+    from .update_variant_request_config_attributes_item import (
+        UpdateVariantRequestConfigAttributesItem,
+    )
+    from .update_variant_request_custom_fields_item import (
+        UpdateVariantRequestCustomFieldsItem,
+    )
+    from .update_webhook_request import UpdateWebhookRequest
+    from .user import User
+    from .user_info import UserInfo
+    from .user_list_response import UserListResponse
+    from .variant import Variant
+    from .variant_config_attributes_type_0_item import VariantConfigAttributesType0Item
+    from .variant_custom_fields_type_0_item import VariantCustomFieldsType0Item
+    from .variant_default_storage_bin_link import VariantDefaultStorageBinLink
+    from .variant_default_storage_bin_link_response import (
+        VariantDefaultStorageBinLinkResponse,
+    )
+    from .variant_list_response import VariantListResponse
+    from .variant_response import VariantResponse
+    from .variant_response_config_attributes_type_0_item import (
+        VariantResponseConfigAttributesType0Item,
+    )
+    from .variant_response_custom_fields_type_0_item import (
+        VariantResponseCustomFieldsType0Item,
+    )
+    from .variant_type import VariantType
+    from .webhook import Webhook
+    from .webhook_event import WebhookEvent
+    from .webhook_event_payload import WebhookEventPayload
+    from .webhook_event_payload_object import WebhookEventPayloadObject
+    from .webhook_list_response import WebhookListResponse
+    from .webhook_logs_export import WebhookLogsExport
+    from .webhook_logs_export_request import WebhookLogsExportRequest
+    from .webhook_logs_export_request_event import WebhookLogsExportRequestEvent
+
+# Public name -> submodule defining it, imported on first access
+_MODULES: dict[str, str] = {
+    "AbcClassification": "abc_classification",
+    "AccountingIntegrationType": "accounting_integration_type",
+    "AdditionalCost": "additional_cost",
+    "AdditionalCostListResponse": "additional_cost_list_response",
+    "AdditionalPropertiesValidationError": "additional_properties_validation_error",
+    "AdditionalPropertiesValidationErrorCode": "additional_properties_validation_error_code",
+    "AdditionalPropertiesValidationErrorInfo": "additional_properties_validation_error_info",
+    "AddressEntityType": "address_entity_type",
+    "ArchivableDeletableEntity": "archivable_deletable_entity",
+    "ArchivableEntity": "archivable_entity",
+    "AssignedOperator": "assigned_operator",
+    "BaseEntity": "base_entity",
+    "BaseValidationError": "base_validation_error",
+    "Batch": "batch",
+    "BatchCreateBomRowsRequest": "batch_create_bom_rows_request",
+    "BatchResponse": "batch_response",
+    "BatchStock": "batch_stock",
+    "BatchStockListResponse": "batch_stock_list_response",
+    "BatchStockUpdate": "batch_stock_update",
+    "BatchTransaction": "batch_transaction",
+    "BatchTransactionRequest": "batch_transaction_request",
+    "BinInventory": "bin_inventory",
+    "BinInventoryGranularity": "bin_inventory_granularity",
+    "BinInventoryListResponse": "bin_inventory_list_response",
+    "BinTransfer": "bin_transfer",
+    "BinTransferListResponse": "bin_transfer_list_response",
+    "BinTransferRow": "bin_transfer_row",
+    "BinTransferRowCreateNested": "bin_transfer_row_create_nested",
+    "BinTransferRowListResponse": "bin_transfer_row_list_response",
+    "BinTransferStatus": "bin_transfer_status",
+    "BinTransferTraceability": "bin_transfer_traceability",
+    "BinTransferTraceabilityRequest": "bin_transfer_traceability_request",
+    "BomRow": "bom_row",
+    "BomRowListResponse": "bom_row_list_response",
+    "ClearDemandForecastRequest": "clear_demand_forecast_request",
+    "ClearDemandForecastRequestPeriodsItem": "clear_demand_forecast_request_periods_item",
+    "CodedErrorResponse": "coded_error_response",
+    "ConstValidationError": "const_validation_error",
+    "ConstValidationErrorCode": "const_validation_error_code",
+    "ConstValidationErrorInfo": "const_validation_error_info",
+    "CostDistributionMethod": "cost_distribution_method",
+    "CreateBinTransferRequest": "create_bin_transfer_request",
+    "CreateBinTransferRowRequest": "create_bin_transfer_row_request",
+    "CreateBomRowRequest": "create_bom_row_request",
+    "CreateCustomFieldDefinitionRequest": "create_custom_field_definition_request",
+    "CreateCustomerAddressRequest": "create_customer_address_request",
+    "CreateCustomerRequest": "create_customer_request",
+    "CreateCustomerRequestAddressesItem": "create_customer_request_addresses_item",
+    "CreateDemandForecastRequest": "create_demand_forecast_request",
+    "CreateDemandForecastRequestPeriodsItem": "create_demand_forecast_request_periods_item",
+    "CreateInventoryReorderPointRequest": "create_inventory_reorder_point_request",
+    "CreateInventorySafetyStockLevelRequest": "create_inventory_safety_stock_level_request",
+    "CreateManufacturingOrderOperationRowRequest": "create_manufacturing_order_operation_row_request",
+    "CreateManufacturingOrderOperationRowRequestStatus": "create_manufacturing_order_operation_row_request_status",
+    "CreateManufacturingOrderProductionRequest": "create_manufacturing_order_production_request",
+    "CreateManufacturingOrderRecipeRowRequest": "create_manufacturing_order_recipe_row_request",
+    "CreateManufacturingOrderRecipeRowRequestBatchTransactionsItem": "create_manufacturing_order_recipe_row_request_batch_transactions_item",
+    "CreateManufacturingOrderRequest": "create_manufacturing_order_request",
+    "CreateManufacturingOrderRequestStatus": "create_manufacturing_order_request_status",
+    "CreateMaterialRequest": "create_material_request",
+    "CreateOutsourcedPurchaseOrderRecipeRowRequest": "create_outsourced_purchase_order_recipe_row_request",
+    "CreatePriceListCustomerRequest": "create_price_list_customer_request",
+    "CreatePriceListCustomerRequestPriceListCustomersItem": "create_price_list_customer_request_price_list_customers_item",
+    "CreatePriceListRequest": "create_price_list_request",
+    "CreatePriceListRowRequest": "create_price_list_row_request",
+    "CreatePriceListRowRequestPriceListRowsItem": "create_price_list_row_request_price_list_rows_item",
+    "CreateProductOperationRowItem": "create_product_operation_row_item",
+    "CreateProductOperationRowsRequest": "create_product_operation_rows_request",
+    "CreateProductRequest": "create_product_request",
+    "CreateProductRequestConfigsItem": "create_product_request_configs_item",
+    "CreatePurchaseOrderAdditionalCostRowRequest": "create_purchase_order_additional_cost_row_request",
+    "CreatePurchaseOrderInitialStatus": "create_purchase_order_initial_status",
+    "CreatePurchaseOrderRequest": "create_purchase_order_request",
+    "CreatePurchaseOrderRowRequest": "create_purchase_order_row_request",
+    "CreateRecipesRequest": "create_recipes_request",
+    "CreateRecipesRequestRowsItem": "create_recipes_request_rows_item",
+    "CreateSalesOrderAddressRequest": "create_sales_order_address_request",
+    "CreateSalesOrderFulfillmentRequest": "create_sales_order_fulfillment_request",
+    "CreateSalesOrderRequest": "create_sales_order_request",
+    "CreateSalesOrderRequestAddressesItem": "create_sales_order_request_addresses_item",
+    "CreateSalesOrderRequestCustomFieldsType0": "create_sales_order_request_custom_fields_type_0",
+    "CreateSalesOrderRequestSalesOrderRowsItem": "create_sales_order_request_sales_order_rows_item",
+    "CreateSalesOrderRequestSalesOrderRowsItemAttributesItem": "create_sales_order_request_sales_order_rows_item_attributes_item",
+    "CreateSalesOrderRequestSalesOrderRowsItemCustomFieldsType0": "create_sales_order_request_sales_order_rows_item_custom_fields_type_0",
+    "CreateSalesOrderRowRequest": "create_sales_order_row_request",
+    "CreateSalesOrderRowRequestAttributesItem": "create_sales_order_row_request_attributes_item",
+    "CreateSalesOrderRowRequestCustomFieldsType0": "create_sales_order_row_request_custom_fields_type_0",
+    "CreateSalesOrderShippingFeeRequest": "create_sales_order_shipping_fee_request",
+    "CreateSalesOrderStatus": "create_sales_order_status",
+    "CreateSalesReturnRequest": "create_sales_return_request",
+    "CreateSalesReturnRowRequest": "create_sales_return_row_request",
+    "CreateSerialNumberFailedItem": "create_serial_number_failed_item",
+    "CreateSerialNumberFailureReason": "create_serial_number_failure_reason",
+    "CreateSerialNumberResourceType": "create_serial_number_resource_type",
+    "CreateSerialNumbersRequest": "create_serial_numbers_request",
+    "CreateSerialNumbersResponse": "create_serial_numbers_response",
+    "CreateServiceRequest": "create_service_request",
+    "CreateServiceVariantRequest": "create_service_variant_request",
+    "CreateServiceVariantRequestCustomFieldsItem": "create_service_variant_request_custom_fields_item",
+    "CreateStockAdjustmentRequest": "create_stock_adjustment_request",
+    "CreateStockAdjustmentRequestStockAdjustmentRowsItem": "create_stock_adjustment_request_stock_adjustment_rows_item",
+    "CreateStockTransferRequest": "create_stock_transfer_request",
+    "CreateStocktakeRequest": "create_stocktake_request",
+    "CreateStocktakeRequestStocktakeRowsItem": "create_stocktake_request_stocktake_rows_item",
+    "CreateStocktakeRowRequest": "create_stocktake_row_request",
+    "CreateStocktakeRowRequestStocktakeRowsItem": "create_stocktake_row_request_stocktake_rows_item",
+    "CreateSupplierAddressRequest": "create_supplier_address_request",
+    "CreateSupplierRequest": "create_supplier_request",
+    "CreateTaxRateRequest": "create_tax_rate_request",
+    "CreateVariantRequest": "create_variant_request",
+    "CreateVariantRequestConfigAttributesItem": "create_variant_request_config_attributes_item",
+    "CreateVariantRequestCustomFieldsItem": "create_variant_request_custom_fields_item",
+    "CreateWebhookRequest": "create_webhook_request",
+    "CustomField": "custom_field",
+    "CustomFieldChoice": "custom_field_choice",
+    "CustomFieldChoiceCreate": "custom_field_choice_create",
+    "CustomFieldCollectionResourceType": "custom_field_collection_resource_type",
+    "CustomFieldDefinition": "custom_field_definition",
+    "CustomFieldDefinitionListResponse": "custom_field_definition_list_response",
+    "CustomFieldEntityType": "custom_field_entity_type",
+    "CustomFieldOptions": "custom_field_options",
+    "CustomFieldOptionsCreate": "custom_field_options_create",
+    "CustomFieldType": "custom_field_type",
+    "CustomFieldValue": "custom_field_value",
+    "CustomFieldsCollection": "custom_fields_collection",
+    "CustomFieldsCollectionListResponse": "custom_fields_collection_list_response",
+    "Customer": "customer",
+    "CustomerAddress": "customer_address",
+    "CustomerAddressListResponse": "customer_address_list_response",
+    "CustomerListResponse": "customer_list_response",
+    "DeletableEntity": "deletable_entity",
+    "DeleteSerialNumbersRequest": "delete_serial_numbers_request",
+    "DemandForecastPeriod": "demand_forecast_period",
+    "DemandForecastResponse": "demand_forecast_response",
+    "DependenciesValidationError": "dependencies_validation_error",
+    "DependenciesValidationErrorCode": "dependencies_validation_error_code",
+    "DependenciesValidationErrorInfo": "dependencies_validation_error_info",
+    "DetailedErrorResponse": "detailed_error_response",
+    "DocumentSendStatus": "document_send_status",
+    "EnumValidationError": "enum_validation_error",
+    "EnumValidationErrorCode": "enum_validation_error_code",
+    "EnumValidationErrorInfo": "enum_validation_error_info",
+    "ErrorResponse": "error_response",
+    "ExclusiveMaximumValidationError": "exclusive_maximum_validation_error",
+    "ExclusiveMaximumValidationErrorCode": "exclusive_maximum_validation_error_code",
+    "ExclusiveMaximumValidationErrorInfo": "exclusive_maximum_validation_error_info",
+    "ExclusiveMaximumValidationErrorInfoComparison": "exclusive_maximum_validation_error_info_comparison",
+    "ExclusiveMinimumValidationError": "exclusive_minimum_validation_error",
+    "ExclusiveMinimumValidationErrorCode": "exclusive_minimum_validation_error_code",
+    "ExclusiveMinimumValidationErrorInfo": "exclusive_minimum_validation_error_info",
+    "ExclusiveMinimumValidationErrorInfoComparison": "exclusive_minimum_validation_error_info_comparison",
+    "Factory": "factory",
+    "FactoryLegalAddress": "factory_legal_address",
+    "FindPurchaseOrdersBillingStatus": "find_purchase_orders_billing_status",
+    "FindPurchaseOrdersExtendItem": "find_purchase_orders_extend_item",
+    "FindPurchaseOrdersStatus": "find_purchase_orders_status",
+    "FormatValidationError": "format_validation_error",
+    "FormatValidationErrorCode": "format_validation_error_code",
+    "FormatValidationErrorInfo": "format_validation_error_info",
+    "GenericValidationError": "generic_validation_error",
+    "GetAllInventoryPointExtendItem": "get_all_inventory_point_extend_item",
+    "GetAllMaterialsBatchTracked": "get_all_materials_batch_tracked",
+    "GetAllMaterialsExtendItem": "get_all_materials_extend_item",
+    "GetAllProductsBatchTracked": "get_all_products_batch_tracked",
+    "GetAllProductsExtendItem": "get_all_products_extend_item",
+    "GetAllProductsSerialTracked": "get_all_products_serial_tracked",
+    "GetAllSalesOrderRowsExtendItem": "get_all_sales_order_rows_extend_item",
+    "GetAllSalesOrderRowsProductAvailability": "get_all_sales_order_rows_product_availability",
+    "GetAllSalesOrdersProductAvailability": "get_all_sales_orders_product_availability",
+    "GetAllVariantsExtendItem": "get_all_variants_extend_item",
+    "GetMaterialExtendItem": "get_material_extend_item",
+    "GetProductExtendItem": "get_product_extend_item",
+    "GetPurchaseOrderExtendItem": "get_purchase_order_extend_item",
+    "GetSalesOrderRowExtendItem": "get_sales_order_row_extend_item",
+    "GetVariantExtendItem": "get_variant_extend_item",
+    "IngredientAvailability": "ingredient_availability",
+    "Inventory": "inventory",
+    "InventoryItem": "inventory_item",
+    "InventoryItemType": "inventory_item_type",
+    "InventoryListResponse": "inventory_list_response",
+    "InventoryMovement": "inventory_movement",
+    "InventoryMovementListResponse": "inventory_movement_list_response",
+    "InventoryMovementResourceType": "inventory_movement_resource_type",
+    "InventoryMovementResourceTypeFilter": "inventory_movement_resource_type_filter",
+    "InventoryReorderPoint": "inventory_reorder_point",
+    "InventoryReorderPointResponse": "inventory_reorder_point_response",
+    "InventorySafetyStockLevel": "inventory_safety_stock_level",
+    "InventorySafetyStockLevelResponse": "inventory_safety_stock_level_response",
+    "ItemConfig": "item_config",
+    "Location": "location",
+    "LocationAddress": "location_address",
+    "LocationListResponse": "location_list_response",
+    "MakeToOrderManufacturingOrderRequest": "make_to_order_manufacturing_order_request",
+    "ManufacturingOperationStatus": "manufacturing_operation_status",
+    "ManufacturingOperationType": "manufacturing_operation_type",
+    "ManufacturingOrder": "manufacturing_order",
+    "ManufacturingOrderListResponse": "manufacturing_order_list_response",
+    "ManufacturingOrderOperationProduction": "manufacturing_order_operation_production",
+    "ManufacturingOrderOperationRow": "manufacturing_order_operation_row",
+    "ManufacturingOrderOperationRowListResponse": "manufacturing_order_operation_row_list_response",
+    "ManufacturingOrderProduction": "manufacturing_order_production",
+    "ManufacturingOrderProductionIngredient": "manufacturing_order_production_ingredient",
+    "ManufacturingOrderProductionIngredientResponse": "manufacturing_order_production_ingredient_response",
+    "ManufacturingOrderProductionListResponse": "manufacturing_order_production_list_response",
+    "ManufacturingOrderRecipeRow": "manufacturing_order_recipe_row",
+    "ManufacturingOrderRecipeRowBatchTransactionsItem": "manufacturing_order_recipe_row_batch_transactions_item",
+    "ManufacturingOrderRecipeRowListResponse": "manufacturing_order_recipe_row_list_response",
+    "ManufacturingOrderStatus": "manufacturing_order_status",
+    "Material": "material",
+    "MaterialConfig": "material_config",
+    "MaterialListResponse": "material_list_response",
+    "MaterialType": "material_type",
+    "MaxItemsValidationError": "max_items_validation_error",
+    "MaxItemsValidationErrorCode": "max_items_validation_error_code",
+    "MaxItemsValidationErrorInfo": "max_items_validation_error_info",
+    "MaxLengthValidationError": "max_length_validation_error",
+    "MaxLengthValidationErrorCode": "max_length_validation_error_code",
+    "MaxLengthValidationErrorInfo": "max_length_validation_error_info",
+    "MaximumValidationError": "maximum_validation_error",
+    "MaximumValidationErrorCode": "maximum_validation_error_code",
+    "MaximumValidationErrorInfo": "maximum_validation_error_info",
+    "MaximumValidationErrorInfoComparison": "maximum_validation_error_info_comparison",
+    "MinItemsValidationError": "min_items_validation_error",
+    "MinItemsValidationErrorCode": "min_items_validation_error_code",
+    "MinItemsValidationErrorInfo": "min_items_validation_error_info",
+    "MinLengthValidationError": "min_length_validation_error",
+    "MinLengthValidationErrorCode": "min_length_validation_error_code",
+    "MinLengthValidationErrorInfo": "min_length_validation_error_info",
+    "MinimumValidationError": "minimum_validation_error",
+    "MinimumValidationErrorCode": "minimum_validation_error_code",
+    "MinimumValidationErrorInfo": "minimum_validation_error_info",
+    "MinimumValidationErrorInfoComparison": "minimum_validation_error_info_comparison",
+    "MultipleOfValidationError": "multiple_of_validation_error",
+    "MultipleOfValidationErrorCode": "multiple_of_validation_error_code",
+    "MultipleOfValidationErrorInfo": "multiple_of_validation_error_info",
+    "NegativeStock": "negative_stock",
+    "NegativeStockListResponse": "negative_stock_list_response",
+    "OneOfValidationError": "one_of_validation_error",
+    "OneOfValidationErrorCode": "one_of_validation_error_code",
+    "OneOfValidationErrorInfo": "one_of_validation_error_info",
+    "Operator": "operator",
+    "OperatorListResponse": "operator_list_response",
+    "OperatorWorkingArea": "operator_working_area",
+    "OutsourcedPurchaseOrder": "outsourced_purchase_order",
+    "OutsourcedPurchaseOrderEntityType": "outsourced_purchase_order_entity_type",
+    "OutsourcedPurchaseOrderIngredientAvailability": "outsourced_purchase_order_ingredient_availability",
+    "OutsourcedPurchaseOrderRecipeRow": "outsourced_purchase_order_recipe_row",
+    "OutsourcedPurchaseOrderRecipeRowBatchTransactionsItem": "outsourced_purchase_order_recipe_row_batch_transactions_item",
+    "OutsourcedPurchaseOrderRecipeRowListResponse": "outsourced_purchase_order_recipe_row_list_response",
+    "OutsourcedRecipeIngredientAvailability": "outsourced_recipe_ingredient_availability",
+    "PatternValidationError": "pattern_validation_error",
+    "PatternValidationErrorCode": "pattern_validation_error_code",
+    "PatternValidationErrorInfo": "pattern_validation_error_info",
+    "PriceList": "price_list",
+    "PriceListAdjustmentMethod": "price_list_adjustment_method",
+    "PriceListCustomer": "price_list_customer",
+    "PriceListCustomerListResponse": "price_list_customer_list_response",
+    "PriceListListResponse": "price_list_list_response",
+    "PriceListRow": "price_list_row",
+    "PriceListRowListResponse": "price_list_row_list_response",
+    "Product": "product",
+    "ProductAvailability": "product_availability",
+    "ProductListResponse": "product_list_response",
+    "ProductOperationRerank": "product_operation_rerank",
+    "ProductOperationRerankRequest": "product_operation_rerank_request",
+    "ProductOperationRow": "product_operation_row",
+    "ProductOperationRowListResponse": "product_operation_row_list_response",
+    "ProductOperationType": "product_operation_type",
+    "ProductType": "product_type",
+    "PurchaseOrderAccountingMetadata": "purchase_order_accounting_metadata",
+    "PurchaseOrderAccountingMetadataListResponse": "purchase_order_accounting_metadata_list_response",
+    "PurchaseOrderAdditionalCostRow": "purchase_order_additional_cost_row",
+    "PurchaseOrderAdditionalCostRowListResponse": "purchase_order_additional_cost_row_list_response",
+    "PurchaseOrderBase": "purchase_order_base",
+    "PurchaseOrderBillingStatus": "purchase_order_billing_status",
+    "PurchaseOrderDocumentStatus": "purchase_order_document_status",
+    "PurchaseOrderEntityType": "purchase_order_entity_type",
+    "PurchaseOrderListResponse": "purchase_order_list_response",
+    "PurchaseOrderReceiveRow": "purchase_order_receive_row",
+    "PurchaseOrderReceiveRowBatchTransactionsItem": "purchase_order_receive_row_batch_transactions_item",
+    "PurchaseOrderRow": "purchase_order_row",
+    "PurchaseOrderRowBatchTransactionsItem": "purchase_order_row_batch_transactions_item",
+    "PurchaseOrderRowListResponse": "purchase_order_row_list_response",
+    "PurchaseOrderRowRequest": "purchase_order_row_request",
+    "PurchaseOrderStatus": "purchase_order_status",
+    "Recipe": "recipe",
+    "RecipeListResponse": "recipe_list_response",
+    "RegularPurchaseOrder": "regular_purchase_order",
+    "RegularPurchaseOrderEntityType": "regular_purchase_order_entity_type",
+    "RequiredValidationError": "required_validation_error",
+    "RequiredValidationErrorCode": "required_validation_error_code",
+    "RequiredValidationErrorInfo": "required_validation_error_info",
+    "ReturnableItem": "returnable_item",
+    "SalesOrder": "sales_order",
+    "SalesOrderAccountingMetadata": "sales_order_accounting_metadata",
+    "SalesOrderAccountingMetadataListResponse": "sales_order_accounting_metadata_list_response",
+    "SalesOrderAddress": "sales_order_address",
+    "SalesOrderAddressListResponse": "sales_order_address_list_response",
+    "SalesOrderCustomFieldsType0": "sales_order_custom_fields_type_0",
+    "SalesOrderFulfillment": "sales_order_fulfillment",
+    "SalesOrderFulfillmentInvoiceStatus": "sales_order_fulfillment_invoice_status",
+    "SalesOrderFulfillmentInvoiceStatusFilter": "sales_order_fulfillment_invoice_status_filter",
+    "SalesOrderFulfillmentListResponse": "sales_order_fulfillment_list_response",
+    "SalesOrderFulfillmentRowRequest": "sales_order_fulfillment_row_request",
+    "SalesOrderFulfillmentSalesOrderFulfillmentRowsItem": "sales_order_fulfillment_sales_order_fulfillment_rows_item",
+    "SalesOrderFulfillmentSalesOrderFulfillmentRowsItemBatchTransactionsItem": "sales_order_fulfillment_sales_order_fulfillment_rows_item_batch_transactions_item",
+    "SalesOrderFulfillmentStatus": "sales_order_fulfillment_status",
+    "SalesOrderInvoicingStatus": "sales_order_invoicing_status",
+    "SalesOrderListResponse": "sales_order_list_response",
+    "SalesOrderProductionStatus": "sales_order_production_status",
+    "SalesOrderRow": "sales_order_row",
+    "SalesOrderRowAttributesItem": "sales_order_row_attributes_item",
+    "SalesOrderRowBatchTransactionsItem": "sales_order_row_batch_transactions_item",
+    "SalesOrderRowCustomFieldsType0": "sales_order_row_custom_fields_type_0",
+    "SalesOrderRowListResponse": "sales_order_row_list_response",
+    "SalesOrderRowSearchFilter": "sales_order_row_search_filter",
+    "SalesOrderRowSearchRequest": "sales_order_row_search_request",
+    "SalesOrderRowSearchWhere": "sales_order_row_search_where",
+    "SalesOrderRowSearchWhereAndItem": "sales_order_row_search_where_and_item",
+    "SalesOrderRowSearchWhereOrItem": "sales_order_row_search_where_or_item",
+    "SalesOrderRowSerialNumberTransactionsItem": "sales_order_row_serial_number_transactions_item",
+    "SalesOrderRowSerialNumberTransactionsItemQuantity": "sales_order_row_serial_number_transactions_item_quantity",
+    "SalesOrderSearchFilter": "sales_order_search_filter",
+    "SalesOrderSearchRequest": "sales_order_search_request",
+    "SalesOrderSearchWhere": "sales_order_search_where",
+    "SalesOrderSearchWhereAndItem": "sales_order_search_where_and_item",
+    "SalesOrderSearchWhereOrItem": "sales_order_search_where_or_item",
+    "SalesOrderShippingFee": "sales_order_shipping_fee",
+    "SalesOrderShippingFeeListResponse": "sales_order_shipping_fee_list_response",
+    "SalesOrderStatus": "sales_order_status",
+    "SalesReturn": "sales_return",
+    "SalesReturnListResponse": "sales_return_list_response",
+    "SalesReturnReason": "sales_return_reason",
+    "SalesReturnRefundStatus": "sales_return_refund_status",
+    "SalesReturnRow": "sales_return_row",
+    "SalesReturnRowBatchTransactionsItem": "sales_return_row_batch_transactions_item",
+    "SalesReturnRowListResponse": "sales_return_row_list_response",
+    "SalesReturnStatus": "sales_return_status",
+    "SearchComparator": "search_comparator",
+    "SerialNumber": "serial_number",
+    "SerialNumberListResponse": "serial_number_list_response",
+    "SerialNumberResourceType": "serial_number_resource_type",
+    "SerialNumberStock": "serial_number_stock",
+    "SerialNumberStockListResponse": "serial_number_stock_list_response",
+    "SerialNumberStockTransactionsItem": "serial_number_stock_transactions_item",
+    "Service": "service",
+    "ServiceListResponse": "service_list_response",
+    "ServiceType": "service_type",
+    "ServiceVariant": "service_variant",
+    "ServiceVariantCustomFieldsType0Item": "service_variant_custom_fields_type_0_item",
+    "StockAdjustment": "stock_adjustment",
+    "StockAdjustmentBatchTransaction": "stock_adjustment_batch_transaction",
+    "StockAdjustmentListResponse": "stock_adjustment_list_response",
+    "StockAdjustmentRow": "stock_adjustment_row",
+    "StockTransfer": "stock_transfer",
+    "StockTransferListResponse": "stock_transfer_list_response",
+    "StockTransferRow": "stock_transfer_row",
+    "StockTransferRowBatchTransactionsItem": "stock_transfer_row_batch_transactions_item",
+    "StockTransferRowRequest": "stock_transfer_row_request",
+    "StockTransferStatus": "stock_transfer_status",
+    "Stocktake": "stocktake",
+    "StocktakeListResponse": "stocktake_list_response",
+    "StocktakeRow": "stocktake_row",
+    "StocktakeRowListResponse": "stocktake_row_list_response",
+    "StocktakeStatus": "stocktake_status",
+    "StorageBin": "storage_bin",
+    "StorageBinCreate": "storage_bin_create",
+    "StorageBinResponse": "storage_bin_response",
+    "StorageBinUpdate": "storage_bin_update",
+    "Supplier": "supplier",
+    "SupplierAddress": "supplier_address",
+    "SupplierAddressListResponse": "supplier_address_list_response",
+    "SupplierAddressRequest": "supplier_address_request",
+    "SupplierListResponse": "supplier_list_response",
+    "TaxRate": "tax_rate",
+    "TaxRateListResponse": "tax_rate_list_response",
+    "TraceabilityRequest": "traceability_request",
+    "TypeValidationError": "type_validation_error",
+    "TypeValidationErrorCode": "type_validation_error_code",
+    "TypeValidationErrorInfo": "type_validation_error_info",
+    "UnassignedBatchTransaction": "unassigned_batch_transaction",
+    "UnassignedBatchTransactionListResponse": "unassigned_batch_transaction_list_response",
+    "UniqueItemsValidationError": "unique_items_validation_error",
+    "UniqueItemsValidationErrorCode": "unique_items_validation_error_code",
+    "UniqueItemsValidationErrorInfo": "unique_items_validation_error_info",
+    "UnlinkManufacturingOrderRequest": "unlink_manufacturing_order_request",
+    "UnlinkVariantBinLocationRequest": "unlink_variant_bin_location_request",
+    "UpdatableEntity": "updatable_entity",
+    "UpdateBinTransferRequest": "update_bin_transfer_request",
+    "UpdateBinTransferRowRequest": "update_bin_transfer_row_request",
+    "UpdateBinTransferStatusRequest": "update_bin_transfer_status_request",
+    "UpdateBomRowRequest": "update_bom_row_request",
+    "UpdateCustomFieldDefinitionRequest": "update_custom_field_definition_request",
+    "UpdateCustomerAddressRequest": "update_customer_address_request",
+    "UpdateCustomerRequest": "update_customer_request",
+    "UpdateManufacturingOrderOperationRowRequest": "update_manufacturing_order_operation_row_request",
+    "UpdateManufacturingOrderProductionIngredientRequest": "update_manufacturing_order_production_ingredient_request",
+    "UpdateManufacturingOrderProductionRequest": "update_manufacturing_order_production_request",
+    "UpdateManufacturingOrderRecipeRowRequest": "update_manufacturing_order_recipe_row_request",
+    "UpdateManufacturingOrderRecipeRowRequestBatchTransactionsItem": "update_manufacturing_order_recipe_row_request_batch_transactions_item",
+    "UpdateManufacturingOrderRequest": "update_manufacturing_order_request",
+    "UpdateMaterialRequest": "update_material_request",
+    "UpdateMaterialRequestConfigsItem": "update_material_request_configs_item",
+    "UpdateOutsourcedPurchaseOrderRecipeRowRequest": "update_outsourced_purchase_order_recipe_row_request",
+    "UpdatePriceListCustomerRequest": "update_price_list_customer_request",
+    "UpdatePriceListRequest": "update_price_list_request",
+    "UpdatePriceListRowRequest": "update_price_list_row_request",
+    "UpdateProductOperationRowRequest": "update_product_operation_row_request",
+    "UpdateProductRequest": "update_product_request",
+    "UpdateProductRequestConfigsItem": "update_product_request_configs_item",
+    "UpdatePurchaseOrderAdditionalCostRowRequest": "update_purchase_order_additional_cost_row_request",
+    "UpdatePurchaseOrderRequest": "update_purchase_order_request",
+    "UpdatePurchaseOrderRowRequest": "update_purchase_order_row_request",
+    "UpdateRecipeRowRequest": "update_recipe_row_request",
+    "UpdateSalesOrderAddressRequest": "update_sales_order_address_request",
+    "UpdateSalesOrderFulfillmentRequest": "update_sales_order_fulfillment_request",
+    "UpdateSalesOrderRequest": "update_sales_order_request",
+    "UpdateSalesOrderRequestCustomFieldsType0": "update_sales_order_request_custom_fields_type_0",
+    "UpdateSalesOrderRowRequest": "update_sales_order_row_request",
+    "UpdateSalesOrderRowRequestAttributesItem": "update_sales_order_row_request_attributes_item",
+    "UpdateSalesOrderRowRequestCustomFieldsType0": "update_sales_order_row_request_custom_fields_type_0",
+    "UpdateSalesOrderRowRequestSerialNumberTransactionsItem": "update_sales_order_row_request_serial_number_transactions_item",
+    "UpdateSalesOrderShippingFeeRequest": "update_sales_order_shipping_fee_request",
+    "UpdateSalesOrderStatus": "update_sales_order_status",
+    "UpdateSalesReturnRequest": "update_sales_return_request",
+    "UpdateSalesReturnRowRequest": "update_sales_return_row_request",
+    "UpdateServiceRequest": "update_service_request",
+    "UpdateStockAdjustmentRequest": "update_stock_adjustment_request",
+    "UpdateStockTransferRequest": "update_stock_transfer_request",
+    "UpdateStockTransferStatusRequest": "update_stock_transfer_status_request",
+    "UpdateStocktakeRequest": "update_stocktake_request",
+    "UpdateStocktakeRowRequest": "update_stocktake_row_request",
+    "UpdateSupplierAddressRequest": "update_supplier_address_request",
+    "UpdateSupplierRequest": "update_supplier_request",
+    "UpdateVariantRequest": "update_variant_request",
+    "UpdateVariantRequestConfigAttributesItem": "update_variant_request_config_attributes_item",
+    "UpdateVariantRequestCustomFieldsItem": "update_variant_request_custom_fields_item",
+    "UpdateWebhookRequest": "update_webhook_request",
+    "User": "user",
+    "UserInfo": "user_info",
+    "UserListResponse": "user_list_response",
+    "Variant": "variant",
+    "VariantConfigAttributesType0Item": "variant_config_attributes_type_0_item",
+    "VariantCustomFieldsType0Item": "variant_custom_fields_type_0_item",
+    "VariantDefaultStorageBinLink": "variant_default_storage_bin_link",
+    "VariantDefaultStorageBinLinkResponse": "variant_default_storage_bin_link_response",
+    "VariantListResponse": "variant_list_response",
+    "VariantResponse": "variant_response",
+    "VariantResponseConfigAttributesType0Item": "variant_response_config_attributes_type_0_item",
+    "VariantResponseCustomFieldsType0Item": "variant_response_custom_fields_type_0_item",
+    "VariantType": "variant_type",
+    "Webhook": "webhook",
+    "WebhookEvent": "webhook_event",
+    "WebhookEventPayload": "webhook_event_payload",
+    "WebhookEventPayloadObject": "webhook_event_payload_object",
+    "WebhookListResponse": "webhook_list_response",
+    "WebhookLogsExport": "webhook_logs_export",
+    "WebhookLogsExportRequest": "webhook_logs_export_request",
+    "WebhookLogsExportRequestEvent": "webhook_logs_export_request_event",
+}
 
 __all__ = (
     "AbcClassification",
@@ -1073,3 +1576,18 @@ __all__ = (
     "WebhookLogsExportRequest",
     "WebhookLogsExportRequestEvent",
 )
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
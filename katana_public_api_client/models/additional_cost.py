@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar("T", bound="AdditionalCost")
 
@@ -29,7 +29,20 @@ class AdditionalCost:
     created_at: datetime.datetime | Unset = UNSET
     updated_at: datetime.datetime | Unset = UNSET
     deleted_at: datetime.datetime | None | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -53,7 +66,8 @@ class AdditionalCost:
             deleted_at = self.deleted_at
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -115,12 +129,12 @@ class AdditionalCost:
             deleted_at=deleted_at,
         )
 
-        additional_cost.additional_properties = d
+        additional_cost._additional_properties = d or None
         return additional_cost
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -132,4 +146,4 @@ class AdditionalCost:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 if TYPE_CHECKING:
     from ..models.additional_cost import AdditionalCost
@@ -28,7 +28,20 @@ class AdditionalCostListResponse:
     """
 
     data: list[AdditionalCost] | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         data: list[dict[str, Any]] | Unset = UNSET
@@ -39,7 +52,8 @@ class AdditionalCostListResponse:
                 data.append(data_item)
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if data is not UNSET:
             field_dict["data"] = data
@@ -66,12 +80,12 @@ class AdditionalCostListResponse:
             data=data,
         )
 
-        additional_cost_list_response.additional_properties = d
+        additional_cost_list_response._additional_properties = d or None
         return additional_cost_list_response
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -83,4 +97,4 @@ class AdditionalCostListResponse:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -8,6 +8,8 @@ from attrs import (
     field as _attrs_field,
 )
 
+from ..client_types import lazy_dict_eq_key
+
 T = TypeVar("T", bound="AdditionalPropertiesValidationErrorInfo")
 
 
@@ -16,13 +18,27 @@ class AdditionalPropertiesValidationErrorInfo:
     """Keyword-specific metadata for ``additionalProperties``"""
 
     additional_property: str
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         additional_property = self.additional_property
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "additionalProperty": additional_property,
@@ -40,12 +56,12 @@ class AdditionalPropertiesValidationErrorInfo:
             additional_property=additional_property,
         )
 
-        additional_properties_validation_error_info.additional_properties = d
+        additional_properties_validation_error_info._additional_properties = d or None
         return additional_properties_validation_error_info
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -57,4 +73,4 @@ class AdditionalPropertiesValidationErrorInfo:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar("T", bound="ArchivableEntity")
 
@@ -27,7 +27,20 @@ class ArchivableEntity:
     created_at: datetime.datetime | Unset = UNSET
     updated_at: datetime.datetime | Unset = UNSET
     archived_at: datetime.datetime | None | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -49,7 +62,8 @@ class ArchivableEntity:
             archived_at = self.archived_at
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -107,12 +121,12 @@ class ArchivableEntity:
             archived_at=archived_at,
         )
 
-        archivable_entity.additional_properties = d
+        archivable_entity._additional_properties = d or None
         return archivable_entity
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -124,4 +138,4 @@ class ArchivableEntity:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar("T", bound="AssignedOperator")
 
@@ -25,7 +25,20 @@ class AssignedOperator:
     operator_id: int
     name: str
     deleted_at: datetime.datetime | None | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         operator_id = self.operator_id
@@ -41,7 +54,8 @@ class AssignedOperator:
             deleted_at = self.deleted_at
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "operator_id": operator_id,
@@ -83,12 +97,12 @@ class AssignedOperator:
             deleted_at=deleted_at,
         )
 
-        assigned_operator.additional_properties = d
+        assigned_operator._additional_properties = d or None
         return assigned_operator
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -100,4 +114,4 @@ class AssignedOperator:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
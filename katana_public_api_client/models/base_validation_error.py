@@ -8,6 +8,8 @@ from attrs import (
     field as _attrs_field,
 )
 
+from ..client_types import lazy_dict_eq_key
+
 T = TypeVar("T", bound="BaseValidationError")
 
 
@@ -20,7 +22,20 @@ class BaseValidationError:
     path: str
     code: str
     message: str
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         path = self.path
@@ -30,7 +45,8 @@ class BaseValidationError:
         message = self.message
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "path": path,
@@ -56,12 +72,12 @@ class BaseValidationError:
             message=message,
         )
 
-        base_validation_error.additional_properties = d
+        base_validation_error._additional_properties = d or None
         return base_validation_error
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -73,4 +89,4 @@ class BaseValidationError:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
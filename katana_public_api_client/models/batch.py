@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar("T", bound="Batch")
 
@@ -28,7 +28,20 @@ class Batch:
     expiration_date: datetime.datetime | Unset = UNSET
     batch_created_date: datetime.datetime | Unset = UNSET
     batch_barcode: None | str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         batch_number = self.batch_number
@@ -50,7 +63,8 @@ class Batch:
             batch_barcode = self.batch_barcode
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "batch_number": batch_number,
@@ -104,12 +118,12 @@ class Batch:
             batch_barcode=batch_barcode,
         )
 
-        batch.additional_properties = d
+        batch._additional_properties = d or None
         return batch
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -121,4 +135,4 @@ class Batch:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -8,6 +8,8 @@ from attrs import (
     field as _attrs_field,
 )
 
+from ..client_types import lazy_dict_eq_key
+
 if TYPE_CHECKING:
     from ..models.create_bom_row_request import CreateBomRowRequest
 
@@ -26,7 +28,20 @@ class BatchCreateBomRowsRequest:
     """
 
     data: list[CreateBomRowRequest]
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         data = []
@@ -35,7 +50,8 @@ class BatchCreateBomRowsRequest:
             data.append(data_item)
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "data": data,
@@ -62,12 +78,12 @@ class BatchCreateBomRowsRequest:
             data=data,
         )
 
-        batch_create_bom_rows_request.additional_properties = d
+        batch_create_bom_rows_request._additional_properties = d or None
         return batch_create_bom_rows_request
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -79,4 +95,4 @@ class BatchCreateBomRowsRequest:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar("T", bound="BinInventory")
 
@@ -29,7 +29,20 @@ class BinInventory:
     quantity_in_stock: str | Unset = UNSET
     quantity_committed: str | Unset = UNSET
     quantity_expected: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         location_id = self.location_id
@@ -61,7 +74,8 @@ class BinInventory:
         quantity_expected = self.quantity_expected
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if location_id is not UNSET:
             field_dict["location_id"] = location_id
@@ -133,12 +147,12 @@ class BinInventory:
             quantity_expected=quantity_expected,
         )
 
-        bin_inventory.additional_properties = d
+        bin_inventory._additional_properties = d or None
         return bin_inventory
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -150,4 +164,4 @@ class BinInventory:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 from ..models.bin_transfer_status import BinTransferStatus
 
 if TYPE_CHECKING:
@@ -46,7 +46,20 @@ class BinTransfer:
     arrived_at: datetime.datetime | None | Unset = UNSET
     additional_info: None | str | Unset = UNSET
     bin_transfer_rows: list[BinTransferRow] | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -113,7 +126,8 @@ class BinTransfer:
                 bin_transfer_rows.append(bin_transfer_rows_item)
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -277,12 +291,12 @@ class BinTransfer:
             bin_transfer_rows=bin_transfer_rows,
         )
 
-        bin_transfer.additional_properties = d
+        bin_transfer._additional_properties = d or None
         return bin_transfer
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -294,4 +308,4 @@ class BinTransfer:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar("T", bound="BinTransferTraceability")
 
@@ -22,7 +22,20 @@ class BinTransferTraceability:
     batch_id: int | None | Unset = UNSET
     serial_number_id: int | None | Unset = UNSET
     quantity: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         batch_id: int | None | Unset
@@ -40,7 +53,8 @@ class BinTransferTraceability:
         quantity = self.quantity
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if batch_id is not UNSET:
             field_dict["batch_id"] = batch_id
@@ -81,12 +95,12 @@ class BinTransferTraceability:
             quantity=quantity,
         )
 
-        bin_transfer_traceability.additional_properties = d
+        bin_transfer_traceability._additional_properties = d or None
         return bin_transfer_traceability
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -98,4 +112,4 @@ class BinTransferTraceability:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -8,6 +8,8 @@ from attrs import (
     field as _attrs_field,
 )
 
+from ..client_types import lazy_dict_eq_key
+
 T = TypeVar("T", bound="ConstValidationErrorInfo")
 
 
@@ -16,13 +18,27 @@ class ConstValidationErrorInfo:
     """Keyword-specific metadata for ``const``"""
 
     allowed_value: Any
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         allowed_value = self.allowed_value
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "allowedValue": allowed_value,
@@ -40,12 +56,12 @@ class ConstValidationErrorInfo:
             allowed_value=allowed_value,
         )
 
-        const_validation_error_info.additional_properties = d
+        const_validation_error_info._additional_properties = d or None
         return const_validation_error_info
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -57,4 +73,4 @@ class ConstValidationErrorInfo:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
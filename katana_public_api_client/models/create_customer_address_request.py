@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 from ..models.address_entity_type import AddressEntityType
 
 T = TypeVar("T", bound="CreateCustomerAddressRequest")
@@ -36,7 +36,20 @@ class CreateCustomerAddressRequest:
     state: None | str | Unset = UNSET
     zip_: None | str | Unset = UNSET
     country: None | str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         customer_id = self.customer_id
@@ -104,7 +117,8 @@ class CreateCustomerAddressRequest:
             country = self.country
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "customer_id": customer_id,
@@ -246,12 +260,12 @@ class CreateCustomerAddressRequest:
             country=country,
         )
 
-        create_customer_address_request.additional_properties = d
+        create_customer_address_request._additional_properties = d or None
         return create_customer_address_request
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -263,4 +277,4 @@ class CreateCustomerAddressRequest:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
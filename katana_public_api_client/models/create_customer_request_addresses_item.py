@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 from ..models.address_entity_type import AddressEntityType
 
 T = TypeVar("T", bound="CreateCustomerRequestAddressesItem")
@@ -27,7 +27,20 @@ class CreateCustomerRequestAddressesItem:
     state: str | Unset = UNSET
     zip_: str | Unset = UNSET
     country: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         entity_type: str | Unset = UNSET
@@ -55,7 +68,8 @@ class CreateCustomerRequestAddressesItem:
         country = self.country
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if entity_type is not UNSET:
             field_dict["entity_type"] = entity_type
@@ -126,12 +140,12 @@ class CreateCustomerRequestAddressesItem:
             country=country,
         )
 
-        create_customer_request_addresses_item.additional_properties = d
+        create_customer_request_addresses_item._additional_properties = d or None
         return create_customer_request_addresses_item
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -143,4 +157,4 @@ class CreateCustomerRequestAddressesItem:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 from ..models.create_manufacturing_order_operation_row_request_status import (
     CreateManufacturingOrderOperationRowRequestStatus,
 )
@@ -44,7 +44,20 @@ class CreateManufacturingOrderOperationRowRequest:
     cost_parameter: float | Unset = UNSET
     cost_per_hour: float | Unset = UNSET
     assigned_operators: list[Operator] | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         manufacturing_order_id = self.manufacturing_order_id
@@ -79,7 +92,8 @@ class CreateManufacturingOrderOperationRowRequest:
                 assigned_operators.append(assigned_operators_item)
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "manufacturing_order_id": manufacturing_order_id,
@@ -167,12 +181,14 @@ class CreateManufacturingOrderOperationRowRequest:
             assigned_operators=assigned_operators,
         )
 
-        create_manufacturing_order_operation_row_request.additional_properties = d
+        create_manufacturing_order_operation_row_request._additional_properties = (
+            d or None
+        )
         return create_manufacturing_order_operation_row_request
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -184,4 +200,4 @@ class CreateManufacturingOrderOperationRowRequest:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
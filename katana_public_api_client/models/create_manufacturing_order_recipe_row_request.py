@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 if TYPE_CHECKING:
     from ..models.create_manufacturing_order_recipe_row_request_batch_transactions_item import (
@@ -37,7 +37,20 @@ class CreateManufacturingOrderRecipeRowRequest:
     batch_transactions: (
         list[CreateManufacturingOrderRecipeRowRequestBatchTransactionsItem] | Unset
     ) = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         manufacturing_order_id = self.manufacturing_order_id
@@ -58,7 +71,8 @@ class CreateManufacturingOrderRecipeRowRequest:
                 batch_transactions.append(batch_transactions_item)
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "manufacturing_order_id": manufacturing_order_id,
@@ -114,12 +128,12 @@ class CreateManufacturingOrderRecipeRowRequest:
             batch_transactions=batch_transactions,
         )
 
-        create_manufacturing_order_recipe_row_request.additional_properties = d
+        create_manufacturing_order_recipe_row_request._additional_properties = d or None
         return create_manufacturing_order_recipe_row_request
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -131,4 +145,4 @@ class CreateManufacturingOrderRecipeRowRequest:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
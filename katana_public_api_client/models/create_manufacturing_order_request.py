@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 from ..models.create_manufacturing_order_request_status import (
     CreateManufacturingOrderRequestStatus,
 )
@@ -41,7 +41,20 @@ class CreateManufacturingOrderRequest:
     production_deadline_date: datetime.datetime | Unset = UNSET
     additional_info: str | Unset = UNSET
     batch_transactions: list[BatchTransaction] | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         variant_id = self.variant_id
@@ -76,7 +89,8 @@ class CreateManufacturingOrderRequest:
                 batch_transactions.append(batch_transactions_item)
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "variant_id": variant_id,
@@ -165,12 +179,12 @@ class CreateManufacturingOrderRequest:
             batch_transactions=batch_transactions,
         )
 
-        create_manufacturing_order_request.additional_properties = d
+        create_manufacturing_order_request._additional_properties = d or None
         return create_manufacturing_order_request
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -182,4 +196,4 @@ class CreateManufacturingOrderRequest:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar("T", bound="CreatePriceListCustomerRequestPriceListCustomersItem")
 
@@ -16,13 +16,27 @@ T = TypeVar("T", bound="CreatePriceListCustomerRequestPriceListCustomersItem")
 @_attrs_define
 class CreatePriceListCustomerRequestPriceListCustomersItem:
     customer_id: int | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         customer_id = self.customer_id
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if customer_id is not UNSET:
             field_dict["customer_id"] = customer_id
@@ -38,12 +52,14 @@ class CreatePriceListCustomerRequestPriceListCustomersItem:
             customer_id=customer_id,
         )
 
-        create_price_list_customer_request_price_list_customers_item.additional_properties = d
+        create_price_list_customer_request_price_list_customers_item._additional_properties = (
+            d or None
+        )
         return create_price_list_customer_request_price_list_customers_item
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -55,4 +71,4 @@ class CreatePriceListCustomerRequestPriceListCustomersItem:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 from ..models.create_sales_order_status import CreateSalesOrderStatus
 
 if TYPE_CHECKING:
@@ -104,7 +104,20 @@ class CreateSalesOrderRequest:
     ecommerce_store_name: None | str | Unset = UNSET
     ecommerce_order_id: None | str | Unset = UNSET
     custom_fields: CreateSalesOrderRequestCustomFieldsType0 | None | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         from ..models.create_sales_order_request_custom_fields_type_0 import (
@@ -206,7 +219,8 @@ class CreateSalesOrderRequest:
             custom_fields = self.custom_fields
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "customer_id": customer_id,
@@ -454,12 +468,12 @@ class CreateSalesOrderRequest:
             custom_fields=custom_fields,
         )
 
-        create_sales_order_request.additional_properties = d
+        create_sales_order_request._additional_properties = d or None
         return create_sales_order_request
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -471,4 +485,4 @@ class CreateSalesOrderRequest:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
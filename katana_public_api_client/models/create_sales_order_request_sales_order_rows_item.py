@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 if TYPE_CHECKING:
     from ..models.create_sales_order_request_sales_order_rows_item_attributes_item import (
@@ -36,7 +36,20 @@ class CreateSalesOrderRequestSalesOrderRowsItem:
     custom_fields: (
         CreateSalesOrderRequestSalesOrderRowsItemCustomFieldsType0 | None | Unset
     ) = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         from ..models.create_sales_order_request_sales_order_rows_item_custom_fields_type_0 import (
@@ -90,7 +103,8 @@ class CreateSalesOrderRequestSalesOrderRowsItem:
             custom_fields = self.custom_fields
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "quantity": quantity,
@@ -214,12 +228,14 @@ class CreateSalesOrderRequestSalesOrderRowsItem:
             custom_fields=custom_fields,
         )
 
-        create_sales_order_request_sales_order_rows_item.additional_properties = d
+        create_sales_order_request_sales_order_rows_item._additional_properties = (
+            d or None
+        )
         return create_sales_order_request_sales_order_rows_item
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -231,4 +247,4 @@ class CreateSalesOrderRequestSalesOrderRowsItem:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
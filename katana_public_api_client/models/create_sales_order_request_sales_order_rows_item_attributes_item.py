@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar("T", bound="CreateSalesOrderRequestSalesOrderRowsItemAttributesItem")
 
@@ -17,7 +17,20 @@ T = TypeVar("T", bound="CreateSalesOrderRequestSalesOrderRowsItemAttributesItem"
 class CreateSalesOrderRequestSalesOrderRowsItemAttributesItem:
     key: str | Unset = UNSET
     value: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         key = self.key
@@ -25,7 +38,8 @@ class CreateSalesOrderRequestSalesOrderRowsItemAttributesItem:
         value = self.value
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if key is not UNSET:
             field_dict["key"] = key
@@ -46,12 +60,14 @@ class CreateSalesOrderRequestSalesOrderRowsItemAttributesItem:
             value=value,
         )
 
-        create_sales_order_request_sales_order_rows_item_attributes_item.additional_properties = d
+        create_sales_order_request_sales_order_rows_item_attributes_item._additional_properties = (
+            d or None
+        )
         return create_sales_order_request_sales_order_rows_item_attributes_item
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -63,4 +79,4 @@ class CreateSalesOrderRequestSalesOrderRowsItemAttributesItem:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
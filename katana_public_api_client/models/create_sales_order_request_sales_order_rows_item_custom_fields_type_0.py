@@ -8,6 +8,8 @@ from attrs import (
     field as _attrs_field,
 )
 
+from ..client_types import lazy_dict_eq_key
+
 T = TypeVar("T", bound="CreateSalesOrderRequestSalesOrderRowsItemCustomFieldsType0")
 
 
@@ -26,12 +28,26 @@ class CreateSalesOrderRequestSalesOrderRowsItemCustomFieldsType0:
 
     """
 
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
 
         return field_dict
 
@@ -40,12 +56,14 @@ class CreateSalesOrderRequestSalesOrderRowsItemCustomFieldsType0:
         d = dict(src_dict)
         create_sales_order_request_sales_order_rows_item_custom_fields_type_0 = cls()
 
-        create_sales_order_request_sales_order_rows_item_custom_fields_type_0.additional_properties = d
+        create_sales_order_request_sales_order_rows_item_custom_fields_type_0._additional_properties = (
+            d or None
+        )
         return create_sales_order_request_sales_order_rows_item_custom_fields_type_0
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -57,4 +75,4 @@ class CreateSalesOrderRequestSalesOrderRowsItemCustomFieldsType0:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
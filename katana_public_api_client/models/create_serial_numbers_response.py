@@ -8,6 +8,8 @@ from attrs import (
     field as _attrs_field,
 )
 
+from ..client_types import lazy_dict_eq_key
+
 if TYPE_CHECKING:
     from ..models.create_serial_number_failed_item import CreateSerialNumberFailedItem
     from ..models.serial_number import SerialNumber
@@ -32,7 +34,20 @@ class CreateSerialNumbersResponse:
 
     successful: list[SerialNumber]
     failed: list[CreateSerialNumberFailedItem]
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         successful = []
@@ -46,7 +61,8 @@ class CreateSerialNumbersResponse:
             failed.append(failed_item)
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "successful": successful,
@@ -87,12 +103,12 @@ class CreateSerialNumbersResponse:
             failed=failed,
         )
 
-        create_serial_numbers_response.additional_properties = d
+        create_serial_numbers_response._additional_properties = d or None
         return create_serial_numbers_response
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -104,4 +120,4 @@ class CreateSerialNumbersResponse:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
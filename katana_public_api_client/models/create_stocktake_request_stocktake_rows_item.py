@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar("T", bound="CreateStocktakeRequestStocktakeRowsItem")
 
@@ -18,7 +18,20 @@ class CreateStocktakeRequestStocktakeRowsItem:
     variant_id: int | Unset = UNSET
     batch_id: int | Unset = UNSET
     counted_quantity: float | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         variant_id = self.variant_id
@@ -28,7 +41,8 @@ class CreateStocktakeRequestStocktakeRowsItem:
         counted_quantity = self.counted_quantity
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if variant_id is not UNSET:
             field_dict["variant_id"] = variant_id
@@ -54,12 +68,12 @@ class CreateStocktakeRequestStocktakeRowsItem:
             counted_quantity=counted_quantity,
         )
 
-        create_stocktake_request_stocktake_rows_item.additional_properties = d
+        create_stocktake_request_stocktake_rows_item._additional_properties = d or None
         return create_stocktake_request_stocktake_rows_item
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -71,4 +85,4 @@ class CreateStocktakeRequestStocktakeRowsItem:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
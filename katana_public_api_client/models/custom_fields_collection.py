@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 from ..models.custom_field_collection_resource_type import (
     CustomFieldCollectionResourceType,
 )
@@ -39,7 +39,20 @@ class CustomFieldsCollection:
     deleted_at: datetime.datetime | None | Unset = UNSET
     resource_type: CustomFieldCollectionResourceType | Unset = UNSET
     custom_fields: list[CustomField] | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -74,7 +87,8 @@ class CustomFieldsCollection:
                 custom_fields.append(custom_fields_item)
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -162,12 +176,12 @@ class CustomFieldsCollection:
             custom_fields=custom_fields,
         )
 
-        custom_fields_collection.additional_properties = d
+        custom_fields_collection._additional_properties = d or None
         return custom_fields_collection
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -179,4 +193,4 @@ class CustomFieldsCollection:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -8,6 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
+from ..client_types import lazy_dict_eq_key
 from ..models.dependencies_validation_error_code import DependenciesValidationErrorCode
 
 if TYPE_CHECKING:
@@ -30,7 +31,20 @@ class DependenciesValidationError:
     code: DependenciesValidationErrorCode
     message: str
     info: DependenciesValidationErrorInfo
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         path = self.path
@@ -42,7 +56,8 @@ class DependenciesValidationError:
         info = self.info.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "path": path,
@@ -76,12 +91,12 @@ class DependenciesValidationError:
             info=info,
         )
 
-        dependencies_validation_error.additional_properties = d
+        dependencies_validation_error._additional_properties = d or None
         return dependencies_validation_error
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -93,4 +108,4 @@ class DependenciesValidationError:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar("T", bound="DependenciesValidationErrorInfo")
 
@@ -21,7 +21,20 @@ class DependenciesValidationErrorInfo:
     missing_property: str
     deps: str | Unset = UNSET
     deps_count: int | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         property_ = self.property_
@@ -33,7 +46,8 @@ class DependenciesValidationErrorInfo:
         deps_count = self.deps_count
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "property": property_,
@@ -65,12 +79,12 @@ class DependenciesValidationErrorInfo:
             deps_count=deps_count,
         )
 
-        dependencies_validation_error_info.additional_properties = d
+        dependencies_validation_error_info._additional_properties = d or None
         return dependencies_validation_error_info
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -82,4 +96,4 @@ class DependenciesValidationErrorInfo:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -8,6 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
+from ..client_types import lazy_dict_eq_key
 from ..models.exclusive_maximum_validation_error_code import (
     ExclusiveMaximumValidationErrorCode,
 )
@@ -31,7 +32,20 @@ class ExclusiveMaximumValidationError:
     code: ExclusiveMaximumValidationErrorCode
     message: str
     info: ExclusiveMaximumValidationErrorInfo
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         path = self.path
@@ -43,7 +57,8 @@ class ExclusiveMaximumValidationError:
         info = self.info.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "path": path,
@@ -77,12 +92,12 @@ class ExclusiveMaximumValidationError:
             info=info,
         )
 
-        exclusive_maximum_validation_error.additional_properties = d
+        exclusive_maximum_validation_error._additional_properties = d or None
         return exclusive_maximum_validation_error
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -94,4 +109,4 @@ class ExclusiveMaximumValidationError:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 from ..models.exclusive_minimum_validation_error_info_comparison import (
     ExclusiveMinimumValidationErrorInfoComparison,
 )
@@ -22,7 +22,20 @@ class ExclusiveMinimumValidationErrorInfo:
 
     limit: float
     comparison: ExclusiveMinimumValidationErrorInfoComparison | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         limit = self.limit
@@ -32,7 +45,8 @@ class ExclusiveMinimumValidationErrorInfo:
             comparison = self.comparison.value
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "limit": limit,
@@ -60,12 +74,12 @@ class ExclusiveMinimumValidationErrorInfo:
             comparison=comparison,
         )
 
-        exclusive_minimum_validation_error_info.additional_properties = d
+        exclusive_minimum_validation_error_info._additional_properties = d or None
         return exclusive_minimum_validation_error_info
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -77,4 +91,4 @@ class ExclusiveMinimumValidationErrorInfo:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 if TYPE_CHECKING:
     from ..models.location import Location
@@ -48,7 +48,20 @@ class Inventory:
     location: Location | Unset = UNSET
     archived_at: datetime.datetime | None | Unset = UNSET
     default_storage_bin: None | Unset | VariantDefaultStorageBinLinkResponse = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         from ..models.variant_default_storage_bin_link_response import (
@@ -103,7 +116,8 @@ class Inventory:
             default_storage_bin = self.default_storage_bin
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "variant_id": variant_id,
@@ -243,12 +257,12 @@ class Inventory:
             default_storage_bin=default_storage_bin,
         )
 
-        inventory.additional_properties = d
+        inventory._additional_properties = d or None
         return inventory
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -260,4 +274,4 @@ class Inventory:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
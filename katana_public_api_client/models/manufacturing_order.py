@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 from ..models.ingredient_availability import IngredientAvailability
 from ..models.manufacturing_order_status import ManufacturingOrderStatus
 
@@ -73,7 +73,20 @@ class ManufacturingOrder:
     subassemblies_cost: float | Unset = UNSET
     operations_cost: float | Unset = UNSET
     serial_numbers: list[SerialNumber] | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -199,7 +212,8 @@ class ManufacturingOrder:
                 serial_numbers.append(serial_numbers_item)
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -517,12 +531,12 @@ class ManufacturingOrder:
             serial_numbers=serial_numbers,
         )
 
-        manufacturing_order.additional_properties = d
+        manufacturing_order._additional_properties = d or None
         return manufacturing_order
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -534,4 +548,4 @@ class ManufacturingOrder:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
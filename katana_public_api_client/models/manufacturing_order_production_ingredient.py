@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar("T", bound="ManufacturingOrderProductionIngredient")
 
@@ -30,7 +30,20 @@ class ManufacturingOrderProductionIngredient:
     quantity: float | Unset = UNSET
     production_date: datetime.datetime | Unset = UNSET
     cost: float | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -70,7 +83,8 @@ class ManufacturingOrderProductionIngredient:
         cost = self.cost
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -177,12 +191,12 @@ class ManufacturingOrderProductionIngredient:
             cost=cost,
         )
 
-        manufacturing_order_production_ingredient.additional_properties = d
+        manufacturing_order_production_ingredient._additional_properties = d or None
         return manufacturing_order_production_ingredient
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -194,4 +208,4 @@ class ManufacturingOrderProductionIngredient:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
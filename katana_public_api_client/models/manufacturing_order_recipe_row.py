@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 from ..models.ingredient_availability import IngredientAvailability
 
 if TYPE_CHECKING:
@@ -51,7 +51,20 @@ class ManufacturingOrderRecipeRow:
     cost: None | str | Unset = UNSET
     total_consumed_quantity: float | Unset = UNSET
     total_remaining_quantity: float | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -116,7 +129,8 @@ class ManufacturingOrderRecipeRow:
         total_remaining_quantity = self.total_remaining_quantity
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -286,12 +300,12 @@ class ManufacturingOrderRecipeRow:
             total_remaining_quantity=total_remaining_quantity,
         )
 
-        manufacturing_order_recipe_row.additional_properties = d
+        manufacturing_order_recipe_row._additional_properties = d or None
         return manufacturing_order_recipe_row
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -303,4 +317,4 @@ class ManufacturingOrderRecipeRow:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar("T", bound="NegativeStock")
 
@@ -33,7 +33,20 @@ class NegativeStock:
     category: str | Unset = UNSET
     quantity_on_hand: float | Unset = UNSET
     quantity_allocated: float | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         variant_id = self.variant_id
@@ -55,7 +68,8 @@ class NegativeStock:
         quantity_allocated = self.quantity_allocated
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if variant_id is not UNSET:
             field_dict["variant_id"] = variant_id
@@ -113,12 +127,12 @@ class NegativeStock:
             quantity_allocated=quantity_allocated,
         )
 
-        negative_stock.additional_properties = d
+        negative_stock._additional_properties = d or None
         return negative_stock
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -130,4 +144,4 @@ class NegativeStock:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -8,6 +8,8 @@ from attrs import (
     field as _attrs_field,
 )
 
+from ..client_types import lazy_dict_eq_key
+
 T = TypeVar("T", bound="OneOfValidationErrorInfo")
 
 
@@ -16,7 +18,20 @@ class OneOfValidationErrorInfo:
     """Keyword-specific metadata for ``oneOf``"""
 
     passing_schemas: list[int] | None
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         passing_schemas: list[int] | None
@@ -27,7 +42,8 @@ class OneOfValidationErrorInfo:
             passing_schemas = self.passing_schemas
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "passingSchemas": passing_schemas,
@@ -59,12 +75,12 @@ class OneOfValidationErrorInfo:
             passing_schemas=passing_schemas,
         )
 
-        one_of_validation_error_info.additional_properties = d
+        one_of_validation_error_info._additional_properties = d or None
         return one_of_validation_error_info
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -76,4 +92,4 @@ class OneOfValidationErrorInfo:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
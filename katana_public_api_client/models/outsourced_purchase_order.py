@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 from ..models.document_send_status import DocumentSendStatus
 from ..models.outsourced_purchase_order_entity_type import (
     OutsourcedPurchaseOrderEntityType,
@@ -57,7 +57,20 @@ class OutsourcedPurchaseOrder:
         UNSET
     )
     ingredient_expected_date: datetime.datetime | None | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -144,7 +157,8 @@ class OutsourcedPurchaseOrder:
             ingredient_expected_date = self.ingredient_expected_date
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -371,12 +385,12 @@ class OutsourcedPurchaseOrder:
             ingredient_expected_date=ingredient_expected_date,
         )
 
-        outsourced_purchase_order.additional_properties = d
+        outsourced_purchase_order._additional_properties = d or None
         return outsourced_purchase_order
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -388,4 +402,4 @@ class OutsourcedPurchaseOrder:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
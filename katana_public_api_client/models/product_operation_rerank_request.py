@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar("T", bound="ProductOperationRerankRequest")
 
@@ -24,7 +24,20 @@ class ProductOperationRerankRequest:
     rank_product_operation_id: int
     preceding_product_operation_id: int | Unset = UNSET
     should_group: bool | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         rank_product_operation_id = self.rank_product_operation_id
@@ -34,7 +47,8 @@ class ProductOperationRerankRequest:
         should_group = self.should_group
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "rank_product_operation_id": rank_product_operation_id,
@@ -64,12 +78,12 @@ class ProductOperationRerankRequest:
             should_group=should_group,
         )
 
-        product_operation_rerank_request.additional_properties = d
+        product_operation_rerank_request._additional_properties = d or None
         return product_operation_rerank_request
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -81,4 +95,4 @@ class ProductOperationRerankRequest:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
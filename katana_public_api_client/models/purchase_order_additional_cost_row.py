@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar("T", bound="PurchaseOrderAdditionalCostRow")
 
@@ -40,7 +40,20 @@ class PurchaseOrderAdditionalCostRow:
     currency: str | Unset = UNSET
     currency_conversion_rate: float | None | Unset = UNSET
     currency_conversion_rate_fix_date: datetime.datetime | None | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -104,7 +117,8 @@ class PurchaseOrderAdditionalCostRow:
             currency_conversion_rate_fix_date = self.currency_conversion_rate_fix_date
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -263,12 +277,12 @@ class PurchaseOrderAdditionalCostRow:
             currency_conversion_rate_fix_date=currency_conversion_rate_fix_date,
         )
 
-        purchase_order_additional_cost_row.additional_properties = d
+        purchase_order_additional_cost_row._additional_properties = d or None
         return purchase_order_additional_cost_row
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -280,4 +294,4 @@ class PurchaseOrderAdditionalCostRow:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 from ..models.document_send_status import DocumentSendStatus
 from ..models.purchase_order_billing_status import PurchaseOrderBillingStatus
 from ..models.purchase_order_entity_type import PurchaseOrderEntityType
@@ -47,7 +47,20 @@ class PurchaseOrderBase:
     last_document_status: DocumentSendStatus | Unset = UNSET
     purchase_order_rows: list[PurchaseOrderRow] | Unset = UNSET
     supplier: Supplier | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -120,7 +133,8 @@ class PurchaseOrderBase:
             supplier = self.supplier.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -307,12 +321,12 @@ class PurchaseOrderBase:
             supplier=supplier,
         )
 
-        purchase_order_base.additional_properties = d
+        purchase_order_base._additional_properties = d or None
         return purchase_order_base
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -324,4 +338,4 @@ class PurchaseOrderBase:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
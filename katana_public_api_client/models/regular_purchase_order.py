@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 from ..models.document_send_status import DocumentSendStatus
 from ..models.purchase_order_billing_status import PurchaseOrderBillingStatus
 from ..models.purchase_order_status import PurchaseOrderStatus
@@ -48,7 +48,20 @@ class RegularPurchaseOrder:
     purchase_order_rows: list[PurchaseOrderRow] | Unset = UNSET
     supplier: Supplier | Unset = UNSET
     tracking_location_id: None | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -123,7 +136,8 @@ class RegularPurchaseOrder:
         tracking_location_id = self.tracking_location_id
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -315,12 +329,12 @@ class RegularPurchaseOrder:
             tracking_location_id=tracking_location_id,
         )
 
-        regular_purchase_order.additional_properties = d
+        regular_purchase_order._additional_properties = d or None
         return regular_purchase_order
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -332,4 +346,4 @@ class RegularPurchaseOrder:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
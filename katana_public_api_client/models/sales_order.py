@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 from ..models.ingredient_availability import IngredientAvailability
 from ..models.product_availability import ProductAvailability
 from ..models.sales_order_invoicing_status import SalesOrderInvoicingStatus
@@ -162,7 +162,20 @@ class SalesOrder:
     shipping_fee: None | SalesOrderShippingFee | Unset = UNSET
     addresses: list[SalesOrderAddress] | Unset = UNSET
     custom_fields: None | SalesOrderCustomFieldsType0 | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         from ..models.sales_order_custom_fields_type_0 import (
@@ -381,7 +394,8 @@ class SalesOrder:
             custom_fields = self.custom_fields
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -925,12 +939,12 @@ class SalesOrder:
             custom_fields=custom_fields,
         )
 
-        sales_order.additional_properties = d
+        sales_order._additional_properties = d or None
         return sales_order
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -942,4 +956,4 @@ class SalesOrder:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
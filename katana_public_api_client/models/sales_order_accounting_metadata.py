@@ -9,6 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
+from ..client_types import lazy_dict_eq_key
 from ..models.accounting_integration_type import AccountingIntegrationType
 
 T = TypeVar("T", bound="SalesOrderAccountingMetadata")
@@ -29,7 +30,20 @@ class SalesOrderAccountingMetadata:
     invoice_id: str
     integration_type: AccountingIntegrationType
     created_at: datetime.datetime
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -45,7 +59,8 @@ class SalesOrderAccountingMetadata:
         created_at = self.created_at.isoformat()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -83,12 +98,12 @@ class SalesOrderAccountingMetadata:
             created_at=created_at,
         )
 
-        sales_order_accounting_metadata.additional_properties = d
+        sales_order_accounting_metadata._additional_properties = d or None
         return sales_order_accounting_metadata
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -100,4 +115,4 @@ class SalesOrderAccountingMetadata:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 from ..models.sales_order_fulfillment_invoice_status import (
     SalesOrderFulfillmentInvoiceStatus,
 )
@@ -55,7 +55,20 @@ class SalesOrderFulfillment:
     sales_order_fulfillment_rows: (
         list[SalesOrderFulfillmentSalesOrderFulfillmentRowsItem] | Unset
     ) = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -146,7 +159,8 @@ class SalesOrderFulfillment:
                 sales_order_fulfillment_rows.append(sales_order_fulfillment_rows_item)
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -354,12 +368,12 @@ class SalesOrderFulfillment:
             sales_order_fulfillment_rows=sales_order_fulfillment_rows,
         )
 
-        sales_order_fulfillment.additional_properties = d
+        sales_order_fulfillment._additional_properties = d or None
         return sales_order_fulfillment
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -371,4 +385,4 @@ class SalesOrderFulfillment:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 if TYPE_CHECKING:
     from ..models.sales_order_fulfillment_sales_order_fulfillment_rows_item_batch_transactions_item import (
@@ -28,7 +28,20 @@ class SalesOrderFulfillmentSalesOrderFulfillmentRowsItem:
         | Unset
     ) = UNSET
     serial_numbers: list[int] | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         sales_order_row_id = self.sales_order_row_id
@@ -47,7 +60,8 @@ class SalesOrderFulfillmentSalesOrderFulfillmentRowsItem:
             serial_numbers = self.serial_numbers
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if sales_order_row_id is not UNSET:
             field_dict["sales_order_row_id"] = sales_order_row_id
@@ -96,12 +110,14 @@ class SalesOrderFulfillmentSalesOrderFulfillmentRowsItem:
             serial_numbers=serial_numbers,
         )
 
-        sales_order_fulfillment_sales_order_fulfillment_rows_item.additional_properties = d
+        sales_order_fulfillment_sales_order_fulfillment_rows_item._additional_properties = (
+            d or None
+        )
         return sales_order_fulfillment_sales_order_fulfillment_rows_item
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -113,4 +129,4 @@ class SalesOrderFulfillmentSalesOrderFulfillmentRowsItem:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
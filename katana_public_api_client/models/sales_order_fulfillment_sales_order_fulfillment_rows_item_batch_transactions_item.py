@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar(
     "T", bound="SalesOrderFulfillmentSalesOrderFulfillmentRowsItemBatchTransactionsItem"
@@ -19,7 +19,20 @@ T = TypeVar(
 class SalesOrderFulfillmentSalesOrderFulfillmentRowsItemBatchTransactionsItem:
     batch_id: int | Unset = UNSET
     quantity: float | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         batch_id = self.batch_id
@@ -27,7 +40,8 @@ class SalesOrderFulfillmentSalesOrderFulfillmentRowsItemBatchTransactionsItem:
         quantity = self.quantity
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if batch_id is not UNSET:
             field_dict["batch_id"] = batch_id
@@ -48,12 +62,14 @@ class SalesOrderFulfillmentSalesOrderFulfillmentRowsItemBatchTransactionsItem:
             quantity=quantity,
         )
 
-        sales_order_fulfillment_sales_order_fulfillment_rows_item_batch_transactions_item.additional_properties = d
+        sales_order_fulfillment_sales_order_fulfillment_rows_item_batch_transactions_item._additional_properties = (
+            d or None
+        )
         return sales_order_fulfillment_sales_order_fulfillment_rows_item_batch_transactions_item
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -65,4 +81,4 @@ class SalesOrderFulfillmentSalesOrderFulfillmentRowsItemBatchTransactionsItem:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
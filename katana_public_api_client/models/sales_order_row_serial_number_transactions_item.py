@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 from ..models.sales_order_row_serial_number_transactions_item_quantity import (
     SalesOrderRowSerialNumberTransactionsItemQuantity,
 )
@@ -20,7 +20,20 @@ T = TypeVar("T", bound="SalesOrderRowSerialNumberTransactionsItem")
 class SalesOrderRowSerialNumberTransactionsItem:
     serial_number_id: int
     quantity: SalesOrderRowSerialNumberTransactionsItemQuantity | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         serial_number_id = self.serial_number_id
@@ -30,7 +43,8 @@ class SalesOrderRowSerialNumberTransactionsItem:
             quantity = self.quantity.value
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "serial_number_id": serial_number_id,
@@ -58,12 +72,14 @@ class SalesOrderRowSerialNumberTransactionsItem:
             quantity=quantity,
         )
 
-        sales_order_row_serial_number_transactions_item.additional_properties = d
+        sales_order_row_serial_number_transactions_item._additional_properties = (
+            d or None
+        )
         return sales_order_row_serial_number_transactions_item
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -75,4 +91,4 @@ class SalesOrderRowSerialNumberTransactionsItem:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 if TYPE_CHECKING:
     from ..models.sales_order_search_where_and_item import SalesOrderSearchWhereAndItem
@@ -57,7 +57,20 @@ class SalesOrderSearchWhere:
     order_created_date: bool | float | None | SearchComparator | str | Unset = UNSET
     delivery_date: bool | float | None | SearchComparator | str | Unset = UNSET
     picked_date: bool | float | None | SearchComparator | str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         from ..models.search_comparator import SearchComparator
@@ -245,7 +258,8 @@ class SalesOrderSearchWhere:
             picked_date = self.picked_date
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if and_ is not UNSET:
             field_dict["and"] = and_
@@ -871,12 +885,12 @@ class SalesOrderSearchWhere:
             picked_date=picked_date,
         )
 
-        sales_order_search_where.additional_properties = d
+        sales_order_search_where._additional_properties = d or None
         return sales_order_search_where
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -888,4 +902,4 @@ class SalesOrderSearchWhere:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 from ..models.sales_return_refund_status import SalesReturnRefundStatus
 from ..models.sales_return_status import SalesReturnStatus
 
@@ -53,7 +53,20 @@ class SalesReturn:
     tracking_carrier: None | str | Unset = UNSET
     tracking_method: None | str | Unset = UNSET
     sales_return_rows: list[SalesReturnRow] | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -148,7 +161,8 @@ class SalesReturn:
                 sales_return_rows.append(sales_return_rows_item)
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -369,12 +383,12 @@ class SalesReturn:
             sales_return_rows=sales_return_rows,
         )
 
-        sales_return.additional_properties = d
+        sales_return._additional_properties = d or None
         return sales_return
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -386,4 +400,4 @@ class SalesReturn:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
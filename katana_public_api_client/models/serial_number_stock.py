@@ -8,6 +8,8 @@ from attrs import (
     field as _attrs_field,
 )
 
+from ..client_types import lazy_dict_eq_key
+
 if TYPE_CHECKING:
     from ..models.serial_number_stock_transactions_item import (
         SerialNumberStockTransactionsItem,
@@ -25,7 +27,20 @@ class SerialNumberStock:
     serial_number: str
     in_stock: bool
     transactions: list[SerialNumberStockTransactionsItem]
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -40,7 +55,8 @@ class SerialNumberStock:
             transactions.append(transactions_item)
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -81,12 +97,12 @@ class SerialNumberStock:
             transactions=transactions,
         )
 
-        serial_number_stock.additional_properties = d
+        serial_number_stock._additional_properties = d or None
         return serial_number_stock
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -98,4 +114,4 @@ class SerialNumberStock:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
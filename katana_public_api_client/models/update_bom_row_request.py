@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar("T", bound="UpdateBomRowRequest")
 
@@ -24,7 +24,20 @@ class UpdateBomRowRequest:
     ingredient_variant_id: int | Unset = UNSET
     quantity: float | None | Unset = UNSET
     notes: None | str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         ingredient_variant_id = self.ingredient_variant_id
@@ -42,7 +55,8 @@ class UpdateBomRowRequest:
             notes = self.notes
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if ingredient_variant_id is not UNSET:
             field_dict["ingredient_variant_id"] = ingredient_variant_id
@@ -82,12 +96,12 @@ class UpdateBomRowRequest:
             notes=notes,
         )
 
-        update_bom_row_request.additional_properties = d
+        update_bom_row_request._additional_properties = d or None
         return update_bom_row_request
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -99,4 +113,4 @@ class UpdateBomRowRequest:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
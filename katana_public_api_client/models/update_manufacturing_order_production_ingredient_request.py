@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 if TYPE_CHECKING:
     from ..models.batch_transaction import BatchTransaction
@@ -26,7 +26,20 @@ class UpdateManufacturingOrderProductionIngredientRequest:
     """
 
     batch_transactions: list[BatchTransaction] | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         batch_transactions: list[dict[str, Any]] | Unset = UNSET
@@ -37,7 +50,8 @@ class UpdateManufacturingOrderProductionIngredientRequest:
                 batch_transactions.append(batch_transactions_item)
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if batch_transactions is not UNSET:
             field_dict["batch_transactions"] = batch_transactions
@@ -64,12 +78,14 @@ class UpdateManufacturingOrderProductionIngredientRequest:
             batch_transactions=batch_transactions,
         )
 
-        update_manufacturing_order_production_ingredient_request.additional_properties = d
+        update_manufacturing_order_production_ingredient_request._additional_properties = (
+            d or None
+        )
         return update_manufacturing_order_production_ingredient_request
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -81,4 +97,4 @@ class UpdateManufacturingOrderProductionIngredientRequest:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar("T", bound="UpdateManufacturingOrderProductionRequest")
 
@@ -23,7 +23,20 @@ class UpdateManufacturingOrderProductionRequest:
     """
 
     production_date: datetime.datetime | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         production_date: str | Unset = UNSET
@@ -31,7 +44,8 @@ class UpdateManufacturingOrderProductionRequest:
             production_date = self.production_date.isoformat()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if production_date is not UNSET:
             field_dict["production_date"] = production_date
@@ -52,12 +66,12 @@ class UpdateManufacturingOrderProductionRequest:
             production_date=production_date,
         )
 
-        update_manufacturing_order_production_request.additional_properties = d
+        update_manufacturing_order_production_request._additional_properties = d or None
         return update_manufacturing_order_production_request
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -69,4 +83,4 @@ class UpdateManufacturingOrderProductionRequest:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
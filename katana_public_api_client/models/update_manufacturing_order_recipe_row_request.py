@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 if TYPE_CHECKING:
     from ..models.update_manufacturing_order_recipe_row_request_batch_transactions_item import (
@@ -36,7 +36,20 @@ class UpdateManufacturingOrderRecipeRowRequest:
     batch_transactions: (
         list[UpdateManufacturingOrderRecipeRowRequestBatchTransactionsItem] | Unset
     ) = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         variant_id = self.variant_id
@@ -55,7 +68,8 @@ class UpdateManufacturingOrderRecipeRowRequest:
                 batch_transactions.append(batch_transactions_item)
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if variant_id is not UNSET:
             field_dict["variant_id"] = variant_id
@@ -106,12 +120,12 @@ class UpdateManufacturingOrderRecipeRowRequest:
             batch_transactions=batch_transactions,
         )
 
-        update_manufacturing_order_recipe_row_request.additional_properties = d
+        update_manufacturing_order_recipe_row_request._additional_properties = d or None
         return update_manufacturing_order_recipe_row_request
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -123,4 +137,4 @@ class UpdateManufacturingOrderRecipeRowRequest:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 from ..models.manufacturing_order_status import ManufacturingOrderStatus
 
 if TYPE_CHECKING:
@@ -40,7 +40,20 @@ class UpdateManufacturingOrderRequest:
     additional_info: str | Unset = UNSET
     batch_transactions: list[BatchTransaction] | Unset = UNSET
     serial_numbers: list[int] | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         status: str | Unset = UNSET
@@ -83,7 +96,8 @@ class UpdateManufacturingOrderRequest:
             serial_numbers = self.serial_numbers
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if status is not UNSET:
             field_dict["status"] = status
@@ -187,12 +201,12 @@ class UpdateManufacturingOrderRequest:
             serial_numbers=serial_numbers,
         )
 
-        update_manufacturing_order_request.additional_properties = d
+        update_manufacturing_order_request._additional_properties = d or None
         return update_manufacturing_order_request
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -204,4 +218,4 @@ class UpdateManufacturingOrderRequest:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar("T", bound="UpdateSalesOrderRowRequestSerialNumberTransactionsItem")
 
@@ -17,7 +17,20 @@ T = TypeVar("T", bound="UpdateSalesOrderRowRequestSerialNumberTransactionsItem")
 class UpdateSalesOrderRowRequestSerialNumberTransactionsItem:
     serial_number_id: int | Unset = UNSET
     quantity: float | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         serial_number_id = self.serial_number_id
@@ -25,7 +38,8 @@ class UpdateSalesOrderRowRequestSerialNumberTransactionsItem:
         quantity = self.quantity
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if serial_number_id is not UNSET:
             field_dict["serial_number_id"] = serial_number_id
@@ -46,12 +60,14 @@ class UpdateSalesOrderRowRequestSerialNumberTransactionsItem:
             quantity=quantity,
         )
 
-        update_sales_order_row_request_serial_number_transactions_item.additional_properties = d
+        update_sales_order_row_request_serial_number_transactions_item._additional_properties = (
+            d or None
+        )
         return update_sales_order_row_request_serial_number_transactions_item
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -63,4 +79,4 @@ class UpdateSalesOrderRowRequestSerialNumberTransactionsItem:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar("T", bound="UpdateVariantRequestConfigAttributesItem")
 
@@ -17,7 +17,20 @@ T = TypeVar("T", bound="UpdateVariantRequestConfigAttributesItem")
 class UpdateVariantRequestConfigAttributesItem:
     config_name: str | Unset = UNSET
     config_value: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         config_name = self.config_name
@@ -25,7 +38,8 @@ class UpdateVariantRequestConfigAttributesItem:
         config_value = self.config_value
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if config_name is not UNSET:
             field_dict["config_name"] = config_name
@@ -46,12 +60,12 @@ class UpdateVariantRequestConfigAttributesItem:
             config_value=config_value,
         )
 
-        update_variant_request_config_attributes_item.additional_properties = d
+        update_variant_request_config_attributes_item._additional_properties = d or None
         return update_variant_request_config_attributes_item
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -63,4 +77,4 @@ class UpdateVariantRequestConfigAttributesItem:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
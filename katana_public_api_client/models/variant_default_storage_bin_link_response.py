@@ -9,7 +9,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar("T", bound="VariantDefaultStorageBinLinkResponse")
 
@@ -30,7 +30,20 @@ class VariantDefaultStorageBinLinkResponse:
     bin_name: str | Unset = UNSET
     variant_id: int | Unset = UNSET
     storage_bin_id: int | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         id = self.id
@@ -58,7 +71,8 @@ class VariantDefaultStorageBinLinkResponse:
         storage_bin_id = self.storage_bin_id
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "id": id,
@@ -131,12 +145,12 @@ class VariantDefaultStorageBinLinkResponse:
             storage_bin_id=storage_bin_id,
         )
 
-        variant_default_storage_bin_link_response.additional_properties = d
+        variant_default_storage_bin_link_response._additional_properties = d or None
         return variant_default_storage_bin_link_response
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -148,4 +162,4 @@ class VariantDefaultStorageBinLinkResponse:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
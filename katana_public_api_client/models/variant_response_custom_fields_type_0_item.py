@@ -8,7 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
-from ..client_types import UNSET, Unset
+from ..client_types import UNSET, Unset, lazy_dict_eq_key
 
 T = TypeVar("T", bound="VariantResponseCustomFieldsType0Item")
 
@@ -17,7 +17,20 @@ T = TypeVar("T", bound="VariantResponseCustomFieldsType0Item")
 class VariantResponseCustomFieldsType0Item:
     field_name: str | Unset = UNSET
     field_value: str | Unset = UNSET
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         field_name = self.field_name
@@ -25,7 +38,8 @@ class VariantResponseCustomFieldsType0Item:
         field_value = self.field_value
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update({})
         if field_name is not UNSET:
             field_dict["field_name"] = field_name
@@ -46,12 +60,12 @@ class VariantResponseCustomFieldsType0Item:
             field_value=field_value,
         )
 
-        variant_response_custom_fields_type_0_item.additional_properties = d
+        variant_response_custom_fields_type_0_item._additional_properties = d or None
         return variant_response_custom_fields_type_0_item
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -63,4 +77,4 @@ class VariantResponseCustomFieldsType0Item:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
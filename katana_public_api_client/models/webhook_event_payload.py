@@ -8,6 +8,7 @@ from attrs import (
     field as _attrs_field,
 )
 
+from ..client_types import lazy_dict_eq_key
 from ..models.webhook_event import WebhookEvent
 
 if TYPE_CHECKING:
@@ -31,7 +32,20 @@ class WebhookEventPayload:
     action: WebhookEvent
     webhook_id: int
     object_: WebhookEventPayloadObject
-    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
 
     def to_dict(self) -> dict[str, Any]:
         resource_type = self.resource_type
@@ -43,7 +57,8 @@ class WebhookEventPayload:
         object_ = self.object_.to_dict()
 
         field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        if self._additional_properties:
+            field_dict.update(self._additional_properties)
         field_dict.update(
             {
                 "resource_type": resource_type,
@@ -75,12 +90,12 @@ class WebhookEventPayload:
             object_=object_,
         )
 
-        webhook_event_payload.additional_properties = d
+        webhook_event_payload._additional_properties = d or None
         return webhook_event_payload
 
     @property
     def additional_keys(self) -> list[str]:
-        return list(self.additional_properties.keys())
+        return list(self._additional_properties or ())
 
     def __getitem__(self, key: str) -> Any:
         return self.additional_properties[key]
@@ -92,4 +107,4 @@ class WebhookEventPayload:
         del self.additional_properties[key]
 
     def __contains__(self, key: str) -> bool:
-        return key in self.additional_properties
+        return key in (self._additional_properties or ())
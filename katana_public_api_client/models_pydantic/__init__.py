@@ -59,9 +59,11 @@ The Pydantic models here are designed for user-facing operations while the attrs
 models handle API communication internally.
 """
 
-# Import generated models (populated by generation script)
-# This will be updated by the generate_pydantic_models.py script
-import logging
+# Generated models (populated by generation script) are imported on first
+# access, one domain module at a time; the attrs <-> Pydantic registry fills
+# in the same way as classes are looked up.
+import importlib
+from typing import TYPE_CHECKING, Any
 
 from ._base import KatanaPydanticBase
 from ._registry import (
@@ -75,37 +77,19 @@ from ._registry import (
     register,
 )
 
-_logger = logging.getLogger(__name__)
-
-# Try to import generated models
-try:
+if TYPE_CHECKING:
     from ._generated import *  # noqa: F403
 
-    _GENERATED_MODELS_AVAILABLE = True
-except ImportError as e:
-    # Generated models not yet created - this is expected before running
-    # the generation script for the first time
-    _GENERATED_MODELS_AVAILABLE = False
-    _logger.debug(
-        "Pydantic models not yet generated. Run 'uv run poe generate-pydantic' "
-        "to generate them. Import error: %s",
-        e,
-    )
-
-# Import auto-registration (populated by generation script)
-try:
-    from ._auto_registry import register_all_models as _register_all
-
-    _register_all()
-    _REGISTRY_AVAILABLE = True
-except ImportError as e:
-    # Auto-registry not yet created - this is expected before generation
-    _REGISTRY_AVAILABLE = False
-    _logger.debug(
-        "Auto-registry not yet generated. Run 'uv run poe generate-pydantic' "
-        "to generate it. Import error: %s",
-        e,
-    )
+
+def __getattr__(name: str) -> Any:
+    _generated = importlib.import_module("._generated", __name__)
+    if name not in _generated.__all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(_generated, name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Base class
@@ -6,1587 +6,440 @@ To regenerate, run:
     uv run poe generate-pydantic
 """
 
-# Import all model classes
-from katana_public_api_client.models.additional_cost import (
-    AdditionalCost as AttrsAdditionalCost,
-)
-from katana_public_api_client.models.additional_cost_list_response import (
-    AdditionalCostListResponse as AttrsAdditionalCostListResponse,
-)
-from katana_public_api_client.models.additional_properties_validation_error import (
-    AdditionalPropertiesValidationError as AttrsAdditionalPropertiesValidationError,
-)
-from katana_public_api_client.models.archivable_deletable_entity import (
-    ArchivableDeletableEntity as AttrsArchivableDeletableEntity,
-)
-from katana_public_api_client.models.archivable_entity import (
-    ArchivableEntity as AttrsArchivableEntity,
-)
-from katana_public_api_client.models.assigned_operator import (
-    AssignedOperator as AttrsAssignedOperator,
-)
-from katana_public_api_client.models.base_entity import BaseEntity as AttrsBaseEntity
-from katana_public_api_client.models.base_validation_error import (
-    BaseValidationError as AttrsBaseValidationError,
-)
-from katana_public_api_client.models.batch import Batch as AttrsBatch
-from katana_public_api_client.models.batch_create_bom_rows_request import (
-    BatchCreateBomRowsRequest as AttrsBatchCreateBomRowsRequest,
-)
-from katana_public_api_client.models.batch_response import (
-    BatchResponse as AttrsBatchResponse,
-)
-from katana_public_api_client.models.batch_stock import BatchStock as AttrsBatchStock
-from katana_public_api_client.models.batch_stock_list_response import (
-    BatchStockListResponse as AttrsBatchStockListResponse,
-)
-from katana_public_api_client.models.batch_stock_update import (
-    BatchStockUpdate as AttrsBatchStockUpdate,
-)
-from katana_public_api_client.models.batch_transaction import (
-    BatchTransaction as AttrsBatchTransaction,
-)
-from katana_public_api_client.models.batch_transaction_request import (
-    BatchTransactionRequest as AttrsBatchTransactionRequest,
-)
-from katana_public_api_client.models.bin_inventory import (
-    BinInventory as AttrsBinInventory,
-)
-from katana_public_api_client.models.bin_inventory_list_response import (
-    BinInventoryListResponse as AttrsBinInventoryListResponse,
-)
-from katana_public_api_client.models.bin_transfer import BinTransfer as AttrsBinTransfer
-from katana_public_api_client.models.bin_transfer_list_response import (
-    BinTransferListResponse as AttrsBinTransferListResponse,
-)
-from katana_public_api_client.models.bin_transfer_row import (
-    BinTransferRow as AttrsBinTransferRow,
-)
-from katana_public_api_client.models.bin_transfer_row_create_nested import (
-    BinTransferRowCreateNested as AttrsBinTransferRowCreateNested,
-)
-from katana_public_api_client.models.bin_transfer_row_list_response import (
-    BinTransferRowListResponse as AttrsBinTransferRowListResponse,
-)
-from katana_public_api_client.models.bin_transfer_traceability import (
-    BinTransferTraceability as AttrsBinTransferTraceability,
-)
-from katana_public_api_client.models.bin_transfer_traceability_request import (
-    BinTransferTraceabilityRequest as AttrsBinTransferTraceabilityRequest,
-)
-from katana_public_api_client.models.bom_row import BomRow as AttrsBomRow
-from katana_public_api_client.models.bom_row_list_response import (
-    BomRowListResponse as AttrsBomRowListResponse,
-)
-from katana_public_api_client.models.clear_demand_forecast_request import (
-    ClearDemandForecastRequest as AttrsClearDemandForecastRequest,
-)
-from katana_public_api_client.models.coded_error_response import (
-    CodedErrorResponse as AttrsCodedErrorResponse,
-)
-from katana_public_api_client.models.const_validation_error import (
-    ConstValidationError as AttrsConstValidationError,
-)
-from katana_public_api_client.models.create_bin_transfer_request import (
-    CreateBinTransferRequest as AttrsCreateBinTransferRequest,
-)
-from katana_public_api_client.models.create_bin_transfer_row_request import (
-    CreateBinTransferRowRequest as AttrsCreateBinTransferRowRequest,
-)
-from katana_public_api_client.models.create_bom_row_request import (
-    CreateBomRowRequest as AttrsCreateBomRowRequest,
-)
-from katana_public_api_client.models.create_custom_field_definition_request import (
-    CreateCustomFieldDefinitionRequest as AttrsCreateCustomFieldDefinitionRequest,
-)
-from katana_public_api_client.models.create_customer_address_request import (
-    CreateCustomerAddressRequest as AttrsCreateCustomerAddressRequest,
-)
-from katana_public_api_client.models.create_customer_request import (
-    CreateCustomerRequest as AttrsCreateCustomerRequest,
-)
-from katana_public_api_client.models.create_demand_forecast_request import (
-    CreateDemandForecastRequest as AttrsCreateDemandForecastRequest,
-)
-from katana_public_api_client.models.create_inventory_reorder_point_request import (
-    CreateInventoryReorderPointRequest as AttrsCreateInventoryReorderPointRequest,
-)
-from katana_public_api_client.models.create_inventory_safety_stock_level_request import (
-    CreateInventorySafetyStockLevelRequest as AttrsCreateInventorySafetyStockLevelRequest,
-)
-from katana_public_api_client.models.create_manufacturing_order_operation_row_request import (
-    CreateManufacturingOrderOperationRowRequest as AttrsCreateManufacturingOrderOperationRowRequest,
-)
-from katana_public_api_client.models.create_manufacturing_order_production_request import (
-    CreateManufacturingOrderProductionRequest as AttrsCreateManufacturingOrderProductionRequest,
-)
-from katana_public_api_client.models.create_manufacturing_order_recipe_row_request import (
-    CreateManufacturingOrderRecipeRowRequest as AttrsCreateManufacturingOrderRecipeRowRequest,
-)
-from katana_public_api_client.models.create_manufacturing_order_request import (
-    CreateManufacturingOrderRequest as AttrsCreateManufacturingOrderRequest,
-)
-from katana_public_api_client.models.create_material_request import (
-    CreateMaterialRequest as AttrsCreateMaterialRequest,
-)
-from katana_public_api_client.models.create_outsourced_purchase_order_recipe_row_request import (
-    CreateOutsourcedPurchaseOrderRecipeRowRequest as AttrsCreateOutsourcedPurchaseOrderRecipeRowRequest,
-)
-from katana_public_api_client.models.create_price_list_customer_request import (
-    CreatePriceListCustomerRequest as AttrsCreatePriceListCustomerRequest,
-)
-from katana_public_api_client.models.create_price_list_request import (
-    CreatePriceListRequest as AttrsCreatePriceListRequest,
-)
-from katana_public_api_client.models.create_price_list_row_request import (
-    CreatePriceListRowRequest as AttrsCreatePriceListRowRequest,
-)
-from katana_public_api_client.models.create_product_operation_row_item import (
-    CreateProductOperationRowItem as AttrsCreateProductOperationRowItem,
-)
-from katana_public_api_client.models.create_product_operation_rows_request import (
-    CreateProductOperationRowsRequest as AttrsCreateProductOperationRowsRequest,
-)
-from katana_public_api_client.models.create_product_request import (
-    CreateProductRequest as AttrsCreateProductRequest,
-)
-from katana_public_api_client.models.create_purchase_order_additional_cost_row_request import (
-    CreatePurchaseOrderAdditionalCostRowRequest as AttrsCreatePurchaseOrderAdditionalCostRowRequest,
-)
-from katana_public_api_client.models.create_purchase_order_request import (
-    CreatePurchaseOrderRequest as AttrsCreatePurchaseOrderRequest,
-)
-from katana_public_api_client.models.create_purchase_order_row_request import (
-    CreatePurchaseOrderRowRequest as AttrsCreatePurchaseOrderRowRequest,
-)
-from katana_public_api_client.models.create_recipes_request import (
-    CreateRecipesRequest as AttrsCreateRecipesRequest,
-)
-from katana_public_api_client.models.create_sales_order_address_request import (
-    CreateSalesOrderAddressRequest as AttrsCreateSalesOrderAddressRequest,
-)
-from katana_public_api_client.models.create_sales_order_fulfillment_request import (
-    CreateSalesOrderFulfillmentRequest as AttrsCreateSalesOrderFulfillmentRequest,
-)
-from katana_public_api_client.models.create_sales_order_request import (
-    CreateSalesOrderRequest as AttrsCreateSalesOrderRequest,
-)
-from katana_public_api_client.models.create_sales_order_row_request import (
-    CreateSalesOrderRowRequest as AttrsCreateSalesOrderRowRequest,
-)
-from katana_public_api_client.models.create_sales_order_shipping_fee_request import (
-    CreateSalesOrderShippingFeeRequest as AttrsCreateSalesOrderShippingFeeRequest,
-)
-from katana_public_api_client.models.create_sales_return_request import (
-    CreateSalesReturnRequest as AttrsCreateSalesReturnRequest,
-)
-from katana_public_api_client.models.create_sales_return_row_request import (
-    CreateSalesReturnRowRequest as AttrsCreateSalesReturnRowRequest,
-)
-from katana_public_api_client.models.create_serial_number_failed_item import (
-    CreateSerialNumberFailedItem as AttrsCreateSerialNumberFailedItem,
-)
-from katana_public_api_client.models.create_serial_numbers_request import (
-    CreateSerialNumbersRequest as AttrsCreateSerialNumbersRequest,
-)
-from katana_public_api_client.models.create_serial_numbers_response import (
-    CreateSerialNumbersResponse as AttrsCreateSerialNumbersResponse,
-)
-from katana_public_api_client.models.create_service_request import (
-    CreateServiceRequest as AttrsCreateServiceRequest,
-)
-from katana_public_api_client.models.create_service_variant_request import (
-    CreateServiceVariantRequest as AttrsCreateServiceVariantRequest,
-)
-from katana_public_api_client.models.create_stock_adjustment_request import (
-    CreateStockAdjustmentRequest as AttrsCreateStockAdjustmentRequest,
-)
-from katana_public_api_client.models.create_stock_transfer_request import (
-    CreateStockTransferRequest as AttrsCreateStockTransferRequest,
-)
-from katana_public_api_client.models.create_stocktake_request import (
-    CreateStocktakeRequest as AttrsCreateStocktakeRequest,
-)
-from katana_public_api_client.models.create_stocktake_row_request import (
-    CreateStocktakeRowRequest as AttrsCreateStocktakeRowRequest,
-)
-from katana_public_api_client.models.create_supplier_address_request import (
-    CreateSupplierAddressRequest as AttrsCreateSupplierAddressRequest,
-)
-from katana_public_api_client.models.create_supplier_request import (
-    CreateSupplierRequest as AttrsCreateSupplierRequest,
-)
-from katana_public_api_client.models.create_tax_rate_request import (
-    CreateTaxRateRequest as AttrsCreateTaxRateRequest,
-)
-from katana_public_api_client.models.create_variant_request import (
-    CreateVariantRequest as AttrsCreateVariantRequest,
-)
-from katana_public_api_client.models.create_webhook_request import (
-    CreateWebhookRequest as AttrsCreateWebhookRequest,
-)
-from katana_public_api_client.models.custom_field import CustomField as AttrsCustomField
-from katana_public_api_client.models.custom_field_choice import (
-    CustomFieldChoice as AttrsCustomFieldChoice,
-)
-from katana_public_api_client.models.custom_field_choice_create import (
-    CustomFieldChoiceCreate as AttrsCustomFieldChoiceCreate,
-)
-from katana_public_api_client.models.custom_field_definition import (
-    CustomFieldDefinition as AttrsCustomFieldDefinition,
-)
-from katana_public_api_client.models.custom_field_definition_list_response import (
-    CustomFieldDefinitionListResponse as AttrsCustomFieldDefinitionListResponse,
-)
-from katana_public_api_client.models.custom_field_options import (
-    CustomFieldOptions as AttrsCustomFieldOptions,
-)
-from katana_public_api_client.models.custom_field_options_create import (
-    CustomFieldOptionsCreate as AttrsCustomFieldOptionsCreate,
-)
-from katana_public_api_client.models.custom_field_value import (
-    CustomFieldValue as AttrsCustomFieldValue,
-)
-from katana_public_api_client.models.custom_fields_collection import (
-    CustomFieldsCollection as AttrsCustomFieldsCollection,
-)
-from katana_public_api_client.models.custom_fields_collection_list_response import (
-    CustomFieldsCollectionListResponse as AttrsCustomFieldsCollectionListResponse,
-)
-from katana_public_api_client.models.customer import Customer as AttrsCustomer
-from katana_public_api_client.models.customer_address import (
-    CustomerAddress as AttrsCustomerAddress,
-)
-from katana_public_api_client.models.customer_address_list_response import (
-    CustomerAddressListResponse as AttrsCustomerAddressListResponse,
-)
-from katana_public_api_client.models.customer_list_response import (
-    CustomerListResponse as AttrsCustomerListResponse,
-)
-from katana_public_api_client.models.deletable_entity import (
-    DeletableEntity as AttrsDeletableEntity,
-)
-from katana_public_api_client.models.delete_serial_numbers_request import (
-    DeleteSerialNumbersRequest as AttrsDeleteSerialNumbersRequest,
-)
-from katana_public_api_client.models.demand_forecast_period import (
-    DemandForecastPeriod as AttrsDemandForecastPeriod,
-)
-from katana_public_api_client.models.demand_forecast_response import (
-    DemandForecastResponse as AttrsDemandForecastResponse,
-)
-from katana_public_api_client.models.dependencies_validation_error import (
-    DependenciesValidationError as AttrsDependenciesValidationError,
-)
-from katana_public_api_client.models.detailed_error_response import (
-    DetailedErrorResponse as AttrsDetailedErrorResponse,
-)
-from katana_public_api_client.models.enum_validation_error import (
-    EnumValidationError as AttrsEnumValidationError,
-)
-from katana_public_api_client.models.error_response import (
-    ErrorResponse as AttrsErrorResponse,
-)
-from katana_public_api_client.models.exclusive_maximum_validation_error import (
-    ExclusiveMaximumValidationError as AttrsExclusiveMaximumValidationError,
-)
-from katana_public_api_client.models.exclusive_minimum_validation_error import (
-    ExclusiveMinimumValidationError as AttrsExclusiveMinimumValidationError,
-)
-from katana_public_api_client.models.factory import Factory as AttrsFactory
-from katana_public_api_client.models.format_validation_error import (
-    FormatValidationError as AttrsFormatValidationError,
-)
-from katana_public_api_client.models.generic_validation_error import (
-    GenericValidationError as AttrsGenericValidationError,
-)
-from katana_public_api_client.models.inventory import Inventory as AttrsInventory
-from katana_public_api_client.models.inventory_item import (
-    InventoryItem as AttrsInventoryItem,
-)
-from katana_public_api_client.models.inventory_list_response import (
-    InventoryListResponse as AttrsInventoryListResponse,
-)
-from katana_public_api_client.models.inventory_movement import (
-    InventoryMovement as AttrsInventoryMovement,
-)
-from katana_public_api_client.models.inventory_movement_list_response import (
-    InventoryMovementListResponse as AttrsInventoryMovementListResponse,
-)
-from katana_public_api_client.models.inventory_reorder_point import (
-    InventoryReorderPoint as AttrsInventoryReorderPoint,
-)
-from katana_public_api_client.models.inventory_reorder_point_response import (
-    InventoryReorderPointResponse as AttrsInventoryReorderPointResponse,
-)
-from katana_public_api_client.models.inventory_safety_stock_level import (
-    InventorySafetyStockLevel as AttrsInventorySafetyStockLevel,
-)
-from katana_public_api_client.models.inventory_safety_stock_level_response import (
-    InventorySafetyStockLevelResponse as AttrsInventorySafetyStockLevelResponse,
-)
-from katana_public_api_client.models.item_config import ItemConfig as AttrsItemConfig
-from katana_public_api_client.models.location import Location as AttrsLocation
-from katana_public_api_client.models.location_address import (
-    LocationAddress as AttrsLocationAddress,
-)
-from katana_public_api_client.models.location_list_response import (
-    LocationListResponse as AttrsLocationListResponse,
-)
-from katana_public_api_client.models.make_to_order_manufacturing_order_request import (
-    MakeToOrderManufacturingOrderRequest as AttrsMakeToOrderManufacturingOrderRequest,
-)
-from katana_public_api_client.models.manufacturing_order import (
-    ManufacturingOrder as AttrsManufacturingOrder,
-)
-from katana_public_api_client.models.manufacturing_order_list_response import (
-    ManufacturingOrderListResponse as AttrsManufacturingOrderListResponse,
-)
-from katana_public_api_client.models.manufacturing_order_operation_production import (
-    ManufacturingOrderOperationProduction as AttrsManufacturingOrderOperationProduction,
-)
-from katana_public_api_client.models.manufacturing_order_operation_row import (
-    ManufacturingOrderOperationRow as AttrsManufacturingOrderOperationRow,
-)
-from katana_public_api_client.models.manufacturing_order_operation_row_list_response import (
-    ManufacturingOrderOperationRowListResponse as AttrsManufacturingOrderOperationRowListResponse,
-)
-from katana_public_api_client.models.manufacturing_order_production import (
-    ManufacturingOrderProduction as AttrsManufacturingOrderProduction,
-)
-from katana_public_api_client.models.manufacturing_order_production_ingredient import (
-    ManufacturingOrderProductionIngredient as AttrsManufacturingOrderProductionIngredient,
-)
-from katana_public_api_client.models.manufacturing_order_production_ingredient_response import (
-    ManufacturingOrderProductionIngredientResponse as AttrsManufacturingOrderProductionIngredientResponse,
-)
-from katana_public_api_client.models.manufacturing_order_production_list_response import (
-    ManufacturingOrderProductionListResponse as AttrsManufacturingOrderProductionListResponse,
-)
-from katana_public_api_client.models.manufacturing_order_recipe_row import (
-    ManufacturingOrderRecipeRow as AttrsManufacturingOrderRecipeRow,
-)
-from katana_public_api_client.models.manufacturing_order_recipe_row_list_response import (
-    ManufacturingOrderRecipeRowListResponse as AttrsManufacturingOrderRecipeRowListResponse,
-)
-from katana_public_api_client.models.material import Material as AttrsMaterial
-from katana_public_api_client.models.material_config import (
-    MaterialConfig as AttrsMaterialConfig,
-)
-from katana_public_api_client.models.material_list_response import (
-    MaterialListResponse as AttrsMaterialListResponse,
-)
-from katana_public_api_client.models.max_items_validation_error import (
-    MaxItemsValidationError as AttrsMaxItemsValidationError,
-)
-from katana_public_api_client.models.max_length_validation_error import (
-    MaxLengthValidationError as AttrsMaxLengthValidationError,
-)
-from katana_public_api_client.models.maximum_validation_error import (
-    MaximumValidationError as AttrsMaximumValidationError,
-)
-from katana_public_api_client.models.min_items_validation_error import (
-    MinItemsValidationError as AttrsMinItemsValidationError,
-)
-from katana_public_api_client.models.min_length_validation_error import (
-    MinLengthValidationError as AttrsMinLengthValidationError,
-)
-from katana_public_api_client.models.minimum_validation_error import (
-    MinimumValidationError as AttrsMinimumValidationError,
-)
-from katana_public_api_client.models.multiple_of_validation_error import (
-    MultipleOfValidationError as AttrsMultipleOfValidationError,
-)
-from katana_public_api_client.models.negative_stock import (
-    NegativeStock as AttrsNegativeStock,
-)
-from katana_public_api_client.models.negative_stock_list_response import (
-    NegativeStockListResponse as AttrsNegativeStockListResponse,
-)
-from katana_public_api_client.models.one_of_validation_error import (
-    OneOfValidationError as AttrsOneOfValidationError,
-)
-from katana_public_api_client.models.operator import Operator as AttrsOperator
-from katana_public_api_client.models.operator_list_response import (
-    OperatorListResponse as AttrsOperatorListResponse,
-)
-from katana_public_api_client.models.outsourced_purchase_order import (
-    OutsourcedPurchaseOrder as AttrsOutsourcedPurchaseOrder,
-)
-from katana_public_api_client.models.outsourced_purchase_order_recipe_row import (
-    OutsourcedPurchaseOrderRecipeRow as AttrsOutsourcedPurchaseOrderRecipeRow,
-)
-from katana_public_api_client.models.outsourced_purchase_order_recipe_row_list_response import (
-    OutsourcedPurchaseOrderRecipeRowListResponse as AttrsOutsourcedPurchaseOrderRecipeRowListResponse,
-)
-from katana_public_api_client.models.pattern_validation_error import (
-    PatternValidationError as AttrsPatternValidationError,
-)
-from katana_public_api_client.models.price_list import PriceList as AttrsPriceList
-from katana_public_api_client.models.price_list_customer import (
-    PriceListCustomer as AttrsPriceListCustomer,
-)
-from katana_public_api_client.models.price_list_customer_list_response import (
-    PriceListCustomerListResponse as AttrsPriceListCustomerListResponse,
-)
-from katana_public_api_client.models.price_list_list_response import (
-    PriceListListResponse as AttrsPriceListListResponse,
-)
-from katana_public_api_client.models.price_list_row import (
-    PriceListRow as AttrsPriceListRow,
-)
-from katana_public_api_client.models.price_list_row_list_response import (
-    PriceListRowListResponse as AttrsPriceListRowListResponse,
-)
-from katana_public_api_client.models.product import Product as AttrsProduct
-from katana_public_api_client.models.product_list_response import (
-    ProductListResponse as AttrsProductListResponse,
-)
-from katana_public_api_client.models.product_operation_rerank import (
-    ProductOperationRerank as AttrsProductOperationRerank,
-)
-from katana_public_api_client.models.product_operation_rerank_request import (
-    ProductOperationRerankRequest as AttrsProductOperationRerankRequest,
-)
-from katana_public_api_client.models.product_operation_row import (
-    ProductOperationRow as AttrsProductOperationRow,
-)
-from katana_public_api_client.models.product_operation_row_list_response import (
-    ProductOperationRowListResponse as AttrsProductOperationRowListResponse,
-)
-from katana_public_api_client.models.purchase_order_accounting_metadata import (
-    PurchaseOrderAccountingMetadata as AttrsPurchaseOrderAccountingMetadata,
-)
-from katana_public_api_client.models.purchase_order_accounting_metadata_list_response import (
-    PurchaseOrderAccountingMetadataListResponse as AttrsPurchaseOrderAccountingMetadataListResponse,
-)
-from katana_public_api_client.models.purchase_order_additional_cost_row import (
-    PurchaseOrderAdditionalCostRow as AttrsPurchaseOrderAdditionalCostRow,
-)
-from katana_public_api_client.models.purchase_order_additional_cost_row_list_response import (
-    PurchaseOrderAdditionalCostRowListResponse as AttrsPurchaseOrderAdditionalCostRowListResponse,
-)
-from katana_public_api_client.models.purchase_order_base import (
-    PurchaseOrderBase as AttrsPurchaseOrderBase,
-)
-from katana_public_api_client.models.purchase_order_list_response import (
-    PurchaseOrderListResponse as AttrsPurchaseOrderListResponse,
-)
-from katana_public_api_client.models.purchase_order_receive_row import (
-    PurchaseOrderReceiveRow as AttrsPurchaseOrderReceiveRow,
-)
-from katana_public_api_client.models.purchase_order_row import (
-    PurchaseOrderRow as AttrsPurchaseOrderRow,
-)
-from katana_public_api_client.models.purchase_order_row_list_response import (
-    PurchaseOrderRowListResponse as AttrsPurchaseOrderRowListResponse,
-)
-from katana_public_api_client.models.purchase_order_row_request import (
-    PurchaseOrderRowRequest as AttrsPurchaseOrderRowRequest,
-)
-from katana_public_api_client.models.recipe import Recipe as AttrsRecipe
-from katana_public_api_client.models.recipe_list_response import (
-    RecipeListResponse as AttrsRecipeListResponse,
-)
-from katana_public_api_client.models.regular_purchase_order import (
-    RegularPurchaseOrder as AttrsRegularPurchaseOrder,
-)
-from katana_public_api_client.models.required_validation_error import (
-    RequiredValidationError as AttrsRequiredValidationError,
-)
-from katana_public_api_client.models.returnable_item import (
-    ReturnableItem as AttrsReturnableItem,
-)
-from katana_public_api_client.models.sales_order import SalesOrder as AttrsSalesOrder
-from katana_public_api_client.models.sales_order_accounting_metadata import (
-    SalesOrderAccountingMetadata as AttrsSalesOrderAccountingMetadata,
-)
-from katana_public_api_client.models.sales_order_accounting_metadata_list_response import (
-    SalesOrderAccountingMetadataListResponse as AttrsSalesOrderAccountingMetadataListResponse,
-)
-from katana_public_api_client.models.sales_order_address import (
-    SalesOrderAddress as AttrsSalesOrderAddress,
-)
-from katana_public_api_client.models.sales_order_address_list_response import (
-    SalesOrderAddressListResponse as AttrsSalesOrderAddressListResponse,
-)
-from katana_public_api_client.models.sales_order_fulfillment import (
-    SalesOrderFulfillment as AttrsSalesOrderFulfillment,
-)
-from katana_public_api_client.models.sales_order_fulfillment_list_response import (
-    SalesOrderFulfillmentListResponse as AttrsSalesOrderFulfillmentListResponse,
-)
-from katana_public_api_client.models.sales_order_fulfillment_row_request import (
-    SalesOrderFulfillmentRowRequest as AttrsSalesOrderFulfillmentRowRequest,
-)
-from katana_public_api_client.models.sales_order_list_response import (
-    SalesOrderListResponse as AttrsSalesOrderListResponse,
-)
-from katana_public_api_client.models.sales_order_row import (
-    SalesOrderRow as AttrsSalesOrderRow,
-)
-from katana_public_api_client.models.sales_order_row_list_response import (
-    SalesOrderRowListResponse as AttrsSalesOrderRowListResponse,
-)
-from katana_public_api_client.models.sales_order_row_search_filter import (
-    SalesOrderRowSearchFilter as AttrsSalesOrderRowSearchFilter,
-)
-from katana_public_api_client.models.sales_order_row_search_request import (
-    SalesOrderRowSearchRequest as AttrsSalesOrderRowSearchRequest,
-)
-from katana_public_api_client.models.sales_order_row_search_where import (
-    SalesOrderRowSearchWhere as AttrsSalesOrderRowSearchWhere,
-)
-from katana_public_api_client.models.sales_order_search_filter import (
-    SalesOrderSearchFilter as AttrsSalesOrderSearchFilter,
-)
-from katana_public_api_client.models.sales_order_search_request import (
-    SalesOrderSearchRequest as AttrsSalesOrderSearchRequest,
-)
-from katana_public_api_client.models.sales_order_search_where import (
-    SalesOrderSearchWhere as AttrsSalesOrderSearchWhere,
-)
-from katana_public_api_client.models.sales_order_shipping_fee import (
-    SalesOrderShippingFee as AttrsSalesOrderShippingFee,
-)
-from katana_public_api_client.models.sales_order_shipping_fee_list_response import (
-    SalesOrderShippingFeeListResponse as AttrsSalesOrderShippingFeeListResponse,
-)
-from katana_public_api_client.models.sales_return import SalesReturn as AttrsSalesReturn
-from katana_public_api_client.models.sales_return_list_response import (
-    SalesReturnListResponse as AttrsSalesReturnListResponse,
-)
-from katana_public_api_client.models.sales_return_reason import (
-    SalesReturnReason as AttrsSalesReturnReason,
-)
-from katana_public_api_client.models.sales_return_row import (
-    SalesReturnRow as AttrsSalesReturnRow,
-)
-from katana_public_api_client.models.sales_return_row_list_response import (
-    SalesReturnRowListResponse as AttrsSalesReturnRowListResponse,
-)
-from katana_public_api_client.models.search_comparator import (
-    SearchComparator as AttrsSearchComparator,
-)
-from katana_public_api_client.models.serial_number import (
-    SerialNumber as AttrsSerialNumber,
-)
-from katana_public_api_client.models.serial_number_list_response import (
-    SerialNumberListResponse as AttrsSerialNumberListResponse,
-)
-from katana_public_api_client.models.serial_number_stock import (
-    SerialNumberStock as AttrsSerialNumberStock,
-)
-from katana_public_api_client.models.serial_number_stock_list_response import (
-    SerialNumberStockListResponse as AttrsSerialNumberStockListResponse,
-)
-from katana_public_api_client.models.service import Service as AttrsService
-from katana_public_api_client.models.service_list_response import (
-    ServiceListResponse as AttrsServiceListResponse,
-)
-from katana_public_api_client.models.service_variant import (
-    ServiceVariant as AttrsServiceVariant,
-)
-from katana_public_api_client.models.stock_adjustment import (
-    StockAdjustment as AttrsStockAdjustment,
-)
-from katana_public_api_client.models.stock_adjustment_batch_transaction import (
-    StockAdjustmentBatchTransaction as AttrsStockAdjustmentBatchTransaction,
-)
-from katana_public_api_client.models.stock_adjustment_list_response import (
-    StockAdjustmentListResponse as AttrsStockAdjustmentListResponse,
-)
-from katana_public_api_client.models.stock_adjustment_row import (
-    StockAdjustmentRow as AttrsStockAdjustmentRow,
-)
-from katana_public_api_client.models.stock_transfer import (
-    StockTransfer as AttrsStockTransfer,
-)
-from katana_public_api_client.models.stock_transfer_list_response import (
-    StockTransferListResponse as AttrsStockTransferListResponse,
-)
-from katana_public_api_client.models.stock_transfer_row import (
-    StockTransferRow as AttrsStockTransferRow,
-)
-from katana_public_api_client.models.stock_transfer_row_request import (
-    StockTransferRowRequest as AttrsStockTransferRowRequest,
-)
-from katana_public_api_client.models.stocktake import Stocktake as AttrsStocktake
-from katana_public_api_client.models.stocktake_list_response import (
-    StocktakeListResponse as AttrsStocktakeListResponse,
-)
-from katana_public_api_client.models.stocktake_row import (
-    StocktakeRow as AttrsStocktakeRow,
-)
-from katana_public_api_client.models.stocktake_row_list_response import (
-    StocktakeRowListResponse as AttrsStocktakeRowListResponse,
-)
-from katana_public_api_client.models.storage_bin import StorageBin as AttrsStorageBin
-from katana_public_api_client.models.storage_bin_create import (
-    StorageBinCreate as AttrsStorageBinCreate,
-)
-from katana_public_api_client.models.storage_bin_response import (
-    StorageBinResponse as AttrsStorageBinResponse,
-)
-from katana_public_api_client.models.storage_bin_update import (
-    StorageBinUpdate as AttrsStorageBinUpdate,
-)
-from katana_public_api_client.models.supplier import Supplier as AttrsSupplier
-from katana_public_api_client.models.supplier_address import (
-    SupplierAddress as AttrsSupplierAddress,
-)
-from katana_public_api_client.models.supplier_address_list_response import (
-    SupplierAddressListResponse as AttrsSupplierAddressListResponse,
-)
-from katana_public_api_client.models.supplier_address_request import (
-    SupplierAddressRequest as AttrsSupplierAddressRequest,
-)
-from katana_public_api_client.models.supplier_list_response import (
-    SupplierListResponse as AttrsSupplierListResponse,
-)
-from katana_public_api_client.models.tax_rate import TaxRate as AttrsTaxRate
-from katana_public_api_client.models.tax_rate_list_response import (
-    TaxRateListResponse as AttrsTaxRateListResponse,
-)
-from katana_public_api_client.models.traceability_request import (
-    TraceabilityRequest as AttrsTraceabilityRequest,
-)
-from katana_public_api_client.models.type_validation_error import (
-    TypeValidationError as AttrsTypeValidationError,
-)
-from katana_public_api_client.models.unassigned_batch_transaction import (
-    UnassignedBatchTransaction as AttrsUnassignedBatchTransaction,
-)
-from katana_public_api_client.models.unassigned_batch_transaction_list_response import (
-    UnassignedBatchTransactionListResponse as AttrsUnassignedBatchTransactionListResponse,
-)
-from katana_public_api_client.models.unique_items_validation_error import (
-    UniqueItemsValidationError as AttrsUniqueItemsValidationError,
-)
-from katana_public_api_client.models.unlink_manufacturing_order_request import (
-    UnlinkManufacturingOrderRequest as AttrsUnlinkManufacturingOrderRequest,
-)
-from katana_public_api_client.models.unlink_variant_bin_location_request import (
-    UnlinkVariantBinLocationRequest as AttrsUnlinkVariantBinLocationRequest,
-)
-from katana_public_api_client.models.updatable_entity import (
-    UpdatableEntity as AttrsUpdatableEntity,
-)
-from katana_public_api_client.models.update_bin_transfer_request import (
-    UpdateBinTransferRequest as AttrsUpdateBinTransferRequest,
-)
-from katana_public_api_client.models.update_bin_transfer_row_request import (
-    UpdateBinTransferRowRequest as AttrsUpdateBinTransferRowRequest,
-)
-from katana_public_api_client.models.update_bin_transfer_status_request import (
-    UpdateBinTransferStatusRequest as AttrsUpdateBinTransferStatusRequest,
-)
-from katana_public_api_client.models.update_bom_row_request import (
-    UpdateBomRowRequest as AttrsUpdateBomRowRequest,
-)
-from katana_public_api_client.models.update_custom_field_definition_request import (
-    UpdateCustomFieldDefinitionRequest as AttrsUpdateCustomFieldDefinitionRequest,
-)
-from katana_public_api_client.models.update_customer_address_request import (
-    UpdateCustomerAddressRequest as AttrsUpdateCustomerAddressRequest,
-)
-from katana_public_api_client.models.update_customer_request import (
-    UpdateCustomerRequest as AttrsUpdateCustomerRequest,
-)
-from katana_public_api_client.models.update_manufacturing_order_operation_row_request import (
-    UpdateManufacturingOrderOperationRowRequest as AttrsUpdateManufacturingOrderOperationRowRequest,
-)
-from katana_public_api_client.models.update_manufacturing_order_production_ingredient_request import (
-    UpdateManufacturingOrderProductionIngredientRequest as AttrsUpdateManufacturingOrderProductionIngredientRequest,
-)
-from katana_public_api_client.models.update_manufacturing_order_production_request import (
-    UpdateManufacturingOrderProductionRequest as AttrsUpdateManufacturingOrderProductionRequest,
-)
-from katana_public_api_client.models.update_manufacturing_order_recipe_row_request import (
-    UpdateManufacturingOrderRecipeRowRequest as AttrsUpdateManufacturingOrderRecipeRowRequest,
-)
-from katana_public_api_client.models.update_manufacturing_order_request import (
-    UpdateManufacturingOrderRequest as AttrsUpdateManufacturingOrderRequest,
-)
-from katana_public_api_client.models.update_material_request import (
-    UpdateMaterialRequest as AttrsUpdateMaterialRequest,
-)
-from katana_public_api_client.models.update_outsourced_purchase_order_recipe_row_request import (
-    UpdateOutsourcedPurchaseOrderRecipeRowRequest as AttrsUpdateOutsourcedPurchaseOrderRecipeRowRequest,
-)
-from katana_public_api_client.models.update_price_list_customer_request import (
-    UpdatePriceListCustomerRequest as AttrsUpdatePriceListCustomerRequest,
-)
-from katana_public_api_client.models.update_price_list_request import (
-    UpdatePriceListRequest as AttrsUpdatePriceListRequest,
-)
-from katana_public_api_client.models.update_price_list_row_request import (
-    UpdatePriceListRowRequest as AttrsUpdatePriceListRowRequest,
-)
-from katana_public_api_client.models.update_product_operation_row_request import (
-    UpdateProductOperationRowRequest as AttrsUpdateProductOperationRowRequest,
-)
-from katana_public_api_client.models.update_product_request import (
-    UpdateProductRequest as AttrsUpdateProductRequest,
-)
-from katana_public_api_client.models.update_purchase_order_additional_cost_row_request import (
-    UpdatePurchaseOrderAdditionalCostRowRequest as AttrsUpdatePurchaseOrderAdditionalCostRowRequest,
-)
-from katana_public_api_client.models.update_purchase_order_request import (
-    UpdatePurchaseOrderRequest as AttrsUpdatePurchaseOrderRequest,
-)
-from katana_public_api_client.models.update_purchase_order_row_request import (
-    UpdatePurchaseOrderRowRequest as AttrsUpdatePurchaseOrderRowRequest,
-)
-from katana_public_api_client.models.update_recipe_row_request import (
-    UpdateRecipeRowRequest as AttrsUpdateRecipeRowRequest,
-)
-from katana_public_api_client.models.update_sales_order_address_request import (
-    UpdateSalesOrderAddressRequest as AttrsUpdateSalesOrderAddressRequest,
-)
-from katana_public_api_client.models.update_sales_order_fulfillment_request import (
-    UpdateSalesOrderFulfillmentRequest as AttrsUpdateSalesOrderFulfillmentRequest,
-)
-from katana_public_api_client.models.update_sales_order_request import (
-    UpdateSalesOrderRequest as AttrsUpdateSalesOrderRequest,
-)
-from katana_public_api_client.models.update_sales_order_row_request import (
-    UpdateSalesOrderRowRequest as AttrsUpdateSalesOrderRowRequest,
-)
-from katana_public_api_client.models.update_sales_order_shipping_fee_request import (
-    UpdateSalesOrderShippingFeeRequest as AttrsUpdateSalesOrderShippingFeeRequest,
-)
-from katana_public_api_client.models.update_sales_return_request import (
-    UpdateSalesReturnRequest as AttrsUpdateSalesReturnRequest,
-)
-from katana_public_api_client.models.update_sales_return_row_request import (
-    UpdateSalesReturnRowRequest as AttrsUpdateSalesReturnRowRequest,
-)
-from katana_public_api_client.models.update_service_request import (
-    UpdateServiceRequest as AttrsUpdateServiceRequest,
-)
-from katana_public_api_client.models.update_stock_adjustment_request import (
-    UpdateStockAdjustmentRequest as AttrsUpdateStockAdjustmentRequest,
-)
-from katana_public_api_client.models.update_stock_transfer_request import (
-    UpdateStockTransferRequest as AttrsUpdateStockTransferRequest,
-)
-from katana_public_api_client.models.update_stock_transfer_status_request import (
-    UpdateStockTransferStatusRequest as AttrsUpdateStockTransferStatusRequest,
-)
-from katana_public_api_client.models.update_stocktake_request import (
-    UpdateStocktakeRequest as AttrsUpdateStocktakeRequest,
-)
-from katana_public_api_client.models.update_stocktake_row_request import (
-    UpdateStocktakeRowRequest as AttrsUpdateStocktakeRowRequest,
-)
-from katana_public_api_client.models.update_supplier_address_request import (
-    UpdateSupplierAddressRequest as AttrsUpdateSupplierAddressRequest,
-)
-from katana_public_api_client.models.update_supplier_request import (
-    UpdateSupplierRequest as AttrsUpdateSupplierRequest,
-)
-from katana_public_api_client.models.update_variant_request import (
-    UpdateVariantRequest as AttrsUpdateVariantRequest,
-)
-from katana_public_api_client.models.update_webhook_request import (
-    UpdateWebhookRequest as AttrsUpdateWebhookRequest,
-)
-from katana_public_api_client.models.user import User as AttrsUser
-from katana_public_api_client.models.user_info import UserInfo as AttrsUserInfo
-from katana_public_api_client.models.user_list_response import (
-    UserListResponse as AttrsUserListResponse,
-)
-from katana_public_api_client.models.variant import Variant as AttrsVariant
-from katana_public_api_client.models.variant_default_storage_bin_link import (
-    VariantDefaultStorageBinLink as AttrsVariantDefaultStorageBinLink,
-)
-from katana_public_api_client.models.variant_default_storage_bin_link_response import (
-    VariantDefaultStorageBinLinkResponse as AttrsVariantDefaultStorageBinLinkResponse,
-)
-from katana_public_api_client.models.variant_list_response import (
-    VariantListResponse as AttrsVariantListResponse,
-)
-from katana_public_api_client.models.variant_response import (
-    VariantResponse as AttrsVariantResponse,
-)
-from katana_public_api_client.models.webhook import Webhook as AttrsWebhook
-from katana_public_api_client.models.webhook_event_payload import (
-    WebhookEventPayload as AttrsWebhookEventPayload,
-)
-from katana_public_api_client.models.webhook_list_response import (
-    WebhookListResponse as AttrsWebhookListResponse,
-)
-from katana_public_api_client.models.webhook_logs_export import (
-    WebhookLogsExport as AttrsWebhookLogsExport,
-)
-from katana_public_api_client.models.webhook_logs_export_request import (
-    WebhookLogsExportRequest as AttrsWebhookLogsExportRequest,
-)
+import importlib
 
-from ._generated.base import (
-    ArchivableDeletableEntity as PydanticArchivableDeletableEntity,
-    ArchivableEntity as PydanticArchivableEntity,
-    BaseEntity as PydanticBaseEntity,
-    DeletableEntity as PydanticDeletableEntity,
-    UpdatableEntity as PydanticUpdatableEntity,
-)
-from ._generated.common import (
-    AdditionalCost as PydanticAdditionalCost,
-    AdditionalCostListResponse as PydanticAdditionalCostListResponse,
-    AssignedOperator as PydanticAssignedOperator,
-    BinInventory as PydanticBinInventory,
-    BinInventoryListResponse as PydanticBinInventoryListResponse,
-    BinTransfer as PydanticBinTransfer,
-    BinTransferListResponse as PydanticBinTransferListResponse,
-    BinTransferRow as PydanticBinTransferRow,
-    BinTransferRowCreateNested as PydanticBinTransferRowCreateNested,
-    BinTransferRowListResponse as PydanticBinTransferRowListResponse,
-    BinTransferTraceability as PydanticBinTransferTraceability,
-    BinTransferTraceabilityRequest as PydanticBinTransferTraceabilityRequest,
-    ClearDemandForecastRequest as PydanticClearDemandForecastRequest,
-    CreateBinTransferRequest as PydanticCreateBinTransferRequest,
-    CreateBinTransferRowRequest as PydanticCreateBinTransferRowRequest,
-    CreateCustomFieldDefinitionRequest as PydanticCreateCustomFieldDefinitionRequest,
-    CreateDemandForecastRequest as PydanticCreateDemandForecastRequest,
-    CreateInventorySafetyStockLevelRequest as PydanticCreateInventorySafetyStockLevelRequest,
-    CreateTaxRateRequest as PydanticCreateTaxRateRequest,
-    CustomField as PydanticCustomField,
-    CustomFieldChoice as PydanticCustomFieldChoice,
-    CustomFieldChoiceCreate as PydanticCustomFieldChoiceCreate,
-    CustomFieldDefinition as PydanticCustomFieldDefinition,
-    CustomFieldDefinitionListResponse as PydanticCustomFieldDefinitionListResponse,
-    CustomFieldOptions as PydanticCustomFieldOptions,
-    CustomFieldOptionsCreate as PydanticCustomFieldOptionsCreate,
-    CustomFieldsCollection as PydanticCustomFieldsCollection,
-    CustomFieldsCollectionListResponse as PydanticCustomFieldsCollectionListResponse,
-    CustomFieldValue as PydanticCustomFieldValue,
-    DemandForecastPeriod as PydanticDemandForecastPeriod,
-    DemandForecastResponse as PydanticDemandForecastResponse,
-    Factory as PydanticFactory,
-    Location as PydanticLocation,
-    LocationAddress as PydanticLocationAddress,
-    LocationListResponse as PydanticLocationListResponse,
-    Operator as PydanticOperator,
-    OperatorListResponse as PydanticOperatorListResponse,
-    ProductOperationRerank as PydanticProductOperationRerank,
-    ProductOperationRerankRequest as PydanticProductOperationRerankRequest,
-    ProductOperationRow as PydanticProductOperationRow,
-    ProductOperationRowListResponse as PydanticProductOperationRowListResponse,
-    SearchComparator as PydanticSearchComparator,
-    TaxRate as PydanticTaxRate,
-    TaxRateListResponse as PydanticTaxRateListResponse,
-    TraceabilityRequest as PydanticTraceabilityRequest,
-    UnlinkVariantBinLocationRequest as PydanticUnlinkVariantBinLocationRequest,
-    UpdateBinTransferRequest as PydanticUpdateBinTransferRequest,
-    UpdateBinTransferRowRequest as PydanticUpdateBinTransferRowRequest,
-    UpdateBinTransferStatusRequest as PydanticUpdateBinTransferStatusRequest,
-    UpdateCustomFieldDefinitionRequest as PydanticUpdateCustomFieldDefinitionRequest,
-    User as PydanticUser,
-    UserInfo as PydanticUserInfo,
-    UserListResponse as PydanticUserListResponse,
-    VariantDefaultStorageBinLink as PydanticVariantDefaultStorageBinLink,
-    VariantDefaultStorageBinLinkResponse as PydanticVariantDefaultStorageBinLinkResponse,
-)
-from ._generated.contacts import (
-    CreateCustomerAddressRequest as PydanticCreateCustomerAddressRequest,
-    CreateCustomerRequest as PydanticCreateCustomerRequest,
-    CreatePriceListCustomerRequest as PydanticCreatePriceListCustomerRequest,
-    CreatePriceListRequest as PydanticCreatePriceListRequest,
-    CreatePriceListRowRequest as PydanticCreatePriceListRowRequest,
-    CreateSupplierAddressRequest as PydanticCreateSupplierAddressRequest,
-    CreateSupplierRequest as PydanticCreateSupplierRequest,
-    Customer as PydanticCustomer,
-    CustomerAddress as PydanticCustomerAddress,
-    CustomerAddressListResponse as PydanticCustomerAddressListResponse,
-    CustomerListResponse as PydanticCustomerListResponse,
-    PriceList as PydanticPriceList,
-    PriceListCustomer as PydanticPriceListCustomer,
-    PriceListCustomerListResponse as PydanticPriceListCustomerListResponse,
-    PriceListListResponse as PydanticPriceListListResponse,
-    PriceListRow as PydanticPriceListRow,
-    PriceListRowListResponse as PydanticPriceListRowListResponse,
-    Supplier as PydanticSupplier,
-    SupplierAddress as PydanticSupplierAddress,
-    SupplierAddressListResponse as PydanticSupplierAddressListResponse,
-    SupplierAddressRequest as PydanticSupplierAddressRequest,
-    SupplierListResponse as PydanticSupplierListResponse,
-    UpdateCustomerAddressRequest as PydanticUpdateCustomerAddressRequest,
-    UpdateCustomerRequest as PydanticUpdateCustomerRequest,
-    UpdatePriceListCustomerRequest as PydanticUpdatePriceListCustomerRequest,
-    UpdatePriceListRequest as PydanticUpdatePriceListRequest,
-    UpdatePriceListRowRequest as PydanticUpdatePriceListRowRequest,
-    UpdateSupplierAddressRequest as PydanticUpdateSupplierAddressRequest,
-    UpdateSupplierRequest as PydanticUpdateSupplierRequest,
-)
-from ._generated.errors import (
-    AdditionalPropertiesValidationError as PydanticAdditionalPropertiesValidationError,
-    BaseValidationError as PydanticBaseValidationError,
-    CodedErrorResponse as PydanticCodedErrorResponse,
-    ConstValidationError as PydanticConstValidationError,
-    DependenciesValidationError as PydanticDependenciesValidationError,
-    DetailedErrorResponse as PydanticDetailedErrorResponse,
-    EnumValidationError as PydanticEnumValidationError,
-    ErrorResponse as PydanticErrorResponse,
-    ExclusiveMaximumValidationError as PydanticExclusiveMaximumValidationError,
-    ExclusiveMinimumValidationError as PydanticExclusiveMinimumValidationError,
-    FormatValidationError as PydanticFormatValidationError,
-    GenericValidationError as PydanticGenericValidationError,
-    MaximumValidationError as PydanticMaximumValidationError,
-    MaxItemsValidationError as PydanticMaxItemsValidationError,
-    MaxLengthValidationError as PydanticMaxLengthValidationError,
-    MinimumValidationError as PydanticMinimumValidationError,
-    MinItemsValidationError as PydanticMinItemsValidationError,
-    MinLengthValidationError as PydanticMinLengthValidationError,
-    MultipleOfValidationError as PydanticMultipleOfValidationError,
-    OneOfValidationError as PydanticOneOfValidationError,
-    PatternValidationError as PydanticPatternValidationError,
-    RequiredValidationError as PydanticRequiredValidationError,
-    TypeValidationError as PydanticTypeValidationError,
-    UniqueItemsValidationError as PydanticUniqueItemsValidationError,
-)
-from ._generated.inventory import (
-    CreateInventoryReorderPointRequest as PydanticCreateInventoryReorderPointRequest,
-    CreateMaterialRequest as PydanticCreateMaterialRequest,
-    CreateProductOperationRowItem as PydanticCreateProductOperationRowItem,
-    CreateProductOperationRowsRequest as PydanticCreateProductOperationRowsRequest,
-    CreateProductRequest as PydanticCreateProductRequest,
-    CreateServiceRequest as PydanticCreateServiceRequest,
-    CreateServiceVariantRequest as PydanticCreateServiceVariantRequest,
-    CreateVariantRequest as PydanticCreateVariantRequest,
-    Inventory as PydanticInventory,
-    InventoryItem as PydanticInventoryItem,
-    InventoryListResponse as PydanticInventoryListResponse,
-    InventoryMovement as PydanticInventoryMovement,
-    InventoryMovementListResponse as PydanticInventoryMovementListResponse,
-    InventoryReorderPoint as PydanticInventoryReorderPoint,
-    InventoryReorderPointResponse as PydanticInventoryReorderPointResponse,
-    InventorySafetyStockLevel as PydanticInventorySafetyStockLevel,
-    InventorySafetyStockLevelResponse as PydanticInventorySafetyStockLevelResponse,
-    ItemConfig as PydanticItemConfig,
-    Material as PydanticMaterial,
-    MaterialConfig as PydanticMaterialConfig,
-    MaterialListResponse as PydanticMaterialListResponse,
-    Product as PydanticProduct,
-    ProductListResponse as PydanticProductListResponse,
-    Service as PydanticService,
-    ServiceListResponse as PydanticServiceListResponse,
-    ServiceVariant as PydanticServiceVariant,
-    UpdateMaterialRequest as PydanticUpdateMaterialRequest,
-    UpdateProductOperationRowRequest as PydanticUpdateProductOperationRowRequest,
-    UpdateProductRequest as PydanticUpdateProductRequest,
-    UpdateServiceRequest as PydanticUpdateServiceRequest,
-    UpdateVariantRequest as PydanticUpdateVariantRequest,
-    Variant as PydanticVariant,
-    VariantListResponse as PydanticVariantListResponse,
-    VariantResponse as PydanticVariantResponse,
-)
-from ._generated.manufacturing import (
-    BatchCreateBomRowsRequest as PydanticBatchCreateBomRowsRequest,
-    BomRow as PydanticBomRow,
-    BomRowListResponse as PydanticBomRowListResponse,
-    CreateBomRowRequest as PydanticCreateBomRowRequest,
-    CreateManufacturingOrderOperationRowRequest as PydanticCreateManufacturingOrderOperationRowRequest,
-    CreateManufacturingOrderProductionRequest as PydanticCreateManufacturingOrderProductionRequest,
-    CreateManufacturingOrderRecipeRowRequest as PydanticCreateManufacturingOrderRecipeRowRequest,
-    CreateManufacturingOrderRequest as PydanticCreateManufacturingOrderRequest,
-    CreateRecipesRequest as PydanticCreateRecipesRequest,
-    MakeToOrderManufacturingOrderRequest as PydanticMakeToOrderManufacturingOrderRequest,
-    ManufacturingOrder as PydanticManufacturingOrder,
-    ManufacturingOrderListResponse as PydanticManufacturingOrderListResponse,
-    ManufacturingOrderOperationProduction as PydanticManufacturingOrderOperationProduction,
-    ManufacturingOrderOperationRow as PydanticManufacturingOrderOperationRow,
-    ManufacturingOrderOperationRowListResponse as PydanticManufacturingOrderOperationRowListResponse,
-    ManufacturingOrderProduction as PydanticManufacturingOrderProduction,
-    ManufacturingOrderProductionIngredient as PydanticManufacturingOrderProductionIngredient,
-    ManufacturingOrderProductionIngredientResponse as PydanticManufacturingOrderProductionIngredientResponse,
-    ManufacturingOrderProductionListResponse as PydanticManufacturingOrderProductionListResponse,
-    ManufacturingOrderRecipeRow as PydanticManufacturingOrderRecipeRow,
-    ManufacturingOrderRecipeRowListResponse as PydanticManufacturingOrderRecipeRowListResponse,
-    Recipe as PydanticRecipe,
-    RecipeListResponse as PydanticRecipeListResponse,
-    UnlinkManufacturingOrderRequest as PydanticUnlinkManufacturingOrderRequest,
-    UpdateBomRowRequest as PydanticUpdateBomRowRequest,
-    UpdateManufacturingOrderOperationRowRequest as PydanticUpdateManufacturingOrderOperationRowRequest,
-    UpdateManufacturingOrderProductionIngredientRequest as PydanticUpdateManufacturingOrderProductionIngredientRequest,
-    UpdateManufacturingOrderProductionRequest as PydanticUpdateManufacturingOrderProductionRequest,
-    UpdateManufacturingOrderRecipeRowRequest as PydanticUpdateManufacturingOrderRecipeRowRequest,
-    UpdateManufacturingOrderRequest as PydanticUpdateManufacturingOrderRequest,
-    UpdateRecipeRowRequest as PydanticUpdateRecipeRowRequest,
-)
-from ._generated.purchase_orders import (
-    CreateOutsourcedPurchaseOrderRecipeRowRequest as PydanticCreateOutsourcedPurchaseOrderRecipeRowRequest,
-    CreatePurchaseOrderAdditionalCostRowRequest as PydanticCreatePurchaseOrderAdditionalCostRowRequest,
-    CreatePurchaseOrderRequest as PydanticCreatePurchaseOrderRequest,
-    CreatePurchaseOrderRowRequest as PydanticCreatePurchaseOrderRowRequest,
-    OutsourcedPurchaseOrder as PydanticOutsourcedPurchaseOrder,
-    OutsourcedPurchaseOrderRecipeRow as PydanticOutsourcedPurchaseOrderRecipeRow,
-    OutsourcedPurchaseOrderRecipeRowListResponse as PydanticOutsourcedPurchaseOrderRecipeRowListResponse,
-    PurchaseOrderAccountingMetadata as PydanticPurchaseOrderAccountingMetadata,
-    PurchaseOrderAccountingMetadataListResponse as PydanticPurchaseOrderAccountingMetadataListResponse,
-    PurchaseOrderAdditionalCostRow as PydanticPurchaseOrderAdditionalCostRow,
-    PurchaseOrderAdditionalCostRowListResponse as PydanticPurchaseOrderAdditionalCostRowListResponse,
-    PurchaseOrderBase as PydanticPurchaseOrderBase,
-    PurchaseOrderListResponse as PydanticPurchaseOrderListResponse,
-    PurchaseOrderReceiveRow as PydanticPurchaseOrderReceiveRow,
-    PurchaseOrderRow as PydanticPurchaseOrderRow,
-    PurchaseOrderRowListResponse as PydanticPurchaseOrderRowListResponse,
-    PurchaseOrderRowRequest as PydanticPurchaseOrderRowRequest,
-    RegularPurchaseOrder as PydanticRegularPurchaseOrder,
-    UpdateOutsourcedPurchaseOrderRecipeRowRequest as PydanticUpdateOutsourcedPurchaseOrderRecipeRowRequest,
-    UpdatePurchaseOrderAdditionalCostRowRequest as PydanticUpdatePurchaseOrderAdditionalCostRowRequest,
-    UpdatePurchaseOrderRequest as PydanticUpdatePurchaseOrderRequest,
-    UpdatePurchaseOrderRowRequest as PydanticUpdatePurchaseOrderRowRequest,
-)
-from ._generated.sales_orders import (
-    CreateSalesOrderAddressRequest as PydanticCreateSalesOrderAddressRequest,
-    CreateSalesOrderFulfillmentRequest as PydanticCreateSalesOrderFulfillmentRequest,
-    CreateSalesOrderRequest as PydanticCreateSalesOrderRequest,
-    CreateSalesOrderRowRequest as PydanticCreateSalesOrderRowRequest,
-    CreateSalesOrderShippingFeeRequest as PydanticCreateSalesOrderShippingFeeRequest,
-    CreateSalesReturnRequest as PydanticCreateSalesReturnRequest,
-    CreateSalesReturnRowRequest as PydanticCreateSalesReturnRowRequest,
-    ReturnableItem as PydanticReturnableItem,
-    SalesOrder as PydanticSalesOrder,
-    SalesOrderAccountingMetadata as PydanticSalesOrderAccountingMetadata,
-    SalesOrderAccountingMetadataListResponse as PydanticSalesOrderAccountingMetadataListResponse,
-    SalesOrderAddress as PydanticSalesOrderAddress,
-    SalesOrderAddressListResponse as PydanticSalesOrderAddressListResponse,
-    SalesOrderFulfillment as PydanticSalesOrderFulfillment,
-    SalesOrderFulfillmentListResponse as PydanticSalesOrderFulfillmentListResponse,
-    SalesOrderFulfillmentRowRequest as PydanticSalesOrderFulfillmentRowRequest,
-    SalesOrderListResponse as PydanticSalesOrderListResponse,
-    SalesOrderRow as PydanticSalesOrderRow,
-    SalesOrderRowListResponse as PydanticSalesOrderRowListResponse,
-    SalesOrderRowSearchFilter as PydanticSalesOrderRowSearchFilter,
-    SalesOrderRowSearchRequest as PydanticSalesOrderRowSearchRequest,
-    SalesOrderRowSearchWhere as PydanticSalesOrderRowSearchWhere,
-    SalesOrderSearchFilter as PydanticSalesOrderSearchFilter,
-    SalesOrderSearchRequest as PydanticSalesOrderSearchRequest,
-    SalesOrderSearchWhere as PydanticSalesOrderSearchWhere,
-    SalesOrderShippingFee as PydanticSalesOrderShippingFee,
-    SalesOrderShippingFeeListResponse as PydanticSalesOrderShippingFeeListResponse,
-    SalesReturn as PydanticSalesReturn,
-    SalesReturnListResponse as PydanticSalesReturnListResponse,
-    SalesReturnReason as PydanticSalesReturnReason,
-    SalesReturnRow as PydanticSalesReturnRow,
-    SalesReturnRowListResponse as PydanticSalesReturnRowListResponse,
-    UnassignedBatchTransaction as PydanticUnassignedBatchTransaction,
-    UnassignedBatchTransactionListResponse as PydanticUnassignedBatchTransactionListResponse,
-    UpdateSalesOrderAddressRequest as PydanticUpdateSalesOrderAddressRequest,
-    UpdateSalesOrderFulfillmentRequest as PydanticUpdateSalesOrderFulfillmentRequest,
-    UpdateSalesOrderRequest as PydanticUpdateSalesOrderRequest,
-    UpdateSalesOrderRowRequest as PydanticUpdateSalesOrderRowRequest,
-    UpdateSalesOrderShippingFeeRequest as PydanticUpdateSalesOrderShippingFeeRequest,
-    UpdateSalesReturnRequest as PydanticUpdateSalesReturnRequest,
-    UpdateSalesReturnRowRequest as PydanticUpdateSalesReturnRowRequest,
-)
-from ._generated.stock import (
-    Batch as PydanticBatch,
-    BatchResponse as PydanticBatchResponse,
-    BatchStock as PydanticBatchStock,
-    BatchStockListResponse as PydanticBatchStockListResponse,
-    BatchStockUpdate as PydanticBatchStockUpdate,
-    BatchTransaction as PydanticBatchTransaction,
-    BatchTransactionRequest as PydanticBatchTransactionRequest,
-    CreateSerialNumberFailedItem as PydanticCreateSerialNumberFailedItem,
-    CreateSerialNumbersRequest as PydanticCreateSerialNumbersRequest,
-    CreateSerialNumbersResponse as PydanticCreateSerialNumbersResponse,
-    CreateStockAdjustmentRequest as PydanticCreateStockAdjustmentRequest,
-    CreateStocktakeRequest as PydanticCreateStocktakeRequest,
-    CreateStocktakeRowRequest as PydanticCreateStocktakeRowRequest,
-    CreateStockTransferRequest as PydanticCreateStockTransferRequest,
-    DeleteSerialNumbersRequest as PydanticDeleteSerialNumbersRequest,
-    NegativeStock as PydanticNegativeStock,
-    NegativeStockListResponse as PydanticNegativeStockListResponse,
-    SerialNumber as PydanticSerialNumber,
-    SerialNumberListResponse as PydanticSerialNumberListResponse,
-    SerialNumberStock as PydanticSerialNumberStock,
-    SerialNumberStockListResponse as PydanticSerialNumberStockListResponse,
-    StockAdjustment as PydanticStockAdjustment,
-    StockAdjustmentBatchTransaction as PydanticStockAdjustmentBatchTransaction,
-    StockAdjustmentListResponse as PydanticStockAdjustmentListResponse,
-    StockAdjustmentRow as PydanticStockAdjustmentRow,
-    Stocktake as PydanticStocktake,
-    StocktakeListResponse as PydanticStocktakeListResponse,
-    StocktakeRow as PydanticStocktakeRow,
-    StocktakeRowListResponse as PydanticStocktakeRowListResponse,
-    StockTransfer as PydanticStockTransfer,
-    StockTransferListResponse as PydanticStockTransferListResponse,
-    StockTransferRow as PydanticStockTransferRow,
-    StockTransferRowRequest as PydanticStockTransferRowRequest,
-    StorageBin as PydanticStorageBin,
-    StorageBinCreate as PydanticStorageBinCreate,
-    StorageBinResponse as PydanticStorageBinResponse,
-    StorageBinUpdate as PydanticStorageBinUpdate,
-    UpdateStockAdjustmentRequest as PydanticUpdateStockAdjustmentRequest,
-    UpdateStocktakeRequest as PydanticUpdateStocktakeRequest,
-    UpdateStocktakeRowRequest as PydanticUpdateStocktakeRowRequest,
-    UpdateStockTransferRequest as PydanticUpdateStockTransferRequest,
-    UpdateStockTransferStatusRequest as PydanticUpdateStockTransferStatusRequest,
-)
-from ._generated.webhooks import (
-    CreateWebhookRequest as PydanticCreateWebhookRequest,
-    UpdateWebhookRequest as PydanticUpdateWebhookRequest,
-    Webhook as PydanticWebhook,
-    WebhookEventPayload as PydanticWebhookEventPayload,
-    WebhookListResponse as PydanticWebhookListResponse,
-    WebhookLogsExport as PydanticWebhookLogsExport,
-    WebhookLogsExportRequest as PydanticWebhookLogsExportRequest,
-)
 from ._registry import register
 
+# ``_generated`` module -> (attrs module under ``models``, class name) of each
+# pair it defines. Both sides share the class name.
+MODEL_PAIRS: dict[str, tuple[tuple[str, str], ...]] = {
+    "base": (
+        ("archivable_deletable_entity", "ArchivableDeletableEntity"),
+        ("archivable_entity", "ArchivableEntity"),
+        ("base_entity", "BaseEntity"),
+        ("deletable_entity", "DeletableEntity"),
+        ("updatable_entity", "UpdatableEntity"),
+    ),
+    "common": (
+        ("additional_cost", "AdditionalCost"),
+        ("additional_cost_list_response", "AdditionalCostListResponse"),
+        ("assigned_operator", "AssignedOperator"),
+        ("bin_inventory", "BinInventory"),
+        ("bin_inventory_list_response", "BinInventoryListResponse"),
+        ("bin_transfer", "BinTransfer"),
+        ("bin_transfer_list_response", "BinTransferListResponse"),
+        ("bin_transfer_row", "BinTransferRow"),
+        ("bin_transfer_row_create_nested", "BinTransferRowCreateNested"),
+        ("bin_transfer_row_list_response", "BinTransferRowListResponse"),
+        ("bin_transfer_traceability", "BinTransferTraceability"),
+        ("bin_transfer_traceability_request", "BinTransferTraceabilityRequest"),
+        ("clear_demand_forecast_request", "ClearDemandForecastRequest"),
+        ("create_bin_transfer_request", "CreateBinTransferRequest"),
+        ("create_bin_transfer_row_request", "CreateBinTransferRowRequest"),
+        (
+            "create_custom_field_definition_request",
+            "CreateCustomFieldDefinitionRequest",
+        ),
+        ("create_demand_forecast_request", "CreateDemandForecastRequest"),
+        (
+            "create_inventory_safety_stock_level_request",
+            "CreateInventorySafetyStockLevelRequest",
+        ),
+        ("create_tax_rate_request", "CreateTaxRateRequest"),
+        ("custom_field", "CustomField"),
+        ("custom_field_choice", "CustomFieldChoice"),
+        ("custom_field_choice_create", "CustomFieldChoiceCreate"),
+        ("custom_field_definition", "CustomFieldDefinition"),
+        ("custom_field_definition_list_response", "CustomFieldDefinitionListResponse"),
+        ("custom_field_options", "CustomFieldOptions"),
+        ("custom_field_options_create", "CustomFieldOptionsCreate"),
+        ("custom_field_value", "CustomFieldValue"),
+        ("custom_fields_collection", "CustomFieldsCollection"),
+        (
+            "custom_fields_collection_list_response",
+            "CustomFieldsCollectionListResponse",
+        ),
+        ("demand_forecast_period", "DemandForecastPeriod"),
+        ("demand_forecast_response", "DemandForecastResponse"),
+        ("factory", "Factory"),
+        ("location", "Location"),
+        ("location_address", "LocationAddress"),
+        ("location_list_response", "LocationListResponse"),
+        ("operator", "Operator"),
+        ("operator_list_response", "OperatorListResponse"),
+        ("product_operation_rerank", "ProductOperationRerank"),
+        ("product_operation_rerank_request", "ProductOperationRerankRequest"),
+        ("product_operation_row", "ProductOperationRow"),
+        ("product_operation_row_list_response", "ProductOperationRowListResponse"),
+        ("search_comparator", "SearchComparator"),
+        ("tax_rate", "TaxRate"),
+        ("tax_rate_list_response", "TaxRateListResponse"),
+        ("traceability_request", "TraceabilityRequest"),
+        ("unlink_variant_bin_location_request", "UnlinkVariantBinLocationRequest"),
+        ("update_bin_transfer_request", "UpdateBinTransferRequest"),
+        ("update_bin_transfer_row_request", "UpdateBinTransferRowRequest"),
+        ("update_bin_transfer_status_request", "UpdateBinTransferStatusRequest"),
+        (
+            "update_custom_field_definition_request",
+            "UpdateCustomFieldDefinitionRequest",
+        ),
+        ("user", "User"),
+        ("user_info", "UserInfo"),
+        ("user_list_response", "UserListResponse"),
+        ("variant_default_storage_bin_link", "VariantDefaultStorageBinLink"),
+        (
+            "variant_default_storage_bin_link_response",
+            "VariantDefaultStorageBinLinkResponse",
+        ),
+    ),
+    "contacts": (
+        ("create_customer_address_request", "CreateCustomerAddressRequest"),
+        ("create_customer_request", "CreateCustomerRequest"),
+        ("create_price_list_customer_request", "CreatePriceListCustomerRequest"),
+        ("create_price_list_request", "CreatePriceListRequest"),
+        ("create_price_list_row_request", "CreatePriceListRowRequest"),
+        ("create_supplier_address_request", "CreateSupplierAddressRequest"),
+        ("create_supplier_request", "CreateSupplierRequest"),
+        ("customer", "Customer"),
+        ("customer_address", "CustomerAddress"),
+        ("customer_address_list_response", "CustomerAddressListResponse"),
+        ("customer_list_response", "CustomerListResponse"),
+        ("price_list", "PriceList"),
+        ("price_list_customer", "PriceListCustomer"),
+        ("price_list_customer_list_response", "PriceListCustomerListResponse"),
+        ("price_list_list_response", "PriceListListResponse"),
+        ("price_list_row", "PriceListRow"),
+        ("price_list_row_list_response", "PriceListRowListResponse"),
+        ("supplier", "Supplier"),
+        ("supplier_address", "SupplierAddress"),
+        ("supplier_address_list_response", "SupplierAddressListResponse"),
+        ("supplier_address_request", "SupplierAddressRequest"),
+        ("supplier_list_response", "SupplierListResponse"),
+        ("update_customer_address_request", "UpdateCustomerAddressRequest"),
+        ("update_customer_request", "UpdateCustomerRequest"),
+        ("update_price_list_customer_request", "UpdatePriceListCustomerRequest"),
+        ("update_price_list_request", "UpdatePriceListRequest"),
+        ("update_price_list_row_request", "UpdatePriceListRowRequest"),
+        ("update_supplier_address_request", "UpdateSupplierAddressRequest"),
+        ("update_supplier_request", "UpdateSupplierRequest"),
+    ),
+    "errors": (
+        (
+            "additional_properties_validation_error",
+            "AdditionalPropertiesValidationError",
+        ),
+        ("base_validation_error", "BaseValidationError"),
+        ("coded_error_response", "CodedErrorResponse"),
+        ("const_validation_error", "ConstValidationError"),
+        ("dependencies_validation_error", "DependenciesValidationError"),
+        ("detailed_error_response", "DetailedErrorResponse"),
+        ("enum_validation_error", "EnumValidationError"),
+        ("error_response", "ErrorResponse"),
+        ("exclusive_maximum_validation_error", "ExclusiveMaximumValidationError"),
+        ("exclusive_minimum_validation_error", "ExclusiveMinimumValidationError"),
+        ("format_validation_error", "FormatValidationError"),
+        ("generic_validation_error", "GenericValidationError"),
+        ("max_items_validation_error", "MaxItemsValidationError"),
+        ("max_length_validation_error", "MaxLengthValidationError"),
+        ("maximum_validation_error", "MaximumValidationError"),
+        ("min_items_validation_error", "MinItemsValidationError"),
+        ("min_length_validation_error", "MinLengthValidationError"),
+        ("minimum_validation_error", "MinimumValidationError"),
+        ("multiple_of_validation_error", "MultipleOfValidationError"),
+        ("one_of_validation_error", "OneOfValidationError"),
+        ("pattern_validation_error", "PatternValidationError"),
+        ("required_validation_error", "RequiredValidationError"),
+        ("type_validation_error", "TypeValidationError"),
+        ("unique_items_validation_error", "UniqueItemsValidationError"),
+    ),
+    "inventory": (
+        (
+            "create_inventory_reorder_point_request",
+            "CreateInventoryReorderPointRequest",
+        ),
+        ("create_material_request", "CreateMaterialRequest"),
+        ("create_product_operation_row_item", "CreateProductOperationRowItem"),
+        ("create_product_operation_rows_request", "CreateProductOperationRowsRequest"),
+        ("create_product_request", "CreateProductRequest"),
+        ("create_service_request", "CreateServiceRequest"),
+        ("create_service_variant_request", "CreateServiceVariantRequest"),
+        ("create_variant_request", "CreateVariantRequest"),
+        ("inventory", "Inventory"),
+        ("inventory_item", "InventoryItem"),
+        ("inventory_list_response", "InventoryListResponse"),
+        ("inventory_movement", "InventoryMovement"),
+        ("inventory_movement_list_response", "InventoryMovementListResponse"),
+        ("inventory_reorder_point", "InventoryReorderPoint"),
+        ("inventory_reorder_point_response", "InventoryReorderPointResponse"),
+        ("inventory_safety_stock_level", "InventorySafetyStockLevel"),
+        ("inventory_safety_stock_level_response", "InventorySafetyStockLevelResponse"),
+        ("item_config", "ItemConfig"),
+        ("material", "Material"),
+        ("material_config", "MaterialConfig"),
+        ("material_list_response", "MaterialListResponse"),
+        ("product", "Product"),
+        ("product_list_response", "ProductListResponse"),
+        ("service", "Service"),
+        ("service_list_response", "ServiceListResponse"),
+        ("service_variant", "ServiceVariant"),
+        ("update_material_request", "UpdateMaterialRequest"),
+        ("update_product_operation_row_request", "UpdateProductOperationRowRequest"),
+        ("update_product_request", "UpdateProductRequest"),
+        ("update_service_request", "UpdateServiceRequest"),
+        ("update_variant_request", "UpdateVariantRequest"),
+        ("variant", "Variant"),
+        ("variant_list_response", "VariantListResponse"),
+        ("variant_response", "VariantResponse"),
+    ),
+    "manufacturing": (
+        ("batch_create_bom_rows_request", "BatchCreateBomRowsRequest"),
+        ("bom_row", "BomRow"),
+        ("bom_row_list_response", "BomRowListResponse"),
+        ("create_bom_row_request", "CreateBomRowRequest"),
+        (
+            "create_manufacturing_order_operation_row_request",
+            "CreateManufacturingOrderOperationRowRequest",
+        ),
+        (
+            "create_manufacturing_order_production_request",
+            "CreateManufacturingOrderProductionRequest",
+        ),
+        (
+            "create_manufacturing_order_recipe_row_request",
+            "CreateManufacturingOrderRecipeRowRequest",
+        ),
+        ("create_manufacturing_order_request", "CreateManufacturingOrderRequest"),
+        ("create_recipes_request", "CreateRecipesRequest"),
+        (
+            "make_to_order_manufacturing_order_request",
+            "MakeToOrderManufacturingOrderRequest",
+        ),
+        ("manufacturing_order", "ManufacturingOrder"),
+        ("manufacturing_order_list_response", "ManufacturingOrderListResponse"),
+        (
+            "manufacturing_order_operation_production",
+            "ManufacturingOrderOperationProduction",
+        ),
+        ("manufacturing_order_operation_row", "ManufacturingOrderOperationRow"),
+        (
+            "manufacturing_order_operation_row_list_response",
+            "ManufacturingOrderOperationRowListResponse",
+        ),
+        ("manufacturing_order_production", "ManufacturingOrderProduction"),
+        (
+            "manufacturing_order_production_ingredient",
+            "ManufacturingOrderProductionIngredient",
+        ),
+        (
+            "manufacturing_order_production_ingredient_response",
+            "ManufacturingOrderProductionIngredientResponse",
+        ),
+        (
+            "manufacturing_order_production_list_response",
+            "ManufacturingOrderProductionListResponse",
+        ),
+        ("manufacturing_order_recipe_row", "ManufacturingOrderRecipeRow"),
+        (
+            "manufacturing_order_recipe_row_list_response",
+            "ManufacturingOrderRecipeRowListResponse",
+        ),
+        ("recipe", "Recipe"),
+        ("recipe_list_response", "RecipeListResponse"),
+        ("unlink_manufacturing_order_request", "UnlinkManufacturingOrderRequest"),
+        ("update_bom_row_request", "UpdateBomRowRequest"),
+        (
+            "update_manufacturing_order_operation_row_request",
+            "UpdateManufacturingOrderOperationRowRequest",
+        ),
+        (
+            "update_manufacturing_order_production_ingredient_request",
+            "UpdateManufacturingOrderProductionIngredientRequest",
+        ),
+        (
+            "update_manufacturing_order_production_request",
+            "UpdateManufacturingOrderProductionRequest",
+        ),
+        (
+            "update_manufacturing_order_recipe_row_request",
+            "UpdateManufacturingOrderRecipeRowRequest",
+        ),
+        ("update_manufacturing_order_request", "UpdateManufacturingOrderRequest"),
+        ("update_recipe_row_request", "UpdateRecipeRowRequest"),
+    ),
+    "purchase_orders": (
+        (
+            "create_outsourced_purchase_order_recipe_row_request",
+            "CreateOutsourcedPurchaseOrderRecipeRowRequest",
+        ),
+        (
+            "create_purchase_order_additional_cost_row_request",
+            "CreatePurchaseOrderAdditionalCostRowRequest",
+        ),
+        ("create_purchase_order_request", "CreatePurchaseOrderRequest"),
+        ("create_purchase_order_row_request", "CreatePurchaseOrderRowRequest"),
+        ("outsourced_purchase_order", "OutsourcedPurchaseOrder"),
+        ("outsourced_purchase_order_recipe_row", "OutsourcedPurchaseOrderRecipeRow"),
+        (
+            "outsourced_purchase_order_recipe_row_list_response",
+            "OutsourcedPurchaseOrderRecipeRowListResponse",
+        ),
+        ("purchase_order_accounting_metadata", "PurchaseOrderAccountingMetadata"),
+        (
+            "purchase_order_accounting_metadata_list_response",
+            "PurchaseOrderAccountingMetadataListResponse",
+        ),
+        ("purchase_order_additional_cost_row", "PurchaseOrderAdditionalCostRow"),
+        (
+            "purchase_order_additional_cost_row_list_response",
+            "PurchaseOrderAdditionalCostRowListResponse",
+        ),
+        ("purchase_order_base", "PurchaseOrderBase"),
+        ("purchase_order_list_response", "PurchaseOrderListResponse"),
+        ("purchase_order_receive_row", "PurchaseOrderReceiveRow"),
+        ("purchase_order_row", "PurchaseOrderRow"),
+        ("purchase_order_row_list_response", "PurchaseOrderRowListResponse"),
+        ("purchase_order_row_request", "PurchaseOrderRowRequest"),
+        ("regular_purchase_order", "RegularPurchaseOrder"),
+        (
+            "update_outsourced_purchase_order_recipe_row_request",
+            "UpdateOutsourcedPurchaseOrderRecipeRowRequest",
+        ),
+        (
+            "update_purchase_order_additional_cost_row_request",
+            "UpdatePurchaseOrderAdditionalCostRowRequest",
+        ),
+        ("update_purchase_order_request", "UpdatePurchaseOrderRequest"),
+        ("update_purchase_order_row_request", "UpdatePurchaseOrderRowRequest"),
+    ),
+    "sales_orders": (
+        ("create_sales_order_address_request", "CreateSalesOrderAddressRequest"),
+        (
+            "create_sales_order_fulfillment_request",
+            "CreateSalesOrderFulfillmentRequest",
+        ),
+        ("create_sales_order_request", "CreateSalesOrderRequest"),
+        ("create_sales_order_row_request", "CreateSalesOrderRowRequest"),
+        (
+            "create_sales_order_shipping_fee_request",
+            "CreateSalesOrderShippingFeeRequest",
+        ),
+        ("create_sales_return_request", "CreateSalesReturnRequest"),
+        ("create_sales_return_row_request", "CreateSalesReturnRowRequest"),
+        ("returnable_item", "ReturnableItem"),
+        ("sales_order", "SalesOrder"),
+        ("sales_order_accounting_metadata", "SalesOrderAccountingMetadata"),
+        (
+            "sales_order_accounting_metadata_list_response",
+            "SalesOrderAccountingMetadataListResponse",
+        ),
+        ("sales_order_address", "SalesOrderAddress"),
+        ("sales_order_address_list_response", "SalesOrderAddressListResponse"),
+        ("sales_order_fulfillment", "SalesOrderFulfillment"),
+        ("sales_order_fulfillment_list_response", "SalesOrderFulfillmentListResponse"),
+        ("sales_order_fulfillment_row_request", "SalesOrderFulfillmentRowRequest"),
+        ("sales_order_list_response", "SalesOrderListResponse"),
+        ("sales_order_row", "SalesOrderRow"),
+        ("sales_order_row_list_response", "SalesOrderRowListResponse"),
+        ("sales_order_row_search_filter", "SalesOrderRowSearchFilter"),
+        ("sales_order_row_search_request", "SalesOrderRowSearchRequest"),
+        ("sales_order_row_search_where", "SalesOrderRowSearchWhere"),
+        ("sales_order_search_filter", "SalesOrderSearchFilter"),
+        ("sales_order_search_request", "SalesOrderSearchRequest"),
+        ("sales_order_search_where", "SalesOrderSearchWhere"),
+        ("sales_order_shipping_fee", "SalesOrderShippingFee"),
+        ("sales_order_shipping_fee_list_response", "SalesOrderShippingFeeListResponse"),
+        ("sales_return", "SalesReturn"),
+        ("sales_return_list_response", "SalesReturnListResponse"),
+        ("sales_return_reason", "SalesReturnReason"),
+        ("sales_return_row", "SalesReturnRow"),
+        ("sales_return_row_list_response", "SalesReturnRowListResponse"),
+        ("unassigned_batch_transaction", "UnassignedBatchTransaction"),
+        (
+            "unassigned_batch_transaction_list_response",
+            "UnassignedBatchTransactionListResponse",
+        ),
+        ("update_sales_order_address_request", "UpdateSalesOrderAddressRequest"),
+        (
+            "update_sales_order_fulfillment_request",
+            "UpdateSalesOrderFulfillmentRequest",
+        ),
+        ("update_sales_order_request", "UpdateSalesOrderRequest"),
+        ("update_sales_order_row_request", "UpdateSalesOrderRowRequest"),
+        (
+            "update_sales_order_shipping_fee_request",
+            "UpdateSalesOrderShippingFeeRequest",
+        ),
+        ("update_sales_return_request", "UpdateSalesReturnRequest"),
+        ("update_sales_return_row_request", "UpdateSalesReturnRowRequest"),
+    ),
+    "stock": (
+        ("batch", "Batch"),
+        ("batch_response", "BatchResponse"),
+        ("batch_stock", "BatchStock"),
+        ("batch_stock_list_response", "BatchStockListResponse"),
+        ("batch_stock_update", "BatchStockUpdate"),
+        ("batch_transaction", "BatchTransaction"),
+        ("batch_transaction_request", "BatchTransactionRequest"),
+        ("create_serial_number_failed_item", "CreateSerialNumberFailedItem"),
+        ("create_serial_numbers_request", "CreateSerialNumbersRequest"),
+        ("create_serial_numbers_response", "CreateSerialNumbersResponse"),
+        ("create_stock_adjustment_request", "CreateStockAdjustmentRequest"),
+        ("create_stock_transfer_request", "CreateStockTransferRequest"),
+        ("create_stocktake_request", "CreateStocktakeRequest"),
+        ("create_stocktake_row_request", "CreateStocktakeRowRequest"),
+        ("delete_serial_numbers_request", "DeleteSerialNumbersRequest"),
+        ("negative_stock", "NegativeStock"),
+        ("negative_stock_list_response", "NegativeStockListResponse"),
+        ("serial_number", "SerialNumber"),
+        ("serial_number_list_response", "SerialNumberListResponse"),
+        ("serial_number_stock", "SerialNumberStock"),
+        ("serial_number_stock_list_response", "SerialNumberStockListResponse"),
+        ("stock_adjustment", "StockAdjustment"),
+        ("stock_adjustment_batch_transaction", "StockAdjustmentBatchTransaction"),
+        ("stock_adjustment_list_response", "StockAdjustmentListResponse"),
+        ("stock_adjustment_row", "StockAdjustmentRow"),
+        ("stock_transfer", "StockTransfer"),
+        ("stock_transfer_list_response", "StockTransferListResponse"),
+        ("stock_transfer_row", "StockTransferRow"),
+        ("stock_transfer_row_request", "StockTransferRowRequest"),
+        ("stocktake", "Stocktake"),
+        ("stocktake_list_response", "StocktakeListResponse"),
+        ("stocktake_row", "StocktakeRow"),
+        ("stocktake_row_list_response", "StocktakeRowListResponse"),
+        ("storage_bin", "StorageBin"),
+        ("storage_bin_create", "StorageBinCreate"),
+        ("storage_bin_response", "StorageBinResponse"),
+        ("storage_bin_update", "StorageBinUpdate"),
+        ("update_stock_adjustment_request", "UpdateStockAdjustmentRequest"),
+        ("update_stock_transfer_request", "UpdateStockTransferRequest"),
+        ("update_stock_transfer_status_request", "UpdateStockTransferStatusRequest"),
+        ("update_stocktake_request", "UpdateStocktakeRequest"),
+        ("update_stocktake_row_request", "UpdateStocktakeRowRequest"),
+    ),
+    "webhooks": (
+        ("create_webhook_request", "CreateWebhookRequest"),
+        ("update_webhook_request", "UpdateWebhookRequest"),
+        ("webhook", "Webhook"),
+        ("webhook_event_payload", "WebhookEventPayload"),
+        ("webhook_list_response", "WebhookListResponse"),
+        ("webhook_logs_export", "WebhookLogsExport"),
+        ("webhook_logs_export_request", "WebhookLogsExportRequest"),
+    ),
+}
+
+
+def register_module_models(module_name: str) -> None:
+    """Register the attrs <-> Pydantic pairs defined by one ``_generated`` module."""
+    pydantic_module = importlib.import_module(f"._generated.{module_name}", __package__)
+    for attrs_module, class_name in MODEL_PAIRS[module_name]:
+        attrs_class = getattr(
+            importlib.import_module(f"katana_public_api_client.models.{attrs_module}"),
+            class_name,
+        )
+        register(attrs_class, getattr(pydantic_module, class_name))
+
 
 def register_all_models() -> None:
     """Register all attrs <-> Pydantic model mappings."""
-    register(AttrsAdditionalCost, PydanticAdditionalCost)
-    register(AttrsAdditionalCostListResponse, PydanticAdditionalCostListResponse)
-    register(
-        AttrsAdditionalPropertiesValidationError,
-        PydanticAdditionalPropertiesValidationError,
-    )
-    register(AttrsArchivableDeletableEntity, PydanticArchivableDeletableEntity)
-    register(AttrsArchivableEntity, PydanticArchivableEntity)
-    register(AttrsAssignedOperator, PydanticAssignedOperator)
-    register(AttrsBaseEntity, PydanticBaseEntity)
-    register(AttrsBaseValidationError, PydanticBaseValidationError)
-    register(AttrsBatch, PydanticBatch)
-    register(AttrsBatchCreateBomRowsRequest, PydanticBatchCreateBomRowsRequest)
-    register(AttrsBatchResponse, PydanticBatchResponse)
-    register(AttrsBatchStock, PydanticBatchStock)
-    register(AttrsBatchStockListResponse, PydanticBatchStockListResponse)
-    register(AttrsBatchStockUpdate, PydanticBatchStockUpdate)
-    register(AttrsBatchTransaction, PydanticBatchTransaction)
-    register(AttrsBatchTransactionRequest, PydanticBatchTransactionRequest)
-    register(AttrsBinInventory, PydanticBinInventory)
-    register(AttrsBinInventoryListResponse, PydanticBinInventoryListResponse)
-    register(AttrsBinTransfer, PydanticBinTransfer)
-    register(AttrsBinTransferListResponse, PydanticBinTransferListResponse)
-    register(AttrsBinTransferRow, PydanticBinTransferRow)
-    register(AttrsBinTransferRowCreateNested, PydanticBinTransferRowCreateNested)
-    register(AttrsBinTransferRowListResponse, PydanticBinTransferRowListResponse)
-    register(AttrsBinTransferTraceability, PydanticBinTransferTraceability)
-    register(
-        AttrsBinTransferTraceabilityRequest, PydanticBinTransferTraceabilityRequest
-    )
-    register(AttrsBomRow, PydanticBomRow)
-    register(AttrsBomRowListResponse, PydanticBomRowListResponse)
-    register(AttrsClearDemandForecastRequest, PydanticClearDemandForecastRequest)
-    register(AttrsCodedErrorResponse, PydanticCodedErrorResponse)
-    register(AttrsConstValidationError, PydanticConstValidationError)
-    register(AttrsCreateBinTransferRequest, PydanticCreateBinTransferRequest)
-    register(AttrsCreateBinTransferRowRequest, PydanticCreateBinTransferRowRequest)
-    register(AttrsCreateBomRowRequest, PydanticCreateBomRowRequest)
-    register(
-        AttrsCreateCustomFieldDefinitionRequest,
-        PydanticCreateCustomFieldDefinitionRequest,
-    )
-    register(AttrsCreateCustomerAddressRequest, PydanticCreateCustomerAddressRequest)
-    register(AttrsCreateCustomerRequest, PydanticCreateCustomerRequest)
-    register(AttrsCreateDemandForecastRequest, PydanticCreateDemandForecastRequest)
-    register(
-        AttrsCreateInventoryReorderPointRequest,
-        PydanticCreateInventoryReorderPointRequest,
-    )
-    register(
-        AttrsCreateInventorySafetyStockLevelRequest,
-        PydanticCreateInventorySafetyStockLevelRequest,
-    )
-    register(
-        AttrsCreateManufacturingOrderOperationRowRequest,
-        PydanticCreateManufacturingOrderOperationRowRequest,
-    )
-    register(
-        AttrsCreateManufacturingOrderProductionRequest,
-        PydanticCreateManufacturingOrderProductionRequest,
-    )
-    register(
-        AttrsCreateManufacturingOrderRecipeRowRequest,
-        PydanticCreateManufacturingOrderRecipeRowRequest,
-    )
-    register(
-        AttrsCreateManufacturingOrderRequest, PydanticCreateManufacturingOrderRequest
-    )
-    register(AttrsCreateMaterialRequest, PydanticCreateMaterialRequest)
-    register(
-        AttrsCreateOutsourcedPurchaseOrderRecipeRowRequest,
-        PydanticCreateOutsourcedPurchaseOrderRecipeRowRequest,
-    )
-    register(
-        AttrsCreatePriceListCustomerRequest, PydanticCreatePriceListCustomerRequest
-    )
-    register(AttrsCreatePriceListRequest, PydanticCreatePriceListRequest)
-    register(AttrsCreatePriceListRowRequest, PydanticCreatePriceListRowRequest)
-    register(AttrsCreateProductOperationRowItem, PydanticCreateProductOperationRowItem)
-    register(
-        AttrsCreateProductOperationRowsRequest,
-        PydanticCreateProductOperationRowsRequest,
-    )
-    register(AttrsCreateProductRequest, PydanticCreateProductRequest)
-    register(
-        AttrsCreatePurchaseOrderAdditionalCostRowRequest,
-        PydanticCreatePurchaseOrderAdditionalCostRowRequest,
-    )
-    register(AttrsCreatePurchaseOrderRequest, PydanticCreatePurchaseOrderRequest)
-    register(AttrsCreatePurchaseOrderRowRequest, PydanticCreatePurchaseOrderRowRequest)
-    register(AttrsCreateRecipesRequest, PydanticCreateRecipesRequest)
-    register(
-        AttrsCreateSalesOrderAddressRequest, PydanticCreateSalesOrderAddressRequest
-    )
-    register(
-        AttrsCreateSalesOrderFulfillmentRequest,
-        PydanticCreateSalesOrderFulfillmentRequest,
-    )
-    register(AttrsCreateSalesOrderRequest, PydanticCreateSalesOrderRequest)
-    register(AttrsCreateSalesOrderRowRequest, PydanticCreateSalesOrderRowRequest)
-    register(
-        AttrsCreateSalesOrderShippingFeeRequest,
-        PydanticCreateSalesOrderShippingFeeRequest,
-    )
-    register(AttrsCreateSalesReturnRequest, PydanticCreateSalesReturnRequest)
-    register(AttrsCreateSalesReturnRowRequest, PydanticCreateSalesReturnRowRequest)
-    register(AttrsCreateSerialNumberFailedItem, PydanticCreateSerialNumberFailedItem)
-    register(AttrsCreateSerialNumbersRequest, PydanticCreateSerialNumbersRequest)
-    register(AttrsCreateSerialNumbersResponse, PydanticCreateSerialNumbersResponse)
-    register(AttrsCreateServiceRequest, PydanticCreateServiceRequest)
-    register(AttrsCreateServiceVariantRequest, PydanticCreateServiceVariantRequest)
-    register(AttrsCreateStockAdjustmentRequest, PydanticCreateStockAdjustmentRequest)
-    register(AttrsCreateStockTransferRequest, PydanticCreateStockTransferRequest)
-    register(AttrsCreateStocktakeRequest, PydanticCreateStocktakeRequest)
-    register(AttrsCreateStocktakeRowRequest, PydanticCreateStocktakeRowRequest)
-    register(AttrsCreateSupplierAddressRequest, PydanticCreateSupplierAddressRequest)
-    register(AttrsCreateSupplierRequest, PydanticCreateSupplierRequest)
-    register(AttrsCreateTaxRateRequest, PydanticCreateTaxRateRequest)
-    register(AttrsCreateVariantRequest, PydanticCreateVariantRequest)
-    register(AttrsCreateWebhookRequest, PydanticCreateWebhookRequest)
-    register(AttrsCustomField, PydanticCustomField)
-    register(AttrsCustomFieldChoice, PydanticCustomFieldChoice)
-    register(AttrsCustomFieldChoiceCreate, PydanticCustomFieldChoiceCreate)
-    register(AttrsCustomFieldDefinition, PydanticCustomFieldDefinition)
-    register(
-        AttrsCustomFieldDefinitionListResponse,
-        PydanticCustomFieldDefinitionListResponse,
-    )
-    register(AttrsCustomFieldOptions, PydanticCustomFieldOptions)
-    register(AttrsCustomFieldOptionsCreate, PydanticCustomFieldOptionsCreate)
-    register(AttrsCustomFieldValue, PydanticCustomFieldValue)
-    register(AttrsCustomFieldsCollection, PydanticCustomFieldsCollection)
-    register(
-        AttrsCustomFieldsCollectionListResponse,
-        PydanticCustomFieldsCollectionListResponse,
-    )
-    register(AttrsCustomer, PydanticCustomer)
-    register(AttrsCustomerAddress, PydanticCustomerAddress)
-    register(AttrsCustomerAddressListResponse, PydanticCustomerAddressListResponse)
-    register(AttrsCustomerListResponse, PydanticCustomerListResponse)
-    register(AttrsDeletableEntity, PydanticDeletableEntity)
-    register(AttrsDeleteSerialNumbersRequest, PydanticDeleteSerialNumbersRequest)
-    register(AttrsDemandForecastPeriod, PydanticDemandForecastPeriod)
-    register(AttrsDemandForecastResponse, PydanticDemandForecastResponse)
-    register(AttrsDependenciesValidationError, PydanticDependenciesValidationError)
-    register(AttrsDetailedErrorResponse, PydanticDetailedErrorResponse)
-    register(AttrsEnumValidationError, PydanticEnumValidationError)
-    register(AttrsErrorResponse, PydanticErrorResponse)
-    register(
-        AttrsExclusiveMaximumValidationError, PydanticExclusiveMaximumValidationError
-    )
-    register(
-        AttrsExclusiveMinimumValidationError, PydanticExclusiveMinimumValidationError
-    )
-    register(AttrsFactory, PydanticFactory)
-    register(AttrsFormatValidationError, PydanticFormatValidationError)
-    register(AttrsGenericValidationError, PydanticGenericValidationError)
-    register(AttrsInventory, PydanticInventory)
-    register(AttrsInventoryItem, PydanticInventoryItem)
-    register(AttrsInventoryListResponse, PydanticInventoryListResponse)
-    register(AttrsInventoryMovement, PydanticInventoryMovement)
-    register(AttrsInventoryMovementListResponse, PydanticInventoryMovementListResponse)
-    register(AttrsInventoryReorderPoint, PydanticInventoryReorderPoint)
-    register(AttrsInventoryReorderPointResponse, PydanticInventoryReorderPointResponse)
-    register(AttrsInventorySafetyStockLevel, PydanticInventorySafetyStockLevel)
-    register(
-        AttrsInventorySafetyStockLevelResponse,
-        PydanticInventorySafetyStockLevelResponse,
-    )
-    register(AttrsItemConfig, PydanticItemConfig)
-    register(AttrsLocation, PydanticLocation)
-    register(AttrsLocationAddress, PydanticLocationAddress)
-    register(AttrsLocationListResponse, PydanticLocationListResponse)
-    register(
-        AttrsMakeToOrderManufacturingOrderRequest,
-        PydanticMakeToOrderManufacturingOrderRequest,
-    )
-    register(AttrsManufacturingOrder, PydanticManufacturingOrder)
-    register(
-        AttrsManufacturingOrderListResponse, PydanticManufacturingOrderListResponse
-    )
-    register(
-        AttrsManufacturingOrderOperationProduction,
-        PydanticManufacturingOrderOperationProduction,
-    )
-    register(
-        AttrsManufacturingOrderOperationRow, PydanticManufacturingOrderOperationRow
-    )
-    register(
-        AttrsManufacturingOrderOperationRowListResponse,
-        PydanticManufacturingOrderOperationRowListResponse,
-    )
-    register(AttrsManufacturingOrderProduction, PydanticManufacturingOrderProduction)
-    register(
-        AttrsManufacturingOrderProductionIngredient,
-        PydanticManufacturingOrderProductionIngredient,
-    )
-    register(
-        AttrsManufacturingOrderProductionIngredientResponse,
-        PydanticManufacturingOrderProductionIngredientResponse,
-    )
-    register(
-        AttrsManufacturingOrderProductionListResponse,
-        PydanticManufacturingOrderProductionListResponse,
-    )
-    register(AttrsManufacturingOrderRecipeRow, PydanticManufacturingOrderRecipeRow)
-    register(
-        AttrsManufacturingOrderRecipeRowListResponse,
-        PydanticManufacturingOrderRecipeRowListResponse,
-    )
-    register(AttrsMaterial, PydanticMaterial)
-    register(AttrsMaterialConfig, PydanticMaterialConfig)
-    register(AttrsMaterialListResponse, PydanticMaterialListResponse)
-    register(AttrsMaxItemsValidationError, PydanticMaxItemsValidationError)
-    register(AttrsMaxLengthValidationError, PydanticMaxLengthValidationError)
-    register(AttrsMaximumValidationError, PydanticMaximumValidationError)
-    register(AttrsMinItemsValidationError, PydanticMinItemsValidationError)
-    register(AttrsMinLengthValidationError, PydanticMinLengthValidationError)
-    register(AttrsMinimumValidationError, PydanticMinimumValidationError)
-    register(AttrsMultipleOfValidationError, PydanticMultipleOfValidationError)
-    register(AttrsNegativeStock, PydanticNegativeStock)
-    register(AttrsNegativeStockListResponse, PydanticNegativeStockListResponse)
-    register(AttrsOneOfValidationError, PydanticOneOfValidationError)
-    register(AttrsOperator, PydanticOperator)
-    register(AttrsOperatorListResponse, PydanticOperatorListResponse)
-    register(AttrsOutsourcedPurchaseOrder, PydanticOutsourcedPurchaseOrder)
-    register(
-        AttrsOutsourcedPurchaseOrderRecipeRow, PydanticOutsourcedPurchaseOrderRecipeRow
-    )
-    register(
-        AttrsOutsourcedPurchaseOrderRecipeRowListResponse,
-        PydanticOutsourcedPurchaseOrderRecipeRowListResponse,
-    )
-    register(AttrsPatternValidationError, PydanticPatternValidationError)
-    register(AttrsPriceList, PydanticPriceList)
-    register(AttrsPriceListCustomer, PydanticPriceListCustomer)
-    register(AttrsPriceListCustomerListResponse, PydanticPriceListCustomerListResponse)
-    register(AttrsPriceListListResponse, PydanticPriceListListResponse)
-    register(AttrsPriceListRow, PydanticPriceListRow)
-    register(AttrsPriceListRowListResponse, PydanticPriceListRowListResponse)
-    register(AttrsProduct, PydanticProduct)
-    register(AttrsProductListResponse, PydanticProductListResponse)
-    register(AttrsProductOperationRerank, PydanticProductOperationRerank)
-    register(AttrsProductOperationRerankRequest, PydanticProductOperationRerankRequest)
-    register(AttrsProductOperationRow, PydanticProductOperationRow)
-    register(
-        AttrsProductOperationRowListResponse, PydanticProductOperationRowListResponse
-    )
-    register(
-        AttrsPurchaseOrderAccountingMetadata, PydanticPurchaseOrderAccountingMetadata
-    )
-    register(
-        AttrsPurchaseOrderAccountingMetadataListResponse,
-        PydanticPurchaseOrderAccountingMetadataListResponse,
-    )
-    register(
-        AttrsPurchaseOrderAdditionalCostRow, PydanticPurchaseOrderAdditionalCostRow
-    )
-    register(
-        AttrsPurchaseOrderAdditionalCostRowListResponse,
-        PydanticPurchaseOrderAdditionalCostRowListResponse,
-    )
-    register(AttrsPurchaseOrderBase, PydanticPurchaseOrderBase)
-    register(AttrsPurchaseOrderListResponse, PydanticPurchaseOrderListResponse)
-    register(AttrsPurchaseOrderReceiveRow, PydanticPurchaseOrderReceiveRow)
-    register(AttrsPurchaseOrderRow, PydanticPurchaseOrderRow)
-    register(AttrsPurchaseOrderRowListResponse, PydanticPurchaseOrderRowListResponse)
-    register(AttrsPurchaseOrderRowRequest, PydanticPurchaseOrderRowRequest)
-    register(AttrsRecipe, PydanticRecipe)
-    register(AttrsRecipeListResponse, PydanticRecipeListResponse)
-    register(AttrsRegularPurchaseOrder, PydanticRegularPurchaseOrder)
-    register(AttrsRequiredValidationError, PydanticRequiredValidationError)
-    register(AttrsReturnableItem, PydanticReturnableItem)
-    register(AttrsSalesOrder, PydanticSalesOrder)
-    register(AttrsSalesOrderAccountingMetadata, PydanticSalesOrderAccountingMetadata)
-    register(
-        AttrsSalesOrderAccountingMetadataListResponse,
-        PydanticSalesOrderAccountingMetadataListResponse,
-    )
-    register(AttrsSalesOrderAddress, PydanticSalesOrderAddress)
-    register(AttrsSalesOrderAddressListResponse, PydanticSalesOrderAddressListResponse)
-    register(AttrsSalesOrderFulfillment, PydanticSalesOrderFulfillment)
-    register(
-        AttrsSalesOrderFulfillmentListResponse,
-        PydanticSalesOrderFulfillmentListResponse,
-    )
-    register(
-        AttrsSalesOrderFulfillmentRowRequest, PydanticSalesOrderFulfillmentRowRequest
-    )
-    register(AttrsSalesOrderListResponse, PydanticSalesOrderListResponse)
-    register(AttrsSalesOrderRow, PydanticSalesOrderRow)
-    register(AttrsSalesOrderRowListResponse, PydanticSalesOrderRowListResponse)
-    register(AttrsSalesOrderRowSearchFilter, PydanticSalesOrderRowSearchFilter)
-    register(AttrsSalesOrderRowSearchRequest, PydanticSalesOrderRowSearchRequest)
-    register(AttrsSalesOrderRowSearchWhere, PydanticSalesOrderRowSearchWhere)
-    register(AttrsSalesOrderSearchFilter, PydanticSalesOrderSearchFilter)
-    register(AttrsSalesOrderSearchRequest, PydanticSalesOrderSearchRequest)
-    register(AttrsSalesOrderSearchWhere, PydanticSalesOrderSearchWhere)
-    register(AttrsSalesOrderShippingFee, PydanticSalesOrderShippingFee)
-    register(
-        AttrsSalesOrderShippingFeeListResponse,
-        PydanticSalesOrderShippingFeeListResponse,
-    )
-    register(AttrsSalesReturn, PydanticSalesReturn)
-    register(AttrsSalesReturnListResponse, PydanticSalesReturnListResponse)
-    register(AttrsSalesReturnReason, PydanticSalesReturnReason)
-    register(AttrsSalesReturnRow, PydanticSalesReturnRow)
-    register(AttrsSalesReturnRowListResponse, PydanticSalesReturnRowListResponse)
-    register(AttrsSearchComparator, PydanticSearchComparator)
-    register(AttrsSerialNumber, PydanticSerialNumber)
-    register(AttrsSerialNumberListResponse, PydanticSerialNumberListResponse)
-    register(AttrsSerialNumberStock, PydanticSerialNumberStock)
-    register(AttrsSerialNumberStockListResponse, PydanticSerialNumberStockListResponse)
-    register(AttrsService, PydanticService)
-    register(AttrsServiceListResponse, PydanticServiceListResponse)
-    register(AttrsServiceVariant, PydanticServiceVariant)
-    register(AttrsStockAdjustment, PydanticStockAdjustment)
-    register(
-        AttrsStockAdjustmentBatchTransaction, PydanticStockAdjustmentBatchTransaction
-    )
-    register(AttrsStockAdjustmentListResponse, PydanticStockAdjustmentListResponse)
-    register(AttrsStockAdjustmentRow, PydanticStockAdjustmentRow)
-    register(AttrsStockTransfer, PydanticStockTransfer)
-    register(AttrsStockTransferListResponse, PydanticStockTransferListResponse)
-    register(AttrsStockTransferRow, PydanticStockTransferRow)
-    register(AttrsStockTransferRowRequest, PydanticStockTransferRowRequest)
-    register(AttrsStocktake, PydanticStocktake)
-    register(AttrsStocktakeListResponse, PydanticStocktakeListResponse)
-    register(AttrsStocktakeRow, PydanticStocktakeRow)
-    register(AttrsStocktakeRowListResponse, PydanticStocktakeRowListResponse)
-    register(AttrsStorageBin, PydanticStorageBin)
-    register(AttrsStorageBinCreate, PydanticStorageBinCreate)
-    register(AttrsStorageBinResponse, PydanticStorageBinResponse)
-    register(AttrsStorageBinUpdate, PydanticStorageBinUpdate)
-    register(AttrsSupplier, PydanticSupplier)
-    register(AttrsSupplierAddress, PydanticSupplierAddress)
-    register(AttrsSupplierAddressListResponse, PydanticSupplierAddressListResponse)
-    register(AttrsSupplierAddressRequest, PydanticSupplierAddressRequest)
-    register(AttrsSupplierListResponse, PydanticSupplierListResponse)
-    register(AttrsTaxRate, PydanticTaxRate)
-    register(AttrsTaxRateListResponse, PydanticTaxRateListResponse)
-    register(AttrsTraceabilityRequest, PydanticTraceabilityRequest)
-    register(AttrsTypeValidationError, PydanticTypeValidationError)
-    register(AttrsUnassignedBatchTransaction, PydanticUnassignedBatchTransaction)
-    register(
-        AttrsUnassignedBatchTransactionListResponse,
-        PydanticUnassignedBatchTransactionListResponse,
-    )
-    register(AttrsUniqueItemsValidationError, PydanticUniqueItemsValidationError)
-    register(
-        AttrsUnlinkManufacturingOrderRequest, PydanticUnlinkManufacturingOrderRequest
-    )
-    register(
-        AttrsUnlinkVariantBinLocationRequest, PydanticUnlinkVariantBinLocationRequest
-    )
-    register(AttrsUpdatableEntity, PydanticUpdatableEntity)
-    register(AttrsUpdateBinTransferRequest, PydanticUpdateBinTransferRequest)
-    register(AttrsUpdateBinTransferRowRequest, PydanticUpdateBinTransferRowRequest)
-    register(
-        AttrsUpdateBinTransferStatusRequest, PydanticUpdateBinTransferStatusRequest
-    )
-    register(AttrsUpdateBomRowRequest, PydanticUpdateBomRowRequest)
-    register(
-        AttrsUpdateCustomFieldDefinitionRequest,
-        PydanticUpdateCustomFieldDefinitionRequest,
-    )
-    register(AttrsUpdateCustomerAddressRequest, PydanticUpdateCustomerAddressRequest)
-    register(AttrsUpdateCustomerRequest, PydanticUpdateCustomerRequest)
-    register(
-        AttrsUpdateManufacturingOrderOperationRowRequest,
-        PydanticUpdateManufacturingOrderOperationRowRequest,
-    )
-    register(
-        AttrsUpdateManufacturingOrderProductionIngredientRequest,
-        PydanticUpdateManufacturingOrderProductionIngredientRequest,
-    )
-    register(
-        AttrsUpdateManufacturingOrderProductionRequest,
-        PydanticUpdateManufacturingOrderProductionRequest,
-    )
-    register(
-        AttrsUpdateManufacturingOrderRecipeRowRequest,
-        PydanticUpdateManufacturingOrderRecipeRowRequest,
-    )
-    register(
-        AttrsUpdateManufacturingOrderRequest, PydanticUpdateManufacturingOrderRequest
-    )
-    register(AttrsUpdateMaterialRequest, PydanticUpdateMaterialRequest)
-    register(
-        AttrsUpdateOutsourcedPurchaseOrderRecipeRowRequest,
-        PydanticUpdateOutsourcedPurchaseOrderRecipeRowRequest,
-    )
-    register(
-        AttrsUpdatePriceListCustomerRequest, PydanticUpdatePriceListCustomerRequest
-    )
-    register(AttrsUpdatePriceListRequest, PydanticUpdatePriceListRequest)
-    register(AttrsUpdatePriceListRowRequest, PydanticUpdatePriceListRowRequest)
-    register(
-        AttrsUpdateProductOperationRowRequest, PydanticUpdateProductOperationRowRequest
-    )
-    register(AttrsUpdateProductRequest, PydanticUpdateProductRequest)
-    register(
-        AttrsUpdatePurchaseOrderAdditionalCostRowRequest,
-        PydanticUpdatePurchaseOrderAdditionalCostRowRequest,
-    )
-    register(AttrsUpdatePurchaseOrderRequest, PydanticUpdatePurchaseOrderRequest)
-    register(AttrsUpdatePurchaseOrderRowRequest, PydanticUpdatePurchaseOrderRowRequest)
-    register(AttrsUpdateRecipeRowRequest, PydanticUpdateRecipeRowRequest)
-    register(
-        AttrsUpdateSalesOrderAddressRequest, PydanticUpdateSalesOrderAddressRequest
-    )
-    register(
-        AttrsUpdateSalesOrderFulfillmentRequest,
-        PydanticUpdateSalesOrderFulfillmentRequest,
-    )
-    register(AttrsUpdateSalesOrderRequest, PydanticUpdateSalesOrderRequest)
-    register(AttrsUpdateSalesOrderRowRequest, PydanticUpdateSalesOrderRowRequest)
-    register(
-        AttrsUpdateSalesOrderShippingFeeRequest,
-        PydanticUpdateSalesOrderShippingFeeRequest,
-    )
-    register(AttrsUpdateSalesReturnRequest, PydanticUpdateSalesReturnRequest)
-    register(AttrsUpdateSalesReturnRowRequest, PydanticUpdateSalesReturnRowRequest)
-    register(AttrsUpdateServiceRequest, PydanticUpdateServiceRequest)
-    register(AttrsUpdateStockAdjustmentRequest, PydanticUpdateStockAdjustmentRequest)
-    register(AttrsUpdateStockTransferRequest, PydanticUpdateStockTransferRequest)
-    register(
-        AttrsUpdateStockTransferStatusRequest, PydanticUpdateStockTransferStatusRequest
-    )
-    register(AttrsUpdateStocktakeRequest, PydanticUpdateStocktakeRequest)
-    register(AttrsUpdateStocktakeRowRequest, PydanticUpdateStocktakeRowRequest)
-    register(AttrsUpdateSupplierAddressRequest, PydanticUpdateSupplierAddressRequest)
-    register(AttrsUpdateSupplierRequest, PydanticUpdateSupplierRequest)
-    register(AttrsUpdateVariantRequest, PydanticUpdateVariantRequest)
-    register(AttrsUpdateWebhookRequest, PydanticUpdateWebhookRequest)
-    register(AttrsUser, PydanticUser)
-    register(AttrsUserInfo, PydanticUserInfo)
-    register(AttrsUserListResponse, PydanticUserListResponse)
-    register(AttrsVariant, PydanticVariant)
-    register(AttrsVariantDefaultStorageBinLink, PydanticVariantDefaultStorageBinLink)
-    register(
-        AttrsVariantDefaultStorageBinLinkResponse,
-        PydanticVariantDefaultStorageBinLinkResponse,
-    )
-    register(AttrsVariantListResponse, PydanticVariantListResponse)
-    register(AttrsVariantResponse, PydanticVariantResponse)
-    register(AttrsWebhook, PydanticWebhook)
-    register(AttrsWebhookEventPayload, PydanticWebhookEventPayload)
-    register(AttrsWebhookListResponse, PydanticWebhookListResponse)
-    register(AttrsWebhookLogsExport, PydanticWebhookLogsExport)
-    register(AttrsWebhookLogsExportRequest, PydanticWebhookLogsExportRequest)
+    for module_name in MODEL_PAIRS:
+        register_module_models(module_name)
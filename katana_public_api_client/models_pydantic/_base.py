@@ -7,8 +7,10 @@ and Pydantic models (for validation, serialization, and user-facing operations).
 
 from __future__ import annotations
 
+import contextlib
 import datetime
 import enum
+import logging
 import types
 from collections.abc import Callable, Iterable
 from typing import (
@@ -31,6 +33,8 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound="KatanaPydanticBase")
 
+_logger = logging.getLogger(__name__)
+
 
 def _is_unset(value: Any) -> bool:
     """Check if a value is the UNSET sentinel.
@@ -103,14 +107,6 @@ def _annotation_accepts_str(annotation: Any) -> bool:
     return False
 
 
-def _coerce_sentinel_null(value: Any, annotation: Any) -> Any:
-    """Map Katana's literal ``"null"``/``"undefined"`` string to ``None`` when the
-    target field cannot hold a string; otherwise return ``value`` unchanged."""
-    if not isinstance(value, str) or value not in _SENTINEL_NULL_STRINGS:
-        return value
-    return None if not _annotation_accepts_str(annotation) else value
-
-
 class KatanaPydanticBase(SQLModel):
     """Base class for all generated Pydantic models.
 
@@ -169,6 +165,10 @@ class KatanaPydanticBase(SQLModel):
         - Enum value extraction
         - Field name mapping (type_ -> type)
 
+        The field list and per-field handling are compiled once per
+        (attrs class, Pydantic class) pair and cached; see
+        ``_from_attrs_plan``.
+
         Args:
             attrs_obj: An instance of the corresponding attrs model.
 
@@ -184,58 +184,31 @@ class KatanaPydanticBase(SQLModel):
             msg = f"Cannot convert None to {cls.__name__}"
             raise ValueError(msg)
 
-        # Extract field values from attrs object
-        data: dict[str, Any] = {}
-
-        # Get the attrs object's fields
         if hasattr(attrs_obj, "__attrs_attrs__"):
-            field_names = [attr.name for attr in attrs_obj.__attrs_attrs__]
+            plan = _from_attrs_plan(cls, type(attrs_obj))
         else:
-            # Fallback: use __dict__ for non-attrs objects
-            field_names = list(vars(attrs_obj).keys())
-
-        for field_name in field_names:
-            value = getattr(attrs_obj, field_name)
+            # Fallback: use __dict__ for non-attrs objects. Not cached, as the
+            # fields can differ per instance.
+            plan = _compile_from_attrs_plan(cls, list(vars(attrs_obj).keys()))
 
-            # Skip additional_properties field (handled separately)
-            if field_name == "additional_properties":
-                continue
-
-            # Convert UNSET -> None
-            if _is_unset(value):
-                value = None
-            elif isinstance(value, list):
-                # Handle lists of nested objects
-                value = [_convert_nested_value(item, _registry) for item in value]
-            elif isinstance(value, dict) and field_name != "additional_properties":
-                # Normalize an empty dict to None. Katana sometimes returns {}
-                # instead of null for absent optional nested objects (e.g.
-                # shipping_fee). An empty mapping cannot satisfy any schema
-                # that has required fields, so treat it the same as null.
-                if not value:
-                    value = None
-                else:
-                    value = {
-                        k: _convert_nested_value(v, _registry) for k, v in value.items()
-                    }
-            else:
-                value = _convert_nested_value(value, _registry)
-
-            # Map field names (type_ -> type for pydantic)
-            pydantic_field_name = field_name
-            if field_name.endswith("_") and not field_name.startswith("_"):
-                # Remove trailing underscore for pydantic field
-                pydantic_field_name = field_name[:-1]
+        data: dict[str, Any] = {}
+        for attrs_name, field_name, coerce_sentinel in plan:
+            value = getattr(attrs_obj, attrs_name)
+            if type(value) not in _PLAIN_TYPES:
+                value = _convert_field_value(value, _registry)
 
             # Normalize Katana's literal ``"null"``/``"undefined"`` sentinel to
             # None for typed (non-string) fields so a single quirky record
             # doesn't fail ``model_validate`` below (and, in the typed-cache
             # sync, abort the whole batch).
-            model_field = cls.model_fields.get(pydantic_field_name)
-            if model_field is not None:
-                value = _coerce_sentinel_null(value, model_field.annotation)
+            if (
+                coerce_sentinel
+                and isinstance(value, str)
+                and value in _SENTINEL_NULL_STRINGS
+            ):
+                value = None
 
-            data[pydantic_field_name] = value
+            data[field_name] = value
 
         return cls.model_validate(data)
 
@@ -248,6 +221,9 @@ class KatanaPydanticBase(SQLModel):
         - Enum reconstruction from values
         - Field name mapping (type -> type_)
 
+        The per-field handling is compiled once per Pydantic class and
+        cached; see ``_to_attrs_plan``.
+
         Returns:
             An instance of the corresponding attrs model.
 
@@ -256,78 +232,215 @@ class KatanaPydanticBase(SQLModel):
         """
         from . import _registry
 
-        attrs_class = _registry.get_attrs_class(type(self))
-        if attrs_class is None:
-            msg = f"No attrs model registered for {type(self).__name__}"
-            raise RuntimeError(msg)
-
-        # Get UNSET sentinel
+        attrs_class, fields = _to_attrs_plan(type(self))
         unset = _get_unset()
 
-        # Build kwargs for attrs constructor
         kwargs: dict[str, Any] = {}
-
-        # Get attrs field info to know which fields accept UNSET
-        attrs_fields: dict[str, Any] = {}
-        if hasattr(attrs_class, "__attrs_attrs__"):
-            attrs_attrs = cast(Iterable[Any], attrs_class.__attrs_attrs__)
-            for attr in attrs_attrs:
-                attrs_fields[attr.name] = attr
-
         for field_name, field_value in self.model_dump().items():
-            # Map field names (type -> type_ for attrs)
-            attrs_field_name = field_name
-            # Check if attrs model uses trailing underscore (skip private fields)
-            if not field_name.startswith("_") and f"{field_name}_" in attrs_fields:
-                attrs_field_name = f"{field_name}_"
-
-            # Convert None -> UNSET where the attrs field type includes Unset
-            converted_value = field_value
-            if field_value is None and attrs_field_name in attrs_fields:
-                # Check if the field type includes Unset
-                attr_info = attrs_fields[attrs_field_name]
-                type_hint = attr_info.type if hasattr(attr_info, "type") else None
-                if type_hint is not None and "Unset" in str(type_hint):
-                    converted_value = unset
-
-            # Handle nested objects
-            if isinstance(converted_value, dict):
-                # Try to find the corresponding attrs class for nested objects
-                nested_pydantic_class = _get_field_type(type(self), field_name)
-                if nested_pydantic_class and issubclass(
-                    nested_pydantic_class, KatanaPydanticBase
-                ):
-                    nested_attrs_class = _registry.get_attrs_class(
-                        nested_pydantic_class
-                    )
+            attrs_name, unset_if_none, nested_class, dict_class, enum_class = (
+                fields.get(field_name, (field_name, False, None, None, None))
+            )
+
+            value = field_value
+            if value is None:
+                # None -> UNSET where the attrs field type includes Unset
+                if unset_if_none:
+                    value = unset
+            elif isinstance(value, dict):
+                # Nested object: rebuild it through its attrs class
+                if nested_class is not None:
+                    nested_attrs_class = _registry.get_attrs_class(nested_class)
                     if nested_attrs_class and hasattr(nested_attrs_class, "from_dict"):
                         from_dict_fn = cast(
                             Callable[[dict[str, Any]], Any],
                             nested_attrs_class.from_dict,
                         )
-                        converted_value = from_dict_fn(converted_value)
-            elif isinstance(converted_value, list):
-                # Handle lists of nested objects
-                new_list = []
-                for item in converted_value:
-                    if isinstance(item, dict):
-                        # We'd need more type info to convert dicts in lists properly
-                        new_list.append(item)
-                    else:
-                        new_list.append(
-                            _convert_to_attrs_value(item, _registry, attrs_fields, None)
-                        )
-                converted_value = new_list
-            else:
-                converted_value = _convert_to_attrs_value(
-                    converted_value, _registry, attrs_fields, attrs_field_name
-                )
-
-            kwargs[attrs_field_name] = converted_value
+                        value = from_dict_fn(value)
+                elif dict_class is not None:
+                    # Free-form dict on the Pydantic side, attrs model on ours
+                    value = dict_class.from_dict(value)
+            elif isinstance(value, list):
+                # We'd need more type info to convert dicts in lists properly,
+                # so only nested models are converted
+                value = [
+                    item.to_attrs() if isinstance(item, KatanaPydanticBase) else item
+                    for item in value
+                ]
+            elif isinstance(value, KatanaPydanticBase):
+                value = value.to_attrs()
+            elif enum_class is not None and isinstance(value, str):
+                # The attrs model expects enum instances
+                with contextlib.suppress(ValueError):
+                    value = enum_class(value)
+
+            kwargs[attrs_name] = value
 
         return attrs_class(**kwargs)
 
 
+# Values ``from_attrs`` passes through untouched. Checked by exact type, so
+# enums (including ``StrEnum``) still have their value extracted.
+_PLAIN_TYPES = frozenset(
+    {str, int, float, bool, type(None), datetime.datetime, datetime.date}
+)
+
+# Conversion plans, compiled once per class instead of reflecting over the
+# attrs and Pydantic fields (and their annotations) on every call. A
+# ``from_attrs`` plan lists ``(attrs field, Pydantic field, coerce the
+# "null"/"undefined" sentinel)`` per field; a ``to_attrs`` plan is the attrs
+# class and, per Pydantic field, ``(attrs field, None means UNSET, nested
+# Pydantic class, attrs class for a free-form dict field, enum class)``.
+_FromAttrsPlan = tuple[tuple[str, str, bool], ...]
+_ToAttrsField = tuple[
+    str, bool, type[KatanaPydanticBase] | None, Any, type[enum.Enum] | None
+]
+_ToAttrsPlan = tuple[type, dict[str, _ToAttrsField]]
+
+_from_attrs_plans: dict[tuple[type[KatanaPydanticBase], type], _FromAttrsPlan] = {}
+_to_attrs_plans: dict[type[KatanaPydanticBase], _ToAttrsPlan] = {}
+
+
+def _from_attrs_plan(
+    model_class: type[KatanaPydanticBase], attrs_class: Any
+) -> _FromAttrsPlan:
+    """Return the cached ``from_attrs`` plan for ``attrs_class`` -> ``model_class``."""
+    plan = _from_attrs_plans.get((model_class, attrs_class))
+    if plan is None:
+        attrs_attrs = cast(Iterable[Any], attrs_class.__attrs_attrs__)
+        plan = _compile_from_attrs_plan(
+            model_class, [attr.name for attr in attrs_attrs]
+        )
+        _from_attrs_plans[model_class, attrs_class] = plan
+    return plan
+
+
+def _compile_from_attrs_plan(
+    model_class: type[KatanaPydanticBase], field_names: list[str]
+) -> _FromAttrsPlan:
+    """Compile a ``from_attrs`` plan for the given attrs field names."""
+    plan: list[tuple[str, str, bool]] = []
+    for attrs_name in field_names:
+        # additional_properties (and its lazy slot) is not a model field
+        if attrs_name in ("additional_properties", "_additional_properties"):
+            continue
+
+        # Map field names (type_ -> type for pydantic)
+        field_name = attrs_name
+        if attrs_name.endswith("_") and not attrs_name.startswith("_"):
+            field_name = attrs_name[:-1]
+
+        # Only fields that cannot hold a string get the sentinel coerced
+        model_field = model_class.model_fields.get(field_name)
+        coerce_sentinel = model_field is not None and not _annotation_accepts_str(
+            model_field.annotation
+        )
+        plan.append((attrs_name, field_name, coerce_sentinel))
+    return tuple(plan)
+
+
+def _to_attrs_plan(model_class: type[KatanaPydanticBase]) -> _ToAttrsPlan:
+    """Return the cached ``to_attrs`` plan for ``model_class``.
+
+    Raises:
+        RuntimeError: If no attrs model is registered for ``model_class``.
+    """
+    plan = _to_attrs_plans.get(model_class)
+    if plan is None:
+        from . import _registry
+
+        attrs_class = _registry.get_attrs_class(model_class)
+        if attrs_class is None:
+            msg = f"No attrs model registered for {model_class.__name__}"
+            raise RuntimeError(msg)
+        plan = _to_attrs_plans[model_class] = (
+            attrs_class,
+            _compile_to_attrs_fields(model_class, attrs_class),
+        )
+    return plan
+
+
+def _compile_to_attrs_fields(
+    model_class: type[KatanaPydanticBase], attrs_class: type
+) -> dict[str, _ToAttrsField]:
+    """Compile the per-field part of a ``to_attrs`` plan."""
+    # Get attrs field info to know which fields accept UNSET
+    attrs_fields: dict[str, Any] = {}
+    if hasattr(attrs_class, "__attrs_attrs__"):
+        attrs_attrs = cast(Iterable[Any], attrs_class.__attrs_attrs__)
+        for attr in attrs_attrs:
+            attrs_fields[attr.name] = attr
+
+    fields: dict[str, _ToAttrsField] = {}
+    for field_name in model_class.model_fields:
+        # Map field names (type -> type_ for attrs), skipping private fields
+        attrs_name = field_name
+        if not field_name.startswith("_") and f"{field_name}_" in attrs_fields:
+            attrs_name = f"{field_name}_"
+
+        type_hint = None
+        if attrs_name in attrs_fields:
+            attr_info = attrs_fields[attrs_name]
+            type_hint = attr_info.type if hasattr(attr_info, "type") else None
+        unset_if_none = type_hint is not None and "Unset" in str(type_hint)
+        enum_class = _extract_enum_class(type_hint) if type_hint else None
+
+        nested_class = _get_field_type(model_class, field_name)
+        if not (
+            isinstance(nested_class, type)
+            and issubclass(nested_class, KatanaPydanticBase)
+        ):
+            nested_class = None
+        dict_class = None
+        if nested_class is None and type_hint is not None:
+            dict_class = _attrs_class_from_hint(type_hint)
+
+        fields[field_name] = (
+            attrs_name,
+            unset_if_none,
+            nested_class,
+            dict_class,
+            enum_class,
+        )
+    return fields
+
+
+def _attrs_class_from_hint(type_hint: Any) -> Any:
+    """Return the attrs model named in an attrs field's type hint, if any.
+
+    Some schemas are typed ``dict[str, Any]`` on the Pydantic side but as a
+    generated attrs model (e.g. ``Factory.legal_address``). The attrs models
+    use postponed annotations, so the hint is a string like
+    ``"FactoryLegalAddress | Unset"``.
+    """
+    from .. import models
+
+    names = type_hint.split("|") if isinstance(type_hint, str) else []
+    for name in names:
+        candidate = getattr(models, name.strip(), None)
+        if isinstance(candidate, type) and hasattr(candidate, "from_dict"):
+            return candidate
+    return None
+
+
+def _convert_field_value(value: Any, registry: Any) -> Any:
+    """Convert one top-level attrs field value for ``from_attrs``."""
+    # Convert UNSET -> None
+    if _is_unset(value):
+        return None
+    if isinstance(value, list):
+        # Handle lists of nested objects
+        return [_convert_nested_value(item, registry) for item in value]
+    if isinstance(value, dict):
+        # Normalize an empty dict to None. Katana sometimes returns {}
+        # instead of null for absent optional nested objects (e.g.
+        # shipping_fee). An empty mapping cannot satisfy any schema
+        # that has required fields, so treat it the same as null.
+        if not value:
+            return None
+        return {k: _convert_nested_value(v, registry) for k, v in value.items()}
+    return _convert_nested_value(value, registry)
+
+
 def _convert_nested_value(value: Any, registry: Any) -> Any:
     """Convert a nested value from attrs to pydantic representation.
 
@@ -348,10 +461,9 @@ def _convert_nested_value(value: Any, registry: Any) -> Any:
         with a warning; pydantic validation will surface the mismatch
         downstream.
     """
-    import logging
-
-    if value is None:
-        return None
+    # Plain values (None, str, numbers, datetimes) pass through unchanged
+    if type(value) in _PLAIN_TYPES:
+        return value
 
     if _is_unset(value):
         return None
@@ -360,14 +472,6 @@ def _convert_nested_value(value: Any, registry: Any) -> Any:
     if isinstance(value, enum.Enum):
         return value.value
 
-    # Handle datetime objects
-    if isinstance(value, datetime.datetime):
-        return value
-
-    # Handle datetime.date objects
-    if isinstance(value, datetime.date):
-        return value
-
     # Handle nested attrs objects
     if hasattr(value, "__attrs_attrs__"):
         pydantic_class = registry.get_pydantic_class(type(value))
@@ -387,8 +491,7 @@ def _convert_nested_value(value: Any, registry: Any) -> Any:
             return to_dict_fn()
         # Last resort: warn and pass through. Pydantic validation will
         # surface the type mismatch loudly enough.
-        logger = logging.getLogger(__name__)
-        logger.warning(
+        _logger.warning(
             "Nested attrs class %s is not registered in the pydantic registry "
             "and has no ``to_dict`` fallback. Conversion may fail or produce "
             "unexpected results.",
@@ -398,36 +501,6 @@ def _convert_nested_value(value: Any, registry: Any) -> Any:
     return value
 
 
-def _convert_to_attrs_value(
-    value: Any,
-    registry: Any,
-    attrs_fields: dict[str, Any],
-    field_name: str | None,
-) -> Any:
-    """Convert a value from pydantic to attrs representation."""
-    if value is None:
-        return value
-
-    # Handle pydantic models -> attrs models
-    if isinstance(value, KatanaPydanticBase):
-        return value.to_attrs()
-
-    # Handle enums - the attrs model expects enum instances
-    if isinstance(value, str) and field_name and field_name in attrs_fields:
-        attr_info = attrs_fields[field_name]
-        type_hint = attr_info.type if hasattr(attr_info, "type") else None
-        # Try to reconstruct enum from string value
-        if type_hint:
-            enum_class = _extract_enum_class(type_hint)
-            if enum_class:
-                try:
-                    return enum_class(value)
-                except ValueError:
-                    pass
-
-    return value
-
-
 def _extract_enum_class(type_hint: Any) -> type[enum.Enum] | None:
     """Extract an enum class from a type hint."""
     # Handle Union types
@@ -3,484 +3,945 @@
 DO NOT EDIT - This file is generated by scripts/generate_pydantic_models.py
 
 The models in this package mirror the attrs models in katana_public_api_client/models/
-but use Pydantic v2 for validation and serialization.
+but use Pydantic v2 for validation and serialization. Each domain module is
+imported on first access to one of its names.
 
 To regenerate these models, run:
     uv run poe generate-pydantic
 """
 
-from .base import (
-    ArchivableDeletableEntity,
-    ArchivableEntity,
-    BaseEntity,
-    DeletableEntity,
-    UpdatableEntity,
-)
-from .common import (
-    AbcClassification,
-    AccountingIntegrationType,
-    AdditionalCost,
-    AdditionalCostListResponse,
-    Address,
-    AddressEntityType,
-    AssignedOperator,
-    Attribute,
-    Attribute3,
-    BinInventory,
-    BinInventoryGranularity,
-    BinInventoryListResponse,
-    BinTransfer,
-    BinTransferListResponse,
-    BinTransferRow,
-    BinTransferRowCreateNested,
-    BinTransferRowListResponse,
-    BinTransferStatus,
-    BinTransferTraceability,
-    BinTransferTraceabilityRequest,
-    CachedAdditionalCost,
-    CachedBinTransfer,
-    CachedBinTransferRow,
-    CachedFactory,
-    CachedLocation,
-    CachedOperator,
-    CachedTaxRate,
-    ClearDemandForecastRequest,
-    Comparison,
-    Comparison1,
-    Comparison2,
-    Comparison3,
-    Config,
-    Config1,
-    Config2,
-    ConfigAttribute,
-    ConfigAttribute1,
-    ConfigAttribute2,
-    ConfigAttribute3,
-    CostDistributionMethod,
-    CreateBinTransferRequest,
-    CreateBinTransferRowRequest,
-    CreateCustomFieldDefinitionRequest,
-    CreateDemandForecastRequest,
-    CreateInventorySafetyStockLevelRequest,
-    CreateTaxRateRequest,
-    CustomField,
-    CustomField1,
-    CustomField2,
-    CustomField3,
-    CustomField4,
-    CustomField5,
-    CustomFieldChoice,
-    CustomFieldChoiceCreate,
-    CustomFieldCollectionResourceType,
-    CustomFieldDefinition,
-    CustomFieldDefinitionListResponse,
-    CustomFieldEntityType,
-    CustomFieldModel,
-    CustomFieldOptions,
-    CustomFieldOptionsCreate,
-    CustomFieldsCollection,
-    CustomFieldsCollectionListResponse,
-    CustomFieldType,
-    CustomFieldValue,
-    DemandForecastPeriod,
-    DemandForecastResponse,
-    DocumentSendStatus,
-    EntityType,
-    EntityType1,
-    Event,
-    Factory,
-    InventoryItemType,
-    InventoryMovementResourceType,
-    InventoryMovementResourceTypeFilter,
-    Location,
-    LocationAddress,
-    LocationListResponse,
-    ManufacturingOperationStatus,
-    MaterialType,
-    Object,
-    Operator,
-    OperatorListResponse,
-    OperatorWorkingArea,
-    Period,
-    Period1,
-    ProductAvailability,
-    ProductOperationRerank,
-    ProductOperationRerankRequest,
-    ProductOperationRow,
-    ProductOperationRowListResponse,
-    ProductOperationType,
-    ProductType,
-    Quantity,
-    Row,
-    SearchComparator,
-    SearchScalarValue1,
-    ServiceType,
-    Status,
-    TaxRate,
-    TaxRateListResponse,
-    TraceabilityRequest,
-    Transaction,
-    UnlinkVariantBinLocationListRequest,
-    UnlinkVariantBinLocationRequest,
-    UpdateBinTransferRequest,
-    UpdateBinTransferRowRequest,
-    UpdateBinTransferStatusRequest,
-    UpdateCustomFieldDefinitionRequest,
-    User,
-    UserInfo,
-    UserListResponse,
-    VariantDefaultStorageBinLink,
-    VariantDefaultStorageBinLinkResponse,
-    VariantType,
-)
-from .contacts import (
-    CachedCustomer,
-    CachedSupplier,
-    CreateCustomerAddressRequest,
-    CreateCustomerRequest,
-    CreatePriceListCustomerRequest,
-    CreatePriceListRequest,
-    CreatePriceListRowRequest,
-    CreateSupplierAddressRequest,
-    CreateSupplierRequest,
-    Customer,
-    CustomerAddress,
-    CustomerAddressListResponse,
-    CustomerListResponse,
-    PriceList,
-    PriceListAdjustmentMethod,
-    PriceListCustomer,
-    PriceListCustomer1,
-    PriceListCustomerListResponse,
-    PriceListListResponse,
-    PriceListRow,
-    PriceListRow1,
-    PriceListRowListResponse,
-    Supplier,
-    SupplierAddress,
-    SupplierAddressListResponse,
-    SupplierAddressRequest,
-    SupplierItemCode,
-    SupplierListResponse,
-    UpdateCustomerAddressRequest,
-    UpdateCustomerRequest,
-    UpdatePriceListCustomerRequest,
-    UpdatePriceListRequest,
-    UpdatePriceListRowRequest,
-    UpdateSupplierAddressRequest,
-    UpdateSupplierRequest,
-)
-from .errors import (
-    AdditionalPropertiesValidationError,
-    BaseValidationError,
-    Code,
-    Code1,
-    Code2,
-    Code3,
-    Code4,
-    Code5,
-    Code6,
-    Code7,
-    Code8,
-    Code9,
-    Code10,
-    Code11,
-    Code12,
-    Code13,
-    Code14,
-    Code15,
-    Code16,
-    Code17,
-    Code18,
-    CodedErrorResponse,
-    ConstValidationError,
-    DependenciesValidationError,
-    DetailedErrorResponse,
-    EnumValidationError,
-    ErrorResponse,
-    ExclusiveMaximumValidationError,
-    ExclusiveMinimumValidationError,
-    FormatValidationError,
-    GenericValidationError,
-    Info,
-    Info1,
-    Info2,
-    Info3,
-    Info4,
-    Info5,
-    Info6,
-    Info7,
-    Info8,
-    Info9,
-    Info10,
-    Info11,
-    Info12,
-    Info13,
-    Info14,
-    Info15,
-    Info16,
-    Info17,
-    Info18,
-    MaximumValidationError,
-    MaxItemsValidationError,
-    MaxLengthValidationError,
-    MinimumValidationError,
-    MinItemsValidationError,
-    MinLengthValidationError,
-    MultipleOfValidationError,
-    OneOfValidationError,
-    PatternValidationError,
-    RequiredValidationError,
-    TypeValidationError,
-    UniqueItemsValidationError,
-)
-from .inventory import (
-    CachedMaterial,
-    CachedProduct,
-    CachedService,
-    CachedVariant,
-    CreateInventoryReorderPointRequest,
-    CreateMaterialRequest,
-    CreateProductOperationRowItem,
-    CreateProductOperationRowsRequest,
-    CreateProductRequest,
-    CreateServiceRequest,
-    CreateServiceVariantRequest,
-    CreateVariantRequest,
-    Inventory,
-    InventoryItem,
-    InventoryListResponse,
-    InventoryMovement,
-    InventoryMovementListResponse,
-    InventoryReorderPoint,
-    InventoryReorderPointResponse,
-    InventorySafetyStockLevel,
-    InventorySafetyStockLevelResponse,
-    ItemConfig,
-    Material,
-    MaterialConfig,
-    MaterialListResponse,
-    Product,
-    ProductListResponse,
-    Service,
-    ServiceListResponse,
-    ServiceVariant,
-    UpdateMaterialRequest,
-    UpdateProductOperationRowRequest,
-    UpdateProductRequest,
-    UpdateServiceRequest,
-    UpdateVariantRequest,
-    Variant,
-    VariantListResponse,
-    VariantResponse,
-)
-from .manufacturing import (
-    BatchCreateBomRowsRequest,
-    BomRow,
-    BomRowListResponse,
-    CachedManufacturingOrder,
-    CachedManufacturingOrderRecipeRow,
-    CreateBomRowRequest,
-    CreateManufacturingOrderOperationRowRequest,
-    CreateManufacturingOrderProductionRequest,
-    CreateManufacturingOrderRecipeRowRequest,
-    CreateManufacturingOrderRequest,
-    CreateRecipesRequest,
-    MakeToOrderManufacturingOrderRequest,
-    ManufacturingOrder,
-    ManufacturingOrderListResponse,
-    ManufacturingOrderOperationProduction,
-    ManufacturingOrderOperationRow,
-    ManufacturingOrderOperationRowListResponse,
-    ManufacturingOrderOperationRowResponse,
-    ManufacturingOrderProduction,
-    ManufacturingOrderProductionIngredient,
-    ManufacturingOrderProductionIngredientResponse,
-    ManufacturingOrderProductionListResponse,
-    ManufacturingOrderRecipeRow,
-    ManufacturingOrderRecipeRowListResponse,
-    ManufacturingOrderStatus,
-    Recipe,
-    RecipeListResponse,
-    UnlinkManufacturingOrderRequest,
-    UpdateBomRowRequest,
-    UpdateManufacturingOrderOperationRowRequest,
-    UpdateManufacturingOrderProductionIngredientRequest,
-    UpdateManufacturingOrderProductionRequest,
-    UpdateManufacturingOrderRecipeRowRequest,
-    UpdateManufacturingOrderRequest,
-    UpdateRecipeRowRequest,
-)
-from .purchase_orders import (
-    CachedPurchaseOrder,
-    CachedPurchaseOrderRow,
-    CreateOutsourcedPurchaseOrderRecipeRowRequest,
-    CreatePurchaseOrderAdditionalCostRowRequest,
-    CreatePurchaseOrderInitialStatus,
-    CreatePurchaseOrderRequest,
-    CreatePurchaseOrderRowRequest,
-    OutsourcedPurchaseOrder,
-    OutsourcedPurchaseOrderIngredientAvailability,
-    OutsourcedPurchaseOrderRecipeRow,
-    OutsourcedPurchaseOrderRecipeRowListResponse,
-    PurchaseOrderAccountingMetadata,
-    PurchaseOrderAccountingMetadataListResponse,
-    PurchaseOrderAdditionalCostRow,
-    PurchaseOrderAdditionalCostRowListResponse,
-    PurchaseOrderBase,
-    PurchaseOrderBillingStatus,
-    PurchaseOrderDocumentStatus,
-    PurchaseOrderEntityType,
-    PurchaseOrderListResponse,
-    PurchaseOrderReceiveRequest,
-    PurchaseOrderReceiveRequest1,
-    PurchaseOrderReceiveRow,
-    PurchaseOrderRow,
-    PurchaseOrderRowListResponse,
-    PurchaseOrderRowRequest,
-    PurchaseOrderStatus,
-    RegularPurchaseOrder,
-    UpdateOutsourcedPurchaseOrderRecipeRowRequest,
-    UpdatePurchaseOrderAdditionalCostRowRequest,
-    UpdatePurchaseOrderRequest,
-    UpdatePurchaseOrderRowRequest,
-)
-from .sales_orders import (
-    Address1,
-    CachedSalesOrder,
-    CachedSalesOrderRow,
-    CreateSalesOrderAddressRequest,
-    CreateSalesOrderFulfillmentRequest,
-    CreateSalesOrderRequest,
-    CreateSalesOrderRowRequest,
-    CreateSalesOrderShippingFeeRequest,
-    CreateSalesOrderStatus,
-    CreateSalesReturnRequest,
-    CreateSalesReturnRowRequest,
-    ReturnableItem,
-    SalesOrder,
-    SalesOrderAccountingMetadata,
-    SalesOrderAccountingMetadataListResponse,
-    SalesOrderAddress,
-    SalesOrderAddressListResponse,
-    SalesOrderFulfillment,
-    SalesOrderFulfillmentInvoiceStatus,
-    SalesOrderFulfillmentInvoiceStatusFilter,
-    SalesOrderFulfillmentListResponse,
-    SalesOrderFulfillmentRow,
-    SalesOrderFulfillmentRowRequest,
-    SalesOrderFulfillmentStatus,
-    SalesOrderInvoicingStatus,
-    SalesOrderListResponse,
-    SalesOrderProductionStatus,
-    SalesOrderRow,
-    SalesOrderRow1,
-    SalesOrderRowListResponse,
-    SalesOrderRowSearchFilter,
-    SalesOrderRowSearchRequest,
-    SalesOrderRowSearchWhere,
-    SalesOrderSearchFilter,
-    SalesOrderSearchRequest,
-    SalesOrderSearchWhere,
-    SalesOrderShippingFee,
-    SalesOrderShippingFeeListResponse,
-    SalesOrderStatus,
-    SalesReturn,
-    SalesReturnListResponse,
-    SalesReturnReason,
-    SalesReturnRefundStatus,
-    SalesReturnRow,
-    SalesReturnRowListResponse,
-    SalesReturnStatus,
-    UnassignedBatchTransaction,
-    UnassignedBatchTransactionListResponse,
-    UpdateSalesOrderAddressRequest,
-    UpdateSalesOrderFulfillmentRequest,
-    UpdateSalesOrderRequest,
-    UpdateSalesOrderRowRequest,
-    UpdateSalesOrderShippingFeeRequest,
-    UpdateSalesOrderStatus,
-    UpdateSalesReturnRequest,
-    UpdateSalesReturnRowRequest,
-)
-from .stock import (
-    Batch,
-    BatchResponse,
-    BatchStock,
-    BatchStockListResponse,
-    BatchStockUpdate,
-    BatchTransaction,
-    BatchTransaction1,
-    BatchTransaction2,
-    BatchTransaction3,
-    BatchTransaction4,
-    BatchTransaction5,
-    BatchTransaction6,
-    BatchTransaction7,
-    BatchTransaction8,
-    BatchTransaction9,
-    BatchTransaction10,
-    BatchTransactionRequest,
-    CachedStockAdjustment,
-    CachedStockAdjustmentRow,
-    CachedStockTransfer,
-    CachedStockTransferRow,
-    CreateSerialNumberFailedItem,
-    CreateSerialNumberFailureReason,
-    CreateSerialNumberResourceType,
-    CreateSerialNumbersRequest,
-    CreateSerialNumbersResponse,
-    CreateStockAdjustmentRequest,
-    CreateStocktakeRequest,
-    CreateStocktakeRowRequest,
-    CreateStockTransferRequest,
-    DeleteSerialNumbersRequest,
-    NegativeStock,
-    NegativeStockListResponse,
-    SerialNumber,
-    SerialNumberListResponse,
-    SerialNumberResourceType,
-    SerialNumberStock,
-    SerialNumberStockListResponse,
-    SerialNumberTransaction,
-    SerialNumberTransaction1,
-    StockAdjustment,
-    StockAdjustmentBatchTransaction,
-    StockAdjustmentListResponse,
-    StockAdjustmentRow,
-    StockAdjustmentRow1,
-    Stocktake,
-    StocktakeListResponse,
-    StocktakeRow,
-    StocktakeRow1,
-    StocktakeRow2,
-    StocktakeRowListResponse,
-    StocktakeStatus,
-    StockTransfer,
-    StockTransferListResponse,
-    StockTransferRow,
-    StockTransferRowRequest,
-    StockTransferStatus,
-    StorageBin,
-    StorageBinCreate,
-    StorageBinResponse,
-    StorageBinUpdate,
-    UpdateStockAdjustmentRequest,
-    UpdateStocktakeRequest,
-    UpdateStocktakeRowRequest,
-    UpdateStockTransferRequest,
-    UpdateStockTransferStatusRequest,
-)
-from .webhooks import (
-    CreateWebhookRequest,
-    UpdateWebhookRequest,
-    Webhook,
-    WebhookEvent,
-    WebhookEventPayload,
-    WebhookListResponse,
-    WebhookLogsExport,
-    WebhookLogsExportRequest,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import (
+        ArchivableDeletableEntity,
+        ArchivableEntity,
+        BaseEntity,
+        DeletableEntity,
+        UpdatableEntity,
+    )
+    from .common import (
+        AbcClassification,
+        AccountingIntegrationType,
+        AdditionalCost,
+        AdditionalCostListResponse,
+        Address,
+        AddressEntityType,
+        AssignedOperator,
+        Attribute,
+        Attribute3,
+        BinInventory,
+        BinInventoryGranularity,
+        BinInventoryListResponse,
+        BinTransfer,
+        BinTransferListResponse,
+        BinTransferRow,
+        BinTransferRowCreateNested,
+        BinTransferRowListResponse,
+        BinTransferStatus,
+        BinTransferTraceability,
+        BinTransferTraceabilityRequest,
+        CachedAdditionalCost,
+        CachedBinTransfer,
+        CachedBinTransferRow,
+        CachedFactory,
+        CachedLocation,
+        CachedOperator,
+        CachedTaxRate,
+        ClearDemandForecastRequest,
+        Comparison,
+        Comparison1,
+        Comparison2,
+        Comparison3,
+        Config,
+        Config1,
+        Config2,
+        ConfigAttribute,
+        ConfigAttribute1,
+        ConfigAttribute2,
+        ConfigAttribute3,
+        CostDistributionMethod,
+        CreateBinTransferRequest,
+        CreateBinTransferRowRequest,
+        CreateCustomFieldDefinitionRequest,
+        CreateDemandForecastRequest,
+        CreateInventorySafetyStockLevelRequest,
+        CreateTaxRateRequest,
+        CustomField,
+        CustomField1,
+        CustomField2,
+        CustomField3,
+        CustomField4,
+        CustomField5,
+        CustomFieldChoice,
+        CustomFieldChoiceCreate,
+        CustomFieldCollectionResourceType,
+        CustomFieldDefinition,
+        CustomFieldDefinitionListResponse,
+        CustomFieldEntityType,
+        CustomFieldModel,
+        CustomFieldOptions,
+        CustomFieldOptionsCreate,
+        CustomFieldsCollection,
+        CustomFieldsCollectionListResponse,
+        CustomFieldType,
+        CustomFieldValue,
+        DemandForecastPeriod,
+        DemandForecastResponse,
+        DocumentSendStatus,
+        EntityType,
+        EntityType1,
+        Event,
+        Factory,
+        InventoryItemType,
+        InventoryMovementResourceType,
+        InventoryMovementResourceTypeFilter,
+        Location,
+        LocationAddress,
+        LocationListResponse,
+        ManufacturingOperationStatus,
+        MaterialType,
+        Object,
+        Operator,
+        OperatorListResponse,
+        OperatorWorkingArea,
+        Period,
+        Period1,
+        ProductAvailability,
+        ProductOperationRerank,
+        ProductOperationRerankRequest,
+        ProductOperationRow,
+        ProductOperationRowListResponse,
+        ProductOperationType,
+        ProductType,
+        Quantity,
+        Row,
+        SearchComparator,
+        SearchScalarValue1,
+        ServiceType,
+        Status,
+        TaxRate,
+        TaxRateListResponse,
+        TraceabilityRequest,
+        Transaction,
+        UnlinkVariantBinLocationListRequest,
+        UnlinkVariantBinLocationRequest,
+        UpdateBinTransferRequest,
+        UpdateBinTransferRowRequest,
+        UpdateBinTransferStatusRequest,
+        UpdateCustomFieldDefinitionRequest,
+        User,
+        UserInfo,
+        UserListResponse,
+        VariantDefaultStorageBinLink,
+        VariantDefaultStorageBinLinkResponse,
+        VariantType,
+    )
+    from .contacts import (
+        CachedCustomer,
+        CachedSupplier,
+        CreateCustomerAddressRequest,
+        CreateCustomerRequest,
+        CreatePriceListCustomerRequest,
+        CreatePriceListRequest,
+        CreatePriceListRowRequest,
+        CreateSupplierAddressRequest,
+        CreateSupplierRequest,
+        Customer,
+        CustomerAddress,
+        CustomerAddressListResponse,
+        CustomerListResponse,
+        PriceList,
+        PriceListAdjustmentMethod,
+        PriceListCustomer,
+        PriceListCustomer1,
+        PriceListCustomerListResponse,
+        PriceListListResponse,
+        PriceListRow,
+        PriceListRow1,
+        PriceListRowListResponse,
+        Supplier,
+        SupplierAddress,
+        SupplierAddressListResponse,
+        SupplierAddressRequest,
+        SupplierItemCode,
+        SupplierListResponse,
+        UpdateCustomerAddressRequest,
+        UpdateCustomerRequest,
+        UpdatePriceListCustomerRequest,
+        UpdatePriceListRequest,
+        UpdatePriceListRowRequest,
+        UpdateSupplierAddressRequest,
+        UpdateSupplierRequest,
+    )
+    from .errors import (
+        AdditionalPropertiesValidationError,
+        BaseValidationError,
+        Code,
+        Code1,
+        Code2,
+        Code3,
+        Code4,
+        Code5,
+        Code6,
+        Code7,
+        Code8,
+        Code9,
+        Code10,
+        Code11,
+        Code12,
+        Code13,
+        Code14,
+        Code15,
+        Code16,
+        Code17,
+        Code18,
+        CodedErrorResponse,
+        ConstValidationError,
+        DependenciesValidationError,
+        DetailedErrorResponse,
+        EnumValidationError,
+        ErrorResponse,
+        ExclusiveMaximumValidationError,
+        ExclusiveMinimumValidationError,
+        FormatValidationError,
+        GenericValidationError,
+        Info,
+        Info1,
+        Info2,
+        Info3,
+        Info4,
+        Info5,
+        Info6,
+        Info7,
+        Info8,
+        Info9,
+        Info10,
+        Info11,
+        Info12,
+        Info13,
+        Info14,
+        Info15,
+        Info16,
+        Info17,
+        Info18,
+        MaximumValidationError,
+        MaxItemsValidationError,
+        MaxLengthValidationError,
+        MinimumValidationError,
+        MinItemsValidationError,
+        MinLengthValidationError,
+        MultipleOfValidationError,
+        OneOfValidationError,
+        PatternValidationError,
+        RequiredValidationError,
+        TypeValidationError,
+        UniqueItemsValidationError,
+    )
+    from .inventory import (
+        CachedMaterial,
+        CachedProduct,
+        CachedService,
+        CachedVariant,
+        CreateInventoryReorderPointRequest,
+        CreateMaterialRequest,
+        CreateProductOperationRowItem,
+        CreateProductOperationRowsRequest,
+        CreateProductRequest,
+        CreateServiceRequest,
+        CreateServiceVariantRequest,
+        CreateVariantRequest,
+        Inventory,
+        InventoryItem,
+        InventoryListResponse,
+        InventoryMovement,
+        InventoryMovementListResponse,
+        InventoryReorderPoint,
+        InventoryReorderPointResponse,
+        InventorySafetyStockLevel,
+        InventorySafetyStockLevelResponse,
+        ItemConfig,
+        Material,
+        MaterialConfig,
+        MaterialListResponse,
+        Product,
+        ProductListResponse,
+        Service,
+        ServiceListResponse,
+        ServiceVariant,
+        UpdateMaterialRequest,
+        UpdateProductOperationRowRequest,
+        UpdateProductRequest,
+        UpdateServiceRequest,
+        UpdateVariantRequest,
+        Variant,
+        VariantListResponse,
+        VariantResponse,
+    )
+    from .manufacturing import (
+        BatchCreateBomRowsRequest,
+        BomRow,
+        BomRowListResponse,
+        CachedManufacturingOrder,
+        CachedManufacturingOrderRecipeRow,
+        CreateBomRowRequest,
+        CreateManufacturingOrderOperationRowRequest,
+        CreateManufacturingOrderProductionRequest,
+        CreateManufacturingOrderRecipeRowRequest,
+        CreateManufacturingOrderRequest,
+        CreateRecipesRequest,
+        MakeToOrderManufacturingOrderRequest,
+        ManufacturingOrder,
+        ManufacturingOrderListResponse,
+        ManufacturingOrderOperationProduction,
+        ManufacturingOrderOperationRow,
+        ManufacturingOrderOperationRowListResponse,
+        ManufacturingOrderOperationRowResponse,
+        ManufacturingOrderProduction,
+        ManufacturingOrderProductionIngredient,
+        ManufacturingOrderProductionIngredientResponse,
+        ManufacturingOrderProductionListResponse,
+        ManufacturingOrderRecipeRow,
+        ManufacturingOrderRecipeRowListResponse,
+        ManufacturingOrderStatus,
+        Recipe,
+        RecipeListResponse,
+        UnlinkManufacturingOrderRequest,
+        UpdateBomRowRequest,
+        UpdateManufacturingOrderOperationRowRequest,
+        UpdateManufacturingOrderProductionIngredientRequest,
+        UpdateManufacturingOrderProductionRequest,
+        UpdateManufacturingOrderRecipeRowRequest,
+        UpdateManufacturingOrderRequest,
+        UpdateRecipeRowRequest,
+    )
+    from .purchase_orders import (
+        CachedPurchaseOrder,
+        CachedPurchaseOrderRow,
+        CreateOutsourcedPurchaseOrderRecipeRowRequest,
+        CreatePurchaseOrderAdditionalCostRowRequest,
+        CreatePurchaseOrderInitialStatus,
+        CreatePurchaseOrderRequest,
+        CreatePurchaseOrderRowRequest,
+        OutsourcedPurchaseOrder,
+        OutsourcedPurchaseOrderIngredientAvailability,
+        OutsourcedPurchaseOrderRecipeRow,
+        OutsourcedPurchaseOrderRecipeRowListResponse,
+        PurchaseOrderAccountingMetadata,
+        PurchaseOrderAccountingMetadataListResponse,
+        PurchaseOrderAdditionalCostRow,
+        PurchaseOrderAdditionalCostRowListResponse,
+        PurchaseOrderBase,
+        PurchaseOrderBillingStatus,
+        PurchaseOrderDocumentStatus,
+        PurchaseOrderEntityType,
+        PurchaseOrderListResponse,
+        PurchaseOrderReceiveRequest,
+        PurchaseOrderReceiveRequest1,
+        PurchaseOrderReceiveRow,
+        PurchaseOrderRow,
+        PurchaseOrderRowListResponse,
+        PurchaseOrderRowRequest,
+        PurchaseOrderStatus,
+        RegularPurchaseOrder,
+        UpdateOutsourcedPurchaseOrderRecipeRowRequest,
+        UpdatePurchaseOrderAdditionalCostRowRequest,
+        UpdatePurchaseOrderRequest,
+        UpdatePurchaseOrderRowRequest,
+    )
+    from .sales_orders import (
+        Address1,
+        CachedSalesOrder,
+        CachedSalesOrderRow,
+        CreateSalesOrderAddressRequest,
+        CreateSalesOrderFulfillmentRequest,
+        CreateSalesOrderRequest,
+        CreateSalesOrderRowRequest,
+        CreateSalesOrderShippingFeeRequest,
+        CreateSalesOrderStatus,
+        CreateSalesReturnRequest,
+        CreateSalesReturnRowRequest,
+        ReturnableItem,
+        SalesOrder,
+        SalesOrderAccountingMetadata,
+        SalesOrderAccountingMetadataListResponse,
+        SalesOrderAddress,
+        SalesOrderAddressListResponse,
+        SalesOrderFulfillment,
+        SalesOrderFulfillmentInvoiceStatus,
+        SalesOrderFulfillmentInvoiceStatusFilter,
+        SalesOrderFulfillmentListResponse,
+        SalesOrderFulfillmentRow,
+        SalesOrderFulfillmentRowRequest,
+        SalesOrderFulfillmentStatus,
+        SalesOrderInvoicingStatus,
+        SalesOrderListResponse,
+        SalesOrderProductionStatus,
+        SalesOrderRow,
+        SalesOrderRow1,
+        SalesOrderRowListResponse,
+        SalesOrderRowSearchFilter,
+        SalesOrderRowSearchRequest,
+        SalesOrderRowSearchWhere,
+        SalesOrderSearchFilter,
+        SalesOrderSearchRequest,
+        SalesOrderSearchWhere,
+        SalesOrderShippingFee,
+        SalesOrderShippingFeeListResponse,
+        SalesOrderStatus,
+        SalesReturn,
+        SalesReturnListResponse,
+        SalesReturnReason,
+        SalesReturnRefundStatus,
+        SalesReturnRow,
+        SalesReturnRowListResponse,
+        SalesReturnStatus,
+        UnassignedBatchTransaction,
+        UnassignedBatchTransactionListResponse,
+        UpdateSalesOrderAddressRequest,
+        UpdateSalesOrderFulfillmentRequest,
+        UpdateSalesOrderRequest,
+        UpdateSalesOrderRowRequest,
+        UpdateSalesOrderShippingFeeRequest,
+        UpdateSalesOrderStatus,
+        UpdateSalesReturnRequest,
+        UpdateSalesReturnRowRequest,
+    )
+    from .stock import (
+        Batch,
+        BatchResponse,
+        BatchStock,
+        BatchStockListResponse,
+        BatchStockUpdate,
+        BatchTransaction,
+        BatchTransaction1,
+        BatchTransaction2,
+        BatchTransaction3,
+        BatchTransaction4,
+        BatchTransaction5,
+        BatchTransaction6,
+        BatchTransaction7,
+        BatchTransaction8,
+        BatchTransaction9,
+        BatchTransaction10,
+        BatchTransactionRequest,
+        CachedStockAdjustment,
+        CachedStockAdjustmentRow,
+        CachedStockTransfer,
+        CachedStockTransferRow,
+        CreateSerialNumberFailedItem,
+        CreateSerialNumberFailureReason,
+        CreateSerialNumberResourceType,
+        CreateSerialNumbersRequest,
+        CreateSerialNumbersResponse,
+        CreateStockAdjustmentRequest,
+        CreateStocktakeRequest,
+        CreateStocktakeRowRequest,
+        CreateStockTransferRequest,
+        DeleteSerialNumbersRequest,
+        NegativeStock,
+        NegativeStockListResponse,
+        SerialNumber,
+        SerialNumberListResponse,
+        SerialNumberResourceType,
+        SerialNumberStock,
+        SerialNumberStockListResponse,
+        SerialNumberTransaction,
+        SerialNumberTransaction1,
+        StockAdjustment,
+        StockAdjustmentBatchTransaction,
+        StockAdjustmentListResponse,
+        StockAdjustmentRow,
+        StockAdjustmentRow1,
+        Stocktake,
+        StocktakeListResponse,
+        StocktakeRow,
+        StocktakeRow1,
+        StocktakeRow2,
+        StocktakeRowListResponse,
+        StocktakeStatus,
+        StockTransfer,
+        StockTransferListResponse,
+        StockTransferRow,
+        StockTransferRowRequest,
+        StockTransferStatus,
+        StorageBin,
+        StorageBinCreate,
+        StorageBinResponse,
+        StorageBinUpdate,
+        UpdateStockAdjustmentRequest,
+        UpdateStocktakeRequest,
+        UpdateStocktakeRowRequest,
+        UpdateStockTransferRequest,
+        UpdateStockTransferStatusRequest,
+    )
+    from .webhooks import (
+        CreateWebhookRequest,
+        UpdateWebhookRequest,
+        Webhook,
+        WebhookEvent,
+        WebhookEventPayload,
+        WebhookListResponse,
+        WebhookLogsExport,
+        WebhookLogsExportRequest,
+    )
+
+# Public name -> domain module defining it, imported on first access
+_MODULES: dict[str, str] = {
+    "AbcClassification": "common",
+    "AccountingIntegrationType": "common",
+    "AdditionalCost": "common",
+    "AdditionalCostListResponse": "common",
+    "AdditionalPropertiesValidationError": "errors",
+    "Address": "common",
+    "Address1": "sales_orders",
+    "AddressEntityType": "common",
+    "ArchivableDeletableEntity": "base",
+    "ArchivableEntity": "base",
+    "AssignedOperator": "common",
+    "Attribute": "common",
+    "Attribute3": "common",
+    "BaseEntity": "base",
+    "BaseValidationError": "errors",
+    "Batch": "stock",
+    "BatchCreateBomRowsRequest": "manufacturing",
+    "BatchResponse": "stock",
+    "BatchStock": "stock",
+    "BatchStockListResponse": "stock",
+    "BatchStockUpdate": "stock",
+    "BatchTransaction": "stock",
+    "BatchTransaction1": "stock",
+    "BatchTransaction10": "stock",
+    "BatchTransaction2": "stock",
+    "BatchTransaction3": "stock",
+    "BatchTransaction4": "stock",
+    "BatchTransaction5": "stock",
+    "BatchTransaction6": "stock",
+    "BatchTransaction7": "stock",
+    "BatchTransaction8": "stock",
+    "BatchTransaction9": "stock",
+    "BatchTransactionRequest": "stock",
+    "BinInventory": "common",
+    "BinInventoryGranularity": "common",
+    "BinInventoryListResponse": "common",
+    "BinTransfer": "common",
+    "BinTransferListResponse": "common",
+    "BinTransferRow": "common",
+    "BinTransferRowCreateNested": "common",
+    "BinTransferRowListResponse": "common",
+    "BinTransferStatus": "common",
+    "BinTransferTraceability": "common",
+    "BinTransferTraceabilityRequest": "common",
+    "BomRow": "manufacturing",
+    "BomRowListResponse": "manufacturing",
+    "CachedAdditionalCost": "common",
+    "CachedBinTransfer": "common",
+    "CachedBinTransferRow": "common",
+    "CachedCustomer": "contacts",
+    "CachedFactory": "common",
+    "CachedLocation": "common",
+    "CachedManufacturingOrder": "manufacturing",
+    "CachedManufacturingOrderRecipeRow": "manufacturing",
+    "CachedMaterial": "inventory",
+    "CachedOperator": "common",
+    "CachedProduct": "inventory",
+    "CachedPurchaseOrder": "purchase_orders",
+    "CachedPurchaseOrderRow": "purchase_orders",
+    "CachedSalesOrder": "sales_orders",
+    "CachedSalesOrderRow": "sales_orders",
+    "CachedService": "inventory",
+    "CachedStockAdjustment": "stock",
+    "CachedStockAdjustmentRow": "stock",
+    "CachedStockTransfer": "stock",
+    "CachedStockTransferRow": "stock",
+    "CachedSupplier": "contacts",
+    "CachedTaxRate": "common",
+    "CachedVariant": "inventory",
+    "ClearDemandForecastRequest": "common",
+    "Code": "errors",
+    "Code1": "errors",
+    "Code10": "errors",
+    "Code11": "errors",
+    "Code12": "errors",
+    "Code13": "errors",
+    "Code14": "errors",
+    "Code15": "errors",
+    "Code16": "errors",
+    "Code17": "errors",
+    "Code18": "errors",
+    "Code2": "errors",
+    "Code3": "errors",
+    "Code4": "errors",
+    "Code5": "errors",
+    "Code6": "errors",
+    "Code7": "errors",
+    "Code8": "errors",
+    "Code9": "errors",
+    "CodedErrorResponse": "errors",
+    "Comparison": "common",
+    "Comparison1": "common",
+    "Comparison2": "common",
+    "Comparison3": "common",
+    "Config": "common",
+    "Config1": "common",
+    "Config2": "common",
+    "ConfigAttribute": "common",
+    "ConfigAttribute1": "common",
+    "ConfigAttribute2": "common",
+    "ConfigAttribute3": "common",
+    "ConstValidationError": "errors",
+    "CostDistributionMethod": "common",
+    "CreateBinTransferRequest": "common",
+    "CreateBinTransferRowRequest": "common",
+    "CreateBomRowRequest": "manufacturing",
+    "CreateCustomFieldDefinitionRequest": "common",
+    "CreateCustomerAddressRequest": "contacts",
+    "CreateCustomerRequest": "contacts",
+    "CreateDemandForecastRequest": "common",
+    "CreateInventoryReorderPointRequest": "inventory",
+    "CreateInventorySafetyStockLevelRequest": "common",
+    "CreateManufacturingOrderOperationRowRequest": "manufacturing",
+    "CreateManufacturingOrderProductionRequest": "manufacturing",
+    "CreateManufacturingOrderRecipeRowRequest": "manufacturing",
+    "CreateManufacturingOrderRequest": "manufacturing",
+    "CreateMaterialRequest": "inventory",
+    "CreateOutsourcedPurchaseOrderRecipeRowRequest": "purchase_orders",
+    "CreatePriceListCustomerRequest": "contacts",
+    "CreatePriceListRequest": "contacts",
+    "CreatePriceListRowRequest": "contacts",
+    "CreateProductOperationRowItem": "inventory",
+    "CreateProductOperationRowsRequest": "inventory",
+    "CreateProductRequest": "inventory",
+    "CreatePurchaseOrderAdditionalCostRowRequest": "purchase_orders",
+    "CreatePurchaseOrderInitialStatus": "purchase_orders",
+    "CreatePurchaseOrderRequest": "purchase_orders",
+    "CreatePurchaseOrderRowRequest": "purchase_orders",
+    "CreateRecipesRequest": "manufacturing",
+    "CreateSalesOrderAddressRequest": "sales_orders",
+    "CreateSalesOrderFulfillmentRequest": "sales_orders",
+    "CreateSalesOrderRequest": "sales_orders",
+    "CreateSalesOrderRowRequest": "sales_orders",
+    "CreateSalesOrderShippingFeeRequest": "sales_orders",
+    "CreateSalesOrderStatus": "sales_orders",
+    "CreateSalesReturnRequest": "sales_orders",
+    "CreateSalesReturnRowRequest": "sales_orders",
+    "CreateSerialNumberFailedItem": "stock",
+    "CreateSerialNumberFailureReason": "stock",
+    "CreateSerialNumberResourceType": "stock",
+    "CreateSerialNumbersRequest": "stock",
+    "CreateSerialNumbersResponse": "stock",
+    "CreateServiceRequest": "inventory",
+    "CreateServiceVariantRequest": "inventory",
+    "CreateStockAdjustmentRequest": "stock",
+    "CreateStockTransferRequest": "stock",
+    "CreateStocktakeRequest": "stock",
+    "CreateStocktakeRowRequest": "stock",
+    "CreateSupplierAddressRequest": "contacts",
+    "CreateSupplierRequest": "contacts",
+    "CreateTaxRateRequest": "common",
+    "CreateVariantRequest": "inventory",
+    "CreateWebhookRequest": "webhooks",
+    "CustomField": "common",
+    "CustomField1": "common",
+    "CustomField2": "common",
+    "CustomField3": "common",
+    "CustomField4": "common",
+    "CustomField5": "common",
+    "CustomFieldChoice": "common",
+    "CustomFieldChoiceCreate": "common",
+    "CustomFieldCollectionResourceType": "common",
+    "CustomFieldDefinition": "common",
+    "CustomFieldDefinitionListResponse": "common",
+    "CustomFieldEntityType": "common",
+    "CustomFieldModel": "common",
+    "CustomFieldOptions": "common",
+    "CustomFieldOptionsCreate": "common",
+    "CustomFieldType": "common",
+    "CustomFieldValue": "common",
+    "CustomFieldsCollection": "common",
+    "CustomFieldsCollectionListResponse": "common",
+    "Customer": "contacts",
+    "CustomerAddress": "contacts",
+    "CustomerAddressListResponse": "contacts",
+    "CustomerListResponse": "contacts",
+    "DeletableEntity": "base",
+    "DeleteSerialNumbersRequest": "stock",
+    "DemandForecastPeriod": "common",
+    "DemandForecastResponse": "common",
+    "DependenciesValidationError": "errors",
+    "DetailedErrorResponse": "errors",
+    "DocumentSendStatus": "common",
+    "EntityType": "common",
+    "EntityType1": "common",
+    "EnumValidationError": "errors",
+    "ErrorResponse": "errors",
+    "Event": "common",
+    "ExclusiveMaximumValidationError": "errors",
+    "ExclusiveMinimumValidationError": "errors",
+    "Factory": "common",
+    "FormatValidationError": "errors",
+    "GenericValidationError": "errors",
+    "Info": "errors",
+    "Info1": "errors",
+    "Info10": "errors",
+    "Info11": "errors",
+    "Info12": "errors",
+    "Info13": "errors",
+    "Info14": "errors",
+    "Info15": "errors",
+    "Info16": "errors",
+    "Info17": "errors",
+    "Info18": "errors",
+    "Info2": "errors",
+    "Info3": "errors",
+    "Info4": "errors",
+    "Info5": "errors",
+    "Info6": "errors",
+    "Info7": "errors",
+    "Info8": "errors",
+    "Info9": "errors",
+    "Inventory": "inventory",
+    "InventoryItem": "inventory",
+    "InventoryItemType": "common",
+    "InventoryListResponse": "inventory",
+    "InventoryMovement": "inventory",
+    "InventoryMovementListResponse": "inventory",
+    "InventoryMovementResourceType": "common",
+    "InventoryMovementResourceTypeFilter": "common",
+    "InventoryReorderPoint": "inventory",
+    "InventoryReorderPointResponse": "inventory",
+    "InventorySafetyStockLevel": "inventory",
+    "InventorySafetyStockLevelResponse": "inventory",
+    "ItemConfig": "inventory",
+    "Location": "common",
+    "LocationAddress": "common",
+    "LocationListResponse": "common",
+    "MakeToOrderManufacturingOrderRequest": "manufacturing",
+    "ManufacturingOperationStatus": "common",
+    "ManufacturingOrder": "manufacturing",
+    "ManufacturingOrderListResponse": "manufacturing",
+    "ManufacturingOrderOperationProduction": "manufacturing",
+    "ManufacturingOrderOperationRow": "manufacturing",
+    "ManufacturingOrderOperationRowListResponse": "manufacturing",
+    "ManufacturingOrderOperationRowResponse": "manufacturing",
+    "ManufacturingOrderProduction": "manufacturing",
+    "ManufacturingOrderProductionIngredient": "manufacturing",
+    "ManufacturingOrderProductionIngredientResponse": "manufacturing",
+    "ManufacturingOrderProductionListResponse": "manufacturing",
+    "ManufacturingOrderRecipeRow": "manufacturing",
+    "ManufacturingOrderRecipeRowListResponse": "manufacturing",
+    "ManufacturingOrderStatus": "manufacturing",
+    "Material": "inventory",
+    "MaterialConfig": "inventory",
+    "MaterialListResponse": "inventory",
+    "MaterialType": "common",
+    "MaxItemsValidationError": "errors",
+    "MaxLengthValidationError": "errors",
+    "MaximumValidationError": "errors",
+    "MinItemsValidationError": "errors",
+    "MinLengthValidationError": "errors",
+    "MinimumValidationError": "errors",
+    "MultipleOfValidationError": "errors",
+    "NegativeStock": "stock",
+    "NegativeStockListResponse": "stock",
+    "Object": "common",
+    "OneOfValidationError": "errors",
+    "Operator": "common",
+    "OperatorListResponse": "common",
+    "OperatorWorkingArea": "common",
+    "OutsourcedPurchaseOrder": "purchase_orders",
+    "OutsourcedPurchaseOrderIngredientAvailability": "purchase_orders",
+    "OutsourcedPurchaseOrderRecipeRow": "purchase_orders",
+    "OutsourcedPurchaseOrderRecipeRowListResponse": "purchase_orders",
+    "PatternValidationError": "errors",
+    "Period": "common",
+    "Period1": "common",
+    "PriceList": "contacts",
+    "PriceListAdjustmentMethod": "contacts",
+    "PriceListCustomer": "contacts",
+    "PriceListCustomer1": "contacts",
+    "PriceListCustomerListResponse": "contacts",
+    "PriceListListResponse": "contacts",
+    "PriceListRow": "contacts",
+    "PriceListRow1": "contacts",
+    "PriceListRowListResponse": "contacts",
+    "Product": "inventory",
+    "ProductAvailability": "common",
+    "ProductListResponse": "inventory",
+    "ProductOperationRerank": "common",
+    "ProductOperationRerankRequest": "common",
+    "ProductOperationRow": "common",
+    "ProductOperationRowListResponse": "common",
+    "ProductOperationType": "common",
+    "ProductType": "common",
+    "PurchaseOrderAccountingMetadata": "purchase_orders",
+    "PurchaseOrderAccountingMetadataListResponse": "purchase_orders",
+    "PurchaseOrderAdditionalCostRow": "purchase_orders",
+    "PurchaseOrderAdditionalCostRowListResponse": "purchase_orders",
+    "PurchaseOrderBase": "purchase_orders",
+    "PurchaseOrderBillingStatus": "purchase_orders",
+    "PurchaseOrderDocumentStatus": "purchase_orders",
+    "PurchaseOrderEntityType": "purchase_orders",
+    "PurchaseOrderListResponse": "purchase_orders",
+    "PurchaseOrderReceiveRequest": "purchase_orders",
+    "PurchaseOrderReceiveRequest1": "purchase_orders",
+    "PurchaseOrderReceiveRow": "purchase_orders",
+    "PurchaseOrderRow": "purchase_orders",
+    "PurchaseOrderRowListResponse": "purchase_orders",
+    "PurchaseOrderRowRequest": "purchase_orders",
+    "PurchaseOrderStatus": "purchase_orders",
+    "Quantity": "common",
+    "Recipe": "manufacturing",
+    "RecipeListResponse": "manufacturing",
+    "RegularPurchaseOrder": "purchase_orders",
+    "RequiredValidationError": "errors",
+    "ReturnableItem": "sales_orders",
+    "Row": "common",
+    "SalesOrder": "sales_orders",
+    "SalesOrderAccountingMetadata": "sales_orders",
+    "SalesOrderAccountingMetadataListResponse": "sales_orders",
+    "SalesOrderAddress": "sales_orders",
+    "SalesOrderAddressListResponse": "sales_orders",
+    "SalesOrderFulfillment": "sales_orders",
+    "SalesOrderFulfillmentInvoiceStatus": "sales_orders",
+    "SalesOrderFulfillmentInvoiceStatusFilter": "sales_orders",
+    "SalesOrderFulfillmentListResponse": "sales_orders",
+    "SalesOrderFulfillmentRow": "sales_orders",
+    "SalesOrderFulfillmentRowRequest": "sales_orders",
+    "SalesOrderFulfillmentStatus": "sales_orders",
+    "SalesOrderInvoicingStatus": "sales_orders",
+    "SalesOrderListResponse": "sales_orders",
+    "SalesOrderProductionStatus": "sales_orders",
+    "SalesOrderRow": "sales_orders",
+    "SalesOrderRow1": "sales_orders",
+    "SalesOrderRowListResponse": "sales_orders",
+    "SalesOrderRowSearchFilter": "sales_orders",
+    "SalesOrderRowSearchRequest": "sales_orders",
+    "SalesOrderRowSearchWhere": "sales_orders",
+    "SalesOrderSearchFilter": "sales_orders",
+    "SalesOrderSearchRequest": "sales_orders",
+    "SalesOrderSearchWhere": "sales_orders",
+    "SalesOrderShippingFee": "sales_orders",
+    "SalesOrderShippingFeeListResponse": "sales_orders",
+    "SalesOrderStatus": "sales_orders",
+    "SalesReturn": "sales_orders",
+    "SalesReturnListResponse": "sales_orders",
+    "SalesReturnReason": "sales_orders",
+    "SalesReturnRefundStatus": "sales_orders",
+    "SalesReturnRow": "sales_orders",
+    "SalesReturnRowListResponse": "sales_orders",
+    "SalesReturnStatus": "sales_orders",
+    "SearchComparator": "common",
+    "SearchScalarValue1": "common",
+    "SerialNumber": "stock",
+    "SerialNumberListResponse": "stock",
+    "SerialNumberResourceType": "stock",
+    "SerialNumberStock": "stock",
+    "SerialNumberStockListResponse": "stock",
+    "SerialNumberTransaction": "stock",
+    "SerialNumberTransaction1": "stock",
+    "Service": "inventory",
+    "ServiceListResponse": "inventory",
+    "ServiceType": "common",
+    "ServiceVariant": "inventory",
+    "Status": "common",
+    "StockAdjustment": "stock",
+    "StockAdjustmentBatchTransaction": "stock",
+    "StockAdjustmentListResponse": "stock",
+    "StockAdjustmentRow": "stock",
+    "StockAdjustmentRow1": "stock",
+    "StockTransfer": "stock",
+    "StockTransferListResponse": "stock",
+    "StockTransferRow": "stock",
+    "StockTransferRowRequest": "stock",
+    "StockTransferStatus": "stock",
+    "Stocktake": "stock",
+    "StocktakeListResponse": "stock",
+    "StocktakeRow": "stock",
+    "StocktakeRow1": "stock",
+    "StocktakeRow2": "stock",
+    "StocktakeRowListResponse": "stock",
+    "StocktakeStatus": "stock",
+    "StorageBin": "stock",
+    "StorageBinCreate": "stock",
+    "StorageBinResponse": "stock",
+    "StorageBinUpdate": "stock",
+    "Supplier": "contacts",
+    "SupplierAddress": "contacts",
+    "SupplierAddressListResponse": "contacts",
+    "SupplierAddressRequest": "contacts",
+    "SupplierItemCode": "contacts",
+    "SupplierListResponse": "contacts",
+    "TaxRate": "common",
+    "TaxRateListResponse": "common",
+    "TraceabilityRequest": "common",
+    "Transaction": "common",
+    "TypeValidationError": "errors",
+    "UnassignedBatchTransaction": "sales_orders",
+    "UnassignedBatchTransactionListResponse": "sales_orders",
+    "UniqueItemsValidationError": "errors",
+    "UnlinkManufacturingOrderRequest": "manufacturing",
+    "UnlinkVariantBinLocationListRequest": "common",
+    "UnlinkVariantBinLocationRequest": "common",
+    "UpdatableEntity": "base",
+    "UpdateBinTransferRequest": "common",
+    "UpdateBinTransferRowRequest": "common",
+    "UpdateBinTransferStatusRequest": "common",
+    "UpdateBomRowRequest": "manufacturing",
+    "UpdateCustomFieldDefinitionRequest": "common",
+    "UpdateCustomerAddressRequest": "contacts",
+    "UpdateCustomerRequest": "contacts",
+    "UpdateManufacturingOrderOperationRowRequest": "manufacturing",
+    "UpdateManufacturingOrderProductionIngredientRequest": "manufacturing",
+    "UpdateManufacturingOrderProductionRequest": "manufacturing",
+    "UpdateManufacturingOrderRecipeRowRequest": "manufacturing",
+    "UpdateManufacturingOrderRequest": "manufacturing",
+    "UpdateMaterialRequest": "inventory",
+    "UpdateOutsourcedPurchaseOrderRecipeRowRequest": "purchase_orders",
+    "UpdatePriceListCustomerRequest": "contacts",
+    "UpdatePriceListRequest": "contacts",
+    "UpdatePriceListRowRequest": "contacts",
+    "UpdateProductOperationRowRequest": "inventory",
+    "UpdateProductRequest": "inventory",
+    "UpdatePurchaseOrderAdditionalCostRowRequest": "purchase_orders",
+    "UpdatePurchaseOrderRequest": "purchase_orders",
+    "UpdatePurchaseOrderRowRequest": "purchase_orders",
+    "UpdateRecipeRowRequest": "manufacturing",
+    "UpdateSalesOrderAddressRequest": "sales_orders",
+    "UpdateSalesOrderFulfillmentRequest": "sales_orders",
+    "UpdateSalesOrderRequest": "sales_orders",
+    "UpdateSalesOrderRowRequest": "sales_orders",
+    "UpdateSalesOrderShippingFeeRequest": "sales_orders",
+    "UpdateSalesOrderStatus": "sales_orders",
+    "UpdateSalesReturnRequest": "sales_orders",
+    "UpdateSalesReturnRowRequest": "sales_orders",
+    "UpdateServiceRequest": "inventory",
+    "UpdateStockAdjustmentRequest": "stock",
+    "UpdateStockTransferRequest": "stock",
+    "UpdateStockTransferStatusRequest": "stock",
+    "UpdateStocktakeRequest": "stock",
+    "UpdateStocktakeRowRequest": "stock",
+    "UpdateSupplierAddressRequest": "contacts",
+    "UpdateSupplierRequest": "contacts",
+    "UpdateVariantRequest": "inventory",
+    "UpdateWebhookRequest": "webhooks",
+    "User": "common",
+    "UserInfo": "common",
+    "UserListResponse": "common",
+    "Variant": "inventory",
+    "VariantDefaultStorageBinLink": "common",
+    "VariantDefaultStorageBinLinkResponse": "common",
+    "VariantListResponse": "inventory",
+    "VariantResponse": "inventory",
+    "VariantType": "common",
+    "Webhook": "webhooks",
+    "WebhookEvent": "webhooks",
+    "WebhookEventPayload": "webhooks",
+    "WebhookListResponse": "webhooks",
+    "WebhookLogsExport": "webhooks",
+    "WebhookLogsExportRequest": "webhooks",
+}
 
 __all__ = [
     "AbcClassification",
@@ -936,3 +1397,18 @@ __all__ = [
     "WebhookLogsExport",
     "WebhookLogsExportRequest",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -4,23 +4,86 @@ This module provides a registry that maps attrs model classes to their
 corresponding Pydantic model classes and vice versa. This is essential
 for the bi-directional conversion functionality in _base.py.
 
-The registry is populated automatically when models are generated,
-via the _auto_registry.py module.
+The generated pairs are listed in the _auto_registry.py module and
+registered lazily: the first lookup of a class imports only the
+``_generated`` module that defines it and registers that module's pairs, so
+converting one model doesn't build every domain's classes.
 """
 
 from __future__ import annotations
 
+import functools
+import logging
+import threading
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from ._base import KatanaPydanticBase
 
+_logger = logging.getLogger(__name__)
+
 # Registries mapping class names and types
 _attrs_to_pydantic: dict[type, type[KatanaPydanticBase]] = {}
 _pydantic_to_attrs: dict[type[KatanaPydanticBase], type] = {}
 _attrs_name_to_class: dict[str, type] = {}
 _pydantic_name_to_class: dict[str, type[KatanaPydanticBase]] = {}
 
+# ``_generated`` modules whose pairs are registered, and the lock that keeps
+# a module from being seen as registered before all its pairs are
+_registered_modules: set[str] = set()
+_registration_lock = threading.RLock()
+
+
+@functools.cache
+def _generated_pairs() -> dict[str, tuple[tuple[str, str], ...]]:
+    """Return the generated ``{module: ((attrs_module, class_name), ...)}`` table."""
+    try:
+        from ._auto_registry import MODEL_PAIRS
+    except ImportError as e:
+        # Auto-registry not yet created - this is expected before generation
+        _logger.debug(
+            "Auto-registry not yet generated. Run 'uv run poe generate-pydantic' "
+            "to generate it. Import error: %s",
+            e,
+        )
+        return {}
+    return MODEL_PAIRS
+
+
+@functools.cache
+def _owning_modules() -> dict[str, str]:
+    """Map each generated class name to the ``_generated`` module defining it."""
+    return {
+        class_name: module_name
+        for module_name, pairs in _generated_pairs().items()
+        for _, class_name in pairs
+    }
+
+
+def _register_module(module_name: str) -> None:
+    """Register one ``_generated`` module's pairs, once."""
+    if module_name in _registered_modules:
+        return
+    from ._auto_registry import register_module_models
+
+    with _registration_lock:
+        if module_name not in _registered_modules:
+            register_module_models(module_name)
+            _registered_modules.add(module_name)
+
+
+def _resolve(class_name: str) -> None:
+    """Register the generated pairs of the module defining ``class_name``, if any."""
+    module_name = _owning_modules().get(class_name)
+    if module_name is not None:
+        _register_module(module_name)
+
+
+def _resolve_all() -> None:
+    """Register every generated pair."""
+    for module_name in _generated_pairs():
+        _register_module(module_name)
+
 
 def register(attrs_class: type, pydantic_class: type[KatanaPydanticBase]) -> None:
     """Register a mapping between an attrs class and a Pydantic class.
@@ -87,7 +150,11 @@ def get_pydantic_class(attrs_class: type) -> type[KatanaPydanticBase] | None:
     Returns:
         The corresponding Pydantic model class, or None if not registered.
     """
-    return _attrs_to_pydantic.get(attrs_class)
+    pydantic_class = _attrs_to_pydantic.get(attrs_class)
+    if pydantic_class is None:
+        _resolve(attrs_class.__name__)
+        pydantic_class = _attrs_to_pydantic.get(attrs_class)
+    return pydantic_class
 
 
 def get_attrs_class(pydantic_class: type[KatanaPydanticBase]) -> type | None:
@@ -99,7 +166,11 @@ def get_attrs_class(pydantic_class: type[KatanaPydanticBase]) -> type | None:
     Returns:
         The corresponding attrs model class, or None if not registered.
     """
-    return _pydantic_to_attrs.get(pydantic_class)
+    attrs_class = _pydantic_to_attrs.get(pydantic_class)
+    if attrs_class is None:
+        _resolve(pydantic_class.__name__)
+        attrs_class = _pydantic_to_attrs.get(pydantic_class)
+    return attrs_class
 
 
 def get_pydantic_class_by_name(name: str) -> type[KatanaPydanticBase] | None:
@@ -111,6 +182,8 @@ def get_pydantic_class_by_name(name: str) -> type[KatanaPydanticBase] | None:
     Returns:
         The Pydantic model class, or None if not found.
     """
+    if name not in _pydantic_name_to_class:
+        _resolve(name)
     return _pydantic_name_to_class.get(name)
 
 
@@ -123,6 +196,8 @@ def get_attrs_class_by_name(name: str) -> type | None:
     Returns:
         The attrs model class, or None if not found.
     """
+    if name not in _attrs_name_to_class:
+        _resolve(name)
     return _attrs_name_to_class.get(name)
 
 
@@ -132,6 +207,7 @@ def list_registered_models() -> list[tuple[str, str]]:
     Returns:
         List of (attrs_class_name, pydantic_class_name) tuples.
     """
+    _resolve_all()
     return [
         (attrs_cls.__name__, pydantic_cls.__name__)
         for attrs_cls, pydantic_cls in _attrs_to_pydantic.items()
@@ -147,6 +223,8 @@ def is_registered(model_class: type) -> bool:
     Returns:
         True if the class is registered in either direction.
     """
+    if model_class not in _attrs_to_pydantic and model_class not in _pydantic_to_attrs:
+        _resolve(model_class.__name__)
     return model_class in _attrs_to_pydantic or model_class in _pydantic_to_attrs
 
 
@@ -156,6 +234,7 @@ def get_registration_stats() -> dict[str, Any]:
     Returns:
         Dictionary with counts and other stats.
     """
+    _resolve_all()
     return {
         "total_pairs": len(_attrs_to_pydantic),
         "attrs_classes": len(_attrs_name_to_class),
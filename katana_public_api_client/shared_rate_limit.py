@@ -0,0 +1,319 @@
+"""Cross-process rate-limit state for ``RateLimitTransport``.
+
+Katana enforces its request budget per API key, not per process. When several
+processes share a key — MCP server workers, a cron job next to an interactive
+session, a ``multiprocessing`` pool — each one's in-memory limiter believes it
+owns the full budget, so together they overshoot and every process then spends
+its time in ``429`` back-off.
+
+:class:`SharedRateLimitState` moves the limiter's state into one SQLite file so
+every process on the machine draws from the same budget:
+
+- **Token bucket** — a pyrate-limiter ``SQLiteBucket`` guarded by a file lock
+  (``<path>.lock``), so the steady-state ``requests_per_minute`` holds for the
+  sum of all processes.
+- **Remaining estimate** — the optimistic per-request debit and the
+  ``X-Ratelimit-Remaining`` sync-down are applied once, to one shared counter,
+  instead of once per process (which would drain the bucket N times for the
+  same server-side drop).
+- **Reset gate** — a process that sees ``X-Ratelimit-Remaining: 0`` records the
+  ``X-Ratelimit-Reset`` deadline; the others pick it up before their next
+  request and wait it out too.
+
+Each budget is keyed by a ``scope`` string. ``KatanaClient`` uses the API key,
+hashed before it touches disk, so clients with different keys (e.g. the MCP
+server's dedicated sync key) keep separate budgets in the same file.
+
+Requires the ``filelock`` package::
+
+    pip install "katana-openapi-client[shared-rate-limit]"
+"""
+
+import contextlib
+import hashlib
+import importlib.util
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+from pyrate_limiter import Duration, Rate, SQLiteBucket
+
+_SHARED_RATE_LIMIT_HINT = 'pip install "katana-openapi-client[shared-rate-limit]"'
+
+_CREATE_STATE_TABLE = """
+CREATE TABLE IF NOT EXISTS rate_limit_state (
+    scope TEXT PRIMARY KEY,
+    estimated_remaining INTEGER NOT NULL,
+    reset_until_ms INTEGER
+)
+"""
+# The token log layout ``SQLiteBucket`` reads and writes
+_CREATE_BUCKET_TABLE = """
+CREATE TABLE IF NOT EXISTS '{table}' (
+    name VARCHAR,
+    item_timestamp INTEGER
+)
+"""
+_CREATE_BUCKET_INDEX = (
+    "CREATE INDEX IF NOT EXISTS 'idx_{table}_rate_item_timestamp' "
+    "ON '{table}' (item_timestamp)"
+)
+
+
+class SharedRateLimitState:
+    """Rate-limit budget and reset gate shared by every process using ``path``.
+
+    Pass one to ``KatanaClient(shared_rate_limit=...)`` (or just the path), or
+    to ``RateLimitTransport(shared_state=...)`` directly. All methods are
+    synchronous — the transport runs them in a worker thread — and each runs
+    at most one short SQLite transaction; they are safe to call from any
+    number of threads and processes at once.
+
+    Args:
+        path: SQLite database file (``~`` is expanded). Created, with its parent
+            directory, if missing. A ``<path>.lock`` file is created beside it.
+        requests_per_minute: Budget for this scope. Every process sharing the
+            scope should use the same value.
+        scope: Identifies the budget within the file, typically the API key.
+            Only a hash of it is stored.
+
+    Raises:
+        ValueError: If ``requests_per_minute`` is not positive.
+        ImportError: If ``filelock`` is not installed.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        requests_per_minute: int = 60,
+        scope: str = "katana",
+    ) -> None:
+        if requests_per_minute <= 0:
+            msg = f"requests_per_minute must be positive, got {requests_per_minute}"
+            raise ValueError(msg)
+        if importlib.util.find_spec("filelock") is None:
+            msg = (
+                "Shared rate limiting requires the 'filelock' package. "
+                f"Install it with: {_SHARED_RATE_LIMIT_HINT}"
+            )
+            raise ImportError(msg)
+
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.requests_per_minute = requests_per_minute
+        self._scope_key = hashlib.sha256(scope.encode()).hexdigest()[:16]
+        self._bucket_table = f"rate_bucket_{self._scope_key}"
+
+        # Autocommit mode: every method opens its own ``BEGIN IMMEDIATE``
+        # transaction so a read-modify-write can't interleave with another
+        # process's. The lock keeps threads from interleaving statements on
+        # the one connection.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, isolation_level=None, check_same_thread=False, timeout=30.0
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_CREATE_STATE_TABLE)
+        self._create_bucket_table(self._bucket_table)
+        self._conn.execute(
+            "INSERT OR IGNORE INTO rate_limit_state VALUES (?, ?, NULL)",
+            (self._scope_key, requests_per_minute),
+        )
+
+    def open_bucket(
+        self, *, lane: str | None = None, requests_per_minute: int | None = None
+    ) -> SQLiteBucket:
+        """Return a file-locked pyrate bucket over this scope's shared token log.
+
+        Each call opens a new connection; the caller (a ``Limiter``) owns it.
+
+        Args:
+            lane: Name of a separate token log within the scope, e.g.
+                ``"bulk"`` for ``RateLimitTransport``'s bulk-priority cap.
+                ``None`` is the scope's main budget.
+            requests_per_minute: Rate for ``lane``; defaults to the scope's.
+        """
+        table = self._bucket_table
+        if lane is not None:
+            if not lane.isidentifier():
+                msg = f"lane must be a valid identifier, got {lane!r}"
+                raise ValueError(msg)
+            table = f"{table}_{lane}"
+            self._create_bucket_table(table)
+        conn = sqlite3.connect(
+            self.path, isolation_level="DEFERRED", check_same_thread=False
+        )
+        return SQLiteBucket(
+            [Rate(requests_per_minute or self.requests_per_minute, Duration.MINUTE)],
+            conn,
+            table=table,
+            lock=_FileLock(f"{self.path}.lock"),
+        )
+
+    def debit(self) -> int:
+        """Spend one unit of the shared estimate; return the new estimate."""
+        with self._transaction() as cur:
+            cur.execute(
+                "UPDATE rate_limit_state "
+                "SET estimated_remaining = MAX(0, estimated_remaining - 1) "
+                "WHERE scope = ?",
+                (self._scope_key,),
+            )
+            return self._read(cur)[0]
+
+    def sync_down(self, remaining: int) -> int:
+        """Lower the shared estimate to the server's ``remaining``.
+
+        Returns how many tokens the caller should drain from the bucket —
+        zero when the estimate is already at or below ``remaining``, e.g.
+        because another process synced down for the same response window.
+        """
+        with self._transaction() as cur:
+            reset_until = self._reset_until(cur)
+            estimate, _ = self._read(cur)
+            if not 0 < remaining < estimate:
+                return 0
+            self._write(cur, remaining, reset_until)
+            return estimate - remaining
+
+    def engage_reset(self, reset_epoch_ms: int) -> bool:
+        """Close the shared reset gate until ``reset_epoch_ms``.
+
+        Keeps an already-recorded *later* deadline. Returns ``True`` when
+        ``reset_epoch_ms`` became the shared deadline.
+        """
+        with self._transaction() as cur:
+            current = self._reset_until(cur)
+            if current is not None and reset_epoch_ms <= current:
+                return False
+            self._write(cur, 0, reset_epoch_ms)
+            return True
+
+    def reset_until_ms(self) -> int | None:
+        """Return the active shared reset deadline, or ``None`` if the gate is open.
+
+        A plain read, checked before every request; only a gate whose deadline
+        has passed takes the write transaction that rolls it.
+        """
+        with self._lock:
+            cur = self._conn.cursor()
+            try:
+                _, reset_until = self._read(cur)
+            finally:
+                cur.close()
+        if reset_until is None or reset_until > int(time.time() * 1000):
+            return reset_until
+        with self._transaction() as cur:
+            return self._reset_until(cur)
+
+    def release_reset(self, deadline_epoch_ms: int) -> int:
+        """Reopen the shared gate if it is still closed for ``deadline_epoch_ms``.
+
+        Returns the shared estimate afterwards. A later deadline recorded by
+        another process is left in place.
+        """
+        with self._transaction() as cur:
+            _, reset_until = self._read(cur)
+            if reset_until is not None and reset_until <= deadline_epoch_ms:
+                self._write(cur, self.requests_per_minute, None)
+            return self._read(cur)[0]
+
+    def close(self) -> None:
+        """Close the state connection. Buckets from ``open_bucket`` close with their limiter."""
+        with self._lock:
+            self._conn.close()
+
+    def _create_bucket_table(self, table: str) -> None:
+        self._conn.execute(_CREATE_BUCKET_TABLE.format(table=table))
+        self._conn.execute(_CREATE_BUCKET_INDEX.format(table=table))
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Run one ``BEGIN IMMEDIATE`` transaction, committing on success."""
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                yield cur
+            except BaseException:
+                cur.execute("ROLLBACK")
+                raise
+            else:
+                cur.execute("COMMIT")
+            finally:
+                cur.close()
+
+    def _read(self, cur: sqlite3.Cursor) -> tuple[int, int | None]:
+        cur.execute(
+            "SELECT estimated_remaining, reset_until_ms FROM rate_limit_state "
+            "WHERE scope = ?",
+            (self._scope_key,),
+        )
+        estimate, reset_until = cur.fetchone()
+        return estimate, reset_until
+
+    def _write(
+        self, cur: sqlite3.Cursor, estimate: int, reset_until_ms: int | None
+    ) -> None:
+        cur.execute(
+            "UPDATE rate_limit_state "
+            "SET estimated_remaining = ?, reset_until_ms = ? WHERE scope = ?",
+            (estimate, reset_until_ms, self._scope_key),
+        )
+
+    def _reset_until(self, cur: sqlite3.Cursor) -> int | None:
+        """Return the live deadline, reopening a gate whose deadline has passed.
+
+        The process that engaged a gate normally releases it from its timer,
+        but it may have exited first; whoever reads the state after the
+        deadline rolls the window instead, so a crashed process can't leave
+        the estimate pinned at zero.
+        """
+        _, reset_until = self._read(cur)
+        if reset_until is not None and reset_until <= int(time.time() * 1000):
+            self._write(cur, self.requests_per_minute, None)
+            return None
+        return reset_until
+
+
+class _FileLock:
+    """``threading.Lock``-style adapter over ``filelock.FileLock``.
+
+    pyrate-limiter acquires a bucket's lock with ``lock.acquire(False)`` for
+    non-blocking calls (our sync-down drain), but ``FileLock.acquire``'s first
+    positional parameter is ``timeout``, which filelock 4 rejects as a bool.
+    This is also why ``SQLiteBucket.init_from_file(use_file_lock=True)`` is
+    not used above.
+    """
+
+    def __init__(self, path: str) -> None:
+        from filelock import FileLock, Timeout
+
+        self._lock = FileLock(path)
+        self._timeout_error = Timeout
+
+    def acquire(self, blocking: bool = True, timeout: float | None = -1) -> bool:
+        if not blocking:
+            timeout = 0
+        try:
+            self._lock.acquire(timeout=-1 if timeout is None else timeout)
+        except self._timeout_error:
+            return False
+        return True
+
+    def release(self) -> None:
+        self._lock.release()
+
+    def __enter__(self) -> "_FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.release()
+
+
+__all__ = ["SharedRateLimitState"]
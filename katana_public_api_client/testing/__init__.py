@@ -18,7 +18,7 @@ from typing import Any
 
 from dotenv import dotenv_values
 
-from .katana_client import KatanaClient
+from ..katana_client import KatanaClient
 
 __all__ = ["MissingTestCredentialsError", "make_test_client"]
 
@@ -0,0 +1,906 @@
+"""A local stand-in for the Katana API, for load tests and benchmarks.
+
+``MockTransport`` fixtures with hand-written responses can't exercise
+concurrency, deep pagination or rate limiting at scale. :class:`FakeKatanaServer`
+serves every endpoint the MCP typed cache syncs from (products, materials,
+variants, services, customers, suppliers, locations, tax rates, operators,
+additional costs, the factory, sales/purchase/manufacturing orders and their
+rows, stock adjustments, stock transfers and bin transfers) out of a
+deterministic synthetic :class:`FakeDataset`, and behaves like Katana where it
+matters for throughput:
+
+- ``page`` / ``limit`` pagination with the ``X-Pagination`` header;
+- ``updated_at_min``, ``include_deleted``, ``include_archived``, ``ids`` and
+  ``extend=product_or_material`` filters;
+- a per-API-key sliding-window rate limit with ``X-Ratelimit-Limit`` /
+  ``-Remaining`` / ``-Reset`` on every response and ``429`` + ``Retry-After``
+  once the window is full;
+- detail GETs (``/products/7``) with an ``ETag`` that honours
+  ``If-None-Match``.
+
+Run it as a process and point any client at it::
+
+    python -m katana_public_api_client.testing.fake_server --size 5000 --port 8080
+    KATANA_BASE_URL=http://127.0.0.1:8080/v1 KATANA_API_KEY=anything ...
+
+or use it in-process as the client's base transport, with no sockets::
+
+    server = FakeKatanaServer(FakeDataset(size=5000))
+    async with KatanaClient(
+        api_key="anything",
+        base_url="http://katana.test/v1",
+        base_transport=server,
+    ) as client:
+        ...
+
+Only reads are served; writes get ``405``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import math
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Sequence
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import httpx
+
+from ..json_codec import resolve_json_codec
+
+__all__ = [
+    "DEFAULT_PAGE_LIMIT",
+    "MAX_PAGE_LIMIT",
+    "FakeDataset",
+    "FakeKatanaServer",
+    "main",
+]
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 250
+
+_RATE_LIMIT_WINDOW_SECONDS = 60.0
+_API_PREFIX = "/v1"
+_SINGLETONS = frozenset({"/factory"})
+_ARCHIVABLE = frozenset({"/products", "/materials", "/services"})
+
+Record = dict[str, Any]
+
+
+def _timestamp(moment: datetime) -> str:
+    """Katana's timestamp format; fixed-width, so strings sort chronologically."""
+    return (
+        moment.astimezone(UTC).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+    )
+
+
+def _flag(params: httpx.QueryParams, name: str) -> bool:
+    return params.get(name, "").lower() == "true"
+
+
+def _error(status: int, name: str, message: str) -> Record:
+    return {"statusCode": status, "name": name, "message": message}
+
+
+class FakeDataset:
+    """Deterministic synthetic Katana tenant.
+
+    ``size`` sets the row count of the big collections (products, materials,
+    customers and each kind of order); smaller ones scale with it and
+    reference data (locations, tax rates, operators, additional costs) stays
+    fixed. Every foreign key points at a record that exists. ``updated_at``
+    values are spread over ``span`` ending at ``end``, a ``deleted_fraction``
+    of records carry a ``deleted_at`` tombstone and an ``archived_fraction``
+    of products/materials/services an ``archived_at``. The same ``size`` and
+    ``seed`` always produce the same data.
+
+    Args:
+        size: Rows in each large collection. Defaults to 1,000.
+        seed: Random seed. Defaults to 0.
+        deleted_fraction: Share of records soft-deleted. Defaults to 0.02.
+        archived_fraction: Share of catalog items archived. Defaults to 0.05.
+        end: Latest ``updated_at`` in the data. Defaults to now.
+        span: How far back ``updated_at`` values reach. Defaults to 365 days.
+
+    Raises:
+        ValueError: If ``size`` is not positive or a fraction is outside
+            ``[0, 1]``.
+    """
+
+    def __init__(
+        self,
+        size: int = 1000,
+        *,
+        seed: int = 0,
+        deleted_fraction: float = 0.02,
+        archived_fraction: float = 0.05,
+        end: datetime | None = None,
+        span: timedelta = timedelta(days=365),
+    ) -> None:
+        if size < 1:
+            msg = f"size must be positive, got {size}"
+            raise ValueError(msg)
+        for name, fraction in (
+            ("deleted_fraction", deleted_fraction),
+            ("archived_fraction", archived_fraction),
+        ):
+            if not 0.0 <= fraction <= 1.0:
+                msg = f"{name} must be between 0 and 1, got {fraction}"
+                raise ValueError(msg)
+        self.size = size
+        self._rng = random.Random(seed)
+        self._deleted_fraction = deleted_fraction
+        self._archived_fraction = archived_fraction
+        self._end = end if end is not None else datetime.now(tz=UTC)
+        self._span = span
+        self.collections: dict[str, list[Record]] = {}
+        self._index: dict[str, dict[int, Record]] = {}
+        self._generate()
+
+    @property
+    def paths(self) -> list[str]:
+        """Every endpoint path the dataset serves, e.g. ``"/products"``."""
+        return sorted(self.collections)
+
+    def records(self, path: str) -> list[Record]:
+        """All records at ``path`` (including deleted/archived), ordered by id.
+
+        Raises:
+            KeyError: If the dataset has no collection at ``path``.
+        """
+        return self.collections[path]
+
+    def get(self, path: str, record_id: int) -> Record | None:
+        """The record with ``record_id`` at ``path``, if any."""
+        return self._index.get(path, {}).get(record_id)
+
+    def touch(
+        self, path: str, count: int = 1, *, now: datetime | None = None
+    ) -> list[int]:
+        """Bump ``updated_at`` on ``count`` random records, simulating edits.
+
+        Returns the ids touched, so an incremental sync after this call
+        (``updated_at_min`` = the previous sync) sees exactly these rows.
+        """
+        stamp = _timestamp(now if now is not None else datetime.now(tz=UTC))
+        candidates = [r for r in self.records(path) if "id" in r]
+        touched = self._rng.sample(candidates, min(count, len(candidates)))
+        for record in touched:
+            record["updated_at"] = stamp
+        return sorted(record["id"] for record in touched)
+
+    # -- generation ---------------------------------------------------------
+
+    def _generate(self) -> None:
+        size = self.size
+        minor = max(1, size // 10)
+        half = max(1, size // 2)
+
+        locations = self._add("/locations", 3, self._location, deletable=False)
+        tax_rates = self._add("/tax_rates", 3, self._tax_rate, deletable=False)
+        self._add("/operators", 5, self._operator, deletable=False)
+        self._add("/additional_costs", 3, self._additional_cost, deletable=False)
+        suppliers = self._add("/suppliers", minor, self._supplier)
+        customers = self._add("/customers", size, self._customer)
+        products = self._add("/products", size, self._item("product"))
+        materials = self._add("/materials", size, self._item("material"))
+        services = self._add("/services", minor, self._service)
+
+        variants: list[Record] = []
+        for parent in [*products, *materials]:
+            kind = parent["type"]
+            for _ in range(1 + (parent["id"] % 4 == 0)):
+                variant = self._variant(len(variants) + 1, parent, kind)
+                parent["variants"].append(variant)
+                variants.append(variant)
+        for service in services:
+            variant = self._variant(len(variants) + 1, service, "service")
+            variant["service_id"] = service["id"]
+            service["variants"].append(variant)
+            variants.append(variant)
+        self._store("/variants", variants)
+        self.collections["/factory"] = [self._factory(locations)]
+
+        ctx = {
+            "locations": [r["id"] for r in locations],
+            "tax_rates": [r["id"] for r in tax_rates],
+            "suppliers": [r["id"] for r in suppliers],
+            "customers": [r["id"] for r in customers],
+            "variants": [
+                v["id"] for v in variants if v["type"] in ("product", "material")
+            ],
+        }
+        self._orders("/sales_orders", "/sales_order_rows", size, self._sales_order, ctx)
+        self._orders(
+            "/purchase_orders",
+            "/purchase_order_rows",
+            size,
+            self._purchase_order,
+            ctx,
+        )
+        manufacturing_orders = self._add(
+            "/manufacturing_orders", size, lambda i: self._manufacturing_order(i, ctx)
+        )
+        recipe_rows = [
+            self._recipe_row(len(manufacturing_orders) * j + mo["id"], mo, ctx)
+            for mo in manufacturing_orders
+            for j in range(2)
+        ]
+        recipe_rows.sort(key=lambda row: row["id"])
+        self._store("/manufacturing_order_recipe_rows", recipe_rows)
+        self._add("/stock_adjustments", half, lambda i: self._stock_adjustment(i, ctx))
+        self._add("/stock_transfers", half, lambda i: self._stock_transfer(i, ctx))
+        self._add("/bin_transfers", minor, lambda i: self._bin_transfer(i, ctx))
+
+    def _add(
+        self,
+        path: str,
+        count: int,
+        factory: Callable[[int], Record],
+        *,
+        deletable: bool = True,
+    ) -> list[Record]:
+        records = []
+        for record_id in range(1, count + 1):
+            record = factory(record_id)
+            self._stamp(record, deletable=deletable)
+            if path in _ARCHIVABLE:
+                record["archived_at"] = (
+                    record["updated_at"]
+                    if self._rng.random() < self._archived_fraction
+                    else None
+                )
+            records.append(record)
+        self._store(path, records)
+        return records
+
+    def _store(self, path: str, records: list[Record]) -> None:
+        self.collections[path] = records
+        self._index[path] = {record["id"]: record for record in records}
+
+    def _stamp(self, record: Record, *, deletable: bool = True) -> None:
+        updated = self._end - self._span * self._rng.random()
+        created = updated - timedelta(days=30 * self._rng.random())
+        record["created_at"] = _timestamp(created)
+        record["updated_at"] = _timestamp(updated)
+        if deletable:
+            deleted = self._rng.random() < self._deleted_fraction
+            record["deleted_at"] = record["updated_at"] if deleted else None
+
+    def _orders(
+        self,
+        path: str,
+        rows_path: str,
+        count: int,
+        factory: Callable[[int, dict[str, list[int]]], Record],
+        ctx: dict[str, list[int]],
+    ) -> None:
+        """Generate orders with nested rows, also served flat at ``rows_path``."""
+        rows_field = f"{path.strip('/').removesuffix('s')}_rows"
+        fk_field = f"{path.strip('/').removesuffix('s')}_id"
+        orders = self._add(path, count, lambda i: factory(i, ctx))
+        all_rows: list[Record] = []
+        for order in orders:
+            rows = order.pop("_rows")
+            for row in rows:
+                row["id"] = len(all_rows) + 1
+                row[fk_field] = order["id"]
+                self._stamp(row)
+                all_rows.append(row)
+            order[rows_field] = [row for row in rows if row["deleted_at"] is None]
+            order["total"] = round(sum(row["total"] for row in order[rows_field]), 2)
+            order["total_in_base_currency"] = order["total"]
+        self._store(rows_path, all_rows)
+
+    def _price(self, low: float = 1.0, high: float = 500.0) -> float:
+        return round(self._rng.uniform(low, high), 2)
+
+    def _line(
+        self, ctx: dict[str, list[int]], *, decimal_price: bool = False
+    ) -> Record:
+        """An order line; sales order rows carry ``price_per_unit`` as a decimal string."""
+        quantity = self._rng.randint(1, 50)
+        price = self._price()
+        return {
+            "quantity": quantity,
+            "variant_id": self._rng.choice(ctx["variants"]),
+            "tax_rate_id": self._rng.choice(ctx["tax_rates"]),
+            "price_per_unit": f"{price:.10f}" if decimal_price else price,
+            "price_per_unit_in_base_currency": price,
+            "total": round(quantity * price, 2),
+            "total_in_base_currency": round(quantity * price, 2),
+        }
+
+    # -- record factories ---------------------------------------------------
+
+    def _location(self, i: int) -> Record:
+        return {
+            "id": i,
+            "name": f"Warehouse {i}",
+            "legal_name": f"Warehouse {i} LLC",
+            "is_primary": i == 1,
+            "sales_allowed": True,
+            "purchase_allowed": True,
+            "manufacturing_allowed": i != 3,
+        }
+
+    def _tax_rate(self, i: int) -> Record:
+        rate = (0.0, 5.0, 20.0)[(i - 1) % 3]
+        return {
+            "id": i,
+            "name": f"VAT {rate:g}%",
+            "rate": rate,
+            "is_default_sales": i == 3,
+            "is_default_purchases": i == 2,
+            "display_name": f"VAT ({rate}%)",
+        }
+
+    def _operator(self, i: int) -> Record:
+        return {"id": i, "operator_name": f"Operator {i}"}
+
+    def _additional_cost(self, i: int) -> Record:
+        name = ("Shipping Cost", "Import Duty", "Handling Fee")[(i - 1) % 3]
+        return {"id": i, "name": name}
+
+    def _supplier(self, i: int) -> Record:
+        return {
+            "id": i,
+            "name": f"Supplier {i} Ltd",
+            "email": f"orders@supplier{i}.example",
+            "phone": f"+1-555-{i % 10000:04d}",
+            "currency": "USD",
+            "comment": None,
+            "default_address_id": None,
+        }
+
+    def _customer(self, i: int) -> Record:
+        first = self._rng.choice(("Ada", "Grace", "Alan", "Edsger", "Barbara"))
+        last = self._rng.choice(("Lovelace", "Hopper", "Turing", "Liskov", "Knuth"))
+        return {
+            "id": i,
+            "name": f"{first} {last} #{i}",
+            "first_name": first,
+            "last_name": last,
+            "company": f"Customer {i} Inc",
+            "email": f"customer{i}@example.com",
+            "phone": f"+1-555-{i % 10000:04d}",
+            "comment": None,
+            "currency": "USD",
+            "reference_id": f"CUST-{i:06d}",
+            "category": self._rng.choice(("Retail", "Wholesale", "Online")),
+            "discount_rate": self._rng.choice((0.0, 0.0, 5.0)),
+            "default_billing_id": None,
+            "default_shipping_id": None,
+        }
+
+    def _item(self, kind: str) -> Callable[[int], Record]:
+        def build(i: int) -> Record:
+            record: Record = {
+                "id": i,
+                "name": f"{kind.title()} {i}",
+                "type": kind,
+                "uom": self._rng.choice(("pcs", "kg", "m", "set")),
+                "category_name": f"Category {i % 12}",
+                "is_sellable": kind == "product",
+                "default_supplier_id": None,
+                "additional_info": None,
+                "batch_tracked": i % 7 == 0,
+                "purchase_uom": None,
+                "purchase_uom_conversion_rate": None,
+                "variants": [],
+                "configs": [],
+            }
+            if kind == "product":
+                record["is_producible"] = True
+                record["is_purchasable"] = i % 3 == 0
+            return record
+
+        return build
+
+    def _service(self, i: int) -> Record:
+        return {
+            "id": i,
+            "name": f"Service {i}",
+            "uom": "hours",
+            "category_name": "Services",
+            "is_sellable": True,
+            "type": "service",
+            "additional_info": None,
+            "variants": [],
+        }
+
+    def _variant(self, i: int, parent: Record, kind: str) -> Record:
+        variant: Record = {
+            "id": i,
+            "sku": f"{kind[:3].upper()}-{parent['id']:06d}-{i:06d}",
+            "sales_price": self._price() if kind != "material" else None,
+            "purchase_price": self._price() if kind != "service" else None,
+            "product_id": parent["id"] if kind == "product" else None,
+            "material_id": parent["id"] if kind == "material" else None,
+            "type": kind,
+            "internal_barcode": None,
+            "registered_barcode": f"{i:012d}" if i % 5 == 0 else None,
+            "supplier_item_codes": [f"SUP-{i:06d}"] if kind == "material" else [],
+            "lead_time": self._rng.randint(1, 14),
+            "minimum_order_quantity": 1,
+            "config_attributes": [
+                {"config_name": "Size", "config_value": self._rng.choice("SML")}
+            ],
+            "created_at": parent["created_at"],
+            "updated_at": parent["updated_at"],
+            "deleted_at": parent["deleted_at"],
+        }
+        return variant
+
+    def _factory(self, locations: Sequence[Record]) -> Record:
+        return {
+            "display_name": "Fake Factory",
+            "legal_name": "Fake Factory OÜ",
+            "base_currency_code": "USD",
+            "legal_address": {
+                "line_1": "1 Test Street",
+                "line_2": None,
+                "city": "Tallinn",
+                "state": None,
+                "zip": "10111",
+                "country": "Estonia",
+            },
+            "default_manufacturing_location_id": locations[0]["id"],
+            "default_purchases_location_id": locations[0]["id"],
+            "default_sales_location_id": locations[0]["id"],
+        }
+
+    def _sales_order(self, i: int, ctx: dict[str, list[int]]) -> Record:
+        return {
+            "id": i,
+            "customer_id": self._rng.choice(ctx["customers"]),
+            "order_no": f"SO-{i:06d}",
+            "location_id": self._rng.choice(ctx["locations"]),
+            "status": self._rng.choice(
+                ("NOT_SHIPPED", "PENDING", "PACKED", "DELIVERED")
+            ),
+            "source": "API",
+            "currency": "USD",
+            "conversion_rate": 1.0,
+            "additional_info": None,
+            "customer_ref": None,
+            "_rows": [
+                self._line(ctx, decimal_price=True)
+                for _ in range(self._rng.randint(1, 3))
+            ],
+        }
+
+    def _purchase_order(self, i: int, ctx: dict[str, list[int]]) -> Record:
+        outsourced = i % 5 == 0
+        location = self._rng.choice(ctx["locations"])
+        record: Record = {
+            "id": i,
+            "status": self._rng.choice(
+                ("NOT_RECEIVED", "PARTIALLY_RECEIVED", "RECEIVED")
+            ),
+            "order_no": f"PO-{i:06d}",
+            "entity_type": "outsourced" if outsourced else "regular",
+            "supplier_id": self._rng.choice(ctx["suppliers"]),
+            "currency": "USD",
+            "location_id": location,
+            "billing_status": "NOT_BILLED",
+            "additional_info": None,
+            "tracking_location_id": location if outsourced else None,
+            "_rows": [self._line(ctx) for _ in range(self._rng.randint(1, 3))],
+        }
+        return record
+
+    def _manufacturing_order(self, i: int, ctx: dict[str, list[int]]) -> Record:
+        planned = self._rng.randint(1, 100)
+        return {
+            "id": i,
+            "status": self._rng.choice(
+                ("NOT_STARTED", "IN_PROGRESS", "BLOCKED", "DONE")
+            ),
+            "order_no": f"MO-{i:06d}",
+            "variant_id": self._rng.choice(ctx["variants"]),
+            "planned_quantity": planned,
+            "actual_quantity": self._rng.randint(0, planned),
+            "location_id": self._rng.choice(ctx["locations"]),
+            "additional_info": None,
+            "is_linked_to_sales_order": False,
+            "total_cost": self._price(10.0, 5000.0),
+        }
+
+    def _recipe_row(
+        self, i: int, manufacturing_order: Record, ctx: dict[str, list[int]]
+    ) -> Record:
+        row = {
+            "id": i,
+            "manufacturing_order_id": manufacturing_order["id"],
+            "variant_id": self._rng.choice(ctx["variants"]),
+            "notes": None,
+            "planned_quantity_per_unit": f"{self._rng.uniform(0.1, 5):.10f}",
+            "total_actual_quantity": f"{self._rng.uniform(0, 100):.10f}",
+            "ingredient_availability": "IN_STOCK",
+            "cost": f"{self._price():.10f}",
+        }
+        self._stamp(row)
+        return row
+
+    def _stock_adjustment(self, i: int, ctx: dict[str, list[int]]) -> Record:
+        return {
+            "id": i,
+            "stock_adjustment_number": f"SA-{i}",
+            "location_id": self._rng.choice(ctx["locations"]),
+            "reason": "Cycle count",
+            "additional_info": None,
+            "stock_adjustment_rows": [
+                {
+                    "id": i * 10 + j,
+                    "variant_id": self._rng.choice(ctx["variants"]),
+                    "quantity": self._rng.randint(-20, 20) or 1,
+                    "cost_per_unit": self._price(),
+                }
+                for j in range(self._rng.randint(1, 2))
+            ],
+        }
+
+    def _stock_transfer(self, i: int, ctx: dict[str, list[int]]) -> Record:
+        source, target = self._rng.sample(ctx["locations"], 2)
+        return {
+            "id": i,
+            "stock_transfer_number": f"ST-{i}",
+            "source_location_id": source,
+            "target_location_id": target,
+            "status": self._rng.choice(("draft", "inTransit", "received")),
+            "additional_info": None,
+            "stock_transfer_rows": [
+                {
+                    "id": i * 10 + j,
+                    "variant_id": self._rng.choice(ctx["variants"]),
+                    "quantity": self._rng.randint(1, 20),
+                    "cost_per_unit": self._price(),
+                }
+                for j in range(self._rng.randint(1, 2))
+            ],
+        }
+
+    def _bin_transfer(self, i: int, ctx: dict[str, list[int]]) -> Record:
+        return {
+            "id": i,
+            "bin_transfer_number": f"BT-{i}",
+            "location_id": self._rng.choice(ctx["locations"]),
+            "status": self._rng.choice(("CREATED", "IN_TRANSIT", "DONE")),
+            "additional_info": None,
+            "bin_transfer_rows": [
+                {
+                    "id": i * 10 + j,
+                    "bin_transfer_id": i,
+                    "variant_id": self._rng.choice(ctx["variants"]),
+                    "quantity": f"{self._rng.randint(1, 20)}.0000000000",
+                }
+                for j in range(self._rng.randint(1, 2))
+            ],
+        }
+
+
+class _SlidingWindow:
+    """Per-API-key request log enforcing ``limit`` requests per rolling window."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self._log: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def admit(self, key: str, now: float) -> tuple[bool, int, float]:
+        """Record a request; return ``(allowed, remaining, reset_at)``."""
+        with self._lock:
+            log = self._log.setdefault(key, deque())
+            while log and log[0] <= now - _RATE_LIMIT_WINDOW_SECONDS:
+                log.popleft()
+            allowed = len(log) < self.limit
+            if allowed:
+                log.append(now)
+            reset_at = (log[0] if log else now) + _RATE_LIMIT_WINDOW_SECONDS
+            return allowed, self.limit - len(log), reset_at
+
+
+class FakeKatanaServer(httpx.AsyncBaseTransport):
+    """Serve a :class:`FakeDataset` the way the Katana API would.
+
+    Usable in-process as an httpx transport (``KatanaClient(base_transport=
+    server)`` keeps the client's full resilience chain) or over HTTP with
+    :meth:`serve` / ``python -m katana_public_api_client.testing.fake_server``.
+
+    Args:
+        dataset: Data to serve. Defaults to ``FakeDataset()``.
+        requests_per_minute: Requests each API key may make per rolling
+            60-second window before getting ``429``. Defaults to 60, Katana's
+            documented limit. ``None`` disables rate limiting and its headers.
+        latency: Seconds to wait before answering each request, to model
+            network and server time. Defaults to 0.
+        clock: Wall clock in epoch seconds, used for the rate-limit window
+            and ``X-Ratelimit-Reset``. Defaults to :func:`time.time`.
+
+    Attributes:
+        requests: Requests answered, including rejected ones.
+        rate_limited: Requests answered with ``429``.
+    """
+
+    def __init__(
+        self,
+        dataset: FakeDataset | None = None,
+        *,
+        requests_per_minute: int | None = 60,
+        latency: float = 0.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if requests_per_minute is not None and requests_per_minute < 1:
+            msg = f"requests_per_minute must be positive, got {requests_per_minute}"
+            raise ValueError(msg)
+        if latency < 0:
+            msg = f"latency must not be negative, got {latency}"
+            raise ValueError(msg)
+        self.dataset = dataset if dataset is not None else FakeDataset()
+        self.latency = latency
+        self._clock = clock
+        self._window = (
+            _SlidingWindow(requests_per_minute)
+            if requests_per_minute is not None
+            else None
+        )
+        self._codec = resolve_json_codec("auto")
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.rate_limited = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer ``request`` after the configured latency."""
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self.respond(request)
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        """Answer ``request`` synchronously, without the simulated latency."""
+        with self._stats_lock:
+            self.requests += 1
+        headers: dict[str, str] = {}
+        authorization = request.headers.get("Authorization", "")
+        if not authorization.strip():
+            return self._json(
+                request, 401, _error(401, "UnauthorizedError", "Unauthorized"), headers
+            )
+
+        if self._window is not None:
+            now = self._clock()
+            allowed, remaining, reset_at = self._window.admit(authorization, now)
+            headers["X-Ratelimit-Limit"] = str(self._window.limit)
+            headers["X-Ratelimit-Remaining"] = str(remaining)
+            headers["X-Ratelimit-Reset"] = str(int(reset_at * 1000))
+            if not allowed:
+                with self._stats_lock:
+                    self.rate_limited += 1
+                headers["Retry-After"] = str(max(1, math.ceil(reset_at - now)))
+                return self._json(
+                    request,
+                    429,
+                    _error(429, "TooManyRequests", "Too many requests"),
+                    headers,
+                )
+
+        if request.method != "GET":
+            return self._json(
+                request,
+                405,
+                _error(405, "MethodNotAllowed", "The fake server is read-only"),
+                headers,
+            )
+
+        path = request.url.path.rstrip("/").removeprefix(_API_PREFIX) or "/"
+        if path in _SINGLETONS:
+            return self._json(request, 200, self.dataset.records(path)[0], headers)
+        if path in self.dataset.collections:
+            return self._list(request, path, headers)
+        collection, _, record_id = path.rpartition("/")
+        if collection in self.dataset.collections and record_id.isdigit():
+            record = self.dataset.get(collection, int(record_id))
+            if record is not None:
+                return self._detail(request, record, headers)
+        return self._json(
+            request, 404, _error(404, "NotFoundError", "Not found"), headers
+        )
+
+    def _list(
+        self, request: httpx.Request, path: str, headers: dict[str, str]
+    ) -> httpx.Response:
+        params = request.url.params
+        try:
+            page = int(params.get("page", "1"))
+            limit = int(params.get("limit", str(DEFAULT_PAGE_LIMIT)))
+            updated_at_min = params.get("updated_at_min")
+            since = (
+                _timestamp(datetime.fromisoformat(updated_at_min))
+                if updated_at_min
+                else None
+            )
+            ids = {
+                int(value)
+                for raw in params.get_list("ids")
+                for value in raw.split(",")
+                if value
+            }
+        except ValueError as e:
+            return self._json(
+                request,
+                422,
+                _error(422, "UnprocessableEntityError", str(e)),
+                headers,
+            )
+        if page < 1 or not 1 <= limit <= MAX_PAGE_LIMIT:
+            return self._json(
+                request,
+                422,
+                _error(
+                    422,
+                    "UnprocessableEntityError",
+                    f"page must be >= 1 and limit between 1 and {MAX_PAGE_LIMIT}",
+                ),
+                headers,
+            )
+
+        include_deleted = _flag(params, "include_deleted")
+        include_archived = _flag(params, "include_archived")
+        matches = [
+            record
+            for record in self.dataset.records(path)
+            if (include_deleted or record.get("deleted_at") is None)
+            and (include_archived or record.get("archived_at") is None)
+            and (since is None or record["updated_at"] >= since)
+            and (not ids or record["id"] in ids)
+        ]
+        total_pages = math.ceil(len(matches) / limit)
+        offset = (page - 1) * limit
+        data = matches[offset : offset + limit]
+        extend = {
+            value for raw in params.get_list("extend") for value in raw.split(",")
+        }
+        if path == "/variants" and "product_or_material" in extend:
+            data = [self._with_parent(variant) for variant in data]
+
+        headers["X-Pagination"] = self._codec.dumps(
+            {
+                "total_records": str(len(matches)),
+                "total_pages": str(total_pages),
+                "offset": str(offset),
+                "page": str(page),
+                "first_page": str(page == 1).lower(),
+                "last_page": str(page >= total_pages).lower(),
+            }
+        ).decode()
+        return self._json(request, 200, {"data": data}, headers)
+
+    def _with_parent(self, variant: Record) -> Record:
+        parent_id = variant["product_id"] or variant["material_id"]
+        collection = "/products" if variant["product_id"] else "/materials"
+        parent = self.dataset.get(collection, parent_id) if parent_id else None
+        if parent is None:
+            return variant
+        return {
+            **variant,
+            "product_or_material": {k: v for k, v in parent.items() if k != "variants"},
+        }
+
+    def _detail(
+        self, request: httpx.Request, record: Record, headers: dict[str, str]
+    ) -> httpx.Response:
+        etag = f'"{record["id"]}-{record["updated_at"]}"'
+        headers["ETag"] = etag
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers=headers, request=request)
+        return self._json(request, 200, record, headers)
+
+    def _json(
+        self,
+        request: httpx.Request,
+        status: int,
+        payload: Any,
+        headers: dict[str, str],
+    ) -> httpx.Response:
+        return httpx.Response(
+            status,
+            headers={**headers, "Content-Type": "application/json"},
+            content=self._codec.dumps(payload),
+            request=request,
+        )
+
+    def make_http_server(
+        self, host: str = "127.0.0.1", port: int = 8080
+    ) -> ThreadingHTTPServer:
+        """Bind a threaded HTTP/1.1 server answering with this instance.
+
+        Pass ``port=0`` to pick a free port (read it back from
+        ``server_address``). Call ``serve_forever()`` on the result to run
+        it, and ``shutdown()`` to stop.
+        """
+        fake = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _answer(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                request = httpx.Request(
+                    self.command,
+                    f"http://{self.headers.get('Host', host)}{self.path}",
+                    headers=list(self.headers.items()),
+                    content=body,
+                )
+                if fake.latency:
+                    time.sleep(fake.latency)
+                response = fake.respond(request)
+                content = response.content
+                self.send_response(response.status_code)
+                for name, value in response.headers.items():
+                    if name.lower() != "content-length":
+                        self.send_header(name, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _answer
+
+            def log_message(self, format: str, *args: Any) -> None:
+                return
+
+        return ThreadingHTTPServer((host, port), _Handler)
+
+    def serve(self, host: str = "127.0.0.1", port: int = 8080) -> None:
+        """Serve over HTTP until interrupted."""
+        with self.make_http_server(host, port) as server:
+            bound_host, bound_port = server.server_address[:2]
+            print(
+                f"Fake Katana API serving {len(self.dataset.paths)} endpoints at "
+                f"http://{bound_host}:{bound_port}{_API_PREFIX}",
+                flush=True,
+            )
+            with contextlib.suppress(KeyboardInterrupt):
+                server.serve_forever()
+
+
+def main(argv: Iterable[str] | None = None) -> None:
+    """Command-line entry point: ``python -m ...testing.fake_server``."""
+    parser = argparse.ArgumentParser(
+        prog="python -m katana_public_api_client.testing.fake_server",
+        description="Serve a synthetic Katana tenant for load tests and benchmarks.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--size", type=int, default=1000, help="rows per large collection"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--requests-per-minute",
+        type=int,
+        default=60,
+        help="rate limit per API key; 0 disables it",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds added to each response"
+    )
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    server = FakeKatanaServer(
+        FakeDataset(size=args.size, seed=args.seed),
+        requests_per_minute=args.requests_per_minute or None,
+        latency=args.latency,
+    )
+    server.serve(args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
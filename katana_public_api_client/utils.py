@@ -11,33 +11,8 @@ from typing import TYPE_CHECKING, Any, Literal, NoReturn, overload
 
 from .client_types import Response, Unset
 from .domain.converters import unwrap_unset
-from .models.additional_properties_validation_error import (
-    AdditionalPropertiesValidationError,
-)
-from .models.const_validation_error import ConstValidationError
-from .models.dependencies_validation_error import DependenciesValidationError
 from .models.detailed_error_response import DetailedErrorResponse
-from .models.enum_validation_error import EnumValidationError
 from .models.error_response import ErrorResponse
-from .models.exclusive_maximum_validation_error import (
-    ExclusiveMaximumValidationError,
-)
-from .models.exclusive_minimum_validation_error import (
-    ExclusiveMinimumValidationError,
-)
-from .models.format_validation_error import FormatValidationError
-from .models.max_items_validation_error import MaxItemsValidationError
-from .models.max_length_validation_error import MaxLengthValidationError
-from .models.maximum_validation_error import MaximumValidationError
-from .models.min_items_validation_error import MinItemsValidationError
-from .models.min_length_validation_error import MinLengthValidationError
-from .models.minimum_validation_error import MinimumValidationError
-from .models.multiple_of_validation_error import MultipleOfValidationError
-from .models.one_of_validation_error import OneOfValidationError
-from .models.pattern_validation_error import PatternValidationError
-from .models.required_validation_error import RequiredValidationError
-from .models.type_validation_error import TypeValidationError
-from .models.unique_items_validation_error import UniqueItemsValidationError
 
 if TYPE_CHECKING:
     from .models.variant_response import VariantResponse
@@ -121,6 +96,28 @@ def _format_ajv_detail(detail: Any) -> str:
     match its declared schema (e.g. a future Ajv keyword we haven't typed yet,
     or a typed subtype where deserialization fell back to Generic).
     """
+    from .models import (
+        AdditionalPropertiesValidationError,
+        ConstValidationError,
+        DependenciesValidationError,
+        EnumValidationError,
+        ExclusiveMaximumValidationError,
+        ExclusiveMinimumValidationError,
+        FormatValidationError,
+        MaximumValidationError,
+        MaxItemsValidationError,
+        MaxLengthValidationError,
+        MinimumValidationError,
+        MinItemsValidationError,
+        MinLengthValidationError,
+        MultipleOfValidationError,
+        OneOfValidationError,
+        PatternValidationError,
+        RequiredValidationError,
+        TypeValidationError,
+        UniqueItemsValidationError,
+    )
+
     field = detail.path.lstrip("/") if hasattr(detail, "path") else "?"
 
     # ── String / format keywords ────────────────────────────────────────────
@@ -0,0 +1,88 @@
+"""Benchmark attrs <-> pydantic conversion throughput (``from_attrs`` / ``to_attrs``).
+
+Converts ``FakeDataset`` records — the same shapes the typed-cache sync
+handles — for three models of increasing nesting:
+
+- ``Variant``: flat, with list-valued custom fields and config attributes.
+- ``SalesOrder``: nested rows and addresses.
+- ``ManufacturingOrder``: flat, with many numeric and enum fields.
+
+For each it reports objects/sec for ``from_attrs`` (attrs -> pydantic, what a
+cold sync pays per row) and ``to_attrs`` (the way back), best of
+``--repeat`` timings after a warm-up conversion.
+
+Usage::
+
+    uv run poe benchmark-conversion
+    uv run python scripts/benchmark_conversion.py --size 2000 --repeat 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from katana_public_api_client import models, models_pydantic
+from katana_public_api_client.testing.fake_server import FakeDataset
+
+# (model name, FakeDataset collection)
+MODELS = (
+    ("Variant", "/variants"),
+    ("SalesOrder", "/sales_orders"),
+    ("ManufacturingOrder", "/manufacturing_orders"),
+)
+
+
+def benchmark_model(
+    dataset: FakeDataset, name: str, path: str, repeat: int
+) -> dict[str, float]:
+    """Return ``from_attrs`` / ``to_attrs`` objects per second for one model."""
+    attrs_class: Any = getattr(models, name)
+    pydantic_class: Any = getattr(models_pydantic, name)
+    attrs_objs = [attrs_class.from_dict(record) for record in dataset.records(path)]
+    pydantic_objs = [pydantic_class.from_attrs(obj) for obj in attrs_objs]
+    pydantic_objs[0].to_attrs()
+
+    def from_attrs() -> None:
+        for obj in attrs_objs:
+            pydantic_class.from_attrs(obj)
+
+    def to_attrs() -> None:
+        for obj in pydantic_objs:
+            obj.to_attrs()
+
+    count = len(attrs_objs)
+    return {
+        "objects": count,
+        "from_attrs": count / min(timeit.repeat(from_attrs, number=1, repeat=repeat)),
+        "to_attrs": count / min(timeit.repeat(to_attrs, number=1, repeat=repeat)),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark attrs <-> pydantic conversion throughput (from_attrs / to_attrs)"
+    )
+    parser.add_argument("--size", type=int, default=1000, help="FakeDataset size")
+    parser.add_argument("--repeat", type=int, default=5, help="timings per metric")
+    args = parser.parse_args()
+
+    dataset = FakeDataset(size=args.size, end=datetime(2026, 1, 1, tzinfo=UTC))
+
+    print(f"{'model':<20}{'objects':>9}{'from_attrs/s':>15}{'to_attrs/s':>13}")
+    for name, path in MODELS:
+        metrics = benchmark_model(dataset, name, path, args.repeat)
+        print(
+            f"{name:<20}{metrics['objects']:>9.0f}"
+            f"{metrics['from_attrs']:>15,.0f}{metrics['to_attrs']:>13,.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""Benchmark cold import and first-conversion cost of the client's model layers.
+
+Each scenario runs in a fresh interpreter, so nothing is cached between runs:
+
+- ``client``: ``import katana_public_api_client`` — what every user pays.
+- ``convert_variant``: builds an attrs ``Variant`` and converts it with
+  ``to_pydantic`` — a client-only user touching one pydantic model. Only the
+  ``_generated`` module defining it (and what it imports) is loaded and
+  registered.
+- ``full_registry``: registers every attrs <-> pydantic pair, as the typed
+  cache ends up doing. This is what importing ``models_pydantic`` cost before
+  registration became lazy.
+
+Per scenario it reports the median wall time of the scenario's statements
+(interpreter start-up excluded) and how many generated pydantic and attrs
+model modules ended up imported.
+
+Usage::
+
+    uv run poe benchmark-imports
+    uv run python scripts/benchmark_imports.py --repeat 9
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import textwrap
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PYDANTIC_PREFIX = "katana_public_api_client.models_pydantic._generated."
+ATTRS_PREFIX = "katana_public_api_client.models."
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    code: str
+
+
+SCENARIOS = (
+    Scenario("client", "import katana_public_api_client"),
+    Scenario(
+        "convert_variant",
+        """
+        from katana_public_api_client.models import Variant
+        from katana_public_api_client.models_pydantic.converters import to_pydantic
+
+        to_pydantic(Variant.from_dict({"id": 1, "sku": "S-1", "product_id": 2}))
+        """,
+    ),
+    Scenario(
+        "full_registry",
+        """
+        from katana_public_api_client.models_pydantic import list_registered_models
+
+        list_registered_models()
+        """,
+    ),
+)
+
+# Runs ``code`` in a fresh interpreter and reports its time and the modules it
+# left loaded as one JSON line
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec(compile({code!r}, "<scenario>", "exec"), {{}})
+seconds = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": seconds,
+    "pydantic_modules": sum(m.startswith({pydantic!r}) for m in sys.modules),
+    "attrs_modules": sum(m.startswith({attrs!r}) for m in sys.modules),
+}}))
+"""
+
+
+def run_scenario(scenario: Scenario) -> dict[str, float]:
+    """Run ``scenario`` once in a fresh interpreter and return its metrics."""
+    probe = _PROBE.format(
+        code=textwrap.dedent(scenario.code),
+        pydantic=PYDANTIC_PREFIX,
+        attrs=ATTRS_PREFIX,
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+        timeout=120,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def benchmark_scenario(scenario: Scenario, repeat: int) -> dict[str, float]:
+    """Return the median time (ms) and module counts over ``repeat`` runs."""
+    runs = [run_scenario(scenario) for _ in range(repeat)]
+    return {
+        "ms": statistics.median(run["seconds"] for run in runs) * 1000,
+        "pydantic_modules": runs[-1]["pydantic_modules"],
+        "attrs_modules": runs[-1]["attrs_modules"],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark cold import and first-conversion cost of the client's model layers"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="runs per scenario")
+    args = parser.parse_args()
+
+    results = {
+        scenario.name: benchmark_scenario(scenario, args.repeat)
+        for scenario in SCENARIOS
+    }
+
+    print(f"{'scenario':<18}{'median ms':>11}{'pydantic mods':>15}{'attrs mods':>12}")
+    for name, metrics in results.items():
+        print(
+            f"{name:<18}{metrics['ms']:>11.1f}"
+            f"{metrics['pydantic_modules']:>15}{metrics['attrs_modules']:>12}"
+        )
+
+    lazy, full = results["convert_variant"]["ms"], results["full_registry"]["ms"]
+    print(
+        f"\nConverting one model costs {lazy:.0f} ms instead of {full:.0f} ms "
+        f"({full / lazy:.1f}x less) without loading the full registry"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
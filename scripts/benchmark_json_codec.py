@@ -0,0 +1,181 @@
+"""Benchmark the pluggable JSON codecs on a realistic 250-item list page.
+
+Builds a ``GET /sales_orders``-shaped page (250 orders, each with nested
+rows, addresses and timestamps — Katana's maximum page size) and times, per
+installed codec:
+
+- ``decode``: ``codec.loads`` on the raw page bytes — what every layer of
+  the transport chain and the generated parsers pay per response.
+- ``encode``: ``codec.dumps`` of the decoded page — what
+  ``PaginationTransport`` pays once per auto-paginated collection.
+- ``parse``: decode + ``SalesOrderListResponse.from_dict`` — the full
+  generated-parser cost, to show how much of it the codec actually moves.
+
+Usage::
+
+    uv run poe benchmark-json
+    uv run python scripts/benchmark_json_codec.py --items 250 --repeat 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import sys
+import timeit
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from katana_public_api_client.json_codec import (
+    STDLIB_JSON_CODEC,
+    JSONCodec,
+    JSONCodecName,
+    resolve_json_codec,
+)
+from katana_public_api_client.models import SalesOrderListResponse
+
+
+def build_sales_order_page(items: int) -> dict[str, Any]:
+    """Return a ``SalesOrderListResponse`` body with ``items`` realistic orders."""
+    orders = []
+    for i in range(1, items + 1):
+        orders.append(
+            {
+                "id": 100_000 + i,
+                "customer_id": 5_000 + i % 97,
+                "order_no": f"SO-{i:06d}",
+                "source": "api",
+                "order_created_date": "2026-03-14T09:26:53.589Z",
+                "delivery_date": "2026-03-21T00:00:00.000Z",
+                "picked_date": None,
+                "location_id": 1 + i % 3,
+                "status": "NOT_SHIPPED",
+                "currency": "EUR",
+                "conversion_rate": 1.08,
+                "conversion_date": "2026-03-14T00:00:00.000Z",
+                "invoicing_status": "NOT_INVOICED",
+                "total": 1250.5 + i,
+                "total_in_base_currency": 1350.54 + i,
+                "additional_info": f"Customer note for order {i} — handle with care",
+                "customer_ref": f"PO-{i * 7:08d}",
+                "ecommerce_order_type": None,
+                "ecommerce_store_name": None,
+                "ecommerce_order_id": None,
+                "product_availability": "IN_STOCK",
+                "product_expected_date": None,
+                "ingredient_availability": "PROCESSED",
+                "ingredient_expected_date": None,
+                "production_status": "NONE",
+                "tracking_number": None,
+                "tracking_number_url": None,
+                "billing_address_id": 9_000 + i,
+                "shipping_address_id": 9_500 + i,
+                "created_at": "2026-03-14T09:26:53.589Z",
+                "updated_at": "2026-03-15T11:02:17.114Z",
+                "sales_order_rows": [
+                    {
+                        "id": 500_000 + i * 10 + row,
+                        "quantity": 2 + row,
+                        "variant_id": 70_000 + row,
+                        "tax_rate_id": 1,
+                        "price_per_unit": 49.99 + row,
+                        "total_discount": "0",
+                        "price_per_unit_in_base_currency": 53.99 + row,
+                        "conversion_rate": 1.08,
+                        "location_id": 1,
+                        "product_availability": "IN_STOCK",
+                        "created_at": "2026-03-14T09:26:53.589Z",
+                        "updated_at": "2026-03-14T09:26:53.589Z",
+                    }
+                    for row in range(3)
+                ],
+                "addresses": [
+                    {
+                        "id": 9_000 + i,
+                        "sales_order_id": 100_000 + i,
+                        "entity_type": kind,
+                        "first_name": "Ada",
+                        "last_name": "Lovelace",
+                        "company": "Analytical Engines Ltd",
+                        "line_1": f"{i} Babbage Street",
+                        "city": "London",
+                        "zip": "NW1 2DB",
+                        "country": "GB",
+                    }
+                    for kind in ("billing", "shipping")
+                ],
+            }
+        )
+    return {"data": orders}
+
+
+def _best_of(stmt: Any, number: int, repeat: int) -> float:
+    """Return the best (lowest-noise) per-call time in milliseconds."""
+    return min(timeit.repeat(stmt, number=number, repeat=repeat)) / number * 1000
+
+
+def benchmark_codec(
+    codec: JSONCodec, raw: bytes, payload: dict[str, Any], number: int, repeat: int
+) -> dict[str, float]:
+    """Time decode, encode and decode+``from_dict`` for one codec."""
+    return {
+        "decode": _best_of(lambda: codec.loads(raw), number, repeat),
+        "encode": _best_of(lambda: codec.dumps(payload), number, repeat),
+        "parse": _best_of(
+            lambda: SalesOrderListResponse.from_dict(codec.loads(raw)),
+            max(1, number // 10),
+            repeat,
+        ),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the pluggable JSON codecs on a realistic 250-item list page"
+    )
+    parser.add_argument("--items", type=int, default=250, help="orders per page")
+    parser.add_argument("--number", type=int, default=200, help="calls per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="timings per metric")
+    args = parser.parse_args()
+
+    payload = build_sales_order_page(args.items)
+    raw = STDLIB_JSON_CODEC.dumps(payload)
+    print(f"Page: {args.items} sales orders, {len(raw) / 1024:.1f} KiB\n")
+
+    fast_codecs: tuple[JSONCodecName, ...] = ("orjson", "msgspec")
+    codecs = [STDLIB_JSON_CODEC] + [
+        resolve_json_codec(name)
+        for name in fast_codecs
+        if importlib.util.find_spec(name) is not None
+    ]
+    if len(codecs) == 1:
+        print(
+            "Only the stdlib codec is installed; "
+            'install "katana-openapi-client[fast-json]" to compare.\n'
+        )
+
+    results = {
+        codec.name: benchmark_codec(codec, raw, payload, args.number, args.repeat)
+        for codec in codecs
+    }
+    baseline = results["stdlib"]
+
+    print(f"{'codec':<10}{'decode ms':>13}{'encode ms':>13}{'parse ms':>13}")
+    for name, timings in results.items():
+        print(
+            f"{name:<10}"
+            + "".join(
+                f"{timings[metric]:>8.3f} {baseline[metric] / timings[metric]:>3.1f}x"
+                for metric in ("decode", "encode", "parse")
+            )
+        )
+
+    fastest = min(results, key=lambda name: results[name]["decode"])
+    speedup = baseline["decode"] / results[fastest]["decode"]
+    print(f"\nFastest decode: {fastest} ({speedup:.1f}x the stdlib)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""Benchmark the memory a large parsed ``VariantListResponse`` holds (tracemalloc).
+
+Builds a ``/variants`` page of ``--count`` records (``FakeDataset`` variants
+with renumbered ids), parses it with ``VariantListResponse.from_dict``, and
+reports what the resulting model graph keeps alive:
+
+- ``retained``: bytes still allocated once parsing returns and the
+  temporaries are gone, i.e. the cost of holding the list.
+- ``per variant``: ``retained`` divided by the record count.
+- ``peak``: the high-water mark during parsing.
+
+``--materialize-extras`` allocates each variant's ``additional_properties``
+dict, for comparison with what the lazy slot saves.
+
+The wire payload is built before tracing starts, so strings the models share
+with it are not counted.
+
+Usage::
+
+    uv run poe benchmark-memory
+    uv run python scripts/benchmark_memory.py --count 10000
+    uv run python scripts/benchmark_memory.py --materialize-extras
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from katana_public_api_client.models import VariantListResponse
+from katana_public_api_client.testing.fake_server import FakeDataset
+
+
+def variant_page(count: int) -> dict[str, Any]:
+    """Return a ``VariantListResponse`` payload with ``count`` variants."""
+    records = FakeDataset(size=200, end=datetime(2026, 1, 1, tzinfo=UTC)).records(
+        "/variants"
+    )
+    return {"data": [{**records[i % len(records)], "id": i + 1} for i in range(count)]}
+
+
+def measure(
+    payload: dict[str, Any], *, materialize_extras: bool = False
+) -> dict[str, float]:
+    """Return the retained and peak bytes of parsing ``payload``.
+
+    With ``materialize_extras`` every variant's ``additional_properties`` is
+    read once after parsing, allocating the dict the lazy slot otherwise
+    leaves out — the cost an eagerly allocated slot would carry.
+    """
+    VariantListResponse.from_dict({"data": payload["data"][:1]})  # warm caches
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        response = VariantListResponse.from_dict(payload)
+        if materialize_extras:
+            for variant in response.data or []:
+                _ = variant.additional_properties
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    count = len(payload["data"])
+    assert len(response.data or []) == count
+    return {
+        "variants": count,
+        "retained": current - before,
+        "per_variant": (current - before) / count,
+        "peak": peak - before,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the memory a large parsed VariantListResponse holds (tracemalloc)"
+    )
+    parser.add_argument("--count", type=int, default=50_000, help="variants")
+    parser.add_argument(
+        "--materialize-extras",
+        action="store_true",
+        help="allocate every variant's additional_properties, as an eager slot would",
+    )
+    args = parser.parse_args()
+
+    metrics = measure(
+        variant_page(args.count), materialize_extras=args.materialize_extras
+    )
+
+    mib = 1024 * 1024
+    print(f"variants     {metrics['variants']:>12,.0f}")
+    print(f"retained     {metrics['retained'] / mib:>12.1f} MiB")
+    print(f"per variant  {metrics['per_variant']:>12,.0f} B")
+    print(f"peak         {metrics['peak'] / mib:>12.1f} MiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
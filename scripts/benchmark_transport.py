@@ -0,0 +1,460 @@
+"""Benchmark the per-request overhead of the resilient transport chain.
+
+Drives a ``KatanaClient`` — event hooks, ``PaginationAwareRetryTransport``,
+``PaginationTransport``, ``ErrorLoggingTransport``, ``RateLimitTransport`` and
+``JSONCodecTransport`` — against an in-process transport that answers from
+pre-encoded bodies, so no sockets or server work are timed. Each scenario is
+also run through a bare ``httpx.AsyncClient`` over the same transport; the
+difference is what the chain itself costs:
+
+- ``single_page``: a list GET answered by one 25-order page.
+- ``paginate_50``: a list GET auto-paginated across 50 such pages.
+- ``not_found_404``: a detail GET answered with a 404 error body.
+- ``validation_422``: a POST answered with a 422 validation error body,
+  exercising the detailed error logging path.
+
+Per scenario it reports calls/sec, microseconds per call (chain and bare),
+the chain/bare time ratio and the peak memory allocated while serving one
+call (``tracemalloc``). The ratio and the allocation are compared against the
+stored baseline in ``benchmark_transport_baseline.json``: both are measured
+against the bare client on the same machine, so unlike raw timings they are
+comparable across machines. ``--check`` exits non-zero when either regresses
+beyond its tolerance.
+
+Usage::
+
+    uv run poe benchmark-transport
+    uv run python scripts/benchmark_transport.py --check
+    uv run python scripts/benchmark_transport.py --update-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from katana_public_api_client import KatanaClient
+from katana_public_api_client.json_codec import (
+    STDLIB_JSON_CODEC,
+    JSONCodec,
+)
+from scripts.benchmark_json_codec import build_sales_order_page
+
+BASELINE_PATH = Path(__file__).with_name("benchmark_transport_baseline.json")
+
+BASE_URL = "http://katana.test/v1"
+
+ORDERS_PER_PAGE = 25
+
+# Budget the rate limiter never runs out of, so the layer's bookkeeping is
+# timed but it never sleeps.
+UNLIMITED_REQUESTS_PER_MINUTE = 1_000_000
+
+NOT_FOUND_BODY = {
+    "statusCode": 404,
+    "name": "NotFoundError",
+    "message": "Not found",
+}
+
+VALIDATION_ERROR_BODY = {
+    "statusCode": 422,
+    "name": "UnprocessableEntityError",
+    "message": "The request body is invalid.",
+    "code": "VALIDATION_FAILED",
+    "details": [
+        {
+            "path": ".order_no",
+            "code": "maxLength",
+            "message": "should NOT be longer than 10 characters",
+            "info": {"limit": 10},
+        },
+        {
+            "path": ".customer_id",
+            "code": "type",
+            "message": "should be integer",
+            "info": {"type": "integer"},
+        },
+    ],
+}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One request shape and the canned responses that answer it."""
+
+    name: str
+    method: str
+    path: str
+    status: int
+    body: dict[str, Any]
+    pages: int = 1
+
+    @property
+    def requests_per_call(self) -> int:
+        """HTTP requests one call makes (the page count for list GETs)."""
+        return self.pages
+
+
+SCENARIOS = (
+    Scenario(
+        "single_page",
+        "GET",
+        "/sales_orders",
+        200,
+        build_sales_order_page(ORDERS_PER_PAGE),
+    ),
+    Scenario(
+        "paginate_50",
+        "GET",
+        "/sales_orders",
+        200,
+        build_sales_order_page(ORDERS_PER_PAGE),
+        pages=50,
+    ),
+    Scenario("not_found_404", "GET", "/sales_orders/999999", 404, NOT_FOUND_BODY),
+    Scenario("validation_422", "POST", "/sales_orders", 422, VALIDATION_ERROR_BODY),
+)
+
+
+class CannedTransport(httpx.AsyncBaseTransport):
+    """Answer every request with one scenario's pre-encoded response.
+
+    List responses carry ``X-Pagination`` for the scenario's page count, and
+    every response carries the ``X-Ratelimit-*`` headers Katana sends, so the
+    chain parses the same headers it would in production.
+    """
+
+    def __init__(self, scenario: Scenario) -> None:
+        self.scenario = scenario
+        self.requests = 0
+        self._content = STDLIB_JSON_CODEC.dumps(scenario.body)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        headers = {
+            "Content-Type": "application/json",
+            "X-Ratelimit-Limit": str(UNLIMITED_REQUESTS_PER_MINUTE),
+            "X-Ratelimit-Remaining": str(UNLIMITED_REQUESTS_PER_MINUTE),
+            "X-Ratelimit-Reset": str(int((time.time() + 60) * 1000)),
+        }
+        if self.scenario.status == 200:
+            page = int(request.url.params.get("page", "1"))
+            headers["X-Pagination"] = json.dumps(
+                {
+                    "total_records": str(self.scenario.pages * ORDERS_PER_PAGE),
+                    "total_pages": str(self.scenario.pages),
+                    "offset": str((page - 1) * ORDERS_PER_PAGE),
+                    "page": str(page),
+                    "first_page": str(page == 1).lower(),
+                    "last_page": str(page == self.scenario.pages).lower(),
+                }
+            )
+        return httpx.Response(
+            self.scenario.status, headers=headers, content=self._content
+        )
+
+
+def _quiet_logger() -> logging.Logger:
+    """Logger that formats records like production but writes them nowhere."""
+    logger = logging.getLogger("benchmark_transport")
+    logger.handlers = [logging.NullHandler()]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+
+Call = Callable[[], Awaitable[None]]
+
+
+def _chain_call(http: httpx.AsyncClient, scenario: Scenario) -> Call:
+    """One scenario call through the full client; checks what comes back."""
+    expected_rows = scenario.pages * ORDERS_PER_PAGE
+
+    async def call() -> None:
+        if scenario.method == "GET":
+            response = await http.get(scenario.path)
+        else:
+            response = await http.post(scenario.path, json={"order_no": "SO-1"})
+        if response.status_code != scenario.status:
+            msg = f"{scenario.name}: expected {scenario.status}, got {response}"
+            raise AssertionError(msg)
+        if scenario.status == 200 and len(response.json()["data"]) != expected_rows:
+            msg = f"{scenario.name}: auto-pagination returned the wrong row count"
+            raise AssertionError(msg)
+
+    return call
+
+
+def _bare_call(http: httpx.AsyncClient, scenario: Scenario, codec: JSONCodec) -> Call:
+    """The same requests through a plain ``httpx.AsyncClient``.
+
+    Bodies are decoded with the client's codec, so the comparison isolates
+    the chain rather than the JSON backend.
+    """
+
+    async def call() -> None:
+        for page in range(1, scenario.pages + 1):
+            if scenario.method == "GET":
+                params = {"page": page} if scenario.pages > 1 else None
+                response = await http.get(scenario.path, params=params)
+            else:
+                response = await http.post(scenario.path, json={"order_no": "SO-1"})
+            codec.loads(response.content)
+
+    return call
+
+
+async def _seconds_per_call(call: Call, calls: int) -> float:
+    """Mean seconds per call over ``calls`` back-to-back calls."""
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for _ in range(calls):
+        await call()
+    return (loop.time() - started) / calls
+
+
+async def _best_seconds_per_call(
+    calls: int, repeat: int, **clients: Call
+) -> dict[str, float]:
+    """Best (lowest-noise) seconds per call for each client.
+
+    Timing runs alternate between the clients so a noisy neighbour slows
+    them alike, and the garbage collector is paused while timing, as in
+    ``timeit``.
+    """
+    for call in clients.values():
+        await call()  # warm-up: first-call imports and lazily built state
+    best = dict.fromkeys(clients, float("inf"))
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            for name, call in clients.items():
+                best[name] = min(best[name], await _seconds_per_call(call, calls))
+                gc.collect()
+    finally:
+        gc.enable()
+    return best
+
+
+async def _peak_bytes_per_call(call: Call, samples: int) -> float:
+    """Median peak memory allocated while serving one call."""
+    peaks = []
+    gc.disable()
+    tracemalloc.start()
+    try:
+        for _ in range(samples):
+            gc.collect()
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            await call()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+    finally:
+        tracemalloc.stop()
+        gc.enable()
+    return statistics.median(peaks)
+
+
+async def benchmark_scenario(
+    scenario: Scenario, requests: int, repeat: int, samples: int
+) -> dict[str, float]:
+    """Time and measure one scenario through the chain and the bare client.
+
+    Args:
+        scenario: The request shape to benchmark.
+        requests: Approximate HTTP requests per timing run; divided by the
+            scenario's page count to get the number of calls.
+        repeat: Timing runs per client; the fastest is kept.
+        samples: Calls measured with ``tracemalloc``.
+
+    Returns:
+        ``calls_per_sec``, ``chain_us`` and ``bare_us`` (microseconds per
+        call), ``overhead_ratio`` (chain / bare) and ``peak_kib`` (peak KiB
+        allocated per call through the chain).
+    """
+    calls = max(1, requests // scenario.requests_per_call)
+    transport = CannedTransport(scenario)
+
+    async with (
+        httpx.AsyncClient(transport=transport, base_url=BASE_URL) as bare,
+        KatanaClient(
+            api_key="benchmark",
+            base_url=BASE_URL,
+            max_retries=0,
+            logger=_quiet_logger(),
+            requests_per_minute=UNLIMITED_REQUESTS_PER_MINUTE,
+            base_transport=transport,
+        ) as client,
+    ):
+        chain = _chain_call(client.get_async_httpx_client(), scenario)
+        seconds = await _best_seconds_per_call(
+            calls,
+            repeat,
+            bare=_bare_call(bare, scenario, client.json_codec),
+            chain=chain,
+        )
+        peak_bytes = await _peak_bytes_per_call(chain, samples)
+
+    return {
+        "calls_per_sec": 1 / seconds["chain"],
+        "chain_us": seconds["chain"] * 1e6,
+        "bare_us": seconds["bare"] * 1e6,
+        "overhead_ratio": seconds["chain"] / seconds["bare"],
+        "peak_kib": peak_bytes / 1024,
+    }
+
+
+def find_regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, Any],
+    *,
+    time_tolerance: float,
+    alloc_tolerance: float,
+) -> list[str]:
+    """Describe every scenario metric that regressed beyond its tolerance.
+
+    Args:
+        results: Output of :func:`benchmark_scenario` keyed by scenario name.
+        baseline: Parsed baseline file (``{"scenarios": {name: metrics}}``).
+        time_tolerance: Allowed fractional growth of ``overhead_ratio``.
+        alloc_tolerance: Allowed fractional growth of ``peak_kib``.
+
+    Returns:
+        One line per regression; empty when everything is within tolerance.
+        Scenarios missing from the baseline are skipped.
+    """
+    tolerances = {"overhead_ratio": time_tolerance, "peak_kib": alloc_tolerance}
+    regressions = []
+    for name, metrics in results.items():
+        stored = baseline.get("scenarios", {}).get(name)
+        if stored is None:
+            continue
+        for metric, tolerance in tolerances.items():
+            limit = stored[metric] * (1 + tolerance)
+            if metrics[metric] > limit:
+                regressions.append(
+                    f"{name}: {metric} {metrics[metric]:.2f} exceeds baseline "
+                    f"{stored[metric]:.2f} by more than {tolerance:.0%}"
+                )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the per-request overhead of the resilient transport chain"
+    )
+    parser.add_argument(
+        "--requests", type=int, default=500, help="HTTP requests per timing run"
+    )
+    parser.add_argument("--repeat", type=int, default=7, help="timing runs per client")
+    parser.add_argument(
+        "--samples", type=int, default=20, help="calls measured for allocation"
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[scenario.name for scenario in SCENARIOS],
+        help="run only this scenario (repeatable)",
+    )
+    parser.add_argument(
+        "--baseline", type=Path, default=BASELINE_PATH, help="baseline JSON file"
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="exit 1 when a metric regresses"
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="store these results as the new baseline",
+    )
+    parser.add_argument(
+        "--time-tolerance",
+        type=float,
+        default=0.3,
+        help="allowed overhead-ratio growth (default: 0.3 = 30%%)",
+    )
+    parser.add_argument(
+        "--alloc-tolerance",
+        type=float,
+        default=0.15,
+        help="allowed peak-allocation growth (default: 0.15 = 15%%)",
+    )
+    args = parser.parse_args(argv)
+
+    selected = [
+        scenario
+        for scenario in SCENARIOS
+        if args.scenario is None or scenario.name in args.scenario
+    ]
+    results = {
+        scenario.name: asyncio.run(
+            benchmark_scenario(scenario, args.requests, args.repeat, args.samples)
+        )
+        for scenario in selected
+    }
+    baseline: dict[str, Any] = (
+        json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    )
+    stored = baseline.get("scenarios", {})
+
+    print(
+        f"{'scenario':<16}{'calls/s':>10}{'chain µs':>11}{'bare µs':>10}"
+        f"{'ratio':>8}{'base':>7}{'KiB':>9}{'base':>9}"
+    )
+    for name, metrics in results.items():
+        base = stored.get(name, {})
+        print(
+            f"{name:<16}{metrics['calls_per_sec']:>10.0f}"
+            f"{metrics['chain_us']:>11.1f}{metrics['bare_us']:>10.1f}"
+            f"{metrics['overhead_ratio']:>8.2f}"
+            f"{base.get('overhead_ratio', float('nan')):>7.2f}"
+            f"{metrics['peak_kib']:>9.1f}{base.get('peak_kib', float('nan')):>9.1f}"
+        )
+
+    if args.update_baseline:
+        stored.update(
+            {
+                name: {
+                    "overhead_ratio": round(metrics["overhead_ratio"], 3),
+                    "peak_kib": round(metrics["peak_kib"], 1),
+                }
+                for name, metrics in results.items()
+            }
+        )
+        args.baseline.write_text(
+            json.dumps({"scenarios": stored}, indent=2, sort_keys=True) + "\n"
+        )
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    regressions = find_regressions(
+        results,
+        baseline,
+        time_tolerance=args.time_tolerance,
+        alloc_tolerance=args.alloc_tolerance,
+    )
+    if regressions:
+        print("\nRegressions against the stored baseline:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1 if args.check else 0
+    print("\nNo regressions against the stored baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2429,54 +2429,73 @@ def write_init_file(
     class_groups: dict[str, list[ClassInfo]],
     alias_groups: dict[str, list[TypeAliasInfo]],
 ) -> None:
-    """Write the __init__.py file that re-exports all models and type aliases."""
+    """Write the lazy __init__.py that re-exports all models and type aliases."""
     print("Writing __init__.py...")
 
-    imports: list[str] = []
-    all_exports: list[str] = []
+    exports: dict[str, str] = {}  # name -> module_name
+    for module_name in sorted(set(class_groups.keys()) | set(alias_groups.keys())):
+        for cls in class_groups.get(module_name, []):
+            exports[cls.name] = module_name
+        for alias in alias_groups.get(module_name, []):
+            exports[alias.name] = module_name
 
-    # Get all module names
-    all_modules = sorted(set(class_groups.keys()) | set(alias_groups.keys()))
+    init_path = output_dir / "__init__.py"
+    init_path.write_text(render_init_file(exports), encoding="utf-8")
+    print(f"  Exported {len(exports)} models")
 
-    for module_name in all_modules:
-        classes = class_groups.get(module_name, [])
-        aliases = alias_groups.get(module_name, [])
 
-        all_names = sorted(
-            [cls.name for cls in classes] + [alias.name for alias in aliases]
-        )
-        if not all_names:
-            continue
-
-        if len(all_names) <= 5:
-            names_str = ", ".join(all_names)
-            imports.append(f"from .{module_name} import {names_str}")
-        else:
-            names_str = ",\n    ".join(all_names)
-            imports.append(f"from .{module_name} import (\n    {names_str},\n)")
-        all_exports.extend(all_names)
+def render_init_file(exports: dict[str, str]) -> str:
+    """Render ``_generated/__init__.py`` for ``{name: module_name}`` exports.
 
+    Each domain module is imported on first access to one of its names
+    (PEP 562), so using one model doesn't build the SQLModel/pydantic
+    classes of every domain. The imports stay behind ``TYPE_CHECKING`` for
+    type checkers.
+    """
+    names = sorted(exports)
     content = '''"""Auto-generated Pydantic models from OpenAPI specification.
 
 DO NOT EDIT - This file is generated by scripts/generate_pydantic_models.py
 
 The models in this package mirror the attrs models in katana_public_api_client/models/
-but use Pydantic v2 for validation and serialization.
+but use Pydantic v2 for validation and serialization. Each domain module is
+imported on first access to one of its names.
 
 To regenerate these models, run:
     uv run poe generate-pydantic
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
 '''
-    content += "\n".join(imports)
-    content += "\n\n__all__ = [\n"
-    for name in sorted(all_exports):
-        content += f'    "{name}",\n'
-    content += "]\n"
+    content += "".join(f"    from .{exports[name]} import {name}\n" for name in names)
+    content += (
+        "\n# Public name -> domain module defining it, imported on first access\n"
+    )
+    content += "_MODULES: dict[str, str] = {\n"
+    content += "".join(f'    "{name}": "{exports[name]}",\n' for name in names)
+    content += "}\n\n__all__ = [\n"
+    content += "".join(f'    "{name}",\n' for name in names)
+    content += """]
 
-    init_path = output_dir / "__init__.py"
-    init_path.write_text(content, encoding="utf-8")
-    print(f"  Exported {len(all_exports)} models")
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+"""
+    return content
 
 
 def generate_auto_registry(
@@ -2488,7 +2507,7 @@ def generate_auto_registry(
     print("Generating auto-registry...")
 
     # Find all attrs model classes
-    attrs_classes: dict[str, str] = {}  # class_name -> module_path
+    attrs_classes: dict[str, str] = {}  # class_name -> attrs module name
     for py_file in attrs_models_dir.glob("*.py"):
         if py_file.name == "__init__.py":
             continue
@@ -2497,35 +2516,34 @@ def generate_auto_registry(
         # Look for @_attrs_define decorated classes
         class_pattern = r"@_attrs_define\s+class\s+(\w+)"
         for match in re.finditer(class_pattern, content):
-            class_name = match.group(1)
-            module_path = f"katana_public_api_client.models.{py_file.stem}"
-            attrs_classes[class_name] = module_path
-
-    # Build pydantic class mapping
-    pydantic_classes: dict[str, str] = {}  # class_name -> module_name
-    for module_name, classes in groups.items():
-        for cls in classes:
-            pydantic_classes[cls.name] = module_name
-
-    # Build registry code
-    imports: list[str] = []
-    registrations: list[str] = []
-    matched = 0
+            attrs_classes[match.group(1)] = py_file.stem
+
+    # Pair each pydantic class with the attrs class of the same name, grouped
+    # by the pydantic module that defines it
+    pairs: dict[str, list[tuple[str, str]]] = {}
+    total = 0
+    for module_name in sorted(groups):
+        for cls in sorted(groups[module_name], key=lambda cls: cls.name):
+            total += 1
+            if cls.name in attrs_classes:
+                pairs.setdefault(module_name, []).append(
+                    (attrs_classes[cls.name], cls.name)
+                )
 
-    for class_name in sorted(pydantic_classes.keys()):
-        if class_name not in attrs_classes:
-            continue
+    output_path.write_text(render_auto_registry(pairs), encoding="utf-8")
+    matched = sum(len(module_pairs) for module_pairs in pairs.values())
+    print(
+        f"  Generated auto-registry with {matched} mappings (of {total} pydantic models)"
+    )
 
-        pydantic_module = pydantic_classes[class_name]
-        attrs_module = attrs_classes[class_name]
 
-        imports.append(f"from {attrs_module} import {class_name} as Attrs{class_name}")
-        imports.append(
-            f"from ._generated.{pydantic_module} import {class_name} as Pydantic{class_name}"
-        )
-        registrations.append(f"    register(Attrs{class_name}, Pydantic{class_name})")
-        matched += 1
+def render_auto_registry(pairs: dict[str, list[tuple[str, str]]]) -> str:
+    """Render ``_auto_registry.py`` from ``{module: [(attrs_module, class_name)]}``.
 
+    The registry holds module and class names only: ``_registry`` registers
+    one ``_generated`` module's pairs the first time one of its classes is
+    looked up, so nothing is imported up front.
+    """
     content = '''"""Auto-generated registry mapping attrs <-> Pydantic model classes.
 
 DO NOT EDIT - This file is generated by scripts/generate_pydantic_models.py
@@ -2534,24 +2552,41 @@ To regenerate, run:
     uv run poe generate-pydantic
 """
 
+import importlib
+
 from ._registry import register
 
-# Import all model classes
+# ``_generated`` module -> (attrs module under ``models``, class name) of each
+# pair it defines. Both sides share the class name.
+MODEL_PAIRS: dict[str, tuple[tuple[str, str], ...]] = {
 '''
-    content += "\n".join(imports)
-    content += "\n\n\ndef register_all_models() -> None:\n"
-    content += '    """Register all attrs <-> Pydantic model mappings."""\n'
-    if registrations:
-        content += "\n".join(registrations)
-    else:
-        content += "    pass  # No models to register yet"
-    content += "\n"
-
-    output_path.write_text(content, encoding="utf-8")
-    print(
-        f"  Generated auto-registry with {matched} mappings "
-        f"(of {len(pydantic_classes)} pydantic models)"
-    )
+    for module_name, module_pairs in pairs.items():
+        content += f'    "{module_name}": (\n'
+        content += "".join(
+            f'        ("{attrs_module}", "{class_name}"),\n'
+            for attrs_module, class_name in module_pairs
+        )
+        content += "    ),\n"
+    content += '''}
+
+
+def register_module_models(module_name: str) -> None:
+    """Register the attrs <-> Pydantic pairs defined by one ``_generated`` module."""
+    pydantic_module = importlib.import_module(f"._generated.{module_name}", __package__)
+    for attrs_module, class_name in MODEL_PAIRS[module_name]:
+        attrs_class = getattr(
+            importlib.import_module(f"katana_public_api_client.models.{attrs_module}"),
+            class_name,
+        )
+        register(attrs_class, getattr(pydantic_module, class_name))
+
+
+def register_all_models() -> None:
+    """Register all attrs <-> Pydantic model mappings."""
+    for module_name in MODEL_PAIRS:
+        register_module_models(module_name)
+'''
+    return content
 
 
 def format_code(workspace_path: Path) -> None:
@@ -25,6 +25,7 @@ Node.js and npx are required for Redocly validation.
 
 from __future__ import annotations
 
+import ast
 import re
 import shutil
 import subprocess
@@ -592,8 +593,10 @@ def fix_specific_generated_issues(workspace_path: Path) -> bool:
                 "FileTypes = Union[\n    # (filename, file (or bytes), content_type)\n    tuple[str | None, FileContent, str | None],\n    # (filename, file (or bytes), content_type, headers)\n    tuple[str | None, FileContent, str | None, Mapping[str, str]],\n]",
                 "FileTypes = (\n    # (filename, file (or bytes), content_type)\n    tuple[str | None, FileContent, str | None] |\n    # (filename, file (or bytes), content_type, headers)\n    tuple[str | None, FileContent, str | None, Mapping[str, str]]\n)",
             )
+            # Keep ``UNSET`` a singleton through pickle and copy.deepcopy
+            content = content.replace(_UNSET_CLASS, _UNSET_CLASS_BY_REFERENCE, 1)
             client_types_file.write_text(content, encoding="utf-8")
-            print("   ✓ Fixed Union types in client_types.py")
+            print("   ✓ Fixed Union types and UNSET pickling in client_types.py")
         except Exception as e:
             print(f"   ⚠️  Could not fix client_types.py: {e}")
 
@@ -606,9 +609,34 @@ def fix_specific_generated_issues(workspace_path: Path) -> bool:
     # Normalize empty-dict-as-null in typed-object _parse_* helpers (#509)
     normalize_parse_helpers_empty_dict(workspace_path)
 
+    # Let KatanaClient build large GET models off the event loop
+    tag_get_endpoints_for_decode_offload(workspace_path)
+
+    # Load models and endpoint modules on first access, not at import
+    make_generated_packages_lazy(workspace_path)
+
+    # Keep None, not an empty dict, in models without unknown keys
+    make_additional_properties_lazy(workspace_path)
+
+    # Encode auto-paginated bodies only if Response.content is read
+    defer_decoded_response_bodies(workspace_path)
+
     return True
 
 
+_UNSET_CLASS = (
+    "class Unset:\n    def __bool__(self) -> Literal[False]:\n        return False\n"
+)
+_UNSET_CLASS_BY_REFERENCE = (
+    _UNSET_CLASS
+    + "\n"
+    + "    def __reduce__(self) -> str:\n"
+    + "        # Pickle and copy by reference, so ``UNSET`` stays the one instance\n"
+    + "        # the generated ``is UNSET`` checks compare against\n"
+    + '        return "UNSET"\n'
+)
+
+
 # Eligibility for the empty-dict-as-null post-processor (#509). A ``_parse_*``
 # helper is patched only when both ``None`` and ``Unset`` checks are present —
 # that signals ``None`` is a valid return value, so empty-dict-as-null is
@@ -726,6 +754,385 @@ def _function_body_end(content: str, body_start: int) -> int:
     return n
 
 
+# ``_parse_response`` header in generated endpoint modules; the return
+# annotation may wrap over several lines.
+_PARSE_RESPONSE_HEADER_RE = re.compile(
+    r"^def _parse_response\(\n.*?^\)[^\n]*:\n", re.MULTILINE | re.DOTALL
+)
+_GET_METHOD_LINE = '        "method": "get",\n'
+_ENDPOINT_TAG = '        "extensions": {"katana_endpoint": __name__},\n'
+_PREBUILT_MARKER = "# Model already built off the event loop by KatanaClient."
+_PREBUILT_EARLY_RETURN = (
+    f"    {_PREBUILT_MARKER}\n"
+    '    if (parsed := response.extensions.get("katana_parsed_model")) is not None:\n'
+    "        return parsed\n"
+)
+
+
+def tag_get_endpoints_for_decode_offload(workspace_path: Path) -> None:
+    """Let ``KatanaClient`` build large GET models off the event loop.
+
+    ``asyncio_detailed`` parses synchronously once the response arrives, so
+    ``from_dict`` over a large collection blocks the event loop. Each GET
+    endpoint's ``_get_kwargs`` now names its module in the
+    ``katana_endpoint`` request extension; ``DecodeOffloadTransport`` uses it
+    to run that module's ``_parse_response`` in a worker and stores the model
+    under ``katana_parsed_model``, which the early return inserted at the top
+    of ``_parse_response`` hands back without parsing again. Idempotent.
+    """
+    print("🔧 Tagging GET endpoints for off-loop response parsing...")
+
+    api_path = workspace_path / "katana_public_api_client" / "api"
+    if not api_path.exists():
+        print(f"   ⚠️  API directory not found: {api_path}")
+        return
+
+    patched = 0
+    for py_file in sorted(api_path.rglob("*.py")):
+        try:
+            content = py_file.read_text(encoding="utf-8")
+        except OSError as e:
+            print(f"   ⚠️  Could not read {py_file.name}: {e}")
+            continue
+
+        new_content = _tag_get_endpoint(content)
+        if new_content != content:
+            py_file.write_text(new_content, encoding="utf-8")
+            patched += 1
+
+    if patched:
+        print(f"   ✓ Tagged {patched} GET endpoint modules")
+    else:
+        print("   (no eligible endpoints found — already patched or none exist)")
+
+
+def _tag_get_endpoint(content: str) -> str:
+    """Add the endpoint tag and the prebuilt-model early return to a GET module."""
+    if _GET_METHOD_LINE not in content or _PREBUILT_MARKER in content:
+        return content
+    match = _PARSE_RESPONSE_HEADER_RE.search(content)
+    if match is None:
+        return content
+    content = content[: match.end()] + _PREBUILT_EARLY_RETURN + content[match.end() :]
+    return content.replace(_GET_METHOD_LINE, _GET_METHOD_LINE + _ENDPOINT_TAG, 1)
+
+
+# Shared tail of the lazy package ``__init__`` files (PEP 562).
+_LAZY_DIR = """
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
+"""
+_LAZY_MODELS_GETATTR = """
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+"""
+_LAZY_API_GETATTR = """
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    return importlib.import_module(f".{name}", __name__)
+"""
+
+
+def make_generated_packages_lazy(workspace_path: Path) -> None:
+    """Turn the ``models`` and ``api`` package ``__init__`` files into lazy loaders.
+
+    The generator's ``models/__init__.py`` imports every model module up
+    front, which dominated ``import katana_public_api_client``. The rewritten
+    files keep the same public names but load a model (or an endpoint
+    module) on first attribute access through a module ``__getattr__``;
+    the imports stay behind ``TYPE_CHECKING`` for type checkers. Idempotent.
+    """
+    print("🔧 Making models and api packages lazy-loading...")
+
+    package_path = workspace_path / "katana_public_api_client"
+    models_init = package_path / "models" / "__init__.py"
+    if models_init.exists():
+        content = models_init.read_text(encoding="utf-8")
+        models_init.write_text(_lazy_models_init(content), encoding="utf-8")
+        print("   ✓ Rewrote models/__init__.py")
+
+    api_path = package_path / "api"
+    if not api_path.exists():
+        print(f"   ⚠️  API directory not found: {api_path}")
+        return
+    inits = [api_path / "__init__.py", *sorted(api_path.glob("*/__init__.py"))]
+    for init in inits:
+        names = sorted(
+            path.parent.name if path.name == "__init__.py" else path.stem
+            for path in [
+                *init.parent.glob("*/__init__.py"),
+                *init.parent.glob("*.py"),
+            ]
+            if path != init
+        )
+        docstring = ast.get_docstring(ast.parse(init.read_text(encoding="utf-8")))
+        init.write_text(_lazy_api_init(docstring or "", names), encoding="utf-8")
+    print(f"   ✓ Rewrote {len(inits)} api package __init__.py files")
+
+
+def _lazy_models_init(content: str) -> str:
+    """Build a lazy ``models/__init__.py`` from the generated (or lazy) one."""
+    tree = ast.parse(content)
+    modules = {
+        alias.asname or alias.name: node.module
+        for node in ast.walk(tree)
+        if isinstance(node, ast.ImportFrom) and node.level == 1 and node.module
+        for alias in node.names
+    }
+    names = sorted(modules)
+    imports = "".join(f"    from .{modules[name]} import {name}\n" for name in names)
+    mapping = "".join(f'    "{name}": "{modules[name]}",\n' for name in names)
+    exports = "".join(f'    "{name}",\n' for name in names)
+    return (
+        f'"""{ast.get_docstring(tree) or ""}"""\n\n'
+        "import importlib\n"
+        "from typing import TYPE_CHECKING, Any\n\n"
+        f"if TYPE_CHECKING:\n{imports}\n"
+        "# Public name -> submodule defining it, imported on first access\n"
+        f"_MODULES: dict[str, str] = {{\n{mapping}}}\n\n"
+        f"__all__ = (\n{exports})\n"
+        f"{_LAZY_MODELS_GETATTR}{_LAZY_DIR}"
+    )
+
+
+def _lazy_api_init(docstring: str, names: list[str]) -> str:
+    """Build a lazy ``api`` package ``__init__.py`` exposing its submodules."""
+    exports = "".join(f'    "{name}",\n' for name in names)
+    return (
+        f'"""{docstring}"""\n\n'
+        "import importlib\n"
+        "from typing import TYPE_CHECKING, Any\n\n"
+        f"if TYPE_CHECKING:\n    from . import {', '.join(names)}\n\n"
+        f"__all__ = (\n{exports})\n"
+        f"{_LAZY_API_GETATTR}{_LAZY_DIR}"
+    )
+
+
+_EAGER_PROPS_FIELD = "    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)\n"
+_LAZY_PROPS_FIELD = """\
+    # Unknown payload keys; None until the first one appears
+    _additional_properties: dict[str, Any] | None = _attrs_field(
+        init=False, default=None, eq=lazy_dict_eq_key
+    )
+
+    @property
+    def additional_properties(self) -> dict[str, Any]:
+        if self._additional_properties is None:
+            self._additional_properties = {}
+        return self._additional_properties
+
+    @additional_properties.setter
+    def additional_properties(self, value: dict[str, Any]) -> None:
+        self._additional_properties = value
+"""
+# Reads that must not allocate the dict: a round trip through ``to_dict``
+# and key lookups leave an empty slot empty.
+_LAZY_PROPS_READS = (
+    (
+        "        field_dict.update(self.additional_properties)\n",
+        "        if self._additional_properties:\n"
+        "            field_dict.update(self._additional_properties)\n",
+    ),
+    (
+        "        return list(self.additional_properties.keys())\n",
+        "        return list(self._additional_properties or ())\n",
+    ),
+    (
+        "        return key in self.additional_properties\n",
+        "        return key in (self._additional_properties or ())\n",
+    ),
+)
+# ``from_dict`` used to keep its working copy of the payload, every known key
+# popped but the table still sized for all of them.
+_FROM_DICT_PROPS_RE = re.compile(r"^(        \w+)\.additional_properties = d$", re.M)
+_ATTRS_IMPORT = (
+    "from attrs import (\n    define as _attrs_define,\n    field as _attrs_field,\n)\n"
+)
+_CLIENT_TYPES_IMPORT = "from ..client_types import UNSET, Unset\n"
+_LAZY_DICT_EQ_KEY = '''
+
+def lazy_dict_eq_key(value: Mapping[str, object] | None) -> Mapping[str, object]:
+    """Comparison key for a lazily allocated dict slot: ``None`` equals ``{}``."""
+    return value or {}
+'''
+
+
+def make_additional_properties_lazy(workspace_path: Path) -> None:
+    """Allocate each model's ``additional_properties`` dict only when needed.
+
+    Every generated model carried its own ``additional_properties`` dict, and
+    ``from_dict`` filled it with the payload copy it had popped the known keys
+    from, so each instance of a 50k-variant list held an empty but
+    full-sized dict. The models (already slotted by ``attrs.define``) now keep
+    ``None`` in a private ``_additional_properties`` slot until an unknown key
+    arrives or the public ``additional_properties`` property is used, which
+    allocates it. Equality treats ``None`` and ``{}`` alike through
+    ``client_types.lazy_dict_eq_key``. Idempotent.
+    """
+    print("🔧 Making model additional_properties lazy...")
+
+    package_path = workspace_path / "katana_public_api_client"
+    client_types_file = package_path / "client_types.py"
+    if client_types_file.exists():
+        content = client_types_file.read_text(encoding="utf-8")
+        client_types_file.write_text(_add_lazy_dict_eq_key(content), encoding="utf-8")
+
+    models_path = package_path / "models"
+    if not models_path.exists():
+        print(f"   ⚠️  Models directory not found: {models_path}")
+        return
+
+    patched = 0
+    for py_file in sorted(models_path.glob("*.py")):
+        content = py_file.read_text(encoding="utf-8")
+        new_content = _lazy_additional_properties(content)
+        if new_content != content:
+            py_file.write_text(new_content, encoding="utf-8")
+            patched += 1
+
+    if patched:
+        print(f"   ✓ Made additional_properties lazy in {patched} models")
+    else:
+        print("   (no eligible models found — already patched or none exist)")
+
+
+def _add_lazy_dict_eq_key(content: str) -> str:
+    """Add ``lazy_dict_eq_key`` to ``client_types.py``."""
+    if "def lazy_dict_eq_key(" in content:
+        return content
+    all_start = content.index("\n\n__all__ = [")
+    content = content[:all_start] + _LAZY_DICT_EQ_KEY + content[all_start:]
+    return content.replace('"Unset"]', '"Unset", "lazy_dict_eq_key"]', 1)
+
+
+def _lazy_additional_properties(content: str) -> str:
+    """Rewrite one model module's ``additional_properties`` handling."""
+    if _EAGER_PROPS_FIELD not in content or _ATTRS_IMPORT not in content:
+        return content
+    content = content.replace(_EAGER_PROPS_FIELD, _LAZY_PROPS_FIELD, 1)
+    for eager, lazy in _LAZY_PROPS_READS:
+        content = content.replace(eager, lazy, 1)
+    content = _FROM_DICT_PROPS_RE.sub(r"\1._additional_properties = d or None", content)
+
+    # Import the comparison key, keeping the first-party import block sorted
+    if _CLIENT_TYPES_IMPORT in content:
+        return content.replace(
+            _CLIENT_TYPES_IMPORT,
+            "from ..client_types import UNSET, Unset, lazy_dict_eq_key\n",
+            1,
+        )
+    import_line = "from ..client_types import lazy_dict_eq_key\n"
+    if _ATTRS_IMPORT + "\nfrom .." in content:
+        return content.replace(
+            _ATTRS_IMPORT + "\n", _ATTRS_IMPORT + "\n" + import_line, 1
+        )
+    return content.replace(_ATTRS_IMPORT, _ATTRS_IMPORT + "\n" + import_line, 1)
+
+
+# ``client_types.Response`` keeps the httpx response while its body is still
+# unencoded, and encodes it on first ``content`` access.
+_EAGER_RESPONSE_FIELDS = (
+    "    content: bytes\n    headers: MutableMapping[str, str]\n    parsed: T | None\n"
+)
+_DEFERRED_RESPONSE_FIELDS = '''    _content: bytes | httpx.Response = field(alias="content")
+    headers: MutableMapping[str, str]
+    parsed: T | None
+
+    @property
+    def content(self) -> bytes:
+        """Raw response body; an auto-paginated collection is encoded on first access."""
+        if isinstance(self._content, httpx.Response):
+            self._content = self._content.content
+        return self._content
+'''
+_DEFERRED_CONTENT = '''
+
+def deferred_content(response: httpx.Response) -> bytes | httpx.Response:
+    """``response.content``, or ``response`` itself while its body is unencoded."""
+    if getattr(response, "content_deferred", False):
+        return response
+    return response.content
+'''
+_EAGER_BUILD_CONTENT = "        content=response.content,\n"
+_DEFERRED_BUILD_CONTENT = "        content=deferred_content(response),\n"
+_API_CLIENT_TYPES_IMPORT_RE = re.compile(r"^from \.\.\.client_types import (.+)$", re.M)
+
+
+def defer_decoded_response_bodies(workspace_path: Path) -> None:
+    """Encode an auto-paginated collection's body only if it is read.
+
+    ``KatanaClient`` stitches auto-paginated pages into a response that holds
+    the decoded payload, and can produce its bytes on demand. The generated
+    ``_build_response`` read ``response.content`` regardless, re-encoding
+    the whole collection on every call. ``Response`` now keeps such a
+    response in a private ``_content`` slot (``content=`` still initializes
+    it) and its ``content`` property encodes on first access; the GET
+    modules pass it through ``client_types.deferred_content``. Idempotent.
+    """
+    print("🔧 Deferring auto-paginated response bodies...")
+
+    package_path = workspace_path / "katana_public_api_client"
+    client_types_file = package_path / "client_types.py"
+    if client_types_file.exists():
+        content = client_types_file.read_text(encoding="utf-8")
+        client_types_file.write_text(_defer_response_content(content), encoding="utf-8")
+
+    api_path = package_path / "api"
+    if not api_path.exists():
+        print(f"   ⚠️  API directory not found: {api_path}")
+        return
+
+    patched = 0
+    for py_file in sorted(api_path.rglob("*.py")):
+        content = py_file.read_text(encoding="utf-8")
+        new_content = _defer_build_response_content(content)
+        if new_content != content:
+            py_file.write_text(new_content, encoding="utf-8")
+            patched += 1
+
+    if patched:
+        print(f"   ✓ Deferred response bodies in {patched} GET endpoint modules")
+    else:
+        print("   (no eligible endpoints found — already patched or none exist)")
+
+
+def _defer_response_content(content: str) -> str:
+    """Make ``client_types.Response.content`` lazy and add ``deferred_content``."""
+    if _EAGER_RESPONSE_FIELDS not in content:
+        return content
+    content = content.replace(_EAGER_RESPONSE_FIELDS, _DEFERRED_RESPONSE_FIELDS, 1)
+    content = content.replace(
+        "\nfrom attrs import define\n",
+        "\nimport httpx\nfrom attrs import define, field\n",
+        1,
+    )
+    all_start = content.index("\n\n__all__ = [")
+    content = content[:all_start] + _DEFERRED_CONTENT + content[all_start:]
+    return content.replace(
+        '"lazy_dict_eq_key"', '"deferred_content", "lazy_dict_eq_key"', 1
+    )
+
+
+def _defer_build_response_content(content: str) -> str:
+    """Route one GET module's ``_build_response`` body through ``deferred_content``."""
+    if _GET_METHOD_LINE not in content or _EAGER_BUILD_CONTENT not in content:
+        return content
+    content = content.replace(_EAGER_BUILD_CONTENT, _DEFERRED_BUILD_CONTENT, 1)
+    return _API_CLIENT_TYPES_IMPORT_RE.sub(r"\g<0>, deferred_content", content, count=1)
+
+
 def fix_pagination_defaults(workspace_path: Path) -> None:
     """Fix pagination defaults to enable auto-pagination by default.
 
@@ -1,6 +1,7 @@
 """Test configuration and fixtures for the Katana OpenAPI Client test suite."""
 
 import os
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any, cast
 from unittest.mock import AsyncMock, MagicMock
@@ -45,6 +46,27 @@ def katana_client(mock_api_credentials):
     return KatanaClient(**mock_api_credentials)
 
 
+@pytest.fixture
+def make_katana_client() -> Callable[..., KatanaClient]:
+    """Factory for a ``KatanaClient`` over a test transport.
+
+    ``make_katana_client(transport, **kwargs)`` puts ``transport`` at the
+    bottom of the client's transport chain (``None`` keeps the real HTTP
+    transport) and passes ``kwargs`` on to ``KatanaClient``. Rate limiting is
+    off unless ``requests_per_minute`` is given.
+    """
+
+    def make(
+        transport: httpx.AsyncBaseTransport | None = None, **kwargs: Any
+    ) -> KatanaClient:
+        kwargs.setdefault("api_key", "test")
+        kwargs.setdefault("base_url", "http://katana.test/v1")
+        kwargs.setdefault("requests_per_minute", None)
+        return KatanaClient(base_transport=transport, **kwargs)
+
+    return make
+
+
 @pytest.fixture
 def katana_client_limited_pages(mock_api_credentials):
     """Create a KatanaClient with limited pagination for testing."""
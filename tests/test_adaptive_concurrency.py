@@ -0,0 +1,280 @@
+"""Tests for ``AdaptiveConcurrencyTransport`` — the AIMD in-flight limiter."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from katana_public_api_client import KatanaClient
+from katana_public_api_client.adaptive_concurrency import AdaptiveConcurrencyTransport
+from katana_public_api_client.connection_profile import ConnectionReuseTransport
+from katana_public_api_client.katana_client import (
+    JSONCodecTransport,
+    RateLimitTransport,
+    ResilientAsyncTransport,
+)
+
+
+def _make_request() -> httpx.Request:
+    return httpx.Request("GET", "https://api.example.test/products")
+
+
+class _FakeServer(httpx.AsyncBaseTransport):
+    """Serves each request after ``latency`` seconds, tracking peak concurrency.
+
+    Requests beyond ``capacity`` in flight get a 503, like an overloaded
+    upstream; ``status`` and ``headers`` override every response.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.1,
+        capacity: int | None = None,
+        status: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.latency = latency
+        self.capacity = capacity
+        self.status = status
+        self.headers = headers or {}
+        self.in_flight = 0
+        self.peak = 0
+        self.overloaded = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            if self.capacity is not None and self.in_flight > self.capacity:
+                self.overloaded += 1
+                return httpx.Response(503, request=request)
+            return httpx.Response(self.status, headers=self.headers, request=request)
+        finally:
+            self.in_flight -= 1
+
+
+async def _fan_out(transport: httpx.AsyncBaseTransport, requests: int) -> None:
+    await asyncio.gather(
+        *(transport.handle_async_request(_make_request()) for _ in range(requests))
+    )
+
+
+@pytest.mark.unit
+class TestAdaptiveConcurrencyValidation:
+    @pytest.mark.parametrize(
+        ("min_limit", "initial_limit", "max_limit"),
+        [(0, 1, 4), (2, 1, 4), (1, 8, 4)],
+    )
+    def test_rejects_inconsistent_limits(
+        self, min_limit: int, initial_limit: int, max_limit: int
+    ) -> None:
+        with pytest.raises(ValueError, match="Concurrency limits must satisfy"):
+            AdaptiveConcurrencyTransport(
+                min_limit=min_limit, initial_limit=initial_limit, max_limit=max_limit
+            )
+
+    def test_rejects_empty_latency_window(self) -> None:
+        with pytest.raises(ValueError, match="latency_window must be positive"):
+            AdaptiveConcurrencyTransport(latency_window=0)
+
+    def test_rejects_tolerance_at_or_below_one(self) -> None:
+        with pytest.raises(ValueError, match="latency_tolerance must be greater"):
+            AdaptiveConcurrencyTransport(latency_tolerance=1.0)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.looptime
+class TestAdaptiveConcurrencyLimit:
+    async def test_caps_in_flight_requests(self) -> None:
+        server = _FakeServer()
+        transport = AdaptiveConcurrencyTransport(server, initial_limit=3, max_limit=3)
+
+        await _fan_out(transport, 12)
+
+        assert server.peak == 3
+        assert transport.stats().in_flight == 0
+
+    async def test_queued_requests_go_in_arrival_order(self) -> None:
+        served: list[str] = []
+
+        class _Recorder(httpx.AsyncBaseTransport):
+            async def handle_async_request(
+                self, request: httpx.Request
+            ) -> httpx.Response:
+                served.append(request.url.path)
+                await asyncio.sleep(0.1)
+                return httpx.Response(200, request=request)
+
+        transport = AdaptiveConcurrencyTransport(
+            _Recorder(), initial_limit=1, max_limit=1
+        )
+        await asyncio.gather(
+            *(
+                transport.handle_async_request(
+                    httpx.Request("GET", f"https://api.example.test/{i}")
+                )
+                for i in range(5)
+            )
+        )
+
+        assert served == [f"/{i}" for i in range(5)]
+
+    async def test_grows_while_healthy_and_saturated(self) -> None:
+        transport = AdaptiveConcurrencyTransport(
+            _FakeServer(), initial_limit=2, max_limit=8
+        )
+
+        await _fan_out(transport, 200)
+
+        assert transport.limit == 8
+        assert transport.stats().increases > 0
+
+    async def test_does_not_grow_when_limit_is_unused(self) -> None:
+        transport = AdaptiveConcurrencyTransport(
+            _FakeServer(), initial_limit=4, max_limit=8
+        )
+
+        for _ in range(50):
+            await transport.handle_async_request(_make_request())
+
+        assert transport.limit == 4
+
+    @pytest.mark.parametrize("status", [429, 503])
+    async def test_burst_of_failures_halves_once(self, status: int) -> None:
+        transport = AdaptiveConcurrencyTransport(
+            _FakeServer(status=status), initial_limit=8, max_limit=8
+        )
+
+        await _fan_out(transport, 8)
+
+        # All eight were sent before the first failure came back
+        assert transport.limit == 4
+        assert transport.stats().decreases == 1
+
+    async def test_repeated_failures_floor_at_min_limit(self) -> None:
+        transport = AdaptiveConcurrencyTransport(
+            _FakeServer(status=429), initial_limit=8, max_limit=8, min_limit=2
+        )
+
+        await _fan_out(transport, 40)
+
+        assert transport.limit == 2
+
+    async def test_transport_error_halves_and_propagates(self) -> None:
+        class _Broken(httpx.AsyncBaseTransport):
+            async def handle_async_request(
+                self, request: httpx.Request
+            ) -> httpx.Response:
+                raise httpx.ConnectError("boom", request=request)
+
+        transport = AdaptiveConcurrencyTransport(
+            _Broken(), initial_limit=4, max_limit=4
+        )
+
+        with pytest.raises(httpx.ConnectError):
+            await transport.handle_async_request(_make_request())
+
+        assert transport.limit == 2
+        assert transport.stats().in_flight == 0
+
+    async def test_low_rate_limit_budget_halves(self) -> None:
+        transport = AdaptiveConcurrencyTransport(
+            _FakeServer(headers={"X-Ratelimit-Remaining": "3"}),
+            initial_limit=4,
+            max_limit=8,
+        )
+
+        await transport.handle_async_request(_make_request())
+
+        assert transport.limit == 2
+
+    async def test_rising_p95_halves(self) -> None:
+        server = _FakeServer(latency=0.1)
+        transport = AdaptiveConcurrencyTransport(
+            server, initial_limit=4, max_limit=4, latency_window=20
+        )
+        await _fan_out(transport, 40)
+        assert transport.limit == 4
+
+        server.latency = 0.5
+        await _fan_out(transport, 4)
+
+        assert transport.limit == 2
+        assert transport.stats().decreases == 1
+
+    async def test_slower_request_mix_halves_once(self) -> None:
+        """Page fetches after a spell of fast GETs don't pin the limit at the floor."""
+        server = _FakeServer(latency=0.01)
+        transport = AdaptiveConcurrencyTransport(
+            server, initial_limit=8, max_limit=8, latency_window=20
+        )
+        for _ in range(20):
+            await transport.handle_async_request(_make_request())
+
+        server.latency = 0.2
+        for _ in range(5):
+            await _fan_out(transport, 100)
+
+        assert transport.stats().decreases == 1
+        assert transport.limit == 8
+
+    async def test_cancelled_waiter_does_not_leak_slot(self) -> None:
+        server = _FakeServer(latency=1.0)
+        transport = AdaptiveConcurrencyTransport(server, initial_limit=1, max_limit=1)
+        first = asyncio.create_task(transport.handle_async_request(_make_request()))
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(transport.handle_async_request(_make_request()))
+        await asyncio.sleep(0)
+        assert transport.stats().waiting == 1
+
+        queued.cancel()
+        await asyncio.gather(first, queued, return_exceptions=True)
+
+        assert transport.stats().in_flight == 0
+        await transport.handle_async_request(_make_request())
+
+    async def test_converges_near_upstream_capacity(self) -> None:
+        """A 100-wide fan-out settles around what the server can take."""
+        server = _FakeServer(capacity=6)
+        transport = AdaptiveConcurrencyTransport(server, initial_limit=1, max_limit=64)
+
+        for _ in range(5):
+            await _fan_out(transport, 100)
+
+        assert 3 <= transport.limit <= 8
+        # Without the controller every request past the sixth would be a 503
+        assert server.overloaded < 50
+
+
+@pytest.mark.unit
+class TestAdaptiveConcurrencyWiring:
+    def test_factory_places_layer_below_rate_limiter(self) -> None:
+        transport = ResilientAsyncTransport(adaptive_concurrency=16)
+        # retry → pagination → error logging → rate limit → adaptive → codec
+        # → connection reuse → base
+        layer: Any = transport._async_transport
+        chain = []
+        while layer is not None:
+            chain.append(type(layer))
+            layer = getattr(layer, "_wrapped_transport", None)
+        assert chain[-5:-1] == [
+            RateLimitTransport,
+            AdaptiveConcurrencyTransport,
+            JSONCodecTransport,
+            ConnectionReuseTransport,
+        ]
+
+    def test_client_exposes_concurrency_limiter(self) -> None:
+        client = KatanaClient(api_key="test-key", adaptive_concurrency=2)
+        assert client.concurrency_limiter is not None
+        assert client.concurrency_limiter.limit == 2
+        assert client.concurrency_limiter._max_limit == 2
+
+    def test_client_default_has_no_concurrency_limiter(self) -> None:
+        assert KatanaClient(api_key="test-key").concurrency_limiter is None
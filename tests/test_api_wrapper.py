@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import importlib
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from katana_public_api_client import KatanaClient
 from katana_public_api_client.api_wrapper import (
     RESOURCE_REGISTRY,
     ApiNamespace,
+    GetManyResult,
     Resource,
     ResourceConfig,
 )
+from katana_public_api_client.api_wrapper._batch import fetch_many
+from katana_public_api_client.domain import KatanaVariant
+from katana_public_api_client.testing.fake_server import FakeDataset, FakeKatanaServer
 from katana_public_api_client.utils import APIError
 
 # ---------------------------------------------------------------------------
@@ -414,6 +420,128 @@ class TestErrorPropagation:
             await resource.list()
 
 
+# ---------------------------------------------------------------------------
+# Batch get_many
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestGetMany:
+    """Verify that get_many batches IDs into a few list requests."""
+
+    @staticmethod
+    def _client(server: FakeKatanaServer) -> KatanaClient:
+        return KatanaClient(
+            api_key="test-key",
+            base_url="http://katana.test/v1",
+            base_transport=server,
+            requests_per_minute=None,
+        )
+
+    async def test_chunks_ids_into_list_requests(self) -> None:
+        dataset = FakeDataset(size=150)
+        server = FakeKatanaServer(dataset, requests_per_minute=None)
+        live = [
+            v["id"] for v in dataset.records("/variants") if v["deleted_at"] is None
+        ][:300]
+        unknown = 999_999
+
+        client = self._client(server)
+        async with client:
+            result = await client.api.variants.get_many([*live, unknown, live[0]])
+
+        assert server.requests == 2
+        assert list(result.found) == live
+        assert all(result.found[i].id == i for i in live)
+        assert result.missing == [unknown]
+
+    async def test_deleted_ids_are_missing_unless_requested(self) -> None:
+        dataset = FakeDataset(size=50)
+        server = FakeKatanaServer(dataset, requests_per_minute=None)
+        deleted = next(v["id"] for v in dataset.records("/variants") if v["deleted_at"])
+
+        client = self._client(server)
+        async with client:
+            hidden = await client.api.variants.get_many([deleted])
+            shown = await client.api.variants.get_many([deleted], include_deleted=True)
+
+        assert hidden.missing == [deleted]
+        assert list(shown.found) == [deleted]
+
+    async def test_helper_returns_domain_models(self) -> None:
+        server = FakeKatanaServer(FakeDataset(size=20), requests_per_minute=None)
+
+        client = self._client(server)
+        async with client:
+            result = await client.variants.get_many([1, 2, 3], chunk_size=2)
+
+        assert server.requests == 2
+        assert list(result.found) == [1, 2, 3]
+        assert all(isinstance(v, KatanaVariant) for v in result.found.values())
+
+    async def test_bounds_concurrency(self) -> None:
+        in_flight = peak = 0
+
+        async def fetch_chunk(chunk: list[int]) -> list[MagicMock]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return [MagicMock(id=i) for i in chunk]
+
+        result = await fetch_many(
+            list(range(10)), fetch_chunk, chunk_size=1, concurrency=3
+        )
+
+        assert peak == 3
+        assert list(result.found) == list(range(10))
+        assert result.missing == []
+
+    async def test_first_chunk_error_propagates(self) -> None:
+        async def fetch_chunk(chunk: list[int]) -> list[MagicMock]:
+            raise APIError(message="Server error", status_code=500)
+
+        with pytest.raises(APIError, match="Server error"):
+            await fetch_many([1, 2, 3], fetch_chunk, chunk_size=1)
+
+    async def test_rejects_non_positive_options(self) -> None:
+        with pytest.raises(ValueError, match="chunk_size"):
+            await fetch_many([1], AsyncMock(), chunk_size=0)
+        with pytest.raises(ValueError, match="concurrency"):
+            await fetch_many([1], AsyncMock(), concurrency=0)
+
+    async def test_falls_back_to_get_without_ids_filter(
+        self, mock_client: MagicMock, full_config: ResourceConfig
+    ) -> None:
+        resource = Resource(mock_client, full_config)
+
+        async def get(resource_id: int) -> MagicMock:
+            if resource_id == 2:
+                raise APIError(message="Not found", status_code=404)
+            return MagicMock(id=resource_id)
+
+        # A bare mock's signature has no ``ids`` parameter
+        with (
+            patch.object(resource, "_load_module", return_value=MagicMock()),
+            patch.object(resource, "get", side_effect=get) as mock_get,
+        ):
+            result = await resource.get_many([1, 2, 3])
+
+        assert isinstance(result, GetManyResult)
+        assert list(result.found) == [1, 3]
+        assert result.missing == [2]
+        assert mock_get.await_count == 3
+
+    async def test_without_get_one_or_ids_raises(
+        self, mock_client: MagicMock, readonly_config: ResourceConfig
+    ) -> None:
+        resource = Resource(mock_client, readonly_config)
+
+        with pytest.raises(NotImplementedError, match="get_many"):
+            await resource.get_many([1])
+
+
 # ---------------------------------------------------------------------------
 # Lazy module loading & caching
 # ---------------------------------------------------------------------------
@@ -0,0 +1,28 @@
+"""Coverage check for the models ``scripts/benchmark_conversion.py`` times.
+
+The benchmark reads its records from ``FakeDataset``. A fake-server shape that
+stops converting (say, a new required field on ``SalesOrder``) would show up
+as a crash at benchmark time. Running each model once at a small size here
+catches that in CI instead.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from scripts.benchmark_conversion import MODELS, benchmark_model
+
+from katana_public_api_client.testing.fake_server import FakeDataset
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(("name", "path"), MODELS)
+def test_benchmark_model_converts_every_record(name: str, path: str) -> None:
+    dataset = FakeDataset(size=20, end=datetime(2026, 1, 1, tzinfo=UTC))
+
+    metrics = benchmark_model(dataset, name, path, repeat=1)
+
+    assert metrics["objects"] == len(dataset.records(path))
+    assert metrics["from_attrs"] > 0
+    assert metrics["to_attrs"] > 0
@@ -0,0 +1,24 @@
+"""Smoke test for ``scripts/benchmark_memory.py``.
+
+A 500-variant page is parsed under tracemalloc, once as parsed and once with
+every variant's ``additional_properties`` dict allocated, as an eagerly
+initialized slot would be. Absolute sizes vary across Python versions, so the
+test only checks that the lazy slot keeps retained memory below that
+baseline.
+"""
+
+from __future__ import annotations
+
+import pytest
+from scripts.benchmark_memory import measure, variant_page
+
+
+@pytest.mark.unit
+def test_lazy_extras_retain_less_than_eager_baseline() -> None:
+    page = variant_page(500)
+
+    lazy = measure(page)
+    eager = measure(page, materialize_extras=True)
+
+    assert lazy["variants"] == eager["variants"] == 500
+    assert 0 < lazy["retained"] < eager["retained"]
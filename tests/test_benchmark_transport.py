@@ -0,0 +1,62 @@
+"""Smoke tests for ``scripts/benchmark_transport.py``.
+
+Every scenario makes one round trip through the full ``ResilientAsyncTransport``
+chain over the script's canned base transport. ``find_regressions`` is checked
+against a hand-built baseline. ``benchmark_transport_baseline.json`` must name
+exactly the script's scenarios: ``--check`` compares only scenarios present in
+both, so a scenario missing from the file would never be checked.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from scripts.benchmark_transport import (
+    BASELINE_PATH,
+    SCENARIOS,
+    benchmark_scenario,
+    find_regressions,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=lambda s: s.name)
+async def test_scenario_runs_through_the_chain(scenario) -> None:
+    # benchmark_scenario raises if the chain returns the wrong status or rows
+    metrics = await benchmark_scenario(scenario, requests=1, repeat=1, samples=1)
+
+    assert metrics["calls_per_sec"] > 0
+    assert metrics["overhead_ratio"] > 0
+    assert metrics["peak_kib"] > 0
+
+
+@pytest.mark.unit
+class TestBenchmarkBaseline:
+    def test_baseline_covers_every_scenario(self) -> None:
+        stored = json.loads(BASELINE_PATH.read_text())["scenarios"]
+
+        assert set(stored) == {scenario.name for scenario in SCENARIOS}
+
+    def test_flags_only_metrics_beyond_tolerance(self) -> None:
+        baseline = {
+            "scenarios": {
+                "single_page": {"overhead_ratio": 2.0, "peak_kib": 100.0},
+                "not_found_404": {"overhead_ratio": 2.0, "peak_kib": 10.0},
+            }
+        }
+        results = {
+            "single_page": {"overhead_ratio": 2.5, "peak_kib": 109.0},
+            "not_found_404": {"overhead_ratio": 2.9, "peak_kib": 12.0},
+            "paginate_50": {"overhead_ratio": 99.0, "peak_kib": 9999.0},
+        }
+
+        regressions = find_regressions(
+            results, baseline, time_tolerance=0.3, alloc_tolerance=0.1
+        )
+
+        assert regressions == [
+            "not_found_404: overhead_ratio 2.90 exceeds baseline 2.00 by more than 30%",
+            "not_found_404: peak_kib 12.00 exceeds baseline 10.00 by more than 10%",
+        ]
@@ -0,0 +1,226 @@
+"""Tests for the bulk write executor (``KatanaClient.bulk``)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+
+import httpx
+import pytest
+
+from katana_public_api_client import BulkOperation, KatanaClient
+from katana_public_api_client.bulk import BulkProgress, run_bulk
+from katana_public_api_client.katana_client import _REQUEST_PRIORITY
+from katana_public_api_client.models.create_tax_rate_request import (
+    CreateTaxRateRequest,
+)
+from katana_public_api_client.utils import APIError, RateLimitError, ServerError
+
+
+class _TaxRates(httpx.AsyncBaseTransport):
+    """Creates tax rates, answering rates listed in ``statuses`` with that status.
+
+    Each listed rate pops the next status from its queue, so ``[429, 429]``
+    fails twice and then succeeds.
+    """
+
+    def __init__(self, statuses: dict[float, list[int]] | None = None) -> None:
+        self.statuses = statuses or {}
+        self.posts: list[float] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        rate = json.loads(request.content)["rate"]
+        self.posts.append(rate)
+        queued = self.statuses.get(rate)
+        if queued:
+            status = queued.pop(0)
+            headers = {"Retry-After": "1"} if status == 429 else {}
+            return httpx.Response(
+                status,
+                json={"statusCode": status, "name": "Error", "message": "nope"},
+                headers=headers,
+                request=request,
+            )
+        return httpx.Response(
+            200, json={"id": int(rate * 10), "rate": rate}, request=request
+        )
+
+
+def _creates(client: KatanaClient, rates: list[float]) -> list[BulkOperation]:
+    def create(rate: float) -> BulkOperation:
+        return BulkOperation(
+            key=f"tax:{rate}",
+            call=lambda: client.api.tax_rates.create(CreateTaxRateRequest(rate=rate)),
+        )
+
+    return [create(rate) for rate in rates]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBulk:
+    async def test_failures_do_not_abort_the_batch(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        transport = _TaxRates({2.0: [422]})
+
+        client = make_katana_client(transport)
+        async with client:
+            report = await client.bulk(_creates(client, [1.0, 2.0, 3.0]))
+
+        assert [r.key for r in report.results] == ["tax:1.0", "tax:2.0", "tax:3.0"]
+        assert [r.value.id for r in report.succeeded] == [10, 30]
+        (failed,) = report.failed
+        assert failed.key == "tax:2.0"
+        assert isinstance(failed.error, APIError)
+        assert failed.error.status_code == 422
+        assert failed.attempts == 1
+
+    @pytest.mark.looptime
+    async def test_writes_are_retried_only_when_rate_limited(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        # The transport retries the POST on 429 but never on 503
+        transport = _TaxRates({1.0: [429, 429], 2.0: [503]})
+
+        client = make_katana_client(transport)
+        async with client:
+            report = await client.bulk(_creates(client, [1.0, 2.0]))
+
+        rate_limited, server_error = report.results
+        assert rate_limited.ok
+        assert isinstance(server_error.error, ServerError)
+        assert transport.posts.count(1.0) == 3
+        assert transport.posts.count(2.0) == 1
+
+    async def test_exhausted_rate_limit_is_rerun(self) -> None:
+        calls = {"limited": 0, "broken": 0}
+
+        async def limited() -> str:
+            calls["limited"] += 1
+            if calls["limited"] < 3:
+                raise RateLimitError("slow down", 429)
+            return "done"
+
+        async def broken() -> str:
+            calls["broken"] += 1
+            raise ServerError("boom", 500)
+
+        report = await run_bulk(
+            [BulkOperation("limited", limited), BulkOperation("broken", broken)]
+        )
+
+        assert report.results[0].value == "done"
+        assert report.results[0].attempts == 3
+        assert report.results[1].attempts == 1
+        assert calls == {"limited": 3, "broken": 1}
+
+    async def test_requests_are_bulk_priority(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        seen: list[str] = []
+
+        async def probe() -> None:
+            seen.append(_REQUEST_PRIORITY.get())
+
+        client = make_katana_client(_TaxRates())
+        async with client:
+            await client.bulk([BulkOperation("a", probe), BulkOperation("b", probe)])
+
+        assert seen == ["bulk", "bulk"]
+        assert _REQUEST_PRIORITY.get() == "interactive"
+
+    async def test_checkpoint_resume(
+        self, tmp_path: Path, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        checkpoint = tmp_path / "import.jsonl"
+        transport = _TaxRates({2.0: [500]})
+
+        client = make_katana_client(transport)
+        async with client:
+            first = await client.bulk(
+                _creates(client, [1.0, 2.0, 3.0]), checkpoint=checkpoint
+            )
+            second = await client.bulk(
+                _creates(client, [1.0, 2.0, 3.0]), checkpoint=checkpoint
+            )
+
+        assert len(first.failed) == 1
+        assert second.skipped == ["tax:1.0", "tax:3.0"]
+        assert [r.key for r in second.succeeded] == ["tax:2.0"]
+        assert transport.posts == [1.0, 2.0, 3.0, 2.0]
+        lines = [json.loads(line) for line in checkpoint.read_text().splitlines()]
+        assert sorted(lines, key=lambda e: e["id"]) == [
+            {"key": "tax:1.0", "id": 10},
+            {"key": "tax:2.0", "id": 20},
+            {"key": "tax:3.0", "id": 30},
+        ]
+
+    async def test_torn_checkpoint_line_is_ignored(self, tmp_path: Path) -> None:
+        checkpoint = tmp_path / "import.jsonl"
+        checkpoint.write_text('{"key": "a", "id": 1}\n{"key": "b", "i')
+
+        async def noop() -> None:
+            return None
+
+        report = await run_bulk(
+            [BulkOperation("a", noop), BulkOperation("b", noop)],
+            checkpoint=checkpoint,
+        )
+
+        assert report.skipped == ["a"]
+        assert [r.key for r in report.results] == ["b"]
+
+    async def test_bounded_concurrency_and_lazy_stream(self) -> None:
+        in_flight = peak = done = 0
+        ahead: list[int] = []
+
+        async def work() -> None:
+            nonlocal in_flight, peak, done
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            done += 1
+
+        async def operations() -> AsyncIterator[BulkOperation]:
+            for i in range(20):
+                ahead.append(i - done)
+                yield BulkOperation(f"op{i}", work)
+
+        report = await run_bulk(operations(), concurrency=3)
+
+        assert peak == 3
+        # Pulled only as slots free up: at most 3 running plus 1 waiting
+        assert max(ahead) <= 4
+        assert len(report.succeeded) == 20
+
+    @pytest.mark.looptime
+    async def test_progress_reports_throughput(self) -> None:
+        progress: list[BulkProgress] = []
+
+        async def slow() -> None:
+            await asyncio.sleep(1)
+
+        report = await run_bulk(
+            [BulkOperation(str(i), slow) for i in range(4)],
+            concurrency=2,
+            on_progress=progress.append,
+        )
+
+        assert [p.completed for p in progress] == [1, 2, 3, 4]
+        assert progress[-1].elapsed_seconds == pytest.approx(2.0)
+        assert report.throughput == pytest.approx(2.0)
+
+    async def test_rejects_bad_input(self) -> None:
+        async def noop() -> None:
+            return None
+
+        with pytest.raises(ValueError, match="Duplicate"):
+            await run_bulk([BulkOperation("a", noop), BulkOperation("a", noop)])
+        with pytest.raises(ValueError, match="concurrency"):
+            await run_bulk([], concurrency=0)
+        with pytest.raises(ValueError, match="max_attempts"):
+            await run_bulk([], max_attempts=0)
@@ -0,0 +1,248 @@
+"""Tests for ``RecordingTransport`` / ``ReplayTransport`` cassettes."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from katana_public_api_client import KatanaClient
+from katana_public_api_client.cassette import (
+    CassetteMismatchError,
+    RecordingTransport,
+    ReplayTransport,
+)
+from katana_public_api_client.connection_profile import ConnectionReuseTransport
+
+
+def _origin(request: httpx.Request) -> httpx.Response:
+    """Fake Katana serving three pages of products with rate-limit headers."""
+    page = int(request.url.params.get("page", "1"))
+    return httpx.Response(
+        200,
+        headers={
+            "X-Ratelimit-Remaining": str(60 - page),
+            "X-Ratelimit-Reset": "30",
+            "X-Pagination": json.dumps({"total_pages": 3, "page": page}),
+        },
+        json={"data": [{"id": page * 10 + i} for i in range(2)]},
+    )
+
+
+def _get(url: str = "https://api.example.test/products?page=1") -> httpx.Request:
+    return httpx.Request("GET", url, headers={"Authorization": "Bearer secret-key"})
+
+
+async def _record(path: Path, requests: list[httpx.Request]) -> RecordingTransport:
+    recorder = RecordingTransport(path, httpx.MockTransport(_origin))
+    for request in requests:
+        await recorder.handle_async_request(request)
+    await recorder.aclose()
+    return recorder
+
+
+def _load(path: Path) -> dict[str, Any]:
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRecordingTransport:
+    async def test_writes_compressed_cassette_with_headers_and_timing(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "run.cassette"
+        recorder = await _record(path, [_get()])
+
+        cassette = _load(path)
+        assert recorder.interactions == 1
+        assert cassette["version"] == 1
+        (interaction,) = cassette["interactions"]
+        headers = dict(interaction["response"]["headers"])
+        assert headers["x-ratelimit-remaining"] == "59"
+        assert json.loads(headers["x-pagination"])["total_pages"] == 3
+        assert "content-length" not in headers
+        assert interaction["elapsed"] >= 0
+
+    async def test_never_stores_credentials(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.cassette"
+        await _record(
+            path, [_get("https://api.example.test/products?api_key=secret-key")]
+        )
+
+        raw = gzip.decompress(path.read_bytes()).decode()
+        assert "secret-key" not in raw
+
+    async def test_binary_body_round_trips(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.cassette"
+        recorder = RecordingTransport(
+            path,
+            httpx.MockTransport(lambda r: httpx.Response(200, content=b"\xff\x00")),
+        )
+        await recorder.handle_async_request(_get())
+        recorder.save()
+
+        response = await ReplayTransport(path).handle_async_request(_get())
+
+        assert await response.aread() == b"\xff\x00"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestReplayTransport:
+    async def test_replays_recorded_responses(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.cassette"
+        await _record(path, [_get()])
+
+        response = await ReplayTransport(path).handle_async_request(_get())
+
+        assert response.status_code == 200
+        assert response.headers["X-Ratelimit-Remaining"] == "59"
+        assert response.json() == {"data": [{"id": 10}, {"id": 11}]}
+
+    async def test_repeated_requests_replay_in_order_then_repeat(
+        self, tmp_path: Path
+    ) -> None:
+        versions = iter(range(1, 10))
+        path = tmp_path / "run.cassette"
+        recorder = RecordingTransport(
+            path,
+            httpx.MockTransport(
+                lambda r: httpx.Response(200, json={"version": next(versions)})
+            ),
+        )
+        for _ in range(2):
+            await recorder.handle_async_request(_get())
+        recorder.save()
+        replay = ReplayTransport(path)
+
+        seen = [
+            (await replay.handle_async_request(_get())).json()["version"]
+            for _ in range(3)
+        ]
+
+        assert seen == [1, 2, 2]
+        assert replay.replayed == 3
+
+    async def test_strict_mode_rejects_exhausted_requests(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.cassette"
+        await _record(path, [_get()])
+        replay = ReplayTransport(path, strict=True)
+        await replay.handle_async_request(_get())
+
+        with pytest.raises(CassetteMismatchError):
+            await replay.handle_async_request(_get())
+
+    async def test_unrecorded_request_raises(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.cassette"
+        await _record(path, [_get()])
+
+        with pytest.raises(CassetteMismatchError, match="/products/99"):
+            await ReplayTransport(path).handle_async_request(
+                _get("https://api.example.test/products/99")
+            )
+
+    async def test_request_bodies_are_matched(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.cassette"
+        url = "https://api.example.test/products"
+        await _record(path, [httpx.Request("POST", url, json={"name": "a"})])
+        replay = ReplayTransport(path)
+
+        await replay.handle_async_request(
+            httpx.Request("POST", url, json={"name": "a"})
+        )
+        with pytest.raises(CassetteMismatchError):
+            await replay.handle_async_request(
+                httpx.Request("POST", url, json={"name": "b"})
+            )
+
+    @pytest.mark.looptime
+    async def test_latency_scale_simulates_recorded_timing(
+        self, tmp_path: Path
+    ) -> None:
+        async def slow(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(2.0)
+            return httpx.Response(200, json={})
+
+        path = tmp_path / "run.cassette"
+        recorder = RecordingTransport(path, httpx.MockTransport(slow))
+        await recorder.handle_async_request(_get())
+        recorder.save()
+        loop = asyncio.get_running_loop()
+
+        started = loop.time()
+        await ReplayTransport(path, latency_scale=0.5).handle_async_request(_get())
+        scaled = loop.time() - started
+        started = loop.time()
+        await ReplayTransport(path).handle_async_request(_get())
+        immediate = loop.time() - started
+
+        assert scaled == pytest.approx(1.0, abs=0.01)
+        assert immediate == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCassetteClient:
+    async def test_client_session_records_and_replays_offline(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "sync.cassette"
+        recorder = RecordingTransport(path, httpx.MockTransport(_origin))
+        async with KatanaClient(
+            api_key="secret-key",
+            base_url="https://api.example.test",
+            base_transport=recorder,
+            requests_per_minute=None,
+        ) as client:
+            live = await client.get_async_httpx_client().get("/products")
+
+        def offline(request: httpx.Request) -> httpx.Response:
+            raise AssertionError("replay must not reach the network")
+
+        replay = ReplayTransport(path)
+        async with KatanaClient(
+            api_key="other-key",
+            base_url="https://api.example.test",
+            base_transport=replay,
+            requests_per_minute=None,
+        ) as client:
+            replayed = await client.get_async_httpx_client().get("/products")
+
+        # Auto-pagination walked all three recorded pages in both runs
+        assert recorder.interactions == 3
+        assert replay.replayed == 3
+        assert replayed.json() == live.json()
+        assert len(replayed.json()["data"]) == 6
+
+
+@pytest.mark.unit
+class TestCassetteValidationAndWiring:
+    def test_rejects_unknown_version(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.cassette"
+        path.write_bytes(gzip.compress(b'{"version": 99, "interactions": []}'))
+
+        with pytest.raises(ValueError, match="Unsupported cassette version 99"):
+            ReplayTransport(path)
+
+    def test_rejects_negative_latency_scale(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="latency_scale must not be negative"):
+            ReplayTransport(tmp_path / "run.cassette", latency_scale=-1)
+
+    def test_base_transport_sits_under_the_chain(self, tmp_path: Path) -> None:
+        path = tmp_path / "run.cassette"
+        path.write_bytes(gzip.compress(b'{"version": 1, "interactions": []}'))
+        replay = ReplayTransport(path)
+
+        client = KatanaClient(api_key="test-key", base_transport=replay)
+
+        layer: Any = client.rate_limiter
+        while not isinstance(layer, ConnectionReuseTransport):
+            layer = layer._wrapped_transport
+        assert layer._wrapped_transport is replay
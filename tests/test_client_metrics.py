@@ -0,0 +1,303 @@
+"""Tests for ``katana_public_api_client.metrics`` and the chain that feeds it."""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from katana_public_api_client import KatanaClient
+from katana_public_api_client.metrics import (
+    PAGINATION_PAGES,
+    RATE_LIMITED,
+    REQUEST_DURATION,
+    RETRIES,
+    ClientMetrics,
+    LatencyHistogram,
+    MetricsTransport,
+    endpoint_template,
+)
+from katana_public_api_client.testing.fake_server import FakeDataset, FakeKatanaServer
+
+
+class _Scripted(httpx.AsyncBaseTransport):
+    """Answers each request with the next queued ``(status, body, headers)``."""
+
+    def __init__(self, *responses: tuple[int, Any, dict[str, str]]) -> None:
+        self.responses = list(responses)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        status, body, headers = self.responses.pop(0)
+        return httpx.Response(status, json=body, headers=headers, request=request)
+
+
+@pytest.mark.unit
+class TestRegistry:
+    @pytest.mark.parametrize(
+        ("path", "template"),
+        [
+            ("/v1/products/123", "/v1/products/{id}"),
+            ("/v1/sales_orders/4/rows/5", "/v1/sales_orders/{id}/rows/{id}"),
+            ("/v1/factory", "/v1/factory"),
+        ],
+    )
+    def test_endpoint_template(self, path: str, template: str) -> None:
+        assert endpoint_template(path) == template
+
+    def test_histogram_buckets_and_quantiles(self) -> None:
+        metrics = ClientMetrics(latency_buckets=(0.1, 0.5, 1.0))
+        for seconds in (0.05, 0.1, 0.3, 0.7, 3.0):
+            metrics.observe_request(
+                "GET", "/v1/products", status_code=200, seconds=seconds
+            )
+
+        latency = metrics.snapshot().endpoints["GET /v1/products"].latency
+
+        assert latency.counts == (2, 1, 1, 1)
+        assert latency.count == 5
+        assert latency.sum_seconds == pytest.approx(4.15)
+        assert latency.quantile(0.4) == 0.1
+        assert latency.quantile(0.8) == 1.0
+        assert latency.quantile(1.0) == math.inf
+
+    def test_empty_histogram(self) -> None:
+        latency = LatencyHistogram(bounds=(1.0,), counts=(0, 0), sum_seconds=0.0)
+
+        assert latency.quantile(0.5) is None
+        assert latency.mean_seconds == 0.0
+
+    @pytest.mark.parametrize("buckets", [(), (0.0, 1.0), (1.0, 0.5)])
+    def test_rejects_bad_buckets(self, buckets: tuple[float, ...]) -> None:
+        with pytest.raises(ValueError, match="strictly ascending"):
+            ClientMetrics(latency_buckets=buckets)
+
+    def test_snapshot_is_a_copy_and_reset_clears(self) -> None:
+        metrics = ClientMetrics()
+        metrics.observe_request("GET", "/v1/x", status_code=429, seconds=0.1)
+        snapshot = metrics.snapshot()
+
+        metrics.observe_request("GET", "/v1/x", status_code=200, seconds=0.1)
+        metrics.reset()
+
+        assert snapshot.endpoints["GET /v1/x"].status_counts == {429: 1}
+        assert snapshot.rate_limited == 1
+        assert metrics.snapshot().endpoints == {}
+
+    def test_prometheus_exposition(self) -> None:
+        metrics = ClientMetrics(latency_buckets=(0.1, 1.0))
+        metrics.observe_request(
+            "GET", "/v1/products/{id}", status_code=200, seconds=0.05, bytes_out=0
+        )
+        metrics.observe_request(
+            "GET", "/v1/products/{id}", status_code=429, seconds=0.5, retry=True
+        )
+        metrics.observe_response_bytes("GET", "/v1/products/{id}", 512)
+        metrics.observe_reset_gate()
+
+        text = metrics.snapshot().to_prometheus()
+
+        labels = 'method="GET",endpoint="/v1/products/{id}"'
+        assert "# TYPE katana_client_request_duration_seconds histogram" in text
+        assert (
+            f'katana_client_request_duration_seconds_bucket{{{labels},le="0.1"}} 1'
+            in text
+        )
+        assert (
+            f'katana_client_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2'
+            in text
+        )
+        assert f"katana_client_request_duration_seconds_sum{{{labels}}} 0.55" in text
+        assert f'katana_client_responses_total{{{labels},status="429"}} 1' in text
+        assert f"katana_client_retries_total{{{labels}}} 1" in text
+        assert f"katana_client_response_bytes_total{{{labels}}} 512" in text
+        assert "katana_client_rate_limit_reset_gate_engagements_total 1" in text
+        assert text.endswith("\n")
+
+    def test_listeners_and_opentelemetry(self) -> None:
+        class Instrument:
+            def __init__(self) -> None:
+                self.values: list[tuple[float, dict[str, Any]]] = []
+
+            def record(self, value: float, attributes: dict[str, Any]) -> None:
+                self.values.append((value, attributes))
+
+            add = record
+
+        class Meter:
+            def __init__(self) -> None:
+                self.instruments: dict[str, Instrument] = {}
+
+            def create_histogram(self, name: str, **_: Any) -> Instrument:
+                return self.instruments.setdefault(name, Instrument())
+
+            create_counter = create_histogram
+
+        metrics = ClientMetrics()
+        meter = Meter()
+        seen: list[str] = []
+        metrics.add_listener(lambda name, value, attributes: seen.append(name))
+        forward = metrics.bind_opentelemetry(meter)
+
+        metrics.observe_request(
+            "GET", "/v1/products", status_code=429, seconds=0.2, retry=True
+        )
+        metrics.observe_pagination("GET", "/v1/products", 3)
+        metrics.remove_listener(forward)
+        metrics.observe_request("GET", "/v1/products", status_code=200, seconds=0.1)
+
+        assert meter.instruments[REQUEST_DURATION].values == [
+            (
+                0.2,
+                {
+                    "http.request.method": "GET",
+                    "url.template": "/v1/products",
+                    "http.response.status_code": 429,
+                },
+            )
+        ]
+        assert len(meter.instruments[RETRIES].values) == 1
+        assert len(meter.instruments[RATE_LIMITED].values) == 1
+        assert meter.instruments[PAGINATION_PAGES].values[0][0] == 3
+        assert seen.count(REQUEST_DURATION) == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestClientMetrics:
+    async def test_paginated_collection_counts_every_page(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        dataset = FakeDataset(size=60)
+        server = FakeKatanaServer(dataset, requests_per_minute=None)
+        total = len(dataset.records("/products"))
+
+        client = make_katana_client(server)
+        async with client:
+            http = client.get_async_httpx_client()
+            response = await http.get(
+                "/products",
+                params={
+                    "limit": 25,
+                    "include_deleted": "true",
+                    "include_archived": "true",
+                },
+            )
+            await http.get("/products/3")
+            snapshot = client.metrics.snapshot()
+
+        pages = -(-total // 25)
+        listing = snapshot.endpoints["GET /v1/products"]
+        detail = snapshot.endpoints["GET /v1/products/{id}"]
+        assert len(response.json()["data"]) == total
+        assert listing.requests == pages
+        assert listing.paginated_calls == 1
+        assert listing.pages == pages
+        assert listing.status_counts == {200: pages}
+        assert listing.latency.count == pages
+        assert listing.bytes_in > 0
+        assert detail.requests == 1
+        assert snapshot.requests == pages + 1
+
+    async def test_request_bytes_and_rate_limit_wait(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        transport = _Scripted((201, {"id": 1}, {}), (200, {"id": 1}, {}))
+
+        client = make_katana_client(transport, requests_per_minute=60)
+        async with client:
+            http = client.get_async_httpx_client()
+            await http.post("/products", json={"name": "Widget"})
+            await http.get("/products/1", extensions={"auto_pagination": False})
+            snapshot = client.metrics.snapshot()
+
+        created = snapshot.endpoints["POST /v1/products"]
+        assert created.bytes_out == len(b'{"name":"Widget"}')
+        assert created.bytes_in == len(b'{"id":1}')
+        assert created.rate_limit_wait_seconds >= 0
+        assert snapshot.endpoints["GET /v1/products/{id}"].requests == 1
+
+    @pytest.mark.looptime
+    async def test_retries_and_429s(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        transport = _Scripted(
+            (429, {"message": "slow down"}, {"Retry-After": "1"}),
+            (429, {"message": "slow down"}, {"Retry-After": "1"}),
+            (201, {"id": 1}, {}),
+        )
+
+        client = make_katana_client(transport)
+        async with client:
+            response = await client.get_async_httpx_client().post(
+                "/products", json={"name": "Widget"}
+            )
+            endpoint = client.metrics.snapshot().endpoints["POST /v1/products"]
+
+        assert response.status_code == 201
+        assert endpoint.requests == 3
+        assert endpoint.retries == 2
+        assert endpoint.rate_limited == 2
+        assert endpoint.status_counts == {429: 2, 201: 1}
+
+    async def test_reset_gate_engagement(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        reset = str(int((time.time() + 30) * 1000))
+        transport = _Scripted(
+            (
+                200,
+                {"id": 1},
+                {"X-Ratelimit-Remaining": "0", "X-Ratelimit-Reset": reset},
+            )
+        )
+
+        client = make_katana_client(transport, requests_per_minute=60)
+        async with client:
+            await client.get_async_httpx_client().get("/factory")
+            snapshot = client.metrics.snapshot()
+
+        assert snapshot.reset_gate_engagements == 1
+
+    async def test_transport_errors_are_counted(self) -> None:
+        class Failing(httpx.AsyncBaseTransport):
+            async def handle_async_request(
+                self, request: httpx.Request
+            ) -> httpx.Response:
+                raise httpx.ConnectError("refused", request=request)
+
+        metrics = ClientMetrics()
+        transport = MetricsTransport(Failing(), metrics=metrics)
+
+        with pytest.raises(httpx.ConnectError):
+            await transport.handle_async_request(
+                httpx.Request("GET", "http://katana.test/v1/products/9")
+            )
+
+        endpoint = metrics.snapshot().endpoints["GET /v1/products/{id}"]
+        assert endpoint.errors == 1
+        assert endpoint.status_counts == {}
+
+    async def test_shared_registry_and_custom_transport(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        metrics = ClientMetrics()
+        transport = _Scripted((200, {"id": 1}, {}))
+
+        client = make_katana_client(transport, metrics=metrics)
+        async with client:
+            await client.get_async_httpx_client().get("/factory")
+        bare = KatanaClient(
+            api_key="test",
+            base_url="http://katana.test/v1",
+            transport=httpx.MockTransport(lambda request: httpx.Response(200)),
+        )
+        async with bare:
+            await bare.get_async_httpx_client().get("/factory")
+
+        assert client.metrics is metrics
+        assert metrics.snapshot().requests == 1
+        assert bare.metrics.snapshot().requests == 0
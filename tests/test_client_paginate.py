@@ -0,0 +1,153 @@
+"""Tests for the streaming ``KatanaClient.paginate`` / ``aiter_items`` API."""
+
+import json
+
+import httpx
+import pytest
+
+from katana_public_api_client import KatanaClient, RateLimitError
+from katana_public_api_client.api.sales_order import get_all_sales_orders
+from katana_public_api_client.models.sales_order_list_response import (
+    SalesOrderListResponse,
+)
+
+
+def _sales_order(order_id: int) -> dict:
+    return {
+        "id": order_id,
+        "customer_id": 1,
+        "order_no": f"SO-{order_id}",
+        "location_id": 1,
+        "status": "NOT_SHIPPED",
+    }
+
+
+def _make_client(handler, **kwargs) -> KatanaClient:
+    return KatanaClient(
+        api_key="test-key",
+        base_url="https://api.katana.test",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+class TestPaginate:
+    """``paginate`` yields one parsed list response per page."""
+
+    @pytest.mark.asyncio
+    async def test_yields_parsed_pages_until_total_pages(self):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            page = int(request.url.params["page"])
+            return httpx.Response(
+                200,
+                headers={
+                    "X-Pagination": json.dumps({"page": str(page), "total_pages": "3"})
+                },
+                json={"data": [_sales_order(page * 10), _sales_order(page * 10 + 1)]},
+            )
+
+        async with _make_client(handler) as client:
+            pages = [
+                page
+                async for page in client.paginate(
+                    get_all_sales_orders, page_size=2, status="NOT_SHIPPED"
+                )
+            ]
+
+        assert len(pages) == 3
+        assert all(isinstance(page, SalesOrderListResponse) for page in pages)
+        assert [order.id for page in pages for order in page.data] == [
+            10,
+            11,
+            20,
+            21,
+            30,
+            31,
+        ]
+        # Each page is requested explicitly, so auto-pagination stays off
+        assert [r.url.params["page"] for r in requests] == ["1", "2", "3"]
+        assert all(r.url.params["limit"] == "2" for r in requests)
+        assert all(r.url.params["status"] == "NOT_SHIPPED" for r in requests)
+
+    @pytest.mark.asyncio
+    async def test_stops_on_short_page_without_pagination_headers(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            count = 2 if page < 3 else 1
+            return httpx.Response(
+                200,
+                json={"data": [_sales_order(page * 10 + i) for i in range(count)]},
+            )
+
+        async with _make_client(handler) as client:
+            pages = [
+                page
+                async for page in client.paginate(get_all_sales_orders, page_size=2)
+            ]
+
+        assert [len(page.data) for page in pages] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_max_pages_bounds_iteration(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                headers={"X-Pagination": json.dumps({"total_pages": 50})},
+                json={"data": [_sales_order(int(request.url.params["page"]))]},
+            )
+
+        async with _make_client(handler) as client:
+            pages = [
+                page
+                async for page in client.paginate(
+                    get_all_sales_orders, page_size=1, max_pages=4
+                )
+            ]
+
+        assert len(pages) == 4
+
+    @pytest.mark.asyncio
+    async def test_error_page_raises_typed_error(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params["page"] == "2":
+                return httpx.Response(
+                    429, json={"name": "TooManyRequests", "message": "slow down"}
+                )
+            return httpx.Response(
+                200,
+                headers={"X-Pagination": json.dumps({"total_pages": 3})},
+                json={"data": [_sales_order(1)]},
+            )
+
+        async with _make_client(handler) as client:
+            seen = []
+            with pytest.raises(RateLimitError):
+                async for page in client.paginate(get_all_sales_orders, page_size=1):
+                    seen.append(page)
+
+        assert len(seen) == 1
+
+
+class TestAiterItems:
+    """``aiter_items`` flattens pages into individual models."""
+
+    @pytest.mark.asyncio
+    async def test_yields_items_across_pages(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            return httpx.Response(
+                200,
+                headers={"X-Pagination": json.dumps({"page": page, "total_pages": 2})},
+                json={"data": [_sales_order(page), _sales_order(page + 100)]},
+            )
+
+        async with _make_client(handler) as client:
+            order_nos = [
+                order.order_no
+                async for order in client.aiter_items(get_all_sales_orders, page_size=2)
+            ]
+
+        assert order_nos == ["SO-1", "SO-101", "SO-2", "SO-102"]
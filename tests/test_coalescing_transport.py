@@ -0,0 +1,355 @@
+"""Tests for ``CoalescingTransport`` — single-flight sharing of identical GETs."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+from typing import Any
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from katana_public_api_client import KatanaClient, unwrap_data
+from katana_public_api_client.api.variant import get_all_variants
+from katana_public_api_client.coalescing import CoalescingTransport
+from katana_public_api_client.json_codec import STDLIB_JSON_CODEC
+from katana_public_api_client.katana_client import (
+    DECODED_JSON_EXTENSION,
+    JSONCodecTransport,
+    _DecodedJSONResponse,
+)
+from katana_public_api_client.testing.fake_server import (
+    FakeDataset,
+    FakeKatanaServer,
+)
+
+
+class _SlowServer(httpx.AsyncBaseTransport):
+    """Answers every request after ``latency`` seconds, recording what it saw."""
+
+    def __init__(self, *, latency: float = 0.1, status: int = 200) -> None:
+        self.latency = latency
+        self.status = status
+        self.seen: list[httpx.Request] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.seen.append(request)
+        await asyncio.sleep(self.latency)
+        return httpx.Response(
+            self.status,
+            json={"id": len(self.seen), "path": request.url.path},
+            request=request,
+        )
+
+
+def _get(path: str = "/variants/7", token: str = "key-a") -> httpx.Request:
+    return httpx.Request(
+        "GET",
+        f"https://api.example.test{path}",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+
+async def _send_all(
+    transport: httpx.AsyncBaseTransport, requests: list[httpx.Request]
+) -> list[httpx.Response]:
+    responses = await asyncio.gather(
+        *(transport.handle_async_request(request) for request in requests)
+    )
+    for response in responses:
+        await response.aread()
+    return list(responses)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.looptime
+class TestCoalescingTransport:
+    async def test_identical_concurrent_gets_share_one_request(self) -> None:
+        server = _SlowServer()
+        transport = CoalescingTransport(server)
+        requests = [_get() for _ in range(5)]
+
+        responses = await _send_all(transport, requests)
+
+        assert len(server.seen) == 1
+        assert [r.json() for r in responses] == [{"id": 1, "path": "/variants/7"}] * 5
+        # Each caller gets its own response bound to its own request
+        assert len({id(r) for r in responses}) == 5
+        assert [r.request for r in responses] == requests
+        assert transport.stats().sent == 1
+        assert transport.stats().coalesced == 4
+        assert transport.stats().in_flight == 0
+
+    @pytest.mark.parametrize("method", ["POST", "PUT", "PATCH", "DELETE", "HEAD"])
+    async def test_non_get_methods_are_never_coalesced(self, method: str) -> None:
+        server = _SlowServer()
+        transport = CoalescingTransport(server)
+        requests = [
+            httpx.Request(method, "https://api.example.test/variants/7")
+            for _ in range(3)
+        ]
+
+        await _send_all(transport, requests)
+
+        assert len(server.seen) == 3
+        assert transport.stats().coalesced == 0
+
+    async def test_get_with_body_is_not_coalesced(self) -> None:
+        server = _SlowServer()
+        transport = CoalescingTransport(server)
+        requests = [
+            httpx.Request("GET", "https://api.example.test/search", content=b"{}")
+            for _ in range(2)
+        ]
+
+        await _send_all(transport, requests)
+
+        assert len(server.seen) == 2
+
+    async def test_different_urls_or_credentials_are_kept_apart(self) -> None:
+        server = _SlowServer()
+        transport = CoalescingTransport(server)
+
+        await _send_all(
+            transport,
+            [
+                _get("/variants/7"),
+                _get("/variants/8"),
+                _get("/variants/7?extend=product"),
+                _get("/variants/7", token="key-b"),
+            ],
+        )
+
+        assert len(server.seen) == 4
+        assert transport.stats().coalesced == 0
+
+    @pytest.mark.parametrize(
+        "extensions",
+        [
+            {"max_items": 2},
+            {"auto_pagination": False},
+            {"priority": "bulk"},
+            {"retry": object()},
+        ],
+    )
+    async def test_behavior_changing_extensions_are_kept_apart(
+        self, extensions: dict[str, Any]
+    ) -> None:
+        server = _SlowServer()
+        transport = CoalescingTransport(server)
+        variant = _get()
+        variant.extensions.update(extensions)
+
+        await _send_all(transport, [_get(), variant, _get()])
+
+        assert len(server.seen) == 2
+        assert transport.stats().coalesced == 1
+
+    async def test_sequential_gets_are_sent_again(self) -> None:
+        server = _SlowServer()
+        transport = CoalescingTransport(server)
+
+        await _send_all(transport, [_get()])
+        await _send_all(transport, [_get()])
+
+        assert len(server.seen) == 2
+
+    async def test_lone_response_is_returned_unread(self) -> None:
+        wire_response = httpx.Response(200, stream=httpx.ByteStream(b"{}"))
+        transport = CoalescingTransport(
+            httpx.MockTransport(lambda request: wire_response)
+        )
+
+        response = await transport.handle_async_request(_get())
+
+        assert response is wire_response
+        assert not response.is_stream_consumed
+
+    async def test_error_status_is_shared(self) -> None:
+        server = _SlowServer(status=503)
+        transport = CoalescingTransport(server)
+
+        responses = await _send_all(transport, [_get(), _get()])
+
+        assert len(server.seen) == 1
+        assert [r.status_code for r in responses] == [503, 503]
+
+    async def test_exception_reaches_every_waiter(self) -> None:
+        class _Broken(httpx.AsyncBaseTransport):
+            calls = 0
+
+            async def handle_async_request(
+                self, request: httpx.Request
+            ) -> httpx.Response:
+                self.calls += 1
+                await asyncio.sleep(0.1)
+                raise httpx.ConnectError("boom", request=request)
+
+        broken = _Broken()
+        transport = CoalescingTransport(broken)
+
+        results = await asyncio.gather(
+            transport.handle_async_request(_get()),
+            transport.handle_async_request(_get()),
+            return_exceptions=True,
+        )
+
+        assert broken.calls == 1
+        assert all(isinstance(r, httpx.ConnectError) for r in results)
+        assert transport.stats().in_flight == 0
+
+    async def test_cancelled_leader_does_not_cancel_followers(self) -> None:
+        server = _SlowServer()
+        transport = CoalescingTransport(server)
+        leader = asyncio.create_task(transport.handle_async_request(_get()))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(transport.handle_async_request(_get()))
+        await asyncio.sleep(0.01)
+
+        leader.cancel()
+        response = await follower
+
+        assert leader.cancelled()
+        assert response.json() == {"id": 1, "path": "/variants/7"}
+        assert len(server.seen) == 1
+
+    async def test_last_waiter_cancelled_abandons_request(self) -> None:
+        server = _SlowServer()
+        transport = CoalescingTransport(server)
+        waiter = asyncio.create_task(transport.handle_async_request(_get()))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+        assert transport.stats().in_flight == 0
+        await transport.handle_async_request(_get())
+        assert transport.stats().sent == 2
+
+    async def test_compressed_body_is_shared_decoded(self) -> None:
+        body = json.dumps({"id": 7}).encode()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.1)
+            return httpx.Response(
+                200,
+                headers={"Content-Encoding": "gzip"},
+                content=gzip.compress(body),
+            )
+
+        transport = CoalescingTransport(httpx.MockTransport(handler))
+
+        responses = await _send_all(transport, [_get(), _get()])
+
+        assert [r.json() for r in responses] == [{"id": 7}, {"id": 7}]
+
+    async def test_followers_keep_codec_and_decoded_payload(self) -> None:
+        payload = {"data": [{"id": 1}, {"id": 2}]}
+
+        class _Paginated(httpx.AsyncBaseTransport):
+            async def handle_async_request(
+                self, request: httpx.Request
+            ) -> httpx.Response:
+                await asyncio.sleep(0.1)
+                source = httpx.Response(200, request=request)
+                return _DecodedJSONResponse.from_payload(
+                    payload, source, request, STDLIB_JSON_CODEC
+                )
+
+        transport = CoalescingTransport(JSONCodecTransport(_Paginated()))
+
+        responses = await _send_all(transport, [_get("/products"), _get("/products")])
+
+        for response in responses:
+            assert isinstance(response, _DecodedJSONResponse)
+            assert response.json() is payload
+            assert response.extensions[DECODED_JSON_EXTENSION] is payload
+
+
+@pytest.mark.unit
+class TestCoalescingWiring:
+    def test_disabled_by_default(self) -> None:
+        assert KatanaClient(api_key="test-key").request_coalescer is None
+
+    @pytest.mark.asyncio
+    async def test_client_coalesces_concurrent_gets(self) -> None:
+        calls = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"id": 7})
+
+        client = KatanaClient(
+            api_key="test-key",
+            base_url="https://api.example.test",
+            coalesce_requests=True,
+            requests_per_minute=None,
+        )
+        coalescer = client.request_coalescer
+        assert coalescer is not None
+        # Swap the real network for the mock below every resilience layer
+        layer: Any = coalescer._wrapped_transport
+        while not isinstance(layer, JSONCodecTransport):
+            layer = layer._wrapped_transport
+        layer._wrapped_transport = httpx.MockTransport(handler)
+
+        async with client:
+            http = client.get_async_httpx_client()
+            responses = await asyncio.gather(
+                *(http.get("/variants/7") for _ in range(3))
+            )
+
+        assert calls == 1
+        assert [r.json() for r in responses] == [{"id": 7}] * 3
+        assert coalescer.stats().coalesced == 2
+
+    @pytest.mark.asyncio
+    async def test_max_items_followers_get_their_own_collection(self) -> None:
+        server = FakeKatanaServer(FakeDataset(size=5), requests_per_minute=None)
+        client = KatanaClient(
+            api_key="test-key",
+            base_url="http://katana.test/v1",
+            base_transport=server,
+            coalesce_requests=True,
+            requests_per_minute=None,
+        )
+
+        async with client:
+            http = client.get_async_httpx_client()
+            full, limited = await asyncio.gather(
+                http.get("/variants", params={"limit": 4}),
+                http.get("/variants", params={"limit": 4}, extensions={"max_items": 2}),
+            )
+
+        assert len(full.json()["data"]) == len(server.dataset.records("/variants"))
+        assert len(limited.json()["data"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_followers_share_the_collection_without_encoding_it(self) -> None:
+        server = FakeKatanaServer(FakeDataset(size=5), requests_per_minute=None)
+        codec = MagicMock(wraps=STDLIB_JSON_CODEC)
+        client = KatanaClient(
+            api_key="test-key",
+            base_url="http://katana.test/v1",
+            base_transport=server,
+            coalesce_requests=True,
+            requests_per_minute=None,
+            json_codec=codec,
+        )
+
+        async with client:
+            first, second = await asyncio.gather(
+                get_all_variants.asyncio_detailed(client=client, limit=4),
+                get_all_variants.asyncio_detailed(client=client, limit=4),
+            )
+            coalescer = client.request_coalescer
+
+        assert coalescer is not None
+        assert coalescer.stats().coalesced == 1
+        assert unwrap_data(first) == unwrap_data(second)
+        codec.dumps.assert_not_called()
@@ -0,0 +1,193 @@
+"""Tests for ``ConnectionProfile``, connection warm-up and reuse stats."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from katana_public_api_client import KatanaClient
+from katana_public_api_client.connection_profile import (
+    ConnectionProfile,
+    ConnectionReuseTransport,
+)
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Minimal keep-alive HTTP/1.1 server answering every request with JSON."""
+    body = b'{"id": 1}'
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: %d\r\n\r\n" % len(body)
+            )
+            if not head.startswith(b"HEAD "):
+                writer.write(body)
+            await writer.drain()
+    except asyncio.IncompleteReadError:
+        pass
+    finally:
+        writer.close()
+
+
+@pytest.fixture
+async def base_url() -> AsyncIterator[str]:
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        yield f"http://127.0.0.1:{port}/v1"
+
+
+def _pool(client: KatanaClient) -> Any:
+    layer = client.connections
+    assert layer is not None
+    base: Any = layer._wrapped_transport
+    return base._pool
+
+
+@pytest.mark.unit
+class TestConnectionProfile:
+    @pytest.mark.parametrize("h2", [True, False])
+    def test_managed_sizes_pool_for_concurrency(
+        self, h2: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(
+            "katana_public_api_client.connection_profile._h2_installed", lambda: h2
+        )
+
+        small = ConnectionProfile.managed(2)
+        large = ConnectionProfile.managed(16)
+
+        assert small.http2 is h2
+        assert small.warm_up
+        assert (small.max_keepalive_connections, small.max_connections) == (2, 10)
+        assert (large.max_keepalive_connections, large.max_connections) == (16, 32)
+
+    def test_client_applies_managed_profile(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        make_katana_client: Callable[..., KatanaClient],
+    ) -> None:
+        monkeypatch.setattr(
+            "katana_public_api_client.connection_profile._h2_installed", lambda: False
+        )
+
+        pool = _pool(
+            make_katana_client(
+                connection_profile="managed",
+                adaptive_concurrency=8,
+            )
+        )
+
+        assert pool._max_keepalive_connections == 8
+        assert pool._max_connections == 16
+        assert pool._keepalive_expiry == 120.0
+        assert pool._http2 is False
+
+    def test_explicit_limits_win(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        pool = _pool(
+            make_katana_client(
+                connection_profile=ConnectionProfile(max_keepalive_connections=3),
+                limits=httpx.Limits(max_connections=7),
+            )
+        )
+
+        assert pool._max_connections == 7
+
+    def test_rejects_unknown_profile(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        with pytest.raises(ValueError, match="Unknown connection profile"):
+            make_katana_client(connection_profile="fast")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestConnectionReuse:
+    async def test_warm_up_moves_connect_out_of_first_request(
+        self, base_url: str, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        client = make_katana_client(base_url=base_url, connection_profile="managed")
+        async with client:
+            assert client.connections is not None
+            warmed = client.connections.stats()
+            await client.get_async_httpx_client().get("/factory")
+            stats = client.connections.stats()
+
+        assert (warmed.warm_ups, warmed.connections_opened) == (1, 1)
+        assert stats.requests == 2
+        assert stats.connections_opened == 1
+        assert stats.reused == 1
+        assert stats.connect_seconds_total > 0
+
+    async def test_cold_client_connects_on_first_request(
+        self, base_url: str, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        client = make_katana_client(base_url=base_url)
+        async with client:
+            http = client.get_async_httpx_client()
+            await http.get("/factory")
+            await http.get("/factory")
+            assert client.connections is not None
+            stats = client.connections.stats()
+
+        assert stats.warm_ups == 0
+        assert stats.requests == 2
+        assert stats.connections_opened == 1
+        assert stats.reuse_ratio == 0.5
+
+    async def test_failed_warm_up_leaves_client_usable(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        # Nothing listens on the port the OS just released
+        server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        server.close()
+        await server.wait_closed()
+
+        client = make_katana_client(
+            base_url=f"http://127.0.0.1:{port}/v1", connection_profile="managed"
+        )
+        async with client:
+            assert client.connections is not None
+            assert client.connections.stats().warm_ups == 0
+            assert await client.warm_up() is False
+
+    async def test_caller_trace_still_called_once_per_event(
+        self, base_url: str
+    ) -> None:
+        events: list[str] = []
+
+        async def trace(event: str, info: dict[str, Any]) -> None:
+            events.append(event)
+
+        layer = ConnectionReuseTransport()
+        request = httpx.Request(
+            "GET", f"{base_url}/factory", extensions={"trace": trace}
+        )
+        for _ in range(2):  # a retry re-sends the same request object
+            response = await layer.handle_async_request(request)
+            await response.aread()
+        await layer.aclose()
+
+        assert events.count("connection.connect_tcp.complete") == 1
+        assert events.count("http11.send_request_headers.started") == 2
+        assert layer.stats().requests == 2
+        assert layer.stats().connections_opened == 1
+
+    async def test_custom_transport_has_no_connection_layer(self) -> None:
+        client = KatanaClient(
+            api_key="test",
+            base_url="http://katana.test/v1",
+            transport=httpx.MockTransport(lambda request: httpx.Response(200)),
+        )
+
+        assert client.connections is None
+        assert await client.warm_up() is False
@@ -0,0 +1,257 @@
+"""Tests for parsing large responses off the event loop (``DecodeOffloadTransport``)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from scripts.benchmark_json_codec import build_sales_order_page
+
+from katana_public_api_client import KatanaClient
+from katana_public_api_client.api.product import get_all_products
+from katana_public_api_client.api.sales_order import (
+    get_all_sales_orders,
+    get_sales_order,
+)
+from katana_public_api_client.client_types import UNSET
+from katana_public_api_client.decode_offload import DecodeOffloadTransport
+from katana_public_api_client.json_codec import STDLIB_JSON_CODEC
+from katana_public_api_client.katana_client import (
+    DECODE_OFFLOAD_EXTENSION,
+    DecodeOffload,
+)
+from katana_public_api_client.models import SalesOrder, SalesOrderListResponse
+from katana_public_api_client.testing.fake_server import FakeDataset, FakeKatanaServer
+from katana_public_api_client.utils import unwrap_data
+
+
+class _Orders(httpx.AsyncBaseTransport):
+    """Serves one large sales order page and small single-order lookups."""
+
+    def __init__(self, page: dict[str, Any]) -> None:
+        self.body = json.dumps(page).encode()
+        self.order = page["data"][0]
+        self.page_sent = asyncio.Event()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/sales_orders"):
+            self.page_sent.set()
+            return httpx.Response(
+                200, content=self.body, headers={"Content-Type": "application/json"}
+            )
+        await asyncio.sleep(0.001)  # a round trip yields to the loop
+        return httpx.Response(200, json=self.order)
+
+
+def _stats(client: KatanaClient) -> Any:
+    assert client.decode_offloader is not None
+    return client.decode_offloader.stats()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestDecodeOffload:
+    async def test_large_page_model_is_built_in_worker(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        page = build_sales_order_page(300)
+        transport = _Orders(page)
+
+        client = make_katana_client(
+            transport, decode_offload=DecodeOffload(threshold_bytes=16 * 1024)
+        )
+        async with client:
+            response = await get_all_sales_orders.asyncio_detailed(
+                client=client, page=1
+            )
+            small = await get_sales_order.asyncio_detailed(client=client, id=1)
+            stats = _stats(client)
+
+        assert isinstance(response.parsed, SalesOrderListResponse)
+        assert (
+            response.parsed.to_dict()
+            == SalesOrderListResponse.from_dict(page).to_dict()
+        )
+        assert isinstance(small.parsed, SalesOrder)
+        assert (stats.prebuilt, stats.failed) == (1, 0)
+
+    async def test_auto_paginated_collection_is_prebuilt(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        dataset = FakeDataset(size=60)
+        server = FakeKatanaServer(dataset, requests_per_minute=None)
+
+        client = make_katana_client(
+            server, decode_offload=DecodeOffload(threshold_bytes=1)
+        )
+        async with client:
+            response = await get_all_products.asyncio_detailed(
+                client=client, limit=25, include_deleted=True, include_archived=True
+            )
+            stats = _stats(client)
+
+        assert len(unwrap_data(response)) == len(dataset.records("/products"))
+        assert stats.prebuilt == 1
+
+    async def test_collection_is_sized_from_its_pages_without_encoding(self) -> None:
+        server = FakeKatanaServer(FakeDataset(size=60), requests_per_minute=None)
+        page = await server.handle_async_request(
+            httpx.Request("GET", "http://katana.test/v1/products?limit=25")
+        )
+        codec = MagicMock(wraps=STDLIB_JSON_CODEC)
+
+        # Above any one page, below the pages together
+        client = KatanaClient(
+            api_key="test",
+            base_url="http://katana.test/v1",
+            base_transport=server,
+            requests_per_minute=None,
+            json_codec=codec,
+            decode_offload=DecodeOffload(threshold_bytes=len(page.content) + 1),
+        )
+        async with client:
+            await get_all_products.asyncio_detailed(client=client, limit=25)
+            stats = _stats(client)
+
+        assert stats.prebuilt == 1
+        codec.dumps.assert_not_called()
+
+    async def test_untagged_request_stays_on_loop(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        page = build_sales_order_page(50)
+
+        client = make_katana_client(
+            _Orders(page), decode_offload=DecodeOffload(threshold_bytes=1)
+        )
+        async with client:
+            response = await client.get_async_httpx_client().get("/sales_orders")
+            stats = _stats(client)
+
+        assert response.json() == page
+        assert stats.prebuilt == 0
+
+    async def test_opted_out_request_stays_on_loop(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        client = make_katana_client(
+            _Orders(build_sales_order_page(50)), decode_offload=DecodeOffload(1)
+        )
+        async with client:
+            kwargs: Any = get_all_sales_orders._get_kwargs()
+            kwargs["extensions"][DECODE_OFFLOAD_EXTENSION] = False
+            response = await client.get_async_httpx_client().request(**kwargs)
+            stats = _stats(client)
+
+        assert len(response.json()["data"]) == 50
+        assert stats.prebuilt == 0
+
+    async def test_unparseable_body_fails_on_the_loop_as_before(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=b'{"data": [' * 100)
+        )
+
+        client = make_katana_client(
+            transport, decode_offload=DecodeOffload(threshold_bytes=1)
+        )
+        async with client:
+            with pytest.raises(json.JSONDecodeError):
+                await get_all_sales_orders.asyncio_detailed(client=client, page=1)
+            stats = _stats(client)
+
+        assert (stats.prebuilt, stats.failed) == (0, 1)
+
+    async def test_process_pool_keeps_unset_identity(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        page = build_sales_order_page(20)
+        del page["data"][0]["customer_ref"]
+
+        client = make_katana_client(
+            _Orders(page),
+            decode_offload=DecodeOffload(
+                threshold_bytes=1, executor="process", max_workers=1
+            ),
+        )
+        async with client:
+            response = await get_all_sales_orders.asyncio_detailed(
+                client=client, page=1
+            )
+            stats = _stats(client)
+
+        assert stats.prebuilt == 1
+        orders = unwrap_data(response)
+        assert orders[0].customer_ref is UNSET
+        assert orders[1].customer_ref == page["data"][1]["customer_ref"]
+
+    async def test_disabled_and_invalid_settings(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        assert (
+            make_katana_client(
+                _Orders(build_sales_order_page(1)), decode_offload=None
+            ).decode_offloader
+            is None
+        )
+        executor: Any = "fork"
+        with pytest.raises(ValueError, match="executor"):
+            DecodeOffloadTransport(
+                httpx.MockTransport(lambda request: httpx.Response(200)),
+                offload=DecodeOffload(executor=executor),
+            )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("offload", [True, False], ids=["offloaded", "on-loop"])
+async def test_small_requests_not_blocked_by_large_parse(
+    offload: bool,
+    monkeypatch: pytest.MonkeyPatch,
+    make_katana_client: Callable[..., KatanaClient],
+) -> None:
+    """Lookups issued while a large page is being parsed complete before it."""
+    release = threading.Event()
+    from_dict = SalesOrderListResponse.from_dict.__func__
+
+    def gated_from_dict(cls: type[SalesOrderListResponse], src_dict: Any) -> Any:
+        # Hold the page's parse until the lookups are done. Only off the loop:
+        # on it, waiting would stall the lookups it waits for.
+        if offload:
+            release.wait(timeout=5)
+        return from_dict(cls, src_dict)
+
+    monkeypatch.setattr(
+        SalesOrderListResponse, "from_dict", classmethod(gated_from_dict)
+    )
+    transport = _Orders(build_sales_order_page(50))
+
+    client = make_katana_client(
+        transport, decode_offload=DecodeOffload(threshold_bytes=1) if offload else None
+    )
+    finished: list[str] = []
+    async with client:
+        large = asyncio.create_task(
+            get_all_sales_orders.asyncio_detailed(client=client, page=1)
+        )
+        large.add_done_callback(lambda _: finished.append("page"))
+        await transport.page_sent.wait()
+        for _ in range(3):
+            await get_sales_order.asyncio_detailed(client=client, id=1)
+            finished.append("lookup")
+        release.set()
+        response = await large
+
+    assert len(unwrap_data(response)) == 50
+    if offload:
+        assert finished == ["lookup", "lookup", "lookup", "page"]
+    else:
+        # The page's ``from_dict`` ran on the loop before anything else could
+        assert finished == ["page", "lookup", "lookup", "lookup"]
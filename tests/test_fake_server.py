@@ -0,0 +1,284 @@
+"""Tests for :mod:`katana_public_api_client.testing.fake_server`."""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import httpx
+import pytest
+
+from katana_public_api_client import KatanaClient
+from katana_public_api_client.api.product import get_all_products
+from katana_public_api_client.testing.fake_server import (
+    FakeDataset,
+    FakeKatanaServer,
+    main,
+)
+from katana_public_api_client.utils import unwrap_data
+
+_END = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture(scope="module")
+def dataset() -> FakeDataset:
+    return FakeDataset(size=120, end=_END)
+
+
+def _get(
+    server: FakeKatanaServer, path: str, token: str = "key-a", **params: Any
+) -> httpx.Response:
+    return server.respond(
+        httpx.Request(
+            "GET",
+            f"http://katana.test/v1{path}",
+            params=params,
+            headers={"Authorization": f"Bearer {token}"},
+        )
+    )
+
+
+@pytest.mark.unit
+class TestFakeDataset:
+    def test_same_seed_same_data(self) -> None:
+        first = FakeDataset(size=20, seed=3, end=_END)
+        second = FakeDataset(size=20, seed=3, end=_END)
+
+        assert first.collections == second.collections
+
+    def test_foreign_keys_resolve(self, dataset: FakeDataset) -> None:
+        for row in dataset.records("/sales_order_rows"):
+            assert dataset.get("/sales_orders", row["sales_order_id"]) is not None
+            assert dataset.get("/variants", row["variant_id"]) is not None
+        for variant in dataset.records("/variants"):
+            if variant["product_id"] is not None:
+                assert dataset.get("/products", variant["product_id"]) is not None
+
+    def test_touch_bumps_updated_at(self) -> None:
+        dataset = FakeDataset(size=20, end=_END)
+        now = _END + timedelta(days=1)
+
+        touched = dataset.touch("/products", 3, now=now)
+
+        assert len(touched) == 3
+        stamps = {
+            r["updated_at"] for r in dataset.records("/products") if r["id"] in touched
+        }
+        assert stamps == {"2026-01-02T00:00:00.000Z"}
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"size": 0}, "size must be positive"),
+            ({"deleted_fraction": 1.5}, "deleted_fraction must be between"),
+        ],
+    )
+    def test_rejects_bad_arguments(self, kwargs: dict[str, Any], match: str) -> None:
+        with pytest.raises(ValueError, match=match):
+            FakeDataset(**kwargs)
+
+
+@pytest.mark.unit
+class TestFakeKatanaServer:
+    def test_paginates_with_header(self, dataset: FakeDataset) -> None:
+        server = FakeKatanaServer(dataset, requests_per_minute=None)
+        live = [r for r in dataset.records("/customers") if r["deleted_at"] is None]
+
+        response = _get(server, "/customers", page=2, limit=50)
+
+        pagination = json.loads(response.headers["X-Pagination"])
+        assert pagination["total_records"] == str(len(live))
+        assert pagination["total_pages"] == str(-(-len(live) // 50))
+        assert pagination["page"] == "2"
+        assert pagination["first_page"] == "false"
+        assert [r["id"] for r in response.json()["data"]] == [
+            r["id"] for r in live[50:100]
+        ]
+
+    def test_include_deleted_and_archived(self, dataset: FakeDataset) -> None:
+        server = FakeKatanaServer(dataset, requests_per_minute=None)
+        everything = len(dataset.records("/products"))
+
+        default = _get(server, "/products", limit=250).json()["data"]
+        full = _get(
+            server,
+            "/products",
+            limit=250,
+            include_deleted="true",
+            include_archived="true",
+        ).json()["data"]
+
+        assert len(full) == everything
+        assert len(default) < everything
+        assert all(
+            r["deleted_at"] is None and r["archived_at"] is None for r in default
+        )
+
+    def test_updated_at_min_returns_only_newer_rows(self) -> None:
+        dataset = FakeDataset(size=50, end=_END)
+        server = FakeKatanaServer(dataset, requests_per_minute=None)
+        touched = dataset.touch("/sales_orders", 4, now=_END + timedelta(hours=1))
+
+        response = _get(
+            server,
+            "/sales_orders",
+            include_deleted="true",
+            updated_at_min=(_END + timedelta(minutes=1)).isoformat(),
+        )
+
+        assert [r["id"] for r in response.json()["data"]] == touched
+
+    def test_ids_filter(self, dataset: FakeDataset) -> None:
+        server = FakeKatanaServer(dataset, requests_per_minute=None)
+
+        response = _get(server, "/materials", ids="3,5", include_deleted="true")
+
+        assert [r["id"] for r in response.json()["data"]] == [3, 5]
+
+    def test_variant_extend_embeds_parent(self, dataset: FakeDataset) -> None:
+        server = FakeKatanaServer(dataset, requests_per_minute=None)
+
+        variant = _get(server, "/variants", extend="product_or_material").json()[
+            "data"
+        ][0]
+
+        assert variant["product_or_material"]["id"] == variant["product_id"]
+        assert "variants" not in variant["product_or_material"]
+
+    def test_factory_is_a_bare_object(self, dataset: FakeDataset) -> None:
+        server = FakeKatanaServer(dataset, requests_per_minute=None)
+
+        assert _get(server, "/factory").json()["base_currency_code"] == "USD"
+
+    def test_detail_get_and_etag(self, dataset: FakeDataset) -> None:
+        server = FakeKatanaServer(dataset, requests_per_minute=None)
+        first = _get(server, "/products/7")
+
+        revalidated = server.respond(
+            httpx.Request(
+                "GET",
+                "http://katana.test/v1/products/7",
+                headers={
+                    "Authorization": "Bearer key-a",
+                    "If-None-Match": first.headers["ETag"],
+                },
+            )
+        )
+
+        assert first.json()["id"] == 7
+        assert revalidated.status_code == 304
+
+    @pytest.mark.parametrize(
+        ("path", "status"), [("/products/99999", 404), ("/nope", 404)]
+    )
+    def test_unknown_resources(
+        self, dataset: FakeDataset, path: str, status: int
+    ) -> None:
+        server = FakeKatanaServer(dataset, requests_per_minute=None)
+
+        assert _get(server, path).status_code == status
+
+    def test_requires_authorization(self, dataset: FakeDataset) -> None:
+        server = FakeKatanaServer(dataset)
+
+        response = server.respond(
+            httpx.Request("GET", "http://katana.test/v1/products")
+        )
+
+        assert response.status_code == 401
+
+    def test_writes_are_rejected(self, dataset: FakeDataset) -> None:
+        server = FakeKatanaServer(dataset, requests_per_minute=None)
+
+        response = server.respond(
+            httpx.Request(
+                "POST",
+                "http://katana.test/v1/products",
+                headers={"Authorization": "Bearer key-a"},
+                json={},
+            )
+        )
+
+        assert response.status_code == 405
+
+    def test_rate_limit_window(self, dataset: FakeDataset) -> None:
+        now = 1_700_000_000.0
+        server = FakeKatanaServer(dataset, requests_per_minute=3, clock=lambda: now)
+
+        responses = [_get(server, "/locations") for _ in range(4)]
+        other_key = _get(server, "/locations", token="key-b")
+
+        assert [r.status_code for r in responses] == [200, 200, 200, 429]
+        assert [r.headers["X-Ratelimit-Remaining"] for r in responses] == [
+            "2",
+            "1",
+            "0",
+            "0",
+        ]
+        assert responses[0].headers["X-Ratelimit-Limit"] == "3"
+        assert responses[3].headers["X-Ratelimit-Reset"] == str(int((now + 60) * 1000))
+        assert responses[3].headers["Retry-After"] == "60"
+        assert other_key.status_code == 200
+        assert server.rate_limited == 1
+
+        now += 60
+        assert _get(server, "/locations").status_code == 200
+
+    def test_rejects_bad_arguments(self) -> None:
+        with pytest.raises(ValueError, match="requests_per_minute must be positive"):
+            FakeKatanaServer(FakeDataset(size=1), requests_per_minute=0)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestFakeKatanaServerWithClient:
+    async def test_client_auto_paginates_everything(self, dataset: FakeDataset) -> None:
+        server = FakeKatanaServer(dataset, requests_per_minute=None)
+
+        async with KatanaClient(
+            api_key="fake",
+            base_url="http://katana.test/v1",
+            base_transport=server,
+            requests_per_minute=None,
+        ) as client:
+            response = await get_all_products.asyncio_detailed(
+                client=client, limit=25, include_deleted=True, include_archived=True
+            )
+
+        assert len(unwrap_data(response)) == len(dataset.records("/products"))
+        assert server.requests == -(-len(dataset.records("/products")) // 25)
+
+
+@pytest.fixture
+def http_server(dataset: FakeDataset) -> Iterator[str]:
+    server = FakeKatanaServer(dataset, requests_per_minute=None).make_http_server(
+        port=0
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    try:
+        yield f"http://{host}:{port}/v1"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.unit
+class TestFakeKatanaHttpServer:
+    def test_serves_over_http(self, http_server: str) -> None:
+        with httpx.Client(headers={"Authorization": "Bearer key-a"}) as client:
+            response = client.get(f"{http_server}/tax_rates")
+            missing = client.get(f"{http_server}/products/99999")
+
+        assert response.status_code == 200
+        assert len(response.json()["data"]) == 3
+        assert "X-Pagination" in response.headers
+        assert missing.status_code == 404
+
+    def test_cli_rejects_unknown_flags(self) -> None:
+        with pytest.raises(SystemExit):
+            main(["--bogus"])
@@ -4,6 +4,8 @@ These tests verify that our Katana client properly integrates with
 the generated OpenAPI client and doesn't break existing functionality.
 """
 
+import copy
+import pickle
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -263,3 +265,59 @@ class TestSalesOrderStatusEnum:
             }
         )
         assert so.status == SalesOrderStatus.PENDING
+
+
+_VARIANT_RECORD: dict[str, Any] = {"id": 1, "sku": "KNF-1", "type": "product"}
+
+
+class TestLazyAdditionalProperties:
+    """Generated models keep ``None`` until a payload carries unknown keys."""
+
+    def test_known_keys_leave_the_slot_unallocated(self) -> None:
+        from katana_public_api_client.models import Variant
+
+        variant = Variant.from_dict(_VARIANT_RECORD)
+
+        assert variant._additional_properties is None
+        assert variant.additional_keys == []
+        assert "extra" not in variant
+        assert variant.to_dict() == _VARIANT_RECORD
+        assert variant._additional_properties is None
+        assert not hasattr(variant, "__dict__")
+
+    def test_unknown_keys_round_trip(self) -> None:
+        from katana_public_api_client.models import Variant
+
+        variant = Variant.from_dict({**_VARIANT_RECORD, "extra": 5})
+
+        assert variant.additional_properties == {"extra": 5}
+        assert variant["extra"] == 5
+        assert variant.to_dict() == {**_VARIANT_RECORD, "extra": 5}
+
+    def test_access_allocates_and_equality_ignores_it(self) -> None:
+        from katana_public_api_client.models import Variant
+
+        untouched = Variant.from_dict(_VARIANT_RECORD)
+        touched = Variant.from_dict(_VARIANT_RECORD)
+        touched.additional_properties.update({})
+
+        assert touched._additional_properties == {}
+        assert touched == untouched
+
+        touched["extra"] = 5
+        assert touched != untouched
+        assert touched.additional_keys == ["extra"]
+
+
+class TestUnsetIdentity:
+    """``UNSET`` survives pickling and copying as the same singleton."""
+
+    def test_copies_keep_unset(self) -> None:
+        from katana_public_api_client.client_types import UNSET
+        from katana_public_api_client.models import Variant
+
+        variant = Variant.from_dict(_VARIANT_RECORD)
+
+        for copied in (copy.deepcopy(variant), pickle.loads(pickle.dumps(variant))):
+            assert copied.product_id is UNSET
+            assert copied == variant
@@ -0,0 +1,442 @@
+"""Tests for ``HttpCacheStore`` and ``HttpCacheTransport``."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from katana_public_api_client import KatanaClient
+from katana_public_api_client.http_cache import (
+    HTTP_CACHE_EXTENSION,
+    CachedResponse,
+    HttpCacheStore,
+    HttpCacheTransport,
+)
+from katana_public_api_client.katana_client import (
+    ErrorLoggingTransport,
+    PaginationTransport,
+    RateLimitAwareRetry,
+    ResilientAsyncTransport,
+)
+
+
+class _Origin:
+    """Fake Katana resource server that honours ``If-None-Match``.
+
+    Every resource is ``{"path": <path>, "version": <n>}`` with
+    ``ETag: "v<n>"``; bump ``versions[path]`` (or send a write) to simulate
+    an edit.
+    """
+
+    def __init__(self, *, cache_control: str | None = None, etag: bool = True):
+        self.cache_control = cache_control
+        self.etag = etag
+        self.versions: dict[str, int] = {}
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+        if request.method != "GET":
+            self.versions[path] = self.versions.get(path, 1) + 1
+            return httpx.Response(200, json={})
+        version = self.versions.setdefault(path, 1)
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["ETag"] = f'"v{version}"'
+            if request.headers.get("If-None-Match") == headers["ETag"]:
+                return httpx.Response(304, headers=headers)
+        if self.cache_control is not None:
+            headers["Cache-Control"] = self.cache_control
+        return httpx.Response(
+            200, headers=headers, json={"path": path, "version": version}
+        )
+
+
+def _transport(tmp_path: Path, origin: _Origin, **kwargs: Any) -> HttpCacheTransport:
+    return HttpCacheTransport(
+        httpx.MockTransport(origin),
+        store=HttpCacheStore(tmp_path / "http.db"),
+        **kwargs,
+    )
+
+
+def _get(path: str = "/products/7", token: str = "key-a") -> httpx.Request:
+    return httpx.Request(
+        "GET",
+        f"https://api.example.test{path}",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+
+async def _fetch(transport: HttpCacheTransport, request: httpx.Request) -> Any:
+    response = await transport.handle_async_request(request)
+    await response.aread()
+    return response
+
+
+@pytest.mark.unit
+class TestHttpCacheStore:
+    def test_rejects_non_positive_capacity(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="max_entries must be positive"):
+            HttpCacheStore(tmp_path / "http.db", max_entries=0)
+
+    def test_round_trip_and_validators(self, tmp_path: Path) -> None:
+        store = HttpCacheStore(tmp_path / "cache" / "http.db")
+        entry = CachedResponse(
+            status_code=200,
+            headers=[("ETag", '"abc"'), ("Last-Modified", "Tue, 01 Jan 2030")],
+            content=b'{"id": 1}',
+            stored_at=1.0,
+            expires_at=2.0,
+        )
+        store.put("k", "/products/1", entry)
+
+        loaded = HttpCacheStore(tmp_path / "cache" / "http.db").get("k")
+
+        assert loaded == entry
+        assert loaded is not None
+        assert loaded.etag == '"abc"'
+        assert loaded.last_modified == "Tue, 01 Jan 2030"
+        assert not loaded.is_fresh(now=3.0)
+
+    def test_evicts_least_recently_stored(self, tmp_path: Path) -> None:
+        store = HttpCacheStore(tmp_path / "http.db", max_entries=2)
+        for i in range(3):
+            store.put(
+                f"k{i}",
+                "/p",
+                CachedResponse(200, [], b"", stored_at=float(i), expires_at=0.0),
+            )
+
+        assert store.get("k0") is None
+        assert store.get("k1") is not None
+        assert store.get("k2") is not None
+
+    def test_eviction_runs_only_past_capacity(self, tmp_path: Path) -> None:
+        store = HttpCacheStore(tmp_path / "http.db", max_entries=3)
+        statements: list[str] = []
+        store._conn.set_trace_callback(statements.append)
+
+        for i in range(3):
+            store.put(f"k{i}", "/p", CachedResponse(200, [], b"", float(i), 0.0))
+        assert not [sql for sql in statements if sql.startswith("DELETE")]
+
+        store.put("k3", "/p", CachedResponse(200, [], b"", 3.0, 0.0))
+        assert store.get("k0") is None
+        plan = store._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT key FROM http_cache "
+            "ORDER BY stored_at DESC LIMIT -1 OFFSET 3"
+        ).fetchall()
+        assert "idx_http_cache_stored_at" in str(plan)
+
+    def test_invalidate_prefix_drops_the_collection_only(self, tmp_path: Path) -> None:
+        store = HttpCacheStore(tmp_path / "http.db")
+        paths = [
+            "/v1/sales_order_rows",
+            "/v1/sales_order_rows/5",
+            "/v1/sales_order_rowsX/5",
+            "/v1/sales_order_rows_archive",
+            "/v1/sales_orders/1",
+        ]
+        for path in paths:
+            store.put(path, path, CachedResponse(200, [], b"", 0.0, 0.0))
+
+        assert store.invalidate_prefix("/v1/sales_order_rows/") == 2
+
+        assert [path for path in paths if store.get(path) is not None] == paths[2:]
+
+    def test_keys_hash_the_credentials(self) -> None:
+        key_a = HttpCacheStore.key_for("https://x/p/1", "Bearer secret-a")
+        key_b = HttpCacheStore.key_for("https://x/p/1", "Bearer secret-b")
+
+        assert key_a != key_b
+        assert "secret" not in key_a
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestHttpCacheTransport:
+    async def test_revalidates_and_replays_on_304(self, tmp_path: Path) -> None:
+        origin = _Origin()
+        transport = _transport(tmp_path, origin)
+
+        first = await _fetch(transport, _get())
+        second = await _fetch(transport, _get())
+
+        assert first.extensions[HTTP_CACHE_EXTENSION] == "miss"
+        assert second.extensions[HTTP_CACHE_EXTENSION] == "revalidated"
+        assert second.status_code == 200
+        assert second.json() == {"path": "/products/7", "version": 1}
+        assert origin.requests[1].headers["If-None-Match"] == '"v1"'
+        assert transport.stats().misses == 1
+        assert transport.stats().revalidated == 1
+
+    async def test_changed_resource_is_refetched(self, tmp_path: Path) -> None:
+        origin = _Origin()
+        transport = _transport(tmp_path, origin)
+        await _fetch(transport, _get())
+
+        origin.versions["/products/7"] = 2
+        response = await _fetch(transport, _get())
+
+        assert response.json()["version"] == 2
+        assert response.extensions[HTTP_CACHE_EXTENSION] == "miss"
+
+    async def test_detail_ttl_serves_without_request(self, tmp_path: Path) -> None:
+        origin = _Origin(etag=False)
+        transport = _transport(tmp_path, origin, detail_ttl=30)
+
+        await _fetch(transport, _get())
+        hit = await _fetch(transport, _get())
+
+        assert len(origin.requests) == 1
+        assert hit.extensions[HTTP_CACHE_EXTENSION] == "hit"
+        assert hit.json() == {"path": "/products/7", "version": 1}
+        assert transport.stats().hits == 1
+
+    async def test_detail_ttl_expires(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        origin = _Origin()
+        transport = _transport(tmp_path, origin, detail_ttl=30)
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now)
+        await _fetch(transport, _get())
+
+        monkeypatch.setattr(time, "time", lambda: now + 31)
+        response = await _fetch(transport, _get())
+
+        assert len(origin.requests) == 2
+        assert response.extensions[HTTP_CACHE_EXTENSION] == "revalidated"
+
+    async def test_ttl_applies_only_to_detail_gets(self, tmp_path: Path) -> None:
+        origin = _Origin()
+        transport = _transport(tmp_path, origin, detail_ttl=30)
+
+        await _fetch(transport, _get("/products?limit=50"))
+        await _fetch(transport, _get("/products?limit=50"))
+
+        assert len(origin.requests) == 2
+
+    async def test_max_age_overrides_ttl(self, tmp_path: Path) -> None:
+        origin = _Origin(cache_control="max-age=60")
+        transport = _transport(tmp_path, origin)
+
+        await _fetch(transport, _get("/products"))
+        hit = await _fetch(transport, _get("/products"))
+
+        assert len(origin.requests) == 1
+        assert hit.extensions[HTTP_CACHE_EXTENSION] == "hit"
+
+    async def test_response_no_store_is_not_cached(self, tmp_path: Path) -> None:
+        origin = _Origin(cache_control="no-store")
+        transport = _transport(tmp_path, origin, detail_ttl=30)
+
+        await _fetch(transport, _get())
+        await _fetch(transport, _get())
+
+        assert len(origin.requests) == 2
+        assert "If-None-Match" not in origin.requests[1].headers
+
+    async def test_response_no_cache_always_revalidates(self, tmp_path: Path) -> None:
+        origin = _Origin(cache_control="no-cache")
+        transport = _transport(tmp_path, origin, detail_ttl=30)
+
+        await _fetch(transport, _get())
+        response = await _fetch(transport, _get())
+
+        assert response.extensions[HTTP_CACHE_EXTENSION] == "revalidated"
+
+    async def test_request_no_cache_forces_revalidation(self, tmp_path: Path) -> None:
+        origin = _Origin()
+        transport = _transport(tmp_path, origin, detail_ttl=30)
+        await _fetch(transport, _get())
+
+        request = _get()
+        request.headers["Cache-Control"] = "no-cache"
+        response = await _fetch(transport, request)
+
+        assert response.extensions[HTTP_CACHE_EXTENSION] == "revalidated"
+
+    async def test_callers_own_conditional_request_passes_through(
+        self, tmp_path: Path
+    ) -> None:
+        origin = _Origin()
+        transport = _transport(tmp_path, origin)
+        await _fetch(transport, _get())
+
+        request = _get()
+        request.headers["If-None-Match"] = '"v1"'
+        response = await _fetch(transport, request)
+
+        assert response.status_code == 304
+
+    async def test_write_invalidates_cached_reads(self, tmp_path: Path) -> None:
+        origin = _Origin(etag=False)
+        transport = _transport(tmp_path, origin, detail_ttl=300)
+        await _fetch(transport, _get())
+
+        await _fetch(
+            transport,
+            httpx.Request("PATCH", "https://api.example.test/products/7", json={}),
+        )
+        response = await _fetch(transport, _get())
+
+        assert response.json()["version"] == 2
+
+    async def test_write_invalidates_its_whole_collection(self, tmp_path: Path) -> None:
+        origin = _Origin(etag=False, cache_control="max-age=300")
+        transport = _transport(tmp_path, origin)
+        for path in ("/products", "/products/8", "/products/7", "/sales_orders/1"):
+            await _fetch(transport, _get(path))
+
+        await _fetch(
+            transport,
+            httpx.Request("PATCH", "https://api.example.test/products/7", json={}),
+        )
+        outcomes = [
+            (await _fetch(transport, _get(path))).extensions[HTTP_CACHE_EXTENSION]
+            for path in ("/products", "/products/8", "/sales_orders/1")
+        ]
+
+        # Other collections embedding the resource stay cached until stale
+        assert outcomes == ["miss", "miss", "hit"]
+
+    async def test_revalidation_leaves_callers_request_untouched(
+        self, tmp_path: Path
+    ) -> None:
+        origin = _Origin()
+        transport = _transport(tmp_path, origin)
+        await _fetch(transport, _get())
+
+        request = _get()
+        await _fetch(transport, request)
+
+        assert "If-None-Match" in origin.requests[1].headers
+        assert "If-None-Match" not in request.headers
+
+    async def test_retried_revalidation_returns_the_stored_body(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # The retry policy's backoff jitter doesn't mix well with looptime;
+        # skip the retry's own sleeps instead
+        monkeypatch.setattr(RateLimitAwareRetry, "asleep", AsyncMock())
+        statuses = iter([200, 503])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            status = next(statuses, 304)
+            if status == 304 and request.headers.get("If-None-Match") != '"v1"':
+                status = 200
+            body = {"id": 7} if status == 200 else {}
+            return httpx.Response(status, headers={"ETag": '"v1"'}, json=body)
+
+        transport = ResilientAsyncTransport(
+            http_cache=HttpCacheStore(tmp_path / "http.db"),
+            base_transport=httpx.MockTransport(handler),
+            requests_per_minute=None,
+        )
+        async with httpx.AsyncClient(
+            transport=transport, base_url="https://api.example.test"
+        ) as client:
+            await client.get("/products/7")
+            second = await client.get("/products/7")
+
+        assert second.status_code == 200
+        assert second.json() == {"id": 7}
+        assert second.extensions[HTTP_CACHE_EXTENSION] == "revalidated"
+
+    async def test_api_keys_do_not_share_entries(self, tmp_path: Path) -> None:
+        origin = _Origin(etag=False)
+        transport = _transport(tmp_path, origin, detail_ttl=30)
+
+        await _fetch(transport, _get(token="key-a"))
+        await _fetch(transport, _get(token="key-b"))
+
+        assert len(origin.requests) == 2
+
+    async def test_store_calls_run_off_the_event_loop(self, tmp_path: Path) -> None:
+        transport = _transport(tmp_path, _Origin())
+        threads: list[int] = []
+        for name in ("get", "put", "invalidate_prefix"):
+            method = getattr(transport.store, name)
+
+            def record(*args: Any, _method: Any = method) -> Any:
+                threads.append(threading.get_ident())
+                return _method(*args)
+
+            setattr(transport.store, name, record)
+
+        await _fetch(transport, _get())
+        await _fetch(transport, httpx.Request("DELETE", _get().url))
+
+        assert len(threads) == 3
+        assert threading.get_ident() not in threads
+
+    async def test_store_is_shared_across_transports(self, tmp_path: Path) -> None:
+        origin = _Origin(etag=False)
+        first = _transport(tmp_path, origin, detail_ttl=30)
+        second = _transport(tmp_path, origin, detail_ttl=30)
+
+        await _fetch(first, _get())
+        hit = await _fetch(second, _get())
+
+        assert len(origin.requests) == 1
+        assert hit.extensions[HTTP_CACHE_EXTENSION] == "hit"
+
+
+@pytest.mark.unit
+class TestHttpCacheWiring:
+    def test_rejects_negative_ttl(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="detail_ttl must not be negative"):
+            _transport(tmp_path, _Origin(), detail_ttl=-1)
+
+    def test_disabled_by_default(self) -> None:
+        assert KatanaClient(api_key="test-key").http_cache is None
+
+    def test_path_builds_store(self, tmp_path: Path) -> None:
+        client = KatanaClient(
+            api_key="test-key", http_cache=tmp_path / "http.db", http_cache_ttl=5
+        )
+
+        cache = client.http_cache
+        assert cache is not None
+        assert cache.store.path == tmp_path / "http.db"
+        assert cache._detail_ttl == 5
+
+    @pytest.mark.asyncio
+    async def test_store_opened_from_a_path_closes_with_the_client(
+        self, tmp_path: Path
+    ) -> None:
+        async with KatanaClient(
+            api_key="test-key", http_cache=tmp_path / "http.db"
+        ) as client:
+            cache = client.http_cache
+        assert cache is not None
+        with pytest.raises(sqlite3.ProgrammingError, match="closed"):
+            cache.store.get("k")
+
+    @pytest.mark.asyncio
+    async def test_store_passed_in_stays_open(self, tmp_path: Path) -> None:
+        store = HttpCacheStore(tmp_path / "http.db")
+        async with KatanaClient(api_key="test-key", http_cache=store):
+            pass
+        assert store.get("k") is None
+        store.close()
+
+    def test_factory_places_cache_between_pagination_and_error_logging(
+        self, tmp_path: Path
+    ) -> None:
+        transport = ResilientAsyncTransport(http_cache=HttpCacheStore(tmp_path / "h"))
+        pagination: Any = transport._async_transport
+        assert isinstance(pagination, PaginationTransport)
+        cache = pagination._wrapped_transport
+        assert isinstance(cache, HttpCacheTransport)
+        assert isinstance(cache._wrapped_transport, ErrorLoggingTransport)
@@ -0,0 +1,141 @@
+"""Import-time budget for ``katana_public_api_client``.
+
+The ``models`` and ``api`` packages load their submodules on first attribute
+access, so a cold ``import katana_public_api_client`` only pays for the
+models the client itself needs, and ``katana_client`` imports its optional
+layers (bulk writes, shared rate limiting, the HTTP cache, metrics, streamed
+JSON) where they are used. These tests import the package in a fresh
+interpreter and fail if the generated packages go back to loading everything
+up front, or if the package starts loading more of its own modules. The
+pydantic registry is lazy too: converting one ``Variant`` (the
+``convert_variant`` scenario of ``scripts/benchmark_imports.py``) loads only
+the generated domains it needs.
+"""
+
+from __future__ import annotations
+
+import importlib
+import pkgutil
+import subprocess
+import sys
+import textwrap
+
+import pytest
+from scripts.benchmark_imports import ATTRS_PREFIX, PYDANTIC_PREFIX, SCENARIOS
+
+from katana_public_api_client import api, models
+
+PACKAGE = "katana_public_api_client"
+
+# Eager packages loaded all ~460 model modules (over 60% of import time);
+# lazy ones load ~35, those the domain helpers are built on.
+MAX_MODEL_MODULES = 50
+MAX_MODELS_SHARE = 0.35
+# Modules of this package a cold import loads (86 today, 129 before the
+# optional layers and validation-error models were deferred)
+MAX_PACKAGE_MODULES = 100
+DEFERRED_MODULES = (
+    f"{PACKAGE}.bulk",
+    f"{PACKAGE}.http_cache",
+    f"{PACKAGE}.json_stream",
+    f"{PACKAGE}.metrics",
+    f"{PACKAGE}.shared_rate_limit",
+    f"{PACKAGE}.models.enum_validation_error",
+    f"{PACKAGE}.models.required_validation_error",
+)
+
+
+def _import_times(statement: str) -> dict[str, tuple[int, int]]:
+    """Return ``{module: (self_us, cumulative_us)}`` for a cold ``statement``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=60,
+    )
+    times: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, module = line.removeprefix("import time:").split("|")
+        times[module.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def _loaded_modules(statement: str) -> set[str]:
+    """Return the modules in ``sys.modules`` after a cold ``statement``."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys; {statement}; print(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=60,
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.unit
+class TestImportTimeBudget:
+    def test_cold_import_stays_within_budget(self) -> None:
+        times = _import_times(f"import {PACKAGE}")
+
+        model_modules = [m for m in times if m.startswith(f"{PACKAGE}.models.")]
+        models_us = sum(
+            self_us
+            for m, (self_us, _) in times.items()
+            if m.startswith(f"{PACKAGE}.models")
+        )
+        total_us = times[PACKAGE][1]
+
+        assert len(model_modules) <= MAX_MODEL_MODULES
+        assert models_us / total_us <= MAX_MODELS_SHARE
+
+    def test_cold_import_loads_few_package_modules(self) -> None:
+        modules = _loaded_modules(f"import {PACKAGE}")
+
+        package_modules = {m for m in modules if m.startswith(f"{PACKAGE}.")}
+        assert len(package_modules) <= MAX_PACKAGE_MODULES
+        assert not package_modules.intersection(DEFERRED_MODULES)
+
+
+@pytest.mark.unit
+class TestLazyPydanticRegistry:
+    def test_one_conversion_loads_only_its_domain(self) -> None:
+        """Converting one ``Variant`` loads well under half the model modules."""
+        scenario = next(s for s in SCENARIOS if s.name == "convert_variant")
+        modules = _loaded_modules(textwrap.dedent(scenario.code).strip())
+
+        generated = importlib.import_module(PYDANTIC_PREFIX.rstrip("."))
+        domains = {info.name for info in pkgutil.iter_modules(generated.__path__)}
+        pydantic_loaded = {m for m in modules if m.startswith(PYDANTIC_PREFIX)}
+        attrs_loaded = {m for m in modules if m.startswith(ATTRS_PREFIX)}
+        assert len(pydantic_loaded) < len(domains) / 2
+        assert len(attrs_loaded) < len(models.__all__) / 2
+
+
+@pytest.mark.unit
+class TestLazyPackages:
+    def test_models_resolve_on_access(self) -> None:
+        from katana_public_api_client.models.product import Product
+
+        assert models.Product is Product
+        assert "Product" in dir(models)
+        assert len(models.__all__) == len(set(models.__all__))
+        with pytest.raises(AttributeError, match="NotAModel"):
+            _ = models.NotAModel
+
+    def test_star_import_exports_every_model(self) -> None:
+        namespace: dict[str, object] = {}
+        exec("from katana_public_api_client.models import *", namespace)
+
+        assert set(models.__all__) <= namespace.keys()
+
+    def test_api_packages_resolve_submodules(self) -> None:
+        from katana_public_api_client.api.product import get_all_products
+
+        assert api.product.get_all_products is get_all_products
+        assert "sales_order" in api.__all__
+        assert "get_all_products" in dir(api.product)
+        with pytest.raises(AttributeError, match="no_such_endpoint"):
+            _ = api.product.no_such_endpoint
@@ -0,0 +1,226 @@
+"""Tests for the pluggable JSON codec and its wiring through the transport chain."""
+
+import importlib.util
+import json
+import sys
+from typing import Any
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from katana_public_api_client import KatanaClient
+from katana_public_api_client.json_codec import (
+    STDLIB_JSON_CODEC,
+    MsgspecCodec,
+    OrjsonCodec,
+    StdlibJSONCodec,
+    resolve_json_codec,
+)
+from katana_public_api_client.katana_client import (
+    ErrorLoggingTransport,
+    JSONCodecTransport,
+    PaginationTransport,
+)
+from katana_public_api_client.models import Product
+from katana_public_api_client.utils import unwrap_as
+
+
+class RecordingCodec(StdlibJSONCodec):
+    """Stdlib codec that counts calls, to prove a site routes through the codec."""
+
+    name = "recording"
+
+    def __init__(self) -> None:
+        self.loads_calls = 0
+        self.dumps_calls = 0
+
+    def loads(self, data: bytes | str) -> Any:
+        self.loads_calls += 1
+        return super().loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        self.dumps_calls += 1
+        return super().dumps(obj)
+
+
+def _available_codecs() -> list[Any]:
+    params = [pytest.param(StdlibJSONCodec, id="stdlib")]
+    for name, cls in (("orjson", OrjsonCodec), ("msgspec", MsgspecCodec)):
+        marks = pytest.mark.skipif(
+            importlib.util.find_spec(name) is None, reason=f"{name} not installed"
+        )
+        params.append(pytest.param(cls, id=name, marks=marks))
+    return params
+
+
+class TestCodecs:
+    """Every backend round-trips the same documents and raises the same error."""
+
+    @pytest.mark.parametrize("codec_cls", _available_codecs())
+    def test_round_trip(self, codec_cls):
+        codec = codec_cls()
+        payload = {"data": [{"id": 1, "name": "Café", "price": 9.5, "tags": None}]}
+
+        assert codec.loads(codec.dumps(payload)) == payload
+        assert codec.loads(json.dumps(payload)) == payload
+        assert isinstance(codec.dumps(payload), bytes)
+
+    @pytest.mark.parametrize("codec_cls", _available_codecs())
+    def test_malformed_input_raises_json_decode_error(self, codec_cls):
+        with pytest.raises(json.JSONDecodeError):
+            codec_cls().loads(b"{not json")
+
+
+class TestResolveJsonCodec:
+    def test_stdlib_by_name(self):
+        assert resolve_json_codec("stdlib") is STDLIB_JSON_CODEC
+
+    def test_instance_passes_through(self):
+        codec = RecordingCodec()
+        assert resolve_json_codec(codec) is codec
+
+    def test_auto_falls_back_to_stdlib_when_nothing_installed(self):
+        with patch("importlib.util.find_spec", return_value=None):
+            assert resolve_json_codec("auto") is STDLIB_JSON_CODEC
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("orjson") is None, reason="orjson not installed"
+    )
+    def test_auto_prefers_orjson(self):
+        assert resolve_json_codec("auto").name == "orjson"
+
+    def test_unknown_name_raises_value_error(self):
+        name: Any = "simdjson"
+        with pytest.raises(ValueError, match="Unknown JSON codec 'simdjson'"):
+            resolve_json_codec(name)
+
+    def test_missing_backend_raises_import_error_with_hint(self):
+        with (
+            patch.dict(sys.modules, {"orjson": None}),
+            pytest.raises(ImportError, match=r"katana-openapi-client\[fast-json\]"),
+        ):
+            resolve_json_codec("orjson")
+
+
+class TestTransportWiring:
+    @pytest.mark.asyncio
+    async def test_codec_transport_routes_response_json(self):
+        codec = RecordingCodec()
+        transport = JSONCodecTransport(
+            wrapped_transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json={"id": 7})
+            ),
+            json_codec=codec,
+        )
+        request = httpx.Request("GET", "https://api.example.com/products/7")
+
+        response = await transport.handle_async_request(request)
+        await response.aread()
+
+        assert response.json() == {"id": 7}
+        assert codec.loads_calls == 1
+        assert response.request is request
+
+    @pytest.mark.asyncio
+    async def test_codec_transport_passes_body_stream_through(self):
+        transport = JSONCodecTransport(
+            wrapped_transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    201, content=b'{"ok": true}', headers={"X-Custom": "yes"}
+                )
+            ),
+            json_codec="stdlib",
+        )
+
+        response = await transport.handle_async_request(
+            httpx.Request("POST", "https://api.example.com/products")
+        )
+        await response.aread()
+
+        assert response.status_code == 201
+        assert response.headers["X-Custom"] == "yes"
+        assert response.content == b'{"ok": true}'
+
+    @pytest.mark.asyncio
+    async def test_error_logging_decodes_request_body_with_codec(self):
+        codec = RecordingCodec()
+        transport = ErrorLoggingTransport(
+            wrapped_transport=httpx.MockTransport(
+                lambda request: httpx.Response(400, json={"message": "bad"})
+            ),
+            json_codec=codec,
+        )
+
+        await transport.handle_async_request(
+            httpx.Request("POST", "https://api.example.com/products", json={"a": 1})
+        )
+
+        assert codec.loads_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_pagination_encodes_combined_body_with_codec(self):
+        codec = RecordingCodec()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            return httpx.Response(
+                200,
+                json={"data": [{"id": page}]},
+                headers={"X-Pagination": json.dumps({"total_pages": 2})},
+            )
+
+        transport = PaginationTransport(
+            wrapped_transport=httpx.MockTransport(handler), json_codec=codec
+        )
+
+        response = await transport.handle_async_request(
+            httpx.Request("GET", "https://api.example.com/products")
+        )
+
+        assert response.json()["data"] == [{"id": 1}, {"id": 2}]
+        # One X-Pagination header per page
+        assert codec.loads_calls == 2
+        # The combined body is encoded only once it is read
+        assert codec.dumps_calls == 0
+        assert json.loads(response.content) == response.json()
+        assert codec.dumps_calls == 1
+
+
+class TestKatanaClientCodec:
+    def test_client_resolves_codec_by_name(self):
+        client = KatanaClient(
+            api_key="test-key",
+            base_url="https://api.katana.test",
+            json_codec="stdlib",
+        )
+        assert client.json_codec is STDLIB_JSON_CODEC
+
+    @pytest.mark.asyncio
+    async def test_generated_parser_decodes_through_client_codec(self):
+        """The generated ``_parse_response`` reaches the codec via ``response.json()``."""
+        from katana_public_api_client.api.product import get_product
+
+        codec = RecordingCodec()
+        client = KatanaClient(
+            api_key="test-key",
+            base_url="https://api.katana.test",
+            requests_per_minute=None,
+            json_codec=codec,
+        )
+
+        async def handle(
+            self: httpx.AsyncHTTPTransport, request: httpx.Request
+        ) -> httpx.Response:
+            return httpx.Response(
+                200, json={"id": 5, "name": "Widget", "type": "product"}
+            )
+
+        with patch.object(httpx.AsyncHTTPTransport, "handle_async_request", handle):
+            async with client:
+                response = await get_product.asyncio_detailed(client=client, id=5)
+
+        assert unwrap_as(response, Product).id == 5
+        # PaginationTransport probes the GET body for pagination info, then the
+        # generated parser decodes it — both through the client's codec.
+        assert codec.loads_calls == 2
@@ -0,0 +1,173 @@
+"""Tests for incremental list parsing (``json_stream`` and ``stream_items``)."""
+
+from __future__ import annotations
+
+import json
+import tracemalloc
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import Any
+
+import httpx
+import pytest
+
+from katana_public_api_client import KatanaClient
+from katana_public_api_client.api.product import get_all_products
+from katana_public_api_client.json_stream import JSONItemSplitter, aiter_json_items
+from katana_public_api_client.models.product import Product
+from katana_public_api_client.testing.fake_server import FakeDataset, FakeKatanaServer
+from katana_public_api_client.utils import AuthenticationError
+
+TRICKY = {
+    "meta": {"data": [{"decoy": True}]},
+    "data": [
+        {"note": 'quote " and \\ backslash ] } , [ {', "n": 1},
+        {"nested": {"data": [1, [2, 3]], "empty": {}}, "n": 2},
+        "plain string",
+        -12.5e3,
+        None,
+        [],
+        {"unicode": "żółć ☃ \U0001f600", "escaped": "\u0000\t"},
+    ],
+    "after": {"data": ["ignored"]},
+}
+
+
+def _split(document: bytes, size: int, key: str = "data") -> list[Any]:
+    splitter = JSONItemSplitter(key)
+    items: list[bytes] = []
+    for start in range(0, len(document), size):
+        items.extend(splitter.feed(document[start : start + size]))
+    splitter.close()
+    return [json.loads(item) for item in items]
+
+
+async def _chunks(parts: Iterator[bytes]) -> AsyncIterator[bytes]:
+    for part in parts:
+        yield part
+
+
+@pytest.mark.unit
+class TestJSONItemSplitter:
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 1 << 20])
+    def test_items_survive_any_chunking(self, size: int) -> None:
+        document = json.dumps(TRICKY, ensure_ascii=False).encode()
+
+        assert _split(document, size) == TRICKY["data"]
+
+    @pytest.mark.parametrize(
+        ("document", "expected"),
+        [
+            (b"[1, 2, 3]", [1, 2, 3]),
+            (b' { "data" : [ ] } ', []),
+            (b'{"total": 0}', []),
+            (b'{"items": {"data": [1]}, "data": [2]}', [2]),
+        ],
+    )
+    def test_document_shapes(self, document: bytes, expected: list[Any]) -> None:
+        assert _split(document, 1) == expected
+
+    def test_custom_key(self) -> None:
+        document = b'{"data": [1], "rows": [{"id": 7}]}'
+
+        assert _split(document, 4, key="rows") == [{"id": 7}]
+
+    def test_truncated_array_raises(self) -> None:
+        splitter = JSONItemSplitter()
+        assert splitter.feed(b'{"data": [{"id": 1}, {"id"') == [b'{"id": 1}']
+
+        with pytest.raises(json.JSONDecodeError, match="Unterminated array"):
+            splitter.close()
+
+    def test_stops_after_array(self) -> None:
+        splitter = JSONItemSplitter()
+
+        assert splitter.feed(b'{"data": [1]') == [b"1"]
+        assert splitter.done
+        assert splitter.feed(b', "data": [2]}') == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestStreamItems:
+    async def test_streamed_items_match_buffered_pages(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        dataset = FakeDataset(size=60)
+        server = FakeKatanaServer(dataset, requests_per_minute=None)
+
+        client = make_katana_client(server)
+        async with client:
+            buffered = [
+                product.to_dict()
+                async for product in client.aiter_items(get_all_products, page_size=25)
+            ]
+            before = server.requests
+            streamed = [
+                product
+                async for product in client.stream_items(
+                    get_all_products, item_type=Product, page_size=25
+                )
+            ]
+
+        assert len(buffered) > 50
+        assert all(isinstance(product, Product) for product in streamed)
+        assert [product.to_dict() for product in streamed] == buffered
+        assert server.requests - before == -(-len(buffered) // 25)
+
+    async def test_yields_dicts_without_item_type(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        server = FakeKatanaServer(FakeDataset(size=10), requests_per_minute=None)
+
+        client = make_katana_client(server)
+        async with client:
+            first = await anext(client.stream_items(get_all_products, max_pages=1))
+
+        assert isinstance(first, dict)
+        assert "id" in first
+
+    async def test_error_status_raises(
+        self, make_katana_client: Callable[..., KatanaClient]
+    ) -> None:
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(
+                401,
+                json={"statusCode": 401, "name": "Unauthorized", "message": "no"},
+            )
+        )
+
+        client = make_katana_client(transport)
+        async with client:
+            with pytest.raises(AuthenticationError):
+                async for _ in client.stream_items(get_all_products):
+                    pass
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_peak_memory_is_bounded_by_one_item() -> None:
+    count, note = 2000, "x" * 500
+
+    def body() -> Iterator[bytes]:
+        yield b'{"data": ['
+        for i in range(count):
+            yield (b"," if i else b"") + json.dumps({"id": i, "note": note}).encode()
+        yield b"]}"
+
+    body_size = sum(len(part) for part in body())
+
+    tracemalloc.start()
+    try:
+        seen = 0
+        async for item in aiter_json_items(_chunks(body())):
+            seen += item["id"] == seen
+        _, streamed_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        page = json.loads(b"".join(body()))
+        _, buffered_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert seen == len(page["data"]) == count
+    assert buffered_peak > body_size
+    assert streamed_peak < body_size / 20
@@ -537,6 +537,47 @@ class TestSerialNumberSentinelNull:
         assert pydantic_sn.serial_number == "null"
 
 
+class TestConversionPlans:
+    """``from_attrs``/``to_attrs`` compile a per-class field plan once and reuse it."""
+
+    def test_from_attrs_plan_is_cached_per_class_pair(self) -> None:
+        from katana_public_api_client.models import Variant as AttrsVariant
+        from katana_public_api_client.models_pydantic import _base
+        from katana_public_api_client.models_pydantic._generated import Variant
+
+        attrs_variant = AttrsVariant.from_dict({"id": 1, "sku": "S-1", "product_id": 2})
+        first = Variant.from_attrs(attrs_variant)
+        plan = _base._from_attrs_plans[Variant, AttrsVariant]
+        second = Variant.from_attrs(attrs_variant)
+
+        assert _base._from_attrs_plans[Variant, AttrsVariant] is plan
+        assert first == second
+        assert first.sku == "S-1"
+
+    def test_to_attrs_round_trips_dict_valued_field(self) -> None:
+        """``Factory.legal_address`` is a ``dict[str, Any]``, not a nested model.
+
+        Its annotation isn't a class, which used to crash ``to_attrs`` with
+        ``TypeError: issubclass() arg 1 must be a class``.
+        """
+        from katana_public_api_client.models import Factory as AttrsFactory
+        from katana_public_api_client.models_pydantic._generated import Factory
+
+        address = {"line_1": "1 Test Street", "city": "Tallinn"}
+        attrs_factory = AttrsFactory.from_dict(
+            {
+                "display_name": "F",
+                "base_currency_code": "USD",
+                "legal_address": address,
+            }
+        )
+
+        round_tripped = Factory.from_attrs(attrs_factory).to_attrs()
+
+        assert isinstance(round_tripped, AttrsFactory)
+        assert round_tripped.to_dict() == attrs_factory.to_dict()
+
+
 class TestManufacturingOrderNullDeadline:
     """ManufacturingOrder.production_deadline_date must accept None.
 
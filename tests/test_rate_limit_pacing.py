@@ -0,0 +1,300 @@
+"""Tests for ``RateLimitTransport``'s paced release of the reset-gate backlog.
+
+When the reset gate reopens, waking every queued request at once spends the
+refilled pyrate bucket in a single burst. Katana counts requests over a
+rolling window, so a burst lands on a window that only has room for the
+requests that just aged out of it, and most of the burst comes back ``429``.
+
+The harness here runs the transport against :class:`_SlidingWindowServer`
+under ``looptime``, with the wall clock and pyrate's bucket clock both slaved
+to the fake event-loop clock, so a few hundred simulated seconds of backlog
+drain in milliseconds and every run is deterministic.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from katana_public_api_client import KatanaClient
+from katana_public_api_client.katana_client import (
+    RateLimitQueueStats,
+    RateLimitTransport,
+    request_priority,
+)
+
+_EPOCH = 1_700_000_000.0
+_WINDOW_SECONDS = 60.0
+
+
+class _LoopClock:
+    """pyrate clock reading the (fake) event-loop clock, in milliseconds.
+
+    Captures the loop up front: pyrate's leaker thread reads the clock too.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+
+    def now(self) -> int:
+        return int(self._loop.time() * 1000)
+
+
+class _SlidingWindowServer(httpx.AsyncBaseTransport):
+    """Fake Katana enforcing ``limit`` requests per rolling 60-second window.
+
+    Answers ``429`` once the window is full, and reports
+    ``X-Ratelimit-Remaining`` plus an ``X-Ratelimit-Reset`` (epoch ms) at
+    which the oldest request in the window ages out.
+    """
+
+    def __init__(self, limit: int, *, latency: float = 0.05) -> None:
+        self.limit = limit
+        self.latency = latency
+        self.accepted: deque[float] = deque()
+        self.rejected = 0
+
+    def prefill_steady_state(self, now: float) -> None:
+        """Record one request per second over the last window (a busy client)."""
+        per_request = _WINDOW_SECONDS / self.limit
+        for i in range(self.limit - 1, -1, -1):
+            self.accepted.append(now - (i + 1) * per_request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(self.latency)
+        now = asyncio.get_running_loop().time()
+        while self.accepted and self.accepted[0] <= now - _WINDOW_SECONDS:
+            self.accepted.popleft()
+
+        if len(self.accepted) >= self.limit:
+            self.rejected += 1
+            status = 429
+        else:
+            self.accepted.append(now)
+            status = 200
+        reset_at = self.accepted[0] + _WINDOW_SECONDS
+        return httpx.Response(
+            status,
+            headers={
+                "X-Ratelimit-Remaining": str(self.limit - len(self.accepted)),
+                "X-Ratelimit-Reset": str(int((_EPOCH + reset_at) * 1000)),
+            },
+            request=request,
+        )
+
+
+def _make_request() -> httpx.Request:
+    return httpx.Request("GET", "https://api.example.test/sales_orders")
+
+
+def _slave_clocks(
+    transport: RateLimitTransport,
+    loop: asyncio.AbstractEventLoop,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Drive ``time.time`` and every pyrate bucket from the fake loop clock."""
+    monkeypatch.setattr(time, "time", lambda: _EPOCH + loop.time())
+    clock = _LoopClock(loop)
+    limiters = [transport._limiter]
+    if transport._bulk_limiter is not None:
+        limiters.append(transport._bulk_limiter)
+    for limiter in limiters:
+        for bucket in limiter.buckets():
+            monkeypatch.setattr(bucket, "_clock", clock)
+
+
+async def _drain_backlog(
+    monkeypatch: pytest.MonkeyPatch, *, reset_pacing: bool, backlog: int = 200
+) -> tuple[_SlidingWindowServer, RateLimitTransport]:
+    """Queue ``backlog`` requests behind a closed gate and retry 429s until done.
+
+    A first request exhausts a server window that a steady-state client has
+    already filled, closing the reset gate; the backlog then piles up behind
+    it. ``429`` responses are retried through the transport, as the retry
+    layer would, so the run ends once every request has succeeded.
+    """
+    loop = asyncio.get_running_loop()
+    server = _SlidingWindowServer(limit=60)
+    transport = RateLimitTransport(
+        wrapped_transport=server, requests_per_minute=60, reset_pacing=reset_pacing
+    )
+    _slave_clocks(transport, loop, monkeypatch)
+    server.prefill_steady_state(loop.time())
+
+    first = await transport.handle_async_request(_make_request())
+    assert first.status_code == 200
+    assert not transport._reset_gate.is_set()
+
+    async def send() -> None:
+        for _ in range(50):
+            response = await transport.handle_async_request(_make_request())
+            if response.status_code != 429:
+                return
+        pytest.fail("request still rate limited after 50 attempts")
+
+    await asyncio.gather(*(send() for _ in range(backlog)))
+    await transport.aclose()
+    return server, transport
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.looptime
+class TestResetBacklogPacing:
+    async def test_pacing_cuts_429s_for_200_request_backlog(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        burst_server, _ = await _drain_backlog(monkeypatch, reset_pacing=False)
+        paced_server, paced = await _drain_backlog(monkeypatch, reset_pacing=True)
+
+        # Released together, most of each burst lands on a full window
+        assert burst_server.rejected >= 50
+        # Paced at the steady-state rate, each request finds the slot that
+        # just aged out of the window
+        assert paced_server.rejected == 0
+
+        stats = paced.queue_stats()
+        assert stats.depth == 0
+        assert stats.waited == 200
+        assert stats.wait_seconds_max > 0
+
+    async def test_backlog_is_released_in_arrival_order(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(time, "time", lambda: _EPOCH)
+        wrapped = AsyncMock(spec=httpx.AsyncHTTPTransport)
+        wrapped.handle_async_request.return_value = MagicMock(
+            spec=httpx.Response, headers={}
+        )
+        transport = RateLimitTransport(
+            wrapped_transport=wrapped, requests_per_minute=60
+        )
+        loop = asyncio.get_running_loop()
+        transport._reset_gate.clear()
+        loop.call_later(5, transport._reset_gate.set)
+
+        sent: list[tuple[int, float]] = []
+
+        async def send(i: int) -> None:
+            await transport.handle_async_request(_make_request())
+            sent.append((i, loop.time()))
+
+        start = loop.time()
+        tasks = []
+        for i in range(5):
+            tasks.append(asyncio.create_task(send(i)))
+            await asyncio.sleep(0.1)
+        await asyncio.gather(*tasks)
+
+        assert [i for i, _ in sent] == list(range(5))
+        # One per second (60/min) from the moment the gate reopened
+        assert [t - start for _, t in sent] == pytest.approx([5, 6, 7, 8, 9], abs=1e-6)
+        await transport.aclose()
+
+    async def test_interactive_overtakes_queued_bulk(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(time, "time", lambda: _EPOCH)
+        wrapped = AsyncMock(spec=httpx.AsyncHTTPTransport)
+        wrapped.handle_async_request.return_value = MagicMock(
+            spec=httpx.Response, headers={}
+        )
+        transport = RateLimitTransport(
+            wrapped_transport=wrapped, requests_per_minute=60
+        )
+        transport._reset_gate.clear()
+        asyncio.get_running_loop().call_later(5, transport._reset_gate.set)
+        sent: list[str] = []
+
+        async def send(name: str) -> None:
+            await transport.handle_async_request(_make_request())
+            sent.append(name)
+
+        with request_priority("bulk"):
+            bulk = [asyncio.create_task(send(f"bulk-{i}")) for i in range(3)]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(send("interactive"))
+        await asyncio.gather(*bulk, interactive)
+
+        # bulk-0 heads the queue (it holds the turn while the gate is shut);
+        # the interactive request goes next, ahead of the bulk ones behind it
+        assert sent == ["bulk-0", "interactive", "bulk-1", "bulk-2"]
+        await transport.aclose()
+
+    async def test_new_requests_queue_behind_backlog(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(time, "time", lambda: _EPOCH)
+        wrapped = AsyncMock(spec=httpx.AsyncHTTPTransport)
+        wrapped.handle_async_request.return_value = MagicMock(
+            spec=httpx.Response, headers={}
+        )
+        transport = RateLimitTransport(
+            wrapped_transport=wrapped, requests_per_minute=60
+        )
+        loop = asyncio.get_running_loop()
+        transport._reset_gate.clear()
+        loop.call_later(1, transport._reset_gate.set)
+        backlog = [
+            asyncio.create_task(transport.handle_async_request(_make_request()))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(1.5)  # gate open, backlog still being paced out
+        assert transport.queue_stats().depth == 2
+
+        start = loop.time()
+        await transport.handle_async_request(_make_request())
+
+        # Turns at t=2 and t=3 belong to the backlog; the newcomer gets t=4
+        assert loop.time() - start == pytest.approx(2.5, abs=1e-6)
+        await asyncio.gather(*backlog)
+        await transport.aclose()
+
+    async def test_pacing_disabled_releases_backlog_at_once(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(time, "time", lambda: _EPOCH)
+        wrapped = AsyncMock(spec=httpx.AsyncHTTPTransport)
+        wrapped.handle_async_request.return_value = MagicMock(
+            spec=httpx.Response, headers={}
+        )
+        transport = RateLimitTransport(
+            wrapped_transport=wrapped, requests_per_minute=60, reset_pacing=False
+        )
+        loop = asyncio.get_running_loop()
+        transport._reset_gate.clear()
+        loop.call_later(5, transport._reset_gate.set)
+
+        start = loop.time()
+        await asyncio.gather(
+            *(transport.handle_async_request(_make_request()) for _ in range(5))
+        )
+
+        assert loop.time() - start == pytest.approx(5, abs=1e-6)
+        await transport.aclose()
+
+
+@pytest.mark.unit
+class TestQueueStats:
+    def test_mean_wait(self) -> None:
+        stats = RateLimitQueueStats(
+            depth=0, waited=4, wait_seconds_total=10.0, wait_seconds_max=4.0
+        )
+        assert stats.mean_wait_seconds == 2.5
+
+    def test_mean_wait_before_any_wait(self) -> None:
+        assert RateLimitTransport().queue_stats().mean_wait_seconds == 0.0
+
+    def test_client_exposes_rate_limiter(self) -> None:
+        client = KatanaClient(api_key="test-key")
+        assert isinstance(client.rate_limiter, RateLimitTransport)
+        assert client.rate_limiter.queue_stats().depth == 0
+
+    def test_client_without_rate_limiting_has_no_limiter(self) -> None:
+        client = KatanaClient(api_key="test-key", requests_per_minute=None)
+        assert client.rate_limiter is None
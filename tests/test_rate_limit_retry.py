@@ -10,13 +10,21 @@ from datetime import UTC, datetime, timedelta, timezone
 from email.utils import formatdate
 from http import HTTPStatus
 from types import SimpleNamespace
+from typing import cast
 from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
 from httpx_retries import RetryTransport
 
-from katana_public_api_client.katana_client import RateLimitAwareRetry
+from katana_public_api_client.katana_client import (
+    ErrorLoggingTransport,
+    JSONCodecTransport,
+    PaginationAwareRetryTransport,
+    PaginationTransport,
+    RateLimitAwareRetry,
+    ResilientAsyncTransport,
+)
 
 
 @pytest.mark.unit
@@ -741,3 +749,66 @@ class TestRetryAfterEndToEndIntegration:
         assert 9.0 <= elapsed <= 11.0, (
             f"Two retries with Retry-After 3 + 7 should pace ~10s; got {elapsed:.2f}s"
         )
+
+
+@pytest.mark.unit
+class TestPaginationAwareRetryTransport:
+    """The outer retry layer leaves auto-paginated GETs to per-page retries."""
+
+    @pytest.fixture(autouse=True)
+    def _no_backoff_sleep(self, monkeypatch) -> None:
+        # The factory's retry policy uses randomized backoff jitter, which
+        # doesn't mix well with looptime; skip the retry's own sleeps instead.
+        monkeypatch.setattr(RateLimitAwareRetry, "asleep", AsyncMock())
+
+    @staticmethod
+    def _transport(handler) -> RetryTransport:
+        transport = ResilientAsyncTransport(max_retries=2, requests_per_minute=None)
+        # Swap the base AsyncHTTPTransport under the codec layer for a mock
+        pagination = cast(PaginationTransport, transport._async_transport)
+        error_logging = cast(ErrorLoggingTransport, pagination._wrapped_transport)
+        codec_layer = cast(JSONCodecTransport, error_logging._wrapped_transport)
+        codec_layer._wrapped_transport = httpx.MockTransport(handler)
+        return transport
+
+    @pytest.mark.asyncio
+    async def test_exhausted_page_does_not_restart_pagination(self) -> None:
+        calls: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            calls.append(page)
+            if page == 2:
+                return httpx.Response(503)
+            return httpx.Response(
+                200, json={"data": [{"id": page}], "pagination": {"total_pages": 3}}
+            )
+
+        transport = self._transport(handler)
+
+        response = await transport.handle_async_request(
+            httpx.Request("GET", "https://api.example.test/products")
+        )
+
+        assert isinstance(transport, PaginationAwareRetryTransport)
+        assert response.status_code == 503
+        # Page 1 is fetched exactly once; only page 2 is retried
+        assert calls == [1, 2, 2, 2]
+
+    @pytest.mark.asyncio
+    async def test_non_paginated_requests_still_retried_by_outer_layer(self) -> None:
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.method)
+            status = 429 if len(calls) == 1 else 201
+            return httpx.Response(status, json={"id": 1})
+
+        transport = self._transport(handler)
+
+        response = await transport.handle_async_request(
+            httpx.Request("POST", "https://api.example.test/products", json={})
+        )
+
+        assert response.status_code == 201
+        assert calls == ["POST", "POST"]
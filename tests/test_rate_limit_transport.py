@@ -32,6 +32,9 @@ from katana_public_api_client import KatanaClient
 from katana_public_api_client.katana_client import (
     PaginationTransport,
     RateLimitTransport,
+    _PriorityLock,
+    _resolve_request_priority,
+    request_priority,
 )
 
 
@@ -856,3 +859,140 @@ class TestRateLimitTransportConcurrency:
             "concurrent updates must respect the lowest reported remaining "
             f"(got {transport._estimated_remaining}, expected ≤5)"
         )
+
+
+@pytest.mark.unit
+class TestRateLimitTransportPriority:
+    """Interactive requests go before queued bulk ones and keep a reserved share."""
+
+    @pytest.mark.parametrize("reserve", [-0.1, 1.0])
+    def test_rejects_out_of_range_reserve(self, reserve: float) -> None:
+        with pytest.raises(ValueError, match="interactive_reserve"):
+            RateLimitTransport(requests_per_minute=60, interactive_reserve=reserve)
+
+    def test_priority_from_context_and_extension(self) -> None:
+        assert _resolve_request_priority(_make_request()) == "interactive"
+        with request_priority("bulk"):
+            assert _resolve_request_priority(_make_request()) == "bulk"
+            # The per-request extension wins over the ambient priority
+            explicit = httpx.Request(
+                "GET",
+                "https://api.example.test/sales_orders/1",
+                extensions={"priority": "interactive"},
+            )
+            assert _resolve_request_priority(explicit) == "interactive"
+        assert _resolve_request_priority(_make_request()) == "interactive"
+
+    def test_unknown_priority_raises(self) -> None:
+        request = httpx.Request(
+            "GET", "https://api.example.test/products", extensions={"priority": "low"}
+        )
+        with pytest.raises(ValueError, match="Unknown request priority 'low'"):
+            _resolve_request_priority(request)
+
+    @pytest.mark.asyncio
+    async def test_queued_interactive_request_goes_before_queued_bulk(
+        self, mock_wrapped_transport: AsyncMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        transport = RateLimitTransport(
+            wrapped_transport=mock_wrapped_transport,
+            requests_per_minute=600,
+            interactive_reserve=0,
+        )
+        sent: list[str] = []
+
+        async def record(request: httpx.Request) -> MagicMock:
+            sent.append(request.url.path)
+            return _build_response()
+
+        mock_wrapped_transport.handle_async_request.side_effect = record
+
+        # The first request to reach the bucket waits for a token until we
+        # open ``bucket_refilled``; everything behind it queues for its turn.
+        bucket_refilled = asyncio.Event()
+        acquires = 0
+
+        async def acquire(*_args: Any, **_kwargs: Any) -> bool:
+            nonlocal acquires
+            acquires += 1
+            if acquires == 1:
+                await bucket_refilled.wait()
+            return True
+
+        monkeypatch.setattr(transport._limiter, "try_acquire_async", acquire)
+
+        def request(path: str) -> httpx.Request:
+            return httpx.Request("GET", f"https://api.example.test{path}")
+
+        with request_priority("bulk"):
+            tasks = [
+                asyncio.create_task(transport.handle_async_request(request("/first")))
+            ]
+            await asyncio.sleep(0)
+            tasks.append(
+                asyncio.create_task(transport.handle_async_request(request("/bulk")))
+            )
+        tasks.append(
+            asyncio.create_task(transport.handle_async_request(request("/interactive")))
+        )
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert transport._priority_lock.waiting("bulk") == 1
+        assert transport._priority_lock.waiting("interactive") == 1
+
+        bucket_refilled.set()
+        await asyncio.gather(*tasks)
+
+        assert sent == ["/first", "/interactive", "/bulk"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_cannot_spend_interactive_reserve(
+        self, mock_wrapped_transport: AsyncMock
+    ) -> None:
+        transport = RateLimitTransport(
+            wrapped_transport=mock_wrapped_transport,
+            requests_per_minute=10,
+            interactive_reserve=0.2,
+        )
+        mock_wrapped_transport.handle_async_request.return_value = _build_response()
+
+        with request_priority("bulk"):
+            for _ in range(8):
+                await transport.handle_async_request(_make_request())
+
+        # Bulk has spent its 8/min cap...
+        assert transport._bulk_limiter is not None
+        assert not await transport._bulk_limiter.try_acquire_async(
+            name="katana", blocking=False
+        )
+        # ...while the 2 reserved tokens still go to interactive calls at once
+        for _ in range(2):
+            await asyncio.wait_for(
+                transport.handle_async_request(_make_request()), timeout=1
+            )
+
+    def test_zero_reserve_skips_bulk_bucket(self) -> None:
+        transport = RateLimitTransport(requests_per_minute=60, interactive_reserve=0)
+        assert transport._bulk_limiter is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_wedge_lock(self) -> None:
+        lock = _PriorityLock()
+        holder_release = asyncio.Event()
+
+        async def hold(priority: Any, until: asyncio.Event | None = None) -> None:
+            async with lock.hold(priority):
+                if until is not None:
+                    await until.wait()
+
+        holder = asyncio.create_task(hold("bulk", holder_release))
+        await asyncio.sleep(0)
+        cancelled = asyncio.create_task(hold("interactive"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+
+        holder_release.set()
+        await holder
+        await asyncio.wait_for(hold("bulk"), timeout=1)
+        assert cancelled.cancelled()
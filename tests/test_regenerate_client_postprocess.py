@@ -169,3 +169,192 @@ def test_function_body_end_uses_indentation(regen: Any) -> None:
     body = sample[:end]
     assert "from_dict" not in body
     assert "_parse_customer_ref" not in body
+
+
+_ENDPOINT_MODULE = """\
+def _get_kwargs() -> dict[str, Any]:
+    _kwargs: dict[str, Any] = {
+        "method": "get",
+        "url": "/sales_orders",
+    }
+
+    return _kwargs
+
+
+def _parse_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response
+) -> (
+    ErrorResponse
+    | SalesOrderListResponse
+    | None
+):
+    if response.status_code == 200:
+        return SalesOrderListResponse.from_dict(response.json())
+"""
+
+
+def test_get_endpoint_tagged_and_returns_prebuilt_model(regen: Any) -> None:
+    """Early return lands first in the body, past a wrapped return annotation."""
+    output = regen._tag_get_endpoint(_ENDPOINT_MODULE)
+
+    assert regen._GET_METHOD_LINE + regen._ENDPOINT_TAG in output
+    header_end = output.index("):\n", output.index("def _parse_response"))
+    header_end += len("):\n")
+    assert output[header_end:].startswith(regen._PREBUILT_EARLY_RETURN)
+    assert output.index("katana_parsed_model") < output.index("status_code == 200")
+
+
+def test_get_endpoint_tag_idempotent_and_get_only(regen: Any) -> None:
+    once = regen._tag_get_endpoint(_ENDPOINT_MODULE)
+    post = _ENDPOINT_MODULE.replace('"method": "get"', '"method": "post"')
+
+    assert regen._tag_get_endpoint(once) == once
+    assert regen._tag_get_endpoint(post) == post
+    assert regen._tag_get_endpoint("x = 1\n") == "x = 1\n"
+
+
+def test_endpoint_extension_keys_match_client(regen: Any) -> None:
+    from katana_public_api_client.katana_client import (
+        ENDPOINT_EXTENSION,
+        PARSED_MODEL_EXTENSION,
+    )
+
+    assert f'"{PARSED_MODEL_EXTENSION}"' in regen._PREBUILT_EARLY_RETURN
+    assert f'"{ENDPOINT_EXTENSION}"' in regen._ENDPOINT_TAG
+
+
+_EAGER_MODELS_INIT = '''\
+"""Contains all the data models used in inputs/outputs"""
+
+from .product import Product
+from .sales_order_list_response import (
+    SalesOrderListResponse,
+)
+
+__all__ = (
+    "Product",
+    "SalesOrderListResponse",
+)
+'''
+
+
+def test_lazy_models_init_keeps_names_and_is_idempotent(regen: Any) -> None:
+    lazy = regen._lazy_models_init(_EAGER_MODELS_INIT)
+    namespace: dict[str, Any] = {}
+    exec(compile(lazy, "models/__init__.py", "exec"), namespace)
+
+    assert namespace["__all__"] == ("Product", "SalesOrderListResponse")
+    assert namespace["_MODULES"] == {
+        "Product": "product",
+        "SalesOrderListResponse": "sales_order_list_response",
+    }
+    assert namespace["__doc__"] == "Contains all the data models used in inputs/outputs"
+    assert regen._lazy_models_init(lazy) == lazy
+
+
+_EAGER_MODEL = """\
+from typing import Any
+
+from attrs import (
+    define as _attrs_define,
+    field as _attrs_field,
+)
+
+from ..client_types import UNSET, Unset
+
+
+@_attrs_define
+class Thing:
+    id: int | Unset = UNSET
+    additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        field_dict: dict[str, Any] = {}
+        field_dict.update(self.additional_properties)
+        return field_dict
+
+    @classmethod
+    def from_dict(cls, src_dict):
+        d = dict(src_dict)
+        thing = cls(id=d.pop("id", UNSET))
+
+        thing.additional_properties = d
+        return thing
+
+    @property
+    def additional_keys(self) -> list[str]:
+        return list(self.additional_properties.keys())
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.additional_properties
+"""
+
+
+def test_lazy_additional_properties_rewrites_model(regen: Any) -> None:
+    lazy = regen._lazy_additional_properties(_EAGER_MODEL)
+
+    assert "from ..client_types import UNSET, Unset, lazy_dict_eq_key\n" in lazy
+    assert "init=False, default=None, eq=lazy_dict_eq_key" in lazy
+    assert "        thing._additional_properties = d or None\n" in lazy
+    assert "field_dict.update(self.additional_properties)" not in lazy
+    assert "return list(self._additional_properties or ())" in lazy
+    assert "return key in (self._additional_properties or ())" in lazy
+    assert regen._lazy_additional_properties(lazy) == lazy
+
+
+def test_lazy_additional_properties_adds_client_types_import(regen: Any) -> None:
+    eager = _EAGER_MODEL.replace("from ..client_types import UNSET, Unset\n\n", "")
+
+    lazy = regen._lazy_additional_properties(eager)
+
+    assert ")\n\nfrom ..client_types import lazy_dict_eq_key\n\n\n@_attrs" in lazy
+
+
+def test_lazy_dict_eq_key_added_once(regen: Any) -> None:
+    content = '"""Types"""\n\n\nT = 1\n\n\n__all__ = ["UNSET", "Unset"]\n'
+
+    patched = regen._add_lazy_dict_eq_key(content)
+
+    assert "def lazy_dict_eq_key(" in patched
+    assert '__all__ = ["UNSET", "Unset", "lazy_dict_eq_key"]' in patched
+    assert regen._add_lazy_dict_eq_key(patched) == patched
+
+
+_BUILD_RESPONSE_MODULE = f"""\
+from ...client_types import Response
+{_ENDPOINT_MODULE}
+
+def _build_response(*, client, response):
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+"""
+
+
+def test_get_build_response_defers_content(regen: Any) -> None:
+    deferred = regen._defer_build_response_content(_BUILD_RESPONSE_MODULE)
+    post = _BUILD_RESPONSE_MODULE.replace('"method": "get"', '"method": "post"')
+
+    assert "from ...client_types import Response, deferred_content\n" in deferred
+    assert "        content=deferred_content(response),\n" in deferred
+    assert regen._defer_build_response_content(deferred) == deferred
+    assert regen._defer_build_response_content(post) == post
+
+
+def test_response_content_deferred_in_client_types(regen: Any) -> None:
+    content = (
+        '"""Types"""\n\nfrom attrs import define\n\n\n@define\nclass Response[T]:\n'
+        "    status_code: HTTPStatus\n" + regen._EAGER_RESPONSE_FIELDS + "\n\n"
+        '__all__ = ["Response", "lazy_dict_eq_key"]\n'
+    )
+
+    patched = regen._defer_response_content(content)
+
+    assert "import httpx\nfrom attrs import define, field\n" in patched
+    assert '    _content: bytes | httpx.Response = field(alias="content")\n' in patched
+    assert "def deferred_content(" in patched
+    assert '"Response", "deferred_content", "lazy_dict_eq_key"]' in patched
+    assert regen._defer_response_content(patched) == patched
@@ -0,0 +1,395 @@
+"""Tests for the cross-process ``SharedRateLimitState`` and its ``RateLimitTransport`` wiring.
+
+In-process tests open two ``SharedRateLimitState`` instances on one file to
+stand in for two processes — each has its own SQLite connections, exactly as a
+second process would. ``TestMultiprocessThroughput`` then runs real processes
+against one file to prove the aggregate request rate stays under the limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from katana_public_api_client import KatanaClient
+from katana_public_api_client.katana_client import (
+    RateLimitTransport,
+    request_priority,
+)
+from katana_public_api_client.shared_rate_limit import SharedRateLimitState
+
+
+def _build_response(remaining: int, reset_offset_seconds: float) -> MagicMock:
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = 200
+    response.headers = {
+        "X-Ratelimit-Remaining": str(remaining),
+        "X-Ratelimit-Reset": str(int((time.time() + reset_offset_seconds) * 1000)),
+    }
+    return response
+
+
+def _make_request() -> httpx.Request:
+    return httpx.Request("GET", "https://api.example.test/manufacturing_orders")
+
+
+def _rate_limit_transport(
+    path: Path, rpm: int, response: MagicMock | None = None
+) -> RateLimitTransport:
+    wrapped = AsyncMock(spec=httpx.AsyncHTTPTransport)
+    wrapped.handle_async_request.return_value = response or MagicMock(
+        spec=httpx.Response, headers={}
+    )
+    return RateLimitTransport(
+        wrapped_transport=wrapped,
+        requests_per_minute=rpm,
+        shared_state=SharedRateLimitState(path, requests_per_minute=rpm),
+    )
+
+
+@pytest.mark.unit
+class TestSharedRateLimitState:
+    def test_rejects_non_positive_rpm(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="must be positive"):
+            SharedRateLimitState(tmp_path / "rl.db", requests_per_minute=0)
+
+    def test_missing_filelock_raises_import_error_with_hint(
+        self, tmp_path: Path
+    ) -> None:
+        with (
+            patch("importlib.util.find_spec", return_value=None),
+            pytest.raises(ImportError, match=r"\[shared-rate-limit\]"),
+        ):
+            SharedRateLimitState(tmp_path / "rl.db")
+
+    def test_creates_parent_directory(self, tmp_path: Path) -> None:
+        SharedRateLimitState(tmp_path / "cache" / "rl.db")
+        assert (tmp_path / "cache" / "rl.db").exists()
+
+    def test_debit_is_shared_and_floors_at_zero(self, tmp_path: Path) -> None:
+        first = SharedRateLimitState(tmp_path / "rl.db", requests_per_minute=3)
+        second = SharedRateLimitState(tmp_path / "rl.db", requests_per_minute=3)
+
+        assert first.debit() == 2
+        assert second.debit() == 1
+        assert first.debit() == 0
+        assert second.debit() == 0
+
+    def test_sync_down_drains_once_per_window(self, tmp_path: Path) -> None:
+        """Two processes seeing the same server drop must not both drain for it."""
+        first = SharedRateLimitState(tmp_path / "rl.db", requests_per_minute=60)
+        second = SharedRateLimitState(tmp_path / "rl.db", requests_per_minute=60)
+
+        assert first.sync_down(40) == 20
+        assert second.sync_down(40) == 0
+        assert second.sync_down(35) == 5
+
+    def test_engage_reset_keeps_later_deadline(self, tmp_path: Path) -> None:
+        first = SharedRateLimitState(tmp_path / "rl.db")
+        second = SharedRateLimitState(tmp_path / "rl.db")
+        later = int(time.time() * 1000) + 60_000
+
+        assert first.engage_reset(later) is True
+        assert second.engage_reset(later - 10_000) is False
+        assert second.reset_until_ms() == later
+        assert second.debit() == 0
+
+    def test_release_reopens_gate_and_refills_estimate(self, tmp_path: Path) -> None:
+        state = SharedRateLimitState(tmp_path / "rl.db", requests_per_minute=60)
+        deadline = int(time.time() * 1000) + 60_000
+        state.engage_reset(deadline)
+
+        assert state.release_reset(deadline) == 60
+        assert state.reset_until_ms() is None
+
+    def test_release_leaves_later_deadline_in_place(self, tmp_path: Path) -> None:
+        state = SharedRateLimitState(tmp_path / "rl.db")
+        now_ms = int(time.time() * 1000)
+        state.engage_reset(now_ms + 60_000)
+
+        assert state.release_reset(now_ms + 30_000) == 0
+        assert state.reset_until_ms() == now_ms + 60_000
+
+    def test_expired_gate_rolls_even_if_engaging_process_exited(
+        self, tmp_path: Path
+    ) -> None:
+        """A deadline nobody released must not pin the estimate at zero."""
+        state = SharedRateLimitState(tmp_path / "rl.db", requests_per_minute=60)
+        state.engage_reset(int(time.time() * 1000) + 60_000)
+
+        with patch("time.time", return_value=time.time() + 120):
+            assert state.reset_until_ms() is None
+            assert state.debit() == 59
+
+    def test_reset_check_does_not_wait_for_a_writer(self, tmp_path: Path) -> None:
+        """The per-request gate check must not queue behind another process's write."""
+        state = SharedRateLimitState(tmp_path / "rl.db")
+        state._conn.execute("PRAGMA busy_timeout = 50")
+        writer = sqlite3.connect(tmp_path / "rl.db", isolation_level=None)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            assert state.reset_until_ms() is None
+        finally:
+            writer.execute("ROLLBACK")
+            writer.close()
+
+    def test_rejects_invalid_lane_name(self, tmp_path: Path) -> None:
+        state = SharedRateLimitState(tmp_path / "rl.db")
+        with pytest.raises(ValueError, match="lane must be a valid identifier"):
+            state.open_bucket(lane="bulk; DROP TABLE rate_limit_state")
+
+    def test_scopes_are_independent(self, tmp_path: Path) -> None:
+        main = SharedRateLimitState(tmp_path / "rl.db", scope="key-a")
+        sync = SharedRateLimitState(tmp_path / "rl.db", scope="key-b")
+        main.engage_reset(int(time.time() * 1000) + 60_000)
+
+        assert sync.reset_until_ms() is None
+        assert sync.debit() == 59
+
+
+@pytest.mark.unit
+class TestRateLimitTransportSharedState:
+    def test_rejects_mismatched_rpm(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="sized for 30 requests/minute"):
+            RateLimitTransport(
+                requests_per_minute=60,
+                shared_state=SharedRateLimitState(
+                    tmp_path / "rl.db", requests_per_minute=30
+                ),
+            )
+
+    @pytest.mark.asyncio
+    async def test_requests_draw_from_one_bucket(self, tmp_path: Path) -> None:
+        first = _rate_limit_transport(tmp_path / "rl.db", rpm=3)
+        second = _rate_limit_transport(tmp_path / "rl.db", rpm=3)
+
+        await first.handle_async_request(_make_request())
+        await second.handle_async_request(_make_request())
+        await first.handle_async_request(_make_request())
+
+        # The third token is gone, so neither transport may acquire another
+        assert not await second._limiter.try_acquire_async(
+            name="katana", blocking=False
+        )
+        assert first._estimated_remaining == 0
+        assert second._estimated_remaining == 1  # mirror as of its last debit
+        await first.aclose()
+        await second.aclose()
+
+    @pytest.mark.asyncio
+    async def test_consistent_headers_cause_no_redundant_drain(
+        self, tmp_path: Path
+    ) -> None:
+        """Per-process estimates would each see the other's request as drift."""
+        first = _rate_limit_transport(
+            tmp_path / "rl.db", rpm=10, response=_build_response(9, 60)
+        )
+        second = _rate_limit_transport(
+            tmp_path / "rl.db", rpm=10, response=_build_response(8, 60)
+        )
+
+        with patch.object(
+            second.logger, "info", wraps=second.logger.info
+        ) as second_info:
+            await first.handle_async_request(_make_request())
+            await second.handle_async_request(_make_request())
+
+        assert second._estimated_remaining == 8
+        second_info.assert_not_called()
+        await first.aclose()
+        await second.aclose()
+
+    @pytest.mark.asyncio
+    async def test_bulk_cap_is_shared(self, tmp_path: Path) -> None:
+        first = _rate_limit_transport(tmp_path / "rl.db", rpm=5)
+        second = _rate_limit_transport(tmp_path / "rl.db", rpm=5)
+
+        # 20% reserve of 5/min leaves bulk 4/min across both processes
+        with request_priority("bulk"):
+            for transport in (first, second, first, second):
+                await transport.handle_async_request(_make_request())
+
+        assert second._bulk_limiter is not None
+        assert not await second._bulk_limiter.try_acquire_async(
+            name="katana", blocking=False
+        )
+        await first.aclose()
+        await second.aclose()
+
+    @pytest.mark.asyncio
+    @pytest.mark.looptime
+    async def test_reset_gate_engaged_by_one_process_blocks_another(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Freeze the wall clock so the gate length is exact under looptime
+        # (see test_rate_limit_transport.py)
+        monkeypatch.setattr(time, "time", lambda: 1_700_000_000.0)
+        gate_seconds = 5.0
+        first = _rate_limit_transport(
+            tmp_path / "rl.db", rpm=60, response=_build_response(0, gate_seconds)
+        )
+        second = _rate_limit_transport(tmp_path / "rl.db", rpm=60)
+
+        await first.handle_async_request(_make_request())
+        assert second._reset_gate.is_set()  # nothing local has closed it yet
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await second.handle_async_request(_make_request())
+
+        assert loop.time() - start == pytest.approx(gate_seconds, abs=1e-6)
+        assert second._reset_gate.is_set()
+        await first.aclose()
+        await second.aclose()
+
+    @pytest.mark.asyncio
+    async def test_state_calls_run_off_the_event_loop(self, tmp_path: Path) -> None:
+        transport = _rate_limit_transport(
+            tmp_path / "rl.db", rpm=60, response=_build_response(0, 60)
+        )
+        state = transport._shared_state
+        assert state is not None
+        threads: list[int] = []
+
+        def record(method: Callable[..., Any]) -> Callable[..., Any]:
+            def wrapper(*args: Any) -> Any:
+                threads.append(threading.get_ident())
+                return method(*args)
+
+            return wrapper
+
+        for name in ("reset_until_ms", "debit", "engage_reset"):
+            setattr(state, name, record(getattr(state, name)))
+
+        await transport.handle_async_request(_make_request())
+
+        assert threads
+        assert threading.get_ident() not in threads
+        await transport.aclose()
+
+    @pytest.mark.asyncio
+    async def test_held_bucket_lock_does_not_block_the_event_loop(
+        self, tmp_path: Path
+    ) -> None:
+        from filelock import FileLock
+
+        transport = _rate_limit_transport(tmp_path / "rl.db", rpm=60)
+        # Another process holds the bucket's file lock for half a second
+        other_process = FileLock(f"{tmp_path / 'rl.db'}.lock", thread_local=False)
+        other_process.acquire()
+        threading.Timer(0.5, other_process.release).start()
+
+        request = asyncio.create_task(transport.handle_async_request(_make_request()))
+        await asyncio.sleep(0.1)
+
+        # Had the acquire blocked the loop, the request would have finished
+        # before this coroutine got to run again
+        assert not request.done()
+        await asyncio.wait_for(request, timeout=5)
+        await transport.aclose()
+
+
+@pytest.mark.unit
+class TestKatanaClientSharedRateLimit:
+    @staticmethod
+    def _shared_state(client: KatanaClient) -> SharedRateLimitState | None:
+        rate_limit = client.rate_limiter
+        assert isinstance(rate_limit, RateLimitTransport)
+        return rate_limit._shared_state
+
+    def test_path_builds_state_scoped_by_api_key(self, tmp_path: Path) -> None:
+        path = tmp_path / "rate_limit.db"
+        main = KatanaClient(api_key="key-a", shared_rate_limit=path)
+        sync = KatanaClient(api_key="key-b", shared_rate_limit=path)
+        main_state = self._shared_state(main)
+        sync_state = self._shared_state(sync)
+
+        assert main_state is not None and sync_state is not None
+        assert main_state.path == path
+        assert main_state._scope_key != sync_state._scope_key
+        assert "key-a" not in main_state._scope_key
+
+    def test_instance_is_used_as_is(self, tmp_path: Path) -> None:
+        state = SharedRateLimitState(tmp_path / "rl.db", requests_per_minute=30)
+        client = KatanaClient(
+            api_key="key-a", requests_per_minute=30, shared_rate_limit=state
+        )
+        assert self._shared_state(client) is state
+
+    @pytest.mark.asyncio
+    async def test_state_opened_from_a_path_closes_with_the_client(
+        self, tmp_path: Path
+    ) -> None:
+        async with KatanaClient(
+            api_key="key-a", shared_rate_limit=tmp_path / "rl.db"
+        ) as client:
+            state = self._shared_state(client)
+        assert state is not None
+        with pytest.raises(sqlite3.ProgrammingError, match="closed"):
+            state.debit()
+
+    @pytest.mark.asyncio
+    async def test_state_passed_in_stays_open(self, tmp_path: Path) -> None:
+        state = SharedRateLimitState(tmp_path / "rl.db", requests_per_minute=60)
+        async with KatanaClient(api_key="key-a", shared_rate_limit=state):
+            pass
+        assert state.debit() == 59
+        state.close()
+
+    def test_default_is_in_process(self) -> None:
+        assert self._shared_state(KatanaClient(api_key="key-a")) is None
+
+
+def _drain_shared_budget(path: str, rpm: int, seconds: float) -> int:
+    """Child process: fire ``rpm`` requests at once; return how many got through."""
+
+    async def run() -> int:
+        transport = RateLimitTransport(
+            wrapped_transport=httpx.MockTransport(lambda request: httpx.Response(200)),
+            requests_per_minute=rpm,
+            shared_state=SharedRateLimitState(path, requests_per_minute=rpm),
+        )
+        sent = 0
+
+        async def send() -> None:
+            nonlocal sent
+            await transport.handle_async_request(_make_request())
+            sent += 1
+
+        tasks = [asyncio.create_task(send()) for _ in range(rpm)]
+        await asyncio.wait(tasks, timeout=seconds)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await transport.aclose()
+        return sent
+
+    return asyncio.run(run())
+
+
+@pytest.mark.slow
+class TestMultiprocessThroughput:
+    def test_aggregate_throughput_stays_under_limit(self, tmp_path: Path) -> None:
+        """Each process alone could spend the whole budget; together they share it."""
+        rpm, processes = 6, 3
+        path = str(tmp_path / "rate_limit.db")
+        SharedRateLimitState(path, requests_per_minute=rpm)  # create schema once
+
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(processes) as pool:
+            sent = pool.starmap(
+                _drain_shared_budget, [(path, rpm, 3.0)] * processes, chunksize=1
+            )
+
+        # Without the shared bucket this would be rpm * processes = 18
+        assert sum(sent) == rpm
@@ -1,12 +1,23 @@
 """Test the transport-level auto-pagination functionality."""
 
+import asyncio
 import json
-from unittest.mock import AsyncMock, MagicMock
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
-from katana_public_api_client.katana_client import PaginationTransport
+from katana_public_api_client import unwrap_data
+from katana_public_api_client.decode_offload import parse_decoded_json
+from katana_public_api_client.json_codec import STDLIB_JSON_CODEC
+from katana_public_api_client.katana_client import (
+    DECODED_JSON_EXTENSION,
+    DecodedJSON,
+    PaginationTransport,
+    RateLimitAwareRetry,
+    decoded_json_responses,
+)
 
 
 class TestTransportAutoPagination:
@@ -1610,3 +1621,475 @@ class TestPaginationStringComparison:
 
         assert response.status_code == 200
         # Should convert without errors: 1 -> True, 0 -> False
+
+
+class TestConcurrentPagination:
+    """Test bounded-concurrency page prefetch (``concurrency > 1``).
+
+    Page 1 is always fetched alone to learn ``total_pages``; pages 2..N are
+    then issued in parallel and reassembled in page order.
+    """
+
+    @staticmethod
+    def _page_response(page: int, total_pages: int, status_code: int = 200):
+        return httpx.Response(
+            status_code,
+            headers={
+                "X-Pagination": json.dumps({"page": page, "total_pages": total_pages})
+            },
+            json={"data": [{"id": page * 10}, {"id": page * 10 + 1}]},
+        )
+
+    def test_concurrency_must_be_positive(self):
+        """Zero or negative concurrency is rejected up front."""
+        with pytest.raises(ValueError, match="concurrency must be at least 1"):
+            PaginationTransport(wrapped_transport=AsyncMock(), concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_pages_reassembled_in_order_when_completed_out_of_order(self):
+        """Later pages finishing first must not reorder the combined data."""
+        total_pages = 6
+
+        async def handle(req):
+            page = int(req.url.params["page"])
+            # Higher pages complete sooner so completion order is reversed.
+            await asyncio.sleep((total_pages - page) * 0.005)
+            return self._page_response(page, total_pages)
+
+        wrapped = AsyncMock(spec=httpx.AsyncHTTPTransport)
+        wrapped.handle_async_request.side_effect = handle
+        transport = PaginationTransport(
+            wrapped_transport=wrapped, max_pages=10, concurrency=4
+        )
+
+        response = await transport.handle_async_request(
+            httpx.Request("GET", "https://api.example.com/sales_orders")
+        )
+
+        combined = json.loads(response.content)
+        assert [item["id"] for item in combined["data"]] == [
+            i for page in range(1, total_pages + 1) for i in (page * 10, page * 10 + 1)
+        ]
+        assert combined["pagination"]["collected_pages"] == total_pages
+        assert wrapped.handle_async_request.call_count == total_pages
+
+    @pytest.mark.asyncio
+    async def test_in_flight_requests_bounded_by_concurrency(self):
+        """No more than ``concurrency`` page requests run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def handle(req):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.005)
+            in_flight -= 1
+            return self._page_response(int(req.url.params["page"]), 12)
+
+        wrapped = AsyncMock(spec=httpx.AsyncHTTPTransport)
+        wrapped.handle_async_request.side_effect = handle
+        transport = PaginationTransport(
+            wrapped_transport=wrapped, max_pages=20, concurrency=3
+        )
+
+        await transport.handle_async_request(
+            httpx.Request("GET", "https://api.example.com/products")
+        )
+
+        assert wrapped.handle_async_request.call_count == 12
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_max_pages_caps_concurrent_fetch(self):
+        """``max_pages`` still bounds the total pages requested."""
+
+        async def handle(req):
+            return self._page_response(int(req.url.params["page"]), 40)
+
+        wrapped = AsyncMock(spec=httpx.AsyncHTTPTransport)
+        wrapped.handle_async_request.side_effect = handle
+        transport = PaginationTransport(
+            wrapped_transport=wrapped, max_pages=5, concurrency=4
+        )
+
+        response = await transport.handle_async_request(
+            httpx.Request("GET", "https://api.example.com/products")
+        )
+
+        requested = sorted(
+            int(call.args[0].url.params["page"])
+            for call in wrapped.handle_async_request.call_args_list
+        )
+        assert requested == [1, 2, 3, 4, 5]
+        assert len(json.loads(response.content)["data"]) == 10
+
+    @pytest.mark.asyncio
+    async def test_max_items_limits_pages_and_truncates(self):
+        """``max_items`` limits how many pages are issued and truncates exactly."""
+
+        async def handle(req):
+            return self._page_response(int(req.url.params["page"]), 40)
+
+        wrapped = AsyncMock(spec=httpx.AsyncHTTPTransport)
+        wrapped.handle_async_request.side_effect = handle
+        transport = PaginationTransport(
+            wrapped_transport=wrapped, max_pages=50, concurrency=4
+        )
+
+        response = await transport.handle_async_request(
+            httpx.Request(
+                "GET",
+                "https://api.example.com/products?limit=2",
+                extensions={"max_items": 5},
+            )
+        )
+
+        # ceil(5 / 2) == 3 pages, truncated to 5 items
+        assert wrapped.handle_async_request.call_count == 3
+        assert len(json.loads(response.content)["data"]) == 5
+
+    @pytest.mark.asyncio
+    async def test_error_page_returned_and_later_pages_not_started(self):
+        """A failing page is returned as-is and stops unstarted pages."""
+
+        async def handle(req):
+            page = int(req.url.params["page"])
+            if page == 3:
+                return httpx.Response(503, json={"message": "unavailable"})
+            return self._page_response(page, 10)
+
+        wrapped = AsyncMock(spec=httpx.AsyncHTTPTransport)
+        wrapped.handle_async_request.side_effect = handle
+        transport = PaginationTransport(
+            wrapped_transport=wrapped, max_pages=10, concurrency=2
+        )
+
+        response = await transport.handle_async_request(
+            httpx.Request("GET", "https://api.example.com/products")
+        )
+
+        assert response.status_code == 503
+        # Page 1 alone, then pages 2+3 in flight; page 3 fails and at most
+        # one more page slips in before the stop flag is observed.
+        assert wrapped.handle_async_request.call_count <= 4
+
+    @pytest.mark.asyncio
+    async def test_transport_error_on_a_page_is_raised_as_is(self):
+        """A page's own ``httpx`` error surfaces, not the task group's wrapper."""
+
+        async def handle(req):
+            page = int(req.url.params["page"])
+            if page == 3:
+                raise httpx.ConnectError("connection refused", request=req)
+            return self._page_response(page, 5)
+
+        wrapped = AsyncMock(spec=httpx.AsyncHTTPTransport)
+        wrapped.handle_async_request.side_effect = handle
+        transport = PaginationTransport(
+            wrapped_transport=wrapped, max_pages=10, concurrency=4
+        )
+
+        with pytest.raises(httpx.ConnectError, match="connection refused"):
+            await transport.handle_async_request(
+                httpx.Request("GET", "https://api.example.com/products")
+            )
+
+    @pytest.mark.asyncio
+    async def test_concurrency_one_is_sequential(self):
+        """The default keeps the one-page-at-a-time behavior."""
+        in_flight = 0
+        peak = 0
+
+        async def handle(req):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return self._page_response(int(req.url.params["page"]), 4)
+
+        wrapped = AsyncMock(spec=httpx.AsyncHTTPTransport)
+        wrapped.handle_async_request.side_effect = handle
+        transport = PaginationTransport(wrapped_transport=wrapped, max_pages=10)
+
+        await transport.handle_async_request(
+            httpx.Request("GET", "https://api.example.com/products")
+        )
+
+        assert transport.concurrency == 1
+        assert peak == 1
+        assert wrapped.handle_async_request.call_count == 4
+
+
+class TestDecodedPayloadPassthrough:
+    """The combined response carries its decoded payload so it isn't re-parsed."""
+
+    @staticmethod
+    def _handler(total_pages: int):
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            return httpx.Response(
+                200,
+                json={
+                    "data": [
+                        {
+                            "id": page,
+                            "customer_id": 1,
+                            "order_no": f"SO-{page}",
+                            "location_id": 1,
+                            "status": "NOT_SHIPPED",
+                        }
+                    ],
+                    "pagination": {"page": page, "total_pages": total_pages},
+                },
+            )
+
+        return handler
+
+    @pytest.mark.asyncio
+    async def test_combined_response_exposes_decoded_payload(self):
+        transport = PaginationTransport(
+            wrapped_transport=httpx.MockTransport(self._handler(3))
+        )
+
+        response = await transport.handle_async_request(
+            httpx.Request("GET", "https://api.example.com/sales_orders")
+        )
+
+        payload = response.extensions[DECODED_JSON_EXTENSION]
+        assert response.json() is payload
+        assert [item["id"] for item in payload["data"]] == [1, 2, 3]
+        # The body bytes still describe the same document
+        assert json.loads(response.content) == payload
+
+    @pytest.mark.asyncio
+    async def test_generated_endpoint_decodes_each_page_once(self):
+        from katana_public_api_client import KatanaClient
+        from katana_public_api_client.api.sales_order import get_all_sales_orders
+
+        total_pages = 4
+        client = KatanaClient(
+            api_key="test-key",
+            base_url="https://api.katana.test",
+            transport=PaginationTransport(
+                wrapped_transport=httpx.MockTransport(self._handler(total_pages))
+            ),
+        )
+
+        with patch("json.loads", wraps=json.loads) as loads:
+            async with client:
+                response = await get_all_sales_orders.asyncio_detailed(client=client)
+
+        assert [order.id for order in unwrap_data(response)] == [1, 2, 3, 4]
+        # One decode per page; the combined body is never decoded again
+        assert loads.call_count == total_pages
+
+    @pytest.mark.asyncio
+    async def test_combined_body_is_encoded_only_when_read(self):
+        from katana_public_api_client import KatanaClient
+        from katana_public_api_client.api.sales_order import get_all_sales_orders
+
+        codec = MagicMock(wraps=STDLIB_JSON_CODEC)
+        client = KatanaClient(
+            api_key="test-key",
+            base_url="https://api.katana.test",
+            transport=PaginationTransport(
+                wrapped_transport=httpx.MockTransport(self._handler(3)),
+                json_codec=codec,
+            ),
+        )
+
+        async with client:
+            response = await get_all_sales_orders.asyncio_detailed(client=client)
+            raw = await client.get_async_httpx_client().get("/sales_orders")
+
+        assert [order.id for order in unwrap_data(response)] == [1, 2, 3]
+        assert raw.is_closed
+        assert raw.json()["data"] == [item.to_dict() for item in unwrap_data(response)]
+        codec.dumps.assert_not_called()
+
+        # Encoded once, on first access, for either response
+        assert json.loads(response.content) == json.loads(response.content)
+        assert json.loads(raw.read())["pagination"]["collected_pages"] == 3
+        assert codec.dumps.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_decoded_json_responses_skip_building_the_model(self):
+        from katana_public_api_client import KatanaClient
+        from katana_public_api_client.api.sales_order import get_all_sales_orders
+
+        client = KatanaClient(
+            api_key="test-key",
+            base_url="https://api.katana.test",
+            transport=PaginationTransport(
+                wrapped_transport=httpx.MockTransport(self._handler(3))
+            ),
+        )
+
+        async with client:
+            with decoded_json_responses():
+                decoded = await get_all_sales_orders.asyncio_detailed(client=client)
+            parsed = await get_all_sales_orders.asyncio_detailed(client=client)
+
+        assert isinstance(decoded.parsed, DecodedJSON)
+        payload = decoded.parsed.payload
+        assert [item["id"] for item in payload["data"]] == [1, 2, 3]
+        assert parse_decoded_json(get_all_sales_orders, payload) == parsed.parsed
+
+
+class TestPerPageRetry:
+    """A failed page is retried in place; pagination resumes from that page."""
+
+    @staticmethod
+    def _retry(total: int = 3) -> RateLimitAwareRetry:
+        return RateLimitAwareRetry(
+            total=total,
+            backoff_factor=1.0,
+            backoff_jitter=0.0,
+            respect_retry_after_header=True,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=["GET"],
+        )
+
+    @staticmethod
+    def _handler(total_pages: int, failures: dict[int, list[Any]], calls: list[int]):
+        """Serve ``total_pages`` pages; ``failures[page]`` is consumed first."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            calls.append(page)
+            pending = failures.get(page)
+            if pending:
+                failure = pending.pop(0)
+                if isinstance(failure, Exception):
+                    raise failure
+                return failure
+            return httpx.Response(
+                200,
+                json={
+                    "data": [{"id": page}],
+                    "pagination": {"page": page, "total_pages": total_pages},
+                },
+            )
+
+        return handler
+
+    @pytest.mark.asyncio
+    @pytest.mark.looptime
+    async def test_failed_page_is_retried_without_refetching_earlier_pages(self):
+        calls: list[int] = []
+        transport = PaginationTransport(
+            wrapped_transport=httpx.MockTransport(
+                self._handler(4, {3: [httpx.Response(503)]}, calls)
+            ),
+            retry=self._retry(),
+        )
+
+        response = await transport.handle_async_request(
+            httpx.Request("GET", "https://api.example.com/products")
+        )
+
+        assert response.status_code == 200
+        payload = response.json()
+        assert [item["id"] for item in payload["data"]] == [1, 2, 3, 4]
+        assert calls == [1, 2, 3, 3, 4]
+        assert payload["pagination"]["resumed_pages"] == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.looptime
+    async def test_retry_after_paces_the_page_retry(self):
+        calls: list[int] = []
+        transport = PaginationTransport(
+            wrapped_transport=httpx.MockTransport(
+                self._handler(
+                    2, {2: [httpx.Response(429, headers={"Retry-After": "7"})]}, calls
+                )
+            ),
+            retry=self._retry(),
+        )
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        response = await transport.handle_async_request(
+            httpx.Request("GET", "https://api.example.com/products")
+        )
+        elapsed = loop.time() - start
+
+        assert response.status_code == 200
+        assert calls == [1, 2, 2]
+        assert 6.5 <= elapsed <= 7.5
+
+    @pytest.mark.asyncio
+    @pytest.mark.looptime
+    async def test_retryable_exception_is_retried(self):
+        calls: list[int] = []
+        transport = PaginationTransport(
+            wrapped_transport=httpx.MockTransport(
+                self._handler(2, {2: [httpx.ConnectError("reset")]}, calls)
+            ),
+            retry=self._retry(),
+        )
+
+        response = await transport.handle_async_request(
+            httpx.Request("GET", "https://api.example.com/products")
+        )
+
+        assert response.status_code == 200
+        assert calls == [1, 2, 2]
+        assert response.json()["pagination"]["resumed_pages"] == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.looptime
+    async def test_exhausted_page_returns_its_error(self):
+        calls: list[int] = []
+        transport = PaginationTransport(
+            wrapped_transport=httpx.MockTransport(
+                self._handler(3, {2: [httpx.Response(503)] * 10}, calls)
+            ),
+            retry=self._retry(total=2),
+        )
+
+        response = await transport.handle_async_request(
+            httpx.Request("GET", "https://api.example.com/products")
+        )
+
+        assert response.status_code == 503
+        # Page 1 once, page 2 initial attempt + 2 retries, page 3 never
+        assert calls == [1, 2, 2, 2]
+
+    @pytest.mark.asyncio
+    @pytest.mark.looptime
+    async def test_concurrent_pages_are_retried_individually(self):
+        calls: list[int] = []
+        transport = PaginationTransport(
+            wrapped_transport=httpx.MockTransport(
+                self._handler(
+                    5, {2: [httpx.Response(502)], 4: [httpx.Response(503)]}, calls
+                )
+            ),
+            retry=self._retry(),
+            concurrency=3,
+        )
+
+        response = await transport.handle_async_request(
+            httpx.Request("GET", "https://api.example.com/products")
+        )
+
+        payload = response.json()
+        assert [item["id"] for item in payload["data"]] == [1, 2, 3, 4, 5]
+        assert sorted(calls) == [1, 2, 2, 3, 4, 4, 5]
+        assert payload["pagination"]["resumed_pages"] == 2
+
+    @pytest.mark.asyncio
+    async def test_without_retry_policy_metadata_is_unchanged(self):
+        calls: list[int] = []
+        transport = PaginationTransport(
+            wrapped_transport=httpx.MockTransport(self._handler(2, {}, calls))
+        )
+
+        response = await transport.handle_async_request(
+            httpx.Request("GET", "https://api.example.com/products")
+        )
+
+        assert "resumed_pages" not in response.json()["pagination"]
@@ -9,7 +9,10 @@ import httpx_retries
 import pytest
 
 from katana_public_api_client import KatanaClient
-from katana_public_api_client.katana_client import ResilientAsyncTransport
+from katana_public_api_client.katana_client import (
+    PaginationTransport,
+    ResilientAsyncTransport,
+)
 
 
 @pytest.mark.integration
@@ -79,6 +82,18 @@ class TestTransportChainComposition:
         assert 503 in transport.retry.status_forcelist
         assert 504 in transport.retry.status_forcelist
 
+    def test_pagination_concurrency_passed_to_pagination_layer(self):
+        """Test that pagination_concurrency reaches the PaginationTransport."""
+        client = KatanaClient(
+            api_key="test-key",
+            base_url="https://api.example.com",
+            pagination_concurrency=4,
+        )
+
+        pagination = client._find_transport_layer(PaginationTransport)
+        assert isinstance(pagination, PaginationTransport)
+        assert pagination.concurrency == 4
+
     def test_client_with_custom_transport_bypasses_resilient_chain(self):
         """Test that providing custom transport bypasses the resilient transport chain."""
         custom_transport = httpx.AsyncHTTPTransport()